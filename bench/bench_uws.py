@@ -0,0 +1,276 @@
+"""Offline benchmark for the UWS pipeline.
+
+Replays the fixtures in bench/fixtures through local stand-ins (an HTTP server for TradingView,
+Finnhub and the Discord webhook, plus a fixture-backed yfinance) and reports per-stage latency
+from the pipeline's own stage trace, wall time and peak memory for 2..100 ticker watchlists.
+
+    python bench/bench_uws.py                       # 2 10 25 50 100 tickers, cold + warm runs
+    python bench/bench_uws.py --tickers 2 --latency 150 --json bench_output.json
+    python bench/bench_uws.py record                # refresh fixtures from the live feeds
+    python bench/bench_uws.py parity --post 08:00 10:00 --sessions 1 3   # backtest levels == posted levels
+"""
+import os
+import sys
+import json
+import time
+import types
+import shutil
+import argparse
+import resource
+import tempfile
+import threading
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "bench", "fixtures")
+FIXTURE_ROOTS = ("gc", "nq")
+RECORD_SYMBOLS = {"gc": "GC=F", "nq": "NQ=F"}
+FIVE_MINUTE_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+PERIODS = {"1d": 1, "2d": 2, "5d": 5, "1mo": 30, "60d": 60}
+
+# --- 🧪 STAND-INS ---
+class StandIn:
+    """Replays the fixtures: HTTP endpoints for TradingView, Finnhub and the webhook, and a yfinance Ticker."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.posts, self.posted_bytes = 0, 0
+        now = pd.Timestamp.now(tz="UTC")
+        with open(os.path.join(FIXTURES, "tradingview_events.json")) as f: self.events = json.load(f)
+        # Move every event onto today, keeping its time of day, so statuses split into ✅ and 🚩
+        for ev in self.events["result"]:
+            ev["date"] = now.strftime("%Y-%m-%dT") + ev["date"][11:]
+        with open(os.path.join(FIXTURES, "finnhub_news.json")) as f: self.news = json.load(f)
+        shift = int(now.timestamp()) - max(item["datetime"] for item in self.news)
+        for item in self.news: item["datetime"] += shift
+        self.bars = {}
+        for root in FIXTURE_ROOTS:
+            bars = {i: pd.read_csv(os.path.join(FIXTURES, f"{root}_{i}.csv.gz"), index_col=0, parse_dates=True)
+                    for i in ("1m", "5m")}
+            # One shift for both intervals, on the 5m grid, so the 5m bars stay the aggregates of the 1m bars
+            # and the last 1m bar is the latest complete minute of a complete 5m bar
+            shift = now.floor("5min") - pd.Timedelta(minutes=1) - bars["1m"].index[-1]
+            for interval, df in bars.items():
+                df.index = df.index + shift
+                self.bars[root, interval] = df
+        self.aliases = {}
+
+    def ticker(self, symbol):
+        stand_in = self
+        root, scale = self.aliases.get(symbol, (symbol[:2].lower(), 1.0))
+
+        class Ticker:
+            def history(self, period=None, start=None, interval="5m", **_):
+                time.sleep(stand_in.latency)
+                df = stand_in.bars[root, interval]
+                if start is not None: df = df[df.index >= pd.Timestamp(start)]
+                else: df = df[df.index > df.index[-1] - pd.Timedelta(days=PERIODS[period])]
+                df = df.copy()
+                df[["Open", "High", "Low", "Close"]] *= scale
+                return df.tz_convert("America/New_York")
+        return Ticker()
+
+    def serve(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, code, body=b""):
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                time.sleep(stand_in.latency)
+                if self.path.startswith("/events"): self._send(200, json.dumps(stand_in.events).encode())
+                elif self.path.startswith("/news"):
+                    min_id = int(parse_qs(urlparse(self.path).query).get("minId", ["0"])[0])
+                    self._send(200, json.dumps([n for n in stand_in.news if n["id"] > min_id]).encode())
+                else: self._send(404)
+
+            def do_POST(self):
+                time.sleep(stand_in.latency)
+                stand_in.posts += 1
+                stand_in.posted_bytes += len(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                self._send(204)
+
+            def log_message(self, *args): pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+def watchlist(n, stand_in):
+    """n assets cloned from the fixture roots, each price-scaled so their levels differ."""
+    assets = []
+    for i in range(n):
+        symbol = f"B{i:03d}=F"
+        stand_in.aliases[symbol] = (FIXTURE_ROOTS[i % len(FIXTURE_ROOTS)], 1.0 + 0.01 * i)
+        assets.append({"symbol": symbol, "name": f"B{i:03d}", "color": 0xf1c40f})
+    return assets
+
+# --- 📊 RUNS ---
+def read_trace(path):
+    if not os.path.exists(path): return []
+    with open(path) as f: records = [json.loads(line) for line in f if line.strip()]
+    os.remove(path)
+    return records
+
+def summarize(records):
+    by_stage = {}
+    for r in records: by_stage.setdefault(r["stage"], []).append(r["seconds"])
+    return {name: {"count": len(v), "total_s": round(sum(v), 4), "p50_ms": round(1000 * float(np.median(v)), 2),
+                   "max_ms": round(1000 * max(v), 2)} for name, v in by_stage.items()}
+
+def children_rss_mb():
+    """Peak RSS of the largest exited child, i.e. the spawned render workers; the kernel keeps only the max."""
+    return round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+
+def run_pipeline(uws, assets, base_url, state, memory):
+    uws.ASSETS = assets
+    # tracemalloc only sees this process; rendering in pool workers shows up in children_rss_mb()
+    if memory: tracemalloc.start()
+    started = time.perf_counter()
+    uws.post_snapshot(f"{base_url}/webhook", "bench-key", state)
+    wall = time.perf_counter() - started
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return wall, peak
+
+def bench(args):
+    cache = tempfile.mkdtemp(prefix="uws-bench-")
+    trace = os.path.join(cache, "trace.jsonl")
+    # Both are read once at import, and spawned render workers inherit them
+    os.environ["UWS_CACHE_DIR"], os.environ["UWS_TRACE"] = cache, trace
+    stand_in = StandIn(args.latency / 1000)
+    sys.modules["yfinance"] = types.SimpleNamespace(Ticker=stand_in.ticker)
+    sys.path.insert(0, ROOT)
+    import uws_intel as uws
+    base_url = stand_in.serve()
+    uws.TV_EVENTS_URL, uws.FINNHUB_NEWS_URL = f"{base_url}/events", f"{base_url}/news"
+
+    results = []
+    for n in args.tickers:
+        assets = watchlist(n, stand_in)
+        for mode in ("latency", "memory") if args.memory else ("latency",):
+            shutil.rmtree(uws.BAR_STORE, ignore_errors=True)
+            if os.path.exists(uws.NEWS_STATE): os.remove(uws.NEWS_STATE)
+            state = {}
+            # Cold: empty bar store, nothing rendered yet. Warm: same daemon state, incremental bars only
+            for run in ("cold", "warm"):
+                state["full"] = True
+                wall, peak = run_pipeline(uws, assets, base_url, state, mode == "memory")
+                stages = summarize(read_trace(trace))
+                if mode == "latency":
+                    results.append({"tickers": n, "run": run, "wall_s": round(wall, 3), "stages": stages,
+                                    "worker_rss_mb": children_rss_mb()})
+                else:
+                    next(r for r in results if r["tickers"] == n and r["run"] == run)["peak_mb"] = round(peak, 2)
+    report = {"latency_ms": args.latency, "cpus": os.cpu_count(), "posts": stand_in.posts,
+              "posted_mb": round(stand_in.posted_bytes / 2**20, 2),
+              "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+              "worker_max_rss_mb": children_rss_mb(), "runs": results}
+    shutil.rmtree(cache, ignore_errors=True)
+    stand_in.server.shutdown()
+    return report
+
+def print_report(report):
+    print(f"cpus={report['cpus']}  stand-in latency={report['latency_ms']}ms  posts={report['posts']}  "
+          f"uploaded={report['posted_mb']}MB  max RSS={report['max_rss_mb']}MB  worker max RSS={report['worker_max_rss_mb']}MB")
+    for r in report["runs"]:
+        peak = f"  peak={r['peak_mb']}MB" if "peak_mb" in r else ""
+        print(f"\n{r['tickers']:>4} tickers  {r['run']:<5} wall={r['wall_s']:.3f}s{peak}  worker RSS<={r['worker_rss_mb']}MB")
+        for name, s in sorted(r["stages"].items(), key=lambda kv: -kv[1]["total_s"]):
+            print(f"    {name:<14} n={s['count']:<4} total={s['total_s']:>8.3f}s  p50={s['p50_ms']:>9.2f}ms  max={s['max_ms']:>9.2f}ms")
+
+# --- ⚖️ BACKTEST PARITY ---
+def parity(args):
+    """Replays each fixture day up to each post time through get_precision_batch and checks that
+    backtest_sessions reproduces exactly the levels it posts. Returns the number of mismatching sessions."""
+    cache = tempfile.mkdtemp(prefix="uws-parity-")
+    os.environ["UWS_CACHE_DIR"] = cache
+    sys.path.insert(0, ROOT)
+    import uws_intel as uws
+    mismatches = 0
+    for root in FIXTURE_ROOTS:
+        bars = {i: pd.read_csv(os.path.join(FIXTURES, f"{root}_{i}.csv.gz"), index_col=0, parse_dates=True)
+                for i in ("1m", "5m")}
+        for interval, df in bars.items(): uws.store_bars(root, interval, df)
+        for sessions in args.sessions:
+            uws.LEVEL_SESSIONS = sessions
+            for post_at in args.post:
+                levels = uws.backtest_sessions(root, sessions, post_at)
+                checked = 0
+                for i, post in enumerate(levels["post"]):
+                    # The store as it stood at post time: every bar that had opened by then
+                    for interval, df in bars.items():
+                        if os.path.exists(uws._bar_path("live", interval)): os.remove(uws._bar_path("live", interval))
+                        uws.store_bars("live", interval, df[df.index < pd.Timestamp(int(post), tz="UTC")])
+                    live = uws.get_precision_batch(["live"])["live"][1] or {}
+                    expected = {label: levels["prices"][i, k] for k, label in enumerate(uws.LEVEL_LABELS)
+                                if levels["posted"][i, k]}
+                    same = live.keys() == expected.keys() and np.allclose([live[k] for k in expected],
+                                                                            list(expected.values()))
+                    if not same:
+                        mismatches += 1
+                        print(f"  {root} {levels['days'][i].date()} post {post_at:%H:%M} sessions={sessions}: "
+                              f"live {live} != backtest {expected}")
+                    checked += 1
+                print(f"{root} post {post_at:%H:%M} sessions={sessions}: {checked} sessions checked")
+    shutil.rmtree(cache, ignore_errors=True)
+    print("parity OK" if not mismatches else f"{mismatches} sessions differ")
+    return mismatches
+
+# --- 🎙️ RECORDING ---
+def record(args):
+    """Overwrites the fixtures with live TradingView, Finnhub and yfinance responses."""
+    sys.path.insert(0, ROOT)
+    import uws_intel as uws
+    import yfinance as yf
+    today = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d")
+    resp = uws.get_session("browser").get(f"{uws.TV_EVENTS_URL}?from={today}T00:00:00Z&to={today}T23:59:59Z&countries=US", timeout=15)
+    resp.raise_for_status()
+    with open(os.path.join(FIXTURES, "tradingview_events.json"), "w") as f: json.dump(resp.json(), f, indent=1)
+    if os.getenv("FINNHUB_KEY"):
+        resp = uws.get_session("http").get(f"{uws.FINNHUB_NEWS_URL}?category=general&token={os.getenv('FINNHUB_KEY')}", timeout=10)
+        resp.raise_for_status()
+        with open(os.path.join(FIXTURES, "finnhub_news.json"), "w") as f: json.dump(resp.json(), f, indent=1)
+    for root, symbol in RECORD_SYMBOLS.items():
+        df = yf.Ticker(symbol).history(period="5d", interval="1m")[["Open", "High", "Low", "Close", "Volume"]]
+        df.index = df.index.tz_convert("UTC")
+        df.index.name = "Datetime"
+        # 5m is aggregated from the same 1m recording so the two intervals never disagree
+        five = df.resample("5min").agg(FIVE_MINUTE_AGG).dropna()
+        df.round(4).to_csv(os.path.join(FIXTURES, f"{root}_1m.csv.gz"))
+        five.round(4).to_csv(os.path.join(FIXTURES, f"{root}_5m.csv.gz"))
+    print(f"Fixtures recorded to {FIXTURES}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline UWS pipeline benchmark.")
+    parser.add_argument("command", nargs="?", choices=["run", "record", "parity"], default="run")
+    parser.add_argument("--tickers", type=int, nargs="+", default=[2, 10, 25, 50, 100])
+    parser.add_argument("--latency", type=float, default=0.0, help="ms each stand-in request sleeps, to model the network")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc pass")
+    parser.add_argument("--json", help="also write the report here")
+    clock = lambda v: pd.Timestamp(v).time()
+    parser.add_argument("--post", type=clock, nargs="+", default=[clock("08:00"), clock("10:00")],
+                        help="parity: post times HH:MM ET to compare at")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 3], help="parity: session pool sizes to compare")
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args)
+    elif args.command == "parity":
+        sys.exit(1 if parity(args) else 0)
+    else:
+        report = bench(args)
+        print_report(report)
+        if args.json:
+            with open(args.json, "w") as f: json.dump(report, f, indent=1)
@@ -1,46 +1,137 @@
 import os
-import math
-import yfinance as yf
+import time
 import pandas as pd
-import mplfinance as mpf
+import numpy as np
 import requests as discord_requests
-from curl_cffi import requests as anti_bot_requests
 import json
-import base64
 import re
+import threading
+import functools
+import hashlib
+from contextlib import contextmanager
 from io import BytesIO
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, time as dtime
 import pytz
-import matplotlib.pyplot as plt
-from PIL import Image
+
+CACHE_DIR = os.getenv("UWS_CACHE_DIR", ".uws_cache")
+
+# --- ⏱️ STAGE TIMING ---
+# UWS_TRACE=<path> appends one JSON record per stage; TRACE_HOOKS get the same dicts in-process
+TRACE_PATH = os.getenv("UWS_TRACE")
+TRACE_HOOKS = []
+_trace_lock = threading.Lock()
+
+@contextmanager
+def stage(name, **fields):
+    """Times a pipeline stage and emits {"stage", "seconds", "ts", "pid", **fields} (plus "error" if it raised)."""
+    started = time.perf_counter()
+    record = {"stage": name, **fields}
+    try:
+        yield record
+    except BaseException as e:
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        record.update(seconds=round(time.perf_counter() - started, 6), ts=time.time(), pid=os.getpid())
+        _emit_trace(record)
+
+def _emit_trace(record):
+    """Hands a stage record to the hooks and the trace file. Tracing only observes: a failing hook or
+    sink is logged and never raised into, or masks the exception of, the stage it measured."""
+    for hook in TRACE_HOOKS:
+        try:
+            hook(record)
+        except Exception as e:
+            print(f"Trace hook {getattr(hook, '__name__', hook)} failed on {record['stage']}: {e}")
+    if TRACE_PATH:
+        try:
+            with _trace_lock, open(TRACE_PATH, "a") as f: f.write(json.dumps(record, default=str) + "\n")
+        except Exception as e:
+            print(f"Trace write to {TRACE_PATH} failed on {record['stage']}: {e}")
+
+def traced(name):
+    """Decorator form of `stage` for functions that are a stage end to end."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with stage(name): return fn(*args, **kwargs)
+        return inner
+    return wrap
 
 # --- 🏦 UWS LOGO CONFIG ---
-LOGO_BASE64 = """iVBORw0KGgoAAAANSUhEUgAABAAAAAQACAYAAAB/HSuDAAAACXBIWXMAAAsTAAALEwEAmpwYAAZrLUlEQVR4nOz9d7QlSXrYB35fROTN6++7z3tX3nd197S3024Mxs8AAwIDRxAAKZKQqF26w5W4h0dcrnQOVxRXu8ulxCOK0uFSFFcLGpAgBIIAAQyAccD0zPRM++6q6nLvvXrvXZcmIr79I/2991VVz7Sb7u/XXe/emxkZGRmZERmfiS+w1Wyp3b1dDQzDMAzDMAzDMAzDvG8RQETvdiEYhmEYhmEYhmEYhnl7Ee92ARiGYRiGYRiGYRiGefsRhIDvdiEYhmEYhmEYhmEYhnl7YQ8AhmEYhmEYhmEYhvkAIICAYwAwDMMwDMMwDMMwzPsc9gBgGIZhGIZhGIZhmA8AAohDADAMwzAMwzAMwzDM+x0ByDMAGIZhGIZhGIZhGOb9jmD7P8MwDMMwDMMwDMO8/xGAPAeAYRiGYRiGYRiGYd7vCCCeA8AwDMMwDMMwDMMw73cEADsAMAzDMAzDMAzDMMz7HZ4CwDAMwzAMwzAMwzAfAMS7XQCGYRiGYRiGYRiGYd5+BAcAYBiGYRiGYRiGYZj3PwIIWAfAMAzDMAzDMAzDMO9zBK8BwDAMwzAMwzAMwzDvfzgGAMMwDMMwDMMwDMN8ABCEvAgAwzAMwzAMwzAMw7zfEYDAGgCGYRiGYRiGYRiGeZ/DUwAYhmEYhmEYhmEY5gOAQCIOA8gwDMMwDMMwDMMw73PYA4BhGIZhGIZhGIZhPgBwDACGYRiGYRiGYRiG+QAg2P+fYRiGYRiGYRiGYd7/8BQAhmEYhmEYhmEYhvkAIIBnADAMwzAMwzAMwzDM+x7B4j/DMAzDvDdRqowAAGsLDffYWrsZbavzq5thGIZhmO8L9W4XgGEYhmGY8VhrYG66jvednb53pl2de/DOld/VuvuGkGW0xuMwPgzDMAzDvCkUAI8fGIZhGOa9hhRlJDIw2XJb99218KcOr07cK0uX/wYA/COyIQjpojU+v8QZhmEYhrltOAggwzAMw7wHsaQBgKBWU83NjdYDJ05MbS4u1B+N9wJZ+66Wj2EYhmGYHz4EcRBAhmEYhnkPEgn4lYqs11tOq9F2ZaNZWlpdnBaR/p7f3wzDMAzDvDnYA4BhGIZh3pMgKCmgVnOaTqVUUhUHGs3ywnTLrRMZYvGfYRiGYZg3i0Ainj/IMAzDMO8xEARM1MswN1VfqtbKrlt2YXayOr82X9+Ya9URkV/fDMMwDMO8OQQg+xAyDMMwzHsJJV20FNLidL2xOtd8sFUuKxclzLbKjfWF+r2TTbcsEEBKl9/hDMMwDMPcNoLFf4ZhGIZ5b2GtBgCAzeXW2tHl9qNTriPKxsJso1ReX64/PTNZaYcmJEscCJBhGIZhmNuHYwAwDMMwzHsIR5SQwMLyXEusLTXu31isbzQUgvBDaFelWFmon5qcqswCAAArABiGYRiGeRMI4CmEDMMwDPOewZAFAIRazXWXFuuPL85Wmg5Z0P0Q6q6EpYXa0tRU5UiUmkCpKvvyMQzDMAxzW7AHAMMwDMO8hyCwIIWCiUalOjddOdpqKGmMgV4/BCkBJlpupdlw15PUxrIXAMMwDMMwt4fgdYQZhmEY5r0EgjYBrczVD89PVhbdkoSBb6Az0Da0ALWqI6da5WPrS9MKQPI0AIZhGIZhbhv2AGAYhmGY9whKKiQydHJz3l1fbDw42So3ABAGvrW9gQ29wIKjEOcnK8dW5+vTRJpQ8Fw+hmEYhmFuD0HEUQAYhmEY5r2AJYKpVhU3lxubR9eaH2833bIxBJ5njefZ0BtoKgmAtYXq4TOH208d25ipWBOSlGV252MYhmEY5pawBwDDMAzDvEcgIqhVS/LQauOxI2uNM/WqlANPw8A3Wmsy3kBbtAQrs5Wp04dbP746X10BALDWvNtFZxiGYRjmhwAByEEAGIZhGObdBkUJAQAa9VJ1c6X5zOZybariInT7vh74OtSGjOcbY42F2bbrHF1rnF+YqRyKjmYFAMMwDMMwt4Y9ABiGYRjmvQAZkELCVKtSX5qrHZtquwKRoN/XYRDakMCCHxgdhJZqVQVzM5V2u1Vajw8GgS4r9BmGYRiGuSmsAGAYhmGYdxmlyogAMNUqw8p848TsVGXOdRWEGsALrCZLFokoCHToB9YqR8LEhFtqt8rHF2aaCABAoN/lq2AYhmEY5r0OKwAYhmEY5l2GyIIlQ8tz9dbh5cYz7bpTMYbA9y1ZAxYBAIFQa2u80FpLAOWKgzOT1eNzk9UWERFwTF+GYRiGYW6BQOQBA8MwDMO8WyhVQ2sJ5qcbeHitdfLoeuuJiZpT0oGB0DcElqwAQAQAbcAEvtVBaMF1BKzM1o4cW2udWJ5pCCl5BgDDMAzDMDdH8HCBYRiGYd49jNEAYKFRd6qbq42PbC7XD1VdJbxeCL5ntEBAJUECABAhBSHowcAAWoTlmdrs6UPtLyzP1ee1NoSqxK91hmEYhmEORLDHIMMwDMO8m0QKgFpF1dcWavcvz1UbjhTQ7Wnt+0YLIYRUQgqJAgAh1GC6PbJaI8xOVqrHN5tPLc9XDwMAAC8HyDAMwzDMTRAs/zMMwzDMuwmBEALaDbc1P13dmGiWhCWAbt8EQUgGEVFIFChQCIXSElCvbwLPt9CoO7i6VF+bm66sRVnZd/laGIZhGIZ5LyOiWYUMwzAMw7wbCBQw3arB6lxrY3ayMu26EgJNMPBNGIY2RCAAIEABKB1UIAi9INSeH9pyRcHcTLU21S6fmW3XEQAAhcMvdoZhGIZhxsKrADAMwzDMu4RSDhqr6dDSRPvYevszk61y1VgCLzQ2NKSNtRbIAhARIIBUIIQk6evQeIE2gAD1miumJ6pHJ5vlskBkLwCGYRiGYQ5EEM8BYBiGYZh3BWsJluda4sSh9oMnD7c/PNEoOYE24PnGGEvWprZ8AgQCgSQACLQh4wVGa01QLklYnK4f3lxqLRtrSbBnH8MwDMMwByCAWAXAMAzDMO80iC4SEUy33faJw60vHtlorFXKAnp9TZ6vNSAgChAU++ohEaAlC5astWBDDWYw0ICWYGm2tnT2yNQnzh+dbxqrSfA0AIZhGIZhxsBTABiGYRjmXUEDAMFks9zcWG1+aHGuXhIooLsf6CAItRAkhAABhAAQ/4tV9ggAZCwNBtoabWFhqtw4c2TiR9cX6xsAAMTTABiGYRiGGQMrABiGYRjmXYGAyNLcZHVpfqY6V686oAOCbld7YWi0kiQlIhIhAQgAFJgoAqRAAUTUH4TG9zW0m448vFY/vrJQuWt6oooAFoSqshcAwzAMwzAFRDSYYBiGYRjmnUIKhUSWDi9PuWtLzYenmm5VAoDnGfJ8GxABSSEEIqIlIEsAloAICBAAJaIgAhgMdDjwtCmXBSzMVRozU+75kiMQAIAsewEwzAcJKcsohIuIJURUiCjif/KAfyr+TNLlyR+rEIVClA5KWUJHlVl4YJgfYhQgawAYhmEY5p2EgGBuuibuPbN09NjGxCcaFSX9QQgDzxhDSFJIIVCABURLRJaAEAkBAAQSokBBBOT7Juh7QgGirNdLYrJdPTzRcJuXt/p7vBoAw7w/UaqMxljI5gRR5BuEAEIgaB2+LfG9HKWQgICIQEoHiQiIECKHYgkoBFjT5dhiDPMeR73bBWAYhmGYDxJKlpDIQrvpNk8dmfjCkdXW8bIS2OuH4AXWAApEBIToLyGk3+MJAAQEgIaIgtCGnm/C0GDJdUswN1VfX5tvzn7n5e1dKRx0VBVD3ecBOcP8kCJVFa0hALAAYOJ/Q2mEAq1DWplvi2pFuXccW3DKrnJKDrpuCeslBxuuI5ySI0tKSQcxngJMEGsJEYgItCFfa/JCQ6HW1guNJS8wnhdoPwitf3S9bcOQQj+w4WuXdzQAgMISGjAAoIGsBUSMeyoBaY9FAfdBDPMeQiFwm2QYhmGYdwpjowH89ES5fXS19eTqfLUlkeBGL9B+aLUQQqAgtEgAkIynERAREWxq6bOWwFqygSbj+RZqVQeWphsLpzannjp7aOaaseGuEOyqyzA/TAhZRrAGAG2s9xOgpIBQ+2MH7CuzTTXZrtSffmBz8qE7l1Ynm+56q1Zabtad9WpFTtcqsl0ri0atrJrlsiqXSo4rBAgAArBAibBurbWhJu0FxvMD8oLQeF5gep1BsN3ph9f6g/DKwNc7A89e7/bDa59+7NiVG/ve9VOHpvZ2u77/2pUdCxB5CWSlIwAgUEohUfwzVgoIQBAI4Jvx18UwzNuH4pEBwzAMw7yTWABQ0G5Wa0tz9Y2pCVd4gwA6vSDwQ9SI0ZuZCCjyBABApMjwj4QE0ScgIQoQloB8z1DZkTjXdmunDrU+/71XG78JALu8GgDDvLdBWUKwFqJ+IZOFHZTQqrswUXdLrYZbefzutWa9rtqVsqqVS6rhlkSz7IjGT37yyGKr6R6Zmqist+ruVKvmTNTKTqVWkeVySSnXQeE6KEpKouMIlEpmUwYIAEABoABrLWhtITQWjCGy1lJoLPV9bfpeGPiBDQNttB/aYOBrr9vXNzrdcGu/F1zp9PwLv/wT5y72euHVH31qs+sHpueFJuwPdKc30N39brjX6enBxet7VooSWtKR7oESDSdAFJZMAVlWCDDM242KPAkZhmEYhnm7UaqEkUtsSD//+fMnptqVZsmVsN+x1Pd0EFphlJQSgZCIAGJ5P/pDANEfwNhwp5RQCAiDQajLJXDadamOrjfOrC017gKA7wAQSFlDY3r8rmeY9xBSRvPpBUC00icAECEQWZqZauDiZLWxMlObX56rnVqaqz04N1M9MzNVWW813Xa9WiqXS+g4jpCOA8JxpHAUoiMBpCCQKEAKASJ27SdLQAbAQiTkk426A0QEjF2KyAIAWXAkQdlBFEIgCgFkhbRUKhEBoEQwaKOJCBZAawCtLWltKPSM8QY2HAy01+sH/c4g7GzvBZe3d4OXLl8f/OHVbe87j9218cqx9cmd77x8xQcAENJBsiYqAxAg6ChAarLyKSFIlBBqj/svhnkL4RgADMMwDPMOYa0FIkvnjy/VP//0oScm6o5LBOCHRKEGTUggkITASMZPw/Rm/rPJT0IETFYKGHg6dEsgZybLYmmh1p6fqz64ujj5jwGMsTZ8Ny6VYZgcKNxYyk4s/RJmJiow23YbraYz1aiqZq2mpn/6M8frP/HJI4dm25UzC+3ykfm2uzQ9UZ5sNcuVZt1V1YqDriNBqUh4JyQwlsAYE/3TBoyxEGoCsgjGWDKaSGtL2kaW/YhIAQAoIy8jQkAiQEmoBKKSiFIBCkQQKFAIBIEIQiFIiYBCgEABUiBKASgJBRl0dGirge9PeoGhzkAf2evpe7f3gh/Z2fOvX9/zLm3tei/88pfu+G63F1z5safXPN/Xvf7A7HX6+sZuN9jf64bdi1f3tRAOEmnQoGMvAQUAEohYGcAwPyiKWxHDMAzDvP1I5SIBwfpiy3387uWHT200Hm+WUfqeBj8gQyBBIgmJgIhUlPkTi1j8BckCEIIQKCwBDQKjHU/oWSVKE+2ymJkun2g1ZOvCZdoZFzSMYZh3BiUdHJ6KQ2Tp8MqcOnmofeLEeuMjq4uVR2cn3bWZqfJ8o1muVusl1y1JUVGAJQEgAcHaSH8QeCH4vYCICAwBaCIKDZEx1mptrTGGLIG1iEgUOfmThVjkTzqUxLEIgMAACBBokZCQCCykjgECo+XCMfEWQARBKEQUmFQIRCUElpSIphgoRIkEEgy4JUK37KipSVetLldrmmgh0OaM7+un/YHRYWCM7+mgNzCDnb3g+pXt4KXXr/W+fOFq/yuP3LX2/OHVyevPv3o1ROUiGA0AFhAQpHQRYyUKgoDQcIBBhnmzsAcAwzAMw7wDRJG8CWbblYlzx9o/c2y9vlZSBN2uT75vwmgVbkhjaANAYY4exuH/CJAiuxxF8wCIINRW+6HVoYVSyZUw03aXlmeqy89+j7alkOioCoZ6wANlhnkHQCwhxAH2JUqYa5dhtl1uTbfd2Xq91Pjpz5xe/MLHNu47ujbxxOGl2pH5qXKzWXdUo+5AqSSBlABjbGTNDwz4vgFvYKwfGBP61oTaGqutNQSkCawlJEsUmfetjVfmi3sSFJHqEBGFACFi4T6eVRRPxAcbRR1FsJR6CBBQtpgoQbTqX7QwiYWoH0KUiEJJIR0lpFNCJSUJR1h0HJTlkhJOyUHlIFQcCXXpoECSwoIUBECWqlrDRHdg5nc6+vjVXf+RK9v+lcvb/Zev73jf/YUfu+MbX3h685LXD/YGnh50+nrvxn6wv7M/8Hb3fdBGA6JI10cBFECWFQIMcytUFnyDYRiGYZi3DwsAEuamqvPHNifuX5qvutYY2N/3gsAnLRAxdf0fIokFmE3YhfgXEWI0rUBra33fQFkKmJ+sTJ/eaD9ybnP6NWPNrhAuv+sZ5m1GSok2bb8KiHw6vr7gnN1snTt7eOJHj603n5idrSw32qVGpaacVr2kao4CKQQYAzDwLOx3NQTaUhiSNdparaNPY2LnfQtkyRJZsgQIFPcbAgBAoCDCKHioQCRCyJn948VEYgUAxj5FSQACiQAEFKsWKYvYT1GMAkIgIkKCWA2AQHHPhARkNBkLNlINgAUhEEsShZQkhAABElEKgUIQKkRwJGJJoSg5AioVhYu1UmlurjZ1zMCUF+qTnq8/5vXD0BuYsNcLezf2gu03tgYvvnKx82svXtj9rZcv7V/89ovX9oVwkchA5NVgQQgHReSiwLEDGOYA2AOAYRiGYd4hiEL62U+eWpybqUzVagq2tkPq9rWvQ9BKSgECBI0z/xfmAlAcEZAgGoITCgAgQ3bQD6yUSsxOlGunD0/+6EsX9n8PAL6WLvfNMMxbRjSv30A0zUYAkaHDqxO1mXZ5tlmvOj/5yTMbn31q475T682PHV9tHF9fqDZarRKKsoCQLGhDoAMLvUEIg4G1vb4OB54OwsBqY8hYCxYIAZBACBBSghQCRWzYF5HQDyhiax4iIJGIVw+JBHmK44mmfkWYBACMFQAWKVEGQOrvD+mSfclKJJECAKPcKAlciGApOQ+QtWQNERkbOQ74oAEJwRKRjeYWICKhECgcCdJ1hCq7UlXKUrllJVxXQc1V0KwJFMKRkqoSDJTDgBqdnp7b2vcOX1pv3f361dYXX7vc/b0/+dkzf/jJx1ZeHwzCwcA33f1uuL91w9+7eH2XEB1ElOkKA0QhKwMYJoZjADAMwzDM24wUZXRQwNHFafXFj2/e36o7rgWEvk924FMgEVFKkBAH9SJIlgKM39KU/I2WBYhG4JTOzRUCBFmifi/UjiSn3Sip44cmzjz7cvPh5bnGHwMZI2UVjenza59h3gKEUJjMogdwgCigh+5eWf3oQ6tPnjk88ePLc/XD7cnqVLNectt1x6mVBCoE6HsheF0Lg8BaPySjjSVjyNpoDr8xmiwQkABAFCAACBAJEWNBP7biQ9pLIEQ9RWK2x7h7wLTzSOX57A8kmoBkjZFkYgDGoQIoSUIYzxKAJJAAQHrm6LB4N4hE3BaRQ0J0egIRaSwFERFgtOAfEFAYWmMNWD+wWvaMkCIQQiIKQSglYEkKdKRAgYhSIs62S+5Uy1k8ttlY6Hvmvm7P9zu9oO8Nwv7Ovr7++hv9P/z2i3v/5I5jy98gCnuRgiYEAAOIDgoUIISEUHM/yHywYQ8AhmEYhnmbIbAw0XDhxGbr6OHlxuPVkhS+Z8D3yVhCKyUqIaIROVE0vRZyw/s0YleqCkgiBMZBAUU0uB4MdFhyQM7OlOTiQrW5OFe7v1p2/j4A9a3lYIAM84OAooRAGgCiQH5HVtqVqYlyu9Goln/68+fOfeqJjS+e2Ww9eHylPj/TLstSWYEBBG0seIMQdruh6fXCsO9REIQUagsWkFAKiFzlAVEgopAoQUE6RxejsKBZOXITehJ/oGJgP6BUzE8TFmXews+8YqD4kdub+B1l+aZ6SUAQsdeBxMTHIFdvkOlKCOLVBwCALJHW1gYhaWshiWBAABYQCZVEqaSUJSWk60qnUlayUlFyslnC2UlZElArGWMa1ljo9Oz65eveiY3l5gOHL7R/80ufOfebzzyy+kp3f9Dt98Pebjfsvnxxx0d0EdGJ3RwkEHFsFOaDBysAGIZhGOZtRMoyAgAszVVbd5+a/pmTG60zNaXQ6xkIAzKRWQpFLNKnY3mIjGWx920Ueiu/GACl4QKimIBkAQYhhcqzEgTIiZaDc9OVI+1mpQzQ6QNPA2CY7wtHOagtQeTuH1nCH75zceNTj65+7NSR9o8uzDU2J6Yrk1NNt9x0hahKBBta2PN86Idk/YCsHxgdhsaYkIw1ZAWCcEQ0Ix+RonD7sWQcu91j6pkfe+mn1vd4M+UkfUwk8lh5mAn+8f5UdxgrDTGNIZp0Mum5Ukmd4kwx+TkqK1Ocdz7ICKbqgSH1ZVKuuG8jxNSTQYrIgUBAdiIiJGPI+GRJW7B+SLI3MEIpLR0lRMlBUXIQHYFQcSWuLlUbM7Pl8+fOTJ3Z64S/0OkE3Z0b3rUrW/3vvXSh86+fum/zN1fmahcuX+uTpnhlAZSIAsEazYoA5gMDKwAYhmEY5m3EWg0ACDNT5dkTh1sfXVuqN5EQut1Qa22NlCiFALTJOLnopjsuJiBAYbhNgAhoEUhrMl5gwzC0ZdeVMD1Rnl+Zq2/8wbOXtpV0OBAgw7wJEMsI4AMAwES9BLNT9dbUZLX9Jz5xYvOTH974uQ8dn3ry2HprZrJdRixJMIag3w1gtxPYXjcI+oENvcTST0hSolQChZQolMgE/MR9nw4UQYv9AA19jv4Yv5LIAVnfRqJiTrfKO1VUjHoTFI7HaApT9BHNQ5AAIquLeDUCIqBAk/FDrY0lay1YBARHCVV2RamkULolIas1pZp1B6enyo4EdKyGRrcXLmzt+idevdy9/8jG3tePvNL4ZxevdL+5vefd6A9Cv9Pzu3v7Yd9RJdQm8ZKSACiBLHsHMO9PVDbBkGEYhmGYtx4DAkswM1VZWV2ur020Xdzb1bDX1X6orRECRBS8CxKzX+IBEM31T6yCkC4DkBkAKV0OABAIrCUbarLegMh1AOcnKxOnj0x88UOnFl/RJtwWwkFrORgWw9wMR5VjYTBy959slOCuE9Nn7z03/6PHDk99dHmxub4wXWlO15R0HQGeb2DQ1eB51g48rYNBEIbaGG2tBQCI5u5Hy/Bh3N6jMyX285hkHn5aEhoRuwv6wWRzHBI0WpkvTpk34ueOzy0BmEEAuZABkIv7B0lEEhzKI+8wkFdPJKFJs8gAacRASOYxFFcgo6w8mJQDszgEcYGSM0tMYiMAABEFodXagA1CqwehNb2BVW4pFK6S6ChEJQFmp0ulidbE8qG1xsJ9d0w/sdfxuzf2/O3rW4OXX724/+vfe6XzG8+92n3+hYvXdDQ9wACQBhQKhRBgNC8tyLy/YA8AhmEYhnmbEMJBIqKFmQlcmqvdM9kuV1FJ6Pm+6fnaRyRUCtXNjHDx8Dk/YKZsVJ/Z4uJ4gEgWbH9gTNkVarrlls8emvjIS6/f+I3Zydq/IeJpAAxzEIgVBAgBAKDdcGBmstaabLrtQyvN4/eenv1T952bf3JjdaJRq5cBgGDQ82Fr17f7He31PRNqTZqICNGiEiiEFFIpkLFkW5i8H8/yAQAa61o/nsyt/i1hrAvBwfm/XS5EqbU/P78BUkUDIkYxBhAQiFBmZSGwRGQsWK2ttZ729ygkREAlUZZKwqmWhVOpKFWrOmJxpqxWF6p1AKoHnp3fueEdf+2Nzr1H1/Z/ZPPl7j/91GMn/uC+s4tvdPu+1+37+pVLN3wlZOykIABECciwVwDzw48ifNvaM8MwDMN8oEEAmJuq4fnjc0dObLY/0aq7UmuCgW9MoI0uKVQitumnw9/YapYOhjPzG0TCf+Jgi0nsb4pn06KIYwkMfKMHnpStWgmPrzU3j6w0nvjdP1L//voN6wlZRmt4fWyGyRNZfqPpOkSWPvbg+sn7zs38/JG11mOLc/XVpdlqa7pVVkpK6HdC6HnaDgaB6Q/CIAystsYaBIjm80dCa7ReX3YCyCz6OWUAUaF5AySz4hNLfKzvw8gkHrsKFf3wC35Bw14C+bn946IDJtZ5StPlZ/QTFcUETHomSiOUpEsCJilSj4A0z6RoQ5kNk645mF5T+iP1PUiVJel8KRDJOgkChLVRsBNrrQ0CCsmSDUIwnkeyXNaq7ErhOhKUEDDVcmWtKmeXl2pP3HEmeGB3X3e398Kta9uDl1692Pv1jz145N+uzLZeef3qnrFgAawHiAoBJEgpQfNqAswPKewBwDAMwzBvA0qWEBBgbrLauvvE1I8fX22eKEmEbi8EPzQ6dteNVsYeCvIPAFAYB6ckAbrGj6OlAEFAMAi07g5QTTQcNTddrSzO1s83aq4LgB7xagAMAwAAUtXQmigYHFFIawsNd7JVq/z4x07e8YnHN/7SA3fMPLq50qq4rgJjLfS6IWzt9MO9fe15gQmILKEAoVCIkhIKRDSXPdbJAUAkQEd+7/B9GPCH5UvKyf3D0wWiXzRyzPgcR4txsB/SrX0DoJDituMPFA5FxAOuCXNTAtKZAWmYxCiUIAiUKjcZgYiALNgwBOP7Otyn0AoBQkqUriNU2XWcSkWqalWI2amyXJyv1gWKuh/Q/PZuePK1i/0Hjqy0Pr621PhHL13Y+drVnd52bxB63b4eXNnqWsQSIkoEEIBCgWXPAOaHCMUOAAzDMAzz1mOtAZQSFmeqi2cPtz61PldtgSHodkOjtTFSoAQETKf6QzHKN+Xm1haEiMxcGC8ZmNnKhABhCSgIte57GBoiVWuUYHa6tjY7VWvT89d2o0Erw3ywEbKCZBPh39Djdy0d/cJTh545vjn52fWV1omNxdr09IQrHSWgP9DQ64fU6YZhv6+DIKQQLBGiBQFxmI4kml0sSVMiiid+7OmP3Mz+1Asg+RNH+sg2AgABEkK66gfGc/KTYxLVYeJJBEnWcW8y7AmQzs1PfmbydNLvJEVN4glkHgW5/PP9VXo5xfCEmZNBdm1FHWdRy1n0NsgmBKQlp2SFVEwcpXLlHa3TJLpAksRasNF9sRCStp4lOwiFLA+EdEsCyyWJJQdhZkKJRrk2szxXeursmfaDOze8nWs7/UtvXNn/xouvdf/lPSeXv0wU7EfeABrIWkB0UAoJmr2rmB8CFI8CGIZhGOath8CC1YZ++lPH19aW65sTrRJ2epo6vTAwlkgpIQVS5HmbE+RvPXrEwpg7+6DEnYC0scYPjPYCA7WahPZEZXJtsXnnylz7NSlue8Ixw7zvSNaAJwpobrKJ7Qm3+pknDh//kcfW/8L9Z+c+enRzol2vl4Cshf1OANe3Pd3t6WAQmMAasAIRpUTpSKFin/w079SDn6I/+aU7c47xSeqRWH4HlDhJDrF/QbR1yGeICr/eJGn/M8YLAAuXmJbnZmcqeAzkZ0HEfylX2nHXPVwvuYkTxT2JhJ9eRKoziPyk4oCBQqAAzGkGECC0lvwBed0+AVokAQAlB1W1Itx6TahaVYrFOVctrjSaYEWzPwjXr1zp3P29V/af3Fjc/RdfeOrkP/vQqbkXdzoDz/O0f/HqvgZIni8CAQIMcfBA5r2JuqWvEMMwDMMwbwohSggAMDvTxJ/59JG7pmaqdaeioL8XUs8zAQCAlEIi2UzyB8hMbanZC3OD78StOBmRUzSmzQXzESKaUkyEYAxZz9NUdiVOt0q1E+utz77wavPLF67eeEMKBw2vBsB8wEAUsdTowpnN+cpHHlx+5MzRyZ88fmjikUPLzfn5dqVUqSoIfAPdnqa9/TDoD4IgCI02liyBSIPRIRICYs4Lh5Jp+pBaylMtXdHSnZthnxuEJ648w54Auan0hECYCNBFx/xhQTrzBMDCxuFZ9ZmDQCaOY+6cueJBXmQvCOWFviqb6U/5JQlyOgYEBJu/BIi9DTDxAsi8FAqKDcToT8GRQMR5JwXDJOlwpWOWGxESENjIUcNaIkMQBRO0RKGxjheSU/FJOi6hqxRUJMDybNVt1UvHNleaq/ftzX5pa7v7xpXt/vMX3+j+9scf3vi9773W+S5R6CMiWjCAKFGgAO5rmfcaisV/hmEYhnmLIQtERPffsTy3slB/sFJTMiQALyQbaNCORCmiiavx8leUH1VjYaQe2w7HjseHvgFEA1+BkZTgeUb7rnbaVeWcWG/c/7315v1Ls63/zfISwMwHBKVcNCaEyOpvaXGmITaW2jP3nZv78YfOz/7pc8cmD81Nl6WUEvq9EC5f65v9buh7AxsYS1agRSlASCkkkaBIAZAa+WHcXPxx9uo8mSx6QDPMfOfTU+V3ZbJzLmge5OMDDOV1q9aORXH75qXPk5s+cOtko5vTZQEPzmBY1YFjUuLYEiSeUmlYVcJ4YUOEaCkBKVElyhZLZC0BaQOm0yfTGWgfMUABA3AUyrqrSvWao+o1JaYmG9Wjqlk14eT87r5//tULvae/89Le1//4+Z3/8cn71n/n6PrUtX4/9AeBNls3epQpnhQQsTKAefdRwJ6ADMMwDPOW4UgXhQA4sjLlPnXfyoePLjXPVKQA3wshCI2J5vxjPK+36LgbTW0tjPfT9bEBErti3uE1PjrVH0TkFQADR8tm3RGHlhtLm8v1Z2pl9asA1hPSQWt4MMq8fxHSief5AxBZeuDMwuKPfWTzM+dPzv3U4c3JE8vTlXq77iAZC3u9ADqdIOwOwtDzTKA16bwLOaIAa5OGSIl0SbG1PHIEGJJDcUSsTn4U1XeRWJpNvs88CWI1ASZe+jkhH6N0RYVAlnOyPbHQJzo/pGKfkxSSokSpvz8W9sdpClb7yBOp4Maft7nHcQsKfVlUgKQO86WDwuIG8Z/E0yFxIsgL/+l1pK4MOaUmJrci9QuIblVSv3mlTeqlAAIskAWwxoKN+mkiJAtGgyFNFGowvqZSVZN0ywJcB2G6WcHqpjs5P1N77Njh5p1XtwaX37jmPX9ty/v6a290f+fOk0tfJ7L7Ud+u4z5eApHmvpd511C3VtsxDMMwDHO7aGtASoS1+friXcenfu7wQmNWaoKuF5IJjZEIIhIaxoz/8q60lE5xzXaNmNKGZsvGI3QhQAAB+YHV/YGR7ZZbmp2plJbma+fbzXIVAT2y9q2+dIZ5zxDNxY48cVbnJ9TT922sfOzh9f/4qYcWf/bUkcmGrLow6ISwvTewnT3PH/gUGks2EvpRlEpYwlioFwKRKG8xGzd0xqG2erBwDgCZNFxwTYchgTkVcvMHFQXY4SwLJRqzIT+lKL/j+xJHc4qBRBsBmYyfq5B0IkAq6acKExxTpgP8m8aWkcbszB2fKClS4b+oT80rQoQAREQpBIhIeRBPoLBEoSXj93S419eevAHSkSTKrnRqZVfVayW5MFNVi3PuJBFOdrt06vp2+NHnX9979evf3f7/Pv3Qkf/h8NrM653uIAhCDTt7AxJCYTTdQQIRBw5k3lkUP3EMwzAM81ZiAKAEczPVtaMbrTvmpyuOHwTQ7QWhDq0RAhCQ0tW2ETPn3Wz4W5wHG2kDEssZjAyE09Bg8chbCBRAQKG2euBroQlKtboL8zP15aXZ+soffMtsR26pDPP+I1rpIhL+n7h35eiPf+zoZ86emP7xExsTR46u1Kt1V0FnEEKn49m9Pd/rD3SgNWgUKJREKQRF8/wTQ3/UXBPLfMEQjhgZpoviJ+akTIDUFp9Yo6MciOKE6TqgcTwBguLEgnz+BKk8Dckh6Z6cd0HkkZD3AyhK5wX7H2V5JNc2zkEY4x3pfsoFNszXSrEjA8Ji2bJdmJnwMX9gUuacYmS4SxxWNuSDHSCCLSbLKU3S9RQgVerkblgciyBRUQCCABIWiRAsApAla0NrdWAh8G3oe+B4AZWqvlCVMopK2YGJhgv1SqU80SodW16o/bmzx9ufuXKt9/y1671vXLjc/Z37ziw8Z61+I3pOdRybQvL0AOYdgxUADMMwDPMWgcJFAAStffoLP3XXmbmZSqtckbDXtbY3MIG1YIVAkQnsRekhHf4mI2IsjospP2jPixwYKwFizQEiAllAay0FoTVeYMGtAUy3q60jaxPPnN6cfYHI9hxVwlBzpGrm/YFSZTQmBCJDAABP37929JOPrf+th+9eemZ9rVUtlxSEgxBev9Q1+70gHPg6NIaMQMRSSZRQJGHmCJLofllEu8xeXPCEj73xC/Jr5tkOsaU7PS5r0LnonZFyIXPOL7jS509WNJhnZcj1DLkVRQByBvc0i7x/QuJKnykX88rInNkeRhgWyHPJhq+jeD05OZ0wd6JcQoouo6DaiBZZHHGcSldDiK9LIBZ0F3llRqpoSAINJmkopybJ3ytKqh9BSJSohEQiEARAFq01YPue8fv+IIBdAkeiKruOqlXdUrXqyHpV4KlDjcbxQ/UTgW9P7Gz5H33htf0LX/ve1j//9JNH/6eTh6e/t31j0A+CAHb2PXKUg9oKAEQgXk6QeRtRQBwEgGEYhmHeGiwQWTp3fLn2058+8nijUXIsAPR9Y3zfBkIKqSSKzJUX4s8hV1/CnGdwNkLOywEZhThhhXe6BSBtyXheaKuBElNNxz11aOJTL73W/vWZdv0bhqcBMO8TIpd/DYgO3HFsfuL+c3Mf/elPH/s/3nV88tTyQr1UKiP0+gHs7vpm94bf94IwJCAQAoWIFoqLFGjxsvGRsJ5Mq0m9wQlSGXHY5ZxykiZCGuEuJ5xjXnqNs0t7gqTB5wRQTH7nnX+GJNrhUXzRIB6XI5d+dNBfNKVnSsi8DwINHVhwb0ivAWPBmgrakFzC9CLiXBM7e6z9SJUPuRiLmGxHAZaEjSRyEyWJA6livMYiYqY6xdxdSj0qYgmfEIBszhcgp3xJdK6YlAMx1cSKuF5jBytBRASGwBgy1pI1ADoMSAQhGS8IS9WKULWqkpWyglZFQWNBlloNZ3N+ofoLp09Nf+rytc6L16/3nr18tfMHT927/O3lufpLr1y64SNKjLwDJBAvJci8DSi8dRqGYRiGYW6BkiUUSLC53HYfvmvlkc3l5jlHSegNNHi+NcaAkVH0/2jYS1QcccOIwSzn3poMyEdtf0mCvKEO04F1lMVgEOpBT5bqZSmOb7ROPX+o/ek/fmn7ua3dgSewhJYHmcwPKUpV0JgQlEQINdG544vNZx5Y/cVPP776l08eaU24iqDbD+D6Vs90+ibwfauNAQMChUREKVFkceIzsT1iqHEOW/qL5uss3Zj2mc+usDRfbvcw4xplItZSYUvBHF+Uzg/INMsBc14BY5IOOx1RLvvU/D6cz7BWorg977mQ12BQrAcoVG9yMhKElLj2J8oNBIr0qQRgwVqwhCSQIFqtAQGtiCP/E4AQiIiIFHkJWIo0AFFXHK0ISJTOACAQEAVpSDUn0VICaBOFgABREiiicIHZAxSGWoc6NJ0uoJQoHCVk1VWqUVFOpergsY1m7fDhiU0Tms3Onvfk6xf3d771/I0vf/V7O//9vedWfmdxrnnj0pUbqXZWyAoiAhg94H6aeUtQ73YBGIZhGOb9gLUGLBl67EPLax86NfkfHV6uLyEQdHuagpA0xpYkhMgynzfkEWZyQ3G8nbjnDg2sMzNfZiDMWdWiIWtk3QQg8HwTdnqBmJmsqZWFWmN9ufFoo+7+bQDyCPTbVykM8zaC0kGwGgQo2FxolT735PEzP/mJo//pg3fMffTsoXarXEbY63iwteMHvV7oByGFBAixzR8FgsCc0JpXsRXaYSrUJ/PVs5SJvwDmjxl21TlIbEvyTdauz+1IvXowt73guT5OaMc0TT5kSP5zpChJEYe7GshtT7wBhnWQI0UY6p8OKuYYRWayAEruOhABSMS9HCKgJSCBBIiIAiUCCiBCshQJ/1qTCTWFZMEKBIECI7cEQSijiR1CRvccUYCwlizAgbc9rYDcfUFKvQUQYiUDpNEWiICstYaIDJG1BigMLflgIPCM8n1dqmnr1uskyxUHKmUJjVJVNCtqemay+szG2sQdH7rcf+6Na72v/8nPnP39i1f2n3v1YueCNYMBYlTsaOlYw4oA5geCFQAMwzAM8xZAsW1qbaF24vTh1j1L02U3DC10e2FoLFAkcgDG60sN2Rnzo3CIDU6Z6y4OCRg0ZJobHtxH834RpABBBOSHVsPAiEkC1WyWcH6msj41UZlClHtErABgfvhAdBExWq/t9OZs7aE7Fj/yxANLf/3uczMnZ9uuML6BC5cGZrcX+J5nAiAgKaI47/E6mRjJa5BTzY0KzEWRMJN6EdJV5fKlSizFUYrEDT2RrofyKljCAYfc+RNJfugkyfJ5qcIvdcAfOnRIA5D6/8fpR7UVBbLlAsdJ8EVBH5N8E1E69m4aXhbxoONzCoaoUhEhsdVLASgRhIwt7qiEkBJRCoEACNYCWTJgLVKohQlC0tYQkY3mN1nKRHiyRBaAkNIFHfNeU1i8B/letagEsOnUhGTiQW4FCERUAoUEkBS9FgiIyBJRd2D9ru8F27u+dJSQritVtaJUrazE0lyttDRXW7nzJK10e/qJS1d7N7738vYffeM71//f959Z+N3Zqdrlq1sdAgBQSqExAIgOWMteAcybR3EEAIZhGIb5wRDopOPD2Zna8eX5WrtRdeDytYHt9YxvLVkhQRYGxDd7/xbsUQWz31C6oqkt731MlDneBpq09Sz4oa1UqwCzbbe9MV+9Y2Gy/Mr13R4p5aDWHIGa+eEgWcHCWktPfGh14/NPbfzCfXfM/cSZo+3l6UkXfd/A9g1Pb+/6fV8bDQQkJUohUSImETfSxlXMO5ZBU6t/ZojP/P+HZOssv+EmlJOQc4J85uI+bPkf39IPNk/n84r/JMqMnEH9Zg17OE8a82047XB5Rs6T9nOY03vkOqRhh6a47ERIibUfMQroJyUIV6FyS1JUXCXLrkKlZFzdFqwlQFQgZDQdwFgArQ2EfkhhYMgLrPED0n5gdRgaHYY2SGb6o0CBAhAFCAEQuQxEMxmQKB+xIXfPMY46kHiAxM9E/AxQ7LkAQgAgoCCMpwZYa40hY0JrwhC0BwD9gZSDgXX8qnUbNaVqFYmtqoTJuiunW3J6cVo9urFcPXXm9NS3X7/c+/LPfOrkly9c6X13ebZ14bXLPUMUAKJCAAlCIhjNgQOZ24M9ABiGYRjmB4TAAqKA45uzlT/5hWN31uuOIgDwPKt93wYoSSgFCgVk1sHoA3IfhSm00bgSi9uHD6Bk6InZbNV4Omt+KTFr0VoNeuBZ26hZMdl0KqfWm59/6dXW1/t+8Open4MBMj8cIAoUCGCspY/cv7n52Sc2/vYjH5p/ZnmxWlYCYWurT7t7od/3TGAsWSWFFAJEfpp7asPH/DSbbA+kWzIrfBIKLm5e6d68CF/MJSeLDUv4I3Pn45+pkT4O5J96EGTHFi33WQnyZYrqqehVlBNRhwp1M3VIfEB84cMW+/z15acQZOdO/uUPzh2fVG9MNGsfEIFAIgqlIq+pQaDDrhdat+Q49bKrlNKCyIAx1gIQKIXCdaVwyg4opcBVEkqK0DiIbgnQD0j6gVWeb0I/MEYbMiZVmVggSzYW+xEECjFUKYmCIvHESh6GdPpHXMUULYtIApODknCGkUeDo1A5AFE8FwtEJCgIrL4RBqbT9YWjUJZLqGoVpSoVKeZmys7sbGXhzJnZhd5++PjFK/3db72w94d/8OzW3/36d7Z/89kXL3pJlSqlUEiJiAIMK3OZW8DLADIMwzDMD4gUAFMTVTix2T61Nl874zoIfqBh4BsdGtIlCSWREyDG5zIkMCQWvWiEiUWxIkkwznaIiWyTjF8REJEskucZ7Xmm1Ko66uShiQdfutB+6KVLnYu73T7PA2De8ySh3Vfmm6XPPXnszOef3vi/Pnzn7EOri9WSBYKd3cBu7/her28GAABKCimFEEIAEsZaMcqE4TTfcecqfEsF9qJH/LAJ/CDyJvLcMn23svwfTCKRZ2XLFBGJNDq+GIlxftwMgYNOVSzjQQnHnA8LyxPmP0ZzQsBkXUAiACklViuOMwiMefmN7oXvvnLjt/qevlYvl2YdKSqWrLXG+oQESmGlXFKtatWdqtcr7VatNDFRU/Vm1XGbtVKpWnVEe0IKQHK0MeCHGjzfWs/Xpu+FoefpIAwpBLKEAoWSIJVEiQJQQBR4sKBmIVtU9iSLRhQuHgAwW00iCjsAgCgjJRICWgtkrLVaW+0HZBEJ+xJl3zOlmueU6nVQ1VoJW5USTJXLcrJRnpqeKD+xvFA9fvroxJd/+Ut3/s61re63L1/vX1ibq7/x0qVdH2MAIAs0yzBDKLr9dswwDMMwzBBCOGitofvvWJ770Mnpnz+0VF+VZKE3CCjQxgBEgks6UMwZ7pIQfsPB/tJluyg3asbEBhWBiZQPSZI4axwa1BOCkCjIIvmB0b2+Ua2aFJsrrYWjG+3PTH7z+r947Wp/D9FFIp8HjMx7EowiusFUuwaP3r302KeeWP+7952ZPjzRcHDgadi+EYR7Xe2FmoyQQgqkyN8f4nZDiRaNYrPskDibeAOkgvHQAJkS+T3fwIrO76k+YMSvPhbP46nxlPYBmbBecAbA5IR5/4I4qzTKZ5LnsJdQYnTPlr7D5LjIt6CwjGFxCkEezDsn5K4pVSFkihTCoSqJFRGYuP1HHd6wF0Ixy0ipkQTkRwQsu1IGmuy1G8HrX/7m1v/zu6/svBgGRkdu+ijigy0iCSWEqLgl2W7V6nNT9fW1xcaDawv1R9cWaycXZ6tzc9NupV5TWKpIKFUF1DQJ35Oi00XRFUL0PRJak7ZERJasRUIBJABE2u9ibNnH+CKSuqdcncTq1vS+JjUVeRIkcnmsB0JCKUkkAWIhDvziBxiGodWdvi8dFcqS48tqSclyGcXCdKm0MDu5ceep9nqnG37h0pXe9vde3v/K17+z9fc+dGLxd4lo11EOAlhQ0kELCJFXAE8PYDLUaA/HMAzDMMztQmQAAGB1sXHs3LHJZ1ZmqjWjLXR7WhtrrIhc/5Mlsm8CFj7SH/n5tDAuk9y2A0yKUoAktBSG2nR7ELZqVXdmuqJWFuqnp1qVFoLYS4IYMsx7jWjOP8KJzXbr4TuXnnnm0dW/+fAdM5vtpgP7+z5c3/aC3X3dDwwZKYWQEmR+nralZFn7LJxmtvI8Yl6MHx0UH9xoD7SvHuQZMKpT+D45wI5emFoAALEgXUx8Kzv+0HSI8ZUylvSyc91RpmbARIJOvZsKofVyR8RCOJG1VC4JuTRTP7w40zj+9ee2n718rXPTahPgdiablcuLc7VvLM7WfmVprnJmbrpy58xk6dRkq7Q0067Mz7TL7dmJcqVVc8TcZE1Ot0l6xpYHvqZ+T2uvp4PAN2EYUGjJEiGCECCkBCnjaQpi7E0uKmwKypVYqWMpmRgQVYdARJSZsxZZJGPJBtpqG9gAAECiEd2SLtUqwqk3RKnZcMT0hMK5dsVZaFfml6ZrT68t1k6dPtr+6p/78Tt+7dNPbDx3bXtw6cKV/uWLlzs6ND4kSgYiy4oABhRL/wzDMAzz/SFEOR1Qr8zX7t1caSxONEqwc6NP/YEOAQiUA0oIEOOdjjML2kHe/IVjkmSxybDod4qFQ5OxPgGAEIRAhFpr0+9TEGjrNpslmJmuzC7OVo9b8l9DLPGQgHnPEQXYlLCy2MKPPLj+pR99av1vHD4+2Wo4ArZv+HB9a+D1epF503GEQgEidiPPudRA8kEUT45JWtOo4bto1afIqhtbuTNpOr9g/XCMjqx1x8I2DjfoovU98dpJ/ICSU+a+QOGAZF5/7AmQ9gm5yQ1xWRGHff2HypytQDJ0vnxhssop/qZ8qTGfaVSCtDAU7875PFG+TqLjYpM+CADQhmx/EOpapaTOH5tcd6T8L73A7P+Pv7L7rxOHKgAZ/wMAsABgwYKGrf0uXN+7MQCA5xdmGi+6Jfkv3ZJwGzWnvjLbnD26NvHMmcOTnz262jq2PF9rNloO1msSKhaxWhZOVwrR7WrR93Xga9IE8eoBFq0QILIZHIkkbwsWfIiVT7lA65Su6VKo33geB6YbABFQChIIACRRJvlqa81+z5ieh+HOrpblinRqZakqJcTFWdedm5nePHdqcmN3L/jklW1/9/lX97/xje9s//2vPnvlN/7ohav7KKIAh0JKBBJgLccJ+CDDQQAZhmEY5vuEyAIR0Ykj85Vf/PzxB6fabkkoAT2fTD+wIWG0FB8OjZvT44e/3XRe3m2M18ZZ6wjixc4JQmONNWT8QBNgCSdb5erGcvOpc0cWfoco6AlRQV5WinkvINFBCwaILN15anHi0XuWf+4Tj6381fMnJ1vgOrC75cGV6/6g29V9IiLHEY5UKAkIrM1LsuPaVFGqvqVzzgHZFM6Qz+QmmdHNdh/gwTOS5mYuCwc4B9w+4w86yKnh9vPEkYMzHWbirRHJwkKAsBao2wt9JVAsztXU/eemVwOt/+4XP3LyZzaXWl975Y2OR4BAdvy0JSkVWhtNhgCgAAACAOh89VtX3zh7aPblly/s/7tDK80PL8/XH5yZKm8sLJSX56bcxlStLKdbrpxquZWBMZWBr23fC02/b4LAt2EYQgiRUwoKASIOMImiIN5jrkdPPC7y07di7UyiXYonpWCstRGAGK8aAwAAlgCMtTbUpL0AAhgYUP1QdV1ZalSlW68pVasrnK2XcK5dLq/O0/zKfP3JtaXGqcPrjX//i184+6uffHz9tavXB6+//kb3yuVtj5KVNAAkELEy4IOGAg4QwTAMwzBvGqXKKATA0lxL3H/H4h3ri/XTZVeBHxL0A9KBBu1IUCKxhMUjvMRQlgxNASILYTrsHjNXINEL5CN4pxHDY0vTsOyQ2gIRAEEAgQAgS5aIPF+bMDBqolFyThyaeOb5V9v/fGl24j8QEUjVQKNv7mbLMG83FiwIoeDcyYWJzz+1+bc+8djqT2+u1ctaG9i6HNjdHeP1BtZDFKgUKYGIQEQYu2cTJE7/QxLzkJAezSfPXASyed1QnJWDuYOSOe/p+vX5RQOzLzQUiT/JIRV8i2E8cs48mB2WN+AjQBr8j4avLcs8OYDisqbXBiOXn4ql+Tn+IxT6l/gIpKzfSupsyCWChvOioocCpPcouxaMr88QUBBYvd8NsV7zahMtFx88N32ILP33JUV/9kY3+N9v7HkgZR2N6Y70V8bodJsUFbRkAcBEQfjI7M+061/96nPX/6haVv/3dt2tH9lo3n3+aPtnzx2eemhjqTE9NVWWzaqEWh3FYACi44DY7wD2PUKtIYoVQGiJAASCiHxLip4d2YXGT2PSaWfPVd43BCn2MknTxB4YSAQIFtKlLCGKTKA1mb2OGXQHVpa6oSo7QlZdKcuuwoVp15mdKa+eOj75pc6+/2OXrna3nnv+xn/48h9d/9t//N0bX3/+4lWDKBHQgpQSESVoHXC//wGBPQAYhmEY5vvAWg3Warr/3NLCXccnf3ZtvrYARNAZGPBDMtaCjR04bxL6PxnlxZ9Dgv6Ih0DhmPGM25M42EYRqC34vtH9nlZVV8HR1ebmyUMTX/jj57e+9sb1Xt8angnAvHugqCCQASJD951fnXn6weW/9vFHVn7q9KFWObQWLm95ZvuG7vs++gJBOA4qKeLAesOybPSzmH+macsFafv+7dupSiDR6BVOfqA1Pe0SCq35dk4/kmb0oJyOYLQob4mId5uZ5ITY4vb8VIHkS2Yrj6uSLCENfBts3fCUFFSenqrDg3fMHb10rffL335555s7u/2riOW0kpcW5xDIwqXL19OcZ9vTaIa8mqQsobUWtnb7GoA0APZfvrD7q5cu7b/w6uudRzbXWh9bmquemJ4uz85PVZqTTVfNtB051YJqL7DQ7xvT64eh55swDK0ODIUIAAJRSAECBaDAdOJDoo0do2IZdRmJ6yALyYKIBJYQEaO8EURUSWQM2DAkPfCNDwMSUoAol4RTrym30XBVo+Hi0kwJndmKu7lQW1qfqX9mfrp+9OihyX/zU5889dtPP7Ry4cr13vbla71r128M0jgBACUg4qCB72fUiHaOYRiGYZibomQNiaIR2pG1xrnzxyc/sjRTqYaBgU430FpbIzCK71SIwZWuyR1bDguzhTGZIztGJhiO2FsMn5U3NCYRxjF1M0hSAUgpJFi0ng9htxPImiuc1blq9ehq45HpdnkKgPqRpyzDvEsQAVFAD5zfmPncU5v/zUcfXvrsocVaqd8LYXs3MDd2TT8MKZQKlIqFLYBYxioYw0dbTjT9n3KtJW5JsUU/s/Tn5eU4AvyQoX2oyEMuPcN6gLi95+buR45AQ6JgLsI8UF5ZkStyojpAzBo8xt4G+esY8gRIp83H9ZTve/LXO3KNaWZJ/lSwW+frouCplFO0ZGWPbf35fWmfmJXCxjFOpJQSiajXt/6ODEWjZksTjRKcPjJ57z1nZp88vjH5L4i8famqaHSfLr1xdURovXZja4x3QGTpFugiQQgABJdv9OCNr3Se31hovdaol/+XyYZbX1tsnDp/dPpn7jw189SR9cb0ZNvBUg2hXjWy0wGx3yXZ7VlvEEBoLFoCsEAIElGlz4CFOCAFUvY6iB8YHL5XlFYVEBClCx1g4UEhAEKKFAFKgBAoMAo9QBgaMvs97Q0CUHv7oay4UtUrQlRdBRsLVbc9Wb7zrjumz+12/f/44pXu5We/u/Ovvvata//g2eevP3/xWs8zhgAgBClLKFBAyKsHvC9hDwCGYRiGeZMYawGAYG6qjn/yc8fv31hpztdrDmztDGy3G/pIlhyJUmAy5i+MiMcQy/zp/xE3H3mNcR7OuRoUY39F4pBARBAowhBMt6/DtrZOs+7A4lxleWG6skqkX0dEdEQZQ8sDP+adA2UZwVogCuiRuzcXPvH46t/8yINLnz220iiFgYVLV71gby/oGYNWKpRKoYzFnugwGGoRuSky8ZbcXyiseYGFdPnWejOz+Rh371s09HxJkqPHit9DlvFCtge1ymEnoRFHIbpVh3IbvMkMUgUkFTceFOsk3kWRPgOVAEEWrdZoOl3yr237qtFwxPpSbfKxDy3+5a0b/ksA8PvWDECqChp9+/FL5tpT2K5XYLuTxRBAoRDIBgD7AQB2pl+sXb5wqf/sxeuDL5w41Prs8nz18PRMeXKm5VYaFYX1muMEITmdvradrg4Gng61tlqHNrSIQiChiBS7WQTJ5L4UqiF52uKlFaM1XilbXTFdwjKbTRLpU1AqlA5EFWaJwABRqMl4vg471lolQFZdUWo1XLfZKKlGzYGpSVci1qubi/VDS1PVn12Zr911dLP5Kxcudb6+teNd3rrhX7285e1s7fnpChxCOGAMvxPeL/AygAzDMAzzprEAoGCmXa8uzjbunmpXHBQCuj0dDAahr5RQUmIU/M/G5pzEKg8522M6ps+EifxLmXJrfFPenA/5fGJbYjoh2MYGp3g8CYgUG6GSZafC0IY9H/y+byu1FuD0VLlxaKX59MmNqW8S0b4UDo8NmHcWq4FI04Pn12c/98z6f/vRhxd/ZH2u6vS7IWzvhnq/Z7zQolUKpBQQRTAjIoLkv8QunszPH/K2SSTLnGosW3wjidieLA4Y7U+t6QBJDPeUvO2bklBvqZCHiYE3OWd6VPQ/xQb8zJNnXINLlYeY8wbIzekf55aQxB2I4wtQUjNpbdBw+uLvYY+AZLFEAMpFMx0u7dDs9/wEB4qF1/h6EzE3PRcW7w0BYARB1M8SCCGEsWh39gNPoylPt11x37mZk5eu9n/55KG5PwYAz5o357l09cb2iDBLVhMKF4Eir4CtThf+3Tc6Vw6vTP+/fuvr7j+amajMHF5rPXrXyamfO3d88o6NlUalNeFApapF2fXLnX2S3T4FfgCabNzzxyFgEu/6rKYwN2MkHyIwfjYQMfa2SCosvjEURV7I7nNyR1AgkI3C+yFKkMkLx9OgTUdTxyfl7mtZcYWslqVwHYCjq43G8kLlgXvOz9yzt+N3L1/uX/jOi7u/+pXvbP0P33zxxgsXr/WISIO1kVdA4j3B/HDDHgAMwzAM8yaRAkGbkD712PHNxZnaYbckIQwteL7RWpN2FCgpQZAFa6Mx861cACJy4+bcxwEU91JxWe281BFZOzESDUTsNqwNmb5vjB8aVa8qdWSt8eSxtYlfmW1Xv04F+yjDvH0oVUZjIuH/ofOrcx97bPW/ePK++Y8dWqo6wUDD5Wuev9s1A0NISqF0FMlkvr2NJOjEc/82lVaUE2rzBx5s5f9+uJW/T9LQh5vtUKEyV56xmWDxd07PkBiYM4sxDSUak98tL3d8N3bgYbk+KMv/gK4wd/50WUSyAAgoJSARUG8Q+hY1tFtOdWGmIu4+PfP0t1/ce7rT9f7VpWsdgyjwB13nfnhVASkdtBY0AO0BqL2Nl3dfunyt+8eXt/q/ePzwxOMrC/X56aZbrldQzM+6jjau0x0ADXpGD7ww9H0dhiGF8XXIVDGcXHJs8KdESxvtiCcLUFF5NFK58fQUIBCxekVgFIsgeoRQGotkLNl+YAPjGU8QgCNQVspYqteU22g6aqpZwrnpmoOL0N5d8turs42VhZnaHesrzX/66hv7v399Z7C9vevtv3hhZxAtF2sBQAARKwN+WFHIqwAwDMMwzG0jRAmtDeie0ysTP/LI2s9uLNSXFFjo+RqMBYqCNmWem5EVDmODJSTb4y9DZjhMrG+U25wb+BUilFPOKpiN9hPDUGbaw0yvkESkjh0FfF/rQR9V1RV4bK114vTRyc++cHH31eu7gx0pFeYjaTPM24ExGlxQ8MCplYnPfWzjv/7IY0uf25iPLP83dkPdHejAWLJCopASpQDAZBV5iq2laQuJFQPDs/zT3YnERTn5OWfxB8gs7UiZPAZD0fqjc2dtMWuGCEVHgZyFOztFIUgfxtJeWtLYjyHv+Z9eY67QNPQ7nXefX3GAIieJJLhb1BmlHURyaZBY56P6GVIspj8x139lFZwa+pPrSoqUWPwTT+NCXzbkyZTcB6ScX3KugoCAwIKxxnoeBHv7QbmkpDi+3pr8xKMr/2UYhN1/83sX/t313R4oVcK3Mpq9MSEpVUVjNABoePXKPg0C76vPX7jx8vSkO3d4efLM+aPTP33+1MRDxw7VGhNTFahqhYN94+zuDsSu9SgMdWgsWCAkIdABBIyXqoiDRwIRIcWLBhIiIgkQaSHSyAFIsb8JFp4DADBp/IjY9YsQbJIzxCsVxM+SBSIvJG27IfnaOL2+UmVXi4oj0XUEHF6rt+dmy0/dfXbq4e1df/f1N3ovfOvF3X/8yJ0bv0IUXEV0ECAERIlS8uoBP4ywBwDDMAzDvAmIDAAAHF6t33HH8fYnF6bKlcA30OuFhgBISCEJgGxiRh9xsb193tyheWPb0CA+Ngel8kzkQk1BYHSvi2ZywpWr8/XWkfWJJycnyv8QAHasNW++wAxzm0jlojUBEBHdc3yp+bFHV//Pzzy4/Jmjqw3H62t446rndXvGMwAgFUgprBBxEDmKLeeJGDQsnOc/M2/0Ma3olsbog6yvOQ+CQrpi6nHtNq+sQMQxaXLnTAMZ0GiKVKAeMifHCcZPs8+b2Ycu/7Y8AApXMFLikTxwpCsqZkFjto1JGDm9E0qBgizQjd3QQ8DyzGRF3Hd25siNff+vv36t98K//0r3dRGtkveWonU/LalSLl7ZGcCVnd4OAOw8O7H73OsXO1+5ujP9Zy7vTHxmbWViqdVqlFpOCacmKrJekbX9Xuj2+joMfKuNIWOMhSQmoIAoWmxUHYkSILHt34xMi5ROT8HMpySZyhIryVAJFChRQvzMkTXkBRT2fR3c2AtACSHKJenUKqrUaCg1M1WWi/PVmrVQ29rwF9aXW8cX55sP/8ynz/1/HvvQ4rM39vr+jX1/97XL+34UJ0AAgANEtx+HgXn34BgADMMwDHObKBW5P85PN/DnPnPs0SPrjZVmzcHdPd92ejqwBCRE5AFgLRSCN+e9elNLfjpwS6d3pmkBchbMJHp2bvCezwcwN2BM15rOXvDJboLETxQQEWWgyXR7JphoQmW6XcbVhdrmdLsyGQ3meBoA8/ZhjQYAgJOHppt/4qNH/otPP7n2p46stly/b2BrJzTdAQXagJEKlMB0zn8sJCWeLongBGmE/cxSnVhE4+ZCyTwcLAibmHrVJF43WRskSGIKYCZc5y3ZQ060mEZxT/IoDrGzVQDy58zP/k7aMEHS4qPjsjxSHyGKzlfwfgBMTcqZO32uFyKKI4IMeTAUzPhxGAPKMh5RP8Tp0ngD6WT2tLKzbiu64EJ94VC95GOdFK+36K0ghRCWgAYD4+9iiK26W5lqu3j+5NRdr11e+PMPnJ3/byyZ16WQaKx5WwRRrf3Ym0ohgIHru334119++eWzR6f/L7/3x7V/sLY4cer44ZkfP3906qHTh1ozU20Xai2lOnuB2t8Pw24n9PzAhoaIUAhEiRJF5PJPhGijCiEcfh6jJx/TpyJVtuTuR75OIa3r4kOUeZOgECTQorUEZCzZQWi0IaLQWhr4RpZdJdyywkajJE4fm5hfXqx98YG7pj+5db1/9cLlzne+/eKNf3zvyfl/T2SvRuexgOiglMheAe9x2AOAYRiGYW4TYwwQEZ05MjOxNF+7b2bKLQmF0B2EujfQPgGCENHaTam8ASNywAHWrttnrLEu2ZiZB4u7KBsuokAUhGgs2b5nAz+gcrMhcWqiXF+YqZ0kMr+vpEQpK2gMW3SYtxZEgUoKWJ1vl55+YOVLH3lk6WdPHmq5gU9w6fIg2OsGnrZkpEIlBQhEgpxIBJlgOI6iWb/QVg6w+B+USxyN7eDrgDHt8Hbzvq294ws86g+QeAKM5jx6dF7BES9TMqbP+L4o9EFDDF/WTRi5w7F+QQoQQEChBt0baH9r1ytNoiuX5iuVR+6e/9LOnvfd1cXmP7JkAxQuDs/nfyshiqZHKVVGIR0ka3aefWFvh+i17zx0fuO3Ll/Z/8md3ZmfP7rR2JiadstVV8DstOu0qkp1+6HuDcLQD0gbslZrNLE7gABEQAEoKK8Yyhi5S0nA13hnTg8WfWROIWn7iacEAEgUKFEQIBgispbIC432AhPe2CdQUki3rJxGvVRq1B25Ml9WGyu1pvYmmle3vM3N5da5xbnqP//ck5v/7O5TM6/u98L9G3v+3vaeHyseBACU2CvgPYgaUewxDMMwDDOClA4KAbA021AP3LFwfH2xebJadUBrA4NA6yA0oVJSCUQxenR+6JWz+Q1bvLKJvPHvoq9sag0qpE+SYHY4ROPC1HuY4hXCc6Y3RACtyXoGTN+z1liS7abrHl1rf/Kh86v/qlkrXdvt8TQA5q0FUSIAwdp8rfrpJ1d/8bNPrP+fTm5M1MLAwPZOYDs93w+10VKBjJZPy9zcMwVAbGHO+ZJTbgJ6wYk6aU4YN5dUIBoxNxd/JhHvI4eD9Fw5PwPANOOiQiK1jA+1+3QSTl47mBd3abhMsdtOfqiec2BAyu9JcssWIsiXN4WKPzCWrkcExYL7UH4jps4CqUU//kowfHBuY7wKSe6wrP+LT14I34c5TwkLBBAFBEQBCALQENkb+8EAkCpzMxV5+ujk7KVr3i/+8Qu7//aNa/4FY94ZDyatvVhX5MQWcIVE+trJzen/7psvXPs3RzcmHjp/curnzh2ePH10pVmbmalgI3Sd/V1f7e4HYbcXeoEmbYEIJUohQShEBEGYxAcAyKo1Dd2Wek0k8WVy23H0HQNDsR8oXQIjTY8iva9RdlaT8QaGrAkpCIzjVYSsVJRwHQnTkyV5Z3VyfW218kv33TX9xcvXBq+/erH3+9/87s4//Oq3t/7otSsdA2AAwANEB5UUEOq3TyHDvDnYA4BhGIZhbgNrDRBZeuiOxcW7Tkz/3NJsbcYYgv4ghEBbk0TzFrlx/IEq9psa297swDUWIAonzUSl5HSp3IA50QABrQEz8I3uD7SsuhJPrE/cfcexqY9e2er8kxudfe9NFoZhDgRRoRAA0xM1eOjOxUc++djaX/3Q6ZkJMgAXLvf13n4wCI0xUlghBYpU6B6xwo82rLxgPr6BDTXKIcvpcLa3su5naonvzwugQEFWKyoabs+qH6UrKgNG/QSiPTmX8rE5ZkqLN+0TkOkthg4fkvhvnsXYxHlVipIorUU78LRPZKlZdxqtmgunjrRP3n9u7qe2drz/2/de3e0jOkgUviNCZ/48QpSQyHSee+XGc3/0/PZ3X7mw97WrV/u/uHNy+mMbK625VqusylUXZ0uq1KiEqjPQuudp3zfWGmMNWRAiCgyAORn91s/ZOFeBAw6iRIuD6S8QGAUkAIkCKFK8GAt2MNBef2C9G0joOEJVKqpUrztOve6IzdVm6dBac3YwsLMXLvVPr8+37ppu1/7Od1+98eXru739/iD09zqBt98N42kTvHrAewFFwxNxGIZhGIYpoFQVAQim2xX87OPr9959cupHFqbcijfQsL8fam3IICJiLLQkgzWbG1wVbJhDxpkkDHa63HP6ak5k9jRhJr8kMdBw2Go3ZNGMEmFxbBhZNhEBUAD6gdXdXliaqDt4dLk+f+7IxE/80XfLv/XSxb1XUThI9p0ZRDPvX4RwEMDATLsOT963/OFPfXjjvz5zdGpKCgHXd326sR8MvMCESoKUmARJH5JpEmkIkqX88ith5MXnISt13iqdtJGCpXrEUBq1GMpr82IROxGacm2UUkt47HuAWTuPrOO59T8Q8m4Gab8w1GqTExZrYEhOz+IZYJpDmmPSCaWWXipce6Yoif4NOx9QXM9ZnedVBkUZPa9yxKQQOFLtuRuUs0YX9JeYZU3ZQZFzU7SkCgJEriEIQlvUvk/h3l6oS0KqjYVq9aMPLP75fj+8stcN/sGla/sksIT2HRY4rQ0o8gjQcG2rS3/wTfP1q1v9v/7172z//WMbU58+e3zmM2c2Jw+tzVdLzaormkFQ2trz5F4n8PueDnRIISCikiilgEQXAJEbRc5VI71/Q3cmW/txJPZl+gilK84kSbN7WRAMBSHayNnEWrBBSNqShVCHxvdtqVZTslZWWFYS1hfq5Va9dO+hjcbfu3ZjsH1lu//q6xc7v/3s97b/5bdeuPHN1670dLR6gEBEBdayIuDdgj0AGIZhGOYWJO6kzZpbPrTafObIWnOuUVFwbccz3Z72ySJJiTJZZg+GglqNMOLqmweHPgt7InliXHqkkcFbqnjIm48oK5gUJIEAdGhMpxuGjbIszU66cnO5fmp2qjKHKF9NVj1gmO8XKSsYLT5G9NGHN09+/NG1v33/+fmjlZKCy9f7tLUbeF5oQkQAJYQQsds9ZfJgKsYmEmFe7EwlziFG9WEFYRrHbS7I3reAEAuNcdRqPxyY7Rb5jWwZb8bN2jkWmvaw78C4nEb3I+TPg8M9CBW7j5sWLxX2xxjxhzM5IFPMdVlF14hcwEdAEAiohBAEBHudwENL7sJc1bnzeHvmRjf8yy9e6v7uxas3nhNCvSuGTqKQHFVFY0LY2fdhZ9+//JVvX31jc2nuay++3vvXV88P/uK5Y5MPLM9WJlo1KetVR7olWRn4xvV8q8PAGG2tNTavPnozBSj+HD4U05qMGlpx3YFYnYPR8oFSgCAQidcAWQ2mF+ig29UDse2LqitL9apTqtccNTVRErNzbgsRWvudcPPVi90Prc03HliYrf9333npxh9c3ept9wbh4PJWz0YeARYAJLxTnhpMxLvTKhiGYRjmhwoNUiiYnaxXlxaa56cmy0IIhL4Xat83YWL6j9Zfjo1xInO2T6KIpzaXXKTxgiBDQ4PvdHv6kc8Ci8O6nAUw50ebZINJBHXEKGg3AYg48JTWpDu90Bs0Ss5MvYSzM5X2wkz9iLXh7yMiKumiNjx/k/n+sDYEIkNP3rty8uOPrv/nHzo9c2pqogzdjg/bN7xBzzMBIsQ+/5npN2oekakT0yXxIK8OiPdT7ndsER1pUkn7oFQHlhjYE/mSculShhe3j9NEUlnUrpPl/JJpQGn7i/QYBat4osCg9NIARsSzxDqLWNhX0PzFJ0oX/SAYKUM+JkjahwytejBMcSGSpC+Jci5khZmgn11joj0p9kXZ6Sm/Oz0R5pwTksJhvjOMs4lE4SQwAJGUIC0h+b4Jdi1Qq2mc9qQLp45Nrj9679J/9vC9a3/JWv16PC//He+/wtzygYgORvEvFAU6+L03ru/+0pefbZ04sjrx8buOtT95crO5ujBbdaampNShlZ1OQHtdX3cGOtDamnhliKyak/sfP2hFtXHii5K7z4UADPmHMSH1+cjFsABMvUUQ0kYTqQsAyYI1lswATGAsWF9bx9OmVKtJUXUFNMoCDi/XG6268/iJIxN3v3G1d/HCG52vv/D63q/ed3bhd4n0G1HD1hC9QyUY9jZ7R2APAIZhGIa5BUIAzLarcHhl4uzcVG1RSAF+YMAPonWdlQIl4gjViZyfG6zh8Gg7t0LfLew0+SQ5C01e9M8byQ44enhfMqZHRJSCRGDI+AEFPc+YCUuqXiuVVhYaHz5/fP5fENGuEG/92trMB4NE+Lr71MLU555Y//OP3D3/8ZnJsux0fdjeGYT9vvYJiBwlFSYGyehARKJRYSCvBUs2FD5/QMYZyMfto+ENBx0Eqbw1LjBfLLxTIW0hVao1GC3q0IHFnWOKRWPSjS1Rlq4oq9+eKToNRJj8psLm7DQH1e1wGsoqm2I9AAKBECgQAEIDxgtssL0bBqhkaWqiIh+8e/7juz3vwvHDU38TwO69k/EAxpGcG7GMl6/36Op273L4tdffOLy++NsXLs38xo292b9y4vDE2fZEuVIpCWmNISEASyWhAAF1aDUREI5M3S5eEo78oqF7mP92gNJruOy5f4iAUoIUUoi4LRIBga+tGXRMuNsJBo6DquKgqlakU606cn664qwuNSbtcTu5tTM4/dwru0+sLG7/yiceO/z3jm9Mv9Lt+f7A12Zrt09JkFABEgx7BbxtKBjXuTIMwzAMAwAAQki01tCH715bvev41M8vTVcnrSHo9w0FIcSDMkKBCASIhImxHRJzWrqgUxZzLG8Jywb3RQEhs2oOv6mHw3dlzrHpOeOdlFrPgKJiEWXjcRHFAUAhQIQa9CCwehAYVasocWyt+cC5I+17V+cb/w6AtKNKGPLazsybQEoXiTRtrE66Tz+w+pH7zy9+7shqu0bWwtbOIOx0Q48skJQgBEayDcX2xcSTJgsEmDP+Rn/SeOeQbR2yYEOuWcRtLCcEjzo9Z19yNtDifsjJ6GlLzdb3GBW5coWh3LXk0wjM+7ePimN5K3rSXQzJ4smsiMSaTjAuymG+tg7QQQ79zrqTMZMsCEfLmssFi8FOcEQBkrtezBUOkbC4wkGSFiGOohApATDWrQgU1oLt9LSvlBZz8yV1cqPVuLYz/YVvPXftn3z3xe2vYaQreNch8kjKKmpjANFFQEeTDn/t8tb+K4t/VDk2US8tL81WHlhbqJ1Zna+vtprlsqOk6BFQqK0peo8BDLlYZKRa5kz7klOuJYqnJPHoU5BMKcPkzmPhmUMABBF9WguEREREYIksBRBaLUygwfgBOmEonEYNRcWVMDtVFeWKszI/V//5c8emPnbpcud7V651v/ryxe5vnTs6/xUis4+IaEEDIqIQLhjj8XvnLYY9ABiGYRjmAIQsI5GFhem6+OwThx694/jkE9PNkjPohdDthdpaIsR0OJWNYpEwDf2XWyqrYP6iWIQBGB3MFRgzbqVhA9o4gYOg4L6ceiIQABARpisDohAohAARaGO7/ZCqrsQjK83VO45N/cz3Xt997sK13gVtOBYAc/ugqCCQhbmZJj56z+K9D9+98BcPr01MKSlga2dgd3e9vrFglRISBWVLZ8bz6g+c+Zzqy25ujT5YMB1Nf1Pp4jaN/IVNOXm7YOTOnBUSOSxug+Pb/TjrbF4JgLn+I+kPilEBxhTuFhPK833KsG25oC6hUcXkMOnlDlVMKsNSmlWUZnxXV1gFItKrUuEipRQSkTDQVu/vh16rqevNtgMn1hrL956d/cV7Ts//dSL7BqJAInuLUr/9GNOnWmUSB34IRAG8fKlvXr609RwAPEdE9MDZuX/56N0LX6yVnV+amigvKiWF51sRmmylRMzXZa49jN5dTF8HAABpJMU4dWElWSjegthNDGLNHMGwUgay1QNAohQiUQkAkEXyQgw9XwedjhFbCmWlIkv1uuPU6kocW2uVj6w2Nv3+9Oa1rf6Hn3tl//OLCzv/8In7N/+XQ6tTb3Q7g+DKTi/1mgAgIOJpaG8V6lZuPAzDMAzzQYVsCAAA5bJw15drT2+uNWZqFYXXtnq61wt9ICIhQQJGXrzp4Cs/dzc3yC1IA7mpAan9sCDYZCazXPSArGwAUFhPvGA5zCyS0UaRjBSRorE2YqwfoHihbxSEgTGm0/PDSqlSWp6tlU9stB+Yn67NgBAXgBUAzJuBQgCQsLHcnn78nqX//IE7Zk63mwr3Oz7t7Yd+GEIoBAghQIDAxEsl5/ENEAV+T2ftQ1Fgyc1UBsjN+R8yM+eln3HklW/DjTRpuzjcBpN2WTxXNt+6kHFOCZh6KeBwknwO0dWOjs/zMjJhLBhTlC9irs1HQlvO0k7F6khyx7QDGmNBzl9YUVGZN+yP9EmF3zi+/kdiBaRqyeJ5kiOjNQDSPUnpIVYUISAIiZEXk7Z6rxsYt0JyZaasnrpv8Yu9bvj65nL7vwKg4J2OBzDRmsXdvWsj57MCgcACQFDYjoh4fK29PfBh21o0aDFRlBARkACKHEaSqsJEgRIpm4seM1m7KPp7pDVeaEXDTQEKx0QVHj1y2fEA0bOGFHluJClNHBDHWrIhWWssWm3JBoaMH5pSo6pUpSKhUStBpazcxkT5+MJy86+dPz3zpSuXO99+43Lntz/z2JHf/u6r3e8SeSHGRM7rPDXgB0WN7WEYhmEYhgEAAiUFzE2W55fmamfaE64gS9AdmMDzTSgEIEoQqYAQjafwoFdrTrQfleghPzgbOaDAsMNmMpVgxPpDmJnWMPHbhDimUzT6jweKiAKENtb0+jYI6yVnolXCpbn67PxM/SRp/TVEiUKW0bI7JnMLEBVKgbA024L7z8x/8f6zsw+szFVEtxPAte2+NxgYXwohhQIJAoAw8/hGKi4ll4rZOSG1IDzf5kzWMdb54m8a2kbDG/Pkw+KNLuV38MA6buFDwf1SOXtI8EqTDFnME2ktL7znFQOJZ09Ub0kFDZfuNn/frHpxOM3QlQ9nNa7uaShNeoWx0TlOlgiX2bSpSK9BFHthIaKQKC1YutHzfMDAXZoty/PH2o1uT/+5F17v/vrLF2/8gRASUVaRTP/2HpwfgFZzBnHkoiO8wQAADZCNrqjdKmPZlXJuujp75vD0mUMrEx9rVt2GMWC1tWQM2fj9Ig7UaeUCZeaejXi52FghAMWVK/IuAFGlYzr1hrL7V3g1HVhxhGnQS4EgQAIqgTLZbYmoNwiDbi/wtgUI1xWles0p1epK1esOnp2s1E8eap8KOsGpS5d7H3v2pf1n/+C5nX/w0IfW/9XyfHOr1w/0zt6ApHTQWgCBAoxlr4DvB0Vj3Y4YhmEY5oONUjUksrS50HJPb0yeXZ2tLZdLEro9DYOQdGjBuApLKGITejIwzcxu8c9kVjPGRn8oWu7jpHmS0Rbmxl3xWC6Xakg6GFYKQHE4TvFoOZUeMB4UEoCIVtrG0JDxNQSeZyswCbLddtz1pdbTZ06s/m9EpovCZaMBc1OiIF4WluebpafvW/qRZx5Y/IsbC7WyCQzs7nmm0w0GZNCWHKEEZjJtlgEUhMJoMs3wsw5xiyJAtPGG4qM57BUTub5gvA2z+enDOecFUhzdP9pmKVfmVDAdKm3+osacNZ9X9BGLYNmlF45OReT4M3IHKJ406SzStRSTn3kJEUeKkNVXZhmON8CorXiseTm7upzWJd9/pVH/0/Jgev9SsTPLK+k8Iwt3HMMkdQhAxNSKLUgAEA0G2qcQTasqG1OzVTh9pD37+L3Lf/2xezb/VLtZvrSz54NSZdT67VVm7u1fL+QvhUKbLquKQNbSh07PLx7fnDzzS188++BEq3Sk2VCLC+3y8myz0m6VS+VAkw0NWW3IRnqOpPLilShSTwCEEe+VqJ7iyhnWDAwnBIj8LLK3jxh66tPHLD+FBfJJ4oVw4vslEKIlZyBe1hOIrCWrDRltwASGTGDIDALr1AMqNeooqq4D9YkyVMuy3poq37u8Xjt2152Tf+bihb0/vHCp8xuP37381dl2+dUr2z2wpIG9Ar4/OAYAwzAMw4zBxC7vJzfah+45OfuLi1OVlg4t9DxLmpBIiNTWPzKvOA2zF/8dFptHTfW530UrzthAZZCNt2B429A3wJzwn47AY8NUPP5PjEPGAhmLduBbPfC1dF2BR9da9995ZOrhjcXZX0MAkqqM5m0eODM/nChZRgQCS0SffuLQ6U88vvxf3XdmalkJgivXBmZnN+wbC1ZibNHN3PVTjViqEBh+wgrG5mGJk3Jt8OZC6QjDjSouwPBh4zVfOfUFZkLsSObpynUHKQLizQf6DiVJ8gJe7hcmeRdPW/yer5C4voa6JkqEbYCc5AgFK3EhJ4Js7v7NbtpI/5jbnKuS4fj2qRLkoIuKgiggAcaeAIQSCAJLtj8g79qOX5KOcBu1Ejx4fu6x3U74n3V6/l/c2bu2Z0w4fLK3jSgehgEpBZCOph9szDfdjzy4dvwjD6198d5zC3/i6PrEYmtCKUAN0howHlG3a3RnYEM/JE0EJASkEWfSSWexqiiuJIxjvaaxAVL9T1IWIEhs/OkmSHXS0e+cjhggXWESslsRBY8deVrjjVlGlCQHIkuIgEqhkkooAAFERKEhE+6HYaervW0nUJWycupV6dSqKKanHTEzPzl5h52a7N4I7nj5tc7nvvrt6//77LNX/+43X9j51nMvb+0npxaokEBynIDbhGMAMAzDMMwQSrkIoGFlrqW++NT64+eOt++bbJVUfxBCvx9qAAKJ8XAHAJJ3abqCMiWTMbHwmiWK/TEz68wQRfEmHZUNzxgYCR4IhVFe5r45ZNdLFuaOy0aUWA/j3fGPILSm29dULUs8vlJbvudE6xdffn3rj1+7bC5be5uVyHzgMFYDkaW7TixO/NhHD/35O05MrU9MlOD69R5s3/D7ng+BFFJIAQIFiWx9zIM0ZMnXzAKZbEwNoQiJlFNcZi5Lmpk0D7TCFyVhgsygDhBLNFl4/YPEWsDUEE/FbaP6iuLp48/MKp4ThYeF5VToiwt5wDB+WAgbLkKqWEzrt+D0fXMO1GOMqZmC3D68P1GfZgJ9Un25mxYrGtIuNa8ViF1IEr1m9FcKKYwl2u8ZT255YmFOOodWa+X7zs1++rsv7f3Tr3370q8jKny7VzZBLCGAiSvBgcWZOj517/r6odX6Pb/wheOPr65P3H94eWJzfaFZn2y4ICSBFwD4ngVfGwqMtdpaE09ziKR/iB+y3H3LPVgjT+e4W5VI7rmmlX5LnNPiFhf9SZVB+fdIPmPKlniAnHdbTj+X3jaBACAAAMECojHWGrJEgQ11aMMgsGEQCDcIZaluSdXqDtRcBxpTDlad0vREw/3U5mrjQx+6sPeVv/Az5//g8rX+119+ff97kzX32nbPiz2QFCsCboE6aG4KwzAMw3xQSaxDky23fmit8fG15dpEyRWwsxOawSAMBVkAATIa5GRSh0hGq8kKZQAA+bFSLiJTYWCWmm/ilLH5Zng4h7lvBb+AxKgX7U7NNrFHZnaK3LzqdGZwzhokBAoBBKGxptvVuqKkszLruqcP1+5b+WbpnP0j/cboOtQMA/HAG+H04bnaMw+u/8w9Z+Y/1qyXsNsNYGcvCAY+BQACHCVV5MZsIRHkIRMZYFhcKcr02bOcWRcxe/aHUw7rEdLml/cYSHLM6xJy28eJEQWLdTynGiGN5k+Ud5cvnHgoType+sh5hgXmqKFnLZBySYqZZFWSCMdxiaiYF8VzAhCHqjq/gkhc5qiroOxcB4hYIwqPISUExm7/lCYmyHsZjFUTJM7pWSyTwv3E+NoIARyppADC0Bizux8OqhVfTk9JsblUnbrn1Ox/9OF7jn6XSF9AlCili8a8dcKiFA5aMlEQRjJpviePLJbvOjb94H1npn/5/In2Q2tL1YnKhIsOCLAhwfZOnwaD0HiBNkFojLEUSf4AIEQS1hGS2xZfN6bPVLrAS56C/jmpv9E06WdawRDHhqHsZlJWz0kbySaUUS5p8uxnxyYuBTn9FQAQCIEopBAKoUSWrI2X1A1Co/f2ren0jSztaFlyAll1pXRdhauL9crqUu3QPWdnNnf2/M++fKF76Rvf2fn/fWXi+t/73qs3Xn7h4tY759rxQ4zitzjDMAzDDBO5zH/0oc3Z5cXGiYmJMoYaodvXoefrUKRW9ILMnbfgQSZtj5FObkXqv5nknhcgosFzfvJ0TpFQeK3npzmPDqozySP5hgKFQACtyXZ7JmhWrZqZUrgwX56cn6sem5ys/RsAABQuEgdfYmKkKiOABSKizz998vQj98z/+eOHJqbJEFzb8XSnp30CAVIIIeIQ5ulydeOs4envoTS5hzjblJpGi6qCeO5xIi6mZ0yVbGOs1emWYc+EXENL1WUIxXnVxRxyJYERw3oqjB+gXRgzl3tczjffQyO/Cikw/cBi6qKCIN+pFHQ1mB1d7Enyn8lJxit3hkt6S5kkl03W12Z7EoWCAESUIEkjBQEFe3s6cEtBuV13xIPnp57c7Xl/5fSRxf8UgDxrg5HTfD8ksS+Sglpr6IFzy3Mby42T87P183/ys0cfOLI6ceehpdrS8ky5VKtKCACh39fQ2Q9MtxsEvmdCbcgYAgsCUEqSElFg7hWQCPH5GTTpdkgUv0XrfrzaS6EKky3DirDRe03FR6KQuphf+q2QLml5Q20Z07IiSgEoSBpL8WwBoFCTtaHVA49ASSP7JaEqZeM0qkrVawqnGiWcqDmliXppfXa29qc2j0w+9dKF/T/4yU+f+WcvvHLj6y9d2L22tdPld9QBqAPVdwzDMAzzAURJiUREx9Zm3Y88vPrE7GRtClHCwDcw8GygNemSIhWFY8pbJAGykWluaETZ9kRnkATmHh1X5YfRmaVrOM44Ju6wuYFdNCIsnrJANk0U8mYkyjnURoGfAI0mM7DGdj3jTpJUtUZJLS80HllbbP2jnZ3eNgqH7QdMijUhEBF96MRK4/Mf3fwzp4601iYaEq5f9+zOjaAfWjJKocTREOR5sWHUsonFffkHnG7XESV96nNCSJJJ+om5c1NygnhDbCkHhLy3T14JkRYrVdhlbWzocoufybWkDkOJbTQuU17yyxcZ4uLdpA4OVAdgUgtxm7+FcJ5XFGaZxV4IQy77aV75i87fRxq68PQbFjalXejQ9SS1gwXpFlJFURwUjxABBRAogcKQoN6A/K3tEOdnpXtss1br+NM/9vxrO7/yrRfe+LVocbnvb2nAZG6/ELZg7V9bmhYfe/jo0R95dP0/uevk1Mc3lupzjWbJKZcVgLHg+xp29zzT82zoBVaHoTHWkkVAQCmEQpSABAJsVM0UKbDSJzF9jqhYZ7dQoeCYWzkubgUWvsVnTW5KTgk2smJm4gqTj9w5rKBJCwKR99mQsxwCYBRYNzqlBQALBJ42xu8Y0+n44DqoKhXplB0UJVeKU8cm6sfOTJ++fN079ZU/vHI3WPpLb2z1f0M4JWPDt2+Kxw8zrABgGIZhmBzGRu/FYxsTR88ebf+JmXa5GoYGBn1ttbaaCChZkphGLHtDkvqt3rEHWD+HvPnHJqLiz6EkuZFeYYA4eup4oBUN7xBAAAoDZEJDZuAZ7flWVR2FR1cmzp8/Ov3Q+tLkrwoEffMLYz4oJJbPY2vTlc9++NCfefj87CdnJ1zhexr2O2Hg+dYXCqSSoDAV8rN4lEk0//hHnOlBJ0vSvRn9U1HopOzrmCS3tkUXwm8MNe9RS/jNuVWqfGmGVReFeksLdLNMi9LfLav6FmUrZHKrzA5aifCm5z4oPkSyrajITE+FkdICEUBJFIgCtSa939WDek07C3VXHFurTT5698xffeqBtQvT7cpzWzcGIKRCa25PCYDoIKRdoIKpyQrcc25hcW2+fni6XVv72c8cu3tzqfHAqc3mifWFem2iXgKDAF5oYH8QUmc/CHo97fsBBYaAACwIiVJJlEKgQIFASAg2WvPggNfE2BAQhbs85mpufgvyCy/m8qPhur75Uz5+7cPciwjjwueac5ozRfePENDm1HZggbSxJtDWeD4FA184jgRRrztue7bmOHMVQEsoiKDbCa9cuLSjUZVZUX0AisV/hmEYhokQ8TJ3h1YnKz/2zOHPnjncOjdRU3LQD2EwCDUQgYhkf0QURUs7ZrMwE9GmaLLLjZcRCi78yViWxozcCnEB4pDbySrkBVNZ7swjm9N8knFXJIpRsh3z621DGiQqCI3pdjXVyxKPLbWW7j3p/dJrF/e/8eqlndcRS0jE1pUPMlI6GFte6Sc+duLepx9a+AtnjjQnSFvY2vF13zchShBCgBA563b0qFIWOWxEeB2jP4tModnPEeXb0FSbuBGMrA4wbLZPrJpJVPX8ZIJh+RJzbZQop4/IL++ZWWiTi8ss3EWJOVHiFa8EC205U5PkRd6sjJir1zzpqoBJWXJ9TeTNEB83HGC0IHbnlu8bJ2lSsXbTU+Q9AfLFoqw3i4owpnCFMmQSYmpSjjup7FEpqkkwN1VeIKAUCFaCNNbavU4YlEroVsoSHzg3fV/fC/9WENg/+9tfu3aBbDZ1fHF6Ct/Y2h7p24RSCJZACgBAAVobWludds4emzpz76npX7rz6OQzqwu1uWbTLZVLAl2FYDXB1e0B9QZaDwKjg9Do2N5P0kFHpc8HRcvmZW+Rop9YfjlMyvYWp1fkLfU4ck/zuRY8KCB5fvL3ebTu0yUIs3dISq7VDLkaZOWjdKnCoiorea8hQTwtJnk1WQISicIdpUJFQkhLRJaQvJA09Cx29wKngQgvv7Dtfe2PLv8/nv3e1rcBAIhXqzkQXgaQYRiGYWKIIqtOa6Lc3FxvPrW23GiUHITd3YH2PBMIBEQBouDXWMgg93mQyT1/4IEWs1sVFIYGam/e0IFFo2IhKxQgBCCFhsx+JwxdgaX5qYpz4lD77uX5xgkAeB3YCeADj7UWpptleOD08tSXPnn4/3D6SGu2UVNw8Y2B3d4N+tqiUUooRMLEkpkZNG++5N0w0cOaOaTf0uCdKAByEekKxxUdA4qfuX3jkr3lpC2Rcj+w8JEvS5RiqDS3KNyQv8BNGFMJI/txJEmxM7nl3Rkq20Fb6YAsbpJvTs9jAQiQEEUkevY9E1zfDmBuyi2vLzRLD5/HJ16/FHz24pXg77508apRsoTaBJQX/ovWfoTZVgXWFmsLi/OVwz/7uZNTX/rkoYePrLUfO7baOnJovl6fbDoAAsAPQuj1Nex1Qr3f1Z7n6SC0ZAQASolSSSGFhNiVDMjauB4imz/mPePH1MqbqZE3wegZR+5r8uKgMUfdtEEP78zlBTD02CHGtw4SDYcUgAJRkEAKQtLagHEcoUpl4Wht4crlPn3nuZ1vffO7W79+4cq+QSwjESsADkKlqj+GYRiG+cBDQGTp408eWViarx+aaLrgDwLoDEwQhEYrIQVgzigPEA3QqTjXF5O5kCIa9BANv2qHl+krfk2sm7kluePfWcLiACwZKKczmEevLF3YqWhXypuAEpugEIgKURprbbdv/UpZqrlWRSzMVScW5+r3AcCvASAILKFlL4APJAJLqISEQ0sTkx+5b+Uv3HNq9pFaxYG9bgg7ndD3AhMoKaSUQiSCPyXSTfTYRYN8pBHP/nxsPYK8kTMvcVJB2APIOQlgcXu2Nz9/eigNJe0uJyiPSDaUc0LAgsdOXiWIQ210xDI+0kIzy2qWV7Yr9TDA1EKav2IonCxxqhi2qmM+JGl+JYGhMqa/o4ocEfQwMuSP80LIVDvpBcNQaQtGaRzyPkjrKw2SmE8MB5J6BlDynKVXED0lglAiSBta3euR13GVatRctTrfrN5/dv4Xrl73/3hjaeo/GAtGCAcFlgDRgiUNKCwAKLAmpM25SXH2SPv4Peem/vTp4+2PLS7U59utcrlaLgmFEiQRbN3wyPO1HfjaeIHVQWi1sWRRoChJFAIApQCR3mdK1mEhAErvbjTRLG+5zz2w+ceScLjui3cwq3kq7k9qKXs4czrl4RU142chrWtCzKvy0jaVaKySZyO78+k9ifNO7xkMPdOpUxBCvOwhRe/cqO+wFqzWoA0BTdRVeWrKKQECvHKxt/vsC3v/68XrvSshGUBkG/fN4CkADMMwDAMAUpSQyNKRjenKJx5ff2p+qjwhJYEfWPCCaBDnOOQgItghuX3EBn/AYHVkZmTBvJIfyI1LeECGw4qENwEm1sXcqWObC0ogDC3pQUhh37faApSajZJaW2o+8sAdmzNE5roQvJjQBxFHVZFAQ2gs/cRHTpx68M7Zn9pcaTR838LWrq/7ng4AAIQgARhNEQAAAKJY+M/smwc/QLnGQcNKsGKSokX8rX0k3/Jxcu6yRhciuJnVfUQ1cHDSN1EFb85Wnxzx1ksPB+VIiAeslnCTnCidZUWxsgMRAUiAMAZMp2+Cnf1ANqoKzx9vH7mx7/2116/u/8Srb+xeJbJgSAOAhJmWC0tzldn5mcbUT33y1MqPf/Lwg8fWW0+f3mydWl2s1ZvNEgiB4PsWOj1Ne12tewMd+n4YBtpqQ2CFABFZ/FFIIWIn+NThnqiw1mviwB8L0LFiIK8GKDJinz+gZsfsQYB0CcZ83sNy/7js3sQDME53l89r+P0DEOsAUiUCxHoDAhvr0q21FiSIZkM5k+0SXLzq01e/u/Pbf/js1v/8/Os7A0SJ1g5YxL0JanQSFcMwDMN88LBkYX66Lh45v3T2rqOTX5xpKjcIQhj42hoLNlovOxpMZRH4k3FKzjpClA12KHK8zcYzsRVmSACgIVNhup549Gto7W6AzICaSfCUmj7H2W7iNPnyYTLMjLdjPDkzFbQia6exaH1NxgsMVEoIR9daZ+4+PfOZ00fm/2drdU8IB60NebD1AUKbAAAQDq9MOz/9iSOfO7TRWKjXFVy5PrB7++GAjLWOAiUQkJJ58QAAycpliQEwZ42PBKL4aU3m4RcEoFxAMMzb3PM25kygSG35Qwq2YXGpYGVNlGk5JVwWCb1gb8/S53RwI275+eX+Rsz62RWNzMtO0uTaYlJ2irV2mfKA8qeCTKCMjxmOzD/yOzW75643V5T0Z65sI7Li+Dxvpd/I26oLadMiYbEO421JP5bv7YiyWsLUdBwpApCiP0JEkwE8bfTWjf5ACbeyNOuqu0627/3ac63Hf+trr/7jKIYAwupsVZ09MnXyrlPTXzx9bOpTK8uNlckJt9qoOqIqBZAB2N0NwfNCM/CN8QKrtQYTLWWHoBQqAUACAUWSaSzEIsY+MERxhP98v16soezpLj7nqX9A6i2WhIVMzepRXSRH598tafvJR63Nx4HJnvS8gnvYM4cKNzb/3MUTTih3XZHPQNYuC/cM0o4hvdbYy4QouvdkowZmCUgokiUXS7WqQESAC1d7nd9/9trf+c2vvHxRSYlCSmBuDqvuDwCxjNGcn2xAVdSTEuTX+8z+5buwYmMtps2nMfF3MaYkw/kddMfGaPHGlnmoR8+a8VD64bzzaYevZXgb3Ea6fNoEC+MZl+e47Tcre5IuXwf567lZ/QznNe7eijHHZHXKgbIY5r2NFA4CGGhWy86Zw1M/dnqzfbxRVtjp+NAbaI0AAAJFUVyISFv+zcKDD6UtQEN7cWQH5N2d0zQE47tWGN8rHrTkeD7x8PgztpxhqMn0eiE1GiXcXKlOfejM1C+++PrOfwCA54jMuKti3qcopRDAwPx0He8+NX3v2ePtj09OlGSoDex3dTDwjO9IkEoJCQBgc7HMEhf7WCNQaCljW8xNBqmjj/5Bid+a1+9bNl7OFadoghserxT3jDb3A66rOBwc9uUeOfZN1c7BRTwg9x8cPLCXG5s2/zyNXCQKAAkgQmNtp2+8cglVo+6U5qfL1btPTf3S5z585Pmn71/RrpJqc7lx/szRyZ84fXjy/Ppys9WeLINQAEFA0N8PYX8/1J1+GHheEGhjDQGAEFJIIYQQIFCIrExxP1uIiYixo33ONT9tKEmhh18JI79uMv5NdTIHPLk5JVFx+0GywFD6mzxVYx+TkVNlY+5YPRLVQeFFFdcIEiIBaUPGEFDJFU6zLl1XIuztBfDK6/svvvDazjejFUmAx9y3ASsADkJQLI+OExoThh9xHPpnxxxzs/wOEk6H0w1vGxbebzbKs0NlvNWIEODmHcGbSWuH0oxTUIzLY5xiY9z24fTDr8zhuh8+77g88vkkxybXMaywEEPnRgAhgIzPHRHDvMexZABAwEy72jiyPvHhtaV6VQmC/U4YDgYmiFf9iwWWZLCS2QaRYqEGACCNQw2Q9Ak5Q0i6FbPjom2IxamTlA2MhkeymMusOGiEwvmi0kAcoyARxBCTIAaUlDuORAVx2qSAiIhCkDCGbKenw7KrSvNTrjh9uHFiY7l+PwA8BwAgZRWN6XNf9wHAGANERM88uHbiyfsW/8bZw5PrSgjY72ga+CYkAECBQgiMDN8EELn+Q/RAUzKdFwAAktDf0Y8kGjgARA0gtyhZHFcjp1pHoEReQChGQ4e0dWbeNKnyIT7xUNscWWJw6H2e046lDtxxspxQVzi04MlTGFZg0gGk54wEQErzzlo0QhbRPe4PMGczzwtsmDtnYhlOLyOujzh/SmsZs925wmNSr2kxEk+hnM4z57mQ3Lkk90JSyvIoVkXOqyMVeHP3iGI5GSh3IdllU1p38XVntwQA4y155wJMngICQ0jdgQ22d0MlJeAdRyfPTzXK/5OxZCplVZudcWdmp8vVZsVBJAGd3QAGgaG+Z3TgGRNoq0NDlhBRKhlNOEcRvxqIshdFoQPPVV50HyFeDCNeAICytwqlNyXTlGHm0ZE8J1lDyranty3xLogUDVjIK+7/Y4+A5F2EaVuKG1csmBd8EXICe7Y510DSlLn7n1vFIAs/F8cDyL0xIfcmTfoNEV+gNmQ0IDUrTq3dLDlBQPDCa5397zy//b/ubPe60bi8BMyt4QgJY1hdmBQPnJ1enmq7M0KiM+jr/X7X04FvPJQglSMdpWRkDCLIaauElxNuNYFViCABrJNrwgAEma9k1BIdAAzjBhSbUij2XyEnd2TuJYPReiVIDqb3EQshmePGF2ZvHluJj9XxuULK+pd4oInxOSm+NggRICpf/j0A4BBASGCdguvasIkJRZh2QGQqcT0NsvcMAhH6AKQAo2tGEJk5qZCljesEDSBIIDBREpK514dBABlnDUCQpkWkgk9QPA/RSSsL4/rKVTSiMIQggfLCfnwMkEqHIigHBMJYAi0EqJIry+WKalZc0frkk4d6r17ovPDN713bBoZh3pMoARAaQz/x0VMnVxZqq41GCbodD7o9HfgBaSmESPrxYdVp1jX+IPJvfvg8fIYxeQ/rMod2Ju6Utz7nwacAQBAICAKEtZa6Pe1XKka1265YmKlUVhfqj2+uzP1DJZXVhr0APggILCEAwMJkHf/Ejxx+4u4z0/fOz1RltxvCzm7ga22MlCBiRRJl0s9wiynGpL/Jozy0MxN66QdrcG/64Fu1poPOcbPj8iqGvMg0PNd/OJ9xPcRwnnHC76fY+UIVM6SRv6PHvMmKfcu1hpiKr+mGTKkRbRUAoISQoQa7vRt6VVc4U61ydXaydlQIRKck0S0jCGXBH1jY3/dNp6N9zzNBaEgDEKBEIRQqqaQQyRwtQiJLgJStSTmktsiVafTr6NOS3XmEvNnpNmptRDEwbv9QG8xNvRmb2bCEP5T1TR+2kfSY+8gCCg6lQAACFALJIhlrLQFAo+I4rUYZ3rjWs1/51tZvff3b13+l0/UCBAGW2Oh2O6jbCijyAUHKGhrTo5XZ6sxT987/2bvOzn5hol2Z7HXCztbV/df3d70LIMmpVJx2uVxqKikVEJAxFAIAIIBAEpaAYs2kBYwGUDLWfAlBYIEQDCSz4sAiYOz7n9OORf8sQNRhxZaZdI5APC8KEUHkFj2lfJeXangpXgklyTn2S7KWDBFYBAQUKEW0uFUmJBNZsmQiJWSk1kw61qQ7NURkiQxRLCEXVy2F6JIRgMjGC7LYnMZXEIElCybW1oqsm8O014pVEZCZEiAZO+S7t2EH2VhnTDaefhVPd811digEAgjMZxOvs01xoCJEjJSiZCle2zeNo52uf4soSCgklEAE5Lii0miV2rWGqkpr4cWXb3zvX/zmhf8EAH5biDJay8uSMMx7CSEUtqoOPHx2afETj2/+1Nx0uUFAMPAN+QGFRoMWJXQEgkCMo0vF/VQ6tTc2lxEkytS0u4SRkVZO+Enm7RfexVnfkjscCt+pYFUqJkBIFaDZmQpaaMh+pNGWkoxzC61R1G8KBNTGmoFvgk5Pl3zfurWyA5tLrbtOHZo88fKFq9+SosSDiQ8EkfX/kbNLiyc22p9emq1WhEDY6+hwvxsOCAiUACkQRDQciFxPMFu0HGIFVRoIPP+AQrwhaw9YkA3SlpJYQwEgmeucEreNxHo50gyH2lVxHnM+faHJZkOOvJvOmPXrEwtqIiVTuj13rqFVPpJrTgTULG1aX+n2fFOOxpuZZZeSYlPcDxFkZUzqLIkVMnSdaeR9GLobyeiqUDCMzzFcR/HX4VHOSKT6ws9U6ZEMZrNzFwqSXHGu7jA7b2q4wbg2CeIFJqjQw0Z1g1IikkXyfRuSBaqhKCmFEpEgCELqB5ZCY8j3SPueDcMANBFYIUHGitHIcD8k2Kbdf3qhlO5PY2EOV1ha2rhHptRnZkinMhzqEtO6zR5XKj7m6dS0wrsgl1NUSYgCo1UI4hgxaVwaSsTw/MEQVW5a6bnryn7nry6/H9MXVPSiJJtvwLlrTCqSkCwAoBCiLFHWKo4QUsCF6/39Lz97/e9847vbz+33AuC5/7cPewDkiR9kY7S0lsKZdmXq/Om5hlstNXt7g6Xt6917g4GvJSK65ZJ0SlIAIFibCKjZYIvARktdIILA1PUGReyqpCkKBWIhaQgAwyq31C2LCAQkDTD+RAHJGzTXs0CuWwGKpO38axSyTp+ALIC12csKBUTeS+lbJItOmnrnRBJz2rQ1EdnkjZPrgZMekXID20RfTxDPmMfIB9Da2BkVkxdP9DfTdCavBgtptJScu1ByTPp+ihUhNq6TSPgXScSVrKrzIxBMBgoQKwDSwW+Ub+yYkXrt5e5XrBoAFBKV40B9woXSlAsAFq6/tgevvLIvtbbB6APHMMx7ASIDzXpVnTk6/fDZY5NPN+pKdXo+dAfaWIuRIjYdyiXOkJj1e/mRZUrkzZn1IgecO848U56OjJwPPvBAkTvp14rFKg4k4y1xXw95parIusX8aYwl43km6HYCt1KWcHi5sXb/2Zk/e++Zlb8iBOwiSiQyB18s80MNokABAGfWZ2offXD9M8fXJs+WlIROL4ROPwxCbXSpBCUlIsV/vLrZ0AzkeGww9IiOHwXBcJM6cFc+79HNB42xDuCmhbgVRUEoK9GBjXXkPMmIZ3gPHvAr2pITC29SZ7dL0i8Nya/j44iMLdJob3PL8w0fPjbr28s3G+9mPymtmyioKopo+G0t2SC0GgYheoHRAASBNiY0xobGarJIAhCFEKgUKpSIIs4vfc6TiSipgJ8b9469sGT/LW5QTjAmzKuZ83mNZ9y0s2znAQclEsBI0MpxJxgtwoHteOzxmPsggDGXlUyNMIasISC3JEqNmnTLroBuX8Orl7ovP//a7nPbewMAQCDiYLS3CysAchjbJynKONMWV/7tl/G/lUpWKq7zp8+dXSjXltpQaVbEYLtT8rseEQoUSgIIEWsYI01YEjmTyIIlAoEiXgY6GmXJ+JUnidDaTEyO9oo0XSzlxyWjeP5L0pojEZriNOlANNqZybEQ9R2xs0DW7cSys7X/f/b+M1CS4zwMRb+vqrp7wpl08tmzu2dzwC4yCIAgmEWRFiUqJyvbsmXZ8lPy07Ulx2vR6cqynsP1u+/ZvFe6V35+skQFSiIJBhAgARAEQCJnbE5n98Q5E7ur6rs/uqq7umfOBsRdYD5gz8x0V+rqqq++/MVCALIntOuHZ1KUIrBkdABGFQSYPBMnQE2DG9fkMwXrmxcLQiill5HAYFDQRuyc1Q+kCNQ2zYBZihRtm+4xm2jETFhRwkS4GLfLTHkCI4U1rofWxxbd1tL5j4Uu3AhxjEDHDFgDgFYKiBQEHkB5LACoewA+Qvt0G+57+NyLf/Klk3/78RdWvhXP+Uj7P4IRXE2ALMbKk+Ol6uGDkz+9b3d9PvAYrDe7utNRIQAHzoi5PL7BHvFPMhgUHUGpIQoNT00Jee6GDLdy2wwFlQpxHckAuBXyfrqxVsfRrxCmtx1fUdef12r6UvctMijUwZiY1qMYUQJnwJXUemMjlAH3xK4tpdJ7bpr6vpdPrn724adO/ikiohAFlHKE595uIEQBAQgUEf34xw7d+sE7tv7qvoXGhAoJ1jdCGUmlGAPGEZEhgrbRvc1ZC1ZxgNn8Fq4vsLkQf6bWfikDatZ0oiww2vKEznD3j62bARz+izIfznUkQEq2tc1lYBUBlNA4zt4nq3tOW7M0T2ZTWPolnqSUdnToxQyr6woxMBclgJKQCmhnIr6clQTgwBznn9e+E8MF2rE5koAsVWbwEhk86KYPyFldODZPOdQ0SLumLzupDpTEQHC4TqecC4nfetKHw4YTSxcWAaTYk0ApUIoUkkKSGrQm0MzYvzIAZIwYcle3nQayGHR/jf8kTzeUUXb/Ju1Rtowz18lmMTtgeKMDe8jNMJAZqtNTugUoLZqUTytiWiX7fLk+cgYfg2C2amxhC5RKBMnZ80Z5BwhKaUWgoVL1So2G70daw5GTG+3nX175s/NLnQtxo8MCqY9gMxgJAHKgdI+QCVhcuXC224s+2evLlfMb8hcPHZ6bnKr7UKoWIYokrjZD1VmPJCJHwdEEFokPCiIWY8PEAiDGNDHbDpDw69pktYQ8urcCgPx5Qc6WQ9CAQNoa1plNm5hwZc2EHP4/KRMbDMQafG2PLcePCY2PgSsAiEUC9jB3GH+rQXIREkHyDAwxc4gCENiGEjTnnFbpoZ4eZtn0WTZoCBmcSEAWORLF/1hMkWcQlqXFHQSIjoSErJACEUA7KAyN+b/R5zFEVEQkVezQEQjNGlWPA9egWj0483Kb7vvG2cc/fc/xv/npL774KKKPQhRRylFe0hGM4KoCIhBcwPRkeXJhe+X6qcmARb0I1tfDXrePETOxnJ0EU5CYSQ1lHDLknNPRADeSHwgMal0ssesQvZtAlha+dFkH2SZ8TXITs+WM0BcFBw5E1GpH/aKHbG62wPbuqE7uWah91/b5ib9AYEqpzbK5jOBaBqUUCM5h77Yp769/38GfPHxgfKFe8/Hc+bZqboQ9TURCMIFsaGp7xxsmYWusSOpSG2NzyCzki8AgZ3+p8pS/cGWDyv4i9/rAWF49OCIB+0ksFS0YYmmwI9c8f7Mny1/P9IW5gi7pmr9/iX4GG7pUqct96c5ALOVMlq2EzDtmHLhFhFqB1poREBJHxhgjltj5oyGNycZJzfiwDDyNM4LBMVnz/oTTHvJMmQOFHAGA08lFpmxAOJWl2Z1OsoICV9BC2SKZUhd7W/mncVkF2y/CpQQFMd2tCUhp0pwBq9cCvzFewNPn2/obT53/6hPPXfiTdjuUiAy0liP6+gpAXBlie2cAaUmIAp94aWn5ul2N/3xuNXzqwxf6//NdN88cXpgvsKDig25LaHX6fa1IBxw5MI3IDCuq0/CsiIDIgQGZVLhgDzyC2MMnxkcEADpRbydiMWM/lzL1ZoSQyC2Nv3q8URJvGXDfKzp1CbM4JR2Usawntwe7RSltMYkAEF+xv9Ko2FnVEiVSPEqFEBaPJYqmLAqlTIc5oWaGPo4vELPz6aJ0glhm6551BEhWTOC0YiBxayOwEkkCIGBIcUNgBdzxIKQCpRVSEKAoFoOCX/KBAOH4iQ39ha+d/vKffPnE3/nm80svIQYIjMGI+R/BCK4+YMhhZrwKO7fW3jM3VZgIAoRWU1Gro3uKkDyPCTQmUVmRpf1CqRcXpALalIxyqDR0NCZWpmoxXkZzn7Sdtuf6jqIpT8kV03d6LcN0mOKpEZk9D1LdHlgnqRzetdwER2SMA0hFqt3RvcDTYlJDUK36uDBfuW3XfHX2xOnlU4ijWABvR2CMYKJeguv2jF+3d2ftvY2GYBoVtPuh7PZVyOKo/wwwK2FPaILMHkk/Up4cIVvOZZjTRZnsF4TsXgKAhPxIrlsmK0NSuJwRZBmZi0vQUiGbo4HHJBpItu/kKd2YBWDdasgO2zKACZ3ncFwOC5Yyscl2dWILoPPwOcYsle05URUGouln8RI6gkg08+W+0cxkWBIx0SyZYSe55uOnTWIbWByacctIpQjZlHUOMnTeNxli0I7TWn8OvLScdYF1oTW4FxOEmQyFARCBMXRFBOsNhZAO15qduPOM2fnKfMuQxMmYMq/AXcu2G0tqOouH7GpL8D+ZmbfX7NDs9Kd7KH1ksz8TF2LbK2XlC2StG8weGcKou5E6nGrglswTvWkmmpRjyLpJpJYAaMtrIMaABQXPr4wFKASH42dba/c/dua3vvn8hWc22hFoPXI9u1IYWQBsAkSSGHIk0CvrTfmZdjM6093o/qs7bpu+e3a66JfKPq/2qdDaUP1uT/YJNLA48i0iMbJ7BxHQ+lMak3izpYz3kFG0k8WS5h4lLQwRAFAiACBXGhqzsPljCCCOWWUMy5zd6pClCfK2VmpJG6nFm7mSO2DtdYMjklRYlBlA6mofVyZwCgwmzEqqUVI/1yfCYFLBIajGHi0J6rIzZhCPS/uieXuxAECDBgJCRow5c0xAoIlIA5FSoDkyrFUKhUajzPwih6OnNvSXHjjzlT+/9/gvfvZrR15EFEg0kkqOYARXI1if9W+/c+/Ow7vGf7Ax5vlhKKHT1UoqVLH5L2W9jQCyPy6b3cWhvzK4lDCn5LEdZ7B1ngpL6M9crK8B0MMuD7Bng2BZCGQAqABCRard12GzHQV+gcH2mdL2m/ePf/ehXTOfEhx7TASo5SgS89sF7D6566atW+68aeaXdm0b26ZBQrMjoRdJpYmIAwNM+AQnXJjLx7ttDvbifM8v8DcZ8pvzYmVeh6Yu3dbwAi61l1AyuWrJe3DHkWeWLSWU8uEDvV7W+C9S6NJv0cFxeRR4Re0MKZwy55jOQL79eKaY4y/r4lNLaw/Em9xkoBefkmEzO+Qdb7ouNruRO6gSObBr9puv7toL58eUP3lc+v/iIeQ3b9FpCQefxJZjiEhEFEVKaULyAu5Vq17B9zisrYXw0pG1J59+eeXxc8tdBTgK/PdqQAx58yMwoEkRIsMzy2362rfOPNps939+cbXzK++5bfYHr9tdH5+bKfkrfp8vXejoMKSICIkhIuPAiZA0gQ31b+kxzOxPNN5llhN1rAZcQR0zuUxTZtthWuMKdldm0BIlLgOmY9ddKbmejiXz8IljvBOHFFPqNNXmmyZt0Kj05HCNjgAYoc1zmzxb2lW2b9OmTatCufupzJIynwMo10Tyt2kHTNQAKzt2nsHMhBWLGuEMMGRochabW0gE5r0SCYasXBSFiUbgVyoBLK/14CvfWHz4Dz5/9GefeH7xWPxcI8Q0ghFcjcCFhwAarts1Uf+BD+/92VsPjN9VL3ms09bQ7WkJgMBN2BNEMDldUlSZkXHaT0e8m1LU7meO4MkQ4vEPzGUFIPceOCSe63NqpZyOptORbxqrpkQX5yhlLQ415Ww0cco+o73OAJAjIWPApFK61Q51nQu2c7ZYu+uGyb916uzGN545svgIIr9sscgIrm7wRAEBNDTGAvzhv7Lvve+9Zfp7dsyXi2EkobkRSqlIMQYscR80q8wNYhx/yXJVGbOZBDCJz5P4Ag8pY7uxn6l7Yb5Pc30grkCOAcv5q+d6ymhOLFGVmH8nnof557PXbdOZvhMCxNH9OB0kEeyTdjOaYOvTbs2IUm1KlmFzpoGcMbism8U2idDQqotsnCSDRxIcQSnZZ++j86AJmecOIiNUGEKuDmOInXgqgwx3lq/NV0lwZxLTKlsgrxAbMGYfIJApXq8p6hx83+BGoMjksMiBHRum5Zz+kpl13mlSM3nvAMlrsQ1Qis0xkfJYH94kUBmmGWwgPTfMOyLnesq1uDOe9JuS2fY57HpJNgg59zPzkJn11DLCPFDSTsz39CMdAQLUyrxcq3u81w3hhRdWl595dvl3zy91VgAAgI102a8GRrN2CSDSxJiPZ1e6cOahYy+++4b5f9LtqvOo8eev21OfnBwPuMep0mxGYaej+soEUkKMQ1dYdwAymqSU0YTUAses9CRGTLJ/jVU6ZvabA/YAMhs0sawxY8/vuNT3LhUMbvbcKSJIeWV0A97Y+RnsC8ha+NsfFis4GJVy85BUBSBKk+zERXMCgNz5jwMPirYhSlB/MoJ0DpL2AYFsYJjUDxZtXIAYNyLo9DQBwRivjnmF6clioV714fxyBx765uKRz3315N/7wtePHkWM7WWVGmn/RzCCqxG0UgDAYHayNH39/von9mwvVwUiLDdD2Q+1FBw5R0gtgAxxnEJK1Q7Do3mxZFo2SxDRQA0X8kGkDGG1CVbJXN4MuUMW/10KUqIWgIiIITAhkBMQtNpRGAgIJmo+O7ynvvebz1c+OjtZfRRAA8MAR/mYr32QKk77d93O8fqhPfUf27+zWh8re3D6bE83WzIkDSQYpgKAhEPJweCG2AQcbnHTfWeLXHajQ/pw6+chv0OGlL/SLl9TvZSFTxsYNr4YXBFGjn0b/sSOZSThsEJDL75GuJx3N/zeq536K4X8E2+G5zeb/c0BL70E8+WHHw+XrLZ5ZQvDRNmX38XlAg75RukXG7M7c9ZoDUCE5HvMG68HXq3iwZGjzeiBb5779FMvLN93fqVDiAJpFHT2VYEYFH2NIA9ah4RYQGPOvXjL/rnfWt+QR77trvl/+O6bJnfPTpZYyQ8LZ853qd3VfalJIRAKhowhIBGCNq5NCITIYrcXd7HHtJ0V9SbSTcvZm0LDSMZUIok5jOJKR7NnKBqrfNtX6uuT2LraLhlm9m0iZBjw03IK5aIROE+Ylkc0jWAGCwAYE6zME2YlrM5TwDDA5E9cAY0UJenDMPTunFBilWBek5E+ukSG1qAVgWYIGPjojdf9YGKiAGsbEXz5odNP/4/PvvwzDz+1+Hj89GzE/I9gBFc5ECn60Y8f3LJ1rry9XvOh2QyhtRH2o5CkCf6UOH9aGWYaa9s24uBxI6qNNXfuNRzA41bzMtwIz8HJYOpbVOmeHJQl8DN/M80aP+HEm8EtmT7PAJuQO3Io7hIYR06E1O7q0Pc0nxgX3sx0KZifq9zVaBRLi8utDoEc8lwjuJaA8QA5I9g+UxN33TRzw96F2s3VCgcpFWy0Vdjt6h7nwLlRBBPAgKY0XVzZwMQWhq7TAabEEhRmvyT0h139uZYz/vTguNVg5sPG0Rh+UFuDx3TD29zlaXR8lzV2/2aj+btjcR7VGSrlrrsmktbsfIjaJo3Onsajc1pzu8wqPdJqeSBLc9n5No/gBpJLsU4+3LQZuUM3ZS0Y3EFlrRUot14SvDbk5QyKXfN92XeRFX8M4rsUz2VbsxdyvLMbCyG/viHz2GDjauXjTaQWA2YEedI4O9JMTATMxZPITg2lz4FOZhi0OwgTwwC7NpP28geAUdBZn97M82bigKVznAwskSCl5DOZfFtxucS3H3LghKsgUBq0JqSiz/1axSs2xgLQCuCFE81T9z2++G+fPbp6TDBv5GL7GmBkAXCZQNQjTxSRMR85YxtrLfl7na68gET/7o7rJ/fUKh5OT0BhtRnx9Y2oK6WSSmnNGWOAsVeRSRZFLq6J98zANh76O394Ur5A7nfWzCeHaHLFhx0Dbm8ZxAaZswiHVksg5bCzg9u8R/dIHVKAbO0MgZGeOi7lkWknKzxwD+pkBkxExdh+wSBvsnhJa9IAAKWiF0w0vEKt6uN6K4SHn7xw+k+/dOzv/tEXX3o0ToDEQY+Q0tsehCihlJ3Re74GAdFDIk0Hd84G3/ftOz7SqPpFpQnaPam7fRVqDdoTKFKf5k1w0sX6uMSVwdYGMHv2uxsF9XKG40oqcnzPJkfBQK+Z8gQxAkRAZIikAfqSolaPRKdPnhActs6U9x3YUT94fqn12Np6B4TwUMpRXuZrFUhLkKTow7dt3/buG2b/zrYtY9NhpKAVu8lESoHmDHga+T/LHCSXLrEChlAb5saQ9pIyl1rFl9/joGQit2EyQodcE6bYAH01bDtfzpgSoYXbzDDRSVLtoj3kbw6dzdS6MeHKEQFS6mdYrSzjO1Bik1G91jf3esAlX8lFaOVX016e9swINlx8fpHXfOm2c8x8fuMlPwc3ZLpUnQFgfnMAZGnry1zgw+RWkLAlictzGloxNoaOlFaccVar+aWJeuCRIjh6shU++vTSHz75yupL55s9QByxsK8FRrN3BRCZKO6IHh4/u073Paru6XbkT62uRf/mA3fO3DU/U2KFgu9r1dHNjZ5WUksCDTyOjmOy0BsPl2SnESSa8GT75sV7eSbaAmVuJ5dSwVumgouuk6ivsXQOrPeSm1IwZqwNujJMssm8l23VSjQS5OJcGMB8VkJrh2J6dgUK+VFnkaJDkqNbzAnun4pMEn8nso/j4jTXEiJtidIUBpQZGBJ6gvHxml+YmS6xfijh608snv6jzx/9xQe+dfZrVvM/Yv7f/oBYRAANXBRRjbI7XFPAuY8ABNtn6+L9t83ffcu+8e9tlH3R72lod7WKFClm3LicAK3IEgmkQ/gYc/wsZs4F8jPcAbl1hkDWH5UgbwAWm+nmdFpox5OOKRPIOcfQpG0m4s/sfdt6Pmo6mDSoFt8jgUYA0kBRqGWrLWmszHHX/Nj83TdO/fLKWvsf3vdI+yhj7K2m9UfwKoELHwE0TNaL+KMf3Xv3HddPffv8VMnv9xQ0N6JIRaQYQBIuaIA6yS3zvH92eiOpkV2NlF5POeyUtnBToicWiQPR7SHLWCVtDWvbWf+GDkqsdwxtlBUGkok+n9unVqGQxhayPZnbMTHiMtYImLafy9Fnh5DXBDttZoiwDFvmzAu6v+2TpPZACWGWYBNyh+LWc0hX51aSWSARPLq01TAz8ySsXjpt9ot9J0No3gy5aycgWVu5RWfxXEICYnZebLEE92Z5VcoXAEwG6mY1cMH9HT+GWS/OWNy204QLzju1xKyzNzbtxLmfffcufofMehs0O7ATmX9L6fpNtk2G/k4Zjjyfn1qMIDozn44vPejiLzZlGABoAtKKlOehqNV9r1Tz4NTZjrr/G2e//OBj5/7jyTPLGhFR63BEe70GGAUBfBVAFBHnHh49uy5fOb3y0Mfv2vfXiOvf/eAdW+6YaRTYzESh4HvI1zb6vX6kItJaM0ATUy52CRiWPiOF/B28yFWCQXSVEHlpnJrBp9jkxb+a5eA6H6Q9XbqlzWYgX9M+6eARkim/CbIcNo501igx63PL2giMCLHpPxBRscCDasULGg2fRZrg2VfWN/7yK8f/6T1fO/FnJ893FEAARCNfpHcCEI2Y/msVtI7zh8xNlSbuODzxd6/fU9tdFBybzUh3ezoCRIjTmaXGyGl4pzz1dpGOhqA3F8tc3Ptu2L0MJ3NpyMoFLg45i66Bapj5AIvpBQNGpGmjFUaMCW/LRLFw5/VTHzt+Zv3eqfHSfyUiY20xsgK41kCrCBARJuqFyr6d1e/fs2OsXikJOHUu1J22CpGIBEfObJ6jTd4wEaTWz7B5uUyd9Mug+vnVrKTNLBaHgvMw8didLE1DKKnN9thrXPE45Fu24Rz3+6r7cBjNIXy+G0x0cByYwQkDrWMsGEgDIaYVhzV5uejqtcIgg58vMfxdD2snpU4vh6KngV+ZyxfZRxdtO5ESuXdok3XvCKdS0U+uUXLac6vmD77URXdw2NbN1giVjFQiM0/JuGIFGwDFzL8GzRmyUoF71aoHxBFeONE8d+/DZ/7pMy8sn0QUiNy7xMyM4FIgaEDCNoLLAaUiQhRx/niilz76nh0/u9rq/ebH7pz/+L5tNb80JjxcYmxltdfpdcM+aa2ZAGEMAcDkyjXu6QnDDhmqLZE0xj8HWfacYCCLZJ1i9oYjZ8z7xGXacmLFGsSSk905hGJ2vEl9csjcIad+IuV0Axca7X8qCM5SnU5qWiMxzI3JVHaktmTbTJ7JujQlsQ9iJKhN8EZABAaEqX8SI9CaGADUxkQwPV0QxACeeGFl47NfOf6f7nvkzB+fOL8hAdiI+X+HwI4t42LHbHmL52Hh+NnO8RdPLPXf6jGN4EpAAYCA6Yni7P5d1du3zhZ92SdobkRhGGrJGWMmqnlqEZXX8mTUm9nYJBlm2Sg1BuIGmHuZCi5+Bkg1asPlu/EXcmx27TUH3+X9cwdO+zyXsUlfaUyXjKgXBQcOQNDuypB7wLbOlMTu7ZXGzq3Vj1TGCr+/tNrtvfHk/Aheb+A8iDVxWtNH71rYum2+fLhaFaA1QaejorCvI2TAYksZQy0YNaubQx4A0iM4+UuGB8nSHO7aSvcADpRybkJyK8dh5gz9AE1nKbmbX+D5ig4llJgEpvcTkoYMFZdlrwYAnaYHS6W2z27f6Ta3XCEN8ng5+sqmqE+r2nfi9OoymS4r7hRyrRkMjRpnp44nc5DRHPbAtvnEjdz+seslrY/JHcyOLTMRAz8G+h6IO5HMS/Z5BtXw+WqD6DBhcx0SeOgrHUqQOxrw/FLL94XOoBDSGAwubk+sCew6zR46dg+mOzH3jpPnwGTOrT0+S1t0k1AYwwxMJ9NZL+mSQsCcaAezA3fqZycPGYDSRFKBQgAoFkWhXhFBIBAW10N46fj6N586svL0+WYHABC0HGn/XyuMXABeAxBJYtxDZBxJq2fvuHHLL3CttXc3fGJ+vuqN133OEcqrq8TCngy11oQEGlhiXAopw5+imCFk2nDYjJrbROs/XHyQvZJec8fjEH+ZzY9psYGDdRhkGfWMjeAANr2MZja7nk2kna2QwT2WRE4Na22wBiQApUETAfge90oF5tWrnmAC4aWTG+E9D5z83c/ef+K3nnhpaRmRo+D+ZQ5+BNcqeMLHSIa0c2tt9u6bp38+8LF2/2PnfgcAXkT0kWh0IF3twISPjCEoFdHP/8gNN8xNF8YLBQ4XNkJqdWRfEWiPo0iDH6ETzyzFEykY/D2MEnQI73yNYVfyvHeeULRYPcWibkvu2ZE4dA3gSsoiQHDOjKGQ6doVdBjXKc6AaQIKQxW1u8Cl1qJc9nDr7Nj1u7fW5o6cWDnCmHe5mH0EVwloHUf+v3HvdP2j79n68dmp4rQkBb2Ogl5fS61BCw88xgCGLLMYDFmTrOthdD84ZXI82cAazd5NSJDBTrPlhnd6CRhg6C/WQO7BBpjJi90efmTEKduc/EgZJsthtoY87yAmiC+m4dxyY7Hz6PDnVlCQVd5g7jPXc/7FmTZjBhZtvOqBUVismsoJMKufGu7TdBGwNLU7sPw8bfJSNnnGoctqgMrOChsGTBzyMb2HNWGKXZqQyCP2PB7PSxkgnXnnnbp4Pc4RmMgZkvSBzshyn1l6HmOpgTMCc366pRFhIPifFRjGa4WUIhX43B+vBYV6xcf19QiefGb59FMvLP3u4kqno4FGvv+vEwgcRqGM4LJBq4iQ+dYS4MwHbpv/9VY7Ovvhd8//xHW7GrW5iSILBC+trHZ4s9XrSKmkEEwwhgJNhCnLQ2fd2IaYVpEpnTD4QzbnJkjJLYfobLjklB6O5BPUmUOQbsZTiwAIcaAZdOpnRmvH6cgU8kKHhOxGSsbhuAnlnzyVRSThTsG68DuzQpAl5F0sZ40F4liAWpJCBKzUvdLkhO/7AYOjp9rhfQ+f+8JXHj79248+e3YZkSORGm2idwQQLMyNi4+8Z8e7b7916497HvivnG1/CQBejLXKI7jagbSCejWAu29ZmPnhj+34wYlawdcKoNMj1Y0o5By4x9GgEMzhhZSbIXTxoEPsESQqkxRlpuR6JgSsG6ncEuAWyZkaAM7vobSvg+DSS5Bg3rxPdNKyGZOTV5oABo+Bob6y+fOFQGnSYV9HnY4sjpU47J6vbL/7pplfuP3w/Ce1jpY591CpkRvAtQMxPju0e/zwnTfM/LX5qfJYP9TQbCsdyfjAc1YYISWnbybrTipGi8Ger/FNwzCZO4PLO8fIDcsiYBdtxk7A/ZbfO5QZUGq+nF3T7g62MTYSHGBrmr06aNHgsLkpx5U+qc0kkOWT0z5Mug5yNKz2rh2XLZ/XHrvP4PK6ZBwxMvPvdD7IBqS4yWYEIEuruc+UJb7SZFKQm9tMUoicxdRA5P4hYFFvluRM31teI25wtWvBmsxzulySB3BzsWTWkFF5J2jZWGOgM95NZQkDVgSbrUXnTMjElBngABy23awhUzYRGiTrMDu2oUAxzx83hZbpz09CssfSo4sllxNwt0jueTH2A8u8QKLUQ9lY0yEREOmYjSgUuDcxUWS+x+DJZ1aan73/1CcffmLxS0urLULGUetRetnXAwQOw7sjuCIgHRLjJZsm8MXDuyZ/o9cNFyFSv3zd3qnxeiVAxqGgUUO7HfVIa60VKgDGmZGIxQKAYaztIANvek0+U+31ZgPcbOT5CnknAxxg3HOUanYMuX5yx/dgf+7Z7owzfQ7KfWYR4sDjDjxOggTJKTPEPgLTyxT7/JMm4hx5ocD8es33CyUPTl/oqPsfWfzKPfef+tVnX1o5hsgR2MgP6Z0CkYzo5v1bgh3bah/dt3dqXpKiSq2wK76r39rBjeCSgCgQgGB6vFy54/D0Dx3eM3FnwfNwo62g01OSrEdQGgkvZUtSyncIDKOabBOp0CCRuw5oayBbIN/sZt05BbKM/TDMexHi+nKA8l9jk1bbKkNArYGazShioL35qWLpvTdP/9XzS53HZieq/01rBSMrmWsDEH0EANg5P+799e858MPX7xvfM14t4FqrR62OjAgIGANmzstkYSWp4zAODWiacxOn2R4y/eXC1kG6AbObYXDhOFdye2lYhrF8lYuDI9DY5K5hEAfavhQZNoxlzzDmZvvmjPkNs5RWTWY1UyxnF2QawWzV3DTQwKuxj5WKHNJEAZcFmTHl595p1Sk+YASaFS5kGibKChEGUWKWmLwMkvKSkMHuToOUv7YZyZ77PejCmv2ZjBwBksCSybWc4CMnGUnczkwMjYwwJrO03ZSP9t4Q2zGyY0jfXMp3OAMmO6S8GICsoMM9NgisiFADSUWKEKFUFEGt6gfCE3B+tU9ff2rpS19++MzvPX9kpYPIkEiPzpDXCcTFAleM4PJBq45BtIgAuFHw6Pc6XXnu29vqH91yaHb7eKMIwmeFpaUOX13ttsJIR4KQBEeOSb08y5/b9BYcsx73kBj0b3PBJWZxQMk0IGzI7mnH+CDpONNnLM1L20slpk45l74lGBppOnMhRwwbvEKQOynymQvI1DV4055lZHO72urJIZ7pGkEqrYiAalVRnhwvBKWyB4tLff3wt5ae+NJDp/7hY8+ef/HCWg8QOWg18vt/JwDnApWSNN0oTW+brdw8M1XC1W4fuWCBLwQCwCjl2VUPsVZzZrxUv+XgxE/u216bZMhhdb2n+pGSnBPnCAy0QSGZhK0W/2R9SBM84vIirqYDLaHkBkvKRE4Bi9wSXIqDBHLmV0KvYYLnrFml+zcv4jTDN2PMIXjIyR8yBDZl+gYgQnQTwqCJBQDQbss+Z4SzU0VxYGdtev+O2vfWy4U/WFzZkCMrmWsFCAA5TDSK1W3zY7fPTpeFzxE6ba36PRUhAjAOPLVYdON/O6s6IQoMIKQBAe0hDelnNvI+JBvLFt0sCZK7OAeyXuR5T2PknNAIVuNqaZE885VtLkPIZLtynj13AgxkPxjwUHQxgZPTw+XCMJkOZ/+7bbl7Ht16aHFFOkJyGnc5/vQx7Ly4OMCdAjuWeAgZFjidansfs68qMfnP47d8xgLz0HnrDMrUtUxoZhoGv6fT4bTiXre/WaZdS2LbXykPnLYzSK66badXbUwrcmrFKNyuvZR5T9OEUcwcuFnDNgFrUGzxuHnvaOc8GY5Dl9sypkuAJHpX8sRJnXTTOI+JaYDcrHVIypwkYWoIABBjfacJysGMvYJUJEOpIj8QQb0RlGp1n61s9OHRZ5aPfv3xxd966qWz7Tgvz8j0//UEMaJWX18gIkJEfPSF5RM7Zqu/2+7rVangX99248zuSt2HifGip6QuNjfCriIiqbTinHEG+XMhTXPjpLjBQTSTPxXTO5Dcz5ahjKnWEGTlYliX1U64+mzbeTbebYOSFnDw9ibpsIYx5RfBewM1EzyU79UJZzts1FqbNNcIGATcr9W9YKwicGW9Tw9/88IT99x/+u89+tSFxxZXuwCAMEpB8s4BrQHmJqv4V969cGDbbGGhNIaw3tcQ+Hw8lJIYMtRqZAVwtQJjASIgaNL0U584dHDvQnX/ZL2A6xshrLWivlRKC48Eo1RzgmnS0ITsTLBuDsG4RGrWrS7lXMhSUQNYw2mMnI9hRO3lgCOAyCLvwd95a+CcYmkIBxWTgClhH1fgPM6S2A+1bHUgVBpErerj9rmx63duqWx7/sT5IxjLukdwlQMigtYR/cBHD+ybnizOC49Br6+h29FhFJESAlkSGT9jEu8y3SkHOahDH3o6D4E8J735rayFzibtDjEioBw9kHzkA5lZesGmM8gMYpC2yfaULbf5ds4y5k6A9GT4ljVzGW+dEltGPIGO2YUTxC/TO5kqmAhFEkqNEhmmtXofEsd5OD+K4JCxlOiABghQ97kAh1zOiBKy5bL95pOg5mBYG1kxRXwZ84XMvWGPmawR2/tQCtgJRZXDvcnlXD8ug43x+7asdJaKH1zIZs2R4cmtVXEs7CIjztUpvrfnmXN8GWkLkeM/gQnNnMrhMGUNbM9ktzuZx0JwW08nkYggzQqAgKSJNBEpTRoZsmKJ++MNn3HB4IXnlpe/9OCpf/nUixee4EwgAAOtRwqW1xNG4pQ3AAT3ISZ2tLz30dNfCKXubPTCT95248wNs1NFPjtbLgQBEyurvU4YxdF0MT5TAcAR0uXi316SYR7AmlnUmG5+wCwOIYiDcwwSiLmLm/Y8ODJHqAj5JvJRs10s697DYaWHEBRuM6lLRC4gbkKY53G9kYOQVFoBAY2VRbFRCwr1MQ9b7QieeG7p2BcfOvlPHnz87FdPLXaIgAHRyAfpnQKeyYddDLi/dbbw7oW5oOGPARRaADMTpUO3HJgf06RbDMWIwblKgUgDkaYb985Wf+zje35kfro4JjyEVl+pjZ7uMST0BYpMeqS4YvyxiflrqtXLix6TAkPjomTBxdsEKcbPlh/GRrl5urOk6KBQYVgjadQmWzOLfQfpZ7QSgFSqQSktq5RW3T5E3b6CasWDHfPlre+6fuKnb90/+9tEas1a0gxMwQiuChDMR61Duv3w/MR3vn/hR+YmixNaE7S7kno9CqUkyTkGjLGYOdBaD7G3hyHkv2FMIC/fh9R9Kl2k2TVpG7KspGF4HW5ugK8bBrFddI77zA1ySKWLF7ApnVNmEQ3XvHk1d0Nmr2OuRKaZHGlHRECatNZa65j/B3KiMRiSMWss7xBPJqy/ce7GOOMCR4YAyIzWKc7CgMCcLZ/Z+IPs/ZCny17Bixd2UOEw6tEi0TxnngpOLhvcoQ+d6Dwt7QzX8MrDnn9wzWyGyXNUce5yJvahnXuzht0tl8a5Mo71GjRpbWIvol0YMWtvw0BQ7EQR/0CHuzCCAYzzezDGGIvjBGAS79OmMssJbjLzYzZjjgMBe4LERgEISmstpZaAhGNlUZyqFwpjBQHnlnv0+HNL9z/0xJnPPHvkQnsUa+uNAZFnrkbw2iGSfSMJ8/DImY2NZif6/EY3bLe60T97962zd83PlP1GoyBI6+JGK2KhIqWINAIAw9i3zgjfhm6x9AhLo6eaW/HVhNDEnAQzPfswh9FSHOJWdpBL3hzWSVHoHgvpckJ354NFYW7EfaekadMtnwMrTXCd0hLa26AZslJN+7SOZ1Ri7ZDes32TNgclAgoPvFrNK9RrPut0I3j82eWTX3rw1L964ImzXz5+fkMpwBHz/w4DqTQAEJSLvDg3XbhtZtJjwDUUOcDu+eqhm6+b+cierdOfYciV4AFKNVofVxOgCBBRw75t48UPvmvrR67fO/6hcpFjpxdBpxfJSJL0BQpDBFvzqFSRCQCWmsmb0qeBoVIgBwdaoWT6dzCU16CfalbHkg9wZSlDypdzhpJfgFapk49EnYcUX7pEKyZ9ugFqracoWUsv04fSpDdakRQCxdx0sfSeW6d+ZnG189SW6dofaQ3ERAm17Iz2yFUIihTMTpbZx9+z486bD0x853QjCPo9Ce12pKQipQkpZjIxpuKRIaG2lAcAuOyOSzBAwhAA2LPbrilyrjngkj/krvJMIfPhEgcO65Uzo0G3F8swIgyJy5FdnpT5hpYTyt7PMKxDJB35fM6JNM0Ucmkn+2GbMvsMCGJC0V7TpE0cN2QMERky1w0inhZKx2bpSgRIIrEREAEz6AHRWppaxhEgjouUtpqogy1XmvivuvyzjTtg/yHk3pAjmnAZRTuV7uzG7WImXl4GKPdlEzyYBm3NrouMJYhLM1vS0hKc6dwnpdJjYVDsAeC8dicdt/XRN0eNfR3Js8eZqFPn1tiymBCR0uy0cZdpLHH3YZl5QhaXT6zQkNnnTN0KCKxMwW5ItBPEzFMRAWmk2JpAo0YEZJmgf5hOqj0r0AaDNJFpTGad2HKMgdZEUqNWBFQq8mB6olhqVANcXQvhW88sH3v0qcX/9MgzZxdNgPXRefEGwMgC4A0EoogQBZ5b7tCDj597sB+pf9DsRL/87ptn/8re7dXKzFTJKxUicWG11213VA8AgBgQY8AYAyRi5lxxuHRCIsvZo0t6ugeOxVIQywtS5/8URTmOWTka19xP7zmtZcV7TosDHgOmSIqX06PI+jQ4KNXtMiVw8xOa4GxLANvzx3065yESaWf8P0swbdyEFWNKSYoIKCgKv1YXxXrDZ2Eo4dmXV8/f8+Dpf/2VR8/+0XPHltqIARKNfP7feaAAAGGsFATjjeK2YiAAOhJYX8Gu6fLUrQcn/8YrJ1YfPn52/ayikZ/zVQdKAoGGmanS1K2Hpv7mvoXaFoYAzWaPwp6MuFF+xcHEU+o1j4UGiFRIsaBNizdQwBVG5qJCY6YNSFy98sFchzM+lwcZD1VKidB8uOe8vtY5EiA7arCciPN0qQE1Y8g0ELTaUSg44ORkgV+3tzH/3LHmj97/zQt/fvZCp0dqtEeuRmC8gAAaSgUv2L1Q+679O+rbqkUP19b7utMNI0BAxpDFaznNdZG3IrFAA5diQVJ25WW/pVxk9nK2/dQUPsv1uHTJYMvxBcyNyQof4rr5zExuY1nm0xG+GU6R3KlwWaMBnOBw9hjvSSIATaiBALhRuxuFBRIAaQ1aE5ImIBlbTRMSggCGvodeUGBeIeDC8znnHCEWBgAw17Y0IxhAICTQBKCJQGsgUhq01KQ0kZSko4hUGEkVRVpKCUoRaYoZuNh/GxEZQ8YBGTCwqVNShbR9aznmLXmLVsdlraeMhMOVJsTvwXn75LacYjHrqJ9/7wOxp4aBK7hwRuoOmpJO4jeaukU4vHjM3oI2klGiDE5PTecxXR6xEYfpgxIDfIoDUSNpAm15cwQdCwBi3TwwjpxxYIiADJg13WCcgeAMGTIA5BTfZ2jeV5yDnCFklHqkzSwZ3kLH7slahkrJSOtIgZKatFKgSZPmDBkKFMgcD2Vk6UQSALrZApCAQBs5AaBWQJEkqTQoPxD+xHhQnp0uYyQBHn9x7dxn7jv5Dx579vxj9llH8MaAuLLQniO4UiCShMzHc8s99bVvLT681oz+/lozOh7dtfWvH95TH69WA4ykDrQMVS+kKPZDJ0CG3EoarVmXzQsTS991jEMy0UEdQQHkDsf47E0OAsKkrPnM6+VTKV786QgYbIOQRZLxeAbbsGNOLyQYOdvIgIn+8GM87wGVHBDm4bKm/gix1ARIp+IJgBgdJdIBzpDVa0GxMe5xSRqePbq6+sWHT/1vX/rGmf/++IsXlmPmf6TZfacCkabv/eD+2Vq11FCagVwKIVyXMFsL/Ot2VW/bNlc6FD3aP4OI6PMAw5EVwFUEGoiI/urH9+/dv7t268xkUfR6Iaw3w76SSvsMOENgKXbNEKlgtRjxZ8owxMUphwQRHIyU/E2JYkfqmcN7BKkANYPxEgFn5ucAu5NdcI54IROFK1cq48OdEqwuHs+yeASJ6YGNSZMS8sgIGRBRr6v6G4gwMY6liUYRd26t3bgwV9n63JHFl2yU+RFcXUBaAQCD8XqptHVu7ObpyYLHkKDdjqJ+qCTjyDEO9QBak9kC8aodxuE5MYzI8JwZbjjrV59sAxjG1mcaBrNPkk3k7sz8Q+V+Y37zWZ5us3o5jtDWTRhL8wzGKsJ8xYR1dWIG2F2axuWLx6LBMn/mOYw1IlnNhdH8IyBwzjgicQAAjgwDjrwQcFEqMVEqcOZ5ApgJKEVAENvus4SZjrevUc0zBGKxPp+0RpAKQMX2HEoBjyISYZ+rXl/yMCIdKlI69S4n1CZJIAGBIpsL0ggXYnyQGCm5ZuqQKKUIbAQ6cGhZTN9nXu9rhQkJ62pxY9404BKnb8LwJ5ICMnM0BDVlpANuP/FrJMiJT5P4GInuDgmQtLY9GKsBsgHxMoliYwELR06xHwZH0BD/Y8AQYrN8zhj3kAse8/QMGHAAZByRc0TBERkDRE6ALF4CHBEYMjCGO6CT0QCANm8ilgyA1gRSSh72JY9CrUMFOlKg+6GWUUgym23GSmVMXFiyrxntY5rpYgCMmCYkSaSVJuX73J9o+OWJRoEpQHjhxHrvCw+f/k+fffD0H508vSoRGWo9Mv1/o2BkAfAmAOmQED1cbfbh/m+ePnrn9XO/E0rd7Pb1375+f2NuarrIi0VeWVzsdZot2Yk0aEIEjrlUOwAxf4u5EDWYfliEA7l66TEEWeSYHL4u0eps7GwXQ/BqKtUcdt1WRoP8EVLiMjMmU4WGtTVcDuBco9xvh+CFFLUmZ7e5rZTWmkB7PvcqZT+YagTc8xCee6XZ+eKDZz71pYfP/JfHXzy/jOgh0Sj4yDsRGPeQiOi67ZPF73j/jvdN1IN6FGrorkvodJSanPD5ltliY3oiuB4AvgAAIPVIw3m1AOM+CuSwdbLCfuJ79r17y0yxXigxWG0q3eqovtakOUee5PIGyOCZ1GA/BpdtyItE8zgzvmQpVII8IqNc6U1R6CByzfXhVLEU6ED0lawUId/kAJ+UMHGQoNOhqgICMhQ/AAAwhow06lCqCLoSOj1VahQE7NwytuVdByd+4uY9c/+aKGwz5uEooNPVBZwBSKXoBz56cN/cVGl7qcCg2wmh3ZNhKJXkQvDYMnGwrrvaBlZrLmhPxkowZged2kMaTagHS2uk7L+9mO7H7K7Mi8aS3UCZ6tm7ZIRcyWAz0jDnQc1+tzRXXuOSfwxnPJZ7RTDKYQRkDuOrNGkFQFqTRgIQgFgocL9Q9LxCiYtCwJgnOHjI0oh9GiAMCbqhpE4/lN1+JPuRlpEEFUmSUpMmFWuUGTDgAoUIuC8EMo8RDziwsi9EqeDxYsHDcpEhx0BoIqEIIFQEUimIoojCvtRhj2SvTzIMKQolRZo0MQRknHFjgcDA+I6DMR83c5N6pybmrXY+XBcpezUV0pBFQ3Fsg4T6S5XZKT1rviQtk3M/8x6cd+rSyAPL3FHnk5FOoCMdzWr4CcFabwCQ0kBKkdI6djhFAmDG054J5FwwzjljHkfuC8aFABSCMSYAGQPkPLYMYZwBZww4R+A8llzHUiSKg/wBgSYCUrEFgiINigik1hApIK0VaI2kiCBSpONrZjwsthQQnDHOED0O6AuOpYIQgnMAZNALNbS7kep0VNQPlYxDDSBZ64903owwzMxlLFtA1AQUKdBSgfI4E5O1Qml+riw8H+HZl1d7f/bl4//7lx8+9alTZ9bUyPT/jYdRDIA3CYgi4ixAE8zizOG9M/9+raWOh1p98t03T26rNnwIQ1VQmnS3TyEp0JpDavxCMToxbqqJldTA6WqlcQBgyTyDkFLONz20EqSX9W2llPLLa+VzZ3WKVm397HpK3IJyeUyHkdWUGUPmtkuOJp2nblyuEALB5qmx2ipjsJUqLOJxktZaI0dWrYrCRMP3uAA4dWojeuCRc5//wgNn/peHnjy3iCiQaBS06p0KpAmmGyV8z41b9h3aU/+hyapfCHsKVtejMJRa1RkVy2NczEwUbt63rV4GgA6N0p1dPUAEkZb0sdsX9u7dXvtopcx5pBR0Q61CSdK6WxnqlMhgS8vIDGKpPHGasv0JJ5LjuQEgIdLdtgbYnksFGrzEWT0YWyUVhGYSyeRqxWWzoxmGnZM2MX2alPJNcDAiImpECBWpZjuUhQIXWyYKhbtvmvqp80utx7ZOj/0FkVTMBJy76EON4E0Bzj1UKqLbr9868R3vW/jB2fFCnbSETl9SX2klNSgOxF26I7uaByEtO1zMla+fdeXLbgdyrw8VycXfHVf3+Epu6wyKGtyC8U4e3JdpG0lvJnAeOQPFgYcbIrij1CLekHHEIA2DSAAQB/RDImTIOXKPISsILkpF4ZXLgheKAoWIWUwZKeh2FTVbkdzYkL3VZthc2egtr6x3z6xt9E9utKPTna462w31ehhRhzRIItIMkXkeGysWxWQxYBOlAKcqJTE9WSsuTDVK8xPjhUa95hUrJY8HPkcvEFDwjYBCAkofeM/TrOMRb/eIQQ9RSlCxIQNCbGSgAWNfkeTFEdhsERgfrtbT3SIOYJlXikmaOfNSEa1JxMArNB1kLjJysVduzSElC8QOaXB1phdTkpnMerTiVjIyo3iFoBUNDSGG42ckZAxQIGNCIPd8JjyfC08w5nHEwGfM8wg9D4ALAuQIVo3vZsRCMi4cSoNUGqTUICNF/VBRv6dlFJHqR1r2pVa9vuqHoer3I92PpA5DSWEY6V4/0m0pqY+ggXPwOGO+7/Fi0RfFSlnUaxVerVVEcazkeYWCxzyfQ9XjXAjAjQ2Cfl9JUBCb0xpXlngSrO8xJWMFQlAatFagPI68WvIKU43A830OJ8619ee/durTf3TP0V9//PlzayPm/82BkQXAmwhKp8EBGWMbkdR/SKhAk/7N2w5NbJ+cKrFiyR9bvtAL15qyE0VKaobImZGlxv5CFEtUHSXOIMMMcZHsZyKxtmVc4esAOBKCgU4I8p0OItjhLWcPfcx9G3ZlCDiPYcS/qY2q24s1ngMA4zsFRARKklJaa8aQjZVEMDdd8sbGfDh2akN/4aEz93zuqyf+2YNPnl5E5Mj4aIu8U0GIAAE0VMpeYd/O2scO7KwdrpV93utK2uhEfY0AoYrA8wHmp0rX7d1aW1hZ7z232grf6qGPAAAY40gEcOOeqfr3fGDhx6/bUT0cCIR2O4J+X6uEYHNVkonJLiVC1xScqEcXQU9ZcBDVJfj4PONxSeoHL6fQ6wCb9oGxRIHcQyUOMcZ5THtvtGToiZBN1QN23b7a1hdOVH/i/ifEfXAB1mkUL+OqAdIKZiYq+O13Ldxyw+7GX5mo+EG/J6HTU0oZB2uklCkftiTcdXux7ZFZLpmaQ37SEGEZJZcvOYpN91JyYxNhQpI3L+9w6MJwaienl4AkeTym/cWEiU66IY0kFSmlY5dwz2NirCSCasnzyyWPlTwBDDR0+xGcX+pE51d6rQtr3aW1jd5Ssx0uNVvy1MZGdHR9Izq21g7Prrf6K6121Gp3ZLMbqqgf6lAqUKRjbhUZghDIA595BR9LhYCVywVRaFQK1UatsFCvBXtqFbFzrCRmi0W/VqsEU7VKMF4f88YaZV6olbgoFT2sVYVQwEU3VMV+L6JOT8puX8t+qGQkldSaNCJDhsgMD8vQwbaQTg0Oe1tWcjAw005RV8Y03ALk0u9s8/IupG5gsTopFVlpTVpp0qTjGbYutcgZ44IJ3+NcCM49wbjvM+57iL4nmC8QPBEHUCACkDrW2kdKQq8TUT+Suh9p3Q111O3rqN2TvV5fdsNQhTJSPSVJShkXk1L1Iin7Yag3en1aiSJqRZFuxgYhai2MVCeMdCtS1I+UDqXU/TCirlYkAQgYA8EYY55ghYLHS2Mlb6oyxrZVKmJnpeTNVsf82R3bqgd2zo9NlgseK5WYD0TQ7etIaTJRJbIvz3rwa00URqSk1kowxserXmluuuQViwKOnm6rLzx4+t7P3n/yHzz1wtI6IqLHvYu+iRG8PjDibt4CiIMD+vjC0QvdXVsbf9BqRWd6Pf0fP3D7zIFGzQeU2leSdLOjepEmhQTEMDV9olQqabTaVspp/VKNPBvdyFRWWh2PITlIMxJSdG8kbaY1BqXjlOLA7B2MS2dMax3ZqYvqzW2Mpb2269SzCjGD493hmGdNxQZZU1tLBKTPogFIKlIMCMeKXjBZKwSlgoCVtT48+PiFxz997/FfefTpcy/FmU48UHLky/1OBaUiACCojHmNHVvHPrBty1gt8DmsrvZlL5Qh80D0woiKRYYLc+UdN+yb/PiZC+3FpebSMuMB6lEcgLcU4tR/RN/34V0H3nXDxI/t2jZWBwXQbEYyCrXkCMgRkEGMYMkGP07wlUEwEGORLBIy2MmGdsq96YQMpdTtyc08AgCOBNeO1+JO03uCSrO6/awDWKr1BIckHaRks1LhtC+DO/PKlqSc/YmZMeUKJkKAOIgXgSdQaA3U66lwbT2CRi0oTUwU2PZtlZvmpstbnj+2sZ5vaQRvDTAWIAFBtewV9m2vfOe+7WM7xooC252Qej0l4+xwwJgRABAAJOo5szEcsVk+kRCAc/4CpGstq5hIIaUtTD1zpA9VRyAk+wUJM/vWXhvUGLjr2OxJS+8kccuHQD6a31ABRl5cYWggS4fFsUaTUHkaNCWaUSNo8QQTY0Ue1Mc8vzbmMa/gAcV4i46fXm8++dLqI0+8sPp7Lxxf+9r5lXazHUWRlBRJSVJKrSJFdGG1ndnQnvAx93IAkFQkQwkAXQBYrlUC9DgHT/DHPI8JIVAIDp4nBBuvFatbJstbt82M3b5zvvyhXfNj12+bLc/OTJUKY2McygUB5RJiqce8VlvxVgd4p6cxlKSURq2BEYvVwwadxjoba5tpCMYcjZq+k1SW4uZ2ct5JDgmnODK/Yuzac1dT+j7TV2roxjRUfxI+AuOIec4IY2BIluJGACTGkAmPi4LPRTHwRKEguB8w5gcMmADg3Fg7KIIoUtDtadroKrXWjcLVjX5rba2/vNbsL65vhGfWNvrHltd7z6+s9V5Zb/fb7V7U7fdlT4ZKKkl9qUHp2Nw/9mvVEGkNmigWTmgiE0jSJH4w1gOkCVaa3YHTYqZRQcERhADBBfiCIx8b8+q3Xz/zvm+7Y/43btg7vrta9gVo8EJJOox0n3GKVZUm5QwmQjQARUBSk+IcebXEC1MNzyuWOZy90KV7Hjj1pT/83JGfvfcbx07GVTwI5cgy7M2AkQDgLQKiOC4AgA7DiO7VQL/QD6P/5c4bpm/YMVHivucVzq/0xdJ6vxNGKlIaNGdxppfNzqeMsHpYGaJUhJ9IpO29vBY9bTQDOPBl+O1cTaLkFIQkeBQ4uN7+dSJlb4oBXCGvDbiS6RCTubAuEwAAkYwDjwAQlIs82DJTKtarAZxf6dO9j5x98s/vO/bLX3jo2Itx4FEPRgzcOx3i118uirGp8cKORi1A1Ay6PRVJqZXHgfe6kS54Pt8yXa5dt2fie596ZeUvAGCZRnEA3lJA5iU4ZmFr5V27d9W2NeoFWFru03oz6kVSK86BM4ZOqGL3C1maFFLWI2XQ84LQzI+hTPhQ9sW590ajmuGaseFY/OKtDKuXZpqJv4g4GwD1Qh22u5I6XVUar3uwbbY2d+P+6Q+fPNc/+tLxpS4TPuoRsfeWAlFsgD5WEtX5meIts1OFAucIrbaK+j2KODAErrkx66XB9Xql6zddRZdTMy0zbLWmmoDs/U2EClcwShdSBnRo80n/BCaWJrj8JBoZgNEKG/YXCEjK2BURACHwhTdW9oNqxfPKBY6MCJobkT55rNk+faF99vz51isnTjfvfe7I+j3PHll78fiZVi+kaMh8MEDmow2wzwAg2mSPceFhYiipAQBseygBtASAnim5TiRPHN41862ts+XPLMyVbpqfKb5nZrJ0/fRkcWFyojQ91wjK9TFfNKo+a9R8P4yU3+lrarWV7HZ1GIZSylBHmoiQA+McuYgtApBM2jvzFtGVtaQqo+yacynIy3VlHsBblyjnkrtx9gsNWpFWpElp1AAAnCETnPHAYzzwmAh8zrlg6HkcPcHR4ww8RIjjKChobvT1eieUqxthZ6MVttrtaL3bjVqtnlptddXSeic6u7oRvbi+Hh5f34jObrTDlWar31lrhu0jp5cjAIBYQfVqVrMbUd8IqFCgXTeDbZJZBxoAYKPVUX/mMa9QLvr/5Kb94/PlsuCtrmKxpQfFGSeMspK0plCBIo1aI6EfMH9qPChPTwSs5DE4eratv/KNcw/9+VeO/T/u/cYrJxE5chaAVKNMW28WiNFMv3UQWwJ4ePZCi7704IkvL15o/8jqav/ffNd7F75z+9wYn0IUUlNhdaMPUajCOFCHzU9tGjEnij0DEQDi0CsuTZuTfiapV8w1V6Bq/jqyVLej9CDN5c1NEealUWqupWTg+TuYoH5r2GU+3RQG5i/FQWHS8dvgLEiICKA1kJJaEgKWi7ww0fCL1YoP7a6Er33z3LP/7c9f+qmHnzn3lNX8azUiSkcAQET0PR/aMduoBeO+z6CzoaHf1xI0adCg+x0ZqYJg47Ui37lQOzAzNbYXAJ4F0CB4CaUa5Tt/S4AIiDS967qt1Z/43t0fbdSLHjEG7Z5Wnb4KGSPGOTKM3f9NuigXEToaRHJCU2FWC55E1EYwUZBcjWOq+XMRcibAXtphijsTlJtn2LN4PMHJrl12xorAeR5XOJoZRP55s9OYjdDt1LeVye0WASiO+Y4Yn1UIBFpp3WpFshhwMTsxVrz75vm/vbIWvbh1tvolUlIxFqDWI2HrWwkMBUzWC7XJRrClVBIQhgStrg7DUEvGY7qeMoHuEMAmoLdrJMemDxjPZ2L1OFL/ZD9k1+QwXYNls1PmD80atN5+CANrdBjYrvLWCA4OIGd4ZAunDu1GjRFrpI2VQkKaEdhI9zGjj44NkLUyIEKyJuNBwLxaxSvWa4EolzhEUsG5873oiedXXvjq4+f+w7deWv7c8nK72enK7kY7DJvtCKLEhUYAgADOGEjVvqJ9pOTwQJwoSjHHCjr5Z4IhdwHglfnp2tFiAJ8rBKIwNV6Y2b21tv+mfeM/dWjP+J0LW+qTE42Al4o+BL7GglBei0vWblPY1UB9RYo0ECFoYsAMqiZzLRGSbPb2iNJ3nI+GnaKz4dOQtWTKCY2s5AactZnR9aerjOKkB4SMMV9wXiwwv1xkolTgvFDgwD0OyGINvwwJ2r0IVpv96Pxqb+PUYufk0TOtR4+c3PjsmQvt51abvVY3jGQvUn2pSEWxSb8MI5KLSxvJg3jcR6M0NONikK53d+07/9BEYUQCHQ1q+i8XYiGBghePrjZvO7TtD3Ztq33s4K76947VPPQEY2muCiDrz6DjrJKaiFFQ4H6j5hVnpoosKHM4e7pNX/ja6S9/+ovHf+6eB18+gsgRgI+Y/zcZRhYAbzHEwQE9vLDSgS9/vf3iR+7c/muaUH/4zq3fsW/rWLB9ruQXCkxcWO61+30Zaqk055xzzniGLMyfe0Mhg+yyUWsxx9FvOuArfEC3vyEN0eAl8/XyO8rIhtFYJ8YJfZGAQGokpUBpIioF3N8yUypN1gNcbUv4+jfPH/mzrxz7f37m/iNPxJp/PmL+RwBCBEhEtGdrvfiJDywcqo8VyloD9PqSokhFCIAMAKOeiqJQ+/W6wMnJYqXeKO2LWyBQOq+dGcGbAZ7wEIFg77aJ4KN3LXz3wZ2NWwu+gE5PQTdUUmnSjAFjhkBPQxUDDNMVGnI97YDyhGcOrhh75LWXl1H8iuEK2n8VgzDyE8pf57ElALTaUehxxFq9wG+8bmLvycXWz33z2QtfO7240aEBLeYI3kwgimh+so475sYOTtT8BiJAP9LQj7RUmhQ3ucZzySBfA+QFW5c90isse5E1f7Gm8srm5JKV9NmG8wILq6awaov4KrMG6bGgghQBKQUaNOnAZ36lIgqNWuCVCx70I4IjJzf6L59snn7p2NqDT76w8ntff2rxwZdOrHXSQXFAhoNB5i4Bs+OTeG5l6bLqkBwuuBaihEoDAEUEIDsA0IFXcOXlY80XT55uPfPSiY337dja/MjcZGn/9HgwO1UPqpO1oDBR8/lk3S92e7qw0YnURicKe30Vyr4OY3yKyBiyOCgrxdSbYzWajeGfF4XmXZ+GvMBcvUtPgF3p5r3HEf+BMQQRMM/3GC/6XBQKgvleHJQRQIGUBCsbUrd6PdnsRP1WO+ysrfdXms3+4vJa79iF1d5Tpxe7j5481z52/Ez71PHzaxpxs9OEAaIXh0ZEBPkW0KXbZmZQKRmnM0eBiAyJdPPXfuZdD3f76hP2fTEGDABBa9CkNGmlNSCC7zOvPOYXxscL/njZA00AT724Fj74jbNf/sv7Tv7qPQ++cgSRIWMc1IjuftNBvN5kwQiuHJSOLQFM5MsXbzy05a+ttaJ/9gPftv3nrttZD6YnC0xpXVpe1dDrqT7TmoCn5nMWTyKzge4poWeTmFY5CYErqk6J31QAPuDHl2LcGMXmEkYPav4dKX3eMZWSZhK0ns8BbNOIxpqzVHJuDuJUr0bgPium8WFjX1QiMsw/o0LAg0bNLzYaBQwVwDeeXDrxf/35Kz9+37dOPRxr/jloNYr4PwIArTXMjJfxrutn9x3ePflD49VCIQwVdHtSa9LEWZxuWUZa9ftaIQIbKws+1Sge3rNtWgCgglE2gLcEpNJApOi7P7Dr8Ptvm/6163bWZjggrG+EJCOtuElJlOh1DIoyen5H5e0gF4t5MsQ+mKIDODItkaBdcjT/OY1p2qgDtnya7CrBog6ujIc2THbrCDYcHJzH02mUdEzPC0iPhqTpXDj1xOog0Wamz0HGCZQAgXPkSEC9XtRfQw3Vhleamwn43h3V27bNVLc8/8rqyxJGAoC3CjgvoVIdOrCztu3Q7vEfmawVykoS9PtKK621Tsyyk92ByRmdpCNyGWFLe6RiM6vZT5epzfFuFIbDdQMDFAU65ilpNPR0HWapG3d9OiILh7HLtJleSPZrsv0xHisaQsXu6yS+kXlASxMZL01rGGT0tDa9H2hl3LAFBz5W5sHEeOBVxnzodjQ8/8ra6r2PnP3vX3v83O8cO9s8t9rstpZXu6lgDX2gV2ktc7nM/8VAOoIBxAJal4HTF3rq5PkTL+7YMn5krHT+96tlv7x9prz30O7aD95+eOL7D+6ub52eLLJa0cOghMJbI7beJOh0dE9qUsSIAcRcZBq7isV4yYnrhAYfOlYXsdo+pQhhmBA3fb/Znxk6lxws65C3VtDCAFBw5MWAi3JZeJUiRz8QAMChH0lYWQ/V2fO95pEznaMnzrYeO3V+48HF5faRC8vdk6122OmFUvZC1et2Vffscltz9DCmO+2YOZg5AEVXhyb85OKiMw4ONl9FryeXo0gprbUHpOMDwkTxIhMKwfOYV6n5xcZE4FWrPkCf4JkXVjb++L4T/+HzXzv528dOra5Yzb9So5SwbwWIQew7grcCbJ75WBrI1wOB/yIQWI4i+tEDO6qluakS9z0+dmG5y7s92Y8iGTHGGBfIjfZlKN7bvMPXIMS/5JoZ1jQNvbxZQ45B7GUMJ0bOCcGdkMwmOqsCFQQYzEwVypPjBdaLAJ58fnXtL+8/9U++8ujpry+utgFRwCgv9QgsECmolLzC/h31D+/bXj88VhC825XQD6XCWFMBiIBSouqHpMJQez4HnGn4exdmy7Mvnzx/ijM+wq1vMjBWREukLGyt3HpwT23vzHiAa80Qms1+X0mlBQfOsggmUd05lHbm5hB2JBHAXgnaHQ7Dlol7Lduym8zlytvdvNSVLNYcPe3MQSK+BQAAxpAhIfVDFXZ7FPb6slQe82H77Nj0zfsmfuDEyfXffvrE+T5HhioOgD6CNxGIJGyfa4jveM+2d+/f0bizWg68fl9Bv68UDeHOk42S08FmV8LwHXORUbyWRxgCl17JF7Xg2bTFjM5joB9H7JDgBStU0xpAalCRIsUYsEpJFBpVUahWPKYA4NjplnzpaPPkg99a/NRXHjn7/33gyVOLMS0YO8lfjSnRKMekcl5ErUkBtBQA9B6kcOnd1285cmG1/eTRcxs/umNb5dDsVGlibjwoNGqC1cZEqdVWhY1OFLW7MgwjkpEEyYhY7HaShI1M+HwAs8KS5XZlL3LYJObfYioITe0OGCIKjtwTyAgBW51Irq71Vauvw2ZHdZqt/tr55fbRU4vdh4+cat978mzrhTNL7ZWjp5Yjaz7v9siZQPUq00vPT03g6QvLb8F6iFd0o1TBn/zEboA4oxZEUqkoUhHnyAsB9wsFr1Aucq9UErxY4qCA4Oxih145snb+vofP/n8+e//J3378xaV1AAWMeSPN/1sIYsT+X2XAPAAt4RtPnF48tGf2766uhy98/4cXfuPG/eO1yfEiaqLChZUutdtRlwEA08LE3SBHKm4gJwzNZWvKRHhOi+U1RQgZms5Iua0WK5t3lYy0n9Lou0Zf4J5fsXw8J4nPDTslNLLPAACmLmXHaGuRuW98kFAj+QJFbUwEUxNFhpzDE8+srP/h54/9+ucfPPX7i6ttAIAR8z+CBJAJBCCoVfzqwnzlQ1tnyvVAIKxuhCqMtIyDccYrWxHT/QhlryfB4wQLs8Vd1++tf+zQrsk/UFo1R/7Nby7E5uQc9u2aCX72+/a9f3I8CBgjaLVD1WqHfSAgxmKfZosUXYyHOV/3WEuZWj8nmUqcPhPlkzERSDCT0SYmCkWLd3P+9ok9UyaJOSUVM9dNvBfELKNtlJPpPLjqfIBkxEno9ty5bxWfhImPa6pdAwDXSjW+j2lFMwmUkM2QjN/EPEdEQKVJdzpKlUvE5ybKwftum/1b683Okd3z9T/RAKHgHsqRJuhNA84DJJJQKYvSjvnqRxbmq3OlgoetTqh7oZQAAMymLjdpyqznYGqZZ9cpQCq2x4HTGQBSzb7DySGAYzmCkJ76ZLzm0zayuTAAMgveXrIrMN9XOkSnXLrOXVkgmueMHzHWNCeRhDODSlY8mux6NpxIEiYUEVADgSTQCoCQIRZ95k3W/UKj4bO+1PDCK2vrD3zzwmceeuLc7zz98srzLxxfaVuLRGQeKPXqfbffTLDjRCwiQATGXHxx13z9//fAk+c/MzNd2np4d+073nvT1M/etG98x8xkmfklwQpdHvDVkK03o16/r0MNSAIBGaMk4FWCQwGSoFBuLKusIUfeesqhZzM4FwZWaVagGffLEJFzxj0PmfCBd7pRdOJs++xzLze//NKp9mfPrvRearZ6y+1OL2x3wqjZlhtnLzRJsAIiBhjbgJjge4iv2oLDwlvD/ANYRmC1s0G/+CM3AUMGCAxIA2hN2hfolUsiqNZ9r1H3UQgGnXYErxxvtb/x1PkH7n/szCe/+cz5x184vtqM17cPahRo+y0F8boLX0fwmoCMNCzeIKxHpP9Xj0EQSf1Lh/Y0Jhq1gDEOpQscWb+rQiWVMv5TiBxYkkLqUu81f99VZV0KhpSjgQJZBh9w6Hk90JSVuF62kssQ1tkIBghak5aSpC+YGK8HpYnxgqcJ4aWjzd4XHjz9qXsePPmpl0+uSQAEGmmeRuACaUBAqJb90vREcVej7gtADd2+VJHSGhlDAEKttSYAkIp0ryv1WJmxbTPF8cP7Gj/2/PG1+wGgOcp1/uYBFz4iaphqlOH6PeM37Zyv3Ox5HDo9Be2ujKKIIsGRczTGuoa4BONDFQc5G2DtwZTK4So34/SVoY9B9DkM8W6OAbMWAJdC2gjWIsKFzeTE2TZdtih7Z7NehxmHIQBwjlwTUrul+oKFhYl6wK4/0Nh2ZmnqFx59cfkrR85snFdaXuJZRvB6gtYSAAjKRT42PVHcP9koBpwjdHtShZGWcZwMTHhfALBqBqMlHWal9/pqlF5da3Znbr4vN7tz8f7ydx2iI9MgATNKGa2BNAFJjUoIFPUxrzBZ9f1yScDKRkTPHFld/OojZ/+P+79x9j/f961TJ2JxC8drmSYhSgUWjAkkgvDomeYKe5GvHD2xdnxtrXvy3HLvrx/YOX7D3FS5OlUPxNxU0auUfbHWDKNWJ+pHUimtgGysFmSJt0mSasH0NnwMGXHRpd9qRgAUX0SAWHpjFVaMMSY4sE5Phk+/tHbPn9176te//vTJtdgVQkEanA+BMw8ZCiB9dZjyvz6gwM5UpLALIMDzBVQrvs84a1TKBa9SCRgxgPVWBOeWur1jJ5unn3x25c8eemLx//3ZB4+8iIjIYsHQ22herl0YZQG4SoFxAVpF8Owr59sHdkz+u7Vm/5VPvH/7v7j50MRCvV5AFKy4utxlG+thR2vUyGJ741RRYyXWqaYo1f6gIwG3KWkTNZSpnRUkpFFZjQYqh3hTobhRhCWutKZWRhLg5uvNgtUfOMonx9zLFsrVtuYFzGRvjSN3E0PEYlEE4xMFzw8EPH90vfMX95363S989fgnnztyro/IkPFg03cwgncuaNL0ox/bv216ojhdLHvQ6vSh29dRKEmxOGUmaEBCFody7vUiVSr6bHqi5O3f3bhx6zMXbgSAFwE0CFFCuUlQpRG8fqCVBiJNH7x9674P3DL9Dw4u1HZyQNhoSepHIMlSH2joyESlZzAkGdISLRlIqRKfHP2kwzEnce8yaU7z+NFhqN3L1vYgQY5ZLVUiXnD4DMzgPjuIVAyRDQeQWgjkI6S7JHGKcxFsxgMHuWY+iaylQHo/TQhvn918IXtuEHGGDDTqbleGQH2oV7zS5GQBd+2oH9y2pbrr60+dXtw8GNYI3hjQwBFgvBpMTY0X5sslD2QkoROnOdWMIeNmvxgCwph1pC/biW4H1sSFrIVeLsI+bfp2k80EKe0QkyLx0jK7MTEcsIuMnBXurvhkwM7msXsrl6uAUmFGXGxzkYbdX5auihUPWa9zRGKACAxjzQRp0EozzTljlSL3Z8cDvzImYHGpT19+bPGxL3z99D/95jPnv/r0S+ebVuvPub/ZRF1zoLUkZAUEikArCc8dWVnbsaX6P556eePLe7YuH7x5/8RPv/fm6e+6bne1NjHuoxeAz9aINTeoF4WxjbxV+cemFZQguYxXhLMM7JpJcBCkdQY1/lmcm1immnSXZlkTSK0UR4bAuSak1Y3w5ROLG+tZnMUgDmb3drViSgXJyL0APcGDkgcTVGCVig78gg9KIZw83QqffGHpuYefufBfn3ll9S/PnGufe/qVxXacwYCBz0ax568WEA4GHcFVBMrkbWVxDKVO2Jd/iKR1pPQnb7txZvd4rQAlwYLznLFWW/bDiCQp0pwnstIEzFGYvQD5i3l4LbSYU9fpIx8ra7Oal2WM4Iht4yBe8UmvCUBJLTkDVq36pUajEAhfwMnzXXn/o+c+f8/Xjv/mQ0+eXEZkyJkAKa8N87oRvHEwXW/g+bVVArB5kTUdXBivfs+Hdr67UQvGgAH0QqJ+RFIprQRnwjCHyBgwAoJOT0alUIjJqoczM6Xq1ETxpumpyh8CECg1sgJ4o4HxElo/y73bazfeemjy/dtmSoWwr6C5ISOpSHPOOJpoxSlgysdYcKWPQxjmQd3ileHKQf36q4XL6XcA+5urlg1KhQcXG9Tms5E1zMY88jY8mrEkRylJdrtR2O1GxXKZ4+xksXb93sZfvfnAlmeIqBlrP9UIJ7/B4IkCcsagMRbA3GR5a6MWNLhA6HQJehFJqUEJASKzMdB4GlphUeKjPVzb/npIcxxW/grg0qVtxopEXnXZPQwvZ0QWcZBAJNAx809KgRIM+XjVL0+N+16hwODomZZ84JsXHv7zB0792lcfW3xocWkDEDkK7kEk334m0a4WXHCBSkN4/Gzv7ENPnD7z/hu3P91s9o6urE/91K7dtfl6NeCTkyUxNqbG2k0Ztdph2A9lJJUmhoix+11qeoJ5gU62Z/M5eG/ztekKBOJ00kSaSAJJBgqIeZWyV9i9o/rxWw6P3/f0i/rZE2fbvTiH4dsfbxER7d8+J37iB697f2Om5PGJIpRIw/qFLh1bbPXPXuguv/DS0gPfeHzxd77+9PlHj55ryZhWCpBzD6Ts0MRYDaerDTzfXH3bz9fVDqMggFcpTFTquLyxRpoUITI8dq4pP/fQqT9p9/SKUvDv333z7P6J8QIScI+xLq6s9TtKkULHXMrV5SfS69iHjay3fizITx2p0ErxzTgGEv/kc/XmnOnyhGQm8u/FqEy09AUkQV0zMQty5QAg9lclMskC4iNYa9Jaa10siGByolAoln04db4n7//G4v1f+vqpf/zVb508YwItviVpVUZw9YFl/gFircLMRBnvun76ugM7q981XhG+khp6Pa2jiCQjIuYlaZ0YIqIionZfh4We9CYYebWK4LOTwY3T9WB8eamzooeYYI/g9QXSIQAALMzWxd/84es+srC1WhsrB3BmvaVa7aivtNbIIaYdrao60ShChiKMUVk2srer+Le6ITKqcKsBzzSYsdMnSK0KnMt5/JaTkCaxApziZlAOfk7aIAcPpnSxLZehhd1bFt/nxBKuZtcZWty3nTuyhwrEabLiSaJ885ZNjIOzgCate91IhR0uZmu+uPuGqR9YXuk9sWfbxP8JACHnHr59tWhXB2hSoJSi2w9uqe/ZWv/YRC0oARL0Ik1hBJIotSshSzzESwUJ8y/Z3UOUuwhGQg8w4AOYNwlwtPTZlnJCquSKu2aTwTnXXEGXvZrNBJ9aOiaESqrhz4zVtuZuiFQTbegoQADQQCA1aK1AcYZsrMSDmfHAGxsT8PKpZvTpLx/7/b+8/9Q/eenE2qnFpX7c7juAeQQAkEqSzwsYaQWIAonk4vW7J/5fTx5Z/fRtN8z8wu03znzi+v3jUxPjAYwFkYekQUZSSUVRHGc+RkCJEYrNEOXYqqZrEZPPjPUIAGy2PhyUBzbyIgEBadJKkVYK9XjNK7z/jtn3zU4W/uCLD5Y/+ef3n/r946fXQmQMSb89TduFKCJDAdunG/jum+bfdXBf7UOVcR8ACc4s9emhx5aefejp5U+9cHztC+cW186cOb+xena5Y2aTA1Eq2Fpurb8t5+hahJEtxlUKmaBLpIkxjkfONMNI0r0ex19TSv+LW66fPVirBXxszBdhKP1ulyKpQBERcgaOJUDWTA0wdxQPFQFdQi40oDLbBOjKNAGXXTZjKoCgNZBSpJAhK5a94vi4Xxyr+LDalPTYU0tP3vPAyb//recvPM+5QGSjdH8jGA6kNdSrXu3ArtoH926vHiwVOHY7IfR7UgIRIQIyk6aImUhrSpKKJMluX8kwVF4gEOYmirt2baluffqlpWXOvJGQ9Q0GRAXVsg/7FxrzO+drt4+VfZQKoNXVUbev+0wQZ643c7L7LSthmHTDCLA8KnLqvRpd53Ctf/7qJWwDLqarvGJB/ubascvSoCadWpbqIoje4ecYR84QsdOTcm2txxq1gB3a3Zg5u9z/uSdeWv3LI6c3zmo9Sgv4RgORhrmJCr7/lq37d81X76wUhRdFcZYTTaCRjKALY8Nfy+C6a8NmCHyjPTeu/KC+WA2X4Xs1JMBwawd7WWoipUlHiqRgyMdrfnlyvOAHBQ5HzrTl5x8887k/uff4bzz8xOJZAA2MB4m15zsFQpVaBDDGkUivPPXK8vK7rt/695bWw2ebLfm3D++uL8zUPTHVCLxikYlmO4raHdWPpFYyooghIOfIOTKr0UpkNJj6iIAbjBLgct67FQhl5U+EAIqAeqFSpZIQe+YrYud0eVel6P/LULLuFx9inz5ycrkfW5b6INXbyfcfQCkAopA+eOvOuTtvnPyl7XOF6QvLG/DKK335+GMXHvvKA2f/0dcev/ClI2ebRBQCAAFjbERnX+UgRpTp1QlLOfMYrRUhcjx5fkN96ZFT96y2+xfOrfb/4W2Hp963faY41qjwwGOarW/IntKkKCZhTQhfV4PjEm95ktMRGNhggnk6OAkymLUMcNVkNhWUa16a6pgcyTlQqkkgR6tlsW8yuLwaytWcGc2/IiUlyWKJFyYmCsVaw8dmW8K3nlk6fu/Dp37zkacWHzt7oUNaZ6WRIxiBhTiMBkGjFjT2LNQ+trClUvc4g+X1vg5DqRgjxuJct0bdFHOUDBFJg5YRqbCvIChwWJipbL1hz8R33bJv5rjS0RrjPuqRxckbApx7qDXRndfPbH/vLbO/eGBHba/HEFodCZ2+jqQC5XPk2Tx/aaTo+Ff6J/HzBchQga7MINGCZ7T5ZCyU8pVdfaVllDG9P8BAOUIJcHGs1VI6+I+y1Y1fbBL8PI24nsXXqW+0WxnS8OWmOxzAua6FABq8bQfhChWcyYk1wIgAwDgyAIR2X0VKaV0q+6WJRgH3LNT279pWfddXHjn6p4gMhfBRvsMYozcLBPeRiKBS9go7t459YPtceWfBQ+x1Ioj6UjEgREY2nb21GoR4b9j3T3arxHsqs2lytENSyKBNc9GGzRjQ9DvrO284YDWyqfDf1EuqOONzxFNJAUeIhpl9ie6KTTp1LQeyo0xbIWNVREQQSS2VBMmR2FiR+dOTgT9W8+Ho6bb606+c/MM//sKRX/r642eSFH9Kvr0YxSsFS9eajAFrB3ZP/peXjqx/7vZDUz/3wdum/uqNB+qT07NlHGtL/8Jyn62s9jpRqCNigAwRQSAHiNEuadBkwwVYYxAb4woT/xUDdmVYK474mhUCx/id4kKIyARyIoBun6L19QgDLwzqYz7cdt3ktOD8P1RL3tzB3dP/GwDrKGON9naEbVvGDi/Ml27qbfT7X3nu/NOPP7f0e888t/L5l483j5xc7BAZcSHj4h2/tq8FGFkAXENApIgxjkfPNsO1dv/hVlv+Sqcb/sYHb5v93u2zxbFykYtuT/J+HzQRERLGqiy0RqM2PZXbaL6XyxQJ5ZnzBJnmRAYX7Qvi7Cjm5M1aFWZO+MHuE3oUSRMSaSSOxMYKImhUA9SE8OxLa+e/+MDJT37jibP3nr3QIiIYMf8j2BSINAjOYbJRGt8yU9lVqwVMRhpa7SiMpFLcRCSOjfzQOpAiQ0CByEgBdTuR9jhjWyZL5ev3Tnzfc0dXPwsAj5EexQF4I4DxCtq5PbCrcfOdN0390PbZUqnXi2B1XcpQasVM2kbLh7hgicJBffhwDflw5EGb3snwHQMa/Eto/PNwMdSc47nfWMg6DLgBE5OL+bHZr3HuLgilllJqud6RhaDosclGoXT9nsZffe8t2x8h0mfigGgjeCNA6Tia91iJV7dMFe6YHg+qnCFstEMVRVIxJGRx+nmrSnUcAy8/uvqmcPGjfQCucJckJYeWz0cWTtxu3J0/kHAwNxJXOBf/0kSgiLTUWiEi1it+eWoiKJRKAk4vdejLj5596E/vPfarDz2xeD5mdi+Zp+kdA0SKuAiQM46aaOPYsdZzJ0+t/3qn0znVV+Gv7N07OTNeLuDkuBCe4GMbG6Hf7cpQadKRBMUYMOMSkDD/puXMGkgxuiNAzSGtNMcFJBIiNFmrSQNJCWq9KTthvyPbNVmYmS3xO66fmuCC/SNJEHHETz398mIbUSBjPij19gj+yzBOY9gNZev42Y2nXj6x+vWvP774n7/57NJjpy90pNQaEBmQHmn8ryUQoxAA1xZYielqsw+PPnf+JSHgt2cahd31in97pcREIeCeUlqHEUhCAJ5EtU4RXFZpZY6wRPkfE3Op0t1q/G2lYTYDNvIvpDl0AUzKXEfCapPuWmo4lkwkqqOYQ0+SEjgpfR3bAcr0GvtmadScISsVhV8pCSFDgmNnW537Hzn3f977jTN/8NQrS03jbzZCTiMYCp7wEZHBVGMMts/Wrp+eLI0HAYeVjqRWV4VKkuQcOSKgJpsZGgCNvoAxZFqRam3IKBA8mKgGbP/O6v5tW8ZuB4DHADQIXkL5NiEIrhaIff8JtsxUxc/9wP4P7dtVnatWPFi80NXNjbBHSinBgDFGLCZhUtyUayn+m4sabun0BAMl2kwAl7p0HE+dOo7u0aA7ACS0nqUDCv1BLaXbzoAwYUCgAG6PA3XJDhQdIti9l6lgrmPusn1+c6a4GrXMpxtLxsYsoCQbNgAhKUW61ZFhsRAV6mOc33Fo/CNLy62/dmBh4t8BQIcxgXpEUL4BEMckGSuJ2uxkYfdEw/cYR+j0lYqkNpZOZrGnwfIAIJUz2TPf4EBwaYYku0WGSSZIrVAczTul69458J1NY8ecY8rJ9JMMjIaVcvQUblvJNhgq/EtjXJixobM/Mnsw3W1Kk1Zaa2TASgH3p6dLxfFGEc4sdeieB0898CdfPPpLX330+BlERGQejCALygQ/ROTY13147thyR0H0qaPnmt+885bWL777+i0f2LujVpmZHmO1Sr+wtNzm682w1w8h0gq1J0BwRLSxrcihQ2NrgNSOigisAYtFU2kYrATPUUqZJjEeAJkhUDs91dcYgSiEpfG6jzceaNSFYJ+slYOFWw/N/yaRXEPkbxvmSuk2AQA8+8rq48ur3V/p9kJ57FTz7OJqF2KtvwCtR3FbrjUYWQBcg0AmMODyehdePLH+8vGz7W9cv1ffWCl7wvc574XAKSKZ0me5dDk5Wi3X+mUOwjbnUKLD6l60LwAgJGuslaT9ycOQ5jOGBUTkF7hXr3kFIQCPnGi27nt08c/uf/TMv3/y5Ti9zijv6AguBpoUaK3o7psWpvbM1z9aH/MDqQk6fa37EUSMgIRAkZoRxtyR/cU5MiKATkeGxYCLRi3gM9OF4vRU+dZtW8YFAKpRnvPXHxAVaE109y1bt+zYWr2zXg2YJoKNTiR7PdlnCExw4Ck1aCuaT4egz2qLrlTveHFajzIfuauXIYRP1LDgCGthkDEZeJCLNrjJddjkXnL/UuYGFxmAkf9yRKYZg15PRqvrPTY9HvgHdlQay6tTP/nkS6uffv748rOjtIBvHDDGoFIOivWaP1EsCej1NPRCklKTNn6DmGeO3Q20mY58OOTWwxW9VYTB4IGXUWezQpQXgOXLuYhiWBtG2GG+EyCQJpJSSwKCckkUxutBsVwNYLWt4etPLb/w518+/ksPPnbmm4hoIqGPXFs2AxsMkTGGTx9dXXnqleUvveemrc+trES/dFdr7sf376jNTNYFm54sekEgeLMpw25Xh1qTVlZxxGI5o/seh4uF8pdS2jgha9PXjYgEggMnBBZJlJ2e7p8536VOPypunS3zWw6OVzzGf15K6tx2aOtvEakmokAEDvptYnn6zMvnukKUThJpANDAuXhbZq54p4AYZQG8VoEDgIReX/fDiFpEQJwhcs6QMW3i4xOQMbmMJeCx/j82CbCasBxpipkPRzPklCe3BLgqLHD9/oxa3/y0GgBK2sAkjkBKhsd42FgtWPGsuZMG6rKeRrEFAePAiwXmVSqcrW709SPPXnjwM/ef+J+eemnpNKJAGOUdHcElQBPBji1179vvXHjfgYXqHbWS4GGooBsqJTUojwFnDNDGqrD+hQAAgIiMAVOKdD/SUbevpQbg5bKPs1Njh+emqtWTZ1ZW3k4agasBBA9Qa0k375+a+ci7t//w/oXGQV9w6HQ1dHs6VEpr4THOOGIejyUXDEOaKAhzmsS0psVVlPxytf5JY+4v13rA0Ui5EccznwM/7ViznL/Vpse4nDJ4lxxtlot/7e8BvE7us9gC+WVKWQswV/NrJ8/2ZbICuKa0NlGAnRSC2BIAGbAo0rLVjqBRFf5EPYDdC9XtB3aPf3z39slXiKjPuY9qFDvjdQMhAgTgoJSkn/7uw1uq1UKVewzCtoJeqCOtQAvOOGCSEChZwGSEnvY0BrCv39X0A6TpAQ0YeiGfUSh9qYYuIOdqumkgQyFgVp2RKQ7pOqZ4GM56N22YbAb5BZW19IFkhMkw0GX6U+RBhEAaNCmtuUDeqAXFifEia3YkPPzkyrHPffXkrz/2zIUnmu0IAHDE/F8maK0JkSEiIhGdufnAzL9+8eTaX95ycOZvvPfWme+6cU+tMjdXYJVyr7C01OdrG1GvH1IIiOAhCmTATPAKE8ofDe0IYFJHOTy+Ex2Asqs0WedmL1jBEWfEiFD3ezpcpwgKoleeqAd4YEel9L0f2v7L5aKYfc9NO3+DSF5A5Mi5QPU2CIjHxRhqFU8G0WgtX+sgRm/wGgUUAKSgEAgv8FnNE4wzlhJ+9pgyrHbmPHYPucvXQV0+DK6pzVT3g3Vt4KHNUgAOVEVAzoAFAeN+wKG9JOWzx1b/5N5HjpyKcbwPpEYSyhFsDogCAQgm68H4wV2VH9i1tTxfEAitTkRhqExqTcs5JpItIwRIGChEBNAEuh9p1QsVoGAwN1GeP7C98a7tsxP3cAYghEApr31C4GoAZaLFH9w9cfA9N83+je0zlbFeT8PaeqSiiBQiIjC0skNHnAiQJ/XzV5Pflpl+jW/MMhLDgIYP5TV2hgibORpbvj1fBTJ4FVKK2bmTEV7gQDvJzdyNzJljsmkgAkpJsh+RbHekHCt7Yrxe8G86OPGjR8+2HpiZrD6ktQTkHtIoLeDrAkQERJIO7Z4LvudDO95dLgeBIoB+pCiSWiIBII8DqyUJAFOUBwCu3Cp9yZmXk/ezvyzqIqVdMHOJsoRK9mk2bfuSPW5K+OQekobcg/TR4rTDoD2Bolz2Co1KgXHG4eVjK2v3fO34P//qo6c/d26lpwD5yD/6CsFabTLGERFWvvX84lduPTT/eLPVP6GjrT+3d3etUStwmJzwPe4hW9uQvN+nUGnSCACMESNHgGvlAab1jPCSBl47DrhyAdnqBJwjRyKUClS/T+HZxY7udMLC3HTJP7y7MibEth/XwODuW3f9YyJ1LhZmcLzW0z0q2bqmxz+CLAgcmQBcoxDLLzlDxjkGnANjDAAwzuFDNlB5kn0ZzFnq+PO59N0A5ZsRuceQ05oNr2jLUMoV2b6tBD6pRpm2yNEcEVntWyquJ0cTRoSJKoFxRC4QOWOgFOh2NzyP3KZeS7xORzCCTUABAEKjVqjt3Fa5dW6m4CMCtNuRlKGSHInFmghweJschWjiWRAASKVVpxdBqeTBtqnC5C17Gz956szqUyfOLZ9hbBTc7PUAZD4CEGyZbbC//n0HvvO6vRM765UAl1d7urkR9rXWGjkyAgDtqO0Toi5BSwmedFp3op07ms74FjqlEqSWG5z9dDTxAINSBFN10Cfa1k8XXEaA4Gg5bTdZHBor4TFN5u70mVhZZcfqjsklCSg/D5S77lgCuFXcAWckDUa6G1t5ISGg1qRbXRWVWhEfK/l423VTh5fX+n//2Kn1nzm/vLECI9eZ1w3s+t+5ZWzXji1j76mWhKe1hkgqrbXWzBz4rpVgJiNQYg0ARquavnt0JFk2QaS5Ae5Bbzz+HNGB3X8Ogx2XNLpZi3QpleQZyAgLMtcxsybz1gfp/nf3dwaX5ycuQ/OQoZ2kUgoBoTLmF8cbhcATAs6f7crHnz5/36NPnfuLF48vdRG9Ufyh1wBx3CthrQHWbjk4+1tnzm587X3vmv2Nd18/cev2LWV/drbAi6WotLwSso2W7EURRYwTN3QxAwAgSiJUYRKHxfSRQ9lgEHMSj4oSkhrRZhQAIEQGjDToMKKouRFBIHq8UQ/4rm3l4sc/NP+ThRKb/MBtO38hDmwapxMYCYJGcLXAiDu6VsE5BZnVcxm9PwFRQudBjsZLkFqMAAfub94hZKnTwVtDfhgYprofvJXU3lTaP/yKeQYEilOy+R6vjDRGI7gc8FiAAAic+zDRKM1OTxdny2MCIqWh05WRkloJBORgaFGHbxrYNybtptJErXYkw76E6YZfuH5P7X17t1fumKyVkIgAeXEkBHiNgKCAiGhhvjq1a3v9vZPjRQGAsNGKwm436sWuQakAYDj2yOvAh7yWXDEcEBZcHsTkIgwy5JdVMx3hRSHhvyhBopvVsU+LFz0A3AdHR9JwadRq+cKU7XI0DckkEiCLrWu6fR2trIWhlgS75se8dx2afP/BnfVbYmsBBGSjPfNawRMlBALYs7VR3LmldNvCbHFfqcAwCjVEkdYmoR2k7Lf55+4Bc9GyT8P0B5gs9OwrywaNHIQhtEp2w2B2N9idmBECbNboZRE6QwrhJvcIgDRoICDPA2+yEQTj9SKub0h65InzTz78rbP/4fiZtQsY54i5VMcjuAQQSSIiYsjxyZeWVj71p0/9xX//8xd/+p4HTn7m2SOr7WYnhGKRwfSEXxiv++VSkRcAEbQG0po0pcEsnSQBdmE7dPCQJZC401qJLSJoQNBAxDgxIUAIgUJq0OdX+q0TZ9u9SEawf2c5+Oh7tnznR+9e+J/fd9POaYrNb4zF4QhG8NaDuLJgLiO4ugCT/xhhevCmUXhjO6YkRH+K/az58rA2ASAlIJ3D3lXep3mwc43Y/LlJ7mDTXL7IgObLaggSb9bN6cy4X4NOAZimWOaBhIwx5Jz7cUEGl3Hqj+AdDBo0CMZhZqIM87OVOxqNQhEFg25I1O2pUCvQQiC3gbGsBM3NKmf9SylmaJjWoNttFQZCs8lGwBYWyrPzc+X3BgX+GWiCAmO6PoJXB5wJ1FrRjfum6992144f27dQOxAEDHodCb2eiqTSyueMI0sUPRBr9fNqaouLyEF7ObyTKAVTbEXOjazCCLICA8zbiaR6TQvaGYtVkuaT7FnSNduzRZk2wStA6mg/KNpwsGoOnDYxqynN8HzJ/JjW0gppHBmnIbc3myYQENJ6sfs0Mg4cGbBIarne0rpWkX61UcCFLWOVm/ZP/PQtB+ce0VqvIRZGiPw1gtIaCAiqY6K6MFf40JYpf9LjCN2eAhlpxTBOaYrMRutJj2aXn7fr3MafcP3u4y82+4PdPNl1azSp4Cx4sP3EBdJy7ktPSYp4MAMr2hVOuXEpwN1TWcjuNGdtGyLFWBoa2Vc8EUREpGNE4QkQY0Xhj1d8FJzBkRPNlXsePv1PH37m/NeX17sEwIB0d6SMeJ1AU5wFy1gDvPiBW7f8+rHF1tduOTT1k7ccnDi8a0vFG6sE3upqKBaXe91ON+pHESjOgQsOHJFidT5YyxIjRErWiSVOU3uXmJKmjPA/xsdxgC1EhNiSCXSotIq6quev9cQkB7F9tuh97P3zPxYErP7hO3b+CpE6EdMSo6xUI3jrYSSavFbBZeATcXxMjcW2lQkmy0jvMSPjvxh7nD/VcxUGUFdeEACDwoF88cztlEzNE7oZisC5YeUAWsdpdRE1ME6IGPswjpj/EVwKCDREStFH7ti9sGdb9dvLJU+EkYZuX+tIgkQEZCyJAOC6RGe4OfuTMWSkUXe71G97SkxNol9v+GJyunh9rVIsnb3Q3iBSSf8TlQYub6yOCIErAG3m74Z9E7e+9+aZv7VjtlQJ+xKarVArrTVjyEz8KCOlIZsLNYUBx/vcK9j0jeTx3OXhGIuuMX9x8OsQDdTg9ZTZMvxYKh8Y2oZ7PfMEw57TWl5n2smIAwYbdc4ZzFwfOgS0IgTjEIMKCMJIR+utMKxs9INSgeGN+yc+dOx0+/v2LUz/PgCFiD6OAk+9erCRu0sFVpue8PeP170AAaDXVUpJ0hwRkQFLRZvWD3pwb2RWwaZbJ39jmBAqFTjlr2ZXT4aIGUgMsCkM0C+mv0TBMbArIUMzDeuHALTSGhnhWFkU6tXAR2Bw5lxXP/L0hc8/8NS5+1450+xoArjWfb6vRoizYBWQIUdN6sWF2drRV062v7rWDP+5fhd8eNt8xW/UfSTE4lqTiXYn6mtJijRpo8hCYJa/HxS2AoCDTBMlUpoXIwkUiMnCZbGLPwMGqDToldWw3esob262XNq/c6wQBFu+W2rZ/9DtO/4BEZ1gyEdCgBG85SAy6ogRXINAQKQ1gQbr4oSJA5wj1Uztl1KcZzU+zhmfCM7zlgDmXy4GVBLRekA7ZelH3ERan3LxRtbqeOW6arXkM1UHxIw/Oi25Qo3YOCvTxwhGsAkQEBxYGC9/1/t2fuLgQuXGMZ9Dryuh31dKAwBnyGIuxeoA4rWaMmVZQRlDy8xQ1O3pUCrlF4oMpidKC/OztZlnXz7fZIyhx32MVEgj5v/KANFHAICtMw32N39g/yeu31vbOV4RuLzWo41W1NekiXHkrro/xUA2krm9CpCEqM8Q/GnGEadnSF2nwM1gAhmGwenTJSMzWqYErTmHbyquHWglo3qyz5ISqkiQut0nhCm4+HHwW36EqUCBzM/0fl5UkpwF+SZzPWcFDRaHG3VqxiSBgAGgRsRuT0ar612vXi2wg7saM+dXol94/ljz3pdOrB0DGFnOvDZQAEAQBLxYrwaTY2UPiQi6PSml1MoIOtGYOFm9AiEQJpYbdsUM4f43WVGAbj2nmg1OZIUMZPmsTbQMrsVgBu1SKhAgzNbE3Ge6zd3RkiPHy+8RNHROvHYZxjtOaa0ER69SDfyxagEvNCP6+pNLzz7w+Pl/+9yRpSYiImccRvDGAFGPPBEgIkMAlL1If7PVDf/emfPdH7n71tmfuf3gxNa5qQJWa56/vNwVqyv9bqcb9TQhcYGCJ1l9iOKQgWY95nBsvL7IBMWwctG8uMoI/00DiMCiCKKO1Hp9PfQLARMLc4H46N1z318MWOM73rvnlzWpF+LAgCMhwAjeOhg5o1zTQEBAnIC0Bg2E2gosHTY9FQTEzLbh3S/14nMnZiYSqnM7LTdEip4X4w+gubz0PSsmuDzZVEyiamAGWWsA0kbFqod1OoIRAAAYXzyEucni/KE91R/avaU04RHB+kako1BJxpAxhnEAoVRpNESxmcjVEAFAA4EmolAq1etJKAoPZifKMwd3TXz7wd1zJ7TWfURvhHpfBSBo4NyD+emx2s75yp3TE4FgQNBqhVGnK0OILTayyfw2c9tP8FOKIxPdjiu3BACygkrYzJg41+7Qy46g0igy0bSdLZljtR2mJs/QJHwMZq4OGQgNXBkAK0lIRcWZY4AAgGXYMNNLTjnrtLcJ8qV0yo0ptWDAGDJUktT6etgr+qI0PV7Cw3sbBw/sqn34Cw+F/4UzhgwF6hHB/CohTp5b8D1RKvtVzxfQ6Sjoh0pJRdq6OVkvmM2O6+HsubM2c0x4mjrQvZo/+wfh0vEycsz6ZhKpS7SQ7ilH+ZBP1WkIn8QTHBF9n4uxcsCY4PDy6fXVex89+28ef3HpKcbic0W+DdK+Xc1g888LFuDSahe++NDGszvnx//5ucX2w6of/fvbb5jaVa4XoFYRDLQqAtPY60NEhmBGIJYul5yo0/lqllVGCEDmIECzUIzclBAARMzXC9JAG82oq5UKpqZ9f+/CWFAIxLcjsX/78bv3/srM+NhLS2sdiINEjmJWjeDNh5ELwDUL6RGdPawz163oMjl8EYYc7Ek9F+/lTk5M7wyr72rt0z7Sv4PnMLpfMfG5GzKmYZSA9cfWxp1LEzlJr2gkeh/BZQABgoCJ8dL4jm2V/ZONgPX6CprNMAxDLTlDxqxGDC5Oslr+y2inEABAadLdvtbFIrH5yeLYzXsnfvToifX7AODpN+Xx3mbAuY+aJO3fPlG89cDEx3ZtrewNfA7droROV4VRpCPPYx5zLTQ2w3hohTZ5fSWY3zFdZ/mdS1NnOR/9IVxSXgNKKYJzxpr+dBOw5EeXduvUdUabt+AfXLc20ru561pB5J5ryOiHN5px2nZukjMvCYpGYugMmgEyRJCSVLsj+61O5I+Pk9gyFRRu2tf4iY/cvvCliVrx2IW1kRXAqwEuSgjAwGMCyoXAKxb8gAsGUkUQRkoqDVpw5BZ3OZbxmI/QP7ijKLuEY+sbwow6fhMtu5GA2a8XxbIZedbgjh1alrL3rfAqa+mYpXaGicosDaU0aCKkwBf+WFH4vmDQakfw8om15x5/4fxnXzl5IYq1unrE0L1JIHWfBLfWAFx+5VH9xX4U/sKJxY2/e/jA5J2758fqk5MBq1S90uqalKtrUbcf6kgjaM6AcR47BNhDPhbwQDYkJpF1q4UEXyYyrXh1xCs3vsQZMEANUpJutXTf8xkf55zPTxX4B++Y+Ygv2H8ul9g/fPjJxUdOLLbUyBJgBG8FsJGG9BqFzAGYStgT+i+9hUmoEswGQCUr0cYke4BTLTast8GfLamWdA9Z8UNeY2CDE5JRnWYyUpOVldpxZY34M8/o+iCaAIcx7k3rUMz+m44RAEfJLUZwcRCiiAAMNPVperJ8YGKiWPMCDp2u1BvtqBtJHVsAJGpbRx9q0lG5/8D5h4jIeZw4oNtVKuwrmKx47NCu6g17t1c+aBoBxPIldVwjSEHrCCZqBbxxX+PGu2+e+pVtM+VaL9TQbEkdSlKUwYP5UHqWrMfE1NOgNoMdUzwX88VxALAYdcXUX0wkmuuQhJEybaZ13T5d3JbEZ7WEpsGNFschUeImYMFp0qlncPUwR2gXr8e2KJBaQqWDjN1ZKVm9KerN9JjByphrH4DcJjPlyfmGdqxouoynAi2vaP+x+HxCqUC1Oipa2+iD7wHcsL9+y/veNfdLC3O1cYYscQMZwRUAAQAwCFWfapXCXKEgfAAAqYgiRVITafserSV0yuOkWC5hj12U53Rh3ntO1kWZ9RA34Fy3/SZLehhNOsiip7fIqTxIiQDkqYts9qN0r9ugf1nhFRIZLzAAKUkCAYyVRFAteaLblfDK8fX1Z15c+v+fOru2FhNbI/rjzQap+hQLXRicONcK/6+/fPmz//XTL/ytP/7ckd949OkLR1aafQoKAibHAzFeC4rFghcgIsaKI50KKQkAtGvtl5wOmQWLiY9ZlhLQEBs1EWpARsA5MqVRr67p7pkzvbDTkrBjruh/5K7ZD3znBxZ+5z03z921Y0vFZwwgFmCMYARvHoww1TUNCAConO9giTvDJGcDX0OcviQ+otNw11mSz1wZcrjbexc1zbfnvxtNO0uJZ4/vAam+i07N7dyZjAkVbKL/27ImYhvgSAIwgosDkQaiiG65bm5ix/zYR6pjvqcJoBcq1Y9UpHXiGRivLoozq19s9dstg4joCS4YMux2VbTRCrXvAWydDcbmZ0p37dk2I+KSo/zmlwsMOQIAjBU9/7o9je+76bqJG8brPmu1+tRshSEREIu5w5QVjd2BKNHwJVxNwpRfRPpt2ZkkeMomLAhlyhtElC2N7heE4b/yPUOCRzGHiweZGtuSwwDln2xI/Uxf+VvpILKCLjMmK4NwE2TZILTOtA2bAkSkJEptwu+ZQynOlc2w19fR8mo/UkrD7oXa2B03z/zQzm2VfUr3aLRvXgWQBsEZ7N4yzRq1wp7AZ0ITgZRESkGsrs5Isqx0Kr+Uhq3aQaFR8uUiO2y4AGGglQFw+fwBfDywbofvscw+sUvaWbUx35fctNuRtCZiSFgpC1Escjy31Ot948mlL37r2eU/PbHYlHG5UaDKtwqI+iR1fAZ/8/nlk1946NQf/NEXjv3qZ75y+gtPv9xsMcZg+3xZbN1SKlfHvAJDwCjSURRpSVawn+6CvFw37sP8SAVWCWYEgFhiDGRXYOyT2w911GzqztqqDMMewcxEgd192+xt3/VtO//TB2+f/9iuLdUCRwaIHIUYZTwZwZsDIxeAaxYchh9t5N5EHzVw+DnHXSafeVIgMfQbEAWYBiypuYl2yImqnW/cHUOu1fS6obfRqPgtLeImY4n7yc0CkdEeASJjAMiQIIkCmOl1BCMAiLX/RBp2bq0VP3j73If2LVTuKHkcez0Nfak12S0EAJbRSi8YdjCxOAFzFc0GiwkIwZFrQur2ZJ8zjeN1VRwb4zgzGeybGg9qR07zlTgq9wguBwg0ICLMz1Qn9uxsfHh+bsznHKC5EUbtjgxjqwuT+i9hSGOSHi0ycaPbg9X4WJ1jFlcNxxs0cCe9MqQ8YdZ7KY+7BpCwKWLXFDno2f4dRKaQYGW0llaDgdQsB5MagbnB3IYIDAZGlhRL+Tuy4eJMSTIGhTmJhXU1wEyD9h25bRMwROSCCalBN1tRr1QSYma2iHt21Kev21X9/j2zY48jQA+R4yjC+pWAhkiGdNcN28enxoMbCj7nWhFIFZu0J8qCOAZAEuKSAIyThmtfE0MmVYS7NCm7U1LM6XDX9j6lvwd3Q44WcdJlZu9ZiZUDA3vN7SNl14bRJpb5A2e5x2oGIIaEnsd4qcQZcoRjZ1tnv/7k0u/c++iJE4gcOR+R1G81EElC5iGQhKePrC5P1ct/9srJ3tdPn+v/HfoA/dIN+xqVWtUDUn7AmGYbrainFCitSVvmHxCRUQbd2b2A1vIryX+aLK44YSZCfK4k1iRIyEz8gI2W6keyp8cnvGBmssDuvm32kMfwXzFimuGZL75yZqOnlIIRjODNgBG2ehsAJrZDmPIlGSYGIMNKpzmwE3ItH70pYXScI9ISmUmRYQcvOtczdKBDASaEbYJK80+UEhbJdwKX+ydwAxPbbF+GKNUwwqAj2BSUkgCgYXayMHvzwfGf2r9Q2eZxgHY7okiiYoyz1BwvYfQvKZV3Fb2IiKCIwoiiTk+xfqSLYyUG81OFbXsXKrcdP7v+hTPn17XHA4xUf8TIXAQ495CIaO/W8eCWA9Mf3r2ttqdU5NBuh9DpyjCKdCQEF8z15TTYjtBGC3FYaYflJ1MlfXeUsNGAjgGVCTFimBuyLI+b7SQm/CBnrQSQx5EDjA7BkFLgot7ksVysPJDJMB7IJo3Zxxt+fXB06SB0goPjSWOWyLU1jPYUrezBsoqYSkCsO1lMRDuSBLQCgvgCIoHgjElFOgy1bHellFJ741WP3bx//BMvXT/1pb5e/OKpC10phIdSjoJnXR5omB2v4HtunN823SjtLngeUwpA6zhzCcuy5QbsuzNv2y5wW8qG2qQceswtwXRv5dem+3vwNWbkBJnGcgqEIWRIWjh3M3kUZ2dmZH92TOlOIdBgnQyFx0SxyP1iUUCnr+D0hc4rLxxbf5yxAgIIkHKEy68GIB0ZFO4hAMGFx08s3nbdlt9ud/uL55fnfuXmg1M7ZxoFrIz5/tJqT6yth712R/UjrRVnyASgiFG6TvEcIpK1nTXrECGho7PC2/gPxSiTkHHiQEiRIhm1lQSmgAss1McCfNfhqX0C2W8VCuJf+o+d/R9PvXS2HQuTPJCyN1pPI3jDYCQAuEYBMWb2EYkzhNRXWYPNVobuQZkcd/nDF3L0oyUzc9TAYACfXGighL7O8UlDZAlZ2T3lDmE3EGCKTZNz31K+th+GzN4kAtDxST1SrY5gKHAxhgAKEDlsmSpvO7izcdv8dMlXEmCjLSMpQQsmGFprf8wFiMormpz94SSyBIhTDpMGAqlQ9fuKygWOWyaL9Zv2j//0yXMbLwLAUalH5swXAyFKqLWCqUYZP/yu7bfcffOWX946Xa70QwkbRmADEPuPMzSh7Gx6MYsDMfFzT0OFJBgxQ/3HvAbGBk2ISRQo0rE3QYxX0JWWuhRfyqYPyD1dSDSeWS1kjhMZHjQtw8s47ThCD5dHSp7PlSAMDCo9KmxKNmtRlvi2EiapBuMpsrNqhM5kSeNYImt4+jQQXDKZqaAWbBYETHhLQorJbIaxv02vp+TqaleUCwwP7arv+NAd87+0tBGeP3m+89jIZ/bygIsiEgCMlTx/brJ0aKZenAuEQCUBNBExBGRoI2cmKyAOz2MbsQvIBovMzHyW1XdlcPFdu85zrytZc/bugMhgKFCub0rGB5k2KJEugRMg2Hkehy7JSz/IeQANQEqRZgxYoSj8ctkXWiMsr/bl6cXWty6stjtECkaR3K8+IIqIYQkRi0jUXZubqv6vx09vfH19Xf6n979ry7tmpousUSsyAFbQug+6p3pABFqDVowYQhxoGhGQMIlpRRpiq9M0JhUkf2KDGrJHESLG1jWEChkQJ0263YlCeVbrRkMVGtUiu/Pm6X2FovjNIOD1m/bP/h8e5+tSjWiDEbyxMBIAXPNADGBAJp78zfHe6d3caZytv6lIfROS9WI13MqXotc2iclN2TKDvToJXGO7VJ0tP4IRxKDNoap1RH/nR2/cNTc91iiXfTh/oUetjgyVRMVNPmwcpHQdIPcbJZaD7lUEZAwYAUCnp1SpoMR4LfAO767f/fyx1dtnJ8rHAUbRoi8GyryvWrXo33Bw8mduPjR+uF4VuL7Rp/WNKIyJs00YQRNcLtEgIhjdtcOo5xgDy8MiYGJOoDWQkiC1Bo0MGOPAXQxkv23OvjhM+GXAFWGsVBE7RHefZc2sDdimytKkkRw2JyDQRNqENo89Kgg5gzh2lXk8i7vT2jkRR26CXGuE2BUjJreNEAAZIwwjJddWeyGv+/7sVNG76dDUu5882rx1ZrL2TQAExj3UasR4XQyINAASVEpecW68dPNkrTAuGEIYSlBKE7JYgZBdL5h5jylsutWG0ABWaODcGHhTKY7N8eB5L6tN+7/Yfcr3OGylOOsyGQORcR2K70tNymfIykXhlQqCrW+E9OLR5qkjJ9c/f2pxVY/Sul69oKnjWANI+OMvNx/7/g/u/VtrG9E/vuXQ5AcW5iv18fECq4x5pfX1frC62uv0+jqKFCjGgCEz8UkTFzLE7JZI1rnFbGAFAMlGwhi7MQZIACxSpMJWFBIxEIwXa/UAb75+Yl748Ou+gDGf06e+8ezimTgkigA1wnEjeANAuMqKEVxrkD1Vjb4GwUSuNoqZDGtCYDRjKaoy/ywViZmWU5bcanvi0lY15jI86Fa0V62blBNF3dqK2nYSTVKeqs756aVtmP5j4jfrsp0b/WVT3SN4h4ACIk2H924t/vh37np/pRx4UiO0e1p1+jrkyNAXIFKeJcPdQNYNBZKlRs76t9uNmVgAgACdvpQbHWT1SoHtmB+b2bml8uFKOfizxZVOjzEftR4FjhoOCjjzYftcbWb/7toH5rcUPAQN680wandUHwCBMWQxMw8ZS3+LI2KhIKaWyhnNY6K5RoDYgAp1GuPZMr+GlkPGkDEGsbqUUvsBE/cpwU4WEm0qWL04WCWrwaUujsw+eSqbSAccry0ncr9LdzqSDsxpRNHgQisUTnFrnitPBSYx0UsgEBggEQEwqZGUUeJrsJEvnKfF5DkJwGQ+MLIW52nQvB77BuJJMBYbZKJoIRJqpXS7rfsFj/FKWYjZ6fLYdXsmf/C6l9ufXVxaP4nI08kewVAgrQEYQbkkqpPjwYFGxS8iEPT7UktJKomPERtpUBrcDABY+gMpeXP2ncbXMfMnCYKWGiEaGsIGB8BEHAUZhJm4i9htmy6t1CIlbS/Pc4HTamK6Y+tnN31q4T+glMiJMMxDxMI/hmMlwT0f4djpTvvRZ5b+6KXj688BALBR4uGrHogiQiwgoodE0eO3Htzy1148tvZd7799y/90241TB2cnC6wggHOtSqtN2euEOtSEJvyviyAdoji2FrNhTmI8r2MCNyZX00IpYgVkjDEkoLCvwwtLXZCki42JAt58aHyq6OGvFgRV7zo88x+J6AQiR8ZKqHVnRCOM4HWFkQXA2wCIkii+yWFK5Jy6OMgFp3L3/PVBOb4Lw+tsfu/K4FK9Z3tMaYtE2vp6DGIEb1PwRICIGrbN1Nn7btt6577t1TuLgcB+T0G3p6VUJJkgz66ji8WIz2mtHDI3NWVFIBAcuQagXl9HTaawXoNgYjzw5qaLh+uVoAqAPaKRqd8wQCaQSNH+HdPBLQfHf3jnfHlrwUdobihod1Q/jHTkcyZY7KqRddaw2hrSMZFv6f7EexMgibJvrhHEXK0iUqQ1IWliCIxzzgKfCSE4R46MSJHSmpQiRS4iTdnZZBDp56Yq0AG4IioPk26zFzdtGQeLOA1YC28ykgTOgBV8FGVfCM/jTAJSNyLd6UvZ70dRGIEkHTvKIsblkQExloTTAh3nxUrssK1CLHlfljMke2xpsIGzlCaKJEWtrgzbnUiUCxxvPjBxx+JS+PduOrjlHwHQBiLioI33CDJADIJA8FrVmyuVhSAgCCOtlSLtsOmWG7eiM4CUPR96Nhtx09A16zQ6WCkpsAlk9lSu8kXf9PARXrw8JkVSsYQR3cVZLQABUHBkpZJAxhFOX+icf+KF1f92/OzGOSE4KjkKSHktAFGPOC9hLDhk661W/w/X2r0zi6vdX7310OTd1+2oVrZtGeOVui4vLYf+2kbYiyIVSa01Z8iQATMG/XGQv1hQaeJQOEsgI82NhVupSAqBM2CAgEpp1WrLjiZNjGNpvB7g4X2NOkP6OcZR3H3j7H8gUkcROSIGSDSKMTGC1w9ETnU6gmsFbCAlwogSHRVAJm8pAKTCShcoxUTo6o8cfVBWYJ6Rzjt0glPHqgPs8HCYcN+27iy6tH5yLdMXOH055Si9QUBApON0gDGw9DlH+HIEMSilgXGEhfnSwu2HG3/3wEJlR8AQOi1JMlSKGSYGbLAfGKRD3b0CqXIsVmEmVLIJpQ0AnDEkIghDihA0RJKCYpHDzGRx29aZ8tZHntGLI1/mQWA8QCAF8zMV8W13bvvQ3TdP/dyWiUKx11XQ3JA6iuJ83DZtExg1jTVzt4mZTEQQiy0SSSgCAGkTvg6tsa9FNBrMy0XOGQsC5hV8IYRgTBNRKFETgdJxhIjUDiDByUaRbtZCqrAky+U6o0g/8yIC3ExL6S5GpOxPwMyapVyl5F5WOQuW9Ubj74oIiIxQCMYZAyTUwBiDUsBZUGLM7wLbQAVtAogiiAiIjLaLkr1hOEbLoGdDviLEby0dH9nUrhi7ANgn0kjQ62u5th5GU/WCd91CtRKF+sePnVv7yuPPnfnjOANEgGoUTHMTiBej77FiqSxqQYGhBg2hBJ2mO3WOSgQgR1DmbI6EcHCpxlR+5ITpT9T4TmHrLJ05k9PVSpmVC1nfkqQTi5Xzcf3NPsv5DWA6uLjcAEI3AgXjGkRmv9py2jh9c4Ys8JnwfQa9UMGZpe6Rl081X15e75Ea8f7XFCjVIS5KqFUIR8+u99Y7/S8/f2TjkZeObvzId39422/eeePkVLleAK2Ypwlgo9WDKAJJmtzckjH6dAJhxl9iqZFrUZvYy8ZIMq6OhMAAGRHTGnS/p8Kl8z3UERXGJwrs4L7xqu/xv1n0ReNDt87/SyL1YmwJEKDWIzw3gtcHRhYAbycYICzz3zNXXzem4/K09q8CLqYpsDKCVHeXqK7eiKGM4NoHAgWKGMxMFrcd2FW9fX66WCBF0G5FUkmtOEfOkvBlebYs+yttM38pJlAtu4UIyAhAa9JhBFGvrygoMpyeKI4f3NX4zpv2zrxEpJujiOZZIC0BgMFEY6x086Gpn7/hwPjOUlHA8lqkmxuyb7UoNlZD1vTXwRiOGCdR1AChJog1+NrqpwGRxakE/QL3iwH3SiUuCgXBPM4gChV1OlL1e5HqR0oCEjCGjDRoTY7IMmGTANKBZFnxS8HlIeaLtbf5vaEjQUiCXRMgMATgHLnnxbEwVjfC7vmlznkpKZyeKs8tbK02xmsBm6gGhW4IhW5X615fqjCMVL+volBqKXU8J7E81ggU4mBYxqramSEETIJt27KO1JghMilJrjdlt+RLPr+lyPbvqo7fcnDib9xyaO5+IlpGFCMh2qYQ7wHBmVcIsCA8hF5IEEpSSlF+w0D82xV/Wmea/MJOnKI3B7PhcjL/i4wzM+TN28wUxyvZXpu3lzQbC+o0kTbCAfQ99AKfCQSCTieklbXe0eX1fksqDQAj+/9rDZS0cQEELq60YXEl3NhoR/+7Qgkr7e6vHdw7ubClUhRzMwWvUmFibb0XtlqyF0Y6AgTkcaRgK3o2wlMnGktsJJD8tD8yqi2KzxAhUChFqt2KOlqR0oDlRiNg+3Y2yoKxH+aCFb7tjq3/fKrhP39htUeIPhKNXAZH8NpB0IhhukYBk3/GAiAJX20JL4PhMOGLE52Kc2BmDnRHUm7bMYVc3BZ/WK0XWM1R/DtpghIiwZZzKg95Dod3z4/NLYtgNH12XFbfl0ajhiTB+usp5hjBtQxxmiYCUpJ+7keu3zY3XZkolz1YXu5Rqx31lSItOHJE4yxutECYqvhzfq/xIU8Axv6YnJUMkGqo0hVOmqjbU6rY52KqXizefHDyB0+cad03O1G5T2sNQpRQypGfnwUiRd/97Yf379s5cdvM1BgLQwWrTdnvdlWfITKTuwwtDwlgFTAmEEqMg5ASxaWV7SBpQNJApONXR4whCo48CJhXLgu/UvFFpeoD9zj0uxEsrXTl2cX2arsTtXyP+ZWKqJSKngBkoCJSmoCYCZuerIGMECnV/KceWY72EiBFnrkVgC6z7LQXf82uOrDPnZRAZ27Su2mT+H+z958BliTXeSB6TkTmteV9VVd1d7WbtmN6vIEZWAEgQMKQIMUVpKWopfxqtVqtKK8nPenJrJ6ezGop7aMow7darcRHI5EiKUIgQVgSIAEMMBg/093Tvstem5kRZ3+Ez3tvVXVPz0xXdX4zt+vezMjIyHtPnDguzrG6nNTl/BgiliLGquUoygTR5WsbV/7Lly/+jXOXmt85enDsiacfXfzT994zcWB6vIKj1QjqZcG6XcbabeCbDFijTdBNKJUSJAIgY6R+Lc+lS3roVja2i5ZKMKjmlPrxGCJmUspOl7rrTVEabWeVWjWCe49OPPrOB+Z+4L5j0/+OKLvBWQlFkUujDwQARBBHLCqVWJlHALJLkGZSCNK1z23G/5yH36RCJfMzGWplENBjQIK6J+1dx6BqhueF9xQh9dGnf+8CNOMyY/O2Cnoyj+vbi7LJzbWeqZQz0TkDIoEklfiSIWeVCovLZcaSTgbXb7Q7N1bb31LJ/xgWfrTdC6KMVHJAAS+/vpr9/Gc7//I7r9z4zfc9tvg/v/ehhY/fszw2PDpWQuRQzmSHRCOVUqIEiVJtdvJ9TibTCoD19ZsUM0ABjdpIAFAsmHHiAAhJIrMb1zvNLJXV6alqdHh5rFqp8E8O1flMtcz/7C/8xmtfQ2TIeYRCZAWvK/CGUHCuPQ5SqrxZacG36jttZuseHPr7+t+0CID8CDB3sMeQ8CYPpMCuhSrTRHRg3xT7bz9+7JHR4UqJGINWV4pWIhJEwIihcuXkp4UvNAb0Rcb5hIEwbN8xAJU4HTgHDgTUbmdZs8T4SLWEJ5bHDj+7PPbxL33rypdoRSZCiDfp6XcXEBkSSXrkvv0TH3vPoR87MD80xRmDdjulVkckQpAoRxgzxnpcfwgATKschERSAkmpvP1SgEQiAkbIIoxKMcTlWsTLJR5VKlFUKUesFHNAhpBkEq7c6NCNzaT7+sXNy+fOr3/rxkrn27VyNHlw3/Ajo8PxSKXEeJYhpl3KpCQJHHgvk/JHtjPm1FMu/TbCeHZ7WD6CKm+lDSWcI6uWIp5kUrbatPH8a5tf+ZUvv/b8mSPTL7U7cuX85cZnlubrx8fHamNjtVJltMajWpmzejUqpZJKnUTKpCtkJ5FZ0hVZksosS2WqkvupZIrICJERs1EAxppsHM26FiMDAMaQZRJksyvTG+vd0uhIzA4vDo+/4+zsn3jt0uZXAeCGpLQwouUQRRX7pTKOsd7SoX5rVTKXmNP9Lfnm8lUOpMVtv2js06pHCd8O7no1i/pduPUIdzT7LN83wgWBFCRZTKxS5lEp5qzZyujS1db1G6udF1VrDkRFrfbdDFO+kTGO5y5tJOeuNJ7ttNK/2mll11Y30h88cmB0bmq8zBcXosrGRlJaX0s7rY7oZpnIgAFjDBhTdTTROtcICWwN1B5hFYwni1RCWWQ6wazIIGu3s64QJAGxPjVViQ4ujsQxo3eRpL/54ScW//z8ZOUbl260BWKERIURoMCtIypcpLsdvrucwv8ISGW/Js8BT0oxsZ55f7ef68/VNiXtXdepnb1dtMZ7E1JQf2+UiwzwEgZ5W6pyNlLd1PNJIOpO0G0lBAST/ckV+M7l4C7IuwAAICOYnxrGh04tHD+6NPaOei1mSUbQTkgkgkQpwojpndFEoLNfQ7Bu56tpuGNehIBuQbZuOiIgAefIiAg63SxtNJCND5VLCzO1yv6FoUdHRypVAJaAX73yLgXnJQQgOLx/tP597zv8B995dvITC+Nx3G10odVIBOikZc7vrX4knUneHCWTy0EHaYAkICFBIABGgKzMkddrrFyvR1G9HrNyJYIoikCkElbWEnrp9Y3VZ19e+91nXlz7P597aeVzV1eb6zFDfubI1H2zk/UTlVIU1SpR1OmQABJEkiToxE5OkTIeS8ut9FNqpWqAN9J5QnORUZ4yE/DRHpUo/KSVbkDtGdV5E4AIg+3YRKbaH3AADhFHZBixSpnXdVIAJJJrBxdG//2Xv3X5P0+MVSYXZoYPH1sa+/Dx5ZGnj+4fWl6YqdXqQzEMM2BpKlirlUWbTcw2N9Nup01SCBLG24wAzC4gLLdE6cdABGb2YBNHLiTIjUaSVGIoz4xX8MyxiSP3fHfie2dnxr4OACBEugV13X0wOysYZxDFvKJDl1VuTElSFTDV1h8APWkATLSMzdCjXZUucaP+B8Hmk0Dr+den7IabYNu0vdzsznFOerTGH2N28CMH0Trnw+gAP3uA5Qn6uCEvVy3A1hzyL9DjJdNEX0EgpZQIDCplzuOIw5XVTvLK681nLt1ov6YuZDv/MQrc0ZBSECJHkBK+8DuXXjl1ePavvPxa6z89eXbuzz710OzThw8MlysVzjhCRa5KaHeoKyVIbbpkZvUhsxxZph/sBTCHiLzQGEOGjAGLIgRJRGvr3baUVJmZKMfz03X+wcf3vbdeYv9oqBb/pX/3X175NUREzmIU8u7ZOhhFJZtfIS22TL5hFBEAewL9LIwejGdlh3DCdb8zfkdbewd2dCNy1w/ynfW9u7F3FCiwDTiLkCHA/HR94uyJiT9weGn4SMQAWq0MklQK0pKsHx/j5Ft0nrEctQV624A2ZsnnCEwCUZJS1moLzASV6vUIZqeri/PT9cWvk1jjrNjHLKUAhhHMTw9PPnB84odOLA+Nl7mEq9c6WaslE1V7XplVjJxOAARaoZEEJFQSv0zFBjNkiFir8nIcsVq5xKNahfFaibEoBhBE0EkkXVlri41m1l1dbW9cvNp89blX137xW8+t/MJ3Xlz7zquXNzJVIJDok+85Os8Y8mo5iksxxzRRNZ/MVgIgUy46D0ccls7etF97MCfdKuevqd6nDQEECMAjxGqF14dq0TAi1+ohJq9d2lgBYCtE4vlHzyx+9cXzo794fHn4kwcWhh+ana4tTI6Xh8eH43KtEuPUeCUaGy5F3XZW7SRCJCnJNJUiTYVIM5lJIqly/jNgiAyBABkgQ2Lma0NQeQkIgNot0W3EGZ8chXhuqhrff8/kxx+4Z/rf/E6WvXB1tQU8KqHIiq0ACmo1F1mXfv8nzgxHEeNa/wCTk1I3CxNh9vTR5z3m1uP8+x3Q96AmW3vs/TP5lrkerTFjRzEA7jLU0UWExBFZJVb1P29spM2XL7V+/dKN9hXV7q5n2XsKRELbbEsIwForK8nnVjc6FzdanT//xAOzHz12cGR8erzCKrWotrLajdc3k07aFQlJkpwDZ4zpKgGBxTd/F3AWKjCtAUAZADhHJiRQtyOS1aQrKJW16clSaXF+mL/nMfYYMf43P/704T+6NDv0zfNXGpmJmHsrvp+3G1mWkJmbRfWXN46ofwGXAnc6nE5P3JgbnaUbgcikAADPoG9WflBZSE17tc7Zfn2LuVOKzGfD2/Q765VH7zNoi7rXTyA3OM+8GTt497BXmb6NSSLnkXDxBfoKU6MYPbN8T53fAncbJBGQFPTx9x4+ev/x8e/dP18dIiGh0UhFlgnBERnojO4AugIAIdpEAABg9ykHXiJ9CkA5ncy6TgAqE7A+axLNE4AQJJKUsJtKqDKAuana5MlDEx85c2TuFSGzJmMllHfpPuZSVEIABjPjw3B0afK+5YWR5dF6BM3NBNY3k043g4xxxm3UhUnxrbP96039UkqSRJKAIUYxxuUyj4ZqcalW51G1GkGlEgGTAO12BpeutrrPn9+48J2X1z/30oWNX7p4ZePZtY12e3Wju3p9tbu+sp6CH5lRirBUjVktjjljjAGhBKm3HCtzg/FWIkitT6EpeEemuJiBUbnNp1xkAFDwJ3fU0abnhbWXYK4x+X5PRdcqSox01n+99x4RCZB0dDgwBsA4MGQYO9NwrDsWoGtq31iaG/kvX3+29NWR4fLI7GRtdnnf8DtOHRn/+Inl8dMHFoaGx4dLMDIUsTSTrNPNoNnMZKNJCbQkdVMhpQCBCCgZJ8aA6V+XUKLxqBFDQCmJUkmi2ZbpRiOL67USPHB06p5rTyZ/h7LsT//yl155uaiq4YCEQDpJ3VCtNFsqRRwAQAgiIaRQJiumSUev9EYeQKfDmH/J0hy5Kyiv6fjE58e9GI7o3iEZaQIcb7VXgmOu+r2eZ/aziWbpUbUoJ6l4uxwM/ZuxgG1jOzVlMJAhsYgzVilzlAhwda17/aXXm5+7fKOzwlmEUhYh2HsRRAkhVvHyWgu+/Ezy/Plr63/6uZdW/92H37n/7z790MKJ8ckqxJzFBARrgmSayhS1IGwC0ZixAaDL4qL61lTtRFmbiMXQNyKpLYkS5OZm1lbGWF6anh7C9zy59PBQrfT/Gx8p/emf+41zv7iy1gLGOEp5d5SjuFuMHW8FigiAPYOeFVAfVampepI9DrD19/bgeu+ddb7P9CbhXer3Yj1j1Hu/QKbdKQsoDIR3NRivWVPZwkz9+MHF+uLYSIQbGyk1mkkihJQq+z+iJ2v60qKD9zmvX9mDwQHyCNuFogpJstXJZDVhbGK4VDp9eOzjL7229qtTY7XfIcogjiqYZnffvtJUpEBE9P7Hjhx48MT0H5odrw2liYRGM5OdVKQSECJkQEQglLdfRTgTEUNAjsjKJR5HEfI4Zjwuc16pcF6OGXJESKWElfWObF4R2fpG2rp+o3Pt5Qsbv/Ptl9b+7bdeWP3cV751ftV6/gBAhcFzIOIgpIS5yTr7yJP7J0olXuUcrOffN0QaQ9CO7I59iegm4N+DdsqNB7UgbWrV22BAxTxwbchCAOCMQSY45GtRc15GKUV24UpjBQBWiOQrR/dPfOOlc5ufffVY84eOHRx9z8JMbWliJKoPD5XKw7WYjY5U2ehQpZKkotLuJKLTkaLbpSzJSGSShBAkBQCBlASIyAGQc0SOwAgZdVPIrq92EyAsLc3U4qfOzr3//NXN7983O/K/AFCxP9YDQw7LizPsBz58aF8p5hwQQRKBlCTRRfw7a5QlEcz9Behhgl6Zy5ze30PfPXZ+yv31MMhfr46HksmWdG+ot6ez3KAw+OO2TjDEOEJeihi0MgErG92rr19tvXzl+gYVlSf2NojaFEdVvLHegRvrrZUrV1q/mGWyIzL4X+6/b+b0/HiFz03X41o1Hllf73Y7zbSbppRJBoAcOTIvPoTyE8IZ2/LEazbjxBHjJJGlqUzXNtKWQICZyUppZqqG73p4/pgE+HuNbrb55W9c/sr5y43kbvKIf+p7TrB//x+fLfZMvkEUOQB2LbQviQiAUFgrt4knsruQrL1Re949z7/ph0LW5CvYdn+fZx23uwWtlOt5AELzvEVfjcoMx16Cmk9qZYmcRdQaNPyxkjWfmq3W5lUwhgIAALac3JGlqfhHPnH0iamJSjWOGLQ6mWx2soQAiHNgaOz2gSCIYC1nNhu29lcRgFftV/mQyNibrEEf7IzSvlXGiAEBtTtp1m6x0kgtYseXR08+tzzy0W88X3r2xnq7I+TdlwyQaWH6xKHJkR/+8D1/5h0PTL93eqQUtRoptTpZZtxyUmWqo0yQkFIFdzAg4BFGpZhF9WoU1+qluFaPsVzjEDGCNBFw40ZXvnph88Z3X1v/xvPnN37ltUutL6ystS+tbXRa19c6K69eXEtD5Z+Br0Aicl1wkEm1Xx01A7KKBGlOioDkpVbx+aQhCWOcdR5PAJ91+lqJdy328k99aytS9uzRtoo9enxdeznVVY51e+uGSaHAEEHnqRLBTT0I0dVTpIwAqb6Odzaa6ddfOLfxwsRY9e9PjpYXlmaq9x/dP/Y9p49OPX54aXRqerLChkcRUpHxbivlzUYSN1pZ2mxD0slAZBllREjKIwYYMVLbPzgyIUmub6ZtzhD3D5fjA4v12skjEx8/vDT2f7x+ZeMcIi8EGwAAJBCiQ/cd21cZrsbzccwYIYKUQEQqA6PNVg6uklmwdRlzBi7z3uaQMIU4ybZR542/PW8JcHUBFYU6+jUmqOAqNww3NtS2BzJ7gPS4rUiCnjBjzjt/fxgxk4tgMBFFRMQYsThCFnGErCthbbNz4epKs4GMY1H+b+8jzdqatyFeWW/BZ3/rwq9fuNb+2HsvNv7i+x/d94P3HB0dnp6pYaXEKitEsL6ZtkgCqcwlSH5wjCdcaOpz1YOc7GvaoY0kZBy5JKLNzbSjZF4sjdZjeOrB2eOlEv7L0aHoL/3cZ8/99LXVuycSoFD+bw+KCIBdDV9QZN6SCVp7Npv8QgG0xxiZ7wp6xTzqcyy44FaHbsbUO4Ttrt8hk9vzvLDAFkCUIGVG73vs0MK+2aH7apUIU0HQ6UqRZpRFHDnjyJCkmidBHP8O+t/mnFfqjBABOANGBNTtiLTZSNnURBwtztaGlveNvHN8pPK/AWx0bBXLuwpK6P7Y08snHzoz8fFjy0M1kQhYWesmm23RlQQqLF2HrMcR8ijipXLMo1KJ8WqZ8XLMWMQ4AOeQSIDV1S5tbrSSlZX25rkLjRe++9L6zz3zwuovfPuVtRfOXW1mmam6gAicR8gZh0yEiYXmp6bx0vVr1uwoAUEAIwmavQacy/trTZIDnZlv9OvSY3dDCNV58BrkL8q/N5/NC4FQaVahCYJgq0SVfmRAxMt4bTWBqyvJJsD6JmNwaX6y/PV7Doz/yrmL7U+cPNr81NJC/cjEeHlkuB6V6hGyUinCiVJUGh3BOMkkdRMp24nIOlkmRCal/v0BkKEgkp1EpHwzYevNblypxXD88OipJ++f/8y9R2f+MQCs3017Y7dDvcJr1TIf5wxRlwwmBL2XFtCVMAfYhmLzq/TO1/9+6zsF78K++g0hFFucW2HgKKzBa9ADYc8nCQBSkxtjjMWcM0QOSULUbKVXm62kq9aHwgBwt0DRQoQXrjXEhWut85vN5MfTbrbRTBf+wOHlkcnRKoe5uVqlWk3i9WbabXVFKgQJiYCcIXM1UEEbr9QkVH3re5h/dNSK1G1ZhBwJKElFurrWzTJBtWSyXJ6ZqOBTZ+cOkoS/1mqKS1/4xqUvnr/c7NxNkQAF3hiiIo/aboVdgAUCcmM/t1ZEzW9s1n4CnaLafNQSozIp5koFOm+TdmvZBdRl2zcttTc0cJ0SmI1OxgvmejbD9pxtppKAqQ/tbgrerZUXFsHzoBmPrPFf6OdVlaNy31OBuw2MxShlRqePTI998Mn9H19eHD5SihG63QySRGZSksSIRVyF/5tK8doD5GxMKh0AeZEw2jpvpoLW9P0lF/Uc9LoBAlKJzCTIJJFpoylwfAyi8ZEyLs4PHZufHp4munzlbgwtlSTo3qMzY9/7ngPfu7w0PFupcrjW6MLqZtpKUpmyiHFEQIaApRKLqpWoVK/H0XA9ZuVqBDEHyDIJGxspXL3W6bx2uX31uXNrX3v5tdX/eOna5osrq53L11c6V6+udNavr3eBQID6tUtAcvB2C6X8AyiepuKPiFCS4UWgt32SdDbXoB6EdjeaP0CeKEie0KflQc/Dil4bzy9rlX0zLG1t0C38R0HrXbX8GI21wKlNto66yv9nXybnCkNgiMS3MgPnkdmogDoCZCBlCq9fS+jC1fVzJ5an/vlXvnPxZ0ZHKuNT47VDywuj7z+2OPLEkf1DhxZmqkMTo2XkHDHLBGu00mizzUSznabtTpYKQRKIdO56Bt2E0rX1bjoZQ3xsf33og08u/Pc3VpvPfvOFq/8BETGKSpjdzQkBNSnWK7xeLbERhqAqk5KOC/FS7Kj2aK9za7JpBI6kTd8Y0ql6ZzCAjRl5wCNiX7E3eQaCCgD6HyMWoCcHBGYtTzbw37hQa2+OEegKCDkTFwFJUt9QxBnjnKGUDDpdEK22uHzl2qbUSTP6P1+BPQkpM1UlACR89dsXb9x3bPpvvXZt8wuPn537Hx+9d/rho0tDpdkhzks3sHrtRgeaHZEICZKBtgCAJzPr9cBSa8BayTYhQABGCEjIGTBBSK1W1lnhiKWIl4drJXj8vrlDFY7/Ymos/ls/++vnfurcpUZhBCiwIxQRAHsIlrmgyTmGbq3M2cmJ3BUD0lb36TuH2+zb8pNgbWnVV41NJJ+FJP0K3FTFIn23gkh5ePfP1Q/ce2z8B5dma2MkCJqNVIqMBEezLisJ2MqbnhWKQsN9DwZSl3b/utJWKlkVqqrnLEkpbSci6yYZ1aoMp8bLYwcWRh5Z3jf9nYgz4ryEQux9xYXxCpIUMDtRg/c/uvDAvccmPjpUi/naZgJr691EZDIrl6JSfTiulMssiiPOKiWO5ZghjzgQAKw3M2g0u+LGWrt16Urz8rlLre989+XN/+ubL6z8ly98/bUrnMUoSerEXtqKgCUQWfcmvl+0/yIQA9DKg1ai1FtlRw3iPj0+Owi39CP3c6cOHHeYLnXrQaAlfyVAksnwWrqlYVLT9hxFMXIeIRG0vvvqagsAzxNl37jv6OJ/Pn14/OEzx8c/c+TA8JML09X5saFSdbgeRaWYsZF6zOs1zruZLKeZJCmAsgREty3ipJulq2vdFoGsLc0PxaePjE49fGb6jz90cuHXiGiN3fWVNdTXXynxajlmNQaqHqZeYJGM/ougQ+ntJR7N+AiV5bzgcPsYFtr7BxEDRqABJ37c/A+MA9777F9tTow4cs4RMyGh0xZZksgNf4QF7i4QCeI8RsY4EtHKlbXOz11dab+80ez+tWZ79r1H9g8NTYyVMI5ZbXUjLa1vZu00EVkmiRhDxhiisbQag5Sn93tM2liFdVNEjCIecQLKJMlGM+teEh3qjJRKcxMxe8fZmSUewV/eTOjyr37h4i9curopCiNAge0QeU7hArsIdmm0+ovOd+tlyked4cd68821vixoK5H6Tiu/jRF8cwKk9VZZt6nuxVOmjBkzGHjOTer16fYQuv3WoT8sHCNofcqlAUeQhESEzgBQUPddCR5VrX19aXboyPHl0ZPTYxXWbqWwuZElUpDkDJnyvJK3l1TB92KZ7ID9RF3yJ1MwD4zrNsdg9W0kEZGQottNSQjEqdGoevLw2Pe/eG7986+8fu0FxuK7gnJJSgBAmJ+q1x46M/UnTh8dP1qNOG6sdkW3kXWrEY9Hxsr18ZlqXKtFEKl6itDtCLixnsrzl1sbz53bePalc2v/9cKV9S9eW21dXt1IVq6udK+++NpK03hsACIAxkHccnJF7XNGYhEScjDmVVChVQyYcacaz44pUpAngB4PqVeBxbo4XQe2JfoeTzRcFsEWngbNfz1Llh2DUez9wZDuUYcAkDFigElmbdcPdDPi1sky03WbOa8hUQYAGSByJBLtpdmJzz9/4ca3p8bLs6ND8dTcRP34sQNjH7vnwOjZQ/uHZ6amSnyiGqNEQpECdFoZb2wk0fq6wPWNrLG2CjA+nI7W6xGcPjL+wJNnF37o3nvmf1rKbIPzMpo8BXcbiAgWpkfxHffPj1VLbIijBJISJEky+XYIvGr2mgnmVW8/gt4pLNq4hOY9GAuZKRLgjoElLbfLKtfA5vqxU8at9z2mAD0/vBEGf/J9EJp7k5Vd1Fmff+uDOrMnMmRRBIxHhFmWQbudJt2uWDF3ZAO3FRTYyxB6mxgixyvXWvSVb1z+5vW11p987oX1xz/wxMJffd8js8cnZ+tQrYmIoFVdW+u0kkQkjIDFiBEQqaBbQ4eEtjIAAFiiRBfGa6YVMIZIIJmQJJvNtAOSqBrJ6sQIwoNnpuagVP5nQ9XaX/iPn33lJ1+5tFIYAQpsiSICYFfDLnrMGABczL5di/Waa3z+oQC60yi2fLMdOLZuvmNPiNjJ2poPQLCljW3CKugdeIG7AlJkgIgwPzmG/933H390frpWr8QMbrQy0WqKLhEQZ8gACCTpLXkAkPcrbUc+nn4VkrK/TSW8wOYJJCBqd9Os1aLSUJXxk8sjD750buwjh5Ym/ykRJciqSLK9ZxdvxDIylCBkRr/voyefuP/M1LuXl0dLXDJIWsTGhrHKGWJpqMSjiEOzK6DVSmlzo5PeuNHdOH+p9ep3Xtn4pd/97o2ffu6V1ZdfvHA9Rcb1/h8Czjgicrg9SZHUL8mAGEfgHAitImPy/CFiD8UEjKw/NWHu78DBBobb7Rr3O+nSDvbl50H36EWHb/8MNwMhWrZDHlWRsTIiELx+bWMFQK4AAUyN1T5/+tDkfzx7cvqT9x0f/+EDS/Wj01O1kVo95vVSjKUIYXwsZpUy1MrlKMoEyEwQSSLcvzg88o6H5//U1ZX2swDwOSkTYLyKUuzdudQPPCojAEEpYrxejSeqZV6LGCCRAAIJEskp/p7CbJLrGV7Y6yP324dnb+dy65N4YCroR44DflnfpubgOxbCGAI7tQgAEZBHwJBJSLMU2p2kkyRZw7TMxN1XqaWAA5FaVxjjeH2tff6lFxvnm5vJpRKHn7z//rnD47UKjI1WoohjfbPRjZIuZZkgYXJgMoaMM8YM/eWzq+gSl2i2nhkwprLRZhmJZivrXLySynaXVWdnh9nj981NIZb+Zrcr1z/7Vfazq5ut5C37QgrsOtzt8XG7Fy5ltNubaVZKU+DZtfPsi2Zvn30heaH0/QOe+5jznaczvI6chmOUIvQbEHhJgMmuzgRg8hb0OMjMha4qcc/CjsZc+uaJIwV2FVCClJIevXf/xOL88MPD9RKTEqDVlmknlWkUs4gzZKQJ0jix7NYYtHEoqjuvaK9fLzuga8/yZoVpAPDzsKseEZCpHltdmW02BZ8ci/nhpaHJYwdHPjI2UvkpgPUEKHtLvqq3A3FUQYAMJkdi+MgTSw9+3+85/BePHZ8cr8yOALQlTAqOaVdGSSpho5XIK5fXm69c3Dj3ysWN37lweePXr6+0X19ZTy5evt557eLV1vr19bbxV4MEBA4MsttcBk7r+EzdhwHpPf+k/zERS74rx1xnWBQAWNY8KITYRVWZbnIaj5dTxfDyQKUPHKU5DckyTT+3AHix4KA9Uiqzga0FgBCnWUK3O7u+0Fm2eVRBEtKO6NpaEz77tcbF04dnfvJbL139jYnxytT0ZO34/PTwI0cWRx4+ujR8cHGuVh0br8LIKJaSjICBhDhGmJmt4NlTcOS5F6//wPLM8BcAICN5l8rBCFAq8bhejadqlbjOGYKUBFK6jXY2H3+gCxsehwEvC/s2FxiLvcto7qIIPDr3+yZwEVemmoq1/6OLIOjjCSCflk0EoyFda3h1c8RKKt6Ygi6AtAXPHSSdA4AxVUY5zQS1O2krSTPNlL00QwXuajDkIGQK1xsN+PzXL36x0Uk+/cSF1p958r65Dx1dGh6dna7yoTqvra4kyep62kozzBhHhsAAGDIdSYZO/FCmALtOoEST1orI4+eoglWaHdmlNYBSOatNTlTwgdNTk6zM/tm+pfr7P/9bF/82ALwQ8Spmd5kBtMD2KCIAdjXMgkXSrWy+9EfklG30Qousa2fHQWx59X8n7V2hHzs2T9Lo7Tg8sfP7BPsYEUAlrCpwNyNiCIf3T5affnjx6aXZ+hEGCM12Bp1MCgFAkdm33UNxRoCkHPX2nwG94nHot/JVQKNgIQBwRCYBKEkobTQlToyx6tRYzBbnasemxivTnPF1IfeuAUApz4Le+8i+kx9974G/+e4n9j01NVmHTktCYyWBzRsdudlM07WNbvP1S5uvvfjKymefefHG//nsq2vPffPFqxtx5GzXkkx+hfIbCPHfdsTgNCQGarOVjso3Efi5RCsu0th32ffCs51uj55utrqon5/fo2pnk8pd4+jVlAPEoI/bj/zvxqMych4jArSee01+E4BBmqW/dvrI7E+dPjrxwNnjU3/o5JGxd+6bH5obHyuXK2WOEUpgjEOtHsOh5WH28IMzn/rO8zO/0Pqa/OUr15t3Y2kNQASIOGPVSjRdKUcVxqzRSpXMDYxFnnHTXD+w434H9arv7Po3P14IOeiWt3O3HHgqr/APhi7jmuuLIUMEhExIShKRZJmxJBXOhQIKmc7Vw6MIL1xviNc/3/76q5fbP7ay0v6T73l04Y+eOjw2N1yLcXKClThj2GhmSScRqSCQQoBgSMgYMgyYM4BdUBAAUILZKiBBeex4BBEQUppgutmUbbzaQQBWnT04iu96cn6kWuE/fP5S69cXZidfFFJCxCtYRK0U8BERFRuZdiecB54AzC54fc54LbXshp7IB+Ss5kEPEFzbq9D4vCkwMqg/XmZrk703cPIri2UoX1gBRFkz8wJwP9u/eS49DiI08rdLX+2Ps0hxcfeBM45CCnr/YwcOPHhi4kcPzlVnQAhotjOZChLAdIpM1EZ3j2SctzakdavKkzcfginhPGY+XZuqFeTC+JT/mAFDIspSmbYJIU2hWh9iMDNZnjwwW7t3erT84rW1vauzZKJNJw8tlL73/Qd++J1PLr/n6LEp1mpJ+Pbz1zvffW71uVfPr3/5yo3Gb280O5dWVjuvXL3auPH61ea1Kysdcvoo196Xt2J/tzY1IjBlcPRcj0pKM1HzQS4Jc6VqSZaBAYBOok69jC/nzbRbRa3V1jNLkevP3M1t6HeEbUkVXSv90Wn3ek6YJzHWYsNG4+ity0thEjQiixGkBACpx8ZbaxvtL567uP7yV54Z3jc9UT+2MFd/x/752oOLU5Wlgwv1ycNjlQgnK/DI4/um0678Z1ip/Ojc1OivXLnRBLrNUSF3NHQ+oIgjj2M+HHHGEXQEgCl04lkllRxhZIde02foWw9upP+6Bd7kF9DDUGftFj9/fQ6likAwMNZ98OQECOcW5j37uRH1WBNMSmQzFQ1XtknZQM8DTW4MEZEBSQlCUiolpD2PX6AAAIgsI2QRkszgOy/e2CTK/um1lda3Hrtv7k89eHLqkWMHR2pLQ7V4fT2NL19vtxst0UmFFJwBi5WlSQnSNsKLkdoYoENSgINLVUTA1FqDKUkSgkSaCiFFBsAkQBwBAkGzlV69eOUGIcaIWPh7C4QoKGLXwl+g+8llTnDzD9mAvN61tE//NyHv9ZVh80IEWb2pv3k/r3T167P/vXWJcAgDW7e8qsAehdQhdAf3DZ05fWj0obmJcilNBTVbaSZBAuPEtfJvBVBy5nYjpeZ6xeBd/4mDPS0DNcwYW5GQoTWJQZpR1upKWcuIjQ3F5eP7hz72/NLwb11a2TjHeAXlHrXaT0/UJ8dGhw41My5fPteEV15eu/HF37r07377m9f+1+++uvLCc69d7frtOecoAQFZGd767yTPVwYA+77d9tpBZ5367v3dbhh9z+OAj3kNyXMLo3vqt4sASab21pyrag6XbjTpwtWNiwBwEQB+69DS7L89dmD40Knl4Q+cPjb2Q1ca3XsXl0aH61NDcPbehcVzl7p/9tkXG1+6fH39rkwIyBgwzlmFc8aBUNW426Hjh3J/t4an/O+8OVjTVnDhW/ET+TJOn5oDVoQyG7gQADB568ZXYLeBZKbtphF+58WVlcvX2j9//nLrW9fXu38pEeKTx/YPDw8NcZimciUuZbzRzLppJoQQUiijk9pyQob4jAShmDCRKVtEQLpepWRAGJWwNDbMK0M1hulqC16+1Mo+/9XXf/n5V278NmMlRARIs2ILQIEQRQ6AXQptx4Ze+7l76Z2pnjrtCXs5r5Nfk9e7gT2hfZc5bxOEciP0X/wD/T6v7KvKWZjLghpemP/sN1ShjF6eVOw5X+DuAUPnpZybGXp0aaE+MVyP4dK1NjXbWSJJEmMmBsDJfOQRdqDGD7KDeVY0B2tc06YEbaIHAFSl4q3HV1eQA0I1T1sdIdotwUarpejeI2NPv/b6xvuWF0Z/mqRMeFRHkTX3DCFHUQ2zrEVJKpLvvLTyb69ttF4gmSaXLm1+6aWX15555fXNq9fsnn4Atd+W26RLbxus5VJZHNWPZ4KPDLTkZuQ3cCzIekJdxUnLXXPcOaeHaENSX5rzjvk8HH0qRshRtVV3fN+tcTT1rAUEBIBp3rz1VsNk3wZQArZLmxXJl89feeHMkelr337lxm/O/s6lgzPTI/ffe2bu9x6bHd5XLUX1+en6fgB45m5S/okAkAEwhjyKWI1zlXDMJMt1hOZrGgq52kDQk69iB7p6QM+Blx7tSaX4+/TrrurJR0SmkgV514f0iD10HVJ8b0J07H0W7VCQJInUyxNz6JbKYRa4u0CUESLHa6tt+NUvvvLy4w8s/JULlzZ//ckHZv/kE2dm7l2crfHhkXLp+o1utLrW6bTbaYcIKOKSI0OGOjUAEAOSKrGW/geYTjkrBAkpQHKObKgWVWanKnG9xuGF85vpz3z2wk//ypfO/a1XL6yuEIm3f+0scEeiiADYK0ArdQKA8zjqBH+onf8e9IqMGJ7w6pN6TalnpXX3VX/yBgVzOu9PpT7yQo83woiavTzLF0lVmWo1YJe12n8eAqK9G0ZdoBcEABEvwX33LNZ+7NPH7hsZKTFiDFpdmXVTmQESMAZWEPYlUV95d2fMPOl3J1+kRe+oT7doZUxkZKxyuuogAnJkJJFabZE0NjI2Nsz50QOj8yePjn/qi9++9p9fvdS4JAXsKWSZygJ/ZbW5fvW3G7+42ez+/NXr656nl+vvPwbGI9v+7YWnmICpuKI+68MmAMlqUwNBgcbjtk/5Ycj6niF39oyz+mOgtQG4vGw5w3A+GaCzfvX5as2eKjMm/SnJ0tueBPBWYUL5EcsIAMBZCYVM1gBgDQC+AQA/98Enj/ybB45P/oDKeSflwf1z/NVzl/fYbBoMAkVbjCFEHMtchxn3GpLylnb/WO+nfpOx//lwHTfsloLjfez+Ienak2Frd40LdMzfecAFuoE/UQMBxzPoSSnt1krlnu159AIF+oJIUMSryFmEQmbnAOCnPvrOw19N2uIn3vXI/OMzMzU+PlJiHKGyigCdrkxJhfNLZBIRTIUABCKpTcuqfCARUpZRBkg4Ui/VpidK5UqVw+XrHfqN3778+Z//7Gt/5kvfOH8j4hwL5b/AIET5MtUFdgdIK+5IKKzaa7yKegVD0pWe9b63cOd/mP8Jc4t1eB+wPiu7L1Uddfe18nAoClC/Wr32bW7PIOSyEurNr8Y+EMgtnkBgkhqqAAWVY90fQ4G7A1FUxYhzWJiq4+nDY48cnK+fKJc4dFMB7URkaUZZHGHE0Thh0dKY8dSTUaB6MkI5fQgAPFLW84bMP54NwcuLQaYtuj4IwBgjZDfJsvUGdEdH4trMbD3avzh8emy4PAYgL+1VGn753JUMAPRmW/NlxXewt8KaGBGRPAelsbx6L8usBilV/jnt7LFee0MgvpsUXIi0JU2ypBrcwrwsg/SGBOT2PZt7mA9uQ7T2loJX5WDn39JbCSLn0ee8jFJmYCIDiOil+47N/tNaNS5vtEXjblL+AQBMNn5EiDiDMmdeUA25KgAAznBpv0x/gQcA90b2FRjR3M+7tes45wXwbqLWbwwuIlMCIC+ceoQeJi8kXTXAM5DZ/AP50aJr4n0VdksEA0QGzFbs0C9kCJyziDEW9FOgwFYwmfcNPU2OVp8VMvvjl1Zaf+yJswufOHlgbHJqospqVV5bXUuy9fVuu5OIBCQBjzBiJgslAy3uI0jJSEqURACVmOLZyXJlcrIMV2606Ze/ePELP/Nrr/2JL33j/A1ERM4LH2+BwSioY1dDGwHA6NPkXr6mbEHhpT0KOdj+rEJvhEfbXY8G5D5S3w8DZEdn3s+f75ET8gf8E+jULq1zoa2ZUuCughASiLr03oeX9z16auKPL8/VZkhIaLQEJakUtrSTNTz1MU2FjqBeF2uAsA+TdMtzSZnD4TWIumKcikZAAMxSmbYghW4moT5WhsmJ+vj81NA8EX2HMYZxFGOapQNHslvBoyoixiBlsguezdeuwSjMtqKKTp63ra7cy+/68NSgkfVAOr7sN+9nANjyjmHz3Geb3nAn199J8MP7kZWR8RJKkay9jUN6m6GJkQiApHC+dwCn2lpZwTNL9qIney+5T4MwQFIAGz2TNy7kG5JS4HtEFfRJn/KX5LoKz1tbl+3VmWNNNAEgADL1RplJkDgDjCMWR5wXFYYK3DSIiBgr4cpGB37xN1/7xonD03/m6o3kd9pPLP25e4+PL43WY5wcZxEiVjcaXdbpykRKkEREnAMHBsgYIEmgTIIgiVStxOWxUawOD5eg0RbwlW9df/k//OprP/aLv/nKdxAZMlaCLLt7tjwVuHlEu2VxLzAYRCQotIBbh76J/7dLPxnFxnMN+X3Zd27BH0gh2v3uX2kEhN5r+gsLfv+9JgPMCRrbmgpyxo8CdxdU2bzDS0OP3n984p1zU9Vytytgs5FmQpDkDBkz7iZfBvXIDVGXyfJ6HVguMC/Eam8qWg+WnneEoCIMfA+bKsLF9GbxDAgyIUUnyaSUJTY5UqmePDTx6YdPzP/uyFBpZaOxN5NPi12emGhLFQgBoMcD6Z/XhDXIqGrQc15HqxiPaC5SwH4gzzt6Myq9rVjhX7TNGN9mzE1M4eWV62566coQyCtqiu/RRJo7gZSQZYISIaQ0VXJM6orAKIDQk4jPL3NqzAQYut8dtlum+8KZv4wh30oejlU7aiTjuxggmRiHxcDBBAMfZO3QfwgEEUkC4JxhqcQrccRrW/dboEB/SJlQzEuIyBCAb3Jg/2qzlV2+dKP9P569Z/KBw/uHaosLtWi9waMr1zp8c1O0MkFCAhCPVb42KaUUicyiiPPJyVp9eqrEmqmA3/7WjUu/+OsXfvyrz1x9VkUbcLib8p0UuDVE/fZZF7jzoZY/m4FK6gRUYB2QiKgN6LYilDYS6Gg3u4lA99jfY49kQqP1ymqdX56N3YiLCKG7MzDd54RJb/1VSpc500eB9+5lujSyL5J/R/MF9JNKCuxlqL3JEvbPjkY/9v0n3n1waWiyXovh8vWWbDTTBAiIc8ZVyL0B9b41djJCACLySk4Gf8DI0eC7qPI07jpVZ8kcVsoJMVJOYxUJIImo00lEq8HZSDXiDxybfP+Fy81fX2m2f3Z9M21FvIxZsai/TbA/uPoJyVeryRl9TGvLXNFafYKSZehzXnLn/V6sgq9fXog+gEdt/Vic68RT3FxjlwxNGwjMwPx8L5qpq11VFG/3Db2d8JV/H3ez4m/oR0gSmZCtTEgppat8oguMqaZmVbW0lP/aHHHoxL3uOFl6773St7DaEH+nxIciQ8gvrf1ft0HCYEqEo9Od5tIJ5adGkG6IAOy+SSST0BOsbQQAMkFSEEE55lCtROVSzIbsHaMhpKxx99JXgZtGKhLN/sv4zEtXmnNTYz/7+uXmN69db//4u7PZHzh+eGR4eDgCIUplhBQaTdERRCQlkJAkICMRc+BDNaiMjXImOcC3nltf+/nPnvvz//UrF3/++loHANjdVe60wC2DFQrSbgdx8lcsTxGxuZxsyl/1QqtR++fM+oluofbukldvemMHwiO+ccHq+jndPK/q9/SJdrx9zvn96OdELa8iFFsA7jpIICKam6pOLszVHhwfLzPgCM22zNpdFV/OGTKXHT1M2wcAbs+zOrxNoayQIgm1KQ40xep8f45+jbErP0OVGM4QkCFgp5OlGxtdWeEIx5dHl+67Z+Iz48OVIQAJQma37+sqcJOwlhtpMuUH9p1c/lHHbf2d1Z5eHbLknEajqcg5QfuNZsAJ9BhuvkcfvRwczHhR0aQx6noJGra6c4E7DIbXSCLIBHWFro9qqLCXQsCRRY48DC32JcfcQbsL0et5J1TTjyL99JXhvXwjWLiJBoFUUmKT5qDfzb155yUdRFNN2NgtpFB5AOOYQa3GK+UyG7UdyCLBcIFbA1GXEMt45UYT/vMXX3zpP/3GK3/53/7iC//zr3zhwrNXrnXk1FgZD+yrVaYno6FqGUsypazTlO0sAzEyEtVmZko1gQK+89Ja67Nfev1fff7rF3/mpdc3Egl0B+fQKXCnISoMALsVobfJ7WAzHh7rTiIAP2GV5/S3p0GH9fV6pQan/8+Pw6g06H0K7hI4lpwJAoOr3TGznxrtcZehzZ51Jg7jVVV3Kfbp3UWIeYycMTg4NxK/++F99++brR9kHKHdldBJZJYJEHGMkc6BDdbfBd4ssiSmawOEztbQ828OeHNJX4TWbaXNBwjGO+w60SUItfKvPHEqcQWDJJHZ5mbSHa3F1dmpMj+0OHRmbrI+icivEt1dOczuTPgau69EeWVYAiZKjtAoR0Q+Lfmfe7SgPDf1vPr9rgewBIzgxRWQa5snZ1PpXF2HCL4RYICxoMCdDRt3RASZlG1hSuKYrLnKamnWeqKgCkU/8762AlilmsKmvW559SeX3NIxTa/kiteRMZk5IwLl+tmCGi3f9mWJULLpN0Y7RfUBhoBIQCKTUgqCKEao1aK4WmGTk6NV9SUU/LjAGwBRlxhWETFGovTiwuTQT7x0buOLrUb2T9772PzjU5NlNj4SRUgAJIUUgolymZXHJ8rlSg3hpQubnf/ymxd/+te+eP5vf+P5yxuIRcb/AjeHyHNPFNhF8BZNMWg5RCuUAhiBNVB6fPgy6bay3q0Jg3ax1yGE+XH0elz7+51sYgN7EvXC38+dVpD3XockAiEFfeCR/cuPnpz+I/tnhiZFStBoZZRmJFB518MSToMIPSfTuoN93Fy9l7qc6nqPjL+ldnD4KgAyZEBImRCi3RHQTUVleJTh7ExtfHnfyGMLk/XvXri2LnlURlEk9nmbQT3VUwc06/FY9jMe9Dea3hrnUgTYuwM6z0nVxpPwJvlRuIhoH4UhYPdAGwAkSCFkVwgpjJLvRaGQsav3J9etfu8cX9QMELDXNLYtBhB7yKb1vDHbZ0x5PnsfNd5+9Ep9WDjk2pkcLWiqCgOAECCFAMk5Y5VKxCslNsmZ3VS5/XMVKLAFJLUp4iUTZEU//xsvf+Pj7z70369sJn/28funf8+RhfrIxFglqtRgqEVQr8SM1aoIN1aa8mvfvP7lz3359b/3m18/fxGRocpWUaDAzlEkAdzVMHZ5ZIGFm0gtYoTAdE5nU/PcfdCCgPNOqYS7xvVpS/BQbhEOjnrhcyEdBQo7oI2pU5Z9dP33TdpnXQf2U48g63nPrHeC7D0K0/xdAhbVkYhgbmIEf/ADh5568MTUO+fHK6VuS0BjM82IiEz9a1TU5hWyNC58U8Ddh2cqw9xhgFCb9zfAWuHX3SVQxwjIKnw6rbuZX4iIJBFTQVm7K2U3k3xkuFQ6dXji+194Zf2/To8NvSqLsNO3CW7jFHoZ/y1bI3Bk5EgBwPvtTcSHPZwrj0bkn/R4rPoQtM11rf5YrQ4Cltpj9wrehSZhtc/a0bMadVgwtsDuAQGAVPbRVEpS3EOXygl+SW9XoP/XkpjWeW2pYfIpAg1r82QFk1vCWfoH2ffzOQAcWbvolV7jmJ585LYIupbWDOuNv/e+qr2xfihWbKq4ICIKCTLLZJZlJAEQSjHDSiWarMQRB+gW+7EK3BZkNi8AR63If+30kdkfuXS19WMffmLxfzpxdGJ2fLKKk8MxQirg0uub9FvfuPHM57966W8888L1F03SvwIFbhbFFoBdCn9XvFnyzBEk42PfehdzYMD3zfR5B/pA19QWZnUzGCsROMnCXeWt0kQAiHbbnnfWNfGe2alsvv3fqF4FTd8tIKGy49eqZVzaN/Le/UsjY7VqDOtXm6LdTLsgrQEA+7ts3GaSHfHCLZpgn7MeaZsDQTGAnsaoRtTuyKzRTHmtxNmpw+MPn3u98YOvXW78g+vrnY4ub1ZYbt9SWF7FrN3I/MkrOOTzO/d+ewoLOV+/tjl1PbzvNv1vRzB+rgLUAdd6ZpDfqsBugvq9JICQwJz3HFziikF5Jvzrbw2GoWlKul3Lcii3uGN9G/qN+p0L4VvviICyjESWSimFhIgzqFXLk8P1agmvdzKzo6JAgdsBIkFRZKIBsBUh/aTIqJ0x9pcfGSnPjZQjaDYTeOaF1dd/5YsX/+JXn7n6W1dW2oSMgRRF0r8CN4+IcGv2X+DOBJk8d2qN5S7SX7mgkLBvcanAq6QOBI1cZamczBec79VgrBfTHLCGf9RrvycEhKn7vfbakUbhYNyeQbRjU+1MYIMCIYIEJFJZrHQfBXnvbWTAIYK5ydr49HTtWHW4hAIIWp0s7XZFigwROXIA5bUK6Z5sBIrbkuJvmTEkh568icHl1lPmXWXoN2+eIrThqZ6xDXXQqrqIIaIAgE5XppsbKR8fKUeH9g2Nnz428akvf/vav/nua2sXqIgCeBtgPYsMGDKy+6itGk56/zyA1HTiU5LHhzD/xuZvDZki2ggolUdCJVez0clgwp1N+AGaawz79+jT5QbM8UNN3y6JCiEiIUMTRWbug6n3NAV2ARBVfL8E4gJQCgCSwICDUf+ZCQbQWS2d8dzxs9C6Zc4rnT5glc4LYRqQM8r77dAUxiAjWmB/62nOlO8qD4VRiQFFGpnByClGlDAD6ysOmP5U/mBl1CNVc02SzFIpsjQDBgQjQ5WZ6cmh0W+/cq2pKs8UKHD7kGUJMVZGogR+94Wra0f3T/4UK7GhuMz/3IH17vi5i5trn/vKpX/8G1+//CvPn1vtInIkUez7L3BrKLYA7FI46Y64fUe94XS+N8mewl7Zc6AlHQcc0237hvV5gmfvaXTGARcU4I5h73Hf/+9704KbaOEDfck7UMEK7DVEPEYiSQdmx6J7Dg4/MjdVXWQMoN3NoJOITEgpI84jzNMbhB98crNC5XYOqy1oPNTwdhaPYgRWBEDGkCWpzBqNrDtcL0cTYyW2f6F+cH66doQoOV8Inm8fjBlggHfeU0l8ZSWXShV7moTYwnHp8/A+1qSetj2G3i2RU7Dyh3feUYE7AFnWIc4jFEKKJBXNNKOUCABtjRzyNOP+CHapbPXT4xYMc6vkJ7bzm0Do0dim4XZMOjdnjJ8CAUCXUhaSZJZJYAxhfLg0PT9dP7IwPXaJM4CIlzArorEK3EZI2dX2KIYAvPPZr178yU4iV+cmqmcvX2//9leeufpzr1zcTIp9/wXeKKJgM1eB3QOzj1/VpEqVN1ybBVAXJQNwwiciBG73XGbevDTp5AKtans1fF3iAL37juy7cHgATjAwzn+j0bsqafou6Kz31oigam2TPmZDtU3+AM+ji2jKZvmiNkKPx6vAnoHQa9+JI6OnHjo18UeWpisTMhXQamWUZlKQJVdDZ6h1G7LupHBbSQhD4QqeZUD/VXRpaln7e/lNe0+h8oxzOZEbfc8WU1uwUQgQ7S6l3UTK0RFgk+Px0IH5+juPLs1+PsJIcFZGIYtkgG8dDKXoPceObxGgTQsA2v9u2Z8pDAlgvK4ahhT1e9U4JIzQIOWZFxRPVVzS6F22HXlHvbwFZrxozwB5x8HwdY+ibGnVwoq6a4EIkGQya7eza51u1paSgHEExgiVnGBjBvUVvjtf/wUAReYAfpSAIx4CQM9oRHYm2HM+AjEkuKfpTcsmXgSMWsr1GY/nmux+Rl7xqxeFfeaNEHmSDu+lZjQgMsYkICSphHKJwfRoafzQfO3J5ybK3754be0GY6VibhR4U0AkCbGEX/v2xRtLc+M/WSnxf91JZHr+8opELGPE47d7iAV2OYp66bsaBAAoAMCPuNv2Chc8kDtxC+rEVrWqg3bbD22LVs7f3ztMvYfbKVcqtrHAngbnVQQQMDs5jPcsjz9x38nJp2bGy6WknVKzkaaSgJAhC12vYLSwwDHaj/QxLOAO+fbbUrSzz20/rfQksqI3U0XYMkGikwiRCgHDNR4fXRp+3/GDI0dT2SVZlKB6i2F/9ZvgLbfKVGEgae2st96L82vDdv1YBYoACifB7kaayrTVSVc73bRJUhJjAIxtt/ezz0++1QV9GOktUv/2eNM6Dvk7MvWfJKJuIiQQwcxYPHR4aegD81PVWYBiahR4c0GUEGIZL1zZpBfPryUXrjSIYQWJupQW1YAKvEGwwri/O2Ez7CqXI1N+Q/C9SYRmC5zRZlDrJKRq/ionu/PiG+u++myiC7SZwSr6Rqsx/nxd59zcw3O2WkeBNyywNyfP+6T7MhmoTd86UzGaSgFBcXay13iuB9Mdd58LHrkXIaUAAISxoXJlef/oh5b3j47XayVotjLRbGVdIiSGpgSGvshndYYofdIiACRSL0vu6HJSADhPvkkDb33C3i2s8u88/+EccrEwNqs26rnohbEQECVJJjrtDOpljieWR06fPTHxmQfumZlEJEAWF8z7LQUBAUoy/nMbhaVZn32h9U6q3xgdvXk0Z6y2lu/5bVBTFpFm7SGNOd5udHQVJUBeB867So62zGANnzdEaToBGyKjXK4ev3Z3L7BbQISQZpJa7Wyt08makqSOAFDM0SytpH9u8F9A7q3hczZysHe99pdbR5Ngj9uuwQsuQE23Ae2GFwQVfwG8yQaaX7oz1r7rBq7hMVpzD9TRkWTnBZkQAM2FgTNkRETtTpZlqYCJ0VJ8eGn45L7Z+j1mRDwaLiZFgTcNRF3iPALECBiPQVKnEGoL3BYUntJdCwT186EMJUPXgnKvAHap63/tjmE737oDwgHj6LmEeo7ZZ6BcHzYJN7poQGXZEOHVBfYaVIIrSftmh6b3zdbvGRstgwSAzbZI2wklgGovPUDOC5+XMQfeACx9bTctgr7z9/El3UHX5eMKEIAxZIwj76ZSbDZSwRDh4L6h0VNHxz48O1WbVbReVKJ663AbZHz7M++MJ+3EfPlmah4YxMoUOs7uBMG1lQa1O9TopNQQQMA4ADK/MG8/DFiEB1FlHwGj35Hbshrfcic7mU3WgwIMADkDBkDQ7mRZpytkvRrBwkx1fHKiesq0k6KIxirw5iLLOiRlh0TWLATaArcNrFCQdifIeh8BCFSpZrc11PNYgnVGkfWq6+2q1sNksuqDpx8ZhdqZ6cF5gbxxGMt9sAfBjQKNh8k4lIzLwVjgrRPKEw88D0TOk2Dt88p9ATaCwY3BF2pum8hR4A4CsjJKmdKJQzPV00cnfs/ibG2eI0CjI6DZoSQRIAARGUO105VMugnrsQUVIYPa209gw2VMOL7JKGk8/YZkLTnr6/TcIkfIYCwMzqel56rnhQV3LYCJOjDkD8rzxDiyJJPZeiPrJinB5HgFD+0fObxvbugeIpX5l/NyoZm9JTBueVVS0kRDuUrlOTuox5ucpxS8nAC++Yes313TJrgM/66l480mKkX7ZHNGJvIspXY4figKgY10CY1XXnSWvtj4ewGxsDbtYjTbstHqyDVBQMi0AVX/3n60iotKAb0HX3M6m/E/dOW7tRvArf2a95n13VuXbSQiutbub8jK/OlgDanmgxMrnIDgzS00z6MbuTgt087MMfMsqMQjQC16ECEScAaMCKndkd1mR2TAEMZGy/HsZO3+ew7NlwAiACiqshQoUGD3oYgA2AvYwiifPzXQpTnQgb8DBXrLJk6R3zJKQHsX/MSAO4Xp0Rob/DKABfYe9P73YwfGjp09PvmZufFyPemk0GgkIskoBdDyHDMCqk3QFnbjBQf0UOZNR8TkZlsQAbAdXEOlrAEwBOQMmZAkW23RaXeljCIGs5PV2uF9ox88eXC2TEQkiyTAbyEQEIDdMRYXY9gNSGAr5n5zI/eUrzvmkQvcLNRPt9HKmo22uJpmRIgITCUB8GpK9r/O4ebWZc8cBT08cSDebl5m0yXrsUhAVJsbE0Gi3ZVZkggoxQiLM/Xj9yyNHCPqEr9zOEKBAgUK7BgF69qlQG3tRiDmZ8dX3iEdCO8c7mQ8Pp6/yXgAwJaw1h4qImO9N8fdHlInShovkfbk+xZ2XyZ1zn7nwXI+Am2498ZkvFumljo674AJXrDbCUw1AFW7GqxEUyQB3LPgvIQAEvbPT7BTh8Y+et+xsfunhkus00qh3UpTJOW1QbPx2v7xpE+t1FDgdvI8XNYj723sDqJMHKXbnbEuaAVclIH77PZzu7nm7FXaI2Y/ADAgYEAAEijNZNbqiKzblTBai/G+I2Pvf/TU9DuP7puOECPgrFqw8Tcd7gcLyCZfZcTyOz8WS/Nq/RtbTmkiomxwgQkgMTxV/2dDuMJaK34KgnycQG9Ml36nwxfsWfKH7XF3E63gcgBErv8CuwbIgbEyrjeSZKOZvJamUjBE4JwhY8zT/jVTtOEt1l8PjrY8mtSfnf3JHc/LCMrCSh59g0dGhv5NZIDzzrvbGnnAEyTMeMEz/HsvMklVrRVLX2PnsOnGDUr1ZaIWwEUtIIAkkElGotnOCAng8L6hg0+cmf6j77jvwHQm2sRZpZgYBQoU2FUoFKU9BbtA+v8Bs+8GWNi39eC/wTHlhFP/nb8jwLuE8lfai/rA9uX+4W9w0AXuUEgpAQBhfKRSPbg0/PT+heF6uRRBsyWybkekjAOLOHBU6pVTegLVCSzR9FKmxoAtL/1ghN2BoTi2z/B0XvjuazTT6CQiW9tIiAHA8f0jS4+dnvoTC9P1CSIAWeQCeMuAQCx3ICSbvEN+q76M0SiPbcgo33RnbUMKzw26b9Odz4ACdy4QiCS8fvkKNdvpFZFJyRCBM4YMURtKd4I8JWxPGdTn3c3dI4+dDHXrPnYaB2PdKwCESMgZcJIgNxtZ1kkELMxUaw+dnvzYseXhxwAApAo8K1CgQIFdA4ZFeN/uRL9fDY0tngCRtL/c2csBwFMsTHZd31bvPADWE5/LsqsjDGxn1nbuW9Zd0gGw1gjlsge719B0aUZgPbWkC6N7ngDvbhQIsaoDsm60m5CcC+xaEAlamhs6sG9++NjQaAUyQmi0RdpNKUO9d141BBdhQibaRdGUc0R50SiAA7xU/QwEEDhY/azYflvfi2aO91CpGRvoXATGLUYIjAHjEYuSVGarG0mSpBIWZmrx6WNjjy/O1o5xRACQEPEiCuDNh2FYJuJIH0XnzXfvAZz/3/lRFcmYRdezQvVYOn0vJWga8227zpuvs7mA5ZA6vER5QXXOfx3R5d9CsXW9CdyEE7hba3aMQYn3gr/uLoisTaBz4ra7yVompFTZ7QEYAzS/P9k98+Bvs/eqongHfWq2m6jIevl9ecLKFKZjm18AXIoV6Efb4K4L5ok/X/R8s327464aAARWNitBeGMBAAhDuMi2RETkgBhz5EREmy3RbbalGBku49FDw/PLB0Y+srQwEQEQICsVPLhAgQK7BkUEwF6BXsgYUmjT9xWam8ItXdTTw3a9b9XGruc79VEodygByCIt7x4E5zESZXTm0Ez91KGxj85O1iYkIDQ7EjoJZZkEyXTyP2WsImcAcMqNpSefrO4EtcaOAW1RTWAIGEXIhSS50Ug7zbaQ5SqHhbna2P6F+pNTY2WIGIKQRdqLNx/UmzS3hzftzDPaP8Qp32Ab9GWiW3XoK0K9EQFBN/hGuX+BOwcELCpjmmRNIaREAIgYImcqoaW3A+8msDV1hCbP24VbiQC4Nc7uj50hYMSRIwB0ujJpdERKCDAxXmIH9w09cnDfyAyRJCySARYoUGAXgSnvaYFdB5sln4BIZUVDYH7GabN5GUyt6SC7OZjau2aJ9PrzlCV33vdf+gu8+uT2SoPKFeBZIazhPnDou6gB41Ww2/tMC+u1UtZ5f7+hzREALmLAjcH3dBXkvRcQRVWUUsDcZJ09cHz8sUfPTPz+uYlyNelk0GhmIk0pAyJixrtEZou/iVDJ92g8WsZDpeAnlCaCnogAV8kinCC+imVqsoNJMmD7wOBldxnYaeC8bIpqpUoGiIAkibpd0W12siwlgpGxcnTs4Oj3nDo0tm98qAxY5L1804GAEhGZifYAnW/FBgaA793P7452kSi2dT4ZhL7S8D0/dkTlSwmTu/gqvY2G8jy4oGkKA+arXmYYZKvCmHUBdFGMgHbR3angp7sRJCQkSdZJkiwFQRBzhFKEnDNkfjUAW083TNXvaBUAvIMhTyMvctDbw+93BRDwSZNexYkWnmXM8uB8BItjk1pmMJE36G6g39jcRmDmEYDL/K+jFjQDN1MxeCwbIQAACJgJEt2OSDudDEoM4djSyJHHz8z8vgdOzE1KmRHnUWE3K1CgwK4AK+z8uxkEAMQRkSMyYMis+Bno8xa9v/VOnU3bD8VoM+Y+GC74OW+VbxTYFjt1JBglq6DpPQchMgAgGB0uD506NvFDp45OHBmpcdzc6FCjkSRAQBwBbZK9QK0HCGjiLSaPW7udZ3ZTz0REQJ1EZuvNDJAxOHpw9OSjZ6Z+eH66NkogAVkhfL75QGDaCOBZaryzvb93/jPlXr238JWtPHJX7ZSB97TzRur0PLRtey6jeAd3KXBHQmnXaSLSTifrpqkEjgjlmEdcb5fydOYd0BTmXoNbBX17uCW5Y0dLe7/Zdgv3RcCeWyEhMmBZRmJ9Pck6LQGLM0NDT52d/bFTRyfOAgBIKSCOitKsBQoUuPPBCAttaVfCVAFABMYw5iqrj/NS6s15prAtIdgSvtDjKe+3mBsrvIkUyEUGmD2m/TxOtgcM72DlWvQ8pfn7WwsBBWEDpmZ7UO83rD2AgICMqW17wfdUYPdD7eoYH6nFBxbHH12YG4o5Q9jY6HTb7SRhSDb035WcIOextxYnCD32fqZ/j1ZMYEpPRADo4zYSwL/Ao10AR8r29no/tqHjXCSAX6rd1jHUOTcQCBkCSxKZra+nmRQAh5eGxx+9d+JHDi4OH2YMwZRHLPBmwHjnVd6cYO8yeXF0/rZl8FgVmVN+1gkvN6vvpbS0losmsNEqJt9En8oS5GvxNgDM08bMYNzcsMFiGuhCyEDtqgIigjSO4kJW2JVgAEDQTUR7s5GttTsSkCGUSoxxjpwMAWgEBipvudW5fmxKn6AB+QQYEKKjb0uHPmW7Ptx9cylbPa0dmU57kePnrg+/upCTKXy5BMylSo5RmyZ9Xq3mIpnKLKYqAiJhxIETAW1sZN2NRibHR8t434mJg2eOjX3m8OJIHQAgE0VCwAIFCtz56N3TWGBXIe9rl2ZNxHCVtcu7k+tuC9za3Guep4Ef+qGPbGkUKXItsE9HJEGC1CKKWrC93BaFzLoXwBgAEdHi3MiRman6XLkcQzeR0GxlSZaJjHPgnAMnJE0KfQjO2+GyI7ytpOOpcQSETOcCECQ2NrJ2py1oYjTGo4dGDi4vDT8msowQABgvylG9mUAEjlZh2Bkh5fdYb+8/3WEU0xth4rkog17PqGO9dBvXiwJvHWbGp1yIBwAkqWw3WmK91ZUEiBDFnHHO8HbKA/2wLSXfUjjAbbv7Npej/Q4RECKdN6HVybobjaxLQDAzWcYzR8feff+xyQfHhysAAMCKKIACBQrc4WD9FKoCuwDO2ygkkZCSSNr9oQDoCj6bLW/K4YO2spj2cpoa5SrU2Knz4f5lZ7xXnfV6nvReUw3yBcwgTAAgv+IHjgQAz6ph/AEmoy/2kZ615V/ql5JW9YZohCLP5e4HYxEKIensyX0jp49OfHpusjIKUkKnIyhNISUCYqhqWgEiamemiwoJIkX0hMi59AOy8iJc7CZoBJePAiivPzkvr51g1jvskbv2+Fvvk8snkJ9r4MZKgACMMcYi5JKIWp2022qlKWMI0xOV0uGl0Q8+eGJ+TBKZdCAFbju8TOianqTzdDqOqjfnh+zPEIVh27oPY5i1G5XVy9luQ38oaq9q4KEFz5sJvjMWvYoUbl0g3YF9Co8uzRE9dTS/RwBkCMiSNEs9t26BOx1XV6/rxVz9vt1Edjca4mqzIwWBigBgnDHSVSRIMz+VH0gFhJiCFqoN2FgRUxoijPIz/E0v4JYG9bzJ5QYwhOhRuDvuvWyAgvkIkIsyQO8/ky9A8/Hcf7adm6M2YNLkP/AjDW1ohH4Otc4QCpKyk2RZs5EAJ4DTyxMLH37ngb/2+H3zJ4gkkShKsxYocCeDFVU7Cu1o98L5w0lSKqUkKQlsSTxrH3AKiD3qCaE79DX1tFPKTY8j6aZGv+3N0B/vFleSp/KphbvQgvYQiAgWpkfY/fdMPP3APeMfm6jzqN1KoNXKMiIGZku2li2DbBQB5fZGgm4BG/8J/Whuy3lzs8uKMUJYBRHAiq7GNsBcdQMhpGh3s6zZToFzBoeXRu8/e3zqXYcXx8sIBMgK79Pth9XmBZEzlQ5kff6JnTLZLTrC4LNj6H37HTCofERWmHS1f1wCGutGny3RBXYHGFO5gdod2VhZT15Zb6QdQQRRxIBzZJqaPPLo/1N7MSFbNQswuEnudjshL3/CbTentjlvKX3gRDbfin9DBsraB8g4cCGlXFnrJOtrXZgdr7B3Pbzw1NMP7/vxM0cWKkSCEIucLAUK3KmQMrnrvd+Mbl0yKfA2ItSMfRu88esDeDEBZD07PXvt1KLmW9MB/DXRujaVd0Bb9V0OAG+/nmdxdxEEqm+778Dbm5C31gdGBYAeK34o95r9s7onu6JL7/vYUkQvsAvAGEcACWND5erJQyOfOrk8tH+owrCxmchWO1ObLRFREoA0dKIOqQ4s+ZKjG4/YTBRLkNMCPA9pMBN6CdVmpzbeWfRu6itvnns2oF1Cd32OVE0Qj4k4Z0TAkJAhYpJJsdFIJRLAsf3D84/fP/unDy+NHpAyI6CiIsCbAW1glKTDrdTPafipyyJhvZlehRNfYTeUYWjH6ip5pcWSkKZGfT8M6E6dN3Rtc1cE/3nmYjMGk63d3siH8eSqHBRBAZZCXth1EFmHEAE2Wmn79WutL15eaa90MwlRzIBzRONeR49vuZ3x+rMxeZnqF9aCpPIQmQgBRWKKpm2OicBL4PFLMNUowhgANx+0zGGCGb28KyrUyzDrnDGMfJkBg1dQrQhMQAGZHq1kAuZf+7xW1ABEQM4ZI0DYbKbd1Y1uAkiwf6EePXhq6gMPnZx5+vC+yZizwr9WoECBOxcFh9qlyIthgShnJMXcEme9o96mVD+Ebyv0VaX7Sq0DBmsF4XyvYOTX8CHy7qotRqkXZhtiiwjcO7v12Arc0SCSwBiD6YnK5PK++oNzU5UYEWCzkSbdrkiRqUJmgkCScZgHXv4BtDOAZMl/56xWPRf3HB00DQbS9YBwBN8xpiPHrdYIAIwBiyKMpCS52ciSJJE0P1WLztwzfvbQ/tGHVSsJPBoqNLXbCmNQ0kYAvTHe9xP20MNOuty2Xf9GuNWVA85YIwDAQN7v+vXuW7DQXQ8EgJcv3EjPXWl+8/Xr7VfbiaQoYhCxntp5oJR0sKXv7LGeXj3F27EolyEwnyjVH0y/vnosoLm2oXEszOUy0HjWH5R79Y4p7DAwpyECZ4whQ+ymMt1oJt2VjS5lQsLy4tDUux6e/Qv3HZ86k4mEEDkyLPKyFChQ4M4Dy7HRArsENns+oVQvCDI5gwmIV/qDSx6trgZP+c55peDmgj3J/Qm8TvlbeF5TfwREACC1KN3jCssvws7LYG5g7PnWr4oMETFyAyzW3t0MhghToxU4uG/o1MJsfV+tFkM3I2i0syQVIuMMGGOg618wUGIZQ0siBpZwDAYpVuRtx/bO5+tgW88Qus8SAKQ3N30vcB9NH0EGKlh+e6yXHNt5wxgi58ClJGq1sqTTIVmpxjA/V68vLgw/vbw0FQMgyCIT9ZsCApASTIyF/mmIHGlYz6j65Bt5POrpY0LC8K3nuOwFBo3CnpzW1i+82Ua1GKaMXjQWUO+4vKiCArsZytdz4Vr7/KUbnW+3U5KcM+CcudQm+SQk4B3TQgJpu6glIX2tToXh2fkd8SGBDsyjQNsm718ACCur+OKAawAAmPPg+3ELPrkb/gvBy8/qn3OOhC/zXGZeoOvZzi9tnE1SylbWku76ekpT42X2+NnpRx+/f/Z/OHN0rq7ukdzcT1WgQIE7Gn/o9z5qnecxr+7a5ZHt2pHf5QjT9tqkPUAkwebAM8KgEuKsEcCd2an/H5yrS791Uc9GoAwFR2ugJ7BSrDECeIHawarbu4i75+sVQe0K7cneXrLA4NoCuxGMcRRS0tH9o0unDk/8wMRYtZYIhGZHym4mM0lEjBFjjBgiAENERLXfNadtDYA76SfDBACPJtFr7Vu7XNwpOTo2LqLeG3sKV3ADn/BzcOGqOoGbyXTIlBScpJS2ulIkqYRKheOB+frZew6OLBNlZMomFridQAA0hciCo31MloONTVuSZL+O+xyk3A7+7Xhmj7nBkqLfLm8xI82z0bNj7HC9KHCHAQGxjN989nzj2mr3W51ECoYMODM1LcLSey6RSp6Xeb+/l3myT9W/8IN/mScT+OPLXxJkBs71o3iiuSn2mwA5WHlhxyKB//j9DGoIAFHEOCLDzYborKwmXSkIluZr0cP3Tn3okTMzH1iYGlZtkReCSIECuxyHD8zgo2eXo69987I1AKSivWsXxaIM4G6Fv3kD3e9o/D8m1b8faGzt8YSUz/rfSwa+ad/zDvWa5VWvei8/g3Apd3WEc6Kx78QyxyjXeTgECPb6oRNQTOYDdb+iaNVeQBxVkIhg/+xIdP+xqXc8cGzyfeND1ajdJmh3pFAlnyWqF2kZzfcLAfh+zbwc6zKwQ46efaOAOxaobwTGoObZvdS+2VBRcl4m6zXyzvTe3I3d183cflayu10IAIQk2emKtNlKIUaAexaHjjx+avJHHzoxMxtxAmRFEqrbCa0LM2YLThijpmFsg75uR3Tk8dwwh4BvkPVp2P/91Sk/y6Xhu0ZD8ff9h/qKb/INla0AZnWw2Sf1NpSc0aPA7oLKzK+MgqtrnRc7nSxBBOAcwSQXJZ+wwCNny8a8PCp5LdrPCKxPmXZO3zfrv3MOmEoVpou8TTSwq+bmhRto7tZmXgVZ/XPH7TP0cmUAO6/dfKGwtX5AYBwZY4iZINFsZ92NjVRCRnDiwOjkR9619Lff+cjCu4hUhpoiKWCBArsTjFcRMcaXz23AV77+Svb1Z17bE2U+ihwAuxQya/k2de2cUs4a5hX6wwH27l7/kXt3U+qzs5DbgNJ82Kt2EoAnCbhL886F4OZbjcZT1GyKajLlAPfE5LybkQkJAAizk/XRe49NfOb4wbGFSsxhYyMR7bZIGUPGODB/JzaBTgRATuUJ4Ltx+u7tNwKfocv8eXSXYD74FCCUEAnsfoC+t+oRJ8M5qeeyCxgg1xfoASJgmmVifb2Tia6A5fn68KNnpj99YnnsdJoJgqIYxm0HAoAqyJA/6r/v4y31MIjy7LutaFg1CHoJqSinwPW3qfpToE/FDAwHWCj/ux4ia2sltIKNZvdap510SUiIOGIUIWMMkKSURB4vAwiU/+C4gSEXa6j0TtisedCHN5qP3o2MoT+4dX/0m3HB0Cg3HHM41+l2/TjXR88d1DUIyBgyzpBJSfLGard9/XpHjNZieOfZ2aMffdeBf/Cex5b3q5ShEhCL0mMFCuw2SNEmopSIOhRFe6fKUmEA2KVgUS0kQgJl6e5Z88yefJvpF82KTuZCp1XkTe+A3kZU8poH+nywivYvnebb8J3EgINXeOgVAND7N7gMbSnfUFjpbVlg10AAkaDZqaGZg0sjp6amykyQgPXNTrfTzZQBgHHmWJhz7wQE4HmGbGIAytF8fzXL76KPJatnqvTti7x/80cNArmYvKNmjqhdPVZVQwDgiCziyKWUtNFIus12KkdHy3D08Pi+5f2jH1yYHmYAAFjUur39MG77vqfA06j7//oK/bTy3EfrwfQNQzktybYzdO55VJ1Vtu84/cGSGZJnwTUZVrZWxQrsHhAApNDpdFvtZtLMEgERA6iUWcw5ci0UkE8EVoXXYXaKbPK8Myc3QO59LiqAodp7GhRq8fscFHCC5rxtlhM1eum0115hnQaBbSL8jowg4RtvVUtT7cDmQVC7s4AzYAgE7U6arDWSbqcrYGKkDE/dN3fm+9936Cd+zxPLx1QkQFrUHy9QYBcjy7p7ZjHs2c9YYHfA5cpBSW7Tv4XLB+jWVhX8r8KIdTU/r0NzoVP4/c+2bJQ1AIQGdhNol9O+wQ9r9a9w4X5+AYBelSr31ObZvPBtMjnbCuwRxFGMiAiHFqaiI0uj75iarIxjDNBKEmp1kiTLRMYQkSNTBoCecmYuzNnSX46stk12aYnKinvePczWFt/c5pdVM61CX1JI1QT5OdRvDCCBVOlNc4lqzxmwSAnt1Opk3UZbZJIxGBuv8qWFkUf3zw1PR4xDEQVwm2Hj9gOaypOH/aGN8TV0rFoVHXz1I18MLVCzyNlVXXVBw5fNuAL9PefRNIzbN4CR75A1N0NAMiZVMHE1AOQlVi2weyGh201gdb17vdFIiSFApcyiKGLcpBwxNMOM3o7gSuwAGIp2Xep1vL9Rn3I0CGAjE01pP/CmjKfYW/o19wf0p5ZD/taqvdkBac+7vhH8iepvETAGNmdG1icQbMljqe0VqJz6gKTyz5itFN00E9fWOunqWgLzE1X2kacWP/CJ9x76R0/ev39W8QIBnO3exGEFChTYGygiAHYr8l52f6VEtHvuEFgfcTAUDS3IP9O3SJl3TWDid8Kr9URtMfS+R3L9+l6unqHmpW63X7XXoFWss7sNmchgYqQE9x+dOHH/PROfmRwtV7qpgFZbiCyjDIiIAyFX1I2IDAAZ5DNQ9KHwHF07Gs6bEGhgm5zlIJhK/m7VnJvqZsnQKJrepNSeMgJQ+7651gmFANFJZNZNMijHAIf3DR+//56pd++fGypFHCDihcfptkHFYuwAXnLI3AVGWXFb6we88lYqGsCT8+y8nw11gJXU8Pr8hm8bbWKVqZ08c4E7Gao4DkKzla1fud757vW1pCuIoFLhPOKcCYlSEpCfOCi0DRlW5lGDZ9gKFH0/X4/fVhlOTW7T/rA6d0jvxtDVG4ATmAvCAUHP7PPu4Rsreudf+Ml6PkLo50REZMgYY4hSklzbSDpXb3S6nSSDfbNV9p7H5t/zqfcf+ofvffTgMpEgSR2IeFzMqgIFCrxtiPp7Wgvc6RBZk4L9ZCYTHoZeSbOQgcrGo1dlf6uAv0pSKHACBKF56DVHb+HvZxNAr9yfd7VraG/rPUJuwc6vjrkdhvozmvXXJegupNVdC0PT+6ZrE4+cmfojDxybuH+oErNGI6NOhzKGDDmqcEskpUSZJH/K8uV5Nj0jkk0YGWj6vqEJgz/mLYETfEMq7qNhoX+lMRcgghdLEN6LvLEZ25UzQVgpWP9v7F52xCoBHCIiZgJEY7NLw3WOB+erk4/dO/PHL1xpfOul19e+UySfun3Qhk5paQIRCNFRUfBNG15rLAGG6/anuX6GUUW2RiFXinoQGQCgE7yZxGq+ZzZvFXB3QUPZ6NUC0M5Pa8WCvIGiwG4GYxEIIWFtM9145WLz185fa71zYipaLFcijGPikoRSzQ2VIpioP0JPjFBEl7coeXRmDZZG2fa5Jlm6tP8qRu6MB7nJ1GOM9XR4CN7mmDd4QyQ9R5AGXRHcq1eECLg3unE78zACAOOMSyJKUpmui0REEbApKMdLc7Xoo+9e+kSpxIafvH/xR4noIkOGDCsoqVMI4QUKFHjLUUQA7FLwqK6XHmKBw8d+sAXEwA+yw94YPQAw1nboq8yrBjmvPLh24anchQM2otqdBn3lSitB2PU+L77qTap6D16Pn8LRdb8xF7iDkQEAg9nJ+uTxQ2NPH9g3VOcMYHMjSZOuyCLOOGPK42O2uYTJ8cCjKY840Tl8+lLEoBN2r0x/BWjgGZe0j3qOmQtzN7Wf3AZVQ+5ecA8i+M+BgJwjl0LKjY0k6bQzmJ2s8HtPTJw9cmDsXarnnh1CBW4BFPz1A+3zqomG/Rl7yTJ4Dbxhjl4sox180SC23c+4MMjyEJR0U0MotljtAWRZmxAQXjy/0n7xwsYXXr3ceL6dClkucyiVGNOh7+TlCwIwEsR29BrQZVhpYtB1rj6KY3Vb3safT07OCSppDII1e9noSPNs/pP2Q2APU0bXvo+l9k4wROCMIUPATEixut5tXb3WTpJUwP6FevS+x+ff9/0fOPQPP/D4/pPD9QgIukViwAIFCrwtKAwAuxTKMy8BUMa51LmeQkSk86K73GgoVbmyfkseorcA62XPl17twgnuAAGA9BJVeYqWa4YQygOhZ8rlCfD7df4AJwdrUcHWGzDjyS/d/npaiK67DUSCDsyPnFiYG9pXq0eQpBKazaybZlIwBgwZMglIEgBIApEkCdKFyxu66CdMhp9DBQ7AUY6hR6Pkua3T+o11v5qXolmv8BXYJGr6ukEF2EKB0pTNMgmnMGhnCnt6BgBgCEhSUrOZdRstkZXLESzO12vLiyPvP3FwtgzAisRTbxj6G1caNevRnTVvNL85Gb6W0/6V8qKMSo6v+RzXo9qcl9Xsy+8xOnn0Z27Sr8x6YIPVPNnx+bwFTTFx0hueiSC9pa+twB0FxlSOlVde3zj3ysWNLzTaWVaKGZTLyDgjhmD4nLFnSfXBmAUMDzSwpJLb/tRPxMgZxMDcJseDXSRjSO923UfMzYE+nN5MV9MueGM+k+eI8I1r3pwz09DKHsoIoEJlNM+3X5g0W3swjlgURxilmczW19PW5auddKOVwv6Fevx979n/8U9/8NA/efDk9AnOGCBkgKzYDlCgQIG3FoUBYFcjr9zq5VeHBjMExlTS3bB1bhHu22V+5cwv5JBv13vKH9NARbzncK6z/okIemFjEwvsVjAW4ehQDO+8b2n21OHxH5waL9ckSWh1hOwmlEoBAhkiMCWqSUDSinLww1tdzH7C3Du/ZXjewaNbTzAcOG/yCO1Y+lh/Et26v15R116jDA7IGTAgok5XdpstkSYZwVAthkOLQ/efWh45MT9RQoYSoqhSTJA3CFVltfcn6/llt3Jh2o++4t3bsgeDwqZ8a1A+0mrgUPod7aE1s6GmsKLuEWQio0xIePblK+0Ll5tfaDTTLmcA5RixFGGEDBl5GwF0bh2TWQjA2yLQk6xvi/u+ccazNb1qMy0441lPk34fb3qc1tbWc402AqiMzMQYIufIOCLLUkpX15PW1RudJEkJluaH2Pse2/fOT3/w8P/7Q08unt03VYmAMkBkBX8uUKDAW4bCALBb4clkWijVlmgJiCorrU2E64UUO4Uk1E5IZ741pQTzi3sofIarflA4QHu3bI4AWxvArci+wR0975WLAyBrnTcyLVqtLvQ+kLdzwY3D9wQUa+puAOdVJAKYm6gNP3Jm6lP3H5t490g94s12Bu2OyAS5IhSOhI07CLVzxtGactR4xKk9NeblQkFNV6bjvACpaNFSJ7rGdkNNoNNR4K0y3jF7E+O9svMkNE6oIej23nxzyed1oIO6lhihLeUiJVC3S+nmZkaUSVier80/ft/k/3DswMjxTGQkRFER4I3A/MyoGZgfQOwyUXjwSMlGdpjPaAy1nlHJ0IT5z3hCrSau+aStyGJovY+blRy3DIwAeTrHkA7B3MY+Qr4GemEL2AvgrIxXb7RfXFntriZdATFHqJZZHHHkkoCkBEmEAYt1Sq4mdnQcLiALu7aj3t5PnsiAth8nmyhYus854+2qT84URd7WQnWNJ7v0cTrYuUomWtGlGFTXuE/+5h77/Noc5nrtHSeoeEtSRgDFxKMIeRxDLASJjY20felqJ13bTGFhts6+9+mD7/8DHz32U0/dP/fOqeGSktuKSK0CBQq8RShK++xaeAscAverAljrPRkfoZfLCbxlUSlV26TM80zpRvvqIwPmD9k+bVgqbi9DBu7NLdr4/RjtirwOguuL9XQ3QMoMACRMjVcmTx8b/cEjB4ZmIo6wspmKTlekjCGaaBZUijcqi5X6lNt1Cs4sFJJtLzU4ogvJsj/d7FT96T9NXELAUDjdDqHxzBudekpEYAwZ48AySXJ9I0kZQmluslY5e2r2g8++tvkzAPAdgMIAcOswhhiU4Yb4nPKNvbTmjKPUcwWANigMcnD2uaDX++iffCMKujVU2dSTvupfYI8AOUiSsL7ZbVy90X59fTNdGqpGWK9GcZoJ2e5kmQSCiDFGHm32iyahHMU5CseABxIGPotbGTSAMUWR7g/C5b8fnW43HXJT0/a7k9HYe/T2ZrcsMoaICBwzoDSR6epqtymFqMW8WpqbruE7H5o/LYD+frUW/+XfeubGr3/rpetriBwBOBAlhbWtQIECbxqiYnnfndAp/Y2VmqGxx7va0HYLMnqSnFcGmqxSD85Kn5c6/UQ9AP6CmpNOTUZzzJ/vKzS4Nugd6WloFLhwDJ4OpZ/RlBUy0QtYRLbsOgjgyGB2qrp0cLF+z+REibXaAJuNLEkzKTgnzgEQNUGjcZla/6TzQlGgtlDumKGl8K8v3KJu7+jNjdJ5krSAm9PIvYae+UGP0uaSMncL6dvXv1yfZOeWzXphHhVdtAFjjEURRQQAjVaSxDHyuekhfnh5YubQwamPHlic/gUAJMZLKEUhWN48rAdfEilfIwPLT4kIyVUeDzI9OqMNGk+mi+rw6cbnmHlaDA2cPmUZnyWAYfphZzneaY76Zf8cnRmnredgJUCQuXiZArsZjDGQQsBGo9t+9fXGFy9cbZ85vDgyVK+VeLvT5c2W1FlDTSYLsMZ2q9oTgjRUGfJHT4e2nNkwPtVY0zNq+veKE+nL8qTWy89RD8rIQa7sca4PX77pB8q/7W9t82UWOxo9Zr0i+PY/dQ0RSb1UMQYsIiASQjQasnMJCbpJqTQ8XIKnn9h379Rk/Z9Pj7/+dx86Ov8TRGIDMUbGqihlu+DVBQoUeFNQRADsathFTgIB+dnKe0vlgrVK53sIVaP+t9D36YEvw/Z1WAVugIEP0nuvrdps4RHr76cocKeDSNK+6VHcPz98ZnqiNhLHHDrrKbU6IkGSEHFgroKTIyijYhGhtQDko1oG0nYORj7tZwi7hSeCrQl6y1nXv7utekMEzpELKWU3EWmrk0XEiI+Pl/HQ0shjR5ZGD7x24dornBUlAW8NBHneQtswLF9nB4CcC7SPgamPEclr3nvsNkI/WU/vToUrsFcgsg4xjHF9s9N48dzaL718YfyDCzPDp0bqZSw1JZfUIWcgNTVEQg16EMmiZ7+8vaUjvHnXh206U1uP2JN7N2BQeFPceEuYfhDUbjMAQMZU9JoQILNMZKvrstVNRCamoDoxUcazp6amOfI/O1SLF7/nqeWfODBff+H8pXaGWEbkEcisWUzCAgUK3FYwotvLpgu8NbAeTULh9hN7YqU6rezrZKql6b2jepk2iX38DPz+XmNtmQ825jnrt/ps9kD7e/qNZzTIsEv+C/qvtIFp3XWqvJz+Pc0LUNXg9kr7ICECce+bus3ffIHbDc45zkzU8MyxyaMnDk1+YnSoUkpTgHYiRZbJDEiSCumwpf+Ubwo9EgePkk3qMnD06s76Ji+wtOiTl408sTKjo908iea7M516pSuCHBbuX+z9T+/VsdmvMRgXgL2v9TlpZ1r4fQgJspsK0UoS4DyDw0uV5cdPT/y3j56anxUyI1ZknL4lIBBDJIboZxrRSdIAQMUBgNOmyZIi+LX00OaU0HvvTUSA4WtgrjPnNB80XnkwZICelYG0EoNmTpibhd5Q21TPB/IPqywaJooMTJ4BdbZwFuwhIBJcvNaQL7y69sILr218Ya0psqhUglIl4owxBoo2vQIRaGnJ5E8xlGEjRSyN2mBE55n3Eks40vay/Huihmlj7m329jt5w8u9YsnbRGShlo3A8kdzXhuK1cvMAN3eRbxYuUoLNiYHgPlPPTWZCQ7ueY1sQ+7BjaSl+mHAOAfGOXAgok5HpNeudzqXL7ckSIJ7T4xPfeJDB//wpz98+F88/dDC+w7tGyoBEJDsAudFAtcCBQrcXhSL+l4AgejrvrFAMLp8PjBAXT74GgiW7QEXYd8WO8AtKud9jflW6i40/l0EZBECSZgcr44+dHL6vzl9aOKBShThxmZKnU6WWXFO07cE8ERErfD3VAF4A7IS3urlbjw7vTw/F2+acD0h3B5Se4Egy0g0NruSo2SLU+XqI/dO/fCrFzf/KwBcIRLAoyqKrAgv3TkIAFCG1p7tvr68n3S76zzqMQrFrWAAAfq0siWNFqrGnodySSPOTlYvvnyh8Usbm8nv5RzjSoljxBkX2megGK6J6je02bsdBL1/t2dkOZFi5wxz8PPYPnHr/nDAx5sdyw4uccfdwJEBi4CBREApSDSaabvTzdIklbXp6Vq0vG+0VCvFD9Ur8d8fHy394y/+7uVfeP611fOrm11AjJAoK3h2gQIFbguifiWNCtz5QLLKDxAiN552MkqwStWr9qYaDclf7XrUer2E64aUW93IvifjaPcOKGeBEQI81cx2Eqxa9jJyH43V3R+T8ZiB8kSRyZZlFD40Yd/kZUgnoCLb2e4BSQBgsDg3PPPAyYnvP7J/eJwjwOpGN+12Rca1g5UIQq+P9uYYinE2gF4Nvq/iYxKy+bYD2wXZ7M5mjoW06ivvgZXMdeTpcc5L64+JjM8KzPzwQ1vRu8Y64Hwrn3FQqac3DmDlaGLISAI11tNuCaEyMV7BU0fHDxx7fu0TiwtTnwMAkLKYIrcC1JVzTD10XR3dqUfku/rBI7jeZdZPZWKrpgBZmrSl2PN80dKi8VbaoBUTGgBmTJbPk93Pbe6kOL2XnBWRXNJ3tYyQjrK6VVNtgTsUWZYQIuKNtUScv9T85vWV9o0sSYdLnKBSYnFH/fh616BhhujeA4DP55zXXHn2fbgmmsE5T7mjxYBYDQdHy/v0ibA/CI87IkXnv8gb0awNI8/PjSBjhhAa61xUAXrH/Cbo9aUNef7z2rtZ0QUZB06SpBAgNjaSthSsPDpcjieGy+zJB2ePL+2r/r/2z1ef/k+/Ef31X/3yhW8gIjIeoRSFEaBAgQJvHEWytL0C67CXuRNkX35ZqPx1A1cUglwDvbAFwm3Y9KYGHfy9Wdz8HQvcWeAMgEjQ8uLIg4f2Dx+YGCtBmknabKbdLBUZV44qNAX++nZilJ4tyKgPuQ5u2EPz/Zttd2S7a3NFLfvcVI3aD43NI389AgBnyICQWi3R3dwUCSKH6akaP7A08sS+maFJImlE+wI3BYSboKSbbGvaQy+/HYgtiPR2scatp1WBXQzECFKBsLKeXr92vXWusd6hCCQM1aJSqcRjQUCCTOYgL+ifgv960UN75jrfcIAwmLFtQ9M7ousBDQdd3+f4zc7em4Gu3IJxhJwxYN2uSG+stBpXrjXam41EDtVKcOrIxND7n1z66Mfee+j/+bGnDz14aHG0wgEAkSFiuZiWBQoUeENg2yUyKnAnAwEAbcZe30+jdCKyCQCMg9wsxMZzZddi6z03+/Jy9aVzhn971t/c59kGdCUC6/0MqEx7tYx64zo1QoI2WBinAnoWeXU7tVNbeeHIeFGNCzT3/dzid1vgzUbEI8yEpCfuX1w4dXj8h6anqhXiAK1UUCeVqZQkmUqtjmS3aerfGtx+TJOV2tCczV+h4fynbr9pSEOe7GcUHn3c1ZbOq39o7wte/g3bBk2gile33VPm0dKrGSMF91L133Xf3r3IyuHOk2av038ZQ4YImGSQNduUtLsEpZjDwYXh5fuOTb7/2IGpqqSUeFFz+qaBCNxss7A/IHnWJ0NLpoWvM+XzqHg0aeA+eTxNW2n9fft+n87j6hNzjvfZfc6EGIRwk09L5JU10E9l6Sq+Xd9hgTsDnEUAwGFjM2m/cm7js+de39hMUwnD9ZhXKlFMACCJpOO7ijYQCJHIetEd7/X5rpkhXnSeps0wlwWFDFl/DvIJQDDbeq0P3n59M+nM+AbZKAzyNgUtmpicBt7ufxOPkJOxzIKhmb4pn6GG4ni5y53gTCmmF4aAnAMDJrGdJunKeqdz7UZHdjoES3PDpe95+sCHfvRTx/+vDz914IcOL45VGDAASKHI5VKgQIE3giIHwJ4H2X+dptynplMfb35/YPBnZ9b4bfq62a6o543XX/7JCk/nnQgelVBKCUeWxuoffurg7zl1aPyRaiXGZldAO5GZJKAIgSG6InhaPUJH0blf26uzjt7fnnb+Jd573PJgCIQ8ZaH3b8/J3P12MrKtTzkDSJ9ZgADAEAkZJBlkm81MsoixfVPVkUdPTf7hi5fXfxcAnpWUbXWDAoOA/X4aZzYNLKUA4OKKd9Cxb41C+0/Y33bYAf1ufXHOPnCzXRTYFUizNjFWwRfOX8k+8e6jP3tkcfg9M1PVJycnq7ydUrSy3iUpiVSgqLIOab3WWfxz5LIVbAVAU6YF8xf3Eyp2SH07YKdBdxh+HNDuTSV9MrYDZMg5cUQJQpLcbCfddiKzVjsrT0+Uy0vTNTZeKy1Xouj/US5HY7/97er//9WLGxdffX29i8gQIAKiorRrgQIFbg5RkTRtd4L6fMrnPAcvtTiZ9NJWc1Jruc3vQ7kVD3PCq7kTmb2lJuuuvcB6pfSnEAieaOz1afa79vHC9qsn5IsI9hlJ+0kJwFRE6PctFbhzIKUEQAZLc0P7Hjw59SPH9o9Ox4zBRiOhbiIFQ0DG9I8KaGkOAEDneXAuUjLqF4ChQLL7VUPYvZ/GsGBkWF8wRNeP54DV9871B700am5g24dWCjdbbbUBXxp1z5G/pfH0ok4WYP4SWl+Tvp4AEVUuAABoNrKsErHS3GiZP3R84qEXX1v5vsXZkRcASHBeRiG6xUTZFgiAugoAKO8gaI+6yoDimtkoDcPIPK2Dgo8h7RiCpEAx0loToF2q0dKnI8x+/DZvB+j3I4emKJP2n9T8QG/KAaYD7lRgF4MxRRXffGHlO0vzQ//y5PGJB2Znh4arFc44R06EAghIAho61W5xm4cH7Gqc53OGNtHnaujOEToPOkAwL8jKJJibQz78HAEUNKWgkos3MGM+9icseFMxZ4Mz+TV8OcdNdtPQPSh6nVN+fueHT6jT2BjjMQeGhMSASZLUbCUJJwIUVK7XYnjw5OS+ycnyXz99z/inv/y7V//hqcMzPwvAWgApFLkBChQocLMoIgB2PcjmcQh8kFbi6+cV74PcIpwzlOduedODvCUMElq3vKJnT2GxJt6RIACijH7f95xcOnpg9OT0eJm1uhlsrCdplsos4owjyn56jenACk55VXlLusmd7NH7wZs24Q1vDttEAOBObtAjrAYne26StzVwjhwIqNXOuiXOcGyoFB/YV68dPTj64emJ2j+7fL21ImQ+Z0iB7YDG2ggU0J41SurPgXbufXwDd/b63urY7UURBLB3kWVdUklWKf3QU0d+8+pK9wZJGK7GDGplFreIwGQMYaANXgCwM7kipE07N8i/0vExl9J1QATAVox94FACqWhrQvb7eBOIvu8YCIgYWGcMQ0BkhJIkZKnIVtdF2mmlyehopTo5VY5OHh6rzU3VHp4Zq/2tkXp5cWyk9K9fubB2+dKNFiEyJJLFXC1QoMCOwBDxVkXcAm8nvL3yQCBMenR/C5opTxu8yHgQzV400k4fdDoVesu73YfseeVNmmhbz9p/mWq5oVfS7cWz1abB5RXq3WdtnhFtnByA22MHdo8dENhsxbquMAESd19UQd53GhgrI8MIlvfNsYP7xt83O1MbKZUQmq1EbjaSdpZJiRwYMtRpHkA7Qv29oYoWyRK19tJY+gzzS5lThnh8arM7PG1/vgcIPTr1+7exNejqU7tXSMx6rphJCXmqDBU6Oxv6zUkTroBO4STbh76W1DvO1RaKdlcmG82s280IasMRLC0OHzt6YOKeybEaFNx/5/ApxXI0vcVZ816P7FAzJPc72prkhn41fzOp9+3PTZALXjETQP/uxsPp0QbZSWE+Q0BkFDyDPy8coXr+TJ2yAm2ktksaWegXexGIiJeuNS+/frnx/PpalyIEGKlF5XKJR1JnEWKo0s8Boq0FYCrvANn0ETm+BH14KFi+6O8mcIRPWibQ9OpvmkePwK333ez51x15gk+e19o5bNaSUO5wuQ7MWIy5I3cIvbXGTWx3F6XQm/ltoiPIfNem+oaOI9K8HP18MboLIGhnMlttpJ2r17vZ5kYGI9UYHz49ufSDHzn8V/7QJ4//+/c+tv+9CzPDXPXNCo5eoECBHaGoArCrQQDglF275vVqGL3K9RvF7eosZ+C/1S5dRF9veoMCdxaIBAjZoTNHxk8eOzD2nnot4p0kg1YrzZJEpERExtDUT90wgmHfM+QragMuHvzxTUfv2LdXqAY9S3+nMtp/mZaFhQTZTmS63k4plRLmp6tjD56Y+kNHl8ZmpEwJWVTMmZuGb+D0kYvX2CIL2W3jx7eVuatO8pExBYHsXSCqQNC1zU77hVfX/+NL5zZXOomA4aGI1ypRLAmklCDVviJf0/WcEDm4I4560Dtye7E1D90pDW/p9PfsAj2d3+rYrO1AGQmsO0Zn9+ScMR7zCDhj7USkl6931s+/3ty8vtIV1RKHM0fHqh9+at/j3/ueg//wg08e+OjJozO1ydEqcFZGxCLBa4ECBbZGVFj0dyfQ86qHVXmMKR7AZKfWIh2SMsxbR2go7Gk6cGb74H5uPx8Fn+3mOJszIPgD5qbhyL327g56O6HLS6Ada54wqr2c6MZNKNXNVCRAPn6wwB0GziNkSPDw6fnZT77vyJ86c3TkdLXEodXKIE0osymj9f5P1F53BLCeEevdsQUgtFuJvD3WxsPkLEP6rxHzdF/+RlVzLYBH1+H1LmUKhjOll5xDr5Xn6DJmOjM6mwsgN8fsnfUNTNAMmsboiB2t9Gob2PshAgoiarRTUalCtDBZKT1+79T3vH554/P7pod/CkhQFFUwyzrF3NkCRCCJUJr8+DqiQwd1mIIrnuvT5icxH43XVH/GPE15DQEcDfrHPTIOSl/mtRfD+fWEUDELrrGftMBu51bv7KKCiqMiQ2KIUFQB2KOQMiVEhq9eXE3f9/Chn12aG3nX1FT5Y4vz5bieULSyjkxIEmR5kHX1ey5tAMcjAfxVP89KA4nEgDyZwq7vodyANurR5AjweKO9mR4SmXWCXN9mOqAblMunYS7NzTk7Wd04AxkJPf4N1DtHvae2JWfMkWDe21AiACQ9dDQfdJQZYZLKbG0z6wJieUJKPjbE4R1np49PT1T/+T0Hx3/pi1+79Hd++9vXnrl4fRMQGUY8gjQrEgQWKFCgF0UEwB5CTgAc7HdCGHRykEF/iwZqxevnC8Ce1dS/Zoe32+b6nnsUAQB3NKQUIKSgg4v102dPj33kwGKtJoWEjc00ywTIOOIRMsZcCclef3lIYxTIXABvhLZ3jsG+r5uAH4+9VUd5Y8JOoQXMKIKIM2LtVpo0NlI5VI7gxKGRqTPHxn54ZqI6joAgRFERYCdQWyxc0cdtPYuBapTv6000v++Ij+/weqWOpLdjWAXuTHAeAWMRfve1tQtff/7Gv7i00t6IIgZD1YiVI8YRESUASaOj7qjXXiLc2XWDZ9WOHO59SLv/SHrlkB3PR8r9zXe95QF3J2OjQHLHzdZGM0aGiHGEUSnGiHFgzU7avXStvfnahUbr2kpbjtY5PHp6cvJjT+//9Effu/y/vu/JxQ+fOToxOj5ShkxkUEQDFChQoB/YTllygTsLXlZaAYg82GBqFHILbQRHvetN1UsnU5vX37tvl0W9Rjk9TPWf23pqG6K3F9C7kIh076ZWuvOOgVck2/1xj9DH6u55sMDu+yNzb52/OkfShfH7TgHXdYtnx2u4f37ovv1Lw9PDw2VodyRtbGadTIBknHPGGPYTzvLVmA29mH2TFEhTJhu+ITUvK4WmYfXSe/+tU8uQGlkPOwG46WUIk0zEgZlr5hi4ORAk5NDP4qaJH7Kj76H3goPrxtI05A6aZ/OGY+/lSbKIgJwBYwDQbcuksSG6UgKMT5TgwP7hUwcXh49KklTMk+1AoKoAAAP/pwYwtEAm4sqQiN3GYl72hPpj66P343nmnp5X0fA8x2MNXzX7ms0LvXuDjpjyLU1en96ea+OEJAkq+6Z2oxIi2ozmhbywJ5FlCREJuLrSgOdfW/md1680zyUdgGqJw3CVl8sxxlKSFFJKJMqRq1ZmDY0qOvU2vxhhADSpqVPmekvSPmsFj40GYTWqP8Ml/bXBK3rk9WEqIuk5oJcHN/bc5MvNw7xcFM57/Txm6tvR5V8mX4h5UNWznzlJfX+oBHKzKkhlb7GSDRpuIkGKTLTaWbKylnWu30hk0s1gYbYSP/3k7JO//5NH/tVnvu/YT7zj/oV7VVLAFBCLbV4FChQIUVQB2BNA799euGXHKlDkB4T26WoLfaCfNVsd7zmzA7ViyzEMhFHwnJ5mBYQef1uh2NwpkCSAiOip+xb2H1oa++DoUJlngqDZElmrLbo8Qh5FjIeiVAgEJxz6Ahz5DbxLt3XGvNlAO+QQ+SNKgzPyNJk/mL/ISJ4IoO23rj5crkNjuGM6H1WWUNpGwTZaojpc4jAzVR2799jkpx4+OfcKkbiCnCMJUUyYLUBAkky1L/cKVIr+17mzeRY78Cp7YoufZGAnGB4nO3MGdKI3jxGQoUMvVxkAYFEuYo8DkUEqUrh8vbH6wisbnz13tH3iwEK9MjIaxwmRTDazjIgkRsiQGfNqL1kYzuM2mjjq14LH4ImyDX/emjltK7zkh3Mzt94eA28/eDxklwe3mpGZjmjNi3ZvGyJhiVNEDEgIEI2m6LRa7e7qRlKZmClXZ6fLuG92ZmL/9NAnJ2rVuY+/+9gfX5wdffb85bWMYayT6qYFjy9QoEBhANitMJn2teeHmX2oxjrOdH1Zt0fVXGjUAiOyhqtWz9Zn6nnT85H0BVYEJqvDgDW++2NH7yJyVvXcnXvRTy1SZXMYY4AM3ffSd6AF3lYgApw6PDX2kXcc+PS9hyceqpc4dFopdDoiE4IEcmDO300mCTm4AuhGnjQepwFeSQr+2Laawu1fS4N9Lsrp4r7jps8djfDmNbIuInMjtH/cSPrTupnKZksoIKGr2AGu2oGarM75RMZAYoVtMPkTdB+YCsrWG0nG4iiaHauUHz8z/QPXrrV+a3F66D+AlKLvgAoAABiPvSBJUpcHNz+A53wkAOk2/rvM5PaDt2e4300gCCQw99W9gWJ4zvPZ1/JFvSYJ2wOFR/z65nplQGSqOpCX4BzRbhcsHIl7FVIKQmT48oW19ve969hPLS+OP1UbKT88OVZmQxmU1jfSlhQkIWagV1vtuBegDUg+TyXKUZ9JNWGjnDyyVnyLcnzWy3GiG5HuOW/4cjzdMPC8vGImJObkE9NByP/zdjWXQ4ACeSaQNDA3J+0tzdNp7qyNcaGshXYMDBBIm1hsHxR0CKi5jgQgIUm226K7vppwACyNj1RgYarO3/P4vqemJyo/e+wbI//7Ox5c/GlJ6Tk1r4tygQUKFAAlcBfYfdguk7jWEbyKMwC9QWc7uc8bEPn8ixF6O6NBjQfBrc5EXlI0Y+dw3q5CkbnDgIgopaRjB8cPP3b/3I8eWRodh5Rgfa0r0lRmjGuBh6QnGebhPJgBWflGJi8HRD5w1PQQvtkZen2nxti2FeV6AmlgjQCEvl6wIEa0f5/mgT3Jt99edD06FzyLgBgBJ0a42UyTtfVUDJU5nDk6vnj/iYkfmZmsTgIAIPJCw9sCKhGgp5kYoAqUdw09uxX0/y17jt/0UuxVGQQIKsPm50molfSOyCj/bh+BmVcu3LrA3kfEY4ijMn775bXvfumZa//kwvVWs1SJYHioxMqR2sMlyeQCyNESOcMmBXVYcxrzoMmgLnZNbkr4oNxrC+yoT9WPS7Q8QFzZUV9bNewjuyEgU//YLWxBX4QAwIAzZHGMUbnESowh29zM2hdfb26+9tpmsrGR0Px0lb33sYVDP/DBw3/hw+868Nc+9M5DJ/fPjUREkhA5IpYLXl+gwF2MqH/4aIE7HVnWJkRudnBKs53UbqJXZnarfSD4qoW/nLna5+aza9P7EfIf7QLlgtn8Bc+c8y35qAzaOaeqGZN3bZBsQD0g2l7so6LKAqDcZroOehGuegeBRU7QOLhv9Il7Do0fnBqv4spqi9Y3024qpOQRi1B7ulF7OQFAu117qcgC/XT8eiNzzi2jycdJlcqAZEgGnc8cvK0FOfSKsuYK26fxY+XlPXITA5yq5kt2ZO8NADZCBpHQH7eLHDBj2YJ1ax3OHzfnwKRE6nYpaTCBs+OsOj1VwYOLw6f2zQzNff271654ZrQCAZzFxtb3pi2MqbbEAxjnpddD3hoExlbkqrR4XBGDa5x330QKqMM+DeoBmFrjNpbEZfwPPavWQ4sALoUEaSNGaO0oxIW9jDTrEmIJXzh/NXvHgwd+9fzF6XMPHBs/Va/EMDQUl6UUUgghkJBxDgxtJJJPi5Bn0eFNBuroqh9XBQVdt9iH/6Phgb2d5SO2LI8NJAgAMzXsJNXzi4Krej/0znnvKTFsG4pS/dlr8JUN4MA2+sCsaYgq4ggBSRKAJJkmlG7KROXxQCqPDJXwyIHhOivt+8GD+6oPff2bw//fd9+3+O+IxEXECBE5EhXbvgoUuBtRbAHYC/BM1CZpmFvAcgHxNqzYqtVBV/6uPQAYnHQcwwa4EzsS5d55YXr+Qu4ftX/I/VVeKb9bdMl+Bg60wNsFEmrv/4Mn9438/u+75/2TY+USAUGjmYpmO+0CMuScuYokegtyr6cVc39taiX7OfR0hr++uwqDTwGMXJijJl9g7L3KbWsN500gBduTfcwYOeStELnnth5e3xSQnxF6EMqIQACgpHVESDMQ3S6lra6sxmUO0xPV8ePLY0+fODDxSszYJuMxSlHsE+0FSgRginHmFA9Sac9C1oRGl9AErZsGffqif++ZraqaKJJyJteQ3tDaunIXoRmv1w8CEgVbs/QjKr0iP8cK7GXo/Sx4YH5k9bsv3PjP9x2aOHpgYag0NhrHQmZyfSNpCSEE44wxMIX2eg2afRV/8GQO30gaGKg88SBnTNieeQ44kRubz0vzrNofe2iq6zMOAG+7DwIag5vXxlVL9Nu73vIriv3c5+bq69BfirG9ABEygIgxziRxKUluNrqddidL67VSeXyiVDqyNFTZP1M+fWi2/ldnR+un3//Q4b9KlF1Q4+KIPAZZlIEtUOCuQgSFx2dXIopqfX43nUAWCIgkmfS0BLa8s1mJAreTqbXeD/n1tteyHux8NjZ8u3zmSt2GH3w9zD/v38QoO+QyujvjBoKtvu1HT2NR3vJOAeclZAzg2P6J6nsfW/rIieWRh6sVBu1OBs12mqSpSOOYYo6I0iq2TgHpFSO1ZxPUOacMu0sd9WHoVfeEKludzSg86AtXDv7dQxEtNCKQPaY9SP3mkxX8yHs+e8J7RI/+g0fMKYrGm+t5x9A+g9E5w75RJw0UKWXNZiYqJeAz45Xq4/dN/3dXb7SeW2t0f/nySiEI9sKjS+V3U0UiCBQHsiZMDOnE3++PhsK0um5o0uNoANZ84/XmG4DI8WqjLNk9/85w1MdEqu5EHjnZHnXkjHc8bFXgboKkLiEivnpxvfuhJ5d/cml29MFylb9jdqrEMyqVN5tZN0splSRIhwDo/41SSsEW/O2oKGSVnqabdyrkjGHBPXI20h6DrJlbjkV7a4Hf0jdeGKOGZ5BAb3yG75vlRz23N/Vcz143oR3Xfw7N661tjkxlA48vyNAmQmQkLtWRtvGiIKJuKjPRFESYARAvDdViOLY8NjpUL/03+xZqD/yxT9/7D770O1d+gUO0LkQXECMkyopJX6DAXYJoKz9UgTsf6L0clFRq3lolwqyK/XSTvHXe62rQfQHcGk1e1722c3CWdu8OoTrTjw5N596iHK6/3hsJN5vfoMCbDykFEAn66DuXjz15//SfOrI0NC0zARubqewmIkMgZECAJAGtwu6LVQbkkUjgBwk9qxTuiHfU5tQbLSwFMpm7WX+q7LeVvxee6uc1zNOjTQLXY0wLr3DJ/MzYw+lLwUwj64vLDanne2SMGBBQs5kmMaPy2HDMHjgxeezS9dYf+9ZLa1+9vNJZQYyxyBYdQiv40gX/B+K/VqSdmTL/swYMGSAkLu+nteJ+LtrENPGNS37Jx567BQqOHmM/ncqxWQIyO6t6OXq+twJ7F4xFgMhx3/TIs1MTl//m/v31fzM/OzUzPFzCSiWJM5EKIkGCkJS1HR3J5eyUYe3f7aFKquaId0tOdPM02eOVz92jb4+5aRDOJW+u5qN2dvAM2z4BAiK5OEubELZ3CMAZQxZBRBJJEtD6etpqNdPu8BCvjI5F8eHl4fL+hcrZA/O1/89IrbzAefxPf+vZCxsAAIgRIotAisIIXKDAXkexBWCXIstaKpEL9PpIwRzLnwicQt7eN+hdm5wReovVi8K1zatX448C8iurUa0YBMsm9CyDtnOn+BsnWDCInpffQREM8HYBeQVNmaiD+0YePH1s4szMZI2vb3ZpfSPtCAEiijhnDJhSRFT8JGjnat6TEr6nHLkY94murI5g6z3rEBHVys4JaSwBjnZJCZ+Y69Lczr+956Rxx82NgVx9d/+kvSBnhwtMEd6ZATIwufBtL8EnhOTvjVN9Le4458CJiDrdLN0AgLHhcnVhps4PHxy7f3Z6aIqevXIDkRWaXgDvh3bfpc3+r+uR2owU6nv3uLOltd4fyf7ypmvPTY/OeBsWwfB/d8ibt3rNWuFzhPnZsfeFxgCA5p8iUPCughApIcZ4+UYLnnlh9Usvn9t45uw94+8ZqcUwUo/LaSZEkopMElHMGLdGI2vf6kMvfUWJnjpEPZeRXv/zpqhgKdjOxpCfZEhh8yAlv9t7tmW3uefJR4v17t4JL0A7BvWfZz62f41BAdW/qDfGgT+PfVOj+eoZMpSMAASRkFLKLgiprXsxZ/ForQRnjo6PYxT/+X376u/6g588/c+/9dy1rxBlF1VC5SI3QIECex1FEsBdjX7LkhXhenxK5jO5iE8ADCLp/B4C+Otn/oxZ9JUQ6nuOeodqBNX+6zQGf3oFZW+kpAUOcIueW18Lkr4jIAUwxuDUwen6H/zU8ffPTterUcSg2RRZqyW6AAx4RBEyP1QdPdIc9DvmjpsN98bBSaYAnqMoSSDRDyHpdY96HzS95fd597QLz/l7qPsmp7Jupn503jsL+yl6wV3zz0nhXdGPAvJUPcYBSRKmmcyanYyaHVEp18o4M1EbP7Y89oHl/ZOvMmRJHJUwzZJiMgHAYM0iD5t/Af3f2WfDFISsQB+Oafgzmjprrjl5F+aG5pdhw75cfdCzWGWoN+m4u6ZIrHrXIQYhU7h8vdn8zvNr/8cLhybOnjg8OjYyHPNMZtUbq6KRChIcATl6JVxzZS5DtbjPmcDKaviyUnn7urh3MBcpF0GQN+QOslH05/3o7fOnXNOt5tXWw8b+hz1Dn2Hf1pCYK+JpjAjO0GgWQSlJAhAwlFiKMUYAEJJobT1tt5siGa3z8vh4KTpzfHRk//7ah04cHnnoN2Zq/+qpB/b9QyI6p/qOkPMSZFmrWAMKFNiDKCIAdjUQAJgVzKwmYNYDAk9+NAubcjAZT2XomQRvNepZlrTRuc9aMEhq9N1LzkLgFDs9hJ4gA0947asa5TwI5i8CAFPeAE9YLdautwuMAyzODpceODXzyLGDY48OlSNIuwLabZF2U5mWSqzEGUMwhEqSwIsL6QflWXdUrTRg8klcVYUgJLsbAIxy4/tkQoo1wpN/RutaRsvuL935NOvT+VYYIHj6QioRaSEOgCEgMlVjHgFQkjIOoCl4QGAyvkPvzfsJ3aqtlCRTKWWjlWaVGo9nJirVJ++d/rHr15vPtJvdz11ZaW/zIHcZtP0EkXSEST5O2RPRBxKM197z5OW7QfB0+JxC4LrBsA+vK8Xhyd2KjFdSzZ2grjhY4609ip7XX0ctFKFUdxmIWoRYwkvXV+nxM/t/Zn5y+KGhofLvP3qwXkGUUaORxFkmhW/TJPDZc39GuH0wyTasNniHuWMD+sttj7K6e4+RQZ3IGy2MHNK7avjt8tKWOZN7nn52YYAgSssIcOB2GYUd97M7kL6XNRISMNCMBBGlkJQJEs1UpJkgKRirTkQ8Gh+O4d5j49Mj1dKPLc4OP/gjHz/9D772zLX/ygA3hWhDsR2sQIG9iSIJ4C5FHNWcb5BA170nawTQS4eTLI3+bWKr0Yl3eQSyoQ1l7kMm6C/KppkzNAwUAPRdnMKTXy71ouvZu22JrJzg6vp0xdXzYm2Btx4modAHnjy0+ORD83/+6IGRRRASNpspdRORgQmdBjCEqWMbJXh0DQBeWT/tlXEfLSWZ/21KSEAM4+R7RFLXf0AzfurpnThRc7qbywI1wIBm7+EJfDmPmTYAmF0R6lvRk9dMDq9Uu5sx/jz15d18KkClCZoaXtBsp2m8iXx8pMwePTV1YnWt8+deeG3tuSsr7UuIJSQqogD0t8yQUQyMHHUREJHeuKLq8jlB3dsn4vPDrXZm+TzUEaxj6Pa0b0MIriXo2ZfiPYP/NP69ezklOroySVYL3HUgSkjz8pUPPH7s7ywfGHrywGLt9FC9BEO1qJSllAkCkhIkMmTehYM7zfHOPN3ZBvaPUcL9d5osc2177mHo3DOE+W19Hhm09xt5c428/MlA+fPh/MZ8g9yTUk7uCW9opBmT4tVtB8hLOOB/K3Y9IjtOs7wiEsYxRZKQMpB0Yz1pb7aIDw/x8uhwiZ86Mj50aGns3ccOjJ2eHqv9PUD8p994/vJGHEWIGCHjMYisXTCCAgX2CIoIgF2KNFPWeafnG+WoP3/2liIrY6oFQisfuQXTyKv5DLVelZ4B8BZk43bqc9rcM+8o6Gc3sFqOfYJwQVULnyck+1UACvPWW444qiBom9SRxZHHzp6cfGx+pha3mwmtbSTdLKOMM2Ssx1SjhR5t7DHilL8lwN+ObPbsSwlEkqQQUhBJQsYY48BJ6bdIfp/oQmMM/dsaGQhBdImRFc1L683uJOTIq8dF5EmdPtl6FwSkDdpARwQcAaMYI0CALCWRZpRlUkpARM6BRQw5Q1WuS+c98KXZYJDkHTPzDQGBa4G9m4hsYzNNxkcqlX3zw+yeQ+Nn52eGp+mZyxcReTGDLBSV9vHH5Vo54RvA/vzBJYG4n+uFcr9fwO7yOkOPAQr62K7I8W2y//dwfASVZNw8Zb7IZu5OBe4iICIuzk28+u2XJn/p/hPjx5cXatHoSDVOMyxvbKbtVEgRxyxmDF3tS1UTzzNs5og1sD7RQNLqZanoW0/7X2duZbVgf/L0KuS9XZA33Wxml3AcO1SFg/Vqu7a228Et/VE7bkLexf6MVrZxCQTIAJmy+qKQRGkq0qRLSZqSkIJV4qkonhgpwYMnJ6Z4CX98arp8/w99+PhPnD40+bu/8/yVNUSGRaWAAgX2DtiOuViBOwpRVDfKP3Ol/yCvtJuK6uALkww967TRqELDMjjpElXSsbDMnnfWF2xzy6i2lqNZ4M3gvKaufBboqoUun7/fK+szxPxCqVJYExIC9waxg2+zwO2EkCkAABxfnCwfXhz68IG52lC1zKHRFmKznXUJCCKGjNkoR9DSIgOzdzqnnQQgaV9EEiRIVIoxQx5HGJVLEJdLEEURcIbK+yGJSAbEZ0wOuk90NST88oFgk7z5A/LMbLY7ZYQymrihe2dQcHOQTAg/hOf0nRERMOLIKiUWDVWieKjKS5USj6OIR8BQpYEiJEkAgkDtEzBfZN+68Z4Zw0ZRIESMcc4YE4JEu50lrY4AQITJierIof2jTx9cnIwBEaKoXEwio0QQ2e1FetsFqi0oPvMl6zQPtwzn+WNAIMGtwNGffQWEGCj/gTkBDPGZwAQAAESyM8tUW/c4r70FAICyp5GaZGCKuxU5AO5WMK78ROcv3ZDffvHaz3z929e+fXWlS/V6GcZGK2UesUhKkqT3nQclSfut29pw63FE1x4AvNgTCyUD+CmJNVVivq3qwcUDmvkY2gzcX3KaubWi2grK/iGrVlvjmJ2//mT1jGfuicGXlsz2Git62ZdvJfZuar9IM0MNL/K/Ne9ZdBQaAYIEBIlgI8lICUjEACBmyEucc5mhWFnLWucutjoXrmwSoID7T46NfvpDhz79me+9519/6KmDf+Tx00vjRJIYEqBKKVCgQIFdjiICYFeDgMDf724WPy3M9Sj0O+DbecHTfQre2IUx32WPPJtb0JRrYEDbvGE9XFjtUXJ1b7c3YBUGrrcaDAlmJmv8zNHx08cOjDw2OhRBJiQ02yLtpDKNOeM8UrzHV6SRfGeo287iygMCCAFSSpJSkAAgYAgsinlUq/BStRpH1RJwHiFIAdDpStFqybSTyiyTTtbM+4EGod/mqH76Wn8Mmm+2eLttZeVQBGBAwBhizIHFHLFejaJKOUICKDcTQZvNLG23szTpyjSTIAABGZdMR1Sg3VeBUgVIkHsOJH9EBEwnX0wzpDSldLORZNUqjyaGo/iRE5OfuXR54+utdvs3r60UYZ8Gvj7e5xz2NPZg7aD5005L771ZcFEvQ/Z1mR569fQOys2u/nw6f9B72sEXFtjjEFmHOI8wihgeWRr97udGyn99Ybryv82dnZuaHCvj2noSJ4lIJAGBBKnNuNgbAq8RHN45PRH4kU7bcPH86YHh9r13yXcBPhO9CeTNAjuSv/LA3vc9XxsZG3TvHQHA5ciBwOQNEQcGhJBJkEkms/VNIdI0FULI6sREhc1NlrF2anJxpBr/T7NT1Qc//f7jf/fY/rFnnntto4WICBBDsT2sQIHdi6iYvbsV1nvDAIGHpmRlGScCIG01V0ZusmX98gJk3ptk1liy1nFv71uPYaHfR9LX6/v16OrorVDk/7H9507rY6QN+naE2kButBsEsDkRIJS4C7zpUAmDJL33kcVj73h47sePHhxZIiJoNDLodEVGEiRGEOnUf0HldOs/Qfe7kqY9ICBJQFKiJIkSgRA5sFIEUaWC8dAQLw3VOYsjgCSVkCRCSkHEObAYGIeMlOdcal0pp30ZI4MzLoHNsaaETgyMB5ZG886noFvdt22rZ5AmXTuDQaUuYACsHDFeihlPUyFurHVam800mp6q1sZHy1iucayUWGkjYmwTM2x1ZSJdhUMzN7QxxT2I+m5tSgE9VvXFIymrARFQs5UmG+vARusxe+zUxJmNjdaPv3px7Y9eW2m/yhhDKeVdPJkMnQBjAIAmm56G3o2BjgU5b57ltUR2Cy8aulYnALTHDgyz9nyI6P++ANa36fNJww1REwDqWurqP6cNORLsVUYIgNCsF2bkdk0xSQCLQIC7EUJkhMjwu6+srp06OPGrxw+O/MrRA8M/NDdRx5GRUrmbStHpZqkQJJEhY0iGFPswTf3RN2wFewvDeWNEBWULI6fweu169PzgVt5c9AujeOjZ2uV54j2uGo4/V80jL1WRtfVS2N76ZkJF3Q0mbzjxhSd0tohcag7He7xbBtMcg/YEBMgIOQIrIcSCUCYpZddX01azKaLRoag0PFxi9x4fH1/eV//E0aXhs7/8xdrfILjw0y+eX08kCWCsjFJ27+J1oUCB3YuosOjvDbjEY75ioVdLwvyS2qPHe9VktrmPuWDnI7tZOFGgd4F0SyKCKbauDACeuB1sASjw1kLZXo4enLjvoXtn3jc3XY2bjQRWVrNEpJBxRKb0zkAScdKLTSJJICWRlCSlBElSaR6cM16tRpV6NSrV6jyqlhAjDiAlQasj6LWVTvvl1xvnNjfT6xPDpZml2dp8vRqXGaJMMxIZkSQJ0kpzvXHZblC3xBr7TQx/tg2wGOg9AZVKFFcrEX/9SrP99Wevf+HaWue7k+PV4/csjz94aHF4ema8wvfNlqPuhIwa7azabqei1UrTbiKyNBWZlCAJATgDxjjjqCNOlXKn9EKjSSpLCADnwAEBu0mWrm9INlqLKvsX6tGpY+OP7J8bWfryN6++gog7nvF7GYpFKgdnaHnpg/zPnnMkOg9dn+t67hqeGEyaoVJiqqntlGEbdb/33gXudhBJQmRIJDc++fShf7R/fuS+J87yk6OjJZRAtUtXZaPTzjosxph7q7hBvtpPeHZrZuvLA563YvCltyzW5pR8rzuvKgf560ZeXb+5W6kcLtqv4Rnx+vRoEwD2Ppw2+4V9G+nIY/oBr1HGQEIGyBkgSkApQHbbstttZZ1uR5TTDGqTExGfn65h9f54uVwr/a3Ricrprz1z5X9/6bWVC999dXVD5YnhRTRAgQK7DFGxvO9WmCWROBEKV8AJzB5j8hxA6FuOQ3tyqOgElnDf42nMCWZhyRvtjdXb8zapT1u5SENzvV9r166N4Hm+nNamly71fOjHNQT76AAAiupVbxUYixEA4ejSbPSHf/D4x5YPjI5WyxFcv9ZJNzazFgFSFDGOYG03AP83e38eoNmR1Qei58S935b7XllZm6pKUqm071JLvdMNdEOz2WD7mYaxB4zBDxuMaXBjbGNsGMzDC2Mbe3j2s/Hj8XiP8dh4BvC4gaaB3hd1q1vq1q7aVFvumd92740zf8R2Iu79MrNKJVVlZfykrPy+e+NGxJdfxIlzfufECSTr5Zf2oh7DBRXaw00oQKQCRbMp6uMjaWNstJY0h1IQQNBpZ3DxUqf34unNs5/92vL//vGnL/2rdrdYf/zu6Q++/8mFvzkz3hhKCkJJJDMJIIEg4UocsR2j6JS9Kl9ReIY7P2cwmAoaEtjHMkX1CzshUeqjK1utWjIyXBdrp9a7f/r0pX/6yS+e/2S9ltYeOLnvgbc/NP/hR++ZfeKWA6NDQ60EJpo1HG5Aup6CWNsAbANBllNeSJKFRAkIKBBQAgoyDikdCY4muTQCYgKYCEjynIp2R/Y2e9QYGUtwZnp49Pihibffdmj6UwKTvkjqKIu9q+Sp/RUoPEWbdOgRqSgOk8NC3WMPqzHu5T310zVQIHP5gPH9hfY4QObu5HuhzX29rxjZJZMUBsLRrU0LJEKpRD1aT6JJTBkRAVADRIGHZsY/NTZy7seGhhu/+sTDc4fGx+u4ut6r9fvYl4BUEJDAkNsKDHcz0o1XXsee+Ln+wZsonMsyJ3HYCcXqLB+ZaX6j/77qaE37PA8HMCdigNa0fC0KWICA+5iB7mOVpyoDn7fnPhPX67iDhytnvEzZvgfz9yN7Voz3J7BsMCEAJEiYJJASCcoLlEvLRbvb7dQnxmv10ZEUH75/Zu7goeG/fs9tE+/7k0+d/cUHb9/3n4iKFcQEhUhQyiIKioiIXYI0Mvy7H6ROCfNOxNHmtcsbtY0CV5k7LAwT4G8r7lX3zSmb5eJXx52ztV6vcURSr2DlzxHH95sFBAnzUy287/jEXSeOjD02PlKHLJew3qF+ty/79VpaSxJMLDVlktgDgJRAeU55oeLMCQGwJkC06kmtNSQaQ8Np2mzURLMmIEGAbl/CqXPt7Pxid+218+unzpxb//yLp9d/94svrn704186vQgA8L3fcvdTgIitViqgV0C3XwhQKYyJEIRAb3eJxg68SzvAIB8NnzjcBFPRnEi1WoKNVgISCV5b7Jx+8cxaGwDg8mr20ZW17oUzF9Y/ePTQ2Nv2z7aOLMwOzcxPNBsTYw0xMdFq9qRsdns5tdt50dnMs25X9vsZ5QWRBEQUSkdLEoEiAZVUC4BAINr0WlkBxXq7yJubRW241Ujvu332z756ZvOj65u9P72w3L66P8ZNAcWeKK4G7MEL+paXJnIwfHlX/UB5nPijqdoDyJ8MLg4cwSV+YttVImKvg6hHKOp45vImfPJLF//g6KHR3zp+eOSHD80Pp5NjjUZeoOy0816Wy7yWQpoKEKQDvqwuYC3prebBTmGMargiWe1mVsUcq+gQqx7DOXXVsVH+2aCsWd+JEjy0w7pZ2YpqAu7RUgiIgKjixiCXSN2e7Hd7vX67lzVm8vrQzGxLHFsYTiZayR0Tw7V/NDcz/PAH3n78Xxw/MPryi2fXu4okrQHJvUsUR0TsFkQCYJfCHP3n2GBS21K1Uq/8UiZYFVAy3c6Z4+78cLL78ANWnvnc/UWDmS9mgTGuU1M/MQ6cs/52cSJelb/uVd0g1p79RS7Luz5FgGwOAIQYAfDmQIeG0jc+euDedz08+9MnDo0cBAmwvimhn2MhUSAKEEIgqlzR2rOIgIBCZVwmSVKSJASoJZA0G0l9fDRpjo2n6fBoHUSagOxLWFzq0IuvrF/63LOrH3nqudVfe/nsylOLyxsb65u93umL67npy1ArmRkZrreajRT7WYGkN5CqTPsmqJ2qdaoSNUD+Zet9IXsb2fgNd8sjU8js1m83h5W/iRBQACYpQaMO9WY9bZnnLy1twv/xx2vP3Hp44h+ODNWbB+dGDj5wx/R3PXbP7J+/67bpI/v2DScjQ00YKiSOtPvpxko3WVnNsNiQssioAEQkEiRVki4Aofd0k+m53sQOBJtt2a+tZmJkqJY8eOf0navr3Z969cLqD1xYbp/eu7kABBAIqTJrEzkPIdvXr3NX+BySEVZq3AGw4UaeIAvYVTfQnEcfWSFdhqVa89hPbmvZ9sHKZNuCl3ZTufo9D+OOEq1G7CWQ7BNigs++eiH79nfe+h9uPTTyjlaa3D8x3hAEonUhaxedTtGTkiQJtQFJZf33habRQ8geS2G97KoYmx5eHiCmS/gxNeB0BiwV1m/NCS3o3Wd6FHues3pc8LvjjTwf/gB/Bs8n4NXE+4quNbK+es/FD3ZO2mbc8+5v6zrDdSXTgiqsZRaZjaO8wwhSPyYQME0hkQXJfr/IFpc77V4/a4yN1msjw3V4+N65+aMHx/7KHUfG3/7fP3H2Z/JPnP3fXn1ttQAqIE0amBcxN0BExI2MdCsPQcTuACIIJcglAHlLLfMKGeKaLRTI7wIz4qG0iJUbvYb9Z33dCWyvne3lFFoeuhfxpiDBGgIQzE0O4V9837EnHrt/9r3zs0O1zc0cVteyjAioVoNUJCQAAQsCWRRUFFoRTBIQSSKSoVbSSGtJ2mwmaWsoTUYaNawnCHlRwKXFPp1b6rUvXtq89Nr5tReee2ntP3/+2dX/7Q8/98o5xAYC9AEATMgzTE+08H/89pMLrUZaSxJ12ilJ7WcHcGO85BmpdpXsOPs/q5Obgh5/pgdwuXlhjpaDWg3SkVY6XhN1yKT5bDUEkG0A2X7qqxcXHzwxd+bCYufzL53b+OChQ+P3Ts2OzMxMNIZmR5JkfKKOoyP15mZHNjrdQvYykt2ezHo9mReyKPqFlELxLyiEQBRCJEgoBCV5RsX6Rt4fG663Dh8Yrd17cvqJ41+aOPmnT507hSj2KGPMDYUK+D5BCI34wTWGdW7nyhx8b/svZqsSvF3aYg3Yo19/hAchEhCY4m2HRl/4/U80/u70RPNfv/2R+YPz003stvvNrJdlssCiQEQhlH7iRhca4hFshpI3aViV5xyVL9KWD4A7TiXcrb8zQqBcedX77eTA1RUdXNBtLbDdRoA0gYQEiqyQRbsje51O1tvYyBrT03JoempIHD84koy30rtardo/Hhquz3/uKxf/1zOvrS2+eG6lh1hHAAFE3aiQRUTcgEhj0N/uhMntjYAFqCwseu+82+plGXa9hxPt/jYwIax2x6qzm30GvWz4mGUCwe3fJkC9j9p56ckaOeoBTl07it8aY+Um2EIUXPCJc8dgExgfVkxV/SZC5+eD+ZmhqduOT37LLbdMjjVaDbh4rp1vrmddURQkEkpQAJrExSqjP0kEAJFQ0qxhOjqSNkZGkqQ1lECtmQJIARtrGbx6qr3+xeeWvvCpr1z6V8+fXvnE8upmb3W9t/bSmdUOYqoGHQgAFABUgPMtqTB/JDTnshtXKnj2OLLZ4typANZn6zQs55XyPELKscJYKTd9kEAnPUQyew6QtQsAaCIS+IhWb/tFTyfecnsrEeuImCBRsXhofuy3P/Xlix8dnxgaXpgfPXHnsYnvfPDk1PvuOjq6sG+6KaaaKeaUJP2uTNY3i3RtLe91ukXWV7kCCElIAExSUHt2CRHyQsqsD3lWSGg0BczvGxm549j0dz5wx8IniOSaSBso873m3SFAIIEq0Mhd1fJPxSEhEZpDtxwJ4L44W5V+z+UaWo+fq96MInPdMEe+ZcH7w5uw4wtAezyrMrIwUth8IN0VNxp9v2NERFGoKICvnVrePH5w6iOHDoz85vEjY3/j2MGhdGosrfW7tdZ6W3bznPIkhTRJSCCYVBJ2VCpfOj8wkPh6boWt9dybMgB6rbdFMByoHsyGA1RqkvMVsLFOgDZfi/PGB3NNR924qAbQrhViuYvATUBgEsDk8nDqipv7BOALVOIFzN/Kv186aNH9fW3aZ5tfIXg2YPj8HU3mb2z6TZgKFAgJFITU7VN2eanXzvqyOTVWT0eGUnj8gZlbFva1fuH+2yb/wic+f+GX7j82/3tE/U3EBEVSQ1lke2y9iIi48ZFe7w5EvH5YUS61sV92NkJIE/tGM1uUqt1S1Y0GoOrLbxwcQ8AyHO78pPaIa4M0Qdg3NZQ+eMf0o7cfnXxweLQB3T7B2mbeb3eybiqkACKZ5yqHmhBCDLWSRqNeS5sNkbYaSdJqplivJ5CDhNWNPi2eb2eXF3trr13onH7xxdWPfOHZy7/22Wcuf+Xs4joA5KAUosQzjAEAamkd8yJT2c+JMlIAaZJiWlSHPpkxbMcyhWW5kUblh4PLTie1ypqzy2wjvE49m9XOgFrV39tkW07SOsqiyM9cWF8CSJaI8lOP3HPg82dfW/2jV26f/O4jC8N3zU40Jmamm8Mzo00xM1nDqdFac7NXb7Y7hWx38rzblf0io6IoikInIqCCSBIQdbpZ0e2mydhwKu69bfLrXj4183WH90/8VyryApMmUrGXPDsSACQKAKF3VekTJRXKRjIfSfz6laDKhbiDCIABsnnr5/nU0GwWbVE8Ys+DqCAVEYT9P3nq/P+ysG/4gTSdf+eB2aZAbLbk+R6tbORtklBAAkKAtLH+LAPrdoEyb0zfwVK85carpiwvRuFq4N5dmQ40wPNxpXAfZgetD57/qgoMpI0qLwSq/wCpKGTRbufdfjfvd9pZc2qy0ZqcbOCdx0ZbsxONx6fHm/94drp13zc8duT/fXhu6OVTFzs5YoIgUiC9LWByZBqXNxajdImIuI5II6G/O2EMEAJKDNtsDQhCQpP5lQBIGKLZxA0o/hhcQLS6i3y9GyCbrWvTXyVJ180XQG8xRLb0EG+FKwCO8de1+uVZxZY4R1QJ27UHVZH3yDb+xzXmjYRIajgxUoNH7557y3seX/j7tx0amylyCavrOXX6eZaRVOknCgAghFqK6VA9qY2OpI3RsVrSGkog1RtY1ts5nL7Q7j79wvKzTz+//J+ef2nldy4stc+urHY6l5e665dWu6AqSkAdO1T2Qku3wR4QKTH+WHJGDWlPCXfxs/HuvFPOf+uumagVewy8Hfd69lkvPxh3FucFyB6B6DWo+6WP7lB6HIYunxKKvK+ndQ0BCpOHYfHIgfHf+uzTl35vYrw5dmh++N77bp/83ofvnH7HiSPjU1PjDWgM12C0T2JjM6+vb/SS9maW9Tqyn2cyl0SyICQqqNjc6GerdSHGRmp4/+0TRxaXZ3/8+VNLT50+v/4KyGy7oXGTQX+/SAK1vCPz/ZtAJmbT6KMW1Hgp7fUPhq1jmtTj1gupy2r5zg6t8H141lY3fXR7o8256c4L6X0cXZGujXk7yfwQqGixKEYjKiCSBGSRwxeevfg8ovj+RhN+8wPvPPjw+EQNNtp5c7NXZBmAzCUVKagz51VEH6KOmSF+VIWnp1hXvWrLTiN0MraU7V/DZUR2tKoqb2Kw2Bwj7wnwHjCxAboeEzVg6vB4AWSUHwY1IrBIRpPrgNz0M5W4JcrT1/TqwT6f96mM0LCntbLsUD64wLDPS1uSWIv8D2E5BgRMBSQiUZ+h3ZOZXOlBPysaY8NpMj5Wx0cfnDl25NDwh24/MvKeP/zU2Z/9yKfP/7dTl9YJZAZpWsc871M0/iMirj/SgPCL2CXwvjSCotonOZiPtofthN+/WcEGsfJbiO0rY795g9tUvC2I/cTh/GZB7b3PYXxkpH7/nXPf+eA98/ePjzTFxYvtYnml38l6eb+WYNJqJo1GI60167Wk1UzTkUaCaYrQJwmXlvtyabXTW13vb15Y7J5/4dT6J5766uL/60vPLX/+pVNr/Vz2QSkoAoQQUBRb71mSTElC5a0N5gqxM5zLY4XYIOLKITto0v7j8li7h5kjJVAUmW3IinveFmvBAaAQgCiKrT6re86FVyZJglJC/9S5TR0V0Hv5nY/c8pnzFzc/+MqtE99xcN/ILZOTQ2NTo636cCsR0xP1ZGosTXq9eqPbK2S7W+TtbtHvdYv+2lp/M+vKTMwPj8xOt/CuE1P33X5s8tGPfvbMy4k6zXEPAssyE5jxH5a9uhY0ytJ8+ydpCzFY5dp099C9JG8NiIgYgCLPSIgEl1a78N8//vJL3/OtJ//uofmRX3vg5NTM+ERd9CQNL65mnV5X9lBgIhJzMpGmzwjNIZOe4N4OdmgiXPU4vWoB5lO3Xo2h08Mrv+OKr6Y/GF4YgEGf2q1vVd0229sEkkpUK0QqCSAvqNhs571OO++trSeNqWloTUw08MTR8cbUcO2x0aH6P2kONf7hJ5++8HtnLqwtXVru6R2rtZgbICLiOiONM3B3ospPqbZ5kgoA0H4bxbIbk8XZPZZrD0yhUuIaS1qzPXi2xXJ/3CP8XwSXmBA5ke2t+rbOYFBa5t+cUOB50Aism4rse+kqiiP8jUMOAhJYmBudOH5s5p0LByfrkBWwtNjd3Fjvr6c1UR8dSlujo/XGyFgjHRpuQKOeAuQSllZ69NypteWnX1j69FdevPz/P3dx44tLq92llbX+2oWlzvLl5T4VMtft1CAVCWRFZ/svk3lbEUEkJjJE5QHQmySRkJTrtuycNSEBRpnTd4yXyHqhlKFlImFM+Izb8Q8u07L16gvUU1RPCSIXaU2ApP1ThNqZI3jjO0JRFJSkDVTHMRMgNpGoe+6Oo5P/5k+/0Pz/TY82p44sjN9z923Tf+Gu4xMPHz08Mjk12cCR8SZmOSWb7SxZXe2lKys9WF/JNjob/fVWq14bnWk25/ePDt11++wHn7j38EcKWSwK0UAp90ouAOOTNO9IBzKTcV3aoy2VDOYDy0lB9daRQeo3mfHqXWWuffVP4N0ztr7LaaG8hOa4cdtzJm9tdbZ7PGzBfi60OVxQZ6O46rPOIm52SFnYJCYnjkx/bHZi6B8BpD/1wJ0TM7PTjbTfK+pZO+9KQCkFCkGMTmX5UYmAEAmRudmV3GSDmQAMg0v8cUPUln3jpm6FICLAFXRPGK88d5Y72tlZ/cFuSyUdyLUZThmd/BDMGmAiBjzu0H4O0yj6soTz34Y2Qf3XQHARETaqh/0l2IfmeqNHXJCSINrbD+bsEvO3cMEaqjGhqRwipG4fs6WVDHsZ1KdG6snEWFM88cj+OxYWhn/ljuPjH/2jT5/7uU8/ffGzpy+1C4AM9tb6ERFx4yHmANilcMsYF/ChLN3GI64f9/TOnTX8OujzK8EOGyGT3Z0qnojry7XE7PgsXlq9RELUEYFgYbKFJ4+MP3pw3+jBxlAdsnYPhltpfagmJkfHGs2hZiJECpAjwuJan9Y77Xx5qb15+tzGq1/62vJvfv7ZS7/55Rcuv/La5Q0CUgcQCUygkFebNMjRVEKIuhBo8kyTM5ZMua3cR/7c8cYVhteQ61YVD4SXdJti8ADXaQDFwMq2QMES9CXpEApRQ6J89WsAqwD4ysGp4S+8eGrl06fOTX/Hydumvv3Awugts9NDo6PDtXSokeDURD0ZHUpG14b6zY31oitSEL2sgFYzhTuPTj780B2z7z++f/bX1R7gGvIIhJsXCL68LSnu3OTe8hvb7o81yHH4eiIAthrpYbs+exBe2wNfdcQVQyQpyELCV1+5vPngiYV/NzbSPDo73firxw4M16cnGvW8T8Ob3aKXFbJICaiWiMQ869H0xv5Gzyy1BckvZmzZazcoB02+8P4bCn9b2fZzzpCDO3F4DPoAzj1j/uoU3HY7L9ByD4lAgYggSYCUIDc28s7mZt5tr2eN6YlGc2q6Ke4/OTM6NdF8/+hIfW5yovmLX/za4p+8em794sXlDiAmKLAOhdwBuR8REXFNkWLc3bcr4UKK9SkAKq7O/WfMHgBDDoPzyitmGO0iC9ZrxLapAYDydPIFwdbKQ6Jd1YyBBnvCDzuYwBSyZdzgKwVUW3hba/ULroaro9Occo4IMQfAG4SiyKGWDiFRDkSSvuUthx988p6ZHzky1xxLhYSkIWDfvlazlqTQaKZQFAVcXt6UL53rLH/1lfWnv/bq2u+cOrv8J4vL7cULi53zz7x4ec1uXAQAgNdj/AOY7/vycpv+zvc/khjPvAQCqTz+epAQ+pmO7QgHAMkMejWunGPFC5V23hnjuTHzhuUi4Fnhw/2eqgwptQvJRMSaQnYcp2kT8/zKQyaLvK2nqzCTEc4sbVD3K/mzr15Y+5U//dLFX5+ZGp4/fGD0rbcdHvvGu46NP3D84NDEzGQDx0bSWmdT1nJJAHkGjXoCdxwanT1/z9wPfvnF5Y+8dH71vErIuBeAQACSAKTKK6lzf+tDVwmlE7tgRpI5JcXUEZ7NzcYO8XYCw4fJWmsdsffOE+jUeCVcmXRl4w15e1VEAUuYqUc/IEBlQsqICAC1FQAATB6StW944tgvL+xr3d9Mkif2TTfS2VlsFZc7sL6ebQoQAAkkfG1G5t02JxSZOWQGqRXXaCKxCIDQuezdL1Pa6Q52qpkXwf0gcsBEeFldQ/9DTmPSukiQIBZ9PcWCO+79SkswahPanDWMUeQ6E5n1BN3nD8IOTE5kE9iGWlaUoy0DHQ1Y8ED4UVz37cdE9Z2gECBIkux0s/7SCkFB0JwYrYv5meHkXW9ZePTY4dFfvffLkx/9489e+Lk/+sK5z11c3gRJPUiTOuZFPyprERFvImIEwC6FW66QHXkXeqkGsL1vqpgt+5WCJWpHz24JneDN989FvBFY2lgmxDqmSQJ3HZ8b/ovffOwHnnzL/rcfuWVYoJDQ7xaQFwCrm325camdL622N0+dXX3xmRfW/ssXvrr8m195YfmFcxfXQZLK5J8kKSZJAnmeewNhfnofnl+8cBUj1VMqExRgTqfUXBQyNe0qx17psWr/qs5OuXPvK1PudFC53LYvOwSRtF1IkhQvr/fh8lpvCV5aWUpE7ZUDc0OfOXl0/P84fXLqO+45Mf5njxwcPTo53mqNNxtpIxWYEsBIM4GRoy3xUCYf/sJLS3/hudMr//TsxSVKkybme+ZEAJ62dLDE4YTrIIl3Nd/qtjJuOw/mVbYZIwAidgIhEkBM8fC+kVd//+PNnxpu1H/5nY/tu39yvIl5Qc0ipyLLZJ4VUCASJkLlaQEAANTHxGqJbcks5oEoZVO56uHIiVvwVKaS8R48Msiwv3bKB18zwnWqqhEacP1KwBxBA+oOU4GaPqr0gwSJAEwEJCRR5Lks1jeyTrtT9NdWs/rMTLM1O9HE2cnm5P7J1gcmRpsLjaHkpz/99PlPfe2V5TW1gSRFojwKmIiINwkxCeAuBwEJAnMWmslLbaB3eKKLkkPQDDMZEpybJ3xPtGOIEcDtA7PeJ7c8eWD71ciGFZh2bDO2d+XP4/71orV5Dez8XX6UNmlPKiImwRMR1xACAKbHh+Dk7XP33fvQgW+79d7ZFMdSoLMbcObMRvHMC2uvfvWV1Y+/emHtj84vtp9ZWumsXFjsXHjtUmdpabUHLpN/CsUAw/HqjH8Ab0QiCUR1TkSwD5ogSNvmjs8kQJba3aqhLu20N8vseNVuVTs7vHlErFvuWRuBoD05qIubuan3RAAAwdV4/wehKHLtrUsRoIBC9uHU+X6x0e4+e+7i2q9++pnm705NDk8cnh97+J6jM996+6GxOw4vNMdHphsCZptwC4jaE4/N//CZ19Y+eXT/+OeAqH+t+najg4ik2W5kPZGWvTEpVxw876Fx1LMIKAAusP2v2I8uAbcvuaSsc1ecGm9kHihVzV2U2tuKXNQiO1CFW0fbkMoREQBQFBmhaOKr51fyw/PTfzo6VP/ZucnGv3zorqn9U2MNURQ0tLjS67Q7RTcRIBIhhJsImqL132rpaa5zjzZaGer0G/6wdfQHbggMhjHTOlh0jZtULKeH9bqrJYQ5392zdg6a977OZHOABByE6w77LOZT2zmrKeUgeY0JYLPlrHXO7rOP6/rm/QnA/QXNuoWu37wK3Rf3GGpVT52RkiAiIWGRU77ZyQCXQOR5rT42WhPzs0Ppu96y8OiBA0O/fvLo+H9676OH/wkRPYcoEDFFkaRQXMP1LiIiohoxAmBXwyl7FFxzGOyhMuuYX2wn/sotgKUXO+iJQdiu37nteubu8TqjwnotkYgmFtSndz58fOHhu+f+2vy+kYnldgGrlzbh7FcWV5796tKnP/eVpX/91Ncuf/zFc6sXl9YzAIlWKUpQQC7fSJY/qForQ77JXuVHDeeMf5/rSc5+clrW4A0s4JX0amPbCbQ6CyaOpTynrz2MtyVNUpQAsLKRwfJ6/+LTL65cBEzhwMzoHzx3ov1fHzo59cE7bh1+/+G10eNzq9lwq9mAO26dPPSeJw7+/NpG9n0vv/bC84gNrDqW8eaFJQH8r92EMRvOFMtyq6Rzvx4MrKyi9h02OEBOZ1vdjYgwINklgXUkAPjkl177P6fH0n/aSPFD9985PbNveighglaWd4oipyIvqEgECiGYSDUeh3LNTG95veOweuKUfOmh86LiGVfwdepOA+H3Fdl168PZpt2dypzypzCEg6vE8h36Ad4fdVFAklAiBIiCQOaS5Mpaf3NzM++ur2fN8claY3aqgbPTc7Pzk62/NNyoT37gbcd/5ujCxPMvnV3KEOuI2EKimBcgIuKNRBqX890JNEYHUYJE0mag1eQwAekjqAnN2mqMCmEKofFcGjgp77LmOmNFvR0gk8spb3V1jP0m/1YpaaHZoB16xMKjCdDtv9NeOLX3Vmd7d7m6CYCnA4h43ZCUwJGFefHNbz/09XccHnm8t9ztfvSllTNffH7lI197dvHXLlxYPXXm4vqlF86sdNBswIcaACUg3+QFXSAmwiQwV2dO84gRNjrBuU5QbxLgm6DBewE2TxJyr47xnRDw61ZZddWh2V9Kugd2B4sayICsz2/MX8ZHXjhCxhztCJTB2UvrkGX07JmLqz//ia/U/r8zs62FW45Mvf++O/Z908lbJg/dcXz23luPrr8HAJ7fK4YhKjcVO1BFEQFWpIKTUuYNgfkqMRh0uqDvGCx7LT2PoPPecTnJxyoX63zvv1e5d6i6qkMJT7dY6MNV9AErntofEbElJPUJMcGnX7iwed+ts7+apmJofLT+oTuOjQ/NjjeSrF+0Vtezbj+jjIioJjBVK7XOt6InkzFxCa0pyvlTcMe6Oh3HPuCKujnFPdfc680nLrtpD4WxlanZZ49zYUQEeck1wOZAIq6/sLUBbSRA6IWpmmNkZQi6ToJPQtsPyP4Q7I/lMZJmBfSLOfqZ64xGVzQktb5j5RQG7SldDEgiAiQCECSQlJLkZjvvExIIgMbYaIqHD4zUv+FdB7/jwMGR+z//9KX/z3seOfJrRP2XFQlQRyKVF2B+agrPLy1F4RMRcQ0RIwBuFrBorErvYUBt26WmtOZcAxnrdyC44VoPl70yfI14EOmP9seyH+z89LhmXCuIdAwREdJUCIACLl5af+nllxY//tmvLP3KZ7+69ukXz25Ioi4B5pCIBIWoQXEdE/sgCoEmCQCAsc3BvgGw2pk/Isv+WqbWeXVgUK5qNJfGuVG+AK2CZRRcsAkt/W6kaQPz/I33sBsvfpq2UEqCS2ttuLy2vo4vFF/KC/nF2w/N/MGp+zZ/e+2xQ3+vNVybKCT2Dh/cLxDFHployH7I+47s90eGoA2lDyOFXm8X/Cori1B4odyVbWFONwSgmAQw4oqgTgkRCACrzVb6q5Pj9dsTAd9xbGG4uX+6WU8SFIsr/c28kEVRoCQBQiAy1oqCccuC0YPpV5a6WxnT7Lrd2zhAD7G07VZ1BXWGtZnjQa8aZY3OW8fCzflb9GxQJ9zqRfY9z7YQPsu4x8rKDIcDAJAkmKQpJkAAsqBifT3rdtp5tjKcNCanmvXDCyPp3Mzw7UfmR/7W3ETrjm9/x20/d3Bu5MunLywRYg1rIoV+0aG58Um8uLq8R9aZiIg3HunWgasRNyqMyFeeJxTmIHIXRAwmkRipo1113n/GgFOwqFiGm8oCnu83BTDZzhkDTv6yZHsZKqt8XSbdY1NFsGfVcs3aSLPdYraWc1AZl2rYj7heXCvIfM38MfMn7l/4g1Pnlp5eW+svvXy68+qZpR4p3oUAIQEpr5fh75oVigHg52GUytk5YBwrnhcIrJIZKkGlfZFoRh6y58h7xlxGMttb9fwwqf9t+nXdIpGE64Q8d9EaiImiJxAxgVo/74s/vLTUf2V0tD579tLGi6fOvHbd+vlmg0idAqDeABChPhNbO9CN8qs8mWp/vR1i/ihyXvpAbvLB54pDqOYbT6mNGNEX7dOcS2K5W1hAChhHpo5KMZJU3dPRKH5q8agvROwciUigkDl86unXzj15/4Eflzl1vu2dhz547PBofV8KaSaL1vpG0csymQkSVEswsXv9dYJ/S9FqLSDIDRQ4pH0PeegIsaM+dHgwZoHPUs8bTuB0I/IecSBDBHp9QFszU5lYb3T94YkC5j4FbaJVt1w2f633lbhjX6cyaZlKkZlWTrBVDHUfiPTpN0z34xa+XTPVJyWTzNF8QcIEDxAhkaACZD+nrNgopMQ+EGB9ZLgOt90yPjI2XPszxw4OP3TrZ0f++SO3z/4WgLyYyS7Ukwb2i720xSwi4o1HjADY9cACwJHmgX/KL8lelI+BuRZgKwlW3PHSE1YWG9Cnaq8qW0eJJJj03AQ2CWBlZRHXAB9/6twpADgFoPICCIGQ32ALNCJoZdKqclZHNEnOLOk0YGxWfiAXB2kREl2citJdsPmqQgXRPUD2Sf3KGtZvhvd/EMjkGAWAetLEM5c3i5cuXHweAJ6/Xn26rgi/e0ICIqqUu9fiWwudmWEYfwW80P9qBss3grZaLNRPdqXdjojIi4zStI4CE0SRvFYT4h+Mj6QHkjq+58D+oXR+tllPUxBLy33KM8pzBEwEmdSAerNUhTIBV0jzB4ZxmCzQ3CR0cts9x8iyHX/ygCDYkRwIJ2lljytwNb3Cyn6ZNYoz2ZyA2K4py2RrJsDVItXKJxBrApNCgsgLKFZW+5uddt4bG82aE1P12pGDI7WDs83b5ifr/7CRwkhO8P989eL60vomAWITiWJywIiIa4VIAOxaIKj97YYAl0AonfcQjHfdekCdSK+w0UOpGmagduWMgYKmBV1e+70GrWE8Yy7xuoLPZAwhYzAh4/zZBm7r9UJE0Gdw62gIlCXlNeJaQyQNVCfLIdyIyd/2T4/hD/35k/qdUD8okPRoUnPCsgPGRQHmhAnw5lHZa+M8JuB7UPSbkvef8QsqJMcdQ0AqcQWAPrEACIAkSCmpqIvGDTWA+/rUBsSW0gn3TKImUvv/BaYoUCgvmPryBXBlX2VvQOOeJ058GlmN7N0WGFCA5x00481o7uotWf3eWjTuU7Dxat2BYMPFEFUWDCb+tQ9wu95GRFQiz/uUJE2UMoOPfv70qfc+dvhv9Ar5j7/5XYc/cPTAiKglaZr3N5sr63k7KygngKQhMEVUCVIIWVRKFZllUaJdgdui7IUd/pYjI79a7qzQuQb4QsHWCNZ2SNRx8LZsTSGRR/51+6C/eHgfN/wbEGsBUelxRiaQLVD9mLmBOvaC/0Hss0bvc5/ZyELSn0XZ/TpJKs+hQGBSBKAQAIJI5AUVvV7eXwWCAiSghNr4UAJ33jo1gY3k7+xbGH7yT7944Vc+/dTiR14+t5EjpohJAvI6EuIRETcL0mvjooh4s4GWl0UJBNJ6DjkFoJPjoRLoXkax8PgXRnTzyxVJ/4j9wvJKEqzOWy7YGJIAfoGBTilXu0kAiMaq8/VdQ5JEXGvIG8zb76BHBpLOo4fqx84X439HO4YUiM0pc8XddUrZgMHM7bABShYnAfhbp0w54g4IQBJJeYP+lfeO4e8DEQQKEJqg1GQIqYgSdg2g6vsP5NsA2TlQpLqK2AAyhGxFZ7nsLcllpYmzvOoVLbv1ZIvORERsi6LoUpIMI6JAIvncux459KMjI/W5Rnro8bmpJu6bGqqj6OPyeq8jC1kUBclEGK8BAB+jpSGt3yC/yAx9N6tY6JbblxNccCuIrs0c/Gpv+vZ6MB+4SlQxb92/vOfuPjp3BysZZGIONBziRXc6PQeoXYb4IO+zYWl7pn0Oy5fNHgGT4YbsH0wxOVJfSRMQSYJCSqB+XuRLi3K9vZHXJ0ZrzZmpRnr3yemRhf1DH9g3N3LbcKP54aEvXfw/v/zChc1E1HDvnToTEXHtkZbW94hdASVS2dZbshvmSDmArPgFMK4hvlIEqxBzrlsTid+wCmNJa2VKKzFu2GwUC1Zrfuj0wDWLZdnWBQINlXuxzLKO4XoUsSehRoBIUAiBNTRKhwSSkqQZfoONLJflWed315e1qaQ2TLNRbwx3Xav1FplM/rxyPTeYOofaW2KSWahiqOcARvbqhoHz2pnUDYaAVPeNtW2EkoskQeQ7iaFslAfRVuXcAGViwDMBwlNSvBK+t86KzsrEYQg8n4rdNKOSVeTlv0lExM5RFJskkgQREYno5fe/7ZYfLPr0T77xiUPvPDg/Imr1tEYgaW29380ymZMgkaaQoN5Tbo6lcDqKYf9N5CHPhOzmlhLPRrSSf59Ztv50Yw4T9AkAW8bIds3G2T3ywcwq+VDCYz84B2d1L7RtEEgbrIZ2UTGB9kE2GlPOhjSo36ijguwnsW3bGCIf3HPPWyAI/hacPSD7i9/ip5rY5VB/fQBAQgAKCVhIKrrdvLdMRChwaErUk5mxBrzl/rkToyONf3n04Ohvf9Pbj//yvqnWs68tbgJiiuYo24iIiCtH3AKwa2FWIKmNBE5Ns1Jl0ti3y8E+XYLvD/VLupPKfYLASf0BXd6Sb6LyokIQLnF+VSyLO4JSbJGoKD0QsacgEkSRYB1REwDawA6oJQdPmQPgY9ApSFTxjP8embITVBPqUeBNRJOAzShH5rA5hK2nTMSbBwJpjWNP6lQVHWy275ikHPC9l/hQDuYstGQrQcUwCgkLVjmzYfQnjLxqxDWBLAoSIjGRAF/8+seP/GAzTf79ex4/+Pj0TAP3TdbrCRAur/bbhSSJkpvGpBQNmyLFz/Cy1ezCknzXGDCViFmtvkpCfHJX1zWg0vBq2XCvekOM4GMGvC42aGlwhv6g+wOuh53iezrZ5yt9VHALK6M+S/Xbz05u9UNASBNMUgFCElGWy+Lycre9sdFLJsbrzYmpIfHE/fP7D+8b/cvz00MnR1q1v/2nT53/5JkLKxIxQSHqUBR7MyItIuL1IBIAuxVWdCKgyXbOb1mgdme6Bc3uW/bcoWahUUIfDXMeVOhljwZQnn4n+b2FwVs4lfsUOHvt1igEXjT4kGWY7LoVBhioIw+S0jMRewgIiRBCJKKBAkBnMiY9ek2sP5RjAYjZRIFfxDlMTEmviH92O1OazB4YvjfF1m+6ZBNYgOqedPd54xHXGSQIQJIRWWYsDIyi0wPEjI1AQpey/1uYcaDKWorTylJLH9luIPpjjwaSE8E6wLqO5kABjyTzid6IiNcLKQsSSc1EAjz3rW879oMbveLnv/6JhfceXWil9bqoEdDQ6nrRyTLKAQFrKaQClZlPVn4buouMGNVAOyeDacEc3wGlu0NRWzkLvGedT97ZxuGqgFWMXLhDyPWXwjoHUYvmFZMVwTJmNbiKpLfqNuvUQBa7+o8VFrcEAP8StI7G+AL3VgAKAqQCijwrso0+ZAUJwDRrjY838Jb9w7Xmo/NPzkzVf+3I/ta/ess9+34LAU5L2QWR1FAWWRRSERFXgEgA7FIwv7dE1EfnYFldMxSBzW02QJFz+9oC1ZE5iqr1XNT2jVma9OLEDX/+YgsCnfXG72q4XZvd4J/XuVAj9i7U9y+EACEwVbkA/BHHlT4XhclcoB4JwHUpe4pm6Mkotc8OYyv1cFBaDfQuSNhulkS8mSDQxr/3zRjaVJ0EoHJMGsOaq8db2hVUNYK4dAuMFb9PlXLRc+kzZ6CLfK6ii0mF5eqcKnwXLwBFXSHimkEWGaFoImKCRMUX3/7Q4e9LE/qP73ty4Z2zs00xO9WoochhZSXvZJnMZAEFJJSgMKqA8f6Tz8Bpw5q8rTkOJfUgEOSleTpIa6r2tribbCpav4dHzgHYjCHciQJ+Ob5lclCD5dvkFLAwmXOopw2qleejqW62/GRAsth1LexCWAOBis5TXyclAoUQQhQE1OnL/vmLnWJjI2tMTdTr+2ebydzMwvFb5od/dmy4dqSb0c994asXL6RJgiJtYEwOGBGxc6SEFXHjETc+OINMZv3ipg6zyu0G5irTGytY4iq4BcEonXat4bUOMG5Kr9H75RcJyoU8QNnkCv+DuAVgz8ISUAIRhFEQndqFLm5UTwd3KoB9nG8htc+WQxp9us2L2GcEAlnvvq7T3mY5BrwaUacEcDdraQuzPIY5Xm8QgSTiubittGXjxzfES754k0HAKMYlvjNE2dNWprMGkASheOe8lHGbIpeyfjEo9T4OwYhrA5JdStK6iQQ4901vPfrD/Uz+T+99Yv83Hjs4UmvU6zUBXVxZ7XV6/aIPEmRawxSF2QlPRrSrDYhsHJMrAQDO4z+wL/o3J3vNe09Kl6ZCldve/EaqLgDeNLK5NjgZwRojALfZgSla7pHy/DQt+/O4ClwIVUggzYZzzcuTbl5yQJ+y9H1OTI6gpmeIvOtkCUgABAECAIuCim636BeZLKSUBFBvTE224M6jU0MS8PtGRmoHvuM9x3754NzoJ149384R6whJAhTXyoiIbRFZ/d0Ka2CQIKKCGAmgNUQyADLrH7kELaCfp7BSCi4ja4t79k0UnmPOiXzvps8xuyvAjpliVTN2PlCQw89uFWifBfGIiYg9DRTa+Aem29ixz1U6MybBkgEuusYfzEoHC1QhnrfPThz2rGf820rcGAZAQp25U6lA4E6Ud89F4/96g30nlme0370RY+SJ12p60xkXA6OVONXkvIMuF4pPhHojkg1nLgtDQ8Dl62ISW68WvkPVHCUb/QQR1x5F3qcktZEAzzz5wOHvR4R/+01vPfCN8/uGk9nJWipAthZXJHUzyvICi4RQJIIEqnyVTpJa8o2CGeJgR3EYhjVI12C3Q2teiXovdsxvw160hxD6vTIihRhR7HVNt1jSaUo1uR4G53dWlVPCKtDnvHrCvx4XKqVP6NrgXwE4eWW3Y3ibi/gnUiSk67rqg0ACTCBJAFBKkKtrWbvXL/J2m5rT483k5K1TQ/unG99xYG74juHm2b8hnrr4Ry+duZQL0UCRtlDGNTMiYktEAuCmAAGQMRvYUTfqFpmcVcx2h3BVKS8wmpV1a9CV9MbWUrqKYCU92X99JjhE+ao755aX4lxyxF6Gcf9jEprryspRx2J6Gg0nn6z9ro4/4iRVuSUzOXy7j8Jn0I3z0slTjMMyc9ghjuUbA9yDpf9T3xfigBwAAYVkUW3Gh1eqnsZyMRNfHNwqtUlbSdiq3rmtYGqEo9zioYiIq0aRdykRDRMJcOF9Txz5UJ7J7nvesv+bbzs82mjua6WY4PDllazd7co+SCJRAxQqxT93T0Ao1n2b1WlBZR3F6DtMT+GdDNcH/2Il0Lbqt1Zq2051vz6C8Jp70p3tEXhPuGfF1KlO4kO0z/qmfVWSZVUGS0TJIJkWPs3/0iYyg2wP2KdB/znXQ9W0QEBK1Gk4/RzyjXbRLfKelAW1Zuca6fxME598cP7OWq3+b/ZND/2Ltz9w5Dek7F1ATBCxhkQxL0BExCCkSKUdqRG7BtbSkGbHpgAnRpkXssImN4bOQI7cgcAuLG7BYYIcGZkdVhMSvSpZgeF6Xeue58o3jDBsmy3AaE/iMtmruPkUh/beBEIiRJIIUTeRKpKApJ4fZHwSaijqI6ZADSEALzeg9SdZO4uPTQQTzaL3MbousIGt6iNeoemmvaZPF7QROioZG88cGHF9oaUqgnB5Jcx1fRSZ1V2NJNSUE1Ns1bAxqr1vtTuxFhwbCEF523L43v0bylXdFRuyyz4BS99tDCqCKqMg6GVExDVDIXuE2DCnAzzz2N0Lfy2XRS9NDn3nkYOjtZnJZgIghpZW+tjvFxnZwwAAUKiD+pQqhFY2O22AoKTmBjI4VFf4CUjek96bAXNhEEFQWSFbXwbOc9DpAsi9D0hiN99VXeE+fE9hAyOxTAFyGRUsacAXQ3Ot/Km9Y6HJ1wHdpjtyn4/AJytQr6mMDQiiSPV3jKKWQiolyiwrsuXVLvSzfmN8rFYbH2vg2x6eO74w0/oH+6caD3zTE0d/YXai9eziWhcQ60jUj4toREQF0ric7044ZQ8lwlbnhROg3fZ8Jd92lQq6s1rsfmrvole3ux04QbmXqqTEMso8zJuD2hiDGKsaAQLSNIEkSWqGALCn7CmzeqDX1iAcg4PNodBDU6LfgCtP6p1mG/wpxu4GrFnEDQDH3HC3HgESKeZmyy+q8quuwkAX2xs0JnZcFW2xxkREvH4Q9WxOACHSiyND4h8VBfTf++Sh77r9lomhQ/taSbOGw5eX+92NTtHLJchagola9RULW/KhV7g+OAbY5Fv3c+Adv7ayEb6z5yo7tZUA2VHnq8jCrbsxqG6/mE9E+FfYH7+yj+VeDPqICABCgEAElAUVvazI+muQdzPZIBStyfE63nl8bLRZF985Odk4Njs79HOf+fLFP33mpdV1xBSJ8kgCREQESK/QKoy4QZDnHUKsKZ83oTT7qwhJ2zbOv4N2pycyAta5GgEY62r3Iuu3xoAiszNa+ZBwQOCII4y5e1M9CbxtcLcdDR+wAfaZICWbx7CzlRERQIQUQpT7ewsEgAnUaqkQqaiDQJDG/DdFzJlpzimCzisLnmFuEjVboqo0nLiSqecZIZsI4UPeGcpkZpKK/Vdzl8jEKOiNkYQxCeB1BwECCc5YGumi0jwwbxYA2Ffcsxck//PEGCvnok8MmeQPPu2z0+LbeQ3J1E1s2wprjEtDJyH9IWV9poRgDs60x65HRLzBKPI+IdZQyhx+/9Nnnnno5MKP9qXoIYrvuePoaGtivI4FQTOTfdntFX3F6pbTszL/tpsgrJSbe07Qm/nKtQerTdg5yQP6/Qz95R1d+nqoY5X6YAv6XWKTlqf847pUoCq5z02sDi8skuwa5/01zBY1Exlg9o3yLnpuJC6r0FvjnExSfSaPCSGbEcEoc1ximuw8ZP5ghhDVx/giAiYJJAIEFASy04P+hYsd6rSzxtRkIz16ZKw1MzP85MK+sV+dHG/9Qlac+l9eOLXcFyJBKYsoxCIiGGIOgF0N3ytlspn7Jbbgd8rkLbs4iI2ukqFBIfLveDb/DrsT3LDL76Cy8SyLCANEACFQCIGpVWyctUZILkal7OlXxxF5BxVXlPNR7SYpjX1WlzYcsaoN81qdYrBVuxFvHgZ8iVs+ERypurPHrhG4wXClcEG5mlpABKpdq55FRGwFs29bufXT1aFW8g+KnHrrjy988MTR8cnJqSamjWR4ZbVX31jrd7NMZoiIIsHEpKu0hiTblGOuVqo9O+8d8Pqq7hlc2ewr92QrWUFhwYGFdX8RrY0eFuPc49Z1+R0zzw0KprPrHG+n9J6ttMge81gU8zfXF4X+lgmSIqdisy07/V7RlxJGZqZFbW6yjo/cOX2gXhc/PdKqLXzss2d+5Y8+d/qUHk8Q8wJERCikWxqIETcsRNpCzUcLJyDtGSpA1qfp9nV5+9pCxtgukx6/656xC6khBgwLHai4huQ1R73Ya+xsmwqrRjlATd/85dWuBSZzrS3rGHOz9Y8qjzqM2DsgQCQQCCiQhDvNXDnYkYT16iP6Y5E8dcNBGeOGgwqIMdcs2PnDNCo1abhGhXbyERpNh7TSyv5TOo7oFz1CHBRvE/FmwmilzLAgBAIk/WNCS4xSHJ6lHbgIya8czN4pt9eXWDnnmqSQ7URTFv1gEy6W+Q3UI05/ENs3DNoDK2u32TATEXHtkQoBuczhjz9/+tzdt85/eHEt++o3vu3QT91/1+SBsbEapImsUZHT+posCklSFlAkCSZWCQKolNOaXfAu26UgOIKPKyZc9Fstifg89p91+ox/14SY2dNmOEnNiedgzoaXjdMHkNVt6jBrEFs51C4Js/aEQshVwuu0CfmsnuhoTdxW1wrknif4iOmgrvOkFFUlXG10gASVd0VTO3r/p0ACFCRQYCIl0Mpq1s4yavTGssbwUB0fvnNqdmGm9WMLs6373/3ILT9ARKcQBaZpHfM85gWIiIgRADcFtNVt3zsa139lyvovr1wSVlk/yG8jv2Ov7VSNDCnjUtsUtOgvRAiQ7KidiJsSxgxnx7OVHBwwYHTxOq6sxQFDeweeFFcwklc3LgIldtAIKbnmBtx6QzC4hQrpvyU4jRVHZcT1QFYU2lZHBEjakuDf94u8s9Hp/cQDJydum59pJAv7h+qrzV66uJy1u92inxHmiQCRCBRgEwST/deIXGPAc7LrysCfqZ4dRNsJi62fvyJcYRWljl3Jn2CHeiP5SppFuOuYggo9v5FiMQAcL2HrRgB1FESKiZQgs0zmK6u9vNfNssnxojW3bzi9/chIrZYuvFcC/esPvP343zq8b/T50xfaecwLEBEBkJbypkTsMthDqXUmciMm3bF4aDxLnqQ1x+eEe7DsG/XL6r2GAdZcuRHLRKw2sNurdXt2b6xuCY0H1HNUcc8TATsfG80FcBx9kHaNgIwHTu2dRvLZ/Ti89xryvEdPPngkEYgCEW2ECIAZ4079c2GRaBxDA5L2+9qJy0rB6ATjvWVRMdZLYr2urjy6eet2dyNpL4vvyr0aFTXiWsKnkVjqfOvQUgeumi+eBZdY2Qnmln7S1KzNEJb937SGrHyVr9GOR9UQk99amnvjlICNtJIX1KSe8D2LJoYGM7/XERFvDoiIEAU+8+L5ztGDk7+xuLT53PLSws88+cj8O44cGK5NTzdFUUBzmYj6mcxJAhUAUiSQ2NNVVEVWmCO4CEVP1nIL0/1SbDKzTN0JHi7fBnGXNi9j0gug07nUe/2g1ziL4hkU9+Ud6qTnuJ3XfN2xjbg6rYwg+7n8z21u8VJOriCxPyP6riXnnCHz9yDbAwQrAP0jDIMTDBgrrs8jQd4XlRaAdHSAlpcCUACINEXIJch2j3r5Sp9ygKHpyVp6cH8z+ZavO/iNc5PNw//1D5s/+keffu0jZy6tgxA1lDJuB4jYu4gRALsUnvMQ9ZG4WJLi/gPK8t5e4G2h41WZIlv4P/3SWxXcYftVFRABgaxQjiP2INS3nwhIUM8LPqDsNKFrOU4MUcW6wAiEcDiXrmkNyd8xrjpYTxrR4rqhUCYh3S3jcDRfPoIN72WEgb6p9N0tBmHVuLE3qjswsMIKqTmwxdAkuaZTJSLiKkAkCUWCQLLf7WSf6Hayv7XWyX/yLQ/Mv//2w2Nj87PD6chIY3R5udtfXe93sozyXIJME0xSFQ2g6mEbCT1ercrYtpYrM6ztLfR5wAq9KjT4B+s1b5yI35FetlVhJsquFOVHqlbDwQ+j91YAgPSdP5r7UDl/ADHBhArELJPU6clettgtuv2stbB/qLkw08J3PDJ/F4rkl2tp+qGPfubs7758bq1ATBCTGsi8G2VcxJ5DitG5tCvhPD2QAGJiMgAiW+gAQOUCQB4yrxclm+2Vs9F6HbOMubsfrmGGBfZJB69fVhdG04BpI9xnx40epsOWIuhsJIC7RiZNNSGZPhFBUfGXithDSBJoCKHmhcporkeH3mAPZcdPMFB8vwaG+0DDbJth3goKZgTfL6nnHrq5oc7qQAFqJzkFp2zETdg3BhCIUCpZgwQgwWYgNy5C5w40I4zluNIETyhrrZJNrCV23d5H8OwO59C3D/j+OLIOQuB12Eod5WQyTxCBNBEzJhWgSg9gIgAiIq4PSBaEmOKFpTb86ZfOf+n8Uv8HT53rfdf73nro7zx+3/Sh8ckWpAh1KYFWN7JOVshCSpSE6AU3qkNa0MloG7bF9rc74aynipu3Vs1SC4M5xYUMVWbuucge3bCvKrHlgGtm3A4PYh49K9xMTPDyMHl5Q5Cpb35AgC3vEvQzuWCVP9dn/1AnHehkGnHZplzdqLz3CEaukS1nz5NiH8VXOsHqgcj2EajvRtqy7kuwMQMgkEQtwUQKEFKSXN/Mu69d6GKvS/WJ8Sa+/bF9dwy30n+FiP/34uNnfvvViytARQ5J2sQikgARewwxAmDXAwtSP2zlCL1O/PrrRbiabdO7q2k3XChL7fttS4TAXIrYu9CKkMoCmFiNR5rT9fSukYFz5PW0OuACDb7lX3WKnKEpTBLAa9LJiNcN70StEAQAAlBpvMQKD/jG7fDbUuBdUe92HgEQ3in38drNjoiIawOinBJRw8XVLqysXlpdXSv+XZYVm51e9nfvu2v61gMTDXHoQK0xtNavLa30up1O0e/3KRMCRJKoc+S5yap+mZSeW8wCbpxC+JrNO/SvAuzAe1450arm5ZXMSI97HAhPYmwlfsJ7O+gGVr7b5sHAF8Q7UOGPckSofQYhTTAhAMgLWRQFyeWV/kavIxsIYnhquokP3TNzsNsrfjFNsPnJp9P/9tTXzq8g1hBxCInaUX2M2DOIBMAuhecFB+YJcsQwKluHCEi45cuGpOrlwadh3UvEysXMNaKvDsxszaln4pR5RaXVdbglMGDAmT2E+kOQi4Dgd0s9j7jZob9vATUQKJQHB63lrzwcztVi/SZ6hjgHCZsjwMe1r/hZ3wTzsJrQbmReD/eSZz+uUij15FWnANRMyeiduN6wJ6zo5GJcTBKokUXkIqrQJsEK9+X6Squql9DIcJeVhQLeJ7RB+O2tBodPL6B/zYa0BB4/+8Z+7tr2LUVEvPEoZEYCG1hAAV899Vp+9MDkb716fv3z77t8+Jfe/8TBrz96eDQRzZrARLQuX+pQO8+KQspCqOPjEAlJOZeJQNh4LI+MUxSe2byvG0ZApU/Z7f6o5716Y53o4bw1q4RHOzghwvbre5mZ9ELi6rdSx61ULMcMgPOEO2VKz2GWh8Q3nt0TvqpUJS1UBS4/SLXeFkY0of0c3Hp3fw3kfQ87YpIOGF1T56ByamyoeDqyRggUiAJlTkW/L7PFpV6vIGqMjtbxLQ/O3DYxkf7LudnGv3vbA0d+iSi7gNhAkTRRFnGtjdgbiATArgdKY+Z6R0AxgyLMmX/luAb+9YrHBvurrhBoiICICKve5FUDwvIA1zgCwGvBI9bCfpVvVZMLACKO6BsOllIM+FL7QiuwJrzfGtAeremMjOrhV/3F+4b868X2tUUtOOJGhaQeAQAkaQ1lkfdfPrv87Dc8ceyHQcp//o7HFt576MBIfXqigXUBw0srWNvc7PeyTGaFBImIKNTxcQIAnCUeep0JODEWuCu4ANj6lFZvmg/ypIfT0QqZq40A4NXuYAOZ1y5/sizvrg7h57iSvqiLTooGDqHwcU3JGMIHkEQhqVhb77fbvTybzeTw3GxDPHTX5HSzLv5qs5aMvfexYz9P1HtVYA0R60gUjwmMuPmR+gcER+wW+Ls3IUFQ+4bRaKGamSazl42IxcmjTbjqfORa4FtCddCwYMorZ5rtbVabrcuexK66hsTWPcdmW48oer9cn80TfOOr/Yho0iCAv5rG4b23wL2sqKI70fzoOBGbqNipR2XPifrlUlwE44jMk367yqPhTuWoHMwVQ1L7jtFQFEjk0lQDQpq2MM87cTBfNzDCiNB6+kl74Iw85Q495cNjPreSbEVnZBCTf9ybBcDyQfCvn9dMPLCLC3U3js1b600z49Ip+qQdhNrHBuhVFBFx46HIM0JMEBFxaqz50vJ69388e3n9r73n8YM/cO/tU3MT4zWo1aC+lAAur/Wh18e+GtWkCVYBUs8JfViSA5uOasaj4QkA9DVVwHi4Aezk4+5wJM9Rbw66tyoUYwesxLcZQsmuI3Y5CU5NYndZ37npj+6ZUggAi47TqQ8AnQxDU5VdxsiTT14fkP05gC2ZNhLA+7O6rgaJCogVtE0H8oysvET7DALTcY0yiIiQSEKkhKSUvT5kKyv9boLUnJyoiTuPjY62avjB8aF0/tvfcdtPz08Nffm1pTYkoo6FjCRAxM2NGAGwa+FkE7Kf6vt+cqira+f1KoII/GBcU+OVS9jyE9WfP2IvAwFSzXs5BYbH82vdCraJHNnp+HSzxCklvs3PIwB8HxJZVcevTACIK+9JxJsCpkRXfTNq2Kl9AOH3bctwpbqy8p3g9cZ3ha7H11dbRMSbDaKCkrSJS2t9WPryhYsb7d4/6WxmZ9bXe3/rrtsmj85OttJ9c8O15lA9XVnNe5vtfl8WslCbIwlRoEBkHuZBKk+lCN5mrhhWjdfBHwmJYbMS2H+uhdzfQQQAWjWRMQ2mu1WM9TXo1pbd2a4JqizlgjEsQavcQwIgTTEtJMl2O+tk/Tzr9/KhmelG7dZDI0ONRHxjvSaGRQo/+fEvXfz8paU2IKZIlMeFN+KmRbqdAhxxI4MAgYQxL6wXiIks1FvcwiA14yFVtfhkgmKFNVdt2GeziJkVEplXn/WHLx6mnHpJTl4zGe356kNnqd1MjdUPeb02Fl3MmB4BbL8kaac62YwYysFut1wzEgC9YaYQXOCHtqPx1Ohb1qtjsrRb14jrFxvPZq6hzuCpT7JQWQoQUAhMXR/imL7+UCSm8Z+TVtJVnCmgFWDamabvOnlkR1lodPvXnQcMWSmy4wrR5AxwRrvrVVi155f05DHxLoORnkBkz42x/cJ4CkDEjYwi7xKKIQTqw/Ovrq7mufz1Mxc2P/+W+/b/6JMPzX/g7tsnR+f2DWGr0Wuev1Tg5qbsZTnlgIQpAgoz5slQuCx/J/kHtCpY+W395WZBYUW0Qa31Ij1vXQSjasDIEaZgmeeBCQ33mrz27b/2VAN7goFbn2zfAzLCRYKaBoy8oLA51wXTT/JlimmrpMdZCcZ0Qf7RgsgBu8ff/BGd8NKRFIanUGup0X2J6Ymoo6rcyomAgjBFSHIiyjLIV1aLLsk+TE/Wa4cODDfe2RDvrLfwX9bq+KGPP3XhE6fPb+SICRIVcfGNuCkRIwB2LSqs/RKM23PAudWl+swzW8PnXQNlNnTxew/tvI3B2M5DFY2lCD4qt6CDuPE/IBrgykes05rKDiSfMvPrRiACksb7jwITISIBcKMCfeUSwJPINpR+y++tmgcoIRwn3j2TWPCqRGpVw7TFvYiIGxckVQZ3IVJ8/tRq+7lXlz/79gcO/821dvZau19874nj4zMzrRQOzrYay0O12tpav9vtFllRFLIoADBBoXeLWfpO540lnmMoSN46wD3uCOMql4WnxvAJ7l0bICACHcuXC8y49hxBWyM4HdR+3kopYOveWhfboXirfK7qWV/nDOWUIR/4Im5IACJD0wokwBTTHLHo9mWvv9TPspyG5uYazf1zQ+lbH9z3sAD8RQHixz/2ufN/cnFpQ4WIJPWYiDfipkP6+oyxiOsHJSY1IVqQSW2GYDLiI1iPotnatZ38YqLXZo31WV1VitfE2Vz9PGljhy0S7txYB+eCVY9h4Plye2KDhcZbMBEBie+KC+y4KLP3IvS+f6vMmffmjHPrTQXQxj95oY92LAVOfJfmXb+3xdX4RuTKifN9uPmHLjeAnWpEZg+mOrEAAVFAkoi6rScO4+sMX6003ja1f1ab4TpLtY6eskLLnuJovFLE69QhKVBWdk1YMj9ZwCugx5BzkLHsAsyDBvwYdPIqAB1u4BgM5X0jM071eGSbt+JAjLixIWVu8wIQ0YX7Tsz9/Etn1/77Ox7a/+Gve3DuiVsOjKTN0bpoNsTQpcVud329aOeSZIpJUksodca/8Tgr77WO82G+ZQAAsmuDv3Lonf6e7hLqUqpyb288os0rEqrmyMLbyWbj10cSaJ0Lrfc/pAu5BujyKPH7qqtK8liGE1ikGoBtx61fZY+Py+UUfgBfdoSSxMlF4h8B/CWXXLuEEPqUzImOrgUyuX/AfB0IACIBQQCpzCnfbOf9y4sgpibr9X1TQ8lbH9z/UD2p/3IjTX/iT75w9mMvnF3tyqJva50dm8RLa8tREEbsesQIgF2LwBMEoUD1xeC1xBXV5xU2PrESfXAF2MartnUHIvYIkP8YdyzXDQJvv7GdKLx+RS368Odk+VWYHZ7sM6qricD6/MRopQMp4npCApEErX/r8/+srcC+VaOmY0n5VbevpM1BY2CQPKSdFdsGxv6JUjRiN4GoIJE0UGCKBHLpi1+7+N/e/8TRl4tu75+89eH5r9t3cKw5MpwCilazVhPJxmbezXJZFAUVJAFRgHB2O0+I6RvOW8+LshG/ZdmSkyRwfGzz9NXAfg4+wytkxda9GNDP8I8UOHi2qs81HxCXFaQDI1zKveCrpyI0CQBAJIBCQCIFirygYmm5t9HPitbcLLbmpoaSJx5M76ml+E+TBH6ikPB7L51bzkxOgDwnmB2bxktri1EsRuxqpHEE704w8z4xmWb54mTsGOcdAp9p1i/QK0RlTY/QF6IAepMy2de8P+b4q5AN9/vORTZ73suszWpVVHqFd8vc5pneARAhgYg9DZcPQw1uQjS2mrqPaIsB6PlC9gQhW6SUPBO5J4SNbDuRJBivK58F2nmkPSvkuzj00DWdMJUKgakQlWpNxJsOrRUTSSQJ+iRxTTCh5pnsmdb6kBR+yLbZp88VUt9T5q4H73kGb1Cpuv1oKXRnbnv9NU2jY7jKewXcEqC7h0jakWiFOwJSbed/q4iI6w9Z9ChNmljIDBATnB6tP7/Z6f7NF15b/+a3PLj/r95/Yvr4/tkRMdSq1VZXe+niYqfT6RS9jKAQgkSSQqIntVktEIiIe7g9WzlUUGzYmHF7BB5wNFLFnGtPLvLHpBYw6wxrCInt/yezX57M5LXrkpMiJgm0WZf4OSROgUNwIonvxwfviQq73n4e8j4+l0nEnmG8irvo2/RWbnknRDl10HXYxCOwzjh+ARl7ifZDKOJW/bGEICACURAW7W7RX1zuCRCiMTXTEI89PHey0cB/PlRLfvqeo7P/GUC0zRGB02PTcVGO2PWIEQC7GmWff5W5YM92uRJUUdyvgy1yPSj3eafPhzXxWixDr34JiNjT8AgrGDB0g2FEPs8U3gseMQoFOS1pi75Y4x+YXjhg/gISgDBpAOJQvrFAwI0Avb0EjVJulVte3vwq39Rvy8J2J3KxSkSX75a7UbprFGsEdAnKzOcjABtCGxGxu5AXat92LWnh0nof/viLF59/+UL7fz6/2H16ZbX/9x6+e99DC3NDzcnRGjYEtJY389rGZt7r9/NcFlICAopECHtGK5LieLlV67EAHOGsqZx9A8qUy3mG7jYt7VRXuzKJU9X/LZ6rciZtgTJ5iVU3S22Ga31lrfpYbHSMBgAhISIkCQoUgEUh5fJafzOTJOeQWhPjNXj8vtmjDSH+J0koN7vwmy+9dkkitpAoHskbsfuRxoV9d8IFDKtfZuuX2Z9v+WYMgpqNN8oSqooyLclmy7YyT7+ip9UjNuOrz4Y7Jpt0OVMZsjqdUWb6bVluALvXFZ0zlDHBrCrSbDghIBCi/1eJ2JNgrgvU44ZUmgg03lI3MJkxrh8zfn89wNDz4qhr5JpRYw59pw+ZEzKI5xg0edf1VCF1QpFOH697IFT/EAAFgkhFSxEA6O//jrgO0BIKSegTp7XzneWSYF+29g2qUcQ9V07wWtiRxVyJXpEgrbbjnQCA/LIs5ICtB+VNVy53eelz6kQyjgBAPg+ulEiOiLgBkBUdEskQkszg9Gvt/GOfPfexC4vtv/LcK6vf+vi9+/7SY/dM37p/bgiHC1lbutRNl5ap027nvbygQgAlaQKJEIBCzXudA4R74gGcF1616bby6+tGcSFXQOk+esqZdcDQi5o0DM1tP4cAgyEZtV7k33MyAaBMPttFLajbpDDgPiTnnTed8utynn8nM5zVzT8A09bQZf539QacaYkbQVal6qA79YARmag/iNaF7VdFEgAEAAIIRJSIKAui9mbRW7zUQ1FAc3K8Bg/cPX2wl9HPFgX1Tx6Z/R0A2TWRABARsYsRIwBuFqD9BwBAq4hb+809eELZuxHc37ITA9VK3tGdHNQ3uLUqut2ctW0/tdxBZyNuYnjDtUIhIq6nMAyys8uzwxlyhlYY0BP1r5mNniYU1EhAZuCiAKG3AGBJw4q4DmDfE6IleViIKhop62RtGI4barhbt1Y9FL3xolupqHPAkKmsk+nKhqnii8dgf1tExO6BLNQpAYgtPHOh03/1tbVnbj0w+eK58xuf7mf9f/b4/XN3Tcy2cHKihmmKQysr/XSjnff6hSzyQhaCUCRYQcUOnM+lSbnFu60fxeAFBdfteyNw3JEzRvS4R3Y8hUPdD8M7V4wq7W2rsoO6umUdfHW1TiXtELBeJU24sySNiUABNZHKnIq15d5G0SsKoObQ2FgdH7535hgQ/EJBMm938//62uI6RRIgYrcj3YEtFnEjQlsTCFggigRRmNOoPeVPnXuOTEf0GVLtTSJj+rh9WdWiN7xtApQ1I66NKgwWLCf2mZMLuPqMpXtML+V0OLgIAZf7gD2nfopyjyP2JsxgUjMhvE527Lmdi8YrY34rDzyo33osurHquX39bd3a86DmhqEJCECQOrrCXpPa+CcgKVWGgPDMwIgbAlqP1HEiBCohINmDHEqlyezsNQMFy7I11O65p1+/qnrASVSskrCVT/EoA68C0yCpmCqVM4P1NWoJETcJiDoksIGIAgFEP5fFn6xsdr//a6+ufM9bHt7/nfffOjUzOzMEw8ON+tJSN11c7rQ73byfSZBSkEgFigQZV8znBmPu3Okeet3gLm6rw+iZa/nkwKT3LH1dgreHwSOBmU/ezWBPPYCd32Q0RK2/ubz5oKxmZEKLWHds+tOwI6ajzksfMiehdONqnbpOTDaa9tRnCnNPuSd86jT8/NxPRlb5JTQ5pIRUC7Mkom437y0t9RJEbE6MN/Gh+2aOdYvi5/tZvvHxp4pPPn9uo20SA0JExC5EjADY1dBCF1HoNGKgRZ52GyIBIUEQUVppVRCLV1bVqF+hVDY1lC6bADZu0vstcRLau+frvbz5Cvj+NNJRX2oZitZSRBVIGdlAwHbEWJvJ09+IawrsZtWU4ZeDI9qsrQcDxrKyI9l+AjIkBYAk86AsuXwirhMMs+pC/hGMu9xGBGsZ6iuh1SlYKkz20NG23XeuB1m5WHmwhlfcVn/DxCIa+c02NTBO1T65TaciIm58SOoRAECaNPH0xc3+K6+tffL4wckvXLzc+2zvbfLv3XvnzKGJkQZOTdRFijS0vNFP2z2ZZZnMi4IkIGAiUKjTlqFEAlTNEvL/KQGtMe4b/1VLUOXyxPtRsbfNr6RK2FQzCxiID9WWWeQqEkcz6jzsdxm+yumRKsgpVSx/RtMPrwb9CjG4wqWa0x3Dz4wImKSQJEIIKEiureedouhJFMnQ6HgdH7l37oTMil8iKX9so3fuDy8st2MkQMSuRcwBsKtBQCSBiKQkkir/uFJFkZAAAYUAgegLac9I1y+9vf4QCOKqC9ZwCWlb8owhV5/zonqo4ifAOD+NgozA1VwK+uopqQQgAJOwroi9AdS7PxAhAYEJCBaqrekwoQoqOx1NFmEdJVNWdUCNRD0mtZlEJm8G6nwBZCrkrnt/XCOSrl+drc6VNUTEBBATABAgQSChEFiLpwDcKHBmPydKmZqsbwSKtd6EjwAsQ7ehK7f6XrVEM+d9AzPaw8fM/lcA59HTLJTW0W1Mv3agod+2GoyEbvwLMvLXvx7lacTNhLzoEiZ1Gw3wkU+c+83l9fzVF89s/I0H7ph5653HxiYX5ofEaNZoLi5164tL3U6nnXcLQqqnaZokmBhjmHubbY4QMCIAfEOZOcnL2g+6Oc3mfHBoiFpvPA8+qxjcc95b69gBLR+cYOBGtkdKmoucMq8gEgIXkd52RxV9C7gIe5mx70Fz9pfpj+Etww+Lri6vf0YQ6l/Ey/LiACqpqwCUBFDkkG908l6y3EunkOqzUw3x2P377ulk9LNrPfqhTz/92pfOXd4kIWooZRaFY8SuQowA2K0w7CsQSEmZlDzCWUlJlbxJ2RdE3LQnvxpPF9S/7CITyjS/ADeY0L7nwavI7jMFGf2IgfJnc00Fy4XPLZONVGWpZ6LBtHfBRoGKjGHjzMwLfwyq8iX1xfttt6F4XgkAM/YCZwVTXNCSBtZ2JDv4rc4i9P6dBAEFSkAgEIg1gUKnR4q6xfUHSmUMo/dl61MAbBRtSVYZ9lNvHAB3GqWtA9gTzIQP7pP3uyK7a1DXVh8Fzfgz9AKXt3oHS8V4j4i4yUCF8t4itvCFMxvtZ1+5/PuP33vwqdNn1793s73wow/eNX1wZLIOs1N1kSANLQnETof6kpCooAIFCR1DbrUrXaFuwLSEbpaZeEXmISmRz2HMvDkO1L3cHqXMeoPuW0ZAkdpc7wuVxEqSvKJTA986ipz/9kiHckNeTSUOtFSTEW7qtwn8K0te9ox2XhktQQgUSUpJAQCrq712nueyNjfcnJluikfv3/fwZp9+IZfyx3pPvfaVpbUOoGggyV4UlxG7BpEA2KXI8w4p1hpAbR9mqZs8S1vDO5dcLUVG0XT/AoRClzkp1Xsd72b3wCJ6T/r0grtdZrl9lZWvMR7nwCusyNCGoBlb8/kI/ZUrZk/fY3BqBbKJEEToa+cqsqOWB2zMrgzHRH86qTwb7Ck7D8FmZapIq2aVk6Dn2u4y/UZ/tkRcVyAK+/05b5gaDmR0e5+w8dztKjbLB9lyrF7vFitgxpNRXtU1q/Iyoko/xP51rfhS0nwe8oUvbw8AamnDd5tFRNxEIOoQiibqfd2L99028x/OL25+8YUz6z/2+AOz77j7ltGhQ/uHcWSkObS4mNXXVvudXi/rkySZJkmSCJWy1eQFAbYcsPUCyW5uDwxZNDkDAKBq3dJyhkxAJ7IGbB3+izCy0y1kui2sVhdDmWTtZt1BK2dYIfQeZgtkyEEYV42n16ErV7LuK7THgSRBlXA1gX5OGR2Yqtr2Qb0QCSQkQeZZkbU3ZXdxuZtMTTVrB+aHam9/dN87e3n+Dzc6+V//w0+9cgoxBlRH7C5EAmBXwzfqObR81ssQMuldNv7DGr07peq5Rb8VI63bYlaNvw3BsbSDMOj0ae7B5SuX5bApuBKxZ0A2LSXaH3TKCwK6RMnG8ncvrQ7mW+NeffqdVr7IJH/XRbz3doxTuSrwy5jgR2KXVIsu33zE9QQB2N0jYdK9UJZVf1f2dFQepj+oKYAyo1rFsAIA34QcHg/LdWwrssPnq0Qku6aIAcgHF46I2N2YmZ3Ay5dWiGSXAABEUkdZ9BcB4PcfuvPAZy5f3vw78NaDP3DitqmxVqsO09NJmgocWtugpNcvclmAlBKkMNO7yi519JnLAMOSJRknCAsYs+Qh2YOXwRc323n4g+vEjW/NIpBhMEuWul+RE0PoXQd7PShfioAod82XmFXCbWsMLu330SSndnGiXH6DF/Fqr2tyRAgQtRRTSUTLq712XlBz//xQ48hCq/62h+ffu75Z/ORbHzj8M0T5BUSBKOogi25csCNueEQCYNcDJQAXynz18Vcit9t+e+M7vD/In1R+F1RRKmC8V1RxL6jRONJ0uCqT0V4xrtPqtIfsFICIvQjDfakjzU0SQAmlAYfktu1rQkD7VP2UFeGxSvaNb8bx1+W5Qva3G69kGiYCAL2TBxEABGIqEGMQyw0G1Ho5hfKRJ5lGzSWRUym9aFv7EMNA/ZsNPctU+c+gyUnBVGlOAAxw8EFpHUAAG1AFBDrLNwFR1BUiblpcvrTiTTtZ9AmxhgA5AKTrKWT/bHW199xj92/80J23z5w8cmCseejgULLRrg0tLXWK5eV+u9fN+5KAkhSTpIapSt9CCBJI6ugam6tZW6DKsMeSIHEaElWsO+AVR3t7i+06NponrACtiqXeOgKbO4m8gCJTllWnHE0+GeAOOKABcsj5arxMUCXSwt0o8Sq8r7bRsCICL6wAvV8e0OsJAoBQkl6gIEmyn1O+tpn3msu9dGqyltx6cHjovU8ufHCz079w4sjMPwagLsl+Rc0RETceUhogWCJ2BxBAIJiwVJtshsK1gDxtkAtkY6ZYTdJ7yhndgWlDbtGp6BPLMh20B5V8wA55X74KOY+XTcStjSn0BH8kYvcWDKOvYq1d/n/SpIDvirFWuims3qE9FcOztsCOZ35toKODKXP+XfV8eYICkAQgqXzMCWKSCBQCEYor9IxEvDFwctKot2hPejTH54EN1kUjd02krRadzEgHADtmyW/Jv2vIIgDjzjcSkMd3mSSTIbjBT+wptGkwbYJKti2WEQAVNUVE3MwgyihJmihlBp965uK5/dNj//arL6997B2Pbvyttz164DtP3j4x0RpKYVLWE5LUWsUMez1l/ZEEkkJLCTTSwdjadllR2wHMckTmujG9HRvMctGQ0cuIrS9onzWyJZinRi4wFcouZeAb4IRcgqBV0CwlYatBTxxI84RdYj0mwVx00Qfmc5LW4sBIzUD2cWWS1UWuhL7iGADyFVZWNmRQ/RJONdDy2xIkiEIIkSBAIaFYXOpvFv2iuX9hqH7n8ZGR5bV9P3D2tY0/2djI/uDc0jrE4wEjdgMiq79LkaRDngWiDX/rbjJ8sD6eeiB7DLqwI1lD91QFA1xVkV4Lgkw2dpHhLLOriIJX4LXlsuhuB/J+KOh7xN4DMQVBqQX6oF/tUXe7tK0HRDtYzaAbeFi7qtXqC04pYadq+FupuS+FnMfH00Psw/qMY0IQiHUhEPpFn5I07i+8EYAA+oSRCtnC5KB3Td9Qcs7JV0MDmdMBynLS+fV88eszToY7MqPPU9691jyl3KroSJZTYCNVGR4CdJJDwGzg546IuElR6FBuxAQBCH73k2vPvf3+hZ8/t9j+9H2nZ7/vvhPT9966f6R1cP9oOj6ej6ysdPP1tV6n28uzAlQ0QCowEYZcAwA7C/VkDo8R9N6SKa9XrLCcvURWhvhqFoHn/SZjgbNKvLbIkz9Vs93KDNYdNLY3F2SskWpv+yBpssVSx0+bqmwhPBtqQNWmi6VjryylospoR4BmaTBFSKQk2e9TtrpOMLTWr01O1vC+28bnN9556J/lefGDv/F7q3+ioqhqSBRPBoi4cREJgF0K5KyoB0PXEirpJcHsJuaCPVhhSrWgDYRWdz0jhq8yVtz6XlK0R+NUGENcf9XMcqgce50yybWcpQUegeDFO8Ss1REATrsCHXYpFAlgl3ffE4BAJtpPvS+doxyqCOym0YjA0yPYvaBf1kHM5lHg9iACQhQJChQQcQMAAQClR61yw1wJOrKaujX8+fkTwBR6+8Zvoupt6UxrW7Xpix0/3rFgA7RuT5ITtxDIjj1LGCCCOu48bkSJ2LsgKgixaYy6l/dND//bT33l0u+89/GDP/z+Jw/+1btvn54YHq1DIiBNQbZWVgk6mcygAEkEgAIT66hxMl85b4jLCU+vAbNeuAd8g9UIG+t9D6hCpxaxhcjOeLLywEYRkZNMrlfmUfO8M/Tt5YB6BGA+ffI66+l1jKy0L0vUO4VFfALDXzj9v4Ndlb1EhUw8B7ApgIwarbMmEAChOu4HEwSkBERGJC8t9Tp5njfnZlriXY/P351J+hfveeyWb09F7ZVc5lBL65jl/aiSRtyQiATATQAEEIO0MyObuQQysc1O4oJ31z0JFa9NGay+NejawN6VZaMlqW0z5aBZ1hUv71V5x3SUvXsLoWeAjRrychcD8SRMoS2Ghnca7Keovu5GKtsDjnyA2gKlagiIJJitLDoku+yiiLgOUCOJAAq+46hqh5E++NEm+/aDSYiXq2ypJIHRG8PA3FfAxpU3HEu8U8Wn8dcE86NcXjb6318pIiL2LIhMNECKAAVcXOq+VvTz/3ljo3/q9MX2D91+bPzWQ7PDzf37RtLx8Xx0ZbWXr6z1O92ezGQOBSaYiBQTgcbsDwxi1xJ7rSkBb0KX16TyDPUpxmpfPni+HN+IH1y/JTGoWsYMCgTwyw6+U6qPleULOA7+VIMFYLAMh7FVJeIEyZzeypgZQJFCIgloo5N3ZSHl2HBzZGayAU/eP3fPpcu9X+z1ir/+x0+dPheJ04gbGWk0kHYpmNRGAqkDnPVbp32aI/KMMleqgrjAI/DCw4AJSrsuBL4rbWG5sH3fVC8Rw3ZVcCXcuVjW6FF3jJKNRp4HY9VprE4LxlCtlhCx92D3ABqnhbbaiIgkOU+HGTlEbk+05ba4ZmSqC1iz0pwqDVGy/6A+D954X8jEbxKC6pU1LdXEQxBWgYhi+voDAQgpMSf5EZM/evCgEsBIgMTsfv0VsnBT5XVT8oqrt8jkdChLXT1GcTXbW9S9MGiFb4N199C2o6+7ZIVm8JESxERIKrEB5zmiPhuxt0GUkyEBPvvMxXMLc2P/5isvLv/+E/fP/ZV3PLzwwftOzMwNjzYgTUVKAC1ay6HXo4wIJRIKSVLTar6FbDaGVcUwGtY4PL/Jnu5h+gbBUuFt6CfjT9FnCvAjlFQ5jyEHt05atYwtR57p7FvmwNPj+rtKOUHOIghYEW8NRf8CEoIXEaFTsVBpffYdVMQ67HHwLvuhV16y6s0hWgSIRPoUR0GISAgFFr0M80tLWUYAtfnJpnjfWw9+S5blm/ffPvs3AWBJoEBJMq7gETccYgTArgfKShLZ3oYSYVypwtl1IjSzy4ywR64OJpYrvUyl9hGqmtg50LIcdgGroDki9gyMkYSSCGR5LFsFxqzqVVkrrhoeIcAZNr/5clPEu6QKCxQJCiGuRb8irgXUMYD2e2TZudQlE1sVGu4D6wOndTtUHXtd/QaD19uPER6N67UJJkmGyZJR0XSpzYiIvQmT4E0RAZLOXVx77tG75n55caXzzKvnNv/yXbdP33fr/qGR+dlWOj5WjK6s5vn6ZtHr9mVWFCSFAJEiiEQAWhHAOGlmolbrTaUr4UzFUokyfMVrW+mhO1YlnkIfD1/rkKpqvhI5slXZAb0O19rSU1t9Wmvwa7+TIzZ0dBQhIAoESBNISAKtrPc7RVHIQ/uHGscODtfe/ej8d5y7tP7JrJC/8ZUXF1diUsCIGxFpXNB3J4h54m0CcwST5wzcsqIXAs8ucZSBccZr+9m6461X3nmKKtVatz/Lv2udm3bF4O2ZhNhecLTziumSLjLAHIbrs7S6Em3888RqmPBPG7GXYL2k0ro0jVWD9l9b0CXNtH5T9q9D+eg2M6/cGDUZg+1tLyMzAgjDUqGZrmBVEeS+HG2OCZEKNP7dqDtcX2hpRlQoaaMCq9DKMlBCGZ2Qsp4m64XyFXbD+XjEK/c4ld15pmpfvQ+yiBlGgpjQDxOj2l3/dnq4Hitug3wmAOIxgBERIVQ0QMvkBjh1YN/If/zslxd/760P7P8z73/ywN++946p/aOjdUiESNMkw+W1HNp96ksiKgBIuE1ojAO2mef1dduap1+ZK1yfU0ArdNCFZto6SN/nUe3gySJXv+dB18W8qAPSRrFX1imN/BP42pxz2AQqZEll8zIF8E46ztw+RET847s+2z6R32apQX1X/2nssUFodWJEUmG2AgBQgCAgygpZrG3K7uJKL52ZwuTowZGR973t8E8VhMXxQ1P/AYD6QtRQypgUMOLGQVzUdz2unTyhHVa2nUldspW2eu5adJ/0/3ZRjDJ278JoIRKcehEu8I5IQmAu2wAlz4bfwg4nS1iDY7xsdKatiJzWZwJC4zGtNx5MmDxzoysiFtFXVgNc5TfpHWHNNgMrHdVjdl1nBlamf1EYHGz+ZYPTkgMsSWCUrRERHog62jJsIEA/P3dx87WNjd5/7HWzlfPLvR85eevkHQszraF9M41kbLQ2vLyWNZY3+r1+v8j6hSyERBQChSMMvT03YWs7vDYIFcZuxZ0tHwuu89MAdtwtj9Z+A2TKADIBtr5cuqt9B4yc8R8WCCgFAUiCrIBiabXfBaDmzFQzeeCu2QObffjQucvdpzc7vU9dXOqQEClKGSMBIm4MxBwAuxTO301ChTqj2dYFmrpUDiTiRgZjTwPDxOqVmvl0uq0R0dqbGWw0Dfe5GjbaZ3mJO0SN74tX46rgsakmP4F1fJFxT1n3LZp8XJLcntwt/3IRNzeM110ignSj0m2v94ecG7YEaHYUghvfvCww7wfzwLiCfE8j2vHrkherkEKb1wK119WMY1OjdcNC4uZf5AGuL7QCqDfgI5GVdYCAakcoGq87entHw6OmyMlGr37zirvfPE++Htvh3n4zIJHVQmBPYrFPErhTAnQKMitKzRWdu4DIc+QBAkCW9ykmtYqIKGN0eAbraQv6OQJAD7788tLK4fmJ33j21fYfPXrf3Pe97cHZv/TwyYmDE+N1qNXSFITE1XXAXo8ykiRVQlpEFCAAgCXS4wSfIbXZJavv+USgW8gQ+IJG5obJwK+j3HUkE9rkOUyvc+W07mbXNXOmkxYm3EBWYtHpecju6frIik+fBkBw0VPkK6NKnw0XZQDWErqC3t/J1Od3w0ZSeLLZPOOLV/u0Uz9BH7QNQqAgQOr0iv7SiqRWKx0Zn2jBPSemjr7zwv6f3mx3//Znvnz+S5dX+pCmTczzblRTI647YgTATQAiKHYqTQZpbyVvZ+BNGuQNra7LL2mFqF2Utq+hsrWKS9Y8IpfWxneaRjm7t2CSPpbperS2jFGCKhQCVlM4XOnKJoFfkb3m61fI32jizvFcxLYYRFxfcO+4vuTp42FWya0kzzbf6aBBiVsX20nVuow1/A303KAwooD4PoeIiIhKrG9eponROeytrxAAgBB1JILi1PmVUw+cPPD/WFnd/NrFxZkfvvvE5D3H940MLUw3k/FRGlpZ7eXrG/1+t1P0JEiZEBImIGz2VzSEoG/AOoSulMBB418d8CzY5XDgNGfWvb8MbqFrbbVeBpyoJ+wUTT6wq1cN1h8iX7iGa701+pGfMO3vp5BkDkxFEigQExT9LM82O0V3cblXF0lSnx2viycemH3nWrv3IxeXuz+5vL50sSiKa/BhIiJePyIBsEuR511SaUiUwe08Nk7KGcPbim6l5SFZmleV4l5MDCSzZwCx18hcp/wesZhlF2OKjEF2a4kjBvyFyLxA8veWWXet8ZUq1pl0Rl2TCgAB49npex4Iqdmo7e1tVu5anbqd2O5p60qw5QwM028KupFvniabiV2XNK4L0A5+9YRW5Ez2Z2XkA5KKHEeSSqcAAECBmCTYSBKR2I5FXF+og6DB7J/VskxFlmjyBhHRqoWhIPZHmlVCmSgOXgREqhaGnspv9rzyiuwSwL1/zBRAHpSiaiRQshNd0gy11RXt64iIiC2wsn7RTmUp+4Q4gohNJOquHdk/9ltf+NrSR568f99f/KYnFn78wZPT82OjDUgRU0RASV3ZzygnIAApiJT7WZ3RgdrzDgB2TuuIAde6BCcIDGkANtjIN6CNPubWLxMpavUtZPKFgAkM8MWK0bn0ime1PGS/CdzpJuSuo7duohahLC0PN9a5Wso/Nv+c/idkZWyzZFt0pwT5MU1GDTDCXX94Mg0TsS66V0LXkwgUmUS5ut5vIwHt39dq3HpotPXEA/Pf+sq59kcWV/LfPHVuLTIAETcEIgFwEwCREqsAWl2vJPUttOFs5ehOdLsrcQFVtTqQwGWGU3DxitrTH0ll1YlJAPc8hEBAlaZny7FnnSvbehicBlROCDjwkYppU+3DYbwXAQIkCWItSVppkkQZfUNAKakEoPIyaJc5GH5JkafIv1/P+7aVN6yqKY4BbrzKYbtTT9nAutDdZHr5DmuNiIjQINogAIAkqaOUWf/U+c7FldXev8n72drKeu9v3nZs6tjcRKsxM91MRsfSkY3NXK6tZd1uR/azHHJEwCSFVAiJiMo/7yJ0tDyyM9McUFKlS+1s+g4WUUysIW/BWvMDH7vixpBxAlV1BU6uq0VZpDK5TYEDgLdnyVPS+1xdxxAUASATkfSyIlte7ctWU6TTs63ktsPjk+969MDfXl3Pz7585vJHEREFplDEpIAR1xHxFIBdijRtWTkpAIQAUmuE3lyMSh1FQgThE6ZkIgZAORo9cWr2m7pz0kOWwHjfDSWL/DITrOYQFesps3cZYWwXFN8aG9B0sOyYdpRRpk7nVh+fi/c4vvcSzGhKEGuIKIwXg40c5/0g89qONUJ26q961I5ObfRpBchzubIdiMb5geB7TW0fdG3mcUS9f1L5XknHr4gURZqKZpqISADcINA7XYFAOehAIKnUXWZo2F2xRoiqkyG0wLIyNhRsdmAYd5m+SOwt18Gtmm/q5KdPuL21YD1sYKOpqs7kNu2ZQzPUSyNMyf14nY6IiNgJiqJPKkFgAc++fGnz+MHxX3/uldXPPHz3/He95f75777/7snDs9MNGB6qC6RuUxY5ddpFIYlIqMhONKsSklAKjooss25sEIJJCOdZD/Pw29lbfsHKARNDPiGo9Eod/+Q6YBQ79xKcGHRHj3qrsOFN9RJMrr/oquKOKjLkO7leh1vk7F+Afz63Vru9TCa1gf145LxItrR+wjCgyAqYHRrmDwIAQAQCAdMEEymFzCQUS+t5D9Nec2qiJd724L47u73iF5544PC3AMBFSTEQIOL6IiqXuxROzCohyOzz7RlFY2czPZQrk1Wo1FW3QqWHifOqnJk2rzm77bVW+ZZfVktSlbc3Kqx7EYgojUfW6hfh3OCh0AFHUB6/zNTackj53lPuPw19MU5dsxabKo0AAgGSBBupwCijbwggAKAkAmm+OOHvMPGL+i+uTAwNkHM7rSIcZztHIH/tWQcxr2pExOsBUU9FA4gUJcnui2dWv/jAif0vL631nl/ebP/IPScmTx6YHa1PT7TESEsOr671Guubea+XFXmWQYZCHRSQaJ7RO/IIeSxnOFWv1dQNNDfOFAT3rx7K2sdBAoxdD2MAdpQkdyvByK7r/Vuef9/VwVMbcueX2/QlEDFNk1RKku1O0SXZk8PN+sjCbAsfu2fmgWee3/c/XLy4+ssvnF3t6F1XUb5GXBdE5XKXgoxbCNDSnYqwRJOB2hGrzH1kmEw0bKgxkUxIgC1naVv1vuyO9+6byr1uGSmt+2D2PtvXOtWt3d1GYZv6rc3gytqyshcNUWu9s0CGWg2XiYibHo4JE8YARxKgNzSDSbJnxio7dc/s3SYEdaQGGk8EgL/oO8udNeveOHLOeQycRwbMtkpLEHgeDjBzTW1gEKFxGXEdoU5c0a4ofWqEY1L1SSxa7rJxoiNOysFUVUSnI0ONLLUefTtUHallZDbXVgmJHReI9prRU5WodNlbbGu6IhVFxegzx08FfY2IiLgSFDInxAYi1pAoWzt+cPI3nnnp8scfuXvu29/92MEffuDkzIHpyTo0m5TWVkgsrchuuyOKIsccBAohMNHrBou7Z2uPymtjUvqDdZnrclZTJCcXfJ+8qYcLK/JkEJpUoYT2NBsArjsyOhu4N97ACCpyeqB90LhzdDlEk4PH9o9/JGuOhzyEayIAecWId87qm370HpqWbUPoiW4ErbtqRRQBIBEgEAHyPmS9ruyvbeTF0IhMFmaHau99dP8Pdzfal07eMv5fAGBJiDpK2Y+CNeJNRyQA9ioCoex75wehbIBvWbTkAEOn0II9XXXn2IJsNhtxY9L0CAVUxwFc6XgwmsuA6bCVHcTMtsoygx0QnoWl5ocEICIZvQM3Cjyi0+m3xN5vhauIANgysRUMHtpbObqqnFrlFpxtgewnIiLi9cNEAwAAvHR2tf/S2dXnz762+S82N/Nza5v9v33XbZO3Tk/UaxMTNdFqpkNrG7K+vi573V7ez6QskAATBBQCBAoQaHbrgDZNubPHGtOvZxnxnTxbCpgrQUmo+I6fwMWvl9cq0pRTBlfRMcfGl+oto+LD67+JS6atgjISAAECEiKi1fVejxJsTo3XxX0nJw+0Ows/cfrS5gvPvrL6McRaFK8R1wVpHHm7E0jGY0jWUHD6qCVTiYczWc+jdht5x1NrJtPyytZziaxG7tTypbSVoZYp5p5S8rPReuqle2U8W16/eF/MW2+FI009G2+r87pG7EUYd4QA455Qic3ND3M3sKzAZGkp7s9lIx8r2jCTBpiaZS6xHBm2jtCZqutSW6zR7L/WvSEiIiklj2aJuO5AEMrLT2AzQoM+htQKWCvy/DBSMyQ8A99tXHJpVyxd6j3AnXJW3TVNomtY3fLPZzHl7Wh3beojAb3xRSYUQKXSjFpCRMQbAwEABbx4dq1dfPzV//Ti2bXPPXDn3J9/5J65/9tDd04eW5hp4fAopvV6XywuS2x3ZC+XJBFBIAKhMBJJ7wsgLEXDuwNpQi0O3OIWyB53Qf3yEu/rR4D/tvkAWK4Tm7eAefjVBfYW7TO2f4Hscs2ofrp9+1xXDFZV3pbVQ90Nm58gUDZLstoKcM7yuggI3V20OYHINKNPGVLCEzv9PMtXutRs4PD0VB1O3jF17L4X5/7MPSfmvkSUrYikibLoxkU+4k1FjADYpfBlPN9FvEM4JkDXtxMlz7Ped1B/BdAIyatwiVU+w1kHRgJE7GmQjQdBbkDteNDxPf98NA0aieb6VudPDh6VnvoDltojKmIEwI0C9jVwfVaJm9AdBaWRchViaSup58EonzsptqMW+TP2wIPato9HRERcEYhyAgBIkhRfPLPRfuH06jN3HJv7+fOXu59b2+h9+KGT0/fN7xtuTI6lotnAoZX1rL6+nnX7vTzLCyoQCASCQBLKx2K3VYby480g8QbIoIG6oGeTVxZ3Z+gOOGlgq65URooO6hyWypW7HVL3/gt2DqLlQ1CAQIGYZZS323l3ebVfaw1hfXKimT5yz9x3nLvY++SRA5O/RTLPERvIo0MiIt5opHG07U449hQlERZGCTXeS5vP2fo2IZBxfPeqXyMBsPBTCsqZxaVEAXtv/fJY4ZVnbClzyrrFqryE2V8Y9CbYiEZAsuIDR+wBkLcAsyP7zJltpPyaZqBRMH51Ih80ZxRTJWtA/qIPRomxHgHm12XeidDP6lpkP/o/1cVkh8xcxJsERBBgUv8BaY7J7aRl/KYRxfobDkeaecH2kzLSib0FexZ3hZJqjX8rYs3A1q3y/CmeDPa9cmyvv078Z8SqjZzJ/E5FRERcKxSFyQ2QIlHeueXAxO+9fHb1S1/86ty3vuPh+R9+9K7po3PTLRxqpeliikOLi8Vmp5f3pYSCciB1IIkQpaOd1XJmtwiQ/sfIGKdL+R5xexaf52HnOWp4JBLT1tBdQ/DrLhnQlu9GrrwCPx0AVZ+ItI8dkTVQxSyY3AauFe0D0DIylF9BF11KBF8GO47X5JkCL1mgetbrm1EklAxGpZNvbua9pSVIpicbyYN3zBzcbMufPnVh86lT59tfBZmXP09ExBuIGAEQobETf9MOlL+QKSg1gVoQW5V5YBXkPTjI+2901ogIBtIkkOdeCJSDaprfKxsGI+5kdlyzsYg2y1zEdQdWvNq6tB1eliWqfnTQ2KokDKr010piqRrkEcXblGU/ERERbyzsSQFpA6nI+q+e23jlhVc3/vnKSuf5Xrf/cw/eNXvn1EQrnRhriHpCI2ubImt3s7zbk31ZUEFIEhJMhDBiwQiMrZSyyp5AKCEGaWCV2OlCSOELFz9nyPBrv50z7NzVLK/c4q+4a5lZxy4IASJNALJ+kS0tynarlozsmx3Gh++cOfHsS6s/9PLptQ997aWLHZ0cMorciDcFkQDYrdBqnPYWJqh2gYH+QWc4aEFkyUnnebe3AQJPKVjBa8Ulu468vOFUracJvN82Y6wr6TVj7qiP47dpVehQi2aHtbqTq1UBzRoL14soS/cSWFJ/fUqb9rATmWPZXZZ2NgZtdiFUipObD6AcrEHaXxdV4wqavZaeNwEqlCfij9rz2XVwAgWFI24MIPtPpSuRYJzz+rsnJNCy13rYgEAyUcy3iNjs1qGSW/XWjmvmpTP/2j22WgAyohXRj5By+Qv9QYr+ZFCNeKFjoTcvIiLijUCR90glhsvhzIUV+Ohni49cWt08/9zp9e9/6O75b773tomFfdMtHB2r1ZeX2+nickadLvQLFoik5Ay6eW5khsmyH3q20cgABC4lQm873zJv8omY94FSBzwqU5UJSAXdXbuyhja5ITbJ9crXK1194XLMyzkan/kDbDlk18nLCeDc+0qG2taQvHZKqoCuwER+EREgEqYJJVlGWadL3bWNojE5UdT3T9fFOx6Y+3OXL29+4a5jk/8FoFhKkhSLIo+Ka8QbjkgA3CRAT/6YnPjhHSOSBtQw8N32XqpSwW2asMdOgRP8O5Z4lmVgWbcG9irK0b0IREyMOuOCAFR0M7k3jhczzwEv665YXac04ENPSekpMI8Ogg7ItDSXPQ4QnMc24kYAShXxv3XIETeXObHJ7xN/MSBCoNTEINubtr7NB649KbVU/VZuu2j03yyoJS3MJQIKBFlsRtlyg8J4gYVI8JXX1vsvnV353D0n9r149mL3T1c39v/Eg3dMnJibaqSTYw1RT+tDq5uyvtHO+/28KPJCFgIBE1Qp6NCsKMaaDtsqXdl63RokDUqG/BXDX2AZ8Rksskx6lVIDMGForfMykVHZtPeSS/Ftlv2QsA3qUkczEggkTAQJSUjr7bx38XInnZmoi3uOj8+ubez/8LnL6y985aXlj+GV5juIiLhKpHGo7U4wp48EokKnDTey0Uk81EqfVVp9iRqyrugJVqedOqHGdFVElyk9sOK9/V9orC1T2LpVweOAK1VSlt+13Fm1s9tB77fi3qo4wPcSzDgkokKNy0CDYAYXgpd+QicNsKMN+X5D7inhv+1bNsy8g5f4tDCeEDv5tM+FURLGK8yIgKik30ggkkASlP9fgpFjgOjSQGjvkXI+EfO+aVmI5kwri4B99b31nnFOYMldsgMMnQfPy7ANwArqmtB7wc4uYD4xm+SADWJiFUbsRihOlABAAMkEMG0h5Z34hd7AkLIgxBoiIiZJbbXXK37r1Pm1L3zlhen/4Yn79v25h09MHpydaeHwqKxdWuolS8uddqdLmURETAkTIESBCAREiG5FIZN7RnuqWeb9Kq3JesorPN9gy4c6IDgvPjB5FuiIfiA9levlay0TiZV8vKnbk6Fkn1XiDMk2T768NPmB/MgAdP1SCqeuh0L/GvvtzhdC+zEkCAEiAYAsK4rllV53qC6GpqdacPK2yVtO3jr9zccOT39KCNFPRA0LGbcCRLyxiBEANwnIC9kMBXRovm8NxgWUinOhq9VOCiQfVIjlkgu1yus/2FQ3ZARfCcyCROYY3AHPRQJgLyI8GpMDvREUPGevB+ZZpbZRRvlEtZ08Uz3Z4up/o4GEUxcrRpZHApVkW+UJ1vy0VE7QVje/Tfc8coqCTgSSu3K0DWqAAIBqO+tExI2CBGsoQZ0imggBRAUd3DcpRoYaaVoTyUannwNAdn17GbEdiDJK0yEsZAYvnl7pvnxm7StffXnlpy5e7nyu38t/9oGTU0fHR2pidDgRCI2h9c087fWLTBYFSUkSAAWg0D6d8tyvkgb8XvjKlGauIO+6e8TXB6u1wypXeujoCaqr7C9t+XZL3TS4vCONkYvLgVWW9XEhQNQEiDyXebsju8tr/drwaL02Od5I7jkx84GHXt74z+1O9okLlzcgkgARbzQiAbBrYYWjAMREO22MbwgUY6lFO6E+lxQAVOJzLMndQJiZPLHGhOY+JA4iGeit+gmProUKi9/V6tTSsopM4GfJRvsRzCV0iVv1B7Me1S2V2oibE2YAE/kKAwIZt4Bh/tErr28h6APQoWw0ufkVBqPYScUpB9Oc534Ab0I5+0xt/kcbwYLeTIq4QcC+FO0M4tf1V13yYvk+fRMJAL76zPfgqmJ6TOoU3miissiNRhNFFcpVtJEAvhJtC7sh6uv4NqiLzH3AcL2IuKGRJE2Usg9uUKSwMDuCH3jXrfd+z3ec+POH5kcf7fZp86lnL/3bY4dnfu+VM6t9GQ2NGxp53lZqFtZRQg4vnVrr/wHI315cbr/83MszP3j/HdNfd8exyf1zs00xOSmbK0vd2vJK0en0ZSalkEKQSBIUasnjOpJR1cjKJCIm1zihjcFvMhqXfauvsfXPyCqCspfGvjeyasAQDB50uil6HIOvxjr5ZQsMFrWVfUIuZz0So8ptRXrtD5xO6g9Kpt+IgEmCSJJEP6d8o5P3l9d66chIDR+8Y/q21dXsH11Y3PyLFy63X5MUTwWIeGORRvtod6Iku2wCQCPqBtGT5D1jIU1WFRteSr7EDOtTx5r4Yaro12nKBc1ysiAQlxXYyivlXlUTsnFw7z34zJZRFTz7aLAToLz77gqGUGXRwP4CALstgZMHvHM6sWfcnXXDotoq5vos55asxAz5TSal1c1w7A5om79kIQQ8QZdfnEvEssYbx9nNAcQWqnW5SwAA+6aHsdmq12cmh1t3HZt8yzvesvD33/rI/ofnpofFS69sdJdXui98ti7+kEj206SJedGNC+YNDqK+JgKa+NKZ1fbzry598v7bZp4/dXb9fWvt/KcevHvm9rmpppieqCWJoKGVzby/2ZH9IoeiIEkCAYVA4YQTI8CZJ4dT305G+bb44KXUaKCcNPfUPlUdBoLL3g5q9Y72q9AnKxHopUH3SmRG8FT5KpYLlP5A/nXvstanzRnEmIBIAJNeLvPFpW43TbB1y/xQ8sT9c0888+Lyt3/sM6/+y0QIjKcCRLyRSGOSqd2JIm8TYqo2mqocAOBJNvIc58BeomF5ATwPlnJgav+PyXpukqWXlFjYRgYb2Y5o96o664r8vdl2QdBdYdljbWg0qfee51R9djLe07K/f3t6IeJmg1YT1BYASXavoyIDkEUBuCAAm+vXMvb2AD4q7dd2ME4FMmoJy7rMHQ5MsRrQZZMMPtj2TUDmOMM4jm8AECCA4FFW/CUbDuALXeONQjfGAFRUFqDKEq3yUzLtm6zeaXNyE7AIEfAHmB3A3LXlXqt/2UgO4mnRXCIknUjFEhSkclPEUPEbFGpvvwQABCJJdx6Za9xxfPzkd3/gxLv3zQ4/NDXeOLIwN3zLibtmDhw/OgnttRxefW39/PMvL//2ynqnjQgQjf/dBaIuIdYREVFAstTr5//7hZXua6+cXf/Lb7l/7pvuu3Vi/MD+ETHSzpuXLnfTldV+p9cregUi1mqiJgSiQKVhWdvf6Iw6WUlAnQcCRF3wjOCSUunkFoBSMd35An4W/+DDWb1wEA1q6iD7ers/mOkDWLnmLjhxWK7HSE5+AgGAyQNg5Lmh7j09lEWiWnWAkKRU5VJBSV7IYn0j67RaaW12cig9sr9Vf+iO6e/5ukeP/teZ8ebpiyu97T5ZRMRVI24BuMlgBDmAVf+cUhoyliGb6claV8iX+uTdLRsmAfNaRcS6TnpVDyBStWLKyvKukd8DpcNiMuBDRdz0cAoGMevdjISBo0GdrwZm4wyAr7C4etmsskaXUxMqBnq1chLacAAANqLGDfgdqDYRbyYIJCchjbHvyyB/DHAhhwDM86X/IU4hVclWLxlkaftW9ZgOR/uAcUTeazJGgA0mC4mpiBsCImkiyQIESiAqaGKsieNDzeQdDx6ee89bDn79o/fO/eBdt03cvbBvaKjZRKilCI3pIQAi+MrzS73/9sev/MyffO7sxy4sdkjKIn67uxAuGqCOL5zdWH321ZXff/D2uacuXe48JXP6ibtPTE83milMjjdSgdhaW89Ery8zKUESEJLQWwKAyx1/KFgFyyiQXJwxcnJAB1ntVfdhwP2gzspsVJUl+UPefS+CdatusT6VRaMz8isfCokPs+lW/2P+jFICASKkegdDr6BifVNtBWg2BNx9fPyudz6070c2Nru/sLR+6SJigjqncUTENUUkAHY5EEGgwBoIRCIAKYkkWQbAbvEssbnW4NFvbSFT3peSLnzVXyZsovRARvNcM67uqk8QshDlto3GHJIQwKOk0XRGnwQQsSdhxjsqB4fLyafGho6uBwBCsCkC7TnF1QrFlqOJTylg4578QjzZG4Gw5REBQQCgABc+wHSMuBPgRoHLJ02AIL2vCwGRhTRZuWdPUFGS1SSfDr5RNLv70V0BMNLNhnKhMc/5HltCUNFUJocFagrLnDDh6F/Tf+eWM4EvukpCRJX/gsxuMkBCIHNsQcQNAe7xL6Skt913YOHPvPvYQ7ccHnvf4YWxR27ZP3r08NzwxPREIxluJSCEBMICRFFAey2HU6+unPnqC4t/cObiWvxWbwIQ9QmTBiIKTDFZIpC/trievfTk2faPP3By+r7D8yPNhflGOjraT5eWuv2VtX67n1OeCBSpoCQRZDbTK2mhaQEkf+scgj5NQLUKTiwZ65brbVW+e7fOqvq54ex0v60Ic71cK+oUXQYT/wwD1xZUvgNPRvvvGXGA4EW8qtRA+r6lbMMOep/T5wvIrgU6igAAEVEIFFkm8+XVbj49UU9vOTgy/JYH9/2F586s/e6nvvLaf0dETNIWFvHEjohrjDTwJ0TsEiTpkFM4BQoQSvWzPkRkIkkbJKG4orLMcm+rPJRXACNAXXA+Wx/MvaD6UHQP3tPqV8L2DECVII7YSzDGk0BUByDZ7Y2eemIUCU/L0XfRmnNsOBkyihWtWP+xasypMerUotI80AaXMKmaGYkRzwS+QWCNaCkByRABfhY9BfU9l1ggbXM7l72TWiG1iZXvNIdAyKNncTspxwlb3lP0NFhC96PuMjbKS6cZcb2QiBrqU38JAODEkZnWt7/rttu/+R1H/tojd8984Pix8bmx8aaoJQhFt4DNzT4tLRcyTSQ2miiamxLOX+7np0+tPLWy0llToyL6gG4GUNGz0QBfeO7yBQD4X9/18JHPnL906O++/ZH9f/a2o+PjrVYdpiagDgSw1il6WUGFJEmCCAWoLZo6Op2FvrmEe0wggLkXsNVb95G9Zpvu+MXwxZYItb2tCzPDHsBEle7gOS05WY4W9ajStrUNz+pmkjbQIaS+qk6tUkwKCiFqNawREa2t93v1mhDzcw1x4vjEvntvn/qeu4/NfTwVaTsvip1+0oiIHSOFuLbvbngS0NCKoIU4gXZzKmZXb/BXYoiQ05OOfw2qDaOb+BmovKQnKPmjTtJ67Kqukx9CXc3d+p+O12OMf56nYBDrHLEHoVZn7e0HIEnSngFsy4SLt9udaF2jujLlxjVlWCP2d0gzmNk2YCejKa53YfrzEVV0TyRobxAgAKB0b3WyRvadkbPxNatkTpPQZUiXCjP0a3gjjcKIALsv1g1J7ySL7aRn1edR5BNvX6fNtGdZkGkTRMafi3jjMD01j4tL553zFesIkAMAAlFB73jgwNE7jo8//P3feeLbjhwae/i2gyOHDs0OtUZHGiBBQLdfwMZmTksrvU63l+djY2krbaZibSOj519aO/Xci6u/ubzW3VT1xQRjNxOI+io3FBRARKfe+sCBf3BxefPLD9+z7y/dc+vkiaPzw43DB0bqKxt57dJKr9dp93t5LvNUYJKkKAQiSDBLktXMdAJ79daIHWfCB56acESVnDZUKmcdRh6/oFfPcn0VbLy5RcBJ9Iq/UHW3tup/cJ/ciUEY3AAAKkV4eXqr+nhoriMCJIiYF0SdruytbxbpjKTG7EQdHzox8Z4X7pl+T7/f+8hL5zbbpr6Z8Rm8vHo5ztuI141I/+5SOLNdK4cm2Rkzhg1PGe5bUo5PcBJdX+W/kdWglwD1np2kZopXJLAGbmYZQcdtJAzK80qt09MtBEpglhhiFjBmFiynX0fsQbDxYLUSNFoE6bSAQl03QdnqOVO6Wnsh/20wZgeUYeSAU5rY2CaX4o/4/mv+g3q/QCSyrjOw8p138p+WbWTMaFfYHyDkf5ulb9YE2TK92nngeJYKJfO0X4lZ7OTxDVqzdl4vw1swTVRvXbHZrsypseZ0SieUIwHwRsMY/+Y4vzQRkOWSjixMp9/8tttu+5Z3HvvJJ+6f+cCxo2OT9eEUUpDQbxdw4fxmsdmhrJ9LmUkp292iBwRUb6QjQyMNOPtaO3/m5bU/eebF1T86dX4tS9I0fpk3IYhyQlRbAojkqSMLY7/y3Kurf/iuRxc+/J5HFz5w2+Hx1tR4AwGwsZKgaG/2e2rrKLpVkx9ny0x9AEWCO/2PvPVOyaqA4LTiyheD3HNu9NSBA7LkmQInpFRltm/lgoNh45xKnEGZpPCJfwh6Wyb/XR2BzlxJNCAUBNTuyWx1tV+fGEnw5JGRuXc/MvfhS8uby8+dWf0YYop1HIKhVn1Hny0iYjvEYwB3KfK8TcozgFJre3bDqf1hKLG1Fu5qFW8a2uLcY+/f8d9xbqHS/2kXmsGEcRgiW94dRuW3cTxHAABU8fCoNjN7+YfJt8fYeNSnYvgFQ2cHeEqOqUw96JNcaCcFz4XsJQewtWmViEASgYSIGwQkAFHoVPzuW1IWM7O6IdAOyfvXkgfEX6A3EIk96+SfHjnoxh8PCPB66rUVSPaqFNzqE7kzBshGAiAN6FnEGwfEGiqvP8CtB0fH/8zX33rvd3/rrd98x9HJ99x3fOrk0YWh5uhICp0sh/VNCWurWb6+lnf6PZlJUCNVFrKoJSIZaiSiUU9gZbPfffaV5f/0/JmVS/U0xSLP45d5k4LIbAlIEED2N9rZlzbbvZ9ZXmm/8NYHFj744InZg3MTTRwdrdUXlzrp0mqv2+kUPZIkawkmQoBQG9AQiBDtgc/ckQNOHwR9z8UPWUniPObkPwvAl1QuYqwniH+ikrnN7WjbRomgr9ARt/q7+bW6D2bf7YBYCE7QChHqtwAAiICJAFHkslhe7WW1pFafmxkS9945c99nnl9+cHpy6I8BCuhTHxqFgNmJGby0EqMAIl4f0ri/b5dDuWnAKaRSSUOjkJp0TgSASMzj6bmIKvejqgu+ECfuljIdIHehdN+EYKub4Aly8lssnSIToEQ6aA3cGG3V9n90cuwtMOXBS44GzvNp4CVXN0/6O7KdCmDCEXVFATFm75t29U13KFBIrxFovyqSyrqmErBpBUpPYSltjEDE9YXL7W93VwEBkQQi6UVu6DR69knrTbP8QOAR0vW7B5wS6lRPZ/K7pJXIROH26qknH/nQZlMG2ec0D/gJr6K68EYCkwYiFJAmAFlOdPfR6bF3P3bg2975lgMfvuv2qaOTE420mabQ70k4c64tNzb6/XZf5llBEiTIJMU0EYroTBCxWRO1ViqgyCRcXuosv3p+7UsXljegkHFP8V4AUUGY1HFprQ9/+Omzzxw7OPZzp85u/kF7I/9nTz44f9fEdBPHxusik7KR5bLI+pSpIwKU/Yp6i7skJEluz7u3dLpjTZDLIWvrM6HjnT5qxZeWc+GZ5J6FzK+zi4HyaPVaq4hSoNIGWiRfx7cQbfz+IOeX05W9LtluOpIirIFACMAUMCGStLHZ7zXqkEyMN5PZfaONWw5PfcPBfWP/fnm1v0qUw1p3JQrhiGuCuAVglyJNh7FKYulETiU9MNxPauT3YIXRZz+3xWA3FGzdUkAJe236SmfVVbKZD4kvM4VfT8Teg1ZBdrpUWpuswkXh7g8eUsbpYR5h2k84wi0NZveC8+uM3Iq4gcDGE3G/V0jsbPU8wPZf7CBZqa5XScvtWty63iuuKOINAupT2SRJevSuhem/+E0n7v+e7zjxPzx09+w33Hl0YmZ6oolFQbCxWcDyai9bX+93e728n0uQQghRr2EtSUBI7a5t1rE2OpTUU4GwsZHDxcvdU4srnTVl/Ivr/Gkj3ixQ0ac0baqDcYDaWV9+rMjlj1xe7XzogXvnnjy8MDI8O9NIhoaS0dWVfn99I+vmGeUCABJBQgc8cXPbAtmvHR8VwouVKg2bqMi1b4z2gc1VyeZqEtUjEMzCXUk2uAvby2D/bll8ap7feK5Q5Q1IhMAiB9nvFb2NzSLZ7MmhZrMGJw5P3P/oybl3bKz1fuf0xbW8ltYxy/tRQ4h43Uijprk7YY8w43u1TACnOfJMRzyT9fxXSTbj0zJXA09PNcnJyg/QDgPPlCdXbSyYiQwI6zSf0a+Mu6rMp/cXCAJQ1HVS/pwRewHohohLoMc2NCuPhjtIzS776JyefD4go/F5SJ9nA7rW1f/MzcH1DDeuPQ+AGsMGMGjExnF8fYEAgBKIJEhiR0c4OaaHmMsHYEsoDbrkObJhJGp02CgsFkXFk0hioPGWUlEGDjMvb4Dtrsd0ubpMokxdr1WXtRsQMDoL3ijUkgbmMgdEACklvfeRY4e+5Z3HP/TEw7N/7vZjYzNjoylSj2Dpco/WN/Ks3c2zfiFlQVJiKpI6YioAME1AIBAUORVERCNDteHh4TTtS4Kzr3U2T59tf2JjM2+rbzZ+nXsJed7V61wNz11u5//tk2f+4MXX1l5694WN73nXYwt/9Z47pubHxlJIE1EHANjczHpFTkVRUCESStzeIDCCzmhv+uhRBr2+mrxUAUsAbuUkfdSoe87qhK4hcxOISa2QKEfeOSvi3C8/35WTiy5fgWuFfZDyOyY1+TruUQ02Iba9oMtYdYRdZwF+Sm1HAIB+Xxara30aHanjbQfGZt/14PzfXlzafOXFc8tfjCcDRVwrxFVg16LaIEDSgodv7aCgwFVhpx6sQaUG9LfibplJRnbVMblolwxt1qFHK+y4rxE3E7b7ziv5eGQO+4EeT03WD7jnj+RqL4FTM9CeDQ9e05qoAG02CpcEMOLGQUj+mK+Qfeta0UV2TmA5EiSkm7ZChSeraqxaEqGqxcqPYjtud54ELep3edXViNcHlrGdHjoxt+/7vu2uR7/r/Ud/5IGTs4/efnRsZGQkgXYvh+X1nlxezrrtdtGVJAlTTESCIkmEQCQUBJAgIUmgIpcFIUK9nojmUIqr67n82strz33tpbX//PypxY4QNZSyFxfHPQiijISo4eJaFxaf7r3Sz+Svrrf7ZxdXe3/j3hNTJw7tG6kdXhiur65mtcWlbmejW/SLQuZCoEgFiEE5RxQGCDq/B85ax6qyZaHm8Q622AB9lKqfLfWh9HKAXBsUDbClOuzXVZanpDkITQj4zC0mQiSFBLm2lvVSIRpzU83kvjum733qhcWvA4AvAgAgJmiOA42IuFpEAmC3wjKa5mgqfTK12oBK+nhzbTPzc1dIP+lLtnD/PT9bzxkmTIi5guVuARNqxP1j5iYrxajTrTz+/L5llgGM4W/+Ub42R7HCAAkdcdPCN7GMpW1dosjumaz7qMeodn+Sc9p61BOQYv1NVV5Ljv53nhFQlRu/Pp8qpknTPbttR+++1ONZIKIAV1vEdQUJQBCKv3HSRSfmc2QkST4C1Cvj/gLmObLhIdybZbNJBIQnBrKWkQDWDRY4v8hJUrvflothl/U/SAqI9pRDndSLcbJxHF4rJKKGAAQJtuDhOw6Ofus7b/mxdz8+/5ePH5+YHmrWgPICzp3tyo12lne7RdbLIIcERSqEEMKlUEe9IZuAQBKQJCQhUDQaaZLWEri8ttl9+oXl//LsyytfAAAQGDnFvQwpM0JsIEAfPv/spXNHD4z/+qmz7c+cO9/5ya97y8K3nTgy1pyeaGCRUVNCHzr9PCMisiFwbL+9HYQAwD3rPpg84x50pkOiVjJ5GfTeAFsswR03rfMRkNN9/WbVKSZMlprG9S+ecBD5JyF72WmTvs5sI/08eY7svWnDbxTRU6TtQkJAgAJQpJiQBLmxWfTqaZ5MTzRr8/uHWocOjr77jlvn/g0AtCHmBo64BogEwE0DpwRSoMyBSTzuYkKvvv4dotLPuqM6Bm4q0DVU3UUIPbAREQD+ws+4pkEFt0SVs7Vih2KpWt+nYex80PsPaIsRH3HjIGBvsKwQUlgmdEeVgNVvtxyLg6us1L0HQo9Kdi4lKkJWV8NpVl5xlK+vFynWsYAciCTdfnR6+MQts8fe9uC+D737kdlvO3l0dKQ+lMDqWgErS71sdSXr9PqyD8owSJNUO/0BkCRIktp2QMCCgCSpLzFNMW01UkxTActr/Y3nTq383lPPn+sIrGGSRLVvr8M/JYC6L59d/eLXPXr4w5ub/dfe8dD8d995fGp2brophkbSocWVbram8gIUAARJAonwZJV1x8D28oEzAFfeb2c3h351Q5L6ha3Uoq0k5xai940Sd4YrCP9mCCAEYk6EvV7R29jMk36/qA21BBw9NHrvXbdO3bu61v7Maxc38jeoZxF7CCnE/SS7FM6cQQKpPTZgSFAycoWAUGgu1JwGAM4j5cSo8R2ZoAEwdWuN0Be4pQQsgQRF1hBVCH1kz7joA99v5h3BxvoIJgWtpntNhAJpl5YfNh0V1r0IJLuv3njJrJfBFaqwmawnl9hY5a4B3/OKwRg189IQDxR6MazPxEWn6KpIT2GkoDa//ojrA/2tIOmoI/TlKOkIen2cNR8X5gt1ziYtu0s6bEhXWSPdvQYzujRxZMaXF0Wg20ICcySXGcP8lBZ9KowKYEBC1GcXICKa7QDmwyJS6jUQcVVIRAsJ1MkR996+b+y9Txz5rvc8cfDDD9w5dcvcRIr9bgGXL3Tlymre63dkJgssEoECBAiBgGgOZSSdiYKUE5MISILy/ivjP6nVawLynGBptbt49uL66UQkSECQ5Vn8EiMAANQpAVhHxBoSZS/feWTmp0+f3fjDb3n34X/65AP7jo+O1QGgXiMJtLaR9/JCFnplRCU/kGxGFM+WJRZr6lPg4EVoqjKlZVK/8Oh1ci/sGkmmDVPeH9q2DAV1mV0IYQRryHl63jSjULt2+acYRCOUTCxzTCBg+BfwfHSFJNnpF9nGZkbjYzW89eDo/FsfmP+JldXOhwDgORQCSco4lyOuGpEKvmkwiMcxSmTZpLgahAJrR0CoYAz8+mw5K/XL5aOki9ge/iKM9l93QrFXNJwWVzDIjGkF4OaDb7z5VYf9ooq73iWPyIo87Q0D+8WHQi1QdEvf2TasKVXfvbJuVaPsm2NXjNxlchqB8IpkfMS2QKwjAMD89BC869HDR7/pHUe+560PL3zfo/dMH5wcr0O7ncPFxSxbXut1e72iJxBFXQghEkzV84qVkeboW0vSqGy/hQrTplo9qbWaaQqIsLaZweWV3tm1jV5bxhNFIypApDLK62iAdqeT/S4I2exm+d976J65k/unWqI+l9TrtV6yup71ulmeyQJkkmBit3DapLhcpgzAdmJxhyjLNCq/xEFlq7vwxsi8QXUOuE6KiEgSSCQRrW30s3od6/unh2qP3DnzjudeWX4CAJ4DIqilTcx0gseIiCtFuuOjOyJuMDA/IaIA6/Y3+hyZXIB6SzyxJ8shW8E2VHvLPuoy7we18H/dfeudMt4rm29dlTb1+syv8YGaj6eNKsskm66YD4rgNn2xcYz880XDaS/B7OkjJDVOTGiMPhlD7YV2o9V6AOyW2kBz8CJf3P5+MpEtVG3ymbliR6D1TqCKTtC1qeyD2ptstkCahxCFZRjiOL4hYMQNEZGJPzKpJWziCOPu16klbTqVcG9oWHdwg++wtbFOxL1FUDbTUd23IhQxGDno/Uad8cLQGeStBIYyi1rC64UQKQJImJ8ehbc+MP/wux5b+AeP3Tf39kMLw0PNBOHi+Q6trhfZ+mbRKwrIaymm6quTdliR1N+1suTRfS36O5IkEQCbjbTWGkrSbi7hzMVO+8z5zU9vdrKeKptUdzBiz0NFA6R46tJm8bsfP/2fz15sP3d5tf+P3/vYgXcfmh9KpydqCQA1ilVZ9AuZFxJkIkCgPsYOpHc0jlr2dMQUANkt/kaXVOJMrcFok5RUSBt2OgBq2Voi1T0dVy+gSkSrFZ954bnOafXVMCrBO0+bL/IIpe55151OYXIcILH3RimwZUGfwILqObJ/IqzXsEYIsNHNs8Zmkh6Yb4pbD49NHD849g1HD0z9OgDk6kjPiIirQ4wAiPCxYztju4JMGO9Ue9ym3Fa3o3kUwaH5I34Whl5zdZ5znvxnO2znPgBf9fDIuYEleeURuwo66x/syKOqLevKr7kigKDi8R08uWNpHF4lZESujiU39cWReW2gtlQQnTw2NfH4ffNve/fjB//+I/fM3ntobigtcoLFpV5xebG32elTHxAwTSFJU0yUY1WT58be985+1PSOSkpJUhIlKvt/0mgmuNHN6NWzG6dOv7b5sU6v6AEgEOWRy4kYCKKcUNTxzMXN/PSFjS9+09tu+VBR0D96+4P73n14/0hrdrKZpKkYXlnt99qdopfllKcJJELoXVHkzHG/4oprli1HmxNnx/3cvgD5bysevKYCznq7rklVCIC1FJNCgux2i/5amif7CmhOjNbgyP6R+47sH519+ezSuUTUo5iOuGqk4RGeEbsD7sRwUmHC2oWovD+kvIksy7nLym88WMbJaC4zEwYBvOhWdAyp2ztlOqLKWtdlwKwqD5Nrk1eq2vd9pWSeNjQtsj7az27qRuNgM7qsxyT7T0XsJahIWZCeh9Y6bZU3QseU2AXUkgbWe+FYfBvJwqMH9HU+wsi2567aqWre22gDlbCD9LhFIHRzFV2FtncR1w8m1zT37BijGUCf3kAg1FdvvUBGIQ7y7Bvvj36lf7t7AGxkstwtprwz05nayUeKFu522DLPEitORoAaWao+h3aZ6YNViaKWcLVAFAiQwN237xv71ncd+8H3vvXAj568bWJ2ZKgG3XYBK8v9fH0j6+ZSSpGQEAIEIqqDJHT8EgHYXDzWTuKmvwAAQiRCIkSs1xNRqwlYvdTpv/jq6idfObPx9PnLG1KIWjQWIrYFyT4h1hARcXq8+aWV9f4PLa/2fuw9jx/83juOjo9PjjeEENiUskftbtGTEiQiJDaiTQkNK7dsVBHzshtOXa166hFTEpHJQ3IvSuttxZqK/EFkc4VcBIFqiTyZyqOv3Hwz2qiWv9ZnQFykurWeRwmAi/hyeivaBtAsCFbPJVdeKyACCYkIepnM2p0iaXey5uhICkcWhg8+dHL62++7bd9/LGR/TYghlLIdJXTEFSNGANwkGKyhVflytpAV5iiTynp4FZwBqO6Rfc5qpGT5BScVWdVXIML83pDbFhD9VhEAgAjqCD27wpPVNnzz3Cz8W80J2HZsliMAqh68Aj8tAZCknMi4meO4vhEgUf1s930YJVK9MZpmKLX4eBlQH7u8ldd/W2lcGsNKsyars/u9YRQs52Ajdog0GcJC9oBI0p3H54bf99bDP/jN77zlQ/ffNTXRaAlYWurA5Uvd3vpq3pZAlNYwTQUkAARSApFUcdXILBM0pBG61GXmPeh0p6gJgLSewupGv/Pi6ZXfOX1+/RIAgBDx+L+InYEoo1rawMXVPnziS5dOS0m/lBfU62fyL91xfHxmYqyOqRCtpZVestHOenkOeZKIJBGAKjKKhfxXCDdfdmF1oa36F9TjarDGOFaVN4oyBiV8esDUwwz7rdRr2OL+thj82UnqeEUCKgoo1jf7slYjMT/dGH7ozum/fOq1jU8DwGeI4oEAEVeHeArALgWi8fUDEJHUggKA1PFNhMa37sopA5wA7AFPyAUjGEeV8Zqq69ZzxMqB1W6Nq9TndsHWzr33Rge2DKz2crBNsrxJcPFkYV80d+w+KbqzVdX56ewvdSV/1ohdDneSBAIKTFAgGBe78lAIo1WjPalCTQnjcbOBAWSsOGJsfilOUbfHzCX/8De0QzDMJ6z3X+tIA0OOOQ+FlJQXkgpTc8T1hPPKq5NWjEGmneYm9z+a71Z7zgH0oAJwBrYbMwRuzHKvvn1FnNx1CqltyMhtq7c6QY1OkIIJbaGQKVYfBG0+FXOKDAnS/TfytcZ6FbENCpkBAMKDJ+f2/bmvP/Lj3/j2I3/l5K1To7U0geXFPlxe7PU323mPUIJAk+EfEMgmLrGywIgpLC3CAAAIytxCEAJFPcW0WU8BhYCl9d7Ky2dXn3v53HImUKCkmDE8YufI8h4loomSMvjEl1479cAdc7+0tpG9/PWdAz95/50zh8bH64gJNHIp5camLKREiQiJXn1Vgkq7+Dk7w6aDYulGlPhCLaN8SeiyPPHYON9wdnqsZ9V7VL++5jRSz/lkHFQ+pcAZBjId1zLX5OqxmQJ4/iHw2+ZyXj9t+6rTEykpTe7vY35EkiQAAO1OljfrVJsaqYu7b52448svLH3DwX3jnwPIKRF1LGQ/zu+IK0KMANilKPIOIda0fkCSiBy36VObTpYRBCIJ/LL2+iAlj1GhnguCX6iulau3hgNgnENFg1vRrpWUctRMIyy40WWCt8lEzapA+x0tlluPwgEPeC/MfPK9++V6ncfBGn5EhUtOFIf3DQu0/1kQOJt8ELaStNuVx+B60J+qPjKfPlUXtiSsO4yK08eDK48wEMkQksyAKKN7bp0b+6a3Hf7r3/Kuwz948tbJIQKA8xfbcnmp193sZF0BElOV7M8kA3UmE5ZMEfNG84MEAAIkIBQSSEqSqcCkWU/SRoIgM4C19f7y4kr3kpJ30fsfceUoZJfSdAgRExQoLuaZ/I0iL3r9nD58350zRyfH6mJuGpv1tJ+stYteP5M5IkCKKMyxogB+VBG4Ie7eAJgTSwegQs/ELe7igOsDyxuJ7brInVbb4/XJRfO38TgJvRUrrWGKANjp5P3NBMTEcCOdnxsaOrgw8uTYaG3s7EVY1X6CiIgrQhqX890MJVbdNmHNKjLHufKQo5FjBBKZCwoQSh7NwEulM1mjYWYRdMZSv7zpjVUWtbLpmF7nzTC+KWeQuc9itGnrGuU9s54yf+Gw5c1nJ4jnHe1VGIOZtFuf3Esg7dTUngGTD9CQAqqISklUpsUCc53YFDIXkdlYdkl3ZqA15r1EXnYwI2nvq3UtELpxvDO+IuINg/ZREYJy+pP9TkJDXwlbKhlwxrorr7nW16s9Rb56iuEAs5q0rs9xRzZCxUh8nn8Cg9r0VTLeqrC/ql7FRBFhVksblb2PcCDZAwCCt9w7f/iD7z/+d77x7Ye/+/ajYy0AgMtLHVpc7Hb6PZkJABRCCJ1lwbcAQI+p4E/tDqDQ65xQ2cOLggoioGYtqQ23khoCwMZaj1aWe2c2O3lbPR19PRFXhzxvUy1tYV7k8PSLl1fuODL5Wysb2emltfzvveX+fY8emB+q1etJvbi4Sf1+kUkSIBOEFACEAJRs77vdYqoILwAI1lYz/pG/NbKXPRtY8J4hb5/h8CumYLLZ8wKsVwp0ZF5AUBCxpo2ujcxyN8oGhztNQFWPtn5LMBAYJ4W9DwgokHQQI1GvR/1NUYhcQjoyXIf9cyO3Hdg3Nv3MC5dX1BGOERFXhrgq3CSwel6lPU/2iDF2saLwdi3wZwcjYH1LT8mwYOXzbjvCDrvHjSr2IsrFvQhltqC0g9DoH3aYbDGe7XYAV3LHo/8NG26RALj+EBII9JgKxxEHVrwq360QWFvChZp6Fv1WzVfc4DcHj6lyqShLt4KoNZDyPhAR3X3r1PT7njz017/t3bd87+3HJuvdrIBzFzeLxeVOu9st+rVEJLV6kqJW+red2siKWGFkaBsAKUEKAmjVk3SomSZFIWFpudtfWuk9l+XUUwRnVPUirh5Z3lGjTqQIROubneIP2x1aLgr4xScfmX/rwlwjnZ1tNJKUxNq67OY5FYUxc9GqoQAVQoSNbdVGZTTngElyNarsoHoCBXpAaGoZA9rm3nzGLpTbDapwhwSD9oMRFESQS5LdDPJOX8JQTcDcVGvmxJHJd9x+ZPZMmiR9TOpIRdwGELFzpCWyKmJXIE2HLBVKhIXKAUBAIJXpY4WZ0jKc81EBzb7P4NtHv5Td28yLITIW1Cgj5pphL4Ec22uZUv2MR+KyMva+WykMaWxWBgBw56rqsqR9WMZrgoAx3nGPws87ZLdlq98ujTtzjDq6yZD5wCeGcy14b61qYJk1f2w6Asu+dXXolOsewWCyrxtFwR5XqMd6tL2uM0K3k/pBLSRtEn2Vkt2Xm4E1bUYMEVPyAPwj+YCNNT4ULZEVdC3oK1djeeNKppLuoUsyZzkNHUWms6uoH93BLO9S9DRVg/IMAACeuHf+8P/F3p8GW5Jk54HYdzwi7r1vzX2prKy1l+q9uhvdQDfQ3Wg0AAIEAS4giRGogdEojYkYiaKJFMVlKI00oxHGjCI5/EHaDMWxoYmUNAPKbAwc2RAmgKBA7AuxNJbeq7urqzqrK/fl5Xt3ifCjH+7H/bhH3LdkZXXme8+/qpvv3ggP97g3jh8/m5/z7//Rt/5HP/CJZ37s+adPjNqOcePGjr11a7o9m3VzY3w0tTcwMnNPLdD5dYUuACBUBAREMQhhS8aQWRlX9WRS0fasxddev3/tyrWdX5fyf9beL3JewRsG25aJanr12v3uVz595bfmXfeX78/a//N3ftvF73/+mdXxExPTVNWUbt6aby86dGwBY2AqAkBMHJfLEH0aeGUo4SRMTmTHKO+FAICeXJrKnyFXj04g4EcByWHK2WOIeAXE0JrnyeplFehHK/SUehXmB2VY8LJDSF8lV8g9SI4AX6eFQWgt7M50YVdGbC6dGq9/8O1n/vwrX7/3G194+dofEJWA7oKDoZiFjwCiOMr96HclNQaVI9uvuj9ob/yDyBIieu5njH37W5d3E94Unng8Qd4aFDaIiDE9EKGc2Y0q90XpqSbfPz5sZVveed5PwWOAZXxk6DnRYItl5LAnePDtvtof8KRq5VOsFh66K+p6Ql03AzPz258+vfK9H3nqL/7JTz3/F1547tRoe854/fr97tatne3prJuZylR1bSpjiJj7gcJLwXEZ14hJAi0bMjQZm6puCK/fXiy+9PWt3//qa/c//dq1LWtMUQwKHh6YWzbViK7c2Mav/O5rf7Azt3/VgmHqSz/w3OXV5tzZSW0Ia7futtPpzM6ZmY2hClBSoIUrmQp3VNR+WspstNlTedMfBmX3luzccH9Q6AVevhHtImjkqbPVd3UGDSaATAXDIN7Zadudhken1pvqPc+ffN9nv3ziey5fPPE5oCuJAAoOBFMCAA4zctFSXASshc2QWCiGFMWsVaICpX2l/nnnG2VlafAm1NCvOpdcrvrXWhi81VNeQZCRr+Cv8h4o0eXkhpgpbOYWmyogJayBWDpNf6+C4wBVq5dAMKJLh5QADLiaGYhkIxdKanUG8wD9kaZhWdclLTwU2UMEdjcoscsWHwhevKwUCdvnJHBRPDErfEnb/RjCsUD//Jg4PFryGfMVcTm2FHIHpClXpIIAlFUK3teTRDkhZhSkyLfFqNt7Se0o5nhh5pUS6g5jwlnHfMb/wPyDd6oQ4iC6bg4A+JYXzlz605965i/9sY8/87966zOnRhYVrt+c2eu3pvd3FnZBxpjaGGNgCB1cek9VYYfiI4q8xBOMSg4CIEY1AZB9yUywaEZEVBGu3Zltf/ard37qy1+/94rrv+j/BQ8XtpszUOH6nSl+5lde+vL/+PNf/Sv/6udf/cnPvbS1XTc1nriwWp3eqCcNsWHL3FlX1C4kBgxVq4DIsES8QxASyfvLA9cL1XkoypKuvyCiAoiMMwqdrnYLZaxMy6TZd9RzUpih55H+C7ibVaJElJWT6314ru4rGAd6hT6DXBCirzy/rw0qAtP9nXZx737bjkcVnn5y9cTTT659am21XgUAMk2Z7AX7RokAOAJQAgN5jcNxS8l4FgytHDnargIdDTTQFljVrtffbm7N3Qy2iWScHumNoXvh+FfJ3fFckVyPF1LaCFH/yGSE/W6+zdoM0q92RoR4QEWXg1ftsU6XZfwxBKt3nsVmD8pRTGaY1WGv6vByXpxen/m+eqTBQ/wwH3Pwu9Au1JkZMgp6IGqI2fJTFzaaj33w0vf/iU8++7fe+7YzJxYWuHpt2169sX1/Om1ndWPqpjY1MQALZgvrDYtGjC1DK24y1sAxZvJ5TRnGwDQ1AMO4eW9696tX7v3qF796fYeoIuauPMCChw7mGZtqQsY0ZO3iKx//wLP/2661M0NP/Lm3P7W+cuZEU6Hjtdtb7XQ244UlUFWhIvHx+Cz3UX1WoanKUhpN5PsSXtU1OPA6mnHuA12THw3cW7wQQ4Y4755jRAPAsr4qAnU+GeBWxaYD1RubDZ0/O3nuzInJybqq7rUlCKDgAKiHE24UPO5Ia0PbqNyT9xAQyIkGTpSLfnIPX/45OIE0b2XVRlknvVvTfRaxJaMeXQUgUfk1R5ZzebRCtJdGAylktfDqHKlOoERULataLPpfpuA4QGrx+ggV68g02MG8f5MoTeMvdO6o0ke0KN0oywgYWqpjSnKI+wujF9d5/H0TtaeXIYI8sfgEtZUi8UAUPEJ4XkVsvHNK8VSSZ8zsPVSBNAiK1rSlCN6AgGgskgzVQfj1e/ZVXhWi2E80NgQmHYVlQlDgJRULB8dVvEHll5LmHPm6jlBA+0Z+vaMG52nr8JbLJ1a+80NPfvunvu3pv/mut509NZ7UuHJ9h6/f2t6ez9t5ZWAqQ1XMA+70HJ1+R54gh1WtbwDPDT8u0sPFiRhDZlRR1dSOIu7dn925duP+DWNKvoaCNxe2m7KpxkRUE3N79WPvv/wfz6c7N7/325/8D973tpOnLl5YqamarVy7Metsi84SERkiQzFDFHyNKRP4YaaIx4g4d4w55IWSWisS5ZJm5GEl3nLwAKRIr5NDrEMFkjw/kYcns5TVQZJrhPHKHWSDB/lAuDapwz4KzBcm8oU8iUGYtWi3Z1jMOruysVLjwpmVi89dOvGWr35t65Vrt+/DmBFZW5IBFuyNEgFwSKF8USZqIATHWvW67zhSaB8yCXFyfqmCEaRH3YYV03oY32H4jCR66Zllk6xYiCd78V0FxxVKhgh2MXEwZAn1pABQfxYMWe3zaTM0YMBu6rvQMLlFfmAv1pC3t+DRIzyXwIbUUxrgP57A+gyTh59vEGoH80CkF8Vkr9k9BguEorO0l71pK3xJBsBFVlAg7nBqc4IPvvP8i3/048/+nRffdf4tVdPg6q0ZX7uxvb29s5g1hk1dmYp8BTOpOhpTk0Tz+l7Lljwvbchn64ihrk01akxVGYNpa7G9s7izvT2fuZ1w1Zv3IxQUALDdjAHARwJc+Za3n/t7trPTlXH9V194y8m1U6fG1aLj1Xt32+l8YVsimMp4lZ3F3hg278FrvfFjYFSyyOYC4QCirDig4T84hvhm5hsYOLBLZ6F9MN1Cvqfn/9GUQAQyblvjokO7M7e80lk6c2Ky/o5nTv/Jl16+9ztXbty5TSXnR8E+URcR83DCtjsxIzPDEhsQGxAsQnp/792MPDP4F/1uZ0YvAkD7JXKlZqA6enCt+s/DhoHULhvfZlbbnHGGXAD+dsLeqtjQKXdEjjkSYAgw3Cz94QqOBYKQHCUB8SaIrKG2yERCj4ky87z7mlbjyh0okfRkiVaG4CVQ0ntPUPAzVWflcAfIxElR+PSjBgGGCIYCV1XeIG0RkOedk1AmPfbkRI78VB+ncCklfqQ0lysHepe9pyy3wJ6clRBsfHEunZNAGZWlSgypu2zyVscVVVXTibUG73n+9FMf+5Yn//q3vf/ii+fPrpo7d+Z8/dZ0Np11C0MgU1FFLgIExMw6zwjrhxeZSGJYise1d5I8D/H7qokwqqt6PDYVE2F72+LeVnd1OrPb/m7f7J+joAAAYO2CfSTA69/xvkv/1crK5GKH6kff8fzG+oXzKw3RlK7fnG9ZC0vG5UsxlPK8hCeGtVIrx0j9VdnckDQ+7nPKqxR37pvme8trelwv1YNQ9xTitSJjTyK3ZF2IBQrSbkJXpI/GrwdispbtdNrZbqWqTm+Oxi88d+KTn/3K5vsunNn4xZJAuGC/KFb9IwGlNMR6VBzVIAEjBCIr5pR+RsLMJKSacmY0dJ06H2XfAWakxUoM7UNNJaMQsqo5uDrgZdUo+dJQXwXHA5y+izQzoHenxBpI3mvjg15SLRDkpL2L5Z+UcSzQr7NehT9SGoz6RFzwGELpaRRUdOo/fNIPc08XEkenVW7oDI1ZdZVIngOgNHgL3mC65Lv0rxaKLEIlABAZaiqDtzx98vwnPvzkX/zIixe+58LZSTWbt7h+a2d2d2u+UxFM05gaBLLWb8RjZiKX91wWZ/Kk0bMD7PJb69Qi1rIlQ9TUVTUaVWbRMm7ebee377VfXbRYuKDhYgAo+OaBuWUyY2I7u/Lx9z/zt8kYM5lc/rHnL6+PTp5o6tncTran3aLrrCUCk0FWspkDw+wr7NEUygnPjGu98MOoA6v9dsAAj8ytbUln4Zw2AGQSBtSp5HBwiylhQb4a99r3+0rlBd/eAGScUXG+0y6mk6paG9f07JNrzz19ee27Vv+g/k3c5GlVr1DX7hSmXbArigHgkKKuV8gxI7IAmZQpaQsAK8+6VICmfmbgEAkQhcseU9SSijC5bP+q5mmab2mlJnj846boZJywDXXIyquVI78HEpL0GvG/XtuCY4Kgxrusw7qYmQ8UiVJCatl3KzOH2uiktppwj1ZTa340DKiZGJZ6lrgb6MZ+XhDE9yc5isnC1UmKtFyo+DGCYp8hI3RgkCoqRBOa/xuMtEl/Q9Js/LvcXhBNVtINhy1b2kwQxki4vtxzsJsSwfpLmUk2plBuRD6uqKuGAMbG2ggffM+FT373xy7/+AvPn9jgtsXtO3O7M1ssrLW2rsgQgaxY9jhoJn5dTMKFkD2jpUZHIC6FzMQdk62ZqlFTVaOmMrN5h+s3d+7duDP93Ly1HWDAdvv4PrCCRwK2M3YJMhfX/shHnvu/bKzU5823PfF9Tz2xMrpwbjy5cXNmbt3ptl0CCzGfspL3gESSDGxRr4XDK2KIzCIg5LlCPJRfps1vvWosScdxnReFXnbShmvCUP4OKZ3X4dsop5r7qhk7kHWD1FVx9UBlYNgyz2ddu32/bc+eaeonzq6sPXFu9Vsmk7oBeGptSQZYsDfq47ygHxWEqnzKYJirzMCSJ730ZGRS6fmhXoYERM0+02BV3YwGjoHSA+R5H4MU1wxNfBEZXfoKduAmC44TLDO50kPQOS9SOtRuUUS5QQkaUbFjdTX1e2CxWOWGNKWG5TTPaRf6ZCqK9JsVfPPBviwje4NNrESl3UvLTDXc57WZQSi2ywykckYl/4utOeO06RBpv5F3KvpiwAf7xxTc6jYK3Qk624GZ+VMffvq5j33w4l977wunTq+OCV+/st3dvLvYYUvc1FQTmCxDTIkEI4ZvUWeETuIRAMhDlgNiqoAABkJpsaauTF0b3NuZ26s3tq/evL3z0qLtgNy5WlDwzQJVIGro/MnJVyd1/b+rjKm/9zsufu8T51dqe8KOZrOunc26RWfZEjGRoThJFBtyx7J1OhlHvRd+5ZX/3rXqkiVq/i6du8/pFkA17FBPir8PsVJfOnbJaIqT+xv2Hi5UhgyDuV103fZ00TJP6s21xpw5MXlyfW20QmTuMRcDQMHeqIeSTxU8/lAihWEAFqEOtOcYfvEnzViReP5Ta6dWe9QFQ2DqM+VgxfTD5RxPM7rMwiuuEdZtk+58yqTedwc5D28MnXbyFqnIlmILOF5wdM8WHVt0YVv1MkiKDOJIYWkB4NT45YmSKe20751Qnghksv1QEksp3UkU1Twmu0wnKPhmI/JaTjiRmAISO1PK75J3WUJW3UAYXqbo68IWqfGIvFQoVKeYqFPr9TrR/zqAcpHJMT9hCDG3SvyKxxZERE3V4BPvv3zph7/7+Z/4yLvPvbg5rnB/e447W/PZzqybN3VVGyJi6xbDWNTLb/6n+HQJkRr6+r+q+uD+OCTb8ZxGQGSoaWCqmrAza7sbt3ZeuX1nev3azXtsaHy8H1rBIwPbKRszpqu3p/jNz1z7wspK85+cOVk/9e2jc+8+uTGis6fGKzduz+ne/cUOEahpqJYqAO7Fih9BacqRWfYt5yoDlSz8e9nUZECCX9OzQnzKCEtBC6fUhheMDn70RJDtLwlaJIltYyvH5yOXkASiwoQNGcPEtu2snS26tmOL8aTBmZOT8+dPrZ6ztnudyJS5X7Anion4kGLR7rBilRaQT1oVdhHPcKWpOBU74tWhl93Q81b5fqhfMXqolumACKqiFtTVQxoPkVoABnsKTSTGO7YtBoDjhVxQSN+rfSLuM0TYCAp7WoSNDRAWfE3lGonYMnhPJHv9k/bptWFMGAAGhshk9ruCRw12ezNy4TMV5JRiH5xZkS9FSvEvFvrLoK7XZ8MIwWCAKOsyQl+kO1HH1R0lyj+reUHiuabY03GFMSMiMrh4dgPf+aHLP/5933H5Tz13YbXZujPF1es7i+nCtu7HTHPsGGaY5LF6o0DCS4D0GUVyCBSiyCNyN9eXIUt1A6IK2J61i5u3Zy/duTe/BeC422wKHjGsnTFgcPX2FL/1uWu//W9+/cp/9jufuf6Vre2WT2yOaHNzNG4a0xAIsOSKViRI+ShRKtn12nol3E2vZD651Z0U70zG6CdW7U2dMGfdH2K5qZS36z7BGGTrQ13n30VHGnAsL+s4vksYRJZhFx3bedeBDOPkxmjzmQsbH3ju0pm6MgZ13RQOULArDNExX92PAAgwBoAhBpGr3CxqTsrMogEg8peUccX2Is5Eb6cYOd1fUcqDgcELLZSPtPSmEwE3WGCpbwOgnG2r90TkK6bu15RRcBxgQKhQwQChIjrr5TgkOVebsjPK4cG3KU0Hw1PqVVi+8AvRO8OCniN+K4ubRQZUGTOujClG2scNXqK0XsYDg0mxHSdoioqmoO2YuyEQReR7u5k/B25QpNTIX0OelOHrReEU/kvBeFq4KcA4c3IF73rbmbd98L3n/ifPP7sxrkeEm3dmizt35zvWwlaS8R8M47Kbk07sKf04irGKQZC2hCszoKeewUXUUZ1oA1XlRtme2cXNO+0X7m51N1zXRbQreLRgnrEF8KVXri1+8bev/H9/7te//ne/+LU7t5iAMyfH5szJycpk1DRdB9t23LHnXTJ5ZJ0MkOkSP7pxZAqJ/ysxynO8ZgkDzFku59YC4mSb7RDyqbpUDhDe3LtYiSHqFSVtJnCM9bUMXnTo5ouOre1waqNaee6Jte956sLambZr2drCuwt2R130/8MMAjFZw2wNsxgA4KQDKSLK0TWeuIlE/QhdeR6UpDgZGDGwV5FVBgwJKS9zZ2N3rKypfqxEzJXEgv1rM28okTBlkpRp/rsrW3LRn44XPCVVaMhQRYaCsmY9iSR+BGXVl6uF/rRwATlC4V1C9n0FbYizhm064VPoKUQmuB6MAUxlalNVTTpCwaNB0KStM9MEXgMx2rhmOsQ/74Olie8x52e5byqjJI6h4UPt9W0OWFGhKV3tDmD0qBhReuVAm+i1OQYgqoi5449+4PKlb//A+f/Nc09vPGUN49b9Oe5ut/P5wi7quqqNitUJUQBiFfRrbnh2Ep7sYwaEl4jO4be1SetMkZfcjABAIGPIVBUYhO0dO715d/HSna12u67G1Pn67AUFjxJsp0w0Iub57Q++8+y/PHd25QPra6N//21Pn1g5d3pSEy8m12/u3G+t7QyoSjbMyBRQXMoh50McfUfMeerSvglNl+mVYQK70xJnX8wdrICl5GoOh4TjJrO5FysQb0J5EFSLKJez+26wYTdC16GbzTq7WLTV5oqpn7209sFnnlh/1xPnNq6V7d0Fe6FGIZJDDjYh03lwGOTqSI/lOORWR8SdV6FJtpeKaZheBthx+kkLkCRKj2eYKpwqveUlpOnrtzO5/IA6pju9YtB9UnCkIcoRiIwrgs0AXFZzcMiklreHXNbXh0J6C8aAV80TLKtLtMFgYIxEgXN7/oc1OYPaFQ4reGzgtwAAmrMI71Ep+VgRzbInuIw8ssM9nZ5UdYG+np8c8p6j0EsUQcO7ATtV0GV7YvdxQlWPCbA4e3KN/vT3Pf+dH//guT/75PnJ5P72HLfuzNrZglsGwRBIm5ljrsVssQx6f39dik9kOaLZkIW/UVWRqWoDgHF/p71/8+70la994wYbMzq2z63g8QPznIkMMdsrn/zwE/9g1NRra6v1j7zl8okaTPXOdDG+v8MztrAAjNvCzomhXXuwmJxhP/BGd9SfdEfccp0q3T2Wq2zwCbz8mSZJSb7Rvr97ZrZNpfG+6TUzPgROn7bzgj4DmM1sO5t11Xhs6NKF1ScvXVz91rWV5teA7em+b7LgWKLezx6VgscVDIArwAuH4g6H+Om1TdJzOa3/UN6b5oTe8qi88alZNe1HW0W1tTT+yViY6E2pb0nZYrUdQxsp0htnWIlsVedo4H3BsYDQXMi9jT7diLFrGfPzhjFHhMNW+zArhIA9wTunn7+S02ugrgFCWCKHvB0UNsFIU1us+I8TSKoAxK1Q/kzkd8IAdSYUWs47h5DRK3O/Vnz6aQ8rAMSDNMQLI32L8Uq2MBx3/snWgsjg6SfWzn/LO0//B+956+bZjUmFr78+a+/ebafM4Lo2tc5gnudU1MlwRYEPiXhD3hFNKUAeRTJgoQGIYQxMVZExhsCWsb2zuHf73vRmU09oKW8rKHhEYLZMRMTMn/nub336f3/+9Mpb11ebD59aH9Opk80YBNzf7ma2446AypnGpYx1WBP9ZGK1RiM6qFhW7Sh8ErTxNPnTN6L2rK0QhpiZ8/oXDdoQBn8I0n/8fecXxvuKLgYv1/vbMcaV/54vbLe909kTGyNz9vR4/cKZlfevTKpVgKdkGmK7KMygYBDFv3REkEdsekaR7Z7PPnHvkPqsT/DA+Tdys6oPUv/J6YGqgemlgSWydLL3QAXHAxT+JRrib5y1zpL+ZJr+8D6+fOLkqmCf5oaOxmMDipbMwWIAeAwR6o3k1JO00Tj4Q9znFYR+UAoURfUIr/DE/aCuxmTtgt/y5Obk2959/pPvfevJbzl9YoS2Be7d7WY7OzxzNbnJ6D1xYigfWnf3eiZLEzSodmrJIxgQERMRo+ssdqbtva3txf22KyXACh5PGFOBiOjnfuNrX/kff+Hrf+UXfuvaH97emuP0qTGdOjEeg4jajjtrrXU7Of1sClNEKfe7IOfKB+J6nL2SE3qEZZ+y+b6k+16XoTNGLrkPwRgYQ0zzhe12pl1LAE5tjJrTJ0fPjUeVK/FeygEW7IK6V2y44JCBOhE4LBjW7xAUiyG7B0ysGSmAbJdhz5kUqCKhDu7xpPhxgCGy8iYF/5PuQzul/HHPNdnfRKpasb43ArvqbSErK6vESeHuirB7nCCWI4pm+0zqdjTCQFISM2xHket9CHfIvBt2Tfs+wjwZoFA980RoV8EHJOO4EyopuGQaCpYHuzxMoeDRQBiUAcgCZHS1PArlVDVp9cTA1GPEfhOI0IsMQZ6Bkm7X7ya8FfVQR5FEUVRfw+FiiQvIPdWOFFlqAKq5cjzIsbMujcy3vOPsi5/80BN/49lLG5uLhcXte5ancyyshaWaa0Oi/OuCfoghIsw972PI6J85NcVzSUjPy2+uUzEQA0Z8oMzoOsZ03m1tT9upS95YPcyfo6DgoaDrWiZqiKgm5vZXfuyH3vtXz54Y//OPvnj+wtpaTZMVM2ptZzu2DLZcGcld5SVYiY5hgCjnrDQwZ5D8jU2X8DFvaPABU0pq5RhNEATUMGwP3gHhr/UGwSSqAGmuDxXGkDojhCPEjUXSi/EOvq6z3WxKC2aM1ic1Tq43p1cn1QkAV48Lvy54MJQMaUcQiXUx4Tmp9ZTUC72jB0V+HSWvxCuislMv/QK8S4+SW5lCHQLVrjC8AjhvgduvjUFDkD+UFtzB8MJ+oEyp+50/mnLDwk+9iIRCz48t4pap3Z7Rg9rXM6V9oJtBJ9VQN4m8elD+/qDrweEFUUNAi+eePN28+22nf+QD7zzz7pPrY7pzp+W79xZzZnBVUWWMjzBKjD2IVUHSU71nRQkPoHDdvu4RQEXkSg8w0FnGvLU784Vti+G74HEG84IBA6KGfvP3r/7Cr3/62k+9/PX7cxBw+tR4vL5eTyyzbTvuvNZNDJ/EtyfFCvaabXtgX2xuyJAbDamDxw9+J3CcYeiGUmnXkDM/W8t20XWWLaNpCGur9cbG6miFi/OgYA/Uj/oGCt4ICM4NhcAXQtkhBsC+gqiv4yfl/BjK+thP1+/+qETG+nRMWuLPZ1bLxEILhOytIbNqsNouMaEq20DcKkmhFen22trLfqwkZvv4Ca8FDsxkXeI/Rw/iyHTn4AwEqU/NRZSICO8leDK66FBU1SkhQe7NC0Dmip4n0T8r7gUiEDMzxwyeXntgEGIl9oLHAWy88EnswzR95UYpBsBgkhSnEuWhPDqpPEasiCgwbX9Ak0oYPm2Sl44LY5F49mOG+dguMFX3KasDTFLVwCfMJNmCC1pAX3+k0QEwuHhu5dzzz2x88okLqyMiwp27i8X2djs3FaoKiFERuj44IeZbCBV5s9WOwtorC3PsABzWu+jtT39z9t5/EFFtyBgiWMvctXanbW1XDAAFjztcUsCKPvfV12c/9LG3/BcXTq287ZMfeeITF86t1Aw73pm2i3aB1mfl56D8szKSpQ51bytwH0QEjJGsnF0jltHUGaUqXqdeeSUGhLU6N9MTYjSqvz5n2fomtLFPZwKOggqCfCKyus7TRcbbQjp01rJtLYMNsLpar5w9tXLp3Km13zse/LrgQVEiAI4K9rHea3kyWibzTcYPKjzk1+3H9qk3++/CqJICafFgFlEVggsKCrwSZYVg0rQS+bIcN8f0yEfkhKFzA1AF4ZbYn7Q6JhYrOZLXtJBOCh4XeKOMR0JcPR/QnvAk8KBmymXX7deLHOTLIcIOx/t+66OMuqqJ2fJTF9bq97zl1EeffXL9ucmKwXTWYet+O5svukVlmKrKed9yVuIF97BeIZ7qgQO3GH4IQ89Xcw9DgDHkKhBYBrt900f7ARUcGVTGoKkM/f6Xrn/5F37ryk+89Mqd1w2AM5sjOrnRTEaNqdsOXdtyB7BXVpbMF615uwM40MKtLgsFCJdgWF5+2IInIeUA2RjaaMxgy+BFx9xZxtqkGV06s/b+86dWV5kt13VTeELBIEx/Y2HBoQOjC44bdiZNCSFiouho4vhin98/qBvBXT+kgHiXUthvjwF935ldidOexRwb9+aT83Cwyv7HlCrzMlyw5Mo9eXlLZTxkAJZ9PAMPSOLFE3LMIEoZGSIY523T/ykady540o64EMGi3Qh6MWbq1fWFp2EXPxCrDSa+fhUDwOpdHEMp/ywtyCo345vzcxXsEzFiyiVec8dYNsgPW1ehn2ugBuGhgQbcH2LhhZ6HCk2xqlihxtEiIod7i0eDeUnx/ZxvcyQ3ZH7n0CCaV48+Oss4d2qFPviOs+/76HvP/+XL51c3u87i/k7L84VzsgHup/bTPKxv2jMZgygkKmCAD8SwEehQAfUESXKZyPrn+2YwMxmYyrg6ot4A0ALWO3UKvyh4vNF2C24t48r1rfa3Pnf1t/7dH1z7H15+9e4M1uLMiabZWGvGDKDtuPNLc2rbVLzMVdCJK6vOLC2irYtGdZPRfVaTTUeOSiEtvUxLeh6CkoWjDCo8FpC2fgUH9+9BrAwyywdEjcCQw14izbx1314GtmTnC2vbBWNt0jSXL6x/9KkL60+eObFC1h4T5l1wYJQIgGMFzTxEHT/QBue9EfhabsFcfkf5u4E+paKBcrDGhDCctgWo0HVB7gx4ACpX6+0wJQ8c0YeWEGf+Np4VE4VWxcri/TghOnc5P7Hbx2E8oJNqLwxWdxF9Xh119q/+EqCOD/X+EO/08UJVTQiwWF8dj97z1jM/+P4Xznzw1MbYbN1vsbXdLRgEk2YO7fWhf/bB6IzBkfcfAyJ2JwZgiEjux3bMtrOzaLovS2DB4w9m5kVn8QcvXb/9i7995R///G9e+dev39juTm7WOHtqNBo1phKjmUNm4ITMN4JsuUmQTa09Z5rX6XfjcsNywMM2uA2tCqnBWA1PFuDFAnaxYKw0lbl4evLcxTOTZ1YnvhpAQcEASg6AQw3ye53Rhb1CRETEbh+i35rsNf3oZYAoKt7NHsydCFJf8ITK5iRxM+VKi97H6v9Sct79DSxIWUHl0mgtzfoMnYTN22EwlzmbPM+X7bfuvgc3iRUcDwSiQqjZHgz2BF80y7njovc00D45OlQmeNkrHe1O/q+fJxL54g+xKhagM6uzujgpHAAGLMfxxIvrQmAsMyxUDwWPDt5ra2XTPxGDvAedA3sN0Rv+iZJSGT0tKF7pjkZ+RepEOJrrnHozVLKHX25ErhcijzEIUuyCYmIYudL5mEnFxFDgrgAYTT2mo0yH1rYACCc3V1aef+rEp565tL4+qmtcvzXvtqd2QWTIGDZuubIIkXNh0ZNcIHFNdM5F/zyChzFda9Xj13/C22SJ9QEBjt8QKuPShLSWuWUsIr8oBoCCwwFjGhARnTkx+T1j6G9fPDd5y7nT43esrzTYWGsmlltYa23HxMazNLeuqzVZgmikakrGY0nxRECmEaAWaog3fpmsK7JBsncfpCZoOoGFbxNnfD+sA5rP+wE5fLug50srkXQd23GiikQWMYgWLdv5wvKoNnTu1Oj8+dOjd6+Mq19nxr2qXqWu3T66zLvggVBWiUMNBsDqGQ64FJcg2lEfRgTAEF8h9fJHuM9TH5wjEVI7gVbQBlxfBccKCQV4zW3APwBFN/2YlQcgnX2U7x24SP6k2Y2JYHIqL3iUiILZ4CngzWE3uUd/icNJh726A31izD3+vKSv5TdylGHBbPns6dUz58+tPLu+3qDtGFtb3Ww+t60xZCpjDECAXbZ1Uq+sA6eSNh4hthjY+2HoZ2oAY8DkCv855d/4VbaIdgWHA103Z1CFG3em+O3PXf/9X/70tX/yua9u3Z8tGKc2R83mWjMGE9qOO3a1SRPpMhoyM4ParthloT4wm3sYfDF3Wu3BmDWb9/batmO7WFiuK6JTJ0YbZ05N3jOZNA0AlG0ABUOoH4r+V/Do4SqXivWTRNsJls5EI9KqhvdG5FbLaMaM7Qghq79vFKMKOJWAw3GROFVQFSsPvWPey5iT8rJCeB7Hm4UYFaTmey4pFxw3RPWMGQzrNmn73BRgIjZMRDFLMCN4SYUeo+d1aAQK16WHIv377cGRHpWj0N9kbE3KU8sI3la4KB5DhT8/RmByeSWCAyZ6kfwGT4reYO2YRxDo3HP1J3wTVRie9WekvJhVV2GrSLg0er6ktWz0cvQfPV+O3ONYjqW7623wM7ELhZX0FgAW7ZwpCYE/OqjrEdWVwbOXTzff97FnPnL29OSUqQjT+xY7027ettyNR9QYv3ayUtqZCNF1qGRznbdBvck9ggT9vAcmvDrt9xfLU3WKv/AvcsUB9lQeCgoeM7BtmYjotWtb9mMffPq/u3hm4wOjuvkzzz65Ojlp0WxtLWZtyy0bZ+FKc0ohzLWcO/mqPjEyhyN3lBapNi035F6J10B4Zu54CjEJMqFZdaIiFQJ/8GdjOJbn0fD8ONvaSnEIJ1J7bi/isBcfutba+byzm6uNOXViZXz21OpbVsbN2H1vu9vPX3BMUczEhxq7uYWGBADKOKQSUPYpLwyr18sdq/s8/EBwt53fkfamPOwRCw4LCJYIvk53tAtxnx5iaLTOyS3nDoz92p+S1T2/uNDs4wq/7Zq02pY2OEBnB6EV1Xb5ELkw2x8gv3ZgQsjBKPceA2WSrcWibfnZSxtPvO2ZjT9+YrNembcddqad7VruYNkSrBia06y1CdLfaphGsnV4GR0spQ2dSND9Y8Ag4mroHgoKDgOYmY1p6Isv337tl37n9b/3pVfufI0AnFxraGOlGjeGKmZmayXVdW8mDSjo6kSyvqdCr2axuyYAGL7zh2Byy2Ma8m+VMQm194zgFLmus3Y2b1smxupKbdbXmtNNIzkAikxR0IfhJRGNBYcJ5F1Anh16s6ULlgo+IMj+4uB155SDum3HecbpoDlpJ4f4ibxnFVBjI2Tjp9AyRjmSYkd5eEJIl+y8aTr3f8yvHu4mvMhvtJX9WDxk5Cg4FhDvqvOeRwu75NMGwefIiG299u//pbChm5IqXZ62IBn+VWULAsIGApUB2N9R/I8hkQjKt+u8ieFodA+E/ebST8GjRiAu0oyMxCULIIiXiu1EngVHQ6w8yKz7EZpzL/cZii9GHkeyV9TTIhIDFivWLeMFMkesfc1CsRwyV8sbFs5Nx8KhbJnx1MXN5oVnNj76rmc3P3pyvaln8w7TWdexdfvq3e9kwbAsfIDDD6/3VmSrlPrttbiV5CkPxT5EU5F0k2qtk+cJ/+Rc574Gjg28pax5BYcVzITrt7bxBy9d++IffunGz7x29f4CsDi50TQba9WEwGg721nPtKSKBmSND+up9Cfzzs/IVHRUwqgSTtUhSiqr+DM6Bwso2AN1BSxo2SD0rYRgLQiHJDIEJhNk4ODg4sgHyA8Wiwexq45ATK21drawXWsZzdhgZaXaGDU0cYOUCICCPkoEwKGGCA+o+q6dvco75hbFwbd7XbXrbS27/sDY5Yac9VNiH6OR4A2OWHBoEfQwGyqY6UUdyorlP0tqHVmH3zjFPGAPGelahrWFgB8r+KSrQWR8MATz0QM93OFxnZDHewl6nIqv6fXyN10X8rRXRw3GjAmwWF+pV557cuN7n7u0fmF1VGG60/J81nVkyBhjjCQJdQYU4SO7uBuXYcllwciuFf6hi9kX8kUHQ5aioRPgYFEqAn/B4QPznC1bXL2xtf1bn3n9//0rn776G9+4NbWbmw2dOjUamwpV29rWWp/kN5tL/WmVe52y4zKufu3iFN2fbLzMk78XeMlfPbq8vMAiVkQD6pjtomPbMcMYYDQyo3FjVojMQF8FBUBNvZTrBYcH4ndiX5ta9tRDHJpOIoihALH+NGFQ20l2ICbnxGuUkksvAarsmSLxUrlr00zGcmv+3ntMMvpHJV8BkboWsrOLfNZqFwEgVl5m2fB0DFxXBQmEZC2I2VLHHaJXDdAECkAcb0yyOTooO6wX86iby/yK1QGU114qZsi1ISpg+EaJpXa4Eh3Eu+vyFFgbNLpCx48azID1EaiQKgB+TzYzWUB596GiAMKjixwveJh8A4LixZS3Vnw0nlDOJfH5R0VQeF+8h0D/XsBlKSHt6xQEr5UPE+OQXEr4a/ZljgyYWwDA5mqzfvnC2osXz66NGgNsb7ftbN4tTAVjZNttriGoZ8vIH7Wf3/7njUnCE4tk9P77yAxGcAJ6mkjWZKf8M9iQRUUdYIDOVGSDP6cYAAoOL4ypcO9+i9/4g2u/WtXNXzt9evLffve3XXp2c7Oh8U1Tz2aW4KPmwswgCkmmE27I4bT7K+t5WL899IQmXwMrLOeel4Y+QqUXz4OTCivoMQd1nZPNtewh/Fp4AgdRm7PrNT/X0YI+hYAT+i0sM8FUhMm4nqytjlasbZmoPnqMu+ANo0QAHGooBYM4E81yT2c8GvX6RNLUPS4bCQb7IJo9WM2B85opB9RSC6+HY/o640nhe8cLssCTK6G31PLPwQJGDEmk058Qew/1QPcXwelbVkIKlvsBCx4NmNGJcVXvqHI4mMFxuZ94936G/UNDPe1COku9XNkK0bNfHUV+asHMfHpzZf3MyZULq6sNOgvs7HSLtrPWGBhTUSWhwC7cd9jDN/RM90sViRKxe0OWFIDklQ8LwwzTsVIRCgoOI7puwSCDK9e229/4g2u/9ekv3vzZ63dmXFUGG2vNaGVSjwHAds7K5Q2V/So+wOCRodPLW+mjy7KhpJtS477a5Rx+GEkv/ZsMNzuw5IgnwpUEYQIwHlejjbXRuf73KChwMIUwDjuiIhNMh87rIHXP3d4oBtI4Z4rMSivQ5JykpF/gYF0NHqH0grDPGoBs4fft5XqOgpP2aqj9rb2vo46FNyk/jixTLQFpUEuh7+OEsPuP3M4QsdQze4qMRvtkqRUqCbvrlEQRawYjXhSs92o+cZZrQ08Uke5lozYQB5A2aV3jFEWefyzAgBXfkORyyLmN7OyOWUzk8clZTl6yx5OFcYbjiDxOGK+S80Cphyr0zxTzB+TZLV2kGGkqFZqNBEvhlpZtGDhKqFDh8pkTdPn8xgunT05OVhUwX1jM5rbtOu7IkCETflgK6XYgayTCswirnrYo+t8wrpH+OYVlzz9FpTfI+kdyICyq4j50hCBJACmWA/hm/nQFBW8K2LYMAF+7cnvx2S/d/snPfvHO1+/eW+DExqg6uTlaMZUxXccdsVNiXCBWZpRlLX/Kmu85cpizkqPK5/bxbFCuFIN8qMRCHGRN4d1uesb5Gw0BkZ9H6756hUNOPo5yueIf2gCrpnfkLYrzM4M7trZzK8LKqGpObo6fff7ymaaqCE09KcyhIEGJADgSoGEZjaLCA6T2xSisYInMkHmCljXLbkMu7WUgSE2k/et27Xy/AuiwDbjgOMFTtsqv1ace0aw4VDwb6mNP9MiMdjl3cGTmgYLHCkuqAKgzmbkna/PGH2y/47zX4TtMW+V3cbx4aFU11HLLl89vbDxzafO7Nlab8aKzmM46bl04rRT7c9aQLC9iPj/fPHNJYlX3yr83AFiEZLxHtEpjwbGEK2rxpa/e/uwv/9br/+yVK/e31ic1zp4c16OG6pAjl13su58KWMZzBxG15yUsby9+OjDje4r/PrEkqigZKyTIHjzNlmFtx8yWMW5MdWpz9PZTm6PNtp1z2RZUkKNGqQJwqOG3bFZxG6e4D+SxiqVRbVqWfYRiHKDYV2yuTnAu5sQRQgIi6SrwUZYGegg4TwiyY8kXStqmo0rUggg7Yj2NbjZKOuZloxQcUUSqJ7iU3c6DRsHzKV52Rymsbehqo7/zwMnZeI5Fwk66AaIVQREwaw9xzP0fF3C/V1F7eiHVNbK1vpDxIwYBcPv8g1+JSapGxE2g3mGLyBKFmXrSiBTB6l93OhBTTBjtR9OskLIrkhgD7QUOfQTvEot5wu9oT4JO4n1FQdR9T5dSpqlHSyzNhxdsO1w8vUGf+JbL73z28uZ3bKw29WJuMZ3brrOwepNHmvw7GteTzP7696S4AnHSTrnxoPqMxsu0M0VQzAjrNjPYWvfEKwOqDJplgdAFBYcNzC0bqunUZvPayui1f/SOZze+513PbXzrxmqD1bGpp1NUzJatT+ETAm2kA+FWWrdndZLU5yDHxjlIyRF/jVzk+T35xlJ9wM/S0BqhD7X+w3HWWK0qn6scGUcSQii/izvvUgXpDDFuTWots7UW44bMqY3mmdObozMAboSCQgUFHiUC4NCD0iRheo5L3SEllKTiwXKGEOyXrN5nxwYvGuyHIkcl3Xs22BsBL/1QcKygFtNkkQbU/hN3IIQ9K40pEZ73EKJ3o9v8eJHLjwAIBDJBMe6p5g6xqJNwvZxQ9kcEiTFzyNHUuyLRUJFZU2OTRBhdtq+VkqGPIupqRAzG+nozufzE2rc+eWH12UlTmcW0w2LBlvMECM62zmpNdG+V8VlP8Yf+u+X2cHb7UcgQqhpU1VghIw+9MJqCIwCqcPPuFJ/9yq3X/uClWz/19avbi85abKxVzeqKGTEYi852PhmAM4rJPr69pkAi1FKfRTuZAQlP1UJwr3HWb3Y8yML7vqldTmcgdartmDtr0VSGNtea85vrzemLZ9fN0eXkBQ8KUwIADjMYDDbM3GV6Tdha6PNVI25Khpdj437PZO9got1zYILBkpDtKZW9z0Ek9huXQu4BaJbmbaOscgLIOMGqSvGF+F5yFrjr43n3Nvp2OXXTvDk/e8HhQOZGZ0jQv7bEDy3TfoqkhisCgUK9dDkvwoCyxoda7krRcteJnCHeY3cvKksGGLIREWEuxzsteHSg8G/cWy+nIoQQ2PPX8J+YAijuNw39hs2jQgVIcq4koaFZYopIiZLcIl4cbzPkpBBfFal0MA5xqng+HnIFQBaNRTtfZvo9lLD+q6ytVKtPnl/5yBNnJycnFWE+67hdWGsAMsSGyULYhgW5CiMcf2Cd80YUhrwcbWp8T/clR/6TnI1KSTAwuAvIE1RnYS2DyRCakaGmMWtV2QJQcIRg7YwB4Oa9Kf7wy7d+5ne+ePsLr9+e8spqRZubzYQMUdtxB6tYbuJckvmoTbIuCDYU/82NplBirj8VJGCRUaHkXOld8oHIPBYxNfSKME5qgNVOCvfGCRuQ9YC88OH5hcofoiyR8B87C+4soa4q2lgZbW6uNWdGjam48IaCDCUC4NBjD4thgPJmKEbT66Z/1aDqMXR8mL1EBvyGMNCF48XUz33EeauC4wtF2KwU8kF6zw9S+nbJ+sm9T/0j+0NZoB9faKOR8v9n5+Jn3T4GmUT1cH8j0hJylL6WjdmnwiA0Jlqlkh0zRH/VLqR/qCEhsStjs3nm5Oi5U5tNYwiYzdqua7kzwWSufk3ajxfvjUKMPOgxD/0sOsu27awFAXVtMGqq1aqi2n+7N/keCwq+WTBgMF76+t2v/tLvvP6PvvTq3Zv1yODEiZFpmqpiSww2LCkzA/acAvvwtCfCZe5cWiZ0inauPocr9uOc2p3j9gIXkx4Zlpk7SyAymIzqlZVRtdnUNNplwIJjCtOjooJDgape3VXfjrs9gwc0qXyq7aLiSoqO/ZDwOPXID3hOAYQ8AMCQ70OZKLUuFuyetJzdeRdJVNsiC41d6TOuN2bqkrELjg3C/juVVD1Gmija94CFe6nSbt7dhqgA9VUtQfTqx7kW5QWZjKE1lhoY3GmOXTAIrML2Ch0/cjgvfqX0eRCYJJYjMr7I17QjN4Czl3QvT51S80I8n1OMp6+QQTo4peO1vYv8TPD1YTxr5mROSJpsCWhIujhK4oIFQFhZaVZOnRxdWFuvyRJje9a1i85aMjAg8QTKM81NKNkreZ7uFZ5Hz+Wv10b1kjU7SQCiOBiRS/htrW1ba60FqqpCM6rWRk1l4ncrKDj8YO646xivfOPezV/73W/8y89/5fanpwuLtdUGa+OqaSqqXB5AZh/tRLLbLwZPsZdThU1nps2EgarjPQtoXnMFyHlikoQgkUz7RwbVr1RogTB4FYeLICH4znw9FzJgMFt0HYNAGDfVeGVUn6wNVSUHQEEOc5SW8+MIJWouOa/jCBV0fJM+HNV6DDGvnIsJUwW0d2tAut3VejpgZdXZlPwtDBoKpGmWcC0dt+C4IZBmWGb1LJHtLPG/oZkQt7wgkmV2PgjoWvrP9w7LPQWy9iHWakq5v7v5FgsdPxYgbzRPZEQtWMoxh4QnaoPUHo9zCdf2B3QnfV4r5avkPoLZSyWqXG49jkZgTr9Fs/sdH0ZYGFNhY320ub7RbNYTwoIZ04XTq4kAo+ouEvvHnsvtAwvTUqO2wjLzdDD/hLXPG2PiogvARQB0LdvOuq13o1E9mUyaxmVPL/yi4OiAyODu1hwvvXz7tc9/5c5PfePGdN51wNpKU69NqrEBU9tx5/KnLpt5cS1300rqbGayZxgUS+wAQ/LtMMPeW78aMvZqKVqvLgy186gntLjvxMRsue06BoDJyIxWxtWZuqKGLcMscxwWHEuULQCHFF277ae/eAmFTWivJKCFvbDjKWEcjq0FlpNJLslHzQyVECR5AFKpNVf21R5+UjKNbuMttUGwlf3/4Zy6GXUvosKF75VkVy387liC2CQCtFiR/DTxmnfMjCEOWzmX7B1M6TUxZUmkjDI9hX16CPSJZGLKtdCzIpsvZOBCH7VwUvDoEEQxm3MUzdeg6SR73n0BcdhI2qObZF856y2oqT1WGHMuz+oABcmJwV4cJk9tiXELobIWWzGCHUX6I3Tdgs+cWn1yba1ZoYow7xjz1na2446IyfTiitXVeh0bMAhQMBpobkBQPEdsCz6jt3qmwUgUO+asf8vErYXtLECGMB7Vq+srzTrzPHuaBQWHG9YuGADu3J/jS6/c/ZXPffnOV2/emfPKSk2bG6NxVZHpuq6z1gYGKpGs6RyKsmYyf5FI0L61mpyyviuei6x97mYIYqxqkcjasSWgOIRrY8BLrcCIB6UUqMr0ZTu2XduxIaa1STXeWKsvj+qqBgC2JTKoIKIYAI4EFJdQzEyLhxRlyhiROKDpByYULs29TUPQSk3uHMncZQP3vCuP4/g2F5BJjvnAVSccM4h8AdmCYwihCrZMbNz7lP5kRhCR8+eaQKIHlpqTGRYEBplDidFhAD0TvuT6gYSCg4RHH0UF7LCBjUiJFPmSy4GaaInps+qFelL2QnoK/cNeoF3Ss04amXe9hPbiGpCYx+K4KiSWkx6OBh3WdUPMlt/1losrF8+sfXBttRlZZiw6y13HHTOzgYsAMEAaPsz9SJ3ECJOD8la7XKw6GAoQZjj1wH0gtmy4czsZsDqp109tTM5mgxYUHBE0YGPw8mtbX/13f3jjJ7965f7dqqlxYnNSjWpTsVV7mLSG7o3v6awd8OArtT7R3MV4v2z+ZqD8+qVY1mB4rJxHa/6umDlZy9y2lokYqytmtL5WX2waM3ZDHg3+XfBwYMpCcZghSj9VIcOTTxEc4lQJXpGIoqJ8AkTOW84UxFoZ7QEsHiXWVkxtvRRFKBFGZWCIFVScU31GGa/TybZ0A2mhhDLl3QJZZdgqDO84QSX5cxWBQrpzn/VXZdGOFOQhK6ok4h+QCRJaHlLkZEHedf3XdBuGpvy8i2JwRozEk1zwCEAAk03EMB8/0tORAURjZcbYkDmVBoyuQ1w1DOcNSsG7FARb1ZZTskz0T+HAkhNQGTPcrNDZ//W34fDuKEAqgTxxbu38E2fXXlwb1xV3FouFZeuz6wczOfsVi+IzDZU+9MP0v28Stqv3e0SFIg23C5FuomsE4x8FnqQSO8iWN2awtcxd55I5baw0a+dOjd/yzKVzpqoKvyg4WmCec2eBV1/fuvnrv3/tn37xa/c+b0FYX28wHpnaTRVi8YiDLSer7BLWJXOub8TVmarcdJR99+ybJCk9gljqZeRsjc/F1D78KHJeVRySLUhRqKD+dWSIyJC1xG0LCyZMmqpaHdcnmqqSm9vPT11wTFAiAA41ouTmylN7FVzkjqw1wT3wNPMjh3N7igzKIqqzqJMkWNGlrTKNKDDSVBodQBSwDyrCiGAbf5c9TbAFRxUutR/c87cZwSbtckeAn0QUPgzNo0jH2k0QRfXdFP/9foG0fRHoHz1E0ZM4++yZaN4IZDxRdbFX/9jDLzRgZBKZt3dh0Pb1/cbAl3Driu0GPhqsXSAQjlQWaWaDJy+coYtn19564czKsyuNMd28Q7fonNYgK1Ymw0c9QSVezH93eT4hkV/MAYH8Gq0QyHl5G1nQsm8BZmbbWRBbbKxWK+dOjd9zarNZb9spV/WkMI2CIwUG4eadKT73ldsvv/Tq3V++u7XgyhisTEw9HpsREZHfusTeErqESWOQyabNh7X19NIB6/8ud7/b+XS1F+YAb1vsrzfBDhB5PAEEy+CuA4MJTVObcVOvVJIbtMjDBQomXd4KDjXEM5BLLdBWSveuz4r2MAFwbMe7prDKFZes/75Lqt+DzykQLbe59TO7PvBKcoXaC449IrmmizMrWTzxwuXXaYjAP3iW05fXrMhXr5DEa5xfoj9ySDcY/7p/bOHOjws02TgEdTo8uJCOX1mahEf1+WLoLCOQXOZk0LBFKUs2mViexFJA/Xb63tyZIZ7dL3Z4lMAMrE7q+vzpybvOnhyfaypgMW/RtZ0NgXSyTsqDR6j1LX757LdhdeDgJuyBvI79zJLBAuTN/szgtmXqOqyNqTlzcvSOExv1SQBgexSfXMFxhjE1mBlXvnHLfv21e7/4+tWtrelsgZXVyqytN5O6pspatmzzMhh6PuqoUsXhFO9MMvTm+n0QJVJkhrslWavTe4rst89/lQ2WBkKyekKFNLGWue3YggijpqHJqFmrK9kVW3IAFESUCIBDDe8tYnRsY6InSWyucpQjWBORWRq9Q2uZASD3xXMsQqruYYgzhURTy0wBIVlaLvEyHJuSUMh8D3dk3ErGBSFP2FJwfOEWTjK9RL8QG5nT0gZiVZhDYh11jZAXoqIV3/sDahqJAUCrT7FL11kvDsfttSE1r6MBoJD0I4aIdlEzgzeFau9Mntwp2cCkzQIDOncvdES69UMH/q7ZnCbe0JQjY+w5wDKm3GetcqscDcUEgObxgsMNqlYIsFiZmJWzJ8fvPrU+Wq8ALGYdd621RCBjKARIhCkOiJU5/RkkUIDj86fQlJZYFX3Psi4r23ikDUUQSinx9+EqFDBzu2i5a1usjEx95uT4mVObo3OAskMVFBwRuOTXBk3d0Guvb33+i1++/dlrN3ZsM66wudk0dWOqsIVHK9H++kHpkBSnDgZT99Lbebx0INM/MQIm7FztD0xlZ1lBluUj0CO5C0i2/vVSaWmjRbpN1lq21loLIjRNhWZUj6vKVFGyLihwKAaAQw5mWGt5bi1sotFQEP8SH6h/I9sTs1wpyoORc8pcOknl4cjUtFETip1xyrByqchdlh3v7cuKX5qUcETkVD13igEWLleMAccVlTENmZgSXW1BobhNJNfCWP7lgXIZHn1jWTJlsi6Hk2D2PxNcQhYD9rccJlKbjlLwaOCfEcEYCoUiRN4jkm0BMdFJzJcSOCsNUM+wEMnJmWUYOp/mpQ53z4E2faIsxcKDoksckk96jm6ckUPZNY4AP+UOgMXKyDSnNkfPnFhrRgaE+Zy562DJQ54BKfU8pL8BByNfWA8ReY27EuoRhegBdR/qPS172vkR11C2BltiTFtrpwvGZNyYc6fWnjxzYvXpC2c2qAj7BUcRRDWsBV55bfvl3/vCrZ98+fX7t7kC1tYbahpTawNAzmyjaCwSZ1ZlCoohpp6BOMVzi4K8DXbXKM0mHeQ3I0a+QR7P2gbYa0Do34qzF3ihnBmGGKYCqto0seD7EeDfBQ8NRvtyCw4P6npFhFBYywtrXcAfEYEMGSWSAlA2QlY+ncClxDJokYshIZ7A88VgE9XBBgmGRFzxkHilitO+e8hjYIUn9yRn30aoWCRViy7eS7FxHSfIsmsMVYYoVoNwC3MM7vXJzvpGAOhL1GlljUcqLyQZAYO9SwQLSk5rGlbao5+ukWLFCMBMRYp/LOCekwGMgWNPLEzJqEcoCdwAZ6gMliCVN0DxYOFtmr/J3nEhphgDlYWVJ5vQFZZZFFiTtPvPqhGYia0zW7j5ASs5Y46WmOANAKPGjE+sN+fXV+qKmLCYc9d21Lm8/0BYJyUhgmxNC8Y9vx5qzSBUZNAxeIB+E1mAvPNPRCXvIcWZ1JrrlX+/3BkYS0w7re2mC9jRaEznT6+fPnNy5e1NYyqgg2lKHoCCowVrZ8xs8Ptfvnr/01+8/S+/9PWtL05bxmRSYzyqjPEhf+JlJy0bJp59ZQCQSQeI/pwZ8NDj1XFd19yZ9JawEIVDuq8gKrj/YlCthPxzuF8LZQQQPhMSfkvHweDg9qARIxQRNgxUXMGgGZLLC443TPEsHU7EaczgZLefkiRFbtPZhAEffZzGRYdQ6QxLvVGSMEoZGdLx1S3k/WqlSZ3bJXtaegf5hihOd9gWij7O8AYAsFHULWd8aXa1iCK3pgdXbtLrkMU9PZ7Pnf5iq4+IYqFuT5Sw1Ci2tAp5waMBizEJov5pB1EwAAXjDyVsTguVy7JBJ5STs0nd3kujTgbk9EK5qx4Z0iAhx8R0nLRVM2Sxv9/nMMCZPZqaxqsr1cZkXBGDMG9hu7jABJdfMH9IKEeyyKgfUv10/fVYY69VarlXUHVLxmUa4XnL3bxlHjUGpzebycn15rmqcuyPu3aXcQoKDisITTWmz798++WvXrn36zvTjseVwWpjqlGFmgDYrFJVwlR3U4RV3V6l3yfXBZtf3mW6pPfeJ33mZxWj1zkKlkm2rDsK60kU7qMZJJhCdv/eBccOJQngIcWi3REOZYhgRJL0CfQ4WgT7MmOwQJI2bnphTwuQnEk0XrBl5eWQV89LEYZR5lIZf4AJRZ+YNgg4C2o4Gm6WYn4ACcnk9Hxy0wXHEOydaiSavw57VoXO9AKq7GXBU+BBachvjF2JStJQwjRpnZYTyjU/T77imfDeA6VpYmjOFHwzEQL5LZQziQFYBoeDaiO45EuRqivLRLmeESqQh/BOPz7n16URAYF2ocVUT4FiK/CRCmKYTfhqYPIxoUUaHps0PvSoa9NMRtWkqStYJsxb7joLqx1s8sXDvPW/DcsCGrd9IGbeGbCwQEUPyEspGunPmixm2VH2yymRMWSICe2Cu0Xb2bpibKxRvbFWXRo3Ve0uKgFEBUcPpiK0doEvf/16e+X1rV+6dWs2s3PGSmNodWJGVYXKuloALnA11boVa5XtpIhzUpftDMwg57R96O1UrlXO2bMVIAkNhL7Q/QnliAeUf0SRV+9YiHK88C0LuARhe/6mBccPJT76qCHoJ6wV46Vmnij7ZQr/fkD782WExsk99kXhveyTIWfBgMxEqaxVoeBYI2g5iSoUrFi5yhN0es5octgGHxSldNAhrW4p8kkZxJSsWVm5H0ek+596gqVjU45EvGOdkfBYJRfmYmJvrEzxz8YaPBytvHhgnX3pLq8jgsqgbmpqKkOwFmhb7izDeu9ZCAPo/wb5D7/HCth7RnuudNn5YeqQcOOu5a5dcAdmTEYG66vN6dWVZrz3vRUUHE603gFmTE3Xb+x8+fVvbF+7v9WiaQxWV+umrk2VhM335uvAvAi8OzW6aelyyAigbaP7W62XjJ8fCsMqXt5rn6wnSawvM2BZOJitS06QghymhJgedpAVPhAYnneLB1diMBM6K2SsMcpRRlT7leD7A0eeEnjLgM6TbO0P+5fUcU4vCGNlJ4MzJdtvLV8uGkPDgOyvc8GQlMcQFNI+biAQzp85QWSohnO+alu5EJ/MEX808etzzFcBiKMv9sCJoyBPqh41utgz+fkn5S0hfYmFjpW/lTjYAZh9FGPBY4HUty78kjXLgzhfyBEHC69jzWAluiR4jJRBiTlEN/mBUnYXvEKIvJY0kQoxeYoSFsvxzhHvyd2/6lO2osYcAdGWLL/CUUFV0UpdU22IwZ1F17lUuoZARv8KsrASi1Ux8IXENKi8jBKDJ/t5tbc/zwKe70dedj5f2cRIYVvuFgtruxaoK4PN9dGZMycnpwrvKDjaqAAwrt/cufbSy3d/+7Xr0zkbg9X1pm4aUzneJ8wNkaGqWZZZYcObmDMrlav9FvswndPpLY39KD6nRzAgaptsUMz1/lUlk6gIxSg3qBVIy8GQCC/Sy4ALf0CQf5o3ZA0uOJIoEQBHFmmhkaVyW378wPKdZioPKBwu5Uup0DNYUckJwkH+Lii4euMOMyR5XrSQ97PxR/0qNOp52eIRzs/0cltw2lgpTcm1SlFI72SIiI+OwnW4wQDYQG0BUMfTphT/BBNnDL5/o/fQP7Rv7BZn0Gvq81KxEp6lj8MPQxWapkZdmQrG7xfWT1Z9TUmNK4cpn/oHlauXPYK8n+XMx532FMVM3Lbo2pZhQDi5MTr15LnVt186t2nqqkJdl0SABUcPhioQAa9f37n2mS/f/smvfmPr6txajFcqVDUZVpZLZ4zL/fsZor4eMDzN04maTNnBtf0hQbHv3Tg5A9yxlMKKCYaL8l+QwxQr8eFEXa+SZ2sWIKn9TN5D5AOgjfONk1gjgcSlicRZlDCWCOUbjW4kyN6p5HqFZI+pWFyVDTZImDoJoLz8Lfa8rOJ1iZmSnYiqDQOufadHKjg+ELOX955bRsiyG3Y+y97+mI+CAsFKSJRQpdjd09g6Ul5aIUrtCqBAzMzeMg8/i+S8jOkcxeIsHtAliuz+2CC4ahSFsP8neIHis/eRSSEjU+B3wkM1f2PF34Inqb8HXwdOxVcapq69T1Akyuo+4neSQSMizUv2Arx5Qu03GU4ZJnS25fGoWasaU8MwLDGs+N+8mhBzekQ/ms8FEmM0ektM5hpUbeIzUXxCmSXjY3Z96CrkypQEiQQxBmR8xR9rYeeLjtlanNlsNt56eeP7nrqwfm7RtmxL5G/BEURnp8wW+MKrt3b+8Ct3/u1LV+79wc6841Fj0NRkYv1SNZ9Cgh93OETpKIYa5NrwYhXpp+awcF3JVSX8NYjElJQFjv2FMKuQ6yWWX6U0osDPdVJjApDFBUEcFpHYxy35/AcgQ6jIEJFZBJN0QYFHiQA4UtDqg0EipLI+R/3muosDYdhNsaufKZxcZnXg7LXPe4hMVuUAKAzvOCKq0xpp0rTU1h9bDFLufkhxoLfBiyNpZ1doY2x+H4WOHy0IAFlITr8kiWTfZCpIFljSb2jf3C27h3S8XRltjgPwVJF0xRYRSPOw02G8/6auVirjDeQ8FH7T/728wB+sLcGQOGg83+UWhn7GoSmfLdm9rvwy3zF4Nm9t13Y4tdGM33J54+PPXNp4fj+3U1BwWMEgGKropSv3rr56bft3p/PONnWFpjbGK8Ns2cYZy/L/YGcPmCtPDAyeDYSogwfrB8juQ2zK2k6BZWzEHbGePxkiGENVdGscdv5d8DBhiofpcKKnGngzJHHCROImI38uqCRM7khgemqP/4CuEm2X7C2iUrJM71dUF+fcSYyZwZqpmmRyLXkrrPwX9qjKfxTvQztUJHcAkRRyPriIXXDYIfTHNs6H9FxCM7JzjpBm2xWvqc/crUrsODLN9/uJJsByrfIgsqZhRC+DbAn3hO89i4jex2IAeHzg/Tqu4krYCK4rrQZd2f8n2qHO1u/owRHXkIdfnUbkXxTHothfzBFF4SXXcrgruT9vcRJvlQof8CtHtt+VtMCpAgUPOx3GgP6mNhNTkWEAViXciJnB3avnCdQveVbUf87h+eoSDMliF62AyTror9F7f8MzlmcjvAUMGCZm5ums7WbzljdXm+r5yxtvfeqJ9W976onThtmirlaLoFdw5EBUgWHxypWb7bWbO797f6ddEAijpjJNYxoiUGeZpToWgzzDU/k2hNchztkezw5TUJxN6iUuf0DkcBEIEBKGDK7pidAbZGO9C0FHzab3quT80FZkc3F/uDXCGDIl1VvBEEoEwJHDsIAWdA9AsZddsMzjsHSEB2mXttovi8qv0My6oAAACN4IFKje4eAmoeyKZY7fXd1/S0bclWgLPT+eiL4XGiQE3yoo4hggusRj9Maw7w6WRyzkLXofjlSCFTGoAFVNEzKyJSh+WTHEaeE9vEhv/3kDt7DXL5p0v9TX5wwWfo/vdGbb7am141GNJ86tblw4M/nAqDEN0KKz7YPfb0HBYwpj/DJPY9ramr9+/95s2s47jGpDk1FVG0OGO1gXEM9qGg350A8wpyn9oDfr6BEeGKL4606zDvcly8R9Cc0Bw8UKjgFqStOtFxwSsBdkyPueQtmi4AmSnYIuDEh8QH5vKctzF4NmJAJK/+QchtI3tISB6lxKUbSCuLaQSJXcV+FZ7i20jMzb+U4o8jbW2QY0WyykfdwQvOkAXG0IH8kcMgIFXybr5DghBFgRq+tDrOwyIXz/0otMEJ1mhxWhyrX5NPGDiVOP5H9dcgDB5VDwyMEA2IBtjCwxAIhDjhVt0dF5SSIPzfhSnlk/Z7YZrVHKSXMyG7hfT1tCyyC13Z88GcaoEx9VoJNdOP7tAg+a3UY7PIj3X9VmhYyJOUHc0ui/s48FoDj3gz1AedcorEvOq+h/L7gj6XONtBE4kBzx5xUPiR5F98HfoHYOyj+VgWFLPJ3z4v7UVufIVKdOjKvzpydv21irVwDMSwmwgqOItt1hoooAxta92dXr1+5fvX95/WTTVFib1E23sN1s0bVusWcTZ5CaV+AgCMdsPUDO69y8jNNPtw5LehQcEKRjz1N0BSBAeIwewPOZsDx4Hs1DdyKGTFJyigxsEcUdiTs0U7nvggJBiQA4EgjeCRUXmp8OzIeVYJdq50PmxNAmMsY3xx20/557MQOFpxUswzLaOGjIiMyDdO11iMf2r60vNcYrz4TLwlbwWICz1wC3UjRFyd+8pVeu84R8ve6WCX4HRI/ZDyPpXfaD+aR3Bx/0cYX7HS6ePUmGyIgSECMAKFiWdSmuhF0Q+saah7EoDvahmU7/AgKjImfGaFtupzO7aDtg3FQ4tTk5f+7Uymlmyz1lo6DgyMDAELB1f7bz2tX7X7x1e2dOZLE6MVVdkZEcu/3rhn32uzG7YS6qIwC0E+xAnQyCtawhBsfBhoi2B+S8XLbFHiE2XvBQYLgQxSFFEAwMEYzPcB6zkAZDZF9TceJNmkU07k9Kve0JZ9FdaVE3yWwd9uErS2autGuhyvuhpB2LPTWeD3+TygKxrThTQ5ZUZuXuKPR9nBAyoTNsoDqOlO8rZESq8Km5M8enWkDz1dobwhgqN4AXAfz+P90P5LzKAq8zA6frubh0veIFn7W44DGAMDiXBDCEgGcJ8vyWUBATjLiVJfs7CGrTeHz8mXEp8G5ddSDJuRKyo4TPyq/kySfmmIieqUjYkhUr8GCVGINDQIwjciLWE+ZN+G2/2WAYMAwzjAXYwiU5kDwdRMRkwtoi+QAkNwC7C5AyCoqP148S8y4g+9n0g46GIMkoHu0Lsq5qDUA4GMJzNm4JJmuZ5wvbzhYdyADnTk3OvPWpkx99y1NnxtZ2R+HBFRT0YSqAGDfuzG999cr2v3ntxvSOZYuVFUNNTZXwM1ahOJJLRfi6SL9R4vQMWWXdI7WvS+eoCtIzU6iamnH4lM8HUBg5qfehRe4oWoccARKdJIwiuQ/JL8M+nQvpygeEo8G/Cx4WSgTAkUAQDvbTMkiuCYaNoSH30K7ep4HD+7qTrBPWzPIAiLyc9jNwwXEAceRtGUEFmbpHafsgnnwa5Mpbdnh/5BjSjsXF3EkShT8/ViAQGUPGEJkBZkuRt5IXN3uN9AHanWfvl372bBM60lapfrPEjNCzThwtVMRUgU0I4fe5AeWJ5N84mlkGLXdvInajj7RcGYO4Y+bpYmHbrsXZk6O1dz574k8/f2nzIgCQqY/egyw49uBuyoDBzbuLOy+/vvMbr92cvrboGKPGoKoMSQLAvVflKH8und1iR10i8+7LXn9QlqraL703ZY8UQTqwb+OKARxgxIJjArM0pKTgsUbbbssktzpvqBgFw1/xQrH39lDcV6SzoQqTiR4MEWKjRz9sWIZXVEh7RpB5TvtW1pDpNHih3IAyhkqTHrwhHKyv4aYRWa3swlKytHtTmN2xhaO1WFPX04mzzvvtt97e7p3/TEzBCu/nQKCnkLE904ck1wYQPLxCs8nm7CHlS2z+vh/2k445uCAHFMMiuz9yOOdrRcZkWZW929jzo6R6vH6eMaojIwlPM8mzVww5GoSy25GKKjq/fODeUT1UGf1VlJhbB1S9er9mRCMxEZwn3IBBi/BdjwAqIlMRGqndIPvr1VT29cApZEmIJRGUjS5E9gB69UvXQc9r5Fgs8+DayjqXGROTXjg2JBb+BVkzyT81sgzennd2umhxarNp3v385kdeeGbzY09d2KzBjKou1QAKjh6YK7x67Ta//Pr256/c2PnidGG5qitUVWVABklVDS1rhvXZc0/Wa3ic26T4pE7fKjwTrOUAkRXSdTysDXp+h35Zv00z/Ue+E8ZOLk+Wilik1LGH3GRQ9L2CiKIoHQGIZ4LB4D1y/YREQyobmjr5YOMPmCWH/SQHG6DHqpZeHmK8ojGj4FiDmW1U2Ifs8rKAJ0vqMCj50z83YNHfzdcwZMVn2Xcsd3SUtl0fIfiSb5IiDss5HCtjKqXXB1gcPDlbn06XU4q+m70v0uKqEm8Tgffww/0SHcN24I71M1APRzYG6auCnL8/P9/Dh4owCfckO4qIyRiXM2R72i7u77S8Mqnw3JPr5569tPY9q5NmDFjYrlQDKDiKMDDVCr124/7t12/tfGY6t11lKtR1ZciHv7MyqgXZIEOUpYcxLNceEA/SwYCDLYHiDASn2IUySGGbWlH+C1IYXk7rBY89GAAbN8eJo1dfpY2WPc8h07Hf+Sl7glTNUojHX4wEiIaF6IQSjypi4lE3vh8sN2P692HPrPZoec9Ipu8Ef1bwiCHysWAt5eB1YWa27Db+p8y7kPaxgyd9a23H8BtkDcGVivCVL5KoE4QXkVjapSZAdAc6UlPxLNoqr+t8y1wj6tE1oBVC5Sv2+/TEkUhx6tjIn4+KAnZYwWBmaxmdtbBW15Rg5kBPsk/f7+lONMfwV7uQ4yvu28/OJcaqPt1JfyEvgOxFFU+x3Ifcir9W1caObiTh/ZEm/VFC7OGwgzHrmGcd73TcsRgA3BpqODF4RHdeWExJPO4ZKP2pEyOg/vVY/aLBiU9x3Ys5I3w/YSmMCRkZgAXBgtiCGWRRVagMgaY73XzrXjs3ZHD+3Gr95KX1D5zcnEycSlAMAAVHD4YAtgt8+ZXri2s3t39/Ou3aCoSmNlTVVMOAAs8Okq325Et0Fse5Flo6fp4GZwVJuBdFAM2Xg+Kt5NwgzyrnmXde6fxXiflV5+yKkkO4JkQ5AjDEVBFM5ZKZ+EI1XJVKIAU5SgTAoYYWxih49XcX0Sh5F72fw1flZ4Y8m0PepSBoLhk76Wy/WNLW8/Wet23XiwqONNiyy3pF5Mu16bORivecAyr0en+UJNaEXe4t7BDXYyS1LJ0OuGdPBd9csGGGtQyrBUl3SqyTWjyTy+JraO/oAcZHQqNvpK+Ba/u3dxS9Ru77XL15lxcdT61P/ucNhSYm5BLRO16TCuYPB/vuJ7MmyJOxcncEVBVMRWzaOS92tu18tmCMxhUunlt78rlLmy8wd1xXD+nGCwoeI7TdFgMdqKro3tb85s72YsaW0TSGmoYqbwCwIinuxdmWzUu9c+ChYcmNDI2x19heqiGjDRRMytJQUBBRo9SZPtTwO0+r4NGHeHiYw7P1LC+ENLLYG6Njx/vlg/9cVUh3f/3nWP9cayvI3g0wKb/H0ftgB9qKoiUsjsPx0JfslQ7/yO0406wvhwAKOQAeOqsueNwh9Bz2ZEt+SBLvaNj6wkB00VMUpEnI36tzQcdT3ljpQZfXkrq9rpuhlJYhuibMAjdMzB7gJmHwNppIy2XxfizAzuEKQHuEKDBXjrwU4qsNNiShNXdAXeL+Uu9NbA+R4UTEk0gCRVXwBBRINPLZkDk64dqKtmMUQTROSZKYIwQdvN9ZbpnJFXYwYSM/+d+QWH4VZo67iDiuQRSetHLt5atbXDuTJS48SznBiMtzuDB7Wr5/40iCSQT76CEEOU/AYsHtzrTlyaSiJ8+unvi2d537D7/rg0+9urE6esWYmqxtC0MpOGIgwDK2txf3796b35vOuhNVRRhPqqbtrG1bbo1hMn6ysITZMMR26+ZYoitzmOYM+MgAOS/CAgaNu72NQiow13URo1UpvyoY+ii5VtpEbh75kd7M6GQdV8mEXPRj/QA/aMERR4kAONQQgUOnduqDwz9BWMy43N6KsnJiLbmLtLFTuvS5gfEOapQMkrKXhcWcSwHZr1AMAMcVRGQoceynirtWz2XBHKIVKe0jbffG3kS9lCq536ZQ7+MESmMofd6GKBHu7soRnqgV9KVPerCrrB3l5wa6VaYHGmp77JAYAOZS+8/r/xTzMtiYrTYunv7PQWsBLJnJPaVhjx7DKdE69Dlv5iRnNmQwb91ftPfvL3Bmc9x8+L3nvv9b3nX2hzbWRiPmDmQmx5kICo4kKoAMZnO7c/vu7Mb97TkbA0xGpqoqMsFgGqTFiDjzRIkezgp0kAiu3qx/CE744S44O09smThlF2W6F/RhHlE6m4KHhczByBSZV/DokPP/Owd68DYG+cMp0wSdLTpGtCpRx8fZh/NBE0fgdj2mFwulpzetuu4nXUnFq+S8Emrd57gjU26BQCXQ8djCKzwS/cbiyPRv/Azxe67VphmOhisEUo9/4xnEScAZqep8Fn4/N3trvLy85QrZthVRJWNm91zFKA67xwESRQJQdI47UpBa09Fro3kYIfJCeF6LQDb+lR7PX87zbyDVJ9yRbByk/B/q0xA9RVWS4vjyfVQOgKMCPYsWrZ3azloCYIhhJN8/S2C9rF1STEdyhxiEqjhi0SGEqgy7qA/IVt2YOTwnGbVkhlQ62WdZVvUKDQDGwDCB7u9083v32nZt0uCFt5w8+463nf6RE5uTddfJ4mH8nAUFjw3IGBAZbE+7uzduz169szVvwRbjxpjKGCOrbvSTA1EQjfwvHAdSP1U20UKSV82MNZ/PJ67y6kuuFjBFo7C/NpQhEX4j7j0RauT+tAzij1HGQHylIdKW57pUAinwKBEARwBarAAgzIR0ChIEP1UI8k/YxZI+A1QVlN75ZapJv+/IvAYFJNG4lpgDwuUhtjtucYiv3EZbFKdjCV/3VoxUSbLTpUpNrtAP0TCGG+xBZkotSPL+9GQHEQKC+lbweCGGWAIQhtq3YQ47fBOBcd/Pd1/0pW4gkT2HLube4SXxL4NHjwKonlDb2h3bsSX2WbPJm8jzp5ko5yrpFoZ+naF1LVMEdL/RhgS1cCdr7eAQ2fOTpY/BqCpUZIimM7u4t9XOO2tx6kSDZ55cf/szT6xfZmY2uw5QUHD4QOQMc9vTbvv67ekX7tyd7djWoqncnni1ywmJ4T/2kLxbxvn2O3P6y8KyXvfPZ3vxYoM302cQDGqPKi8veHDU3FOYCg4TGLDM3DFLKjxxTDiOlzrfxaqpA4K86BEEAlXz2H8mDMsvGkGhZ8lsDpdJWh/zwzndPfkOkPrscv8xFIsRKwdQet5lWmW2bOXrh7rbiH0UHCeIRM0WzJz4SoXuyZvuVfgTq3AW3yaSoW8glwKkUwdIA/Un1umVuRDakSdqyTIQYnHAsAiJ4/1YJhVJCh4dvHIG93QNXEZ2OUIU0k4geF8CLVJ4xEDklZEmoh0z9U55fhc+cuDNmjY5Za7qoOJ/xMEI5WVDIWihaCVcxi1lOhv10YD/PSzDtljYDhYWqIjIGGOsZWuZGJbg9YlwmZuiJI+BwgRPpn62sAVTkUQMqHuAW59ji3SOc0YnMlTMAK4Nm846QQDIEDHDLBa23Z4t5ts785WVlRE9fW7l9IfeefbHvvVd56+tr1Sv1aah1i6OyoMtOObo2h2u6hFtTxc7N+5Mv3j73vxu29mN2lRUGRjLbC3YsIvhSrYHEhgwHHi1VOMI4DjnQIonqigAlR7Lv8lukCMvTtqlJbCULM6xX8XaAz8By86fOIR8neAc82EPSp5v2+0y5wsAACZ3XBQcPjgjQNA1RNSIwtvgI9YZ0PVRxWh2IY3QbomOzUnL5Z284RBTrzh5E4D0W+05dsExQKCHoNXEcxSTc+krOE+3I1SkLepq5gxNIiAxeomwEILDo21BKlnGEPIhh23BYwCltCEqzEPn+3QSTu1vudU2zF4v++kgz2ixf0PoUTeZRqMMo2vtvF3YBVs3JY2JycE4xOWnbIOBUG52OLpCz/b+6Kk1UN0VL33gQ1/CKR6K5HwJSSYwDIFkb2fbcXf73qy9d2+G0xuj5qPvPf8jH37Phe86sbFSd9yBqpILoOAIgYGdaTu7dW/x1Tv329tdx6grQmWCaVZeknBXcWUe4Ov7HnYAu0/kffNab7DlXVeP4d5k62Px8xYMoWwBONTQ2gdLtk/P6VQxYe8qyOVSXZM0gJFGDWhBA0BQU4JrU79Un9AmhhzCgpXHFYo5K7lKDJzOXyoaUip6Obbta72x1NIGlrHlgqMPImN6KU7CPu0l4fVe3g9+2mUTRCtYnL2yXtOyQZ52SdUWCFY0f17mlhNO7NFWxw4bAlOi9FgQspT5aED9o2wXp/IaReGTIWHmjsVy9BhhiBIxcE4UV0CboYJqqitXaHarM92H7zQ08uHFop36L2/Rtt20bbuu6yyIgMqQMQbGeeZVDg/9nGLETvAU9myLCmqSK81j2co0fMbL//6TM1wy+WfJsvL5p+uqnLCrbOjMSPe2u9nNe223stLQe95+9vKL7zz/Pzt9am3NuQ5KLoCCowMCYTrH/NZWe/XuTne7BXFVG1QVjHGM1ZnJ1DzUPDS8yWz7ubNryNy7DLlDYbd2nG0X0pw/zS7iz3BunowbmNxbC7A9Ity74GHDHJWF/TiDgFjESEFUFa+X5NtEB195x4Pve42GFSTdaWCkwQHDKbNLOGzK5PIbiN3KtWIhkIgH7twJi73Zc8HRhKOJxJ4fI6hFqufYmn0RrdT9GmlN03mcMSEPD2tKc0rbUOJdHvqUOxpjls0063zBI8RufCRLAxD1Z7E4JfbSwa5ZKeuBLe7KnQP66vkQrfYukjSZkImhjQHx/VHNRWGxaFueL7pZ1zkBuTLOc+6eg187osVwIH4j++XVoqcNL5JbLKTf7Vm4Hb/oP+3hJ6vfG1n9iAhkXGSzZYZlrghUVVTNFra9s9XNFpZw9swKvf35ky++/bmT73PlDRnGjIoQWHBEYPD6zXt8Z6t77e5Oe6O1jKom1BW5uR0SrcZ5GcD9+RagYmqTFnoqL+PvoY9ozAWUYTHzJnDKBLR8QIP22MG1In0RoVaNCwoAwFm7Cw4rtLiGKK0BqpR4ZhpQEl2SA528ZyFrkPAax+CiG4sAYgtipWgr6TFVikIXPgJaZUKVczGQIPl28U1PZvUm0JAuNfN6iSBXcHzgnndqOgq28xByT0zsS/xJEKBQmCdxMTH5U956NSicM1gKCbuRtL4QaTEYraR6JfS6n+T5zvrIv1HBNx/Bu2pjIFLcK59IaSKpKTsR1Mc+ho8m9OHbOVpkSMl3EkMXxbwUibXVH49dZJIjcWCoYFFdE79XQFOP6OjQIaPtOswWdtp1gCGgMWQMgs4fyoT7QgA+TN8tMsFGg6jcRyjNQin4+ncmHqIH8eJHGwFx77T6qJ5TVBZI1IjKWFMbNtZauzPt5ve3WwZbPPvE6qmPfeD8X/+ub3v6uZMbIzAvUFfjYgQoOAJwZHzrXnvnzlb7yqKz1higMlnpPwolToSJykRWzimoKZvNNSc0g6J1z3HO4OUSHiA8QzkVOJV7h2yLKiWRYx9SYUTJx71cV+kS5PpxThCGSgJYqgAUCMoWgEMNBsBGr/6J+qxkkMRwqXQLLcj0ughD6PNaS+8ZIA4AZQTY59C6BSVNWTNfQsgBgF4PBUcdYohimz57PR8CDaV0xKkPIC2fhnB02EswfFwCDdJqQBzX8aAaDn2TQruPG5jR9fdiig9WislnxqF4dSLq5R4jHfYfYlcURe5Gibn4GOXZ2CJQM/f7WCYRpiMfFXp036rtLKYzuz1fMBsiNLUxFRExg62asvo3UpkR/QooUnra99JhadcWHulvLXK9nBORPlUs4n2E6mLEZKgjQ5a4s93du7PZ7ds7fHLNmI+9/9x3ffdHLv2Np5/YPA0YdLbb864KCh57EGBohe7cm+/c3Zp/bb7oLBFgTODPXhzO+Z7Ioxh87TFkNqf7PQv25qBDDMLdRboBgMQGkXIKMWoA0RBBpeZHwTCKAeDQYy/lZIiNMQDr4qEo5ThajlEaSrxSDJvZmNErmt2XspYm95fd6qBQlLXRaQ1SRc3tdyQiwBydfNUFDwKleIm2o7xjoYnylPUMaHkoisaQREA+oCAT2sMlUqBCjlPeQvWt72MfqkLBNwuBiUVQULh0uvxcFqS0C/RoqPekE0IZEvRif8tMR8N+Jd2kV+wuXOeND7E2QW7BOvRwYs9iYafbO93d6YwZZNCM6qqqTBUMACFmH4hqv5hU5Pfwf711IHmQSjeXvDqJ6RGqi8Q6kxNJplCIzZ3DU2adsZzCRgZHfMbAUIXq/nS+uHVnujBEeOuzJ1Y//N4Lf+Ltz5x5O3O3lJIKCg4bGB2++vWr9u79xavzBbcA+T2yboJyWKpZXROK8IT1P2HTMofDxqiIwPZVNECPv3PS0rP3zALsP2tjX2TSKQ+IYvUys7A2Q6fny0wvENTLktcUHCYoy190IsnWRfbRQzFqFZ4NiNACJKGGQUgh7TdKWYm0D5nURYQg3ccyuaI3WHI4ODd6baIspk+Fl3+TZncv9H28oKg3RrlE+3lIuN2TAaA/CgmlpvPcn4oebbpDeqHmMHuIU9rM9P3MHEYgGHW40PGjhUUSHK8JxMVohpbJcw2caSi7dH6EBz9FswMlJ1IVUV07QNiEVGwNdMzCaFmWEe8nY7UN5qjBALCYze3szr35q/fut/ON9dGkaSpT1cZ4puGszT72v1/2E4jrkfuX/a8sv2Vs5luIEadnzIk95NfGlXeIWkJ7tf1NKNR5/SycAQAgXnS2vbfN2Jx2zenVMT335ImzH3r3hR//2IvPfJG5u05UkTMGFBQcTrTtNhNVBAA7s8XttuWOYHwEAFyFDxBYtrcGXupmvd4nkKjNOrlrdp78LOVgpRXZIAjJyT3mZV578In9ZOshJ20HpmdI/B3sh746oC9XC07kmK6UASzwMEtIsOAQgQHLwXCYuQcUMj+COhZFSQ4ufn8mnFLMjFMrYmCkA1bORHbVKo52nOg+vbws96WDstQ4mfwUza5O9DEj/R0LClLsRhdu7rgs4FG/G2oW+1rSH0G0KadSQfb3pnV5lAErUTOo5Gh5DCH8Le71dzxJ76qKLeMllBgJNJLgKCXnZQmh89PI3Mr6TTRVRPYZZFdvl6Boxeh/P/bfyKrLjwotSg6a6cxu3bg9+8yte/P7bcdoGkOmksCHmF+b9foDSTkTz4R+1RMeNC6Gz1EoT4zXuqelPCqujPJdJClPFmwSench0G6Bnbfc3rvXLrbvLXDhxLj+xAcv/onv/NATP/62p8+suKjAIhIWHHYw6mpC7dzetwxQRTAVwVQuEMC10UFbcsQzTLb+lebA2kNt7yFm7YtCa+Tbmjlo/pL3Ebmx1CjuJQnUPUnkEvwYxhsIl11QcKxhklWj4FCCCUZYjE8eEmI2JQ9gEPYYPlpZ6hxr8U6JOr5USm4y0LzL8bZlHEnpMtpCQBwOxsRK/mpKPR494ZUzISfaGsBq16bP5YT9s+qCowZ2ZEwxrM5BR2qTLtInkr0YnXLtS/oV+xjCm6RfP3aSkE2nFYyl4qJdn+Ld6Lxu1BcSCh4dAp1UYTOp5B61YFi2stdjH/pbcl5zTkoOeG4shiihTdVHvic0HyQXXhONMx0snJS+rPTr2y7a9kgQobUzBhlsT9v51VvTz1y/vXNj0XZc14SqdmspIHMw3TM8tJUtzHVdqTsuyKGNhbCVJZadYAlIx8g3c4RchElCAq38p89UWIkxxhAMtra62Y0bO/MRGC++7cSJT3744o+/+62nX6hMA4BRVStl4Sw4xGDAMqzlFmAYchU+KgKRgVGZAMMVIT1AULITh1OM7if3pq/YS5I+xZ+DnKwTAquZnPMBUfKlDcWZnWxIYJW4eLBygerXwGl54LoYAQpylBwAhxpRyOuv2BQSnQK7TH1hcP4kBRe7KCipMBIdWdFIoPYiLr3TxESwi4AcSrQt6yuRa1PWKAJr/4KCYwNPNhYMVrnaM4u/Ksiu6XoP5U2gz2dGquhHEH8wh2b9bljbJsRsn86xQr+PITKDJw2fjZ+iR2kIwVY00G2i1gVy8sTLml+qsQORK31yv19JzFRRdw32qKMEAmF72rVXb82+fP3u9BvzruO6IRhD5FN2SG6HsNzEx6MNLNHEku7XTa8QY17OLnR0cN8Uk4J7rfxnn8Yku56cmT/eZ0VEpjLVfGHbu1uL2fZ0gZU1gxee33zi299/8a+8/+1nTzAzWzt/oN+0oOBxgRjbWSruJLk7xKK6xGTqK/rodZyTVksHzPqWz4j8eD83P2Akhv6orH67S7sEkBHrxn5GLjhmqItF6DDDcQEDVMZLAOxrnJJ3UIWmsuWZJL2JP6g0cvKMElCCZpAgU0GGWPcCxXmW0JMYL8XrRAOtWW4pDK6/ajaOErOYWHboFhvncYd7+pa5s8wdoL138p8z72vpPhjsKaefjFC1ttYjtL4mqMN+geWaVDBgyZptxLgVBtzjexe86XBalXHFpL3D3yuKJAyXESJE3LP3ZUhj0oieW37Zk1VBW1E3VypnjOBC5NvhVlPK4dBXuDieZX0NI4iWXmg1yahHgw6JCFdv3eOPvu+pK9duT788bbtvr2oyVaVN4JIhQX47LcGnfvfgjAOQLrx6TNHViTlZ3eLaLe3CcT+WGiUeYUVWWWvSF/rBKuOW/pYYs47bG1vzRTUxzcZabb79xfM/ePvO7Isvvv3CPwToDlFNzEcj4qPguIFgAVjHpN12vrCXKeTjjfKksDzIAYRJpJIIxVlIqX6upOnkLmIUoO9ZZGC93TUfMzku7wlYdioY/wLvIAqcnNzcdxy83dWAUXAsYQqHP8xQ/oggtaRFqoJnH8gqVC3zNQz5HQaoRKyaiMKmtrCmnhL0vFvLv8/QPQ1g4LTUY94tEqHg+MDrL30rGBCt9cEylb2khyEMWK12vwNl1JfkYnG2DNobCh5n6Ie05PG5eNEoNhKreKw3jlw1XNooE173C7FpHFXHkZivr93cuXv91vT3Z/OuNZVBbQyJ5C8OxNRPCLWYDUEd33fYhPYv7nWJXmk5PZRcyupY7NkQg4yT++5uLaZXr03n3DHe8dzG6e/81os//t4Xzn3YKf4EMpMj+vQLjhMoKsH+SH/upku/kluRzrhdBdiQhXr3Zsvk2yAzD14f7z3P4++Nw3t9qaXjFhxfmH5N44LDAwaITWRS4nL0CjjHWE7ZDkCIfgQXKWBi+DOgIgj8Ma0okT/vPU+y5ykWIEh8GuGlkqlxYghgQO9hikYKIs1Iffo037EIMyTjJxENrvwBL9K7KDg2UOsbhYxWyqcn//kJEs6xq6UlMn9M+ZXL1W5OeFpVWwdEy5LzFBN0STuIScAphy4poKruq90NBY8ZGACbuCPTqI1K6TMTXqefePIKzT3tSUoWhOgtlzPCM3AAip6UkVN4ry/5xpKTwPfvSNXnegljUvaSm0bQPoWXG2W8iGLC0RAgXWI8Q1969fri+s2dz25P24UBoa4MVYaMyxgekulIyJCfx5InBEk1xRhVzL6tiqCTdYt8ig+hDkaPTFwP6S/u2rp+Eg+ieuknKvYnvUVYtiQZAhkims/s/O6dxc7OdmvX1yq88NYTlz7ygYt/7Xu+/W3PMy8Y3KGuSz6AgsOGKFwSS079wFej9UyV9ki2spKl6L5SWwdlgoc0PoTAW0UgkLk+kEh7r0qqrLbUas9+iGzVongQh3sTXAZzN2kDk4rtCgo8Sg6AowBCFXRipYeLEUCaJfn6AjiTHPYzYOCW4Qb6zCU1P+qEfbt9kSAJJf0s/6iO88CXG7ivguMAAogZVpNENAZkNqhlPWTYrW3ufMv71lPFJ/gbJszkwmIMeLygn4XSvETw0tp3qEyi2r4BVjSgsi9v02eZe8meaWuw4qdHE4t2zsyMUdXQ7XuzK9NpOyNmNLWhpja1MeRSZ1Hcaht/+0To3sc03eXJcfo28ccMPXRtYJBGrO4lXEtRFwEnt0kEMoYMGJjP7fzuvfn8/v0FTm6M6KMfOPeJT337E//Jh957+SQAdF3JB1Bw2OBXekbXm1PQBzg7jLwdhubu/lflsD5k8zyPUj2IAN6/n2C1HYD31R1dRl7whlAfuew+xw4EEFXiWsh4SVAjgODN8MZKJ9TIuYQMGEq+EQsnR+FDiZSJBdId8HcVzZTaR6/vO9ZMyn0dWZdyQNi2eMXcpkq/8UFrXQP9FRwrcESam0cl//PknAkDA8I0kBml9EC5cBCEj9iJ6ppCK61fiYcCFL18DDDbYgB43MCKZlwxtyDfKWc7pAHgiIGQ8UzVqEd60r3ipbq94mn9zVbqTin+2x8rcv7YU6wgJamwXVjM0SXChW1xb3u2c397sdW29mxjgHFjaoZlSzogTVQJpXATJ3Yezpcu9RjdTxotkdpQI3v/47qWqgNBD/E8ReiB9L3458bSQUAiBITzhoiqmirumLan7fzadUPnLjTjF55dnyza83/qyjfu/eJrr9//J1eu3YUxDVm7OLI0UHDUEDzvzGyZYSFJANjHw5JmuqymjExRPacp069zPp0Y7FUzjqK0N7wFeVt3xoFx+DTWLONRlBGUTKsyGMTAQx9yFng1ScAQgUlniCnTuCCiRAAcBTC6YGzMpMCEr4UIRH2eh+ucq85TpjHcOB5d7qvanzqej7fkCw1C1CuX/K0wvGOOXBJXhyh9ryP9lvpqB5UsHJzKlvj+05ET40DBYwetFfd2ynuFsVcz9eFhiCoe1hBRlTzqtOf2BU/n3XRre3F3OutQGcJkZOqqMsZasnYggm74dx5YfAMecB0aYi6pvh9orDdydm18G1tWFVVVQ/WiQ3fnXrtz9868q8F44an1te/9yBN/47u/7eL3XDy3UjG3OLrZIAqOHoIc6GeJzwC4i7OTsftaro/vKceGBsO9Jdfz8nZx8PzcPnhJCPuJhWKLLFyQox5YOgoODQhgWO+wUU5w5RWisO2eY04ncTHqSiLindKfEARYCkxVjvdVIdaHvWeEVfOsh8iPc/OrfA+dPTXYFRQTUyXWSNW8ii0Kwzuu8LROOo+FZGcnUbQZADkqY3+AOPpnKfyjqSqlYo5uPBk3XsRxHspFTN7jpzK4I6PYmDuODDHZN/pbFDwsUORreu+335zv99t70Y8QPfiip3Eq/Ym3KXhp3btAYTkvRmwf38XOoodJe6vSI8EJrZRVzfP9DDDOc6TzxnJzgB/qkKAG0GJnZu/fuDO/cufe4t1nNkfVyriqdha2ms67hSUmdhnEEptPWDjVsySXO4Q4KOQyx/VnpIsi1PMMvMb95pwL/oGtULTPyLqqo96Y80vUkEE5inuiDVNn2d69N581FSanTzTmO9537nlj7X+1NZv9hf/+Z778C0REddVQ25VIgIJDAmawtVbmCsk2WfjKAH7y2CRC1Wfx8HKBuNS9Ay16CeAlXrErUJQFkvP+CIV/k9tLxJJwdZjn0gMr3hCuRt8UoepgifLPUTcoKMhRIgAONYJA0S3Xdffnd19+XX69KNmpJJsyJmVt1PpQdt/DNsnUV3HgO9dZj4IAVnDsIGSQPX4xkAUqE/vAAfBAFKXvZ2kHPEDwhX4fDxAAZYyh3XhTFPf2zb+WNVzy+Jd5qQ40zrLQfs4tFUfTSWDIRwDMusW1W/Mv3Lgz32k7i8mYTFOTYRdAnGe7cUG1vamarltvCgZ5RzT57wbnDBjqkkAGZAybnelidvX69P7duy2f3Zzg2188//wPfvzpn/jUR55+++kTE3S2BVF1NImh4AjBKcfM1HGeCVO10IhmsYETtLssGm2peYthDtGfxrt756k3/nKpuXfGshd4aHFU+XjBg6MugV2HGUqrYGbZO0RJutPoZw8ujCS1dNojc3Yiqy8t/opg22SpHZ16M2TffxpfAEBqZSs/VroHgWK0QHZtUiKF4nWSUy0mY88NFgXHB2J4IiPPXqtiovxTsJCLLzQW4RbySqnS07XXBvKglWQUv/lPqDPuI/QtWS6N9xVNanFUBlv9qeBRwj8dQnDZhB3iDE4ytJPwIfaeId+FDhFnQHIDsGd4FMZhn9EfgVdq+gmxB8L/EoacOoNJG50oHog5KkgxWBYC1/+Ra0mqssrRQGd32FBNW9vt9qvf2P6Fr1/b+cFL58Zrq2NDkxHVBkxW583xWcWB+DjIP1857H4s78HPtn9ET3/qzmPVRpiTNlS6wShGwqlrQ2oefVOquxDpEQrrRJrRbkEipq6z3XTG81t357OVST05sTbG93zoyY/YFv9lbfC//tlf/fpnAYuqaqgrkQAFjzUIzIbZGmfOdFVYSaKtSNZlIEzAmFsjFnGRnYEyR4NcKlM7yKExr2+IBPCNRYKO0Vdyi9Ibp8dD96zqGCvZF0Cyq1+qwEAKxzC7Y8y+ZAiDqRPuUNer1LbbZf4WwByh9bwAb4a6m9s+97tpJCUsLYfqHnbtK5QtGL6TwfaFoAuAQGy5d5+RBt8/yIR584ymnP3N3xc8cjCsU9y5p2z1m+5yEsA+OBpYsctB7rZL/4M9K+NAbv6VQ7EO69JRjwyIgK+9dqt9+bX7v/PK69uf3553djSpMG6McXH/viHH8FrNWpKfMxj63sTfTHVL8lkZGw/cnbcCEBGZylQgYGu7nb12bWd6b6vDU+fXqu/91kvf+QMfe+o//dYXzz91YmMMa1sQjYplveAxRZgUlgNHy1pknym+aGge7c2ph2b8UD+8VxOkPFeVIdz3yOm38YfMsHxRcJxRFy5+mBE8DB2gBBCf6k/2qQo7kNzjMReAR8gMGBlPEG5V5mJAPA6+/jTEqyDXpmzKGUel5+BKCg6uzBGifSiA3mObfd3oJQt3S3Kvzvxpu95vVHBMIH5U7S+NVO22AFIwSJEQf4z0TagykqN8Vkl1mPuRAFqyUHNGzdVc7xIrPnk3slQAABEZIirbtB4LuGfCzJ0UHYFhl2HF1ZoAEVOyMVzt6ZeQ8UA7PYlUZ5tLPMgkkQSBkIMj3/NWb5CAGifwdO2Elsj+cIs+2oUZPoqBCew8ZQSKHjFGzAFwtCQGcmo+Xr6y9cpXrmz92zvTs991uamrUdNRBaLOwoLZpfsP2rL/tWUNVJ75ED8UH0nIZZMbHYlZXSMdklpzhVNknkWdv0F1qdsqHyLSxpSM7S8hwKAybAgWnbX27v35tK6pGjcrzaXzq9X3f8eTP0QV1z/1c9Vf//nf/MYXgRZ1PaK2nZcFtuAxhAVgoTerumgdyVXlOFyUTwFVIshdoWRQOUTqfZhdHFkAg5O5lcgey5L5JUKEUv7ZoBc15teOmM8ojgwvzgQbrhd3yIXHkvTdtjtlzhYAAOqUwgsOH/ouzv6BZUJbX5BIBYih63TJQC1+7AJCFt4UkyJFoXhg2CBA7WuU0HexdBaAYcH9mJBoDPOCt8+ctielaL2eMJw3oEfMyf0cHARTqrQ+TvB+34yqcvqKXIg4OIQHkfPRJU32RVf76AvegKuNAL3m+b6wfAYdLbTtnIkaYl4s/twPve/fbe10M1A1qeqKjCFDln1+HQpZw5jSn849IgJISiZGcyOA3Zfgh4RU+d8FA4+SQMTskgSbylQWtlt0XXfr7nSbYVfPnZk0z13eGP2Rb7/8A9OZvbN1f/G3vvi1W6/d2VqATENcSgQWPHZgANb0CH5fc3E3hqubifeLoxFgoG/tEss5a//TwNj9BQbIeqKBd6GZ2z/UHGU+XvBgMEx5MEzB4YH4v7lyTkx/1Bc/93WdObiFKDqPophHUZ6NRkL/R66jsM+UxfqY1UNy+1VD1tGsPqlPjh23WQf3VGJ/8sw01G6XPauyvzZ0wWE8YuUl8Q0IVEGOFRwzeM8XseGgsPlTBHI5gThSnrLyyz46hOZCoTqKxtGnmxZxvgRZnxCydJOk4EXqiQvbq71r2Gcl9u5kinOVYKLMUGj50YON85CLTOUWTyLNOFnzPoqVSSjQXagIEChDGLfn4aq0m3iYoP56soEnMsj+cPI809GgpH6W/aFqAUAcnzwtQ1gp+bv03u74OspGVUJdrdC1m9tfvX1nfmc+Z5Ah1CNTm4oqZmILuPogJKFroToCgGAXYhf1QWGdDL+frK9qvVW+SYhhIVYA0Y48liiN4PPT63OIOglLoPTsT1KkgnBl+C4gYr9RWBIeEsgYmEXXdTfvzrev3povZh3hmSdPND/w8cs/8qN/9Nm/94EXzrwTMAC337zHVFCwL3gzrESEhrU+8L4gACgeFxqGCgGJMp3xPb8IqPWefb+B3/ZMxCTyc/Tgu4Mc7803lK370egsXaQ8JAoeQRcgoqR3xxBCEsAiRxRE1EdxOT9eYJM8w1Ra2wNaKZEjYoFcbiqNZ+TdHkzFSS2RXYUEJpR4UhNhV91f/nXkDqnXUt4VJnfcYZm7vZWVhxn+lLkFdx11935C/kKG5Yd5iwVvHIQqP9CHe2QmEQL3Qxqp9yZ82hcFZJ6fpa30VoP+ecsiCyPnzEcYhM52uLc1v3339uzqdGv+dFMzxhNq5h26RcstsduKY3S4brYILX1OzoL4aH/E5cs5vBISFCUyoNpQ3XXczRbd4sbt2X1LZu3CmXHz9qdPTEaGf7hrMb2/w3/zC1+7edXtKGzAXLYDFDwOSGVAZcnksI+G0xlBLq3eweg3z/K57G7EseWrjvS2toY+cqOD/6vDCrR43utEfyWOXrhHzXsKHluUHACHHmTB6Ji979v7DZhVIlMgeIOc9TCYHMMW6OiEEs+QNHcWyuD1d5cgrWzMSS3p8Caq/IHdhkPsLKeUXEXBww+IlwpJ7WIAaQimd2Q4Z4l/w9Rld1NwTKCqqIMBG7fCedt5EAZ8llwf1uvISMzsHPogAmB7Ttgwkp4LwTIvcwj5Iq8/xVrE0trRM5FEvvgqZNa1LrT8aEEAyLq8DOIEFhdqYD1qb6aHsuAEbhcORDoTTu0uT706qjN1OKcuFWNC8aIwlEpaqJtFfs2S2oCZfXyAJJEOHqSjCgLQ4f792fTq1a3P3bq1875zZ0aj1UlVz+a2ns95YZk7Y8j4NAlhbWJGyMgdEgPIn+Q4EJ70kNEgsRSlzz+sc7LmkqIZxDVb9xFN7Ig0yEhymHAIOUBcZENgAFAZY2oD07bc3b4z3amI6dLZSf3spZOjH/xE9aOjplr9//xb8xP/5jdf+z3GAk1d06JtC6MqeAzAAKFOykMBIHLbXdz6D5/bw4VREUmRD9aTTunUaf4f10KYtpekKVuro1kNkoOFdN9Q7J5i30GiyOVqJ7VIoRAt4sOH+zpxPEQTOsZBYQtAmZ4FEfWjvoGCN45kSoe6IVEp2e2aBzYA7eFwCrbI/LwXTpVMJPp8LzPrbpD+lRHgTczOXnDYQAxLwB4J9HKC2cXpGc32S6iMgoHsAHfZP8TKrxDKkBc8HkiMS+qdPMc3mq9xD6Z6gF446yo1oeqxMgwO3TdlHSVQBXDH2NqetV977d7/79WrW9994uSpi2urjZnOuL5/fw62kL1DvqyWXJz+MKlJZrjNgbBvlqKUluRGlGVf5xRM6MLlRXVLcxzQGNCoprrt0C1m3fzmzSmT5dXzpyfN254+Ma5r+lMdW7u10/2NX/v917/mDGEjKpEABY8WkYYTcTjP2Oma+lnjGqRTW0M6CfMpjrUHewwbA3bdzhfXll532giQzazevbL6RkTBn1BQMIRiADgCEPd3KN5E0RwphwEEGUGyEmsNPVocSX2mEAzqPV7RKZW6m9RxhrBZ9ico51IhF0CUWILHQvPnvhDTE7CYwTZ02ZfOjrLgWtCHrLEVURXjS+Kef2/qR7RE+aMhYaAnQB8bo2Rqim8RaDyuzr6f8JHcwu+jbCIY4nqQWcqumgCJfMLW58EAwoQsUXyPGp46mCwzsWUGkQ3pVoiNVJomZ7cBkNJP5tGPvCnnffKXvas3Zo+OfDsppaoGCYn+ddbVMAZg2ScmjEIlA5IzmoLMKN9XnGfU6+nowLZTJlPRna3Z/POv3Pm1z7269emnnjl5/tLZlWp9ivq2WVRtZ9u4lLIE/qRZbJfVGsu8eLEqiBzh5JkGP6MPSvaZJiDWculU23jStLpIjsgW5ZyF+KgQr+3Hmwz0RgZERMawqdlw23F36+58SmBcPLfSPHVpvfmjH3/mh5tmtPZ93/GWv2LM5MvWzlBVI+q6YgQoeFQIK31LMEQwITeGC4v1fM6QpANwHFTk3DgrfHcp/81nXm/onpwbJYgwEGRea16ejhPYRBIy5BkOKeai5G3JRSJfy206ECtAkYcLUhQDwBEA7Tqxc+ayV1/6miWX7acrLRjpizgbgVSzXNDdq3ultFlYLU4VHHMYgjFe+RZlOirskQbjer3LQp5bnQahhYH9LLKkVL5wZy4uURK4ifRS8BhA1HR08QjrrdM4uJqc8+a96cfR7O70tSxmRDalMCSlav9efCnDzHHGQCgDeDRhiHDz7g6/7dkzL3/2lXv/6kPb3SeeGTWrq+PWNIaM7XzlRbjcDiSZF/EA601qCdgdg+voAwjxAzzM2/ShaHtQ7zGGjKnIdB3b2bybX7/d2dbyyrkzk9Fbnz45mozHP8CmMVs7+J//8m+/9DpRRb6yQlmKCx4BZD2N/8Xj/iXOMgDBRd834Q326zvf9bRu2A/jX45BaX3oQlH/eVkTMR4GQ6Atyn9BjlIG8FDDi2eESup8+nzFLvupz0vKkt5c7XL2GxkR1v8BeTCxb8YL9Ud1PLVqyiYlIoIKaUbi4lcsVwQRGdN9s+jV0mOHW/Tqv/UuN8nwjpADoDC84wdHLIZQGUNV2PsPQBUAQLJkyt65EAabEvmgk48pnR++ZTAmKGdBKud7j7HP1UshjzCr7eJOaDEU/HIFjwkIqMKWUo4pAJhArCxN4kgSUovKlkDFKQnv1Gc0efaIIPUVx/NLpUElBGcBAipADD5Zq+e9FDJjuNXiCOcAALquZSJDzPb+H/vUCz9/8/b0HtiuNrVBZSSyg+FF6rD1128nVoaSPWyEAGIdnuwE9/mJo6HUQKSeGGKtBvSWO0d7cg0gfAXB58kxGlDasR5X1mIX2WQqNhVT1XXo7m61M2MWNKmb5qnza9X3f8eT37cyqv67H/7et/915u433S9WE3PJCVDw6MAwPvmes6NHm77n3J7EZeZq0SAkdvFX6PkkFXwgdkCOvZNIsIkcwUp2QP4mA8n/kFkYI7tizqDARcJJV4g07FRiwDLgs7qYTKIvKCgRAEcDmfcxeKV2n+w6bkDkAQhPeaO3k/S/zNOFzNO6f1Op57dBTCl2rIIEZAyIDLQBQHStzNWVqF+5sqWm1R4DZhcsuSYQavTHesEixr9IacC8v4JHiKi0ab5G+XM/0ONKFf/dW8WGueNYq52k2uXYfRwxc7m/vbXhmICoog+999KrN25uvz7dmV9oDDAeV82ss11ruSMiIkMmqsgH6PuBjviDvTBkJFnL070I+xk79zLq/hWhBZuWU2Ca2lTWklks7OLmrVmHDqvnT49Hzz2xWm9+/NJ3jkb4hz/wybf/BWb+TFXVxQhQ8AigVWdVAjVxK8W2iUV0H1Go/TwB+zfT7z5LBxojv4AHGvSu8+404rgDtyj/BX2UKgCHGgwiNkSoYg4AYXRRwYgOopwBxKcft5uKm4MSr1WsdzwkhcYxmWK9YrnHKE9QFCY45W/aNBCOZ7yYE29GzgrDf0RJqa5C4ccLfvGXkjuMEFLPBMCAxOvl01uwkqYD+UXypqRrztZR8d4KrQbLvHYlQM4BPg23GOi8/k/KjcuIG6/ZxJCagkcLz01dDefofpEcKew5ZqIW6qiOqJv3xLDMdhApIfU6RT6Y0mSMRVmutrMPBQ2xA5RGsJBMFIiAG3m1VwGP9BYABwOgw9170+nrV+9/7sat6bsvnBxX62vVaNZZO9+xUyKg9qstmMMu3vhv//nKFA6FxkJ2f1JUEY4gdxWmFXfiY4prpX7uvk3I5aOJS3IIaGdBHMvzJ1nJof2MwahPgCGQIaKu4+72vdkOYHHBYHRuc0Tf9eEnPjwe1T/55//ke//mk+c3f/qVb9xhooqYu/CznD1xlq7fuV60kYI3Eewt/rE6FHxFE8+22YgAIB703I+WGQVkfugh4nF1ANn7viicHs5WeNKytU8klER5DVzoeXUIYYgxShIlxnUxABTkKBEARwDBrinKv44RzNoBSlDxsYtBiKEej3og9Tmk9Y9H5L7Q47L+3NC+1dgqP5nbX0OxN2ifXMFxhFibiBhkdUYctxAikB0nK2Jc5HP6OZgKnggI3mK1nCS14SC9l2KxfxwhNMSk+VIm7HH/GgyxxcB5937OPfmy10vvTnrYfZSU3jixdR0POiRTg63F9s6s/fLX7v70S1/b+vj6av3E2kZjthfc3Nue77BX+olAIU8nDjhbc8N2+nGgbfaElVWpn9xr+C544J30zOFd/6Kod3hFwlNF3VBtLXix6BY3btv7i7ntzp6aTC6emdAf+eil96yuNP8QMH/pF/+d+Zkvv3p9QdQQMALzfb5+5zqf2TxDN+7eOB6EVfDIkJrGokLckymHDP7hRD5DM+Na1gX1jgwMsy/wHnxlSFoJl6mqAwAIx8CAW3BQ1MuUxYLDhsz66Myc4vrUmj6ieKez+mslXQummUSbWx/1Hn5G9FplKk0UdrzaJeMM8ddelIEXUWQsTo4ipFPzx+zS36jg2IBjisgwH4JXyzv8/Z7naDFHcK/JhImkqHR5cnSsl98eE1WuPNbEyYmvX+7Vz4rgshAPrUrcU2TlRw1vRupiAId3xpNW4ZUHlb1xUj1CHRAQvbThJNSBKGBS8ifeD2XXOTqG3kCSC6m9UHFfqcJHNkAU3GBJDXybFk096tswjhBsN+XKVPTKN+4uPvHBp/7N05c2f/bSpdUfffbJtWZtauvqxoxayx27FcYTgJ/UgHONS2eyxEJ+Yg8K/4R2YfEaOucPOcceZ89zF8U/KO860iNen+gGlF9KCLXIg+VJNSL/VQ1gDExnrb27PZ+CiKpRNdlYH+Ej7z377Kgx/+SJc5N//LEPXP4nzIsrRHUoE1iU/4I3D0FurBMFOs4zAsVZmdTH1LycdV+I0yCLyErHjIhRs/FI77KhHnz0rctp5a/QN+UlFGaR29lbpWMvWsROmQ+jrteobe+X+VeAulDBYQb5slToXAIqC63+DloPE/lPbKFRiJQSaZyFNsfzuiP9dpk1VNtDtYSrpUtmGvCS5gdo6Rnfe0h+yN1Ag4JjBB3S3JeTmcVAJWYvsQr0zfhK+BVhXSleYasMYvswKKWzYi/VSc1CeZUKAI8NojEpFGnoKU5QDzyahnbzCO01JoV/eyMln6Ji3yNg9VER5B57Xan3aamp60jBmBqGDJ0/vfbKp79w45996MVzf+z5pzfOrK3UNG7Q8IKZ2bLlqFpLuc+UDzg4Wb1n2VEntVLvvZO9cDgR6iM764/G6l8oJaVvPUrYofqQ6jbBLJX0Hz8xEwF1Y2pjmduOuzvb7c7itfvdyc12cu7cuPrYB84+cebk6K9vrNZPfu9Hnv3PL5yefPUbN7aYaESVGaPt7hXxs+BNhET+xV37RJxsXk0Mt+Q36SixoSd18hCPfTAyHrqqt4ZQPstToSLhCb0+2eUTctLNIsoxR5uHF+wftY4mKzhsIABkg2jKQCx4qvOdRwUm8pYBT4P6IMs/9xqk3gBhiuwjCFQms3il2kPl2gcP5/KvBag6qcMtCfD12xlWigLmm7QLjhWCmhLg6EiM/t5G5DxcQZImRdVqcVdbVtI9talaH671wrTz3esw3aii+U/M2TySkWPvDDDbYMQ44orXoQGhkjJ5AAJzUtlNxLzkj0eJLc0S3xckvR7p9wqQ2KkQh5LmrA5kVJvxcg60R+oOtBKopUFPmW7tCOz0OHHTRTtjIkPXb2/jy1+/89mrN7a/YVs+szKqsDapmo7ZdszMFqgp7pgHwq+cuuJoiSEeCBbHVHjPE4wNKOMUz8o1IYIvNMgilJxLMS7CaVgKUrVI7ltRbG/7nrsvY9z2Ows2i467ezvt1DJzU/HqqVNj88Izm6umfurHLpwbv+vyb47/r+957vS/BfhOZ7dRmzG1dnacyKvgmwbJ/2PZLaMI1i6XKJ9DSg746Cc5EGeRD8H3+316xr1EW6cYoUpJg9g+t8Vx2qwXi80yVYcWgXR7QKgNQCL6CJfg1LEBoMTIFghKDoAjBcpeQC4oRI6hrYtDniG5OhNHArfykkRvp2gUhjR0GBTFZhhsPCACJZdQUP7hDbZDOYwLjiU8/REMyNf+AUVXF4uFn/u6j7SlZGa405r8g0qe7gLvqfOczLZwK8PJOKP6rz0WaZuCR4kkzwgRiPzeKo5KoFfjtZgmztLeI+yZQHtccB/PXKwGIu4F2txnZRQlrPY9zykW7ZyJjkNlyhqdXeDGre2t117f+tzNW7N3nT8xpvW1ZjSzbLem3QwEqiqqjH6yegGMR9HnDKlBaCkoezu4W7NvkEyuDYqL3GK81dhEeUiRc754jR49ErijdWNgamKyLbfTWTt/7fWuu7e1mJw5vzJ++7Obkwtnxt9x4eT40onV8U/AvPYv/uCla3eJDBGNibkYAQoeJrQUyEilw3DY8WXy0a6k8vYyguec1Wofu6fQdT6qBudzMd5Relz14+a5n4thag/Mb4goQQhJg6PNIh2SwcTUxgvLdCtwqPvKV8HhBaMvEOzRXJDp99lh5YVIowK0aJAmL86YLsnVThnTRJfzwQFD6K7HIZnUKZeRDvBbFBwReOpktuF9kNFT5d6VrFCEjUC6IaQ3th0cJjNRIf1EIIr5B+MkoiT7Zn6V7z435BU8LghPRit4TgZjJzcGbifGJo65doSwOFwH9VGbgoZHRno2yXqqz2cm0UDdfoQ8LD10xdnRvL+jj8pU6OwCd+/Pt778yt1/9dKrW59cndRnJmuNGS9sc3e7mzKzRUUVkqQK+mHKO4o/u5TaWWIkz3/iZeveUKs08o695qKMnAOdpHcrrKk/aM8UoK0HFvBZhsgQyBhU3LGdznjWdouO6orOVGZ0bnOMb33f+ec210b/+dkzkxe/+9ue/K+Z7aedt7Ih5sXxIbCCNxmBQ7eiDTuFnkPyTgY5P3ggaKHuhAz95V5EEMVcppSa9Vrk7dvpBvg2kKRfW2o79J84eR/zcwwXCZIbU+YLlRCgbXfKXCsAANQlBeDhRFOvesmCjUv5FL2HLuZZag8lKk9vT79vEyXPQdUcS44JK1JBihTPxEsolktDZJZLSU/4V5rtLzPgamOEfEkCDFQZwOMluBYooZat26wLhMUSIb8egWNJSnbp2Ab8cUrQpehahSZEvYQnyX60dqiNC9FW5aebF9idXqiMDgQQmSglFDp+LMDohHc5UiA4H1MI+YeB8KbIfwbMparPTCFMXFH5cQSlLuR90r0pWVNKX+mLh0RRuR8GQg5KP1ec0Jze7ZFH2+0wUU3fuHbffu9Hn/ml3/38zV+6cHbyA0+eX21WJ7YizGE72zEzJMaIgVgWAPGYJNvt/YZqrc11dM60cM6fVjitjnM2Qr6+qmvkjkK/nqfl7VNWx2mfQoPsI6yJmciSMTAgFxdhmfjW7dn2bN52Z06PJ5ubY/rQi+fPXjgz/l+c2Bg984kPP/2XmPlrVVWXSICCNwHUicHVGwAIYLAEyJPjetFaq81pFDmv16Oz6qs9WSDs1ltCxct4aOTJYoRLDLxBugeiWMEJT1GRiMwxFZbMcALBiF36OHHygr1QkkwddhAbECrRgXtMCSk3Ce6peD1yfyNhD6EvP0H5B82cOAwTI5Xi3Q37OeQutNiaD8pIrtdMPRgACo4r2HILy05Z03LuUqpWjRIbV9+INJTtaz+mprSNNpwh2LBASCL6yoL9uMA/PbEayWEKfyk8Q4jACb8bU+230hsyg1SpNEDhz4N8MuWXyRYBRkKr2e0M0KcfrPdFYod6HSBIGanjoaORcUvIF16+/fLvfObaP37t+vadpqmwvtKYUUWV8fo+x6ohSCax4jZah9YW8GWrH/L26kO6TucD9I/3KIeU6Tw3WCbeIE6MPyH36dAtElRlQgKIyFTGUEWm62y3tTXfuXFjunPnzpwNCM9f3hx973dc/v4f+8G3/N9/5Pte+OhTF9ZGwAJEhup6pTC8gjeIZTNLi8KyUd6AxJLqzbhGZkKqh/dG6E22nNlGG66SqzntRNoMCBBSblbswYR0mipWksIlPBK7hvwXFq+qXitzrAAAUB+T9fzIYdFuM1GdTWQlGrDavuRt/nlLEACDuF2UgdwPGnvQ63voIW3Fmu1ScnU0RUZDZF+KTseMuv3AD6C/bea8IKIqbVFwfBBWR5aFNdG79NZon/ufARYpIIb3pbSb74OlIDOwtFJ6HAeSD2Sv0XMl6PtRVMuw4GxCFjxyiK4d2Rd7kcuX0vPUYgBwkuw0sx4soQN5/kvTw1FKNIM5JQL7TaxfkVAHLvGKnHw/NX8IAC12+UmOHGw3Y6Ka6ornn3vp5m+/emXry7N3nDk7HhmsrZixZXLObwsyBnAxbiSb0cLP7JToGAKkKn6GxtEImPIYQX9Fji2o98bTyrI1uoeUOeXRCCn1UvxekRZjSVUQrGyoJlBFoKohsgy+v9POZq9vdzs77eT0qaZ57vJGc/bE+JMXz6z8P1dG5j/8uV+78rNXb21za0sBn4I3irDYV24dpbCMc3CK+2BR2aDnvQTOIyqb/7O5pqOpMhbqppvSzJM3w3Mv7AwMLFoytnqRfMiwp1eFcI9qjCDoKDmbZCxvRNwj10vB8YEpAuZhB8WixEOCnWJG2jCZYzfxYChNxODxnCOKyTI5kDZPxg1Z/PNOhi/IAyuT4Xo3VHAcQADOnzhBPobZJEXY9TvmKIgTiMUQIDQYNnOnRivdCcmUS84NGJyUXc5fm8xKUbhkb6Iokstna8E3HwPKuno0cRMWDV6TPH5W1VISAW6YQytD0hJ7JiWv0EtOdwNXDDcY6AtAU49pyQ0cURi0ncU3rt+/+fKVe79x7eZOy8TY2GxGK6vVmMHcdT7KKIjnGJiyWTpHZeiLLbTxPKOcLGxPPIPJJuKEKHkp64j8jOKnXilT1Y3qSvO5uFSrSBe4lADW61lEIFORMRVVHTPvTBfTG7em96/fmM3nU4uzpyb49vdfeO5Pf99b/ss/+31v/Yvf+p6L562dM1FDRKPjRGgFDx0UDG6O3xqADZyKLyt6NOOynxM6SSbCu2wi9Vh15Px6YkeRQHkdhqZmZLfJfB6Omg1dpiuN5g8shg4CjEE/cWuRKQoc6kIMhxxuZe6SDaHw+504T7fHSRuvvWgfZirIQHsC5DhnTgixrqaWSA5X++uGWFBiMeX8rOKHuk8tuMppqcydHU+uKjguuHrnDv/wp96hdtW7JTesi8uUGCcwWCKWndAQ+g4lgXw7GiC3SK0DGiIi3apwmziuhbUWVnuWnfplk6sLHhU8L8u2TC1jL8l20F7ZPpEQc8FSC6P6uKcczS4R81f2jU/ivo/HKK/nR8PzQFr5rQshgqFfnO7ow1Q1bLfA1s6i/eLLt//VZ1669QOrq9Vz65uNadmOp7N2sZjzojYwXGlyiKtfDgp2c4paNS35dfWSrtfl2Ci4CQdsDml/geTCip6mPemtwb6MmtxbTmrQfMp/d/LZTVkVSPMX1zUqa2CstfbO3XaH7RSnTjTNiRMj+viHnnju0tn1v3Pp3MZHvv8jb/s/MS++UlVjMqYhYxq07XZZxAseDMpy5YoCWfiFPpRr0RtedeDskIEu8n1dIlPzd/Qujgp/xhGCiCERQqx4QrY8UDpFtcEuichlwG1Mkk2E+Waw/m0UHF+UMoCHGt4Mb9HBUtCpXXmqkOzEr8/KCxGOAH3JIR/Bsb2eWq31fSlFNXyHfsjdBMgBK2vvfH5dMAMEMSkyaUraFBwnCC1EwbUfWEL+X6HunPYSTWtghH6BNq0Q7krNWcSVotQwqFj9DZExhkqelscITr5y1ZciETD6xtb+dT2u1LMT7YdvBc6tWu6jaOSAjLrsPkN3fvXwM6o5bsbUrt1mUzV0/c42f/Cd5z596fzqP710ceVvvfeF06vEbG7fmlZztnNr2cIMVfag7L1o0TLV899zSThmzjHUszz4CsfqzS5XLyXFoVHDqktLGsAYMsYQuhZYtLa9dWd2f7ZoxwxeOXVqQu9568n1pql+ZHOzufzn//i7/847n9381S+8fPveopuCaETM8+NFfAVvEF61JyaXj4U8P2MK0X85A5Y/+TQ+6LBA2kFvxe+bA7RxYTdeniwVAzPCRz4S2OVBRmfJuRUiShWAAkEpA3io4VUNhg1RRjFuyAX5SfZP9opOiB0ihCpVQEhsxhljzDMFh5HD/iVlpxzwWoX7ZOUXzZINDdYeCt9PyUnhHlQZlJBoC8TMcGnfTTXcX8FRR7BL+ZpsUgorhMV5337Yr8sMF7gahPPgUmPVI2fZ1MMeW06t8XpVZu8UC6YqXS/e+e6CQ1Cyr5Ovx24YsoWhEPFjAq/8W8dmvPNVfEjsYqnC3tHoFnX7osmxyiFhTouD8q+jFDmT0iBJVIuywkpOCulDc3Ct1ctVsUgMk4zl5GKVzo1kXXDfZ9HOuR9OerRhuwUbU5G13ZXv+vDlf/HiO0//2Xc+f/J9a5Maq+O6mc94bhkMy0yGiAyIWXiLexIM6//KD6rWVGb1VoyW8Scm/Zz9Ih338+q1NF1Dc66RmsizP4lFSq/3riNdj9yxPc4GEMrySVWElWoNxQdVVRVXRCBr2e5MF/Or1zvs7CzGJ09OquefXp2cPPXEdz11cfS28yfrv18Z/PPf+9Ktm0ALYxqy1pUKPH/qHF29da0oMQW7gEFkV4hsKAEYZGMW3h1bhzjYcFw5AcL0S+eGdkGFtq4TL4lzmFJ6G6G2G+vL9BvHpJVyxlHmTfLKaBnede634zDYWnBrwZ21Uo2kyMQFGiUC4FAjm9BeVuCBFsLHNK/azwraZxeZgX+JAUkiqQ7GboYNAHtf5owcPrjrmPmpClJ4hzmRyZNDRqgQVddYn4vHlljZtWjbo1g1wUTc19fBBd5mUrYe20/iaNwqFS0eJ7iiZxmjGSaULNvkA2CpG2mXdkPg0ISk2DVFeTbraUlnxysJYAoDIqKnnzjxlS+/uvWbN27N3vvE6RVaX2vq2ZzH96fdrO24q4krXZd7+bYJZcTGLk+Wdz37wNh3j0F5yXklZ81oX6TqFBhCVcGAGLZju3W/nc6mdrHo7OqZM5Pm/Okxrbz33FNrk+pvb643T5852fzXf/jSrc9dvTVlIkPMlovyX7A/0MIto17pXyodapr2Umtind2L3NJFP/N+Be6f96LzAujzufwOfTzvhCApi/LjbteXtWBrbb+3ggLAgIfEgILDgahiJMU+nC8KwnrUbiUwCJalDnq0SqoexVeBkCBI+KZKEe28Q+r6ActCPEXJnUSxiJPzoQtxeoTGpPoTNs6DzNBZT7lL76DguECoyHnPYSLlB4s+iwfN+TzFbxtOA8QusCWUEEDwHgRK1fV5ZO7JYT8t5bJED5CJQ74qcZA1IlWHLYsJCpt+tMiERzG2isuIJN87QpI/ydIsUSDhgQde7SkQyLhj3HhF6mwgKEaQMTl4hCgb131O7FkhzMT5iMS77xO3Z3w4ZKWM40tHxwzO82zw8pXbi8+/fPdf/sGXbr968+4cqysjs7k+GlcVVbbjjq1lvXhplSMuY+58YC3KShkqRoankJRiCJQRopnzahBAHC38cf/lycQilWm2FD5F2vTfR+410FpomdNncisxUCb5RdlZNo0xZCpqmeydu+3ON76xPb15fcaTpsYH3n3u7I/80ef+0v/0jz3/j77tfRe+VcotGpNXPiooGEJc72OGXfJJdt35jH8rFusNBjJ/ssmjZzfruSbsXWSFEPHlxxAZWvoR3iszyvPyMKuUEJyWBIyyL0dG7r82eybuvoyFNkTK3RcUOJQIgCOAwHh6J9yymWQIRV8B77OHvOiZxoC1dGhoOaPlkn1j/42jbbcwtoKI5d7/wdb+rxNMd20apObBGTfYq744ec9IJ+fwgIWwHysodT0kHtVqnhI8Mxo8EFfbZfTh1jknX45lFJcnXd3vPR0HGNMAAD7z0q3f+uXfef2fnzu18pff/ZZT6yeJqtv35tV8ZsEWll2uMTWrFU0QR8PN4CjZqtt7UNqa88a+z0PXopeSxzBdGgLBEJEhYy3b+cIu5otuMZujXXRYPXd2bN7yzIlmPK4+YZrR3//RH3jnf/SOZ0795pdeubvteHQF5vZ4E2XBLnDZ/tlB75biPvUvIyPOhNhlWC4HA0iiAnfDct7uz5I6wur4vnlzmS4FKUoVgEMNjntSGcykmITne05Kdfs2KWEg3vIY5NWMS6Ub7yP2EGk5V2j0R988OLF652UPpM7LqhrJfkmKfFm+IofCJwPlCQuODUQ/F7t6dKCJ7d8t1qFwtVxHfpeqzo6eGP7TbOjBYh8HDp6y2F7NqWQ+ufnpT1Eo/edvJOYsSGsCFDxKBE+RkXJR4qUNnlpPW0GNk+TO8KlSYnPXImSHyJ6x9wrlLLiXQJ5zAoQyKCnSyQcGglSa8FjxHfnQLjcGB49TU48o6eMYoeumXJmGOru48okPP/2PX3ju5B9569MnPrQ6qbE2qZvZzC4swNayJafaylbcsM5F3cP/9p46tDldQIiPkrXnMLMO5OaEWMaMB5qnz1y8iYn6Ejfw+485nXjOqvz6oYeYTULGozgfOLunOC4RqKpMxcw8X9j25s3p9qLrJqdPNfX5c+vm+z6x8tGnzm/+tz99ZvUnfvqXX/lvvvDyre3OtjCmJmuLEaAgR1i/2ygasjBiAD4/EMmGQQrzIKzZ4r1PvGdDmrza6CPGPZnXEp2bTqlMRkBIOqjncsKtY1SAr9zBYfbE9Fkc/vjVyflAfIQAg4uuV9BDiQA4AuCBd/6jFDvppdmLrCxXLA6iaPTb9o8czJuU2gt2sarudlsP2LLg6OBgPlQ5zk6poqVFLbD8xAHvjKQIQWbmKnr+4w0OdRl3jzJJcj34Q0oZzBv7vsPndL9qekG+tzwVHB+cQCXodYkvqnnAbo8M2G+feOLsxquff+nWT3/ru86++MzF9WZ9vWlmCx5vbbfTruOuNjDaMZebX5Y5BLUh6EHMfvtZ6fTTHfQd9gZk9e8gXcS/maazv3v32wEqqkCEruVuZ2cxnS26djrvVi6eXRmfPzXB5vvOXqwq838YTerTv/7plX/2pZdvvXLl2nbn7Cw1JEFgQcEgKHsb7bVIZ8UQGR2Qo/Ym1kFn5pLzIsZTdnywtd9A4PwJ+bcvKAAA1IVrHmYQnLeBjZT+S3c0A34vU9Brgv+TtLdA6TX+Wp/IVAyOQeqkwDI9l8v4ZvgojFUcnSpiOvpGxasmPaYCUJ55vZ9MhcKdRAsqAOIqXlco/FjCZeK2Qan2dc2lvnnqUfNlAWSzrHfFh2zroV1mOPPW9oz4pEHv2rjIU5h0YR7JXlmfdCNk6Nh7p0HBNwsxyYp/7nGPvvxLIEd0jOgSEkuBz52S88yQ3Z89Jfhy6pEdimdJlLHUV0wZn9Me1mhEFbpM6SnGwQRFT7ZURTeTx3GsAqBhuzkTEV25dtf+mU89/69+/7PX/vjauHrvxsbIbHY0ns7sYtZ2HVtYECqWtSk8v/js8pUM2efIPihkKI/eyEhA+qknqrpEH7DmT+xpiPz/kb9FUpP1OrmJhBTTrSKcRiqEu9PZJPzRfkiL56FyBaOqUFkQrGW7vdVOr/MM7dyOTqzV9IF3nz53+szkb73t6c3v/flfu/J//NXffe2XvnTlzpy5RWUm1NlpWewLEGiWUId1HxRKZHMMAKCQ4ySJnJIcHZ5+M/dZbmKV6IK0KwrHMxM/0iOMEPHlbzr/KiHjRhZFyMHoxnHe+ug0sIp5JICJWmEEo2qd5t1WmSsFKDWmjxpE4wkZn+Ipjuu4OpZoL3lH+xnsgGcGsKuevk8+VXT9AgCa8vZFDs7SFFrzYHbJrPuDqkCMPn3S8o4KGT/OiA+SROJTr/Ds8oxrOADp+CStQ1cM0obTMhOD7oOA98VEj63+DwAwxgVNfvHl21/55d+++g++emXr1nhkcPpkYyZj08AQMZPk0Et+TJ8bbOkPnD/tmEBUn9HmnQPA9/VGnt7wtW+M5jQYABlQ01BVV1TZlrvbd2b3r7y2vfWN6zttbYB3PLs5/u6PXProD33ymX/w/R9/6ke/5Z1nz5/cGMNyC6LR8SbOAgUC4JXeyEqTnLzhTSYDxOsPMtbBTx0MwVqcZQVaPvNSk3DkIUW+KBDUB0uWVfA4Itg3RakIfxHSPsPp+sH1KJbPuMUpSqmaIJTRsW+azO7BHdVWSnWRrl2KaEuN16iM0+F25Z7EC9G3wIpjwxtuE49CwXFEsP6TZEJ3UTEhp2+olOE8sqxJVPxbFOdIBCF6YaWV3oftbG/qg9/LL+44R6s674Z0LB4ADmkwmGgofXbBo4SvDhGfUnCvhK2mxCrgkpQfPZJMIJHoMQ0066/KfUbJ+ZQ/A36vafTchr0HqmEY0zcNCQxJMeZoqAppp11ACjFCGcDjTZBdt2BDhizb1z/8jks/9c63nv733vX8ie8/uTnC2lo12llw27bcdZYtGetycsuaxLIDWYnjwj4o/JMo6n3vYeAUkJU/XKT4FanKAcj6IM/bUj0i93Ii8LD8FqJHXwalUBhF+pf7dJ+jdxLJGXcsUq+TAggMMjAVgK6jbrawi5t3WlierpzabOpzJ0bmYx8+9+5LF5v/4smLk4/97K++9nd+7te/9gUiQ1XVUNeV7QDHG352MXWQoBdwWE8do/ZrvVP+GT7Qxi++7MMEnRSa82k951z7KPXmRn5GElzgm/s3+YGUwSf5h0g6SCMFxPMf8g945h4rz0AKA1jITKOwi63gmKPkADgKiPpD1LtFKAy5qvQyqy8EhoS6XmtZ/Dn5+HCwZLle7uvYrUrBcC8FxwW51u7j/cIEkUkSmnO0GkXlf7/I1vaBM0hJeB/Wqf34YQseBaJFJuQ7U0if2+5PcNDflFNGr/ch0ok8XMRTlvvbDQPnC6fcH8jULl0o8+2/9Gdf/H988B2nP/rOt508sb7RVNOOJnfuLLbb1naNQaV/070ZS8pN9r/GHeDeH7C/QT4X2CUnbZZiubgRT4s9wQCGYECgzpKdzuz86vWdxc79+eTsufHK5okRvfiO0yfXV5o/NxmNTn7/d7z1bz19ceOrr17dbolqMqZG15UtAccXBDBZYbQER1beraQ2wnjIVpkoPB90tGGOn4gBu8Hsq9UeQ+wBvUIUFAB1WfYPM3wVALgqAIDPARBMjWINDJtV4xosHEtW3Z6ZUhomf+J+qGAIcEJxsP4rb5JOUh09FvIvQ++RjKoZxfsnqNZIpJDoGfOG3FB4XTM4QqHv44ZAnxxTqSVGAPYGJEdWSdm/NGIl6ZXzFpnHTGhdHMAUPF7kxhu6UtO27P73B5j9ZOvFCxQ8EoTnbHx+dxCxrxohhlZWvCwyIonBki0DzhbLwQtPRDTgaFVVW7S5gBJPqvvjSTnYCCJ31B7c4D9y9xJbKgeUT14fqNEHOBBwvKsAaHSdy4VQmzF9x/su/Otf/d0bP726PvpTT11eG588Qc32dlsvFty6XBG9RQvh+chz1PvuEZulFXVSo7fmJ+EsaTNQjtR7KXkFOCW23nV5CWFoT6O/nRDawimdxtwVSK+JqTFCxzpjBSHKDmRAhtiAALbM2/N2ce0Wm3lnR6c2G/OWyxsrayvjP/Hk2fW3/eyvr/2n//o3rvzLr7x6p7N20fsFCo4LonDLUhwr5AHwnv009T5F+TVItEtNrlEEFjrWvrc4b/u7wKLsHHJrQVG9rPQq9DCsAWFqUSKyxMguiu38/VP4YgxiDtu923anMPECACUC4EiAGZ1kblJHw7tB631y5I0qyctY5UFwkOsf1n0XHHmIEpP705KPD75pZPncUpazfS63xVz1uENq+eFgD2ugHZMS3vImy4kq60TacqLop9cv4ZUDY5CiVmfgQFH4l4CqBmwtvvz1u1d/8Xev/r2nLq+//+nL6+84tdHg7q1ZM59izhxl+QOwgXykB76y1w0eTldJn2o6CJZW70k2wyztCt5mGowClSGqKqphwW3H9s699v7OtJvPpnbl/Klx8+wTa/Wp1dH7VtdGf7eZNKd+6Xde+xef/szX77qcAATmWSHiYwdljBIbbbCABv7moKygQ2x9P1NniOJzzhs+D3Z0QBLdF1vwXzyUEy7ToCBFnSqNBYcLidAnHkRn3FTZxLUfPvEiBKt9tNIHH8KSsL5+Jn6RQvvsbsgjlRBbKnzGw7nTU9U4dX8pGd/v8RavGsDcxQ4KeR8rRNqxbk922Mcse5mJyOUGYIqW8nTDPyXKWeImzTICh9QCgLiFIVdGmk69ckEpUNHaJAk7xbvsvASk/WcFjxLCJ9kGNiNSpVRgScNJEq6bkJDLDSCPOtJMxvb6WdO935ejJhVYnFyrUrJLpYL0LsQ7Fe8udiUlMHzG7HBrro2rApBEtR9b2HbGRA29cu02v+Xy2U+/+MLJn/ngO0697ckLq9XGatVMp9V4OreLrkNnXFlAihFvro+8rDhROtXTH1qXhtRrsPYkxotyLhRzl7AaW0c8+fYD3CbVk1KlStJFqAZAEsoUv6f4OCVaKhSdVJEwUPQWJ43/8UAwBKoIxrbU3bvXTomBruNmba3BRz5w9tnTZ8d///LFtY9/6iNv/Y+Z5y8TjYioJua2MNBjg6DxN+ETA55zg4AQcyX5MAIJK+08lXQj72QSn720yKRivbefEKv3RcaezNUwh/3U1qtIIueGm1QpaOTOSFnXyLs8VD0XZuqGzRQFxxklAuAogFAlwuNumnZ24YMM1u9TSaD7QG4qeGPt3JfNyxXqcwXHEVFQpfhfXFozC3qPqg9G0ge5I/mwhDDLIv34QlIxidloOW9R5iIeIiZdTq3XCw99zIO+w+3ECwZIJ09cdSDqIrm+0OQQKlODyBCzXfzp73rbP33nsyc/NarNu9fXauosT67emHc7025W1VTXFSoOKoEgW+EGyWlIFV9+ZunTWrqY7se/2Uegfv+PqFORTgf6o/xiaF1o2DEqzfxSbohoXJvaApgtbHv91mzr/k47Pn1qMjl/bsV8yztObaxNmn+vqevJD33qXT/x7KXNP/zK16+3zthWg7kkCDxWEJOSyIbsk0zG3QAPBcm8y4xolP1NhlROuLTVw7orVna+wscLUtTckyoKDhXcBifjdqMG07o3/flNqYhZ//uyBiVdyYqsSw+79VqEVVZt0+vTnnfTb5yXwN1SzFkgu/+Vf8v1lMm3ec8qByu8fbcaHrzgyIMYZ05v0Mc+eAl+8YPUyIjTA4j+zqQwthZqpcyu91qlVnzxfBHFWZVXDYj3lCpf2stG0pffEO7uj6S6gDITFDb9aCGcidKXe1ac8FPlUfJlAFjEMILSdDJ6CYqTEOFALirtOaLkOGfHUr8U58d0H8GsASKXOMsHUoWjg/dy3NF2O1zRiIgqeur85u9trq38tZX1+v/2sW85+/TpU2Nzb6trtnfs1FpYSyFTvvrJ9fMORxHyNCQqhFr9hH8BcYHumXhSLWT46SnvfRYJGEylnNkq5e5drKEMrYbycQ7a0iHfU7oM+QdcZ2JDYG9FSPY9h37j9yLjfxED6jqy23Oe415LxkwnJ9ZqevaJlfEPfOelH758ceW9v3Rh8nc/+PaL/71BfceiRVXV1HUlGuBoQxk9xRtOQekPk4wlUYs2xoZk2SLnRt4XL0zXes4mWUwvIAQc6V1MZELesXKVmr9+6Y+3oXrTBgMCQF62Z5HbiZmJYVzejPi9UaV8pKCgRAAcEfiJrSPocq40gEG74xLj/e5j570tbznYapkNYQkG/GkxZLXXWWF4xw03bt7jP/E971BHWL/jcEgq6mjNaD+ImvtDIy9WL+Dh9VvwcEEEQwYVhf1Nyx9U1K1cRkrJLp0Kj1jyod/P4IneNbkhYP/8Oe8l9kRAqR01iI7nTGZEr1zd4l/89Dd+7tnn1v6Hd7x983/51Pl1s3liPN6Z8WI2bxe2485UqMin4hoywCf6/iAevt6655D7aknBXsVJ24Pdh7aLasNCUKz8EQsmIlBdUWUMmc6Svb/TzeY77eLuCo3OnVuZPHtppT5zonnn6bXmP9tcqS+Mx9V/8/mv3bh66+5MojaKEeAYQO+WglOEyRlseXD9HpSJ9ztW9lmZrJI2e68Ye/ef8ncemHLkLGRkQoHwN4N/FBxu1EXQPOxgwJXLgaFoZRTtRlbThAXpzNAq8E6LjiF0NEvvr6sLhq7EK6C7Trxc1NvfqPuMArFkU3XSRFJvNeOcTnMTrg4yRGSM2//EkBwAxeJ57CAZpuFD/v2GbdYp16X0OQ9Qh9Ck9rMKDUMJqSxB4N6Npaq3M8fAa3GguuMIXYaO4/RyGQoY7K32iceiBGo9ahgnPRIbY6yPt/IP0guWsoc5C5vXSaJTESz3vsq/gfJSkU+xSYjnKjkTTL4Ur9HHKDpjY/vEJR1PstQsCD6pkEW6IAVbVxXgS69cbf/M97/9//WZ/z97/x1gSXLcB8IRWfVce29mZr33fhfrF5YgQQqEjpIonihLGR5IkBQlOtALpEhCwEcjiA4nUqeTue94Otk7OoAkSMEbwpAgFxAWWDuup30/U1UZ90dmZEZm1evu2Z3d6Z6umOnu96qysvK9ioyM+EVkxP+Y+/qJsZETE5NtzHMYPXt2Z6vfzweJUkohonayiOWUcSm652AXbBcS5HJPUrR8S6kgFnnpoXSb/1mOMJd5q5ov9x8Iwjdk1Qr2OAK4QViZKtNjQsSOfoR8TahSOHlILmWiHaPLpm6YlvgLM00IAUABIClUmoCyQudbXYJkbZAAYmN8tAl33TS9PDOR/sCxxfaDv/Ph1o/9p9/70ifMElCDAJc28bpvZ4CPrzOnLICL5Cq62KsQtEnqYlRdJy+9OuAjVJxwtdfyW6+B2+hD4WkQejTPQpT+B2/Mo4uckYGAXgzz6kMO5+D8BlzJxQIAgEDy89dUk6W0VisvBXJhPqxERGZ9aNTzUYBw3Q9ORIf2yyfSsxFfM8wXFYZOC02i0sMVE1qhjKAsCBLesdZbjxR5g0e5ZViUyBC6s8WlXASq7yNShssgAaCpK2guDcJ690sRb6NZybXT/41BqWrD/6CQYRiFkChT/s+pfcOekJOxYW7A4bK3tAt6aEt7moJWcpxVoz9f1S8AjWvFcQ9KIElTvP36mS/90SdO/drM5Mh33nXj3PjCbEf1d7JWnhU5t5TfplzqYNeqnw4NgH2tyPtM7rx/6VLVEksvq/lsH0NBD2FgfMK9kqgDONmcKkIiRI0KNRGtrg92ut2iMTNdtGemWuq266fHZiYaX9Nup5Nf/di1f29xduLJk2fXCTHBRDUgL3o1c19yZOaLBwAAZMZenkHyp8QElZODjfI9moGc41GNvqiVvD/JCwGsMsDGfawYI3qAL7opK8WoQEISNdUkqQYADjkZm5fs4shb/w167uweWZSa/Tl8PWGpQ7kM22Apj94DuF3T3msE3sMkkwdwWwDwAbBDgAAUmYNdF/ZGog9zPSu+/h8LZQt9NswFCoaL55ouaRK5JYJlvhSigu43UbBou0UzWJzd3ECxHpOPlHGa8PDF1gXDEDkXAde99gAGjyGMhq3pIhN6RJELjwilksSuascTnmW4C/SC1HmUuBeWg+gYhVMPMpO4ahNEYp++vUXsXpXsTuBQYp8dnk96n5bJbeAcaFyzAMIOa5JElBFiil9+buP0+z703M8tz3Zuv2Z55M2LMyMwNdFqdvtFNsjzIi+0Ns9cIYchE4UgEglgx6P6rMYLbx561Z4FhHYXWjaJ5VGQ/EEel+s4+oWb9+nHjz0oco4evKgwc3zlgcgMiVUP8Tmlq8IDafIz2Fbob6jQ7FPRBRW9Xt5fW0NAwvbMVEstz44mr33g2MOTE63/+/eOj/7MjVfN/gcA2Cx0HxLVwELXyQEvLSJAhNSsoQqQFJfIMt5/Ex4okFk27FmXBnAJO5x8ZP4W0TrA0lEK8lD2MgbhVgMKY7vYwy91DAdIcN4AZn3QricOZED088BjHaym+3/BoGqqCUwZwJouCYoEQHTK/RGK6K7PXkCigcig4I/HADBuSxALm2G3C4EBW+5INHbDpUAm+l7JBw9aEKBOAnjUyVtCdrHGSj4ucaWopmP+xO242/IkKpUDGnKL4D5uvOGtfAD2bp3UdFHIKpIhBxBDpXs+qSpnTXggPrFXT8PahbzpDmF1q8q1w99L729MR5eUasD6Zh8+9tnnVv7yG6599/Unxu568I6ly0cnUpwpWiPnVovudrfoqUQlaQoJMggE8vmgRQYZrZHkYUHyV8j1MWxaQS9KimAoLgNAS6KWL7b/8Fbud/CBIv0iAAjIBlsjQoKASaISIqJuNx8MBjrf3ina0xPNxvGF0WR+unnT/HTznSrBJir17z//P85sKEwQsYF1hYBLj9y+rJBhGcI3JPRm5zggwfQe0q045s6U723PyBLb5WmJgfyt6AAC74DcN0PDpDWj0gYDwGD21PK7Jk+pMJ1qOpTkkzNVPUr2g7oKqGAzokeovBMLgedSoJqmM3EmQgKcZiC7Id/E7h10x9HrNyRdr7at33zlLSURROBQUgDkCCnRDV9R5606cuTsc6UAlXIhdEjoMgKLddPZQyRg+9CpFvZrz/gubG4Aif7bPX3M6qyso0S6BNTvMXqRlZCIDP/qeKLVdFFIfP+E5Lye7hz/SE9QIMZM6IDQwRzHUXigVLLP3SaUbv41udOhikvCGWXPBN6p2L4koStzqAAbnaQaaRtrPhxORdElxBQREa9cHv/Y3NTIDzTb6bvvv2thYW6uqXrdfmN7K9shAKAETMoa5/1DKROMnGJPYOR+x2jNZsMlLDEQPWKWIpYNyjBVDGxCwC6mhZFQbjMV2n7QA19sccQ8ivKV+5yeU8MXTkabkSq7yFtDKNAKAoPM9I8KEAlRayqyXOeb24MeEFGzga2JsQTuunFmDhvqp5cXRh786kev/Nn5qc5nTq/tAKLCJEkhzwc1k18qZPVCDQAawpyAoo0R6fZ1GLxXUmrNJdKktra4D8xh3qaoMbsIpF5sf5HoP4gc87PHS3f+DORVZXuE69MoWUyDyOY8qNm6ppDqKgCXBKG0k/lINN1DzROlECqRMMilkW6FlcQRA/SyorMYb6Qhx8MPgEEDEof5vTP+wYtDRjoAdOFb1kLvaFLMpZJTg4R+u3KI51fP9xSdCe6zazVr0ScKJhfKrhwt1fx7gMg+C4pRRYPwIFGYCA3AJVi1povHTCNHDMUCbpjQLN2W21LUlPmIuRXFeUYlPPFsMMOiMGesY1RqGDW65sfdiCgnxBS/cnKn9zsfef4/zM537jl+2ejbrl4eTSbGm43trbzdzyjTuS4ggSRJrBntH6Y1/IW3UNq66GB8f0/mTQyPB+OSbyRwFW9dGnKlG4/ElCItoMJhb45bRABjB0WFMsBQAn8TMbdWSnI7n1yyNwRQCjFtYKKJkkJrvbGd9bJMF5NjaWturpncd+vs1NJs55unx1snOs3m9/7xn535ky89t9pHVHU0wKVCBDmHwgcrqWMg6X3nra4Arnx2VenT0qGIeTnzn7xPNCh/KSN8Q7qunFACBHBAbaj9OwwXEG0sEflFq2brmjzVOQAOOdmNmtoKrejksGVdqImxPIgtI7dIR8hppLRGkdPsugjG6c32GDBgt0SEmJaEHXdrFCb3cX0Obgg2ctd0JGlhbhIfuecEeFPdmjYBZ/Cqy0omIojE6s6D78F7d5UEAFDwtHzh+buskpPokcin8eWa63KvbACK1XSRyWTCD8xtdv0QkClAAuhlJUeH8PZlNvSGwKCB/c8RnJ5/LXsEnEzlCyOKD1p+tSgEScFsb8s3ZkBj700NNUkyIIDCp57b6H3sc2fee/N1028cbzdumhhr4txcMXp2pb+93ct7CSCoJEmB0Dn6MOwIALwE8aCgADADfhJ8JSqdhAuikChcQ1xQkBIgsG1Ido++EYDJxe/75ktlfgIZEejaurxCLBGFZJUGjRuT3wPo+ViqEawr2BnC3ycSFFrTdl8PCq21SmFkarqpTsyPJK9+4NgTc1Od//2ayyd+7dF7jv8GkX7KZFFPkKioGf9QkuOrlJBMZogAnXUS1HCin0xkZg4ir8PEMh484BRE6oHXQ1nIyzyeAbwWqbdxpS0ECOdcBdTmIDcxLKlGByoH+XjEmpFrqqK0ViwvFfKpPpAgjAdw8qW8R8CtxQAibrlKCnkXgPm9m9IJfqGu2mESJQOKBV8oOoffhiKBWm5X8/aRIwI4fXad3vKGmzURaSDJZV5xLBO7z3Y3ucvTKubVqqvQLs6OYQPzjeK2pZ+aDh5VGF2RXRQ8QSkKY/u/lLCvSma6H6d/YnASQlbhxHIxYrubx5e9ZT6XbKA6ZvmAEJOaIfdFKRSFhi9+ef2pP/jwyX86OdL6pw/cNnd8Zq6tskx3eoMi0wRUFKAVgjLpaqX1LVZa+yCl0eFpt3cQMqN971MLYPmKGBBgY8ZgXK7akEtg6GEuYRhJfhTJffeSZcKS8QweZf4XIrFKZUBlhsFuXwIAhYiYmlKBg5yK02f72xtbg8b0dKt1fL6TLsx2brri2NgPz820b3/1/Ve8nYieTpOkBgEONQnk3prAWIbY4itQXipJ8jXKYyCmGPOmtMjtcRTtgh5KAB14VCuQ3dU6RqDe2L+W9f34TJhMwY3SdAzzfKvm65oghbKDqqZDQ6HjBoDAhaKKPf9suKOFGksPvCT2BFOgy0EdyKE4mbAYSOX5kqoRSMRqUysOuubuyX8ksACtd6wRgE/UXaHg1HQkyGUxZ+8TcQoJDBZHcYX5s4s0lFnfPGfZ7eCAYYPARAu3t6DdJVvKrC2Wbr68Fs4HhRAAlHYWCMtCW7PRw6NleRUL3cBrKakanoXAAxywErr+nNwVfTngQcBa5J1XQiH2BqcZmqxS7SR4Vv291FRFRANKVBO/+JWV7q3XLf/G3HT7tsuXO99xw5UTzZnpdtrt08jmTt7LcypSBZSkJnGtxH5idhAFJ8AiQS7aJKojAP65km2Lvg/RAgAijgVxNASAwvdh+HQ8gupPUbblATzIEBtOvN1B8jaBx8vi0ZofJUbDuVcMCoGISATQz3WebekcAUApbE9OtuGmqyfHOq30Ly1Mta/65jfd9ENXHpv48P94dq2HiLZUYJ0X4HARAgDm/Jr/KQ9TeRALJbezHm3nBcr+IATgYsYN8LtQ4FPYMiA3I/0yEn4MMW84kgxdvyKnkZ/2tjSxCS+UVsDwUdR0FCktK6E1HSoyyqcCpHI8n1ERgoUeAKygKDv7o1bhuShcL4ZBJRTh2pclT9jW9RGpBLEMdB9NjFlqLQwCcMhkUAWgFnZHk7zxwui/yPPjVGnfiizixDYR8dGgu2AOgTWuopBvvsCrGSF/S/bmhFlckgg5ts/cSyFCEtywpotEyPCqOAKAiAgKFStd8gl73okMGqdMVj9TCRa535ZzY/AqEJUUisUhH0NmJqBIjAJvp5JAWR1C+uKo0ANS2EBNWff1D1353quOdx4a6yQPLk2NqIW5kTas9GB9s79DoooNMR9h/ByHoUYAQUh88DTLIKMLckIQeX3Ay7uKbYQAkdHNEBF6GSd6F81i5cAbUbJTNwT5oTG8jKLrfWlBf2eTw9JZTA6L412BiACYACJiAhppayfrD/Jc73Tz1vRUO7n+ionWZbPth4/Ndf63VqfxnT0N//nZ51YzhQmqpIW66NfT4FARmvB6QgCrIls9QINNAOAhNc/4JRAg4GuXAjNWgX1EqpDbAcM4Xo1AO4xmkRW8YaQOWF5mHRfcHEF3DljdIO7IJAQkQPDla/N8u+bjmgCgTgJ4iRGC9EZZ1S0ugAZGMIpLQCqS1SqkE2oUNN7PiHY5FyoQYe6UijG4Q1YD4fqn9vM45RhJlS6u6WhQYF2XAXWXwypamb09H2yehYA3PQQf3SxWzmNFOCazkiMQovFNcSRtoCrX2OxBI+9LZ+M/sJeIKBS3AiXiiwRh6dVuepmAHkRpgdBeszKaRylZODC23O898QKrTVI8H2raHyEqQExweb7zpf/ye+oftZvJv/iahy67a362A0DUHmR50e8Xg7ygQiEhKlRsw0pj3fYG/skTgNupLxvt+Ugt+WtE8P6eUI/UA4KSPKW+A1u+8ryn/fC/uK+YCzJXgeF5ZyKJK60RaIQqYoJIgFQUutjpUb8oBgVp1ZmfTdLpqRY8dOf8Cd1K3jM7277j8Xsue6+m4mnEBBFTJMrrCXBIiAAyCjJLWC+RB9iBuVhW3IjwANPKoqtVSVRLWf/ixT/YI7DnmEHqDxaJLUPFchiC/0uVsNz95U9NNRlKh3khajoMRAAEGgi0xTZN4hJEu+/HiANkvB/tO69BAAQ6YYxzCvIwvXnrvAfRYh+hnGKkEAifXUJPXMIs7j/cMi32FBK40lV8GsFvsQ4GXtNRIkRCdHkxUSzeAK5clpkzEQwvjTVpdAV/QHrd/LpKcgK4hX+IX8zl6ohtOLf1hbCuY3lgyLpYiAooPTQAdqcOra7CMk2cHW72SEUSvdcnxrOCLNHiTGAQBYfEa1ZZSRxHIdf5YvfTKA2zpj2p0H1CbOGplW7xH9/3pQ9/89fd8PbjMyO//uAdCwuT4yl0+83O6voAu728XxBRokA56UTenCdwj9g9XVkKD1H6KdmgF+t5pOcxkB8cpbiBkIB8V7HNCTloSsrXKhJl0Hh0YafhfbGilVA1oqmHgTEUj8GVTLRRhERmjyQqgARUQoCU51CcO5ft9Hu6OTvdaM3MNPHhexcWL58f+d6liZEbXnvf1d9NVDzbSBt1XoBDQVIucr5T4gVXBNmY32ZuuRwB5PnZA04l5rOGtQQLnAqNknMputQDdKGO7J1yrMdanndHXf8k4T8ev1DrHR6BnDA7qIWQpqNYRwHUBFBHABxyIgAghQTaLZJ2izEhcoWAaO03Kz+iF1NG0EULPfBbqYKIBkPwfRTnKWguPBNsHAVd7GK0h/qDf13SH9xOrzoC4IiSVIHj4/7H8mK4gzZYn8vcXjbXHAs6466q1dBBignHo7LjQK7mi0BQgwAHgwRHeKc4uexo5pSrShbwUIVB7q0af0wmXAN3eohZFQG2cpysCEb2YnCTqivd3HBtHBfWKOpLIKI+ITYQEfGaE5MfmB9v/1CawE/ee8vc7LGFjkoQ28+f1tmg0AVo1CkCMgrgjJdAIHkp545XMYnkRbE/7vxGH4KXYcRLeONgqY96YIOFhy+0gfLQAyMrAD+CK9ih4fZAY9yBGIvVN/i+iAg2EgC1BhrkRZZvFkWmC00KRqZmWnDjibEmPHT8zSOdxszfevNtP3vbNTMf/uSfn1pBRARUQLoGAg42UcM4iCyDuFQAyD8AADZGgIAQy4i/IwmwIniDWpzzWFjYQwVfBg3Kkwoihq4kOYf4ALJ643QIBwykbt7s2mtNR4nSmhkOO4lVEmTaJlYfkXjjqq9xJg0V245kf/56cO/8ouvOBkDrsNGhfCN0Frlq81g1SAghHqNXkNlKQ7C1gawJxmlean31yJJbP62NJsOlweaDAnRBAH69J6tLspYYcmGw1xQEDwulUu6JpXhuiGmFov4vSehe2HpEABpA66FutZouDhl5ZdhLA2l+btZwtsqhk8FswAFU65QEoYE39J5Q2v/J44ivDb36gvvFUORCgWJ+OOHJG2bBbB4tS+WazoeIMkJs4Fde2Nr5L7//zK+liWqNjzZ/6pbrp0emJhpqcyfrbOwUvbzQhSZEpSABFe7hj6M17As+Gb/YgzC4BveJ8SASY5WiPhCVZJwcWpn/Q1DK51Dh3/zKQ2AyVCoEDuS1wJPDhU3ztSbo39yM7SReJJQClaaQkgba7hWD5091aXsra81ONNOrT4y0pqZOvPbqE2O3HJ/r/IuHbj3+q0R0SilVbwk40ESASKk3gw2ZnC3gdvo541/wMl/PWqWXvwCBGGSWZGQrQsAcjOr0VhDHI90YJP97oS5qWXoUDQRmIPUKNxcQvfFfntdF7f2vyVIdAXCJkDODAyHDMKec70bAxBIgNvv3UgdifHJoe7H2l9sghJKz+i5+iS9J0PL9TXfJ0tIclhrVdCRoYWYCH7ln2b7zizc53F7wktEOPQPutiVqb1B+fxdFt0BxUJqCFbZdTQeCvG88PBY7daysHfYQqUKLC28Tno7eDMu7Xs2ksWIZHXZHw2ttTsqaDS8AGRBA4Rdf2Mjf97FT/2p+fuxe1Uz/yrXHR1pLC81msjLAs6t6K9NUACIqkbhLAoHKJgwd/vx3HYX9ez7L4/4fv5di6HDUYboGU9WncJwY8GfFFdJwM7Y/BsftG5+QELnEBcg5kShUGkAXmvR2N+/nfZ3rHDpzs6o5P9XEe26dWR7rJN89PdG67k0PX/0TyzOjX3x+ZYsQFRLpen4cWBIGPISizmP8MQdK418cJcGT0R0CcGCIOH9xq3nlBCiTxNjk/h8LSqOriFBTTZ7SGtE/7MSKpw3yI+fENOsvmiWPnITiHGeuRA4AeBTe9erQef4bofaho8gtwBQLTyFxrXAKvWNVAABWK85euZbFjBhjJXA1X+1PTUePvNfHo0V+K4xx8xs+RHKeAUIi6W4CU+/a8ChZ1iK3sMotrZIn5RjCMTlk3q3Q4K+zujz5YEVXxFruk6npohNag8b5xhFsJkDLOzK5qpd/pTrRloK26N+XMrELfpPXxp5+7kteHecfjPeC80lrFBFPEnK+MQcu12UALwChagBpDZ/4s+c3Hr/vmu+HVDX/whPL33DlUjudmWw0drp5a6dH/RyAEgJS7NtjuSQdhYIDyjA/r5DIzkPplvTSsbR9hYIeyIZPm6XVcRZREDHgN5yw5EWTE8OMkkOtnVLBFko4JNG5VSE4wwCGfBuWv2TZaVyf/LnFNhb+uL6gMTpr0OREMvFWiICNBBNNijQoWN/W/X62U0xOpK3JqZa67capqYWZ9jctTreuG+2k3/H//90nP6ZQocIUdR0JcIDIu7FcxB9Y8Qau+IXlHBB8Bk7Y2b03kRrr8gc6/gQQOrDj0SrFNZydllmD9hTcDHldsLeTGq/8jPYo5wUAJCIit0UWEQCVgRPtfescADUx1REAh5rkah4u8ZzvBB0YOMwrtE+EsXRlhI5G5yUgyneSYL2RwPG44l4qdRbRuQUKgn0AJshLRX3UdPTI+Gg1iLnhOU7kwHDapYfOdt9F4iB/fgOOwSloE7wYOtXkNd7D4DTUeqE+UGTVLOdx9GfYWAkZoYIcH0Q8JKAikKeDJhJBgKHiDb08jPoaxtglKWv1R4Tz3zde0zDiUnKILSTqP/81j1/744szjWtHWgv3zE22cGG+0zm7OlAbW/lOrkk3Ukyt/q74kZonxG8J5DPjLUXlBxYfcagSDm1G4UspvqpYL+AcJKSIgdFdtzs7laHUgOet2RbpH9I+qrhBlKe93LeFK5QydRsKjTTIdd7t5/1eluUF6NH52Y666thI2kqWHkhayS//7bfc8mM3XT39B3/6pfV1RESqRNdqupjESykngCyJVHQ86SUsVlTUliSZf9+S0XN/hagtde+vEptz96OqhzgZui07bgxYlwGsyVFae0oPMzkDGBwKbo8iCbzTJgYMZJVzRzGKSf6w6wVK2f7LWi8JdB2kVWXEHUaX+9PBCbJS2ves3Hkem5fYMlMwApH23l1EUIgNJTK91XR0CIE4xw8yAMAgP7tqvU0kyl/5fdzotnJbQ44QuOxVaausN9ghYjUM+N6VIwY/R2wSK+tMs+nXENz9TdQB6YrOa7oYRGAzn3OUEfigDiSXWoqjsAQo6TtgEszhIkmiuujMMC46S8hwNmeCzNHAxh+DFBX6YuwZFWCsc3oh2CoaJnrM/IJGI23WTHgBCTHFE4tjX1iYbP7wSDN910N3L9w4NdVCraE16BfZIKOcCAkJUCE/UQ+cEzA/coe+b+ehd9738N4yu38JAfD5UXzcATh5JTAHcmqELCpUgrMo4l+WvxS2K2XLlAXcEPy6H/o0/OD4UlGrAKT9A9wH+c9tQVq3M8BlCNAmOksR9jLKVs71d4qBbs9MttL52aZ63cPLd51YHPlfZydbPznIvvKLX3xmrZeoBIs6MeABIM93/APESSFssB/6GBF7CSvAaJVWctfIqcR8ZiafPRHmwCjpwsGuFKOWesdcBSglh0TyPbBiIvo2k1GkOrIc7SNhZZHPmmqSVEcAXBLkNgB4ISTfXJhb7EpDRUsFajm8q4pehjYOgQhyhxAAXRLlmo487YvbYnQsvC7mYcds1X2GdzyfOSh9aBhxeE0XnwiISBNpoxmq2LAnQAqdkV57hH2xwtDnPeTaErSA8Zv9krf5anr5iahPqFI8dXa7+PCnT//+SKf5E1MTrXfde+vs4sxkG/OcRs+t9bs7/aKPBepWQ6Ucyizgm9ITHv7EGRGXPQxdb4dy0G4cFQMJLln6eRIGrxhtcPOoBFlIC+lFO7QcQmINNCRUilSiELUmvdMtevlA54NB0Z6fa7dnZkbgvlvmZjXADySJav33T77wb774lY1nFDaNyUX9eiJddMLc+r72FIUCwCKohk4vxHj4ZhC9qGplzu+iawy5eJfGtTZRU0hpHQBwCRBRYV3gQIQWCiC3X5XRSbm2x9hjrEq6zLwO7Y98T8JbFaCfDsxHIe9IvJbLe6QqB1EK5BBNl5/aDohNI6GlBJ5TsmUQIei9piND3vZSwtskYumshxQA3P5r+8/zu00ViIwriY7EdejKSwm9VKZml15dEaJD4j0C79zj3a8I7I5FpLqk5YEg9iKRJg0FkfcwWVnFIhilVAu8THGdv9B5WS7FWlE9IOjb8Zu4ju8uQk5Y1pO4dynPgCP2UHmxbn+y0mBqeklEOifEBv7ZV85277x+8b/NTTRvGG0m337LtdNT09NtVRC0e2e7mc6p0AVppVChzY/jZJjFbZyJLFhGmvgo5RFZeVbKXEaWb/xhbztV6Qr+sFy3OUKhDCnxnIh0Dbe0y/P+riTkKXHYTUBRZIzfEAgORBBRhOSPsmoTim/wmdsTu51QK6S8oGJ9u+hpGMBAY2tqrIl33TIzOzvV/JGrlscf++0/ev77Pvq50595fnULUDWQdFZPlotCvHa6ECavHIJ9/obVfRqgQMgSlbkQfN4VyX7BE3a5BqzuEG48QXENgQSrJEJBclCivVskgrkpdXMC8JGGdhuDzKfBnTXSEczynZo3a6ojAC4dsjPfCgQSokmYIyUygshcE9ROj3XV4Ip9UqXOQOfVxX46d6leRMrhC3WXmg4z2YV1F05gRZBfM+0B0ldj6S+a41gBCFXl3eZtTReDEIBQOzl7PvkZpK31ou5cxaW+6+o353NrY2rJOzImdl6fs6bzIi4PSJStPX7n8fc2G2qy3Ur/zvXXTI3OTbeTPKPRjc1+L890rjVQ0lCJWd00WwIym9guD8tnDGAjeShXiBx9MdcN58JyJw49fcnsMwTMpwvRd3wr8sAZ7wtQoJIUsNCg8wKKta2828up6Pd1Z3G+rW66crI12my8vt1pTk/PNH/6k3968oOf/LMzpxAbCJACUbeePxeJ9rOOhms97crcQ23/Xeh8XVHBzAzVguHtfPvSIYtNa35fG/81MaUvrpRMTQeJeIs/Om8mBlKMUOLy4H77+roIClykQJjLVBruwdvIm+kHY88LVSHwxpdRAQk8GHRW4PmxGkJUrlggYwcIeJ8uQ//x11XTJUwECKfPbdBbXn8TEaFmjxaR9dXKfdvW5vELKZd3I/fOzZpoHysKT6rXG0rusOgNid9WOTapCshlk2e7C8kFAVzQL6imF0nueSnmkyoEwPEDeBiWba0Kh/6wOwkO9HfzKdu5n9DvakW5M7wkt4Fn32AMaFcLX/aCLE9aBmSggxME1Ox4wQmTFGxN+acfu/vEu8bH0uOtVvJ1Vxwbb85PdxoKAc6t9XYKrbXSRICIJCoEyPVc/pVLp3uU/gWhCBEJZJKQOhxv5zfVW3kq9z3HuSrIXWUvEcsw+XZxFnSMPocTgHE2Qb7KVkmxDk8E4JRp0mqKZHJUetNrGgJPiWAOAwIQJoCKEFAT6N6gyFY3+gikW1NjzWRpoZ285pGl+48vt37psoX2v3riruO/SJQ9hZhgmqSYF3WVgFeOCEySTPPa6blOL0Qzh1jhBeACUiQ5PdRMwfGH/y30VgEexMGn5VwAPDKh54KvdMEc6PNrIJA2k6o0R4KIIHPCfha3QtnYQrVfKLimo0N1BMAlQy9xYsdII8Wnd4Ei9zOcfV36Ej+DTfYCBLqEEtR0pAgrmal8yK7brLFWnYN9830Mhu3WsHok7qzQIWo+PjBkn0wQPl9lFFc8svPQvUpX23DOYZfT0Df7vxcHr1Y2qEGol5V03qU0bSNigkTF01/76BX/tJFi+/UPXv6GK49NNNKGauSkRza2Br0sK3IEBanZDhCkF5OB7yVukXg8VMnHqEF0JswgsDcr+8KAe7W7EFSJD/i3lTcJ27kmVD1uBABUgCkgFkRYaNLdbt4f9IrB9nbenl/otGcnm3jPrfML4+3mPxgbbR5/06NXvPv4Quczz53ezu2zrWX5K0we6A9eWKrm0N1E9YsRhOf70KVDotKnUEXM5zEm7ZwIWNTGf00x1REAlwrZPIAkhJx95eSJfOGwRlvxmUwPHgDFiDOI29vFHWHIEl8t7qqyBHupNWQxFp/DE4rMx079IYHyEhDo2vw/mhRyl50BjNwTEkcCADA6zoyD4ENPyPM782fkrSLx1ntnKTjOo+Cx8FYbcxq928AyMPkNewDEW1ow6Kemi0X2OSIpdIWffZ1y38ZnGXcepLhkZPwuShvtPEEIwLUsUBz3TkyvHTrHLQk9MLblKByKtO2JN7i6ja7gsA7rYYWyAl3ThaI87xEqAwLMTTU/mRX09k6rMd5pNR6Zn++omZlOoyCi9TWd64IKVCpxz0Q8Z/fgWI5YhiDyfnoAcPuPRUAAsD4A3AdI/gB3BxRnq0BPjvwvyUJhzIScFHk1+ahfxIO8GoI5y2kwnCMU/Pfi5L+/V3hrC1ewkUgyt4LYD2FHjQSQmL1ApAlou1cMijN9mOxBc2qypW68dnZ8drr9V44tdm6Z/UD7+3/zvz//m2fWtjjKo55ALzv5ZRykR5wZ3QpHtD51AIfpBlV+0NarLuu5EZ8yzzke5PtL651nDQ3hdsHvlk9dRQqjlmOQzFCCGvFxIDMIK7hRBMjWekRNkuoIgEuOhnhxoHrqeyWUFzpr8EQ6a3UEwC5YKUbNAuD1Qggh34eR61wIoVrZrulokYOGvPqGMUtWU9WZ3XwCpZsO7TxUeKvmEp+tYdnDQj5lk+SRC/j0nDguVzJnCu+6D/sC/R8GiIeNuN6G8soR6R6lSQvPrvXhtz749Ke/8auu+6FGo/HOx+5bundxvq1SHGlSDnp7O+vlBRWoCZMElQ9mBgitgTINPet6eOmPuhrWr6YXf0cGZqtkqWhlT5fvUSWsKerKG2TabXkgUAAAiKgSTAgQCg16fT3b6m7pdNCn0bn5TuPK4xPJSDu5vZGm70KV6g9/7oUP/fmXzm0gKgRo1FUCLgoJ7keXHjs8DRdiFoQKd0kj3Xfn0hHxUqFXD0DUVBNTijVDHGqyW5oTtLtP7Q8CEqL1KHq0niFRvjZeBhkCIJcl2u11Di14DxSw2sHBiCUnkRFiw21+6Q8QA/ODAuNdZfQ0gvoxzHBAzjlHot+ajgo5ZxMCkK0CwJnaEQgR3e5VIFMM2HrEomU5Xq0p5HPGyBzIHyiZoQuMAERGYHORG4EzIBEANQCQy94LRBpc8p6ajy8+SReNkbL83kcfKST0ctOcNYdkdhXrnDHvInmH8oToq5Qd2lVq8R1Q1J9XPsmypeBfe8iKV2QJjGwOCmSVCCDLB4SY1GDAy0h50SfENiI28Nh854+6ffiWRNG/eu2Dy3fNTLZhMNtpAyBsbAy2i4J0Q0EzsXEiDjok/7y9R5Nsqgchb8Cv6wG8xLIMQfAYSGYaIo2Yc6w85H0rJcsnWs0DT6kYW5BHSOgoRGDEOKHTgFx0jB+vTGnpt0jzZ+Mx8KcXglzIZHYqmEAKVzkGOaICERAUKlKkdEHFxnq/R5qApluNqbE2Pnr/sZsWZjv/9sSxzq/cdv3CTwOodYABpEkD86KuEvDykJNkpnIJgq8CIBdwPifXbjsBSJ6MepZ87o/xq/iR+qoVZR2ar3Iauj0VWmVRhYLwpk5Y87yXAt4NiWpduKYqSmumuBTIGf67tvIyi5xyWdXXfiFKnyRtSDfnTSWsdI+2JStrn9fWdDRImuThAsj+I3uywhXwIhjYAl2sRFecFmPZo6OaDiCJLSLO4GInDQXNPMz0Um8JJSV0aDsxDmfSVIlUoQKfPyfW8vXlJqIeJaqDz5/Zpv/0+1/47N940w1vbzfx3Q/dtXTDzGQbU6XaBAAbW9lOrqkgAkoSUOo8IjVKz5Ut/nLZn/Oml9Op5Hl2f3rKcI0iPCPgj7ImZXeK2a/IXuBBgEQRJg1saA26P8gGg3N51utl7dmZTmduoY0P3jE302qrbysK1es0G//8mZNrq+fWuoSI2EgaMMgHtcB/uckhri9NfsW+qWpySG514/11AiGPhgmJz2uiU3ygppoMpfVyfsjJ7NkseBOnE3ToNzfxvn2HXlpU22z7Yw6wSyCvcpEiEEcEBFokSLTejiE2xl1ogDiG1cszxq+Mhg0u0FF4tsimOY0+u/IX1gLvaJFQ4tDwrUhoLnYAAgABmW2kwqAjkyEYneEV8iiFt/EvZIgLOePL7DJ0e7v5igCK4znqCnnwxmsTwcC8XNPFJQp+jHQjk0MF7RML0q4bb6QVsSy5AEB4W523VLhNwXt8KBSxnuUwlr2yexISHSv4ld8GLiTBgPwpPO+bz4p5I+0MQ41rusBU6C4hpoiIePni2Pt7WfH3geCXHr/v2E1TE23IiNqgEDY3B11dQKEAARJMZAZ7dAiQXPutCW1ZJtzj74xc1isCPyU51cGpFlAysUn4K60KwPxNIb96bz1EKQbjXBc833zRAhd94wABoRvYmQn8CsJvwPwtye/YaOO+KnQUvikC2koEZo+ZApUkmBAQ9Xr54NxqH5SCzvRkgrdcNTXW/Or0+65cHn3oDz/23M985DMnP/zlF7Z2siKHJGlhUdRbAi4cMePZuFiUQC14VRHAPV6nTzrRav4Znmd5LzRTFxkLgtdi2cjj4M6diA5vKsfm5p6dFcEgBQgg5o45RTZYC9w/1x0gEaH2Y6qpJkN1DoBLgtiw9vh45YK1J5VM7/2bz/Ftz7sDKZjKkOmeYquWazWVKGSKYUA8AICWeuSLBo0kCDDEybbf3lH81HRAiEspAbDx5B5RAAARWeNmyNM7b+E4vIuoFwTcu/f9OU8BAaBGny4eEeWUJAk+fWp7sP3RF/5wrJ1+fyPFd91/59I10xNtaCaqfYoANreyntakAQiUAhWn/DofLrsAnOmv3m+un33e1Jv0F9JWDmdPqEfx5wAUNQ5dUxMBQC59EiJA2lQJEEGeUbG1PegNBlmxvdNoL863G7deM9WenWy9fnKssTgykv7ERz5z6gOf+cLKKVMAtoFE9ZaAC0cO8AlgKnG6VPsnaLOH5K7sM24RI7h70O5imcRqcz5sUjvBahpOdRWAQ03S6jaIp/E8+XNmLx5D99y8LPVILGwOWofQi8SKboDWu4bxe2FKkbwnCnzevPdbAL33Vr53S7/cC+uyUznXaQCrmvfhzuyajgI5Dw6ZPfT+GKLJASB8/uh/e9ePAukICiEBrkDB2bMZnPLHHeLv+ZGzSgsWZc8/h5ISmOgD4rlq+quZ94CRzSShgPeUEj8342lhwQPABoLY0h8/TuatOOwaAwYSryhs70QqM7kZk/d5kt/pRRWynHtElrVWqpMVqByQYty+aZYbr/T5fWM1vRQqioIQG7iy3oXf+/jzv70zyP/+oNC/8Nh9x2+aHm+BHrRaRASb21mv0KTtQ7OeaQAA4PgUkIYAlrzs7gw3MOcjFym6c4bXbGZ109IxFULMweZ4yLfBrhl3C+FPlSqLGw1GuxdJtMOA3+UnRqF/+KFQqKfY5cAZYsE5WyyJyyUAgLLCnzUak3/BfHaljNs1y3W+vgU9laCanoRkdqqFD9+3ePvMTPPnl+bav/7E3Uv/moj+FBExUSkWuq4ScGGIAIEarCWynklkl1jg1Jm8kIvqLS6fldehAeK5EgC+wTH/ACuccXKE4jDKbiLeDHRkzuMl9BIHC3CxGDQpMvif1TJEVGxNNRmqIwAuCZLIdQUJ3Q4496kFEs9bHIS66C4Nqk4FNnp4yT4GUtWzBwCqblXrqkeXqpFvXt9thGeoHxIYtGw35+1+6XyB+poOAYkwyljgRDHGRrssm1cvy6gqjg33++wpwGUfwikVaKc1vYJElBGqJj71wmZvbbv//nYr+f6GUu984LbFayfHm6hUq42KcHM77xWaSGvQirdzeCRfdMhmdvlZ7vvp7srZofn/UjlG9rNf73/500UAQDhdxXH/u9wp8a4KsmVd0XtlTQJijQBKI6EClSKgJqAso+L0uf7WxlbemJtrd6anW3jf7fNLk530fxnvNJa+6sEr3rkwM/r5s2tds/ushAjWdP5kuCXQjCXPOqt5H91UvL0ggj2akxFGV9F4H958GQIGAAz+1c6EmqqoBgAONSE7whOe9k41tZk/OUe+a2/OgVfvRP5feyhYfqwT3aHsZPdFsVRxe+WkokHB5RJZt3Ck6YoocAO4sUUqpwv6k55T/xUgKlRswYka2goAilphPWokHF+ACgnZO+/XQHssYA1GBcB7bgHLkZ+xWhvAbpLHeUVnbxiR74uTEfFfTvvv4Hw+DoShW6Cmi0YEAKRsVImOjrP/D00ldR++IVU2jD33Yk+zeRsLPoqui8wWdlg51qBAhko/7P4MJ78SmMT/BBrJ7aMNB1/TK0mkB4SocHVjAL//8ed/u9/Nt/r94t1P3HfstpmpFhJCC6APG5tZtyh0gQkmqLCCC9ksAssUiJwRHwCEpzH0gpqDzFPMZ7bfyDOKUqcQf+JClj6FsK8KAOBhM47fk+29goPR5HKNAiMercM+7sNHOPBHINlFQLJCgJfgLNe93uNyvUh3BCIqQMgL0r2u7q+uDhQgtSbHm3jj1bMTE6Mj37S8MH3z8oef/dH3f/SZ33nm1EZRgwAvlawAJEqZRxEJGBTjuEB++B6mtTFSIcuLbknIQfM+ABa4rAqzvWQo29A5Gvje4np0mDG5vEWOz0VXATme9MqHnSImFIgzC+13O05NR4pqAOASIAIqSCYsK69g/jf4RU8edLJHdBphidV9VzYg0b9Y9AlCgenHhyB0jWGiisOuy5eHCCcRaS7fU9MRJQxYYkgTQTx1iNXBvW8QU9U1kYlXfanP0GnfY0Wjmg4GoX9eTsYcIDmziwytkp27dEO8hYCq1oGaXnEi0oSY4Jef3+6trz/7/kaafF+rmfzcg3cuXDc50QKVqBaAgs2tQY9Iky5IKwuOC0geQJg5+36wUiS5kmND+L667pn4IKLP6BYvOTLBtQ+gslJPMtdfcDwYje8IUc4CB9AKbYfcimNEA7GvApUCRFSoNenNrazb7+dZf6fozM500muvmG7OTo3dPzHW/gVE/I73ffjp33r61HqOiIiqAbqoKwS8FLJFdXnHltu4BS4HwBBmHEK7tjoPKWkUXjPC4KjEFyq6rR6tmN1kMAFf9lWJ1hpqqklSvaHvkBOBmdaaRZ0ku1D5JTXECkFmrQaytcrR6bYGKLfXSG8VgUcehzCQz4Hls/c7HYJCKceD8FnSSfQhmguk1Xm3CAA08dYuACLQmrK8IOv9T/b8Dmu6dAgRYGF2Ah++95iSLiTmeQLJfjKttOzF+qb8dk/n3XGWkdvsbQ6YG3gXrcvDwci/8J2JKBXzV7HyiGj2lIPNPMxbygGGTrSaXiFCAEANZv8/2pTL5LIvg2UN6bkraWuh1SH9iaa2uXgPRpNzQlYgp2Ekgbc6yBkrXszyndCpwuHgPDTlW7DfyPFi8LFqe+RiElFBiCmubg/gA5964f15ob81K/TPPfGqY7fMTI0CQdoCANjc7HXznIpGAxEVKHAAu1g3nUNSehnF8w0i7VCCquSz63jNQmgXVtaGaFRczRJ5wz5Xy7DZz/1wpHi2A6bqocZsSfGckz1idFxMS9aYHBCBQlkJFBHOEO9WF+K4H3RDJecwRl4CNOhsoLONjQECQBunMZ2eaMCDd8xfM9LCX56bar/7vltO/EuA5jrpDFTSQl1XCHgRxOAlIoEySjKnRUFAFPqiJx/p5HRVdMwM/GzDqlqejwmFogFQWueD21kEQOrDflLZeeDmhx9fkJuDhJ4dYAcEmoBI+zakWfrXrFSTpzoC4BIgAtCshMYUYorBCW8GRUIBAUKvD4lGEgdn+6hkQMUW+94fwN13j6ZVPdrkPO691jrLC73LFTVd0sSGuaWhPFWBtl9o8mGuYiWX0Smsaxqt0/6z5z1uUNNFJwx/GCW1dEFUKwusutvx4T04YP/3ZbVxl3UB/O0NPuzg2cb53q2ml4eIckJM8SuntgdP/dYX3/c3v+76tzdHGj//qjvSyyfHWoDUbiFp2NzKuoU2ugEoULy+EgAp8RzLKKgHPiUFZdBEixJHWCSqlAR96AXyHtVhA8FoYmN/yGhlU6eRhBhc+ZI4+sq1x+ADkT/vh0zhZajMMqRBm4YKMUVMEQgGgzw7u1LkvW7enp5ut2anOvjI3YvHp8ZbP9rutJY04Ds+8SfPbKSqhQl2sKBuPfHOlxCAt9MRofGS+XMv27paflAlJHgIz4ZXo2wo5tJujMBc78BoTQiaNBDpWnbXFFNK1fK2pkNBxu3DG/2dmPEJnAGJiDflEUnxESPjWHEUGO50CX/d4sdgJddYFWgn9xRomhIZtciB3HXnFM7g04VeKk9CEUd/XykoT54+ZzNW1/bTkSJpNxMIHrPswQY2u3tAzoAqKEy881aeS34tcDHTIaJwdMlXZp7aXMNmChGYfYkAPhUHeF5GNEp7TQeB2HQi7fzhTub4lKO+9np4pYsWAW98BM8WUfCS0PpQMAswb/uOjaElICaT9CKQ8m4OhCI+HCD3FwC9Us5ittc3VNMrRwYEUIiIeNWxsd/tQ/K3+339z19z7/KNM5NNUDjSIujS+mbezXNdNBqYqgSU4V7zmDmGKci2z/zmOBoE7wHwtVJ+suz0nkswYSTyeoGbmUNeRnPSIv/hhhjv8vODPCiUEnmVeOnmFPF4RUfoGg1xZEB4jiAIBkCHW8SqtJhw/J3YfAukQGmt9fZO3iPoQYLYmp5s483XTo5jQ711Ybpx4ze89oYfPzY7+olnzm4BYgMTlUJe1EDAfgkBuSwmAKCxhUXMf/iovVBGyU9Sg2Rgy9R2qWZIB+IGEwnkK9+UQ7XkUS92nb5RcR+/hhDrFDyPkOzcI65a66ZFBG7VdOSpjgC4ZAjDP0YCUCBY/CsMr5KCKGztjXgGuTGUSUOWoyrZNay5HGGwBg+VVRjI21qm1RSQAQHUXoxBgtF2YTXXZ8i8PB+8wSR15lK/Uj20pf8qB277KJW1qOkiEwEAa1TWAGADCqS5vgtFZ0tl0GINke8RJwSLkwX69iEj2y0sgYyPAF8foSLH4i0+AW3s+tFqeuXJ5ARo4Fde2Nn50n/5/Pu++Wtv+IdtRb/w0J0L14yNt2F+rtPW1IOtrUEXiEz6SiF3iHf9gWcpQ1jiCh95bARhCDGFHCJjnsz7CrJoQqlBoABQ6XR5rNWEAsxCz+5RObUykRtXDDvsYXe7SkQSgEA3FnC2mgHoklSphEAVBeit7bybDXay7Z28Mz/XTm+9bmJkcarxppnx1nK7kX73xz538iN//uxKHzFBTNpIRa8GAfYkBATMzVJKoR0MUgG2ctBa236rntdfMeRW34fjqZCPHcdgLDfLjy2AhO2iYjoRI6gAAZDEYG0D3zsC2L3/vC3YH6/leE2e0v2ku6rpIJMz/OVmf58LIGjrRWC4RIM77oVbiMK7KylsGwvSYPGu0lOlqzPSYFkbiW2jYGssQICwkt1SraWEd1m6S1ZbTZc8icUe5VEHFrmtp3bva1g62njwiXF+iKYVRlzt3mPEy/ZsCKyFxpc/ahZmv6fcjhYJEMkmsagX7gNBCIoNf+Asee6cl3lONvkzXtkMfEDcrYw/Ye+R+YWSee1pbmb4S8YOMCDh8xR6tY+87HRjFtyN7jOUmY0g398XVNMrSUQZITYQEfGK5bHfL3L997e62Tsfu//YnQszI5gm7fbps6A2N7JelhV5koBKEkzAiBlj6rrnjbGoCsEjktIVwIXL8x5+by7Z5pFO4ZZtilicX3hOHbYVQI4qGKg8bBg/TB3kbmanLoVzzTd2KwPIz2BOyUELo4+ITKZ1xW/tORL3FiMmv7fLZN4g6g3yjDYAVIIjMzOYLMy21SP3Lt49Ntp47/HF9i89euex3yAqnjaxnQ0kymrFZi8iAtKkNZHJkeVYj8BkckHPh3JZt2zopDQR8Z5YFFAA56OQuSNse3M+wpAkgoDAgh3EdDJXqPjJSlb1wJWX0nLN4d456hf4Q/MWrppq8lRHABxqQnChSCy0iI1/scBXXrvP9UOCkxXXVaQGsPGFIVBftY81hBhkb/J8lY7gYgQ5pxoRYaCb1HREidPgVqS8lfBXmU2qGCfi9cgwCoyxUnvP3THr+80xop3b/w9BioCaDhiZskoKnbB1Tw0IOOFpqAiaN+VHKvQ6kEZH2IitEyzJw1j/E4MccicqXxx2NCTnBAEA1brCASUGAZ45td37t7/5hfd9w+uu+U5M4Bceu2f5ttmZEUTsNBEQ1tcHXQBtGDNgzWDthuAM6xbeerKnvLEe9BOBrgC+Wdw3n4vnxTC+rhSJFJ8JZ4lLiMkeU3uuahpU91HdstpxJtG0Idfawq5GMSNEBaqhlNKadJbr4uy53s5WN2/MTLZaszMt9eh9i9ctzrZ+eGaidf3r77/s3dPj7S9sbA8AMUGiol4lhpLbmkqS3QOuLa/mAABCaY6CaBm0KZUGjroIyrtKuLfitq5bMXeIDLiAwFUB/dayaNrJPsnd24K4aJRin/61VixqCqle1A89oQaGnjUBZ/6M2oATMCJcKYhQ4vWYJQnF9rRfsL2WKKJTMWjlVl4UIiow5N3N/IGSwS/Gj2CFote1Wc65HbBYEnJlJaWmo0EIZv98HOlJcpc2MaBOBMg1MEwBHXKeoGjZLjEpr91ijeV3fjOh9R4hMzDanNEcbuD0BLNug8w3UNOBoGEAUSRzAlvEuAz93n/mod1kkgzODw4HsjvoR0ZVSXkcjEWsC2RzWTv3pEeOvb3n1Wb0QramA0oGBEgQUeHyXOeDAPTt/YH+mSceOHH/sYUxTJKkqRJU6xv9br+XDRIFKklV4p+sixgxcsgB+IY/wqB/WdnHr7FeJDKfekOIgh5Ch4H9AM5JwCAakt9MQBDNCMHmoY4hNisiCDeE7XWP3TRliuCI2HpE27eFGfz8Ed+ZQCF4urmL0YgJBSYnQJZRlhe6AAJQCbanRptw89XTk51G45tnplrXzM+0f+pDnzn1wS+/sNlDRCwFedZkiUHTeIuW3MKK7nn4ajtEpD3fVWMEsXD1NwCAoHCEXBtQxKQEWirKO5EVx3KbK88ncvq3PBfwltOUwV3jI9FqIV5TSOkQv0NNh4oQiNDu8eOpbiRFuPPTnKmi8r49BgBkoZGSzS46EIZShRfJK6jy4mo4E4cAA+6QRPOtnA9EK5Kq/JA1HQHywBPaZH+B0uftNQbGzb5Mt5CCU9gI0S2su0tJya+seLB24S/mAO7y/n8701DsKjfwvybC4iV9HTVdWHLyy6I06IvtGZHpM/LFsjIGAko+/cokAFAZPWX6MfyGgXB15o/vAX0f7t4yajvAMWLllXup9YSDTqZEYAtPrnSL3/jdL33gzU9c9VbC9F88ft/yvYtzHTU720w16XZeFNqERtu0pCZfkO1FPGcBDZDkUYRwD32Jb8OeMGrm5BvzaGDDiqwUQ3WNYV+AvDmPUPTFc5eghMGhP2X7EnqUbFD6dODtSAq1KJfwVVps/hpncxKZ7zNJQCECaiLa2cn6JzNddMfy1sxUJ73uqqmRuZnWa+em2yearfQf9j707G+9cHpTIyImqgl5XSowIgRALGxGbFCRtLURsg63L6VVscs2oj/JIpIxH2/AW6PdAaaRzi3AKnsphEf4nVduY3HLswJ53hAvN3asJYTMgXm2UnGdxLWmMqVVxlpNh5EEzgkO7QxMlzjplJMeld3x4mw3vrnVu0JREO8kWhAcE0KQorb8psSI1WYS+GXZ9KZZ1pE5g4CwvDDtDbCajh6JHXBI7sdZagDO44QouNVABiINdey0cQYW3wa8tiDnmmsts7uXxhi8lGoD83rNvQeFEADQbytxogXBJFzyz43tKRXUnYr5SByvkHPBC6echsY584uIbY5GLGGoQAvdfYu1wK5CIV3TQSeivo0EQFycGfmUUo2/3+/rdz1+78Kjly2PNJYX241GA8fW1ge97k7RAyRspJA6j79cWgG8YzHmvaq1OVrDJS6FiK5OursgIBRhznamiA5C3eXFSEXuz87TCGPwwVrhh5DR3l63GYbIcRs24nyshFNOADjUDHysgr0XIibK6FxFTkW3m/WLgrQG7MxOt9OF2RF88M6lG9Jm8p7JseZP3XfT/H9VAC8UegAKG6jrvAAB+TU0MP3BIKcILs2POTUEvRJ8IUGw/Q6gwpiPIVYM2kcNgKLswlWomAAjfOINnwWjFt81DaF6C8ChJ5uZ2oa7iT+hjCAWfMBWspVrbAWRawZ+8RLXhxCpO1MSbvYWQlayRCrJ1EjmDl290ApyF1HnihwCBf+MGaUAlXKLfb0mHlnieHogUMRwmFMundOHdV8C84YspxkErWrBFUQRd7ueYpPevpL4HIB3PcgobvQ/IK+t6SKSyaoMADZIlJ+xsj8WG2C9kt3zAEQY+uiHyT3HaTIRdNA8VuhYyFKpSel1lKywhLdyLplgiTA8TGH0dk0HnEwkQANPr/bo/37/k3/8xldd9S1Fv/9zjz+w+IbLLptsTU23Eg3Yzou+zvOi0Bo0ICIqUGhj59igj9NUBhYxzwcM2QOHOAsYkGKDSuSuRCtszRvr0vRGd+T9lOOIQdKYsWMQbQ/vrFsU4g4IqbQRJgIMeF9iKS+STeoiioaI434JIG2TAiAApJRAAdDPi/zMane7N8hb89Od9tR4Cx+/99hVyzPtfzY12riil9E7P/vFs2tKJZimbczzukKAIQ/0kPjrTxOrjPEi7WVhQFKhroByqfzStwjnQ9kel6uCHajQPOJwFQoEstczuC8kAuLNjSasMIphqKkmQ2kNDh1yMglONYAVA+h+0E14u/fYCxgqh6V5GNodCoBHJ/vQyagSyFBB3Ad76OVxHwpb3U98ayeWfc1W/5FZyhl9PPEJDmoOP0rEXnP2+Vcsw7YhuhJYACFgFbaWuSXKiy2vxGhxBBF1V8LsJeTAPXsyymGwVteL9QEicj/EmaGMVeKsZbTWcpgGOuQocsIulH1UyTFDhCLbQFGruHWAE5T4uqymmsNiM3ZEjbRZpRnXdADJVwdIkSh/6mtedeLHNnuDlYfvLd5y9ZXTk3NzraTdVGNrq/3+5lbezTTpBBEVACaiGF5svJgjvPBHBj6KDYNyLE5slqCu6H1IXkUZytnubBn3ivZZR+EJ8R0D+w+EbPYuVbdTIl4J/H2GGFhDbuY/vZj3Fo5WiACJTrSmIi+KYnOLeqZ73ZqdbuFt106Pa4Rvb7Sbs69/6IqfX5jufP7UuS7Y510vHObLStBm8zHSGRkA8nBALCRDJAuG8aa5NAJyS+xcze/kjHzw7wVsJKAAOfsc18gpthsf8wEbBVFvJaypRCnUSUQuDarYV+x28QOAEVfCGHIGRihCvOwi2bDCQgohz3jdL+GTLOwEeM86wVB1d+iC7fF7LnyFgADKAPWEoMxnVaUra7r0iQBBE2oipQGUNdIQeNelw43YTHP1MoRZ5oNMAD165lvIcFahEAvNuRRmGo4Q4ykk+kJ/sPa9HhAiACBFXGLUGv5oSjWiD+QgIOtQFYWiLUgJzqAwss/wTbz/NLbVsSRMY8Mr5h++bUWGn2HcZPNlcCMXgeLuV7PhYSMDArTQZoz/xAO3Lv7Iykb+5Ksf1N9+583Ty1OTKSqiVl6A7g6KTCMAaCIlFuUw0i6ArbxoYvHKp4QlROBBrxJf8yXM/3HEAPn7Sf2CfKd7Gmleb2HLHcPD/F1VzCk+7w1+0wfFLn6vjgSHPTQcynu+nhCFC4MBD07HQKAQoJFgkipMNIHe2sn6eZ7rfj9rz0y21K3Xz4xPTXX+zuLcyE2jrcbbPvq50589fa5HSjVR68ERn7AECDpFIV8Bzf4K4EdazkQJwdobvPDrstnKUpU9TTIoBKBZcBcODgv0BBzCxhjoAFVyHu18ZdU64FffKKkcTE1HmuotAJcA+XBhIaQg9LmjhBYhelPZqe+b24vDw6+pEKnx8WF9lORffNMhg2bR6cqnacjqWmo1OQqsfnGM4mXUhKUihkt3CY8P+64wyUp6cAXFk4UAZMGiAKOo6eCRNd4BAKSkDTdsvgx3BHAAUnR0bwrbDb+SxM/ufdR0sImoT0o1GQR4+u4bF3+l1y9W+v38++68cfbKuak2ttrpyLn1fn5urd/NBjojBEwSTJIEFIFwEUk2D4AmjguEISKy/Or8CCNdIOZBDxOcN3dGxjxGJysniVsfYhnuDXkxVILw6/LngtcYXWm+bIUImKAqCCDPdLHd1b0iHxSFhpGFhU5y1bGRNH3VsUfa7fTXFuZGf/rjnz39W5/8sxfWEBsmIu3IAgH+CVVwCxr01raIzesKTohW6oo7VY8gUA5K/E/iaInzwtwwDugqM2TIhRFEgEM1l5pqgjSubV3TYSICQlLO1y9kA0kEwCPwpbU4TlAmvUYlIQQepS9ZPXHYKDq03DbxSMKuAADfNGgnhJ8EaN1ndQT2R3sA4Iiuf0eUOM7F+lIUW+LE+DjyTk7nhjGtEbhiDkhFwGmHTikQ2rBQFHjrgQJrA9oKA+Ra+mUe3f5WApeCUDIxcCe1aD44hECAmkzZVXDuI36QRCbNZLBPmAJdMsCDnI7vHVJCCIuGEHiS/EuRLT3a3+8uRZkcitxV5nzorXKfh/NmkAaOCuC2WT4gjPdB13TgSesBoRpDxCYSDVZuvGLm32xs5M9sbel3PHzv4p1L8y2llE7zQd7a1ER5QYXWoJVCdDxEHPgvYwG42A5vi3EcBOYFV1ZhiWyPs/nM+YWZJ53TwRtv9gLxaSjMVxR4KDDKZST7DM0sryt58MDvu7YJC53tLsaJfhVgTz2b7nEyTvE1kLhR/DuyDzk1PQGRuzcpBEwbKtEFqKyA4tx6tpMXRXt6stFYnmurNzxy4q7ji2PvWZwZ+dXH7rz8Z4myU0olqFSKWh/NLQH2GVl/uw2Ed5V/eOEWyScBABQ5XmGlgHtDDAF5mYYVQLCp00sjdVtGraBXjisBMgJT2cvdyU5AVNbNz3MIHEM6nnULjFF27Cxu1LpwTTHVZQAvBSIogPelhla5bxIDhwQuMUoVB5Rzl/NiKNYyErqn/EuyHy8ofT/hnfh4STxVQa0BOku+Tfy3FnZHlCImDwye0DhzSmmgt+0mD2XfZSQeK5oGreI6QaUW4XhrCOBgUggr7vWEvCFh3mKs553fMw5QhD2IZWWAJ1AkKnkE+5WXNUceRiK9ZUQdNhABdrI+/M7OgNZ3suKnH7xr/oGrj3UaVxwbba6s9tPTK73tXl8PNClChSpJUPm8aLHRUvU2YtKYZ893aa5c08t8eD5zyYMR+2doD7nhHh9l90mK8SkCBqcjuWIPaCJIABOFSgFSTkT9gc7OrWZFluXtRUzaM5MduOeW2dl2G986OZ5c/qZHrv6JYzOjf/bcyhYhKiTSR0whQgDC3IKzwYNi+18eEjv+IHoQ9hr518rLITqvGIEfSunMEOU2VrdLFF1XalGhgFddV1NNAJDWC/ohJyPctN/DGRbKAwjNCq//+ZT6vhUECVDLBo3dT+WkIWcGBqjavwel6yEcWbQS+tzU3IfHP+1nJTNiD8NTlWyVH6umo0WMjhNp/54Z1PqkRDVA70Cys8ExUJiWzcP6kVmOwR/ThJz6JpbfQN1wbM6cLGcPszeiiQCN+6/pYhABcMUVAOAnR+hzq6ArPi6AVyDh0A+1/qg0X8mocE6qkj5nk5Gxpwed/bCH7SHSEvDdybv42SPreNwmzjKXVq4KNR0y4rwAT5/ZLrY+/tyHzmx0//rKRu8dX/vo8W+44YqJ5twMqP4gbxPk0B9AVmgobHk6RLQZ6iRTA7MGuwyoxIO+MpkAwcCJ5JKXvgQykO/BTDsvg0UslbwUYj5FOYn4dDBhhDIRWG5oj1s9h8SlnK/VfV43p8L7iCoznI4muNDqNWbaIcq4CTdTNRBan3JiazVojXprR/f1yS7t7OStqfmWuuWGifGpifQvT4+1jo21m9/zf/zun30MMcWjVybQPCWyJSrIs6bVlMlu47cMJSJE0Hn+PURqXoj9HEJRdpLRyv4gShbQrhGyJy57wd2y7s0ah5gU3JMbTjy/QsgIeA0iMR9RhojVVJOnOgfAoabI9g0mulTYjLVMAMR7iVRJfOzWM/cTHo2cWf7C0sWh0lw+Fy3WQ8bEcjNCONFVAHBWFao6AWBNhhzvl8CikDto6Jlq2kOXsmt4dEOhMjjFM9Rdhevf/OHCXDUdBEJA5VP+706uEGBk+L+yRNHfvdpKeVzLz0uRiPoW7UzxfR9af+rx+y//wSIruq971bG/fNOV4+PHl0YbI6NZenpl0N3a0b1BprM0gaSRQqLQRyATaVtJRQBFAFDimyhRX3nF34NeBjbE+MW+puXwz7BPDSaw3dieY1EiDE2qukqTBRAUQJKgAlRYFFSsbw62e/0sy1UxNjPfUlcsj6WNe5NHRlrNX/q7b7n9x2+7Zvb3/vSptU1EhagaoIv+JQ4EIJjkv6owsBVXhLAxHLyvwpjJnOO3JNHLUrvCKBdtw2SsogevtVocKf76hT5QpYbs9rR2fZIkftwod7ugpiNGaVTCtaZDRQQApBhvRHbPO0cOm8ZoD7sNT+COyQzVtk97rWnl5JJY/OyCHno1hQAT29dKyDoK/D7e68oYptzfxH0i+FI+Tqax9Q+IyqMASAqQGACo2ftokVt0FZf94SSZzuvJWf7cih14gfz+QAQIffP8hwS/R24A95rhfbDbw8EFGfpthRSwM1llxTheCQlRmT3n4fyr6eIQAmpkSYNmv7FTLUlux0S7I4uMvy/wbIp843GUEkXH4z2iTsGsUOgqMk5Lr6ev1e6N+0A6er62NTEUyVgymXugpkuDiHLiMoG3XrPwHafPdj/xF19/5TvuvWV2Zma2jVpThyiDze2imxdQKIVGphLzCbllHUDGTHnZJyuxIu/GZj6udAZISBRFKhRpIDmNR3QS8aXVUdCeI4/Ggb81+X3a0nci5w3Je/l1RNxIgIGst0TQcrSG+KoyYu4izzFyClOkqvEdCI12BQkiQgIJEdBA62LlXG9nMNCt6cl2Y2Guk77mwWN3n1gY+dXF2c57Mv3ln/mzp872SGdw6ZOpBQ2okFAhAYJGAo1c4RStxW9ltGADsZ6HoaqW74wKy3zq1QRb4cWIVBe74TGFUD0I+dexYKCLlIECxz2CH6TYN8Cc+UC+CKZbVHike3x3NR0lqiMADjU5A1pJQcMqp1f4ggKA9ncZ0zxfqkLAK9TQ8P4xdB7QHqMZdh06XMGKPJOoq6ajSWKpc3oZ7Ql07odfzg9QiqCDoUB/5W1wz1Y1XSTaTY2Sx/d6ep4dSpyye+exU8evA8GNq+4fi1+5KaCmo0cGBFAIQDtZUfxvKoFWP9Pfe9dN00uLMy1sNxsjL5wdqM2tvJdnlOmCVJJSEsNaIfEZHb33786L2/bZuGo8u1+KL4LtrYYRfaZqtaa682DqxhdRVT/WroyOABIkCIgNbOQEutct+lmvl+V96szMYGt2qo133zwz32jCd5Gi5Pc+mrz3C19efwYxQWMEX6rJAS2HISkABE3APyRSpzLqLlAndHpC9dY7o1FQKbQPuAuSLOWvjYDcqof+Ij7hMCqNzpWkrQGAmkJKsd4fcigpTZts8msg1C5jKXulkBA1aCAyYXochidr+pjrwUHYVrGU+qWjIDMvuvBmX/+aiUx9W27Dm964U4RIQkl0NUbKBUIetBUfgRxuSpwGwe+urQXeUSTD7ghIYPLoEmf/JbczDhCMVuAuQute4YWfAmWMRN/8nvup4jCRE9v8d6xLLjOxUSZsXABnIXJJiwiASFMpHLSmi0oEmhEl5gIvGcNa564CtfOl2xMYdui1TntppEFSxH0uQbnj2BDgDZJXl8dv70UQublMT8i86OMT+HhNlyappAG6GMCXnl3f+Y/vf+qXT53rf7bXveJXHr9r/urJiRbkWrURMtjcynq6yAvQpDAhRIUsXoF5384Iz7Dk+d7zNYpWZT4MGbzKzcAUaBFW3rJ8lmWQAGKDfSiaFkffuGZiPUAeWWiYs1B3gjyOHouQOZc3SfZt5y8vGi5ZPLov0y0T7pMphJRA6UQlpIG2d/I+UQ+0htb4SIK33TA1OTXV+L4rlkYe/E/vf+at/+2P/seTdjsAkr4U8wKwLBYxTGb5Z63VnOf8AOieq9i9L2W21WEhjF4JnqpVhm02B3uCn6vldOm659s4HiXBu/605AkLUYQAWoQ4k4gJcFI8lObn9U3WdGlTHQFwSClQ3Ai0NYBNlh5XsgfAoPDxIlrGKF/cGDyFxQPjViJ5oBW4e/f4YqhKuNVbqI8i7clJVDELcDfLyV50HjwqATJzQF4faAIYzEtpV9Z0YKkSKD3P60PCygal8lL8p8oNWdGNPOi7GsLH55EVvaZLg4rc7AlXKsWnnl3vbW3n7x9J6ft0kf/EXbcsXjM3Nao6rUb73Gqvsb6ue71e3s8L0EkDU94KY7B42SvPjjIIvz/RJiAtyffnwZ2BoXSBWnJ7viKyvwCDo/GcOw+KG1dcLO+nEEGlSaI1UJ5TvrGZ7fQyne9MNtrHF9rpjVdONkaa6WsAkvd8w+tu/P5rjk/8yRefXesiKgRsAOlLLy9A2sBOu4PtVlNBugNAOWmdU4HKJtc1+SuscR59w1h+6RpUPQvBEEiVV4kO43Pn/9XvxlMBxPxSF6maLmlKa944nJTlfVveBTQRFWTrxhLXAyQkQO2gP7m/KCpVHe5zY0vd7c+vVkpLZn6AXvq82OUF20HyYgDmgBgiyKEAu08jXYKdcCaPgcFIHeqLABU3r+kIEAEAISjDFWZFtnkAXJJ28n8AAJD3SyMh5/rFwLsTczyb7KI1AMjNhKYH6UGyd0R2SQgeNYnl0Bfe9t4k7vkCfTs1vThyTKOR83G7v1yCmWwMlpWApTwq5BLrez4Ue4idaPRezAAxRdcAwGYgQK/CGg8UGBDLRVNFVSsQJR+F8hHN+HgZQK6dDVGrmi5N0tpsBzizug2/9aFn/+Pp9e6pr9so/smr7z3+0GXLo+ncXJogpO2zWZ73M8pIISYKlY8wBHDBTWRXbQEoSQNKltSz14GXdNIDS74Vi0bJ3+yZFXoD74E2KgP6ZuDVGp95PTTlvb1kKxxJfYXDwwh95Lj9rNIYL9mSpV02FIzFA9D85aAo2yz68unlnQQAAJdbAUABKkSVUEKadJYXxcYm9BsK1dxEUy3Pjqo3PnriNYtz7X+/PNP4sTuvmf8vRHoNMcEkbWCRX0LRAKhMYigFoFKCRgLQUKgyAiANmhQpUiw+EUC7/SqgDEDgv377vPmZ+CWZE7/Y5Tyo3xDa4HZQof7qfvFxXi8838XOMsHmti34dgjAeb4MW7saGXUgYU2VVEcAXCJEToBJq0MuoTFVY4gvVkyUAOvheuYuN3JW1ZDGcUcIgLVgqykkAgAtA/zNNEDp3ByyjW847dONM7wZQhgBIEdrcIS98xTUdJCoSiqR+KlqLTkgUAxLPYFDndAjAqyPVshUHC4mKwdd1Qjhxa8ANV0KRKQpUQk+c2orf/rk5gfe/Opr/mGR0U8+cNf8Y8cXR9pT060kSZLxjY1ssNnL+lmmM6VAqQQUpzBl0TqcHavjT7DUgkrH/fm9j+2fm+OWVXJajsuDFnLmlmf47mBZlW/EfWfDBh6mpvOX8m0RIWlggppUrgvdHxTZ6ZWe7m7ljcX5TntptqUevnP+mpaCHx/tNOcfu+vEbyxMt585vboDiAkSFZeAADA68E43X1td72/0Mz0+Pt6E+dn2yMq5AW7t5N1CE6kUbUkXEzpLBGSqXBCFQfdMFlIi/04c9lhRBDaV+GufusRw9tm9gwBmKC1GNYBbk6e0hoYOMxEggELiPc+RQWyNCjQVfCvEBnk9UNQqlch5WdrZxU/UTTXNPKptYH/26FdEA0TZrXnflAs+CASoLDksTgIHN1h0VnaKXK+7WhWv6dIlAoDTK+v0ljfcrIlAG/4z3nVmGUb3kYRrxu+jdscIeDGPMgI5K8zflaRnAKwfiNF99mih4F3uyFn9/NtOBARAJIWmnAXUfHyxib2SpEhm6rbcZexv/6zDS1k2soYvPT3CQ4gssaSw5ZgmKJcedKKZ5b68N7urvPx1tzeDsX/4QuO5JDKBBQQcR2D8RzX7HR0qdEGIDURUOD/d/uTqZv8ffOX05rc8cu/y37jjhtnjM/Nt1eok7eK0po3NIs8LKFIiSlNIrVcaeS8yuhJrAM7wL+2zl5aT9aYyf6Job/swugz3EYNmfF1ohLOa67IDiVwBZpxulrijYYwCBM4JIq87lYC8yIr3szkMh2D1xicw9nUUnLpEQh54pQxM9ToAsVyI6wlQASYAijTovKBiq1uQWumpfpY2RkdTvPuWuStnpjo/cnxp9JHf/9hzP/PBT5/86MlzO5SoBAttQIDFqVk8tbZyCGe+AgCC02e6z33uz9bed/nSxDded8V4c2a2o3RB7WyQ570MMl1AAQklqEAZJjRmvxF+cZQJyNQUwJLaKdYUszX5B8geiMjUIvlYCTy/oOc9cFeH70JQAkrzwBcAQ55XRdxTTTXVEQCXACFC4sKKwzMQCou9aXjb/ePpAGzXCEW2CmSvujtCeVGPfAnBWWQtVY5TCrpDuH7V9NKpImYfo2U0gqF278/x5e5MXOpNanRBC3HOKBwlM6teqg8+8eMrHxVE7te+ybHNeY1kH/3GUQWlPsrAac2HR4+IMkqTNp5Z7cPpjz/71G03LLxzfSf/Sj+j77vrptkr56baeCxNOu1zg8b6Wn9nkGVZnus8SVVqc47xfkRjqgqUy8vIUJ6WXQS7jM9f87ISRhI9Mun3RcPmcgg4A2MbxrdR1T7ETco9AQCANrPXfuVJAkoDUJ5TcW5jsL25M0hnZpojs9Pt5JbrpiYmxhtvGhtpzDeb6ds/9JlTH3ru9GZutpZqOpzGPwBRn5Kkgy+c3tn84CdP/7NWsznZHdDrrzw+MjIz00oShPHVjay3tZP3iwIKxQa+AoUWcMGqhyaYLngGJKx/8GX9YoN/3xTiXedJLLvRzrnY6D+Uj7Sml4lSxEpZU9MBpzRtGxzcanLIm+6QfAyAP+2Naok1U7j6uNPcH4Cok2vPomyH5UUpviHZiqvOz+TtIYdyeoeaGIkQoA6BReerAgST31CEsCBv8ibUdd30o0nSw2KqACDzl634C5bXGBxDG+7H9a29i8j3Jc08tAqA9F6xNwnE+up2n/IU8MqjiOG2vgGbqJcQhQ7I1QyiT1bTRSHHLzpQBA2jIfn4EggSgZX4ASq8ltyEovd8vtrLU3JfytvZ9s7E4nrsLJYdS0d1LRiIIp9PxZeoKN2hpkuY8qJHiWojYgOJsrXrr57596vr/afOrvV/7NH7jj9w9bEJ1W410wT0yLm1fGeQY14Q6FRhogCBzPoMYAIC0HvdnYUEXjD6KD4C5eeW00uwJAIrYX6SJrtNheTaCwDY1Wr3Xlffq5ToKGYIDbHM4xehLuX6dNNbwM9cJQl8HI/TjcjoQM6OEx+UP5f/HD4/gpnE9h4mmQcQEmgCygrIN7byPmKvNT3RSk4sjzZf0zn+0Ox0+1/OTrXe8TsfeuY/PPn02uZh3w5QFF0CADg+P/O51c38W0+u9P7e4w8s/YN7b55aml/oqLSJnfy0pp0e9XWBBSpSymXMss+cwOYQAqE/8/fKx+x3zJoEMIwqa2GEPIb+hTnODzVI8eDnRZCyKwzjAh+vy4zBOozVLHjOcfWaWn7XJKiOADjUZBcWhCARjyeTFgBJGc/PfjI8V8LVpWV275Gha49CXvnuzr/L+FIkn+XEG2cvtuOaLinC+I2zzodpcMP4RRhyxNoYU/kaz+J7TLUgFhUF53qYgAJ+rumgUpkLZMATu5TKuZ8viqzaB2P6v7EhU9NRo0L3CABAqSYCFJubm9n7NrfzM/0M3vX4ffDolYudxvJ8O221cHxtfdDf6heDoiBtzX4w2w+N3DXGqXKGkIrkbqlq3gWhWObvp3NhoLs+Xh4KRse2ZgkB9K2FqSdIQg3EOJ48hklCBpQBhG5fZ4NBP+8NdHtupt1cmuuo0TsXrxlpJT+Zpkmn8eFn/93nvnhmDVEhQAOIDmeFgCTpoNYEz50598Kd1594504vO0tEb7/jxqnlqckmIsDIubU8XdvKu3lBGgFAISqzp7bMJ8EmQZLfunyKCAb5emkUgkfx10+VLfc28GsAoKaQ0pohDifleY8QEwQCjUSgyCGLDk/n1GJonZzS4cOIOieyYdw73H/PxLFpvLsf3BVBJluWVSSEpbuXX9QY3fYNZI/gzgVBCwCu3JD9RQbh5H3ddvU0bl/13KnThNgouw1qusSJQTGTFIO4kLLdwGd+h/xHfhr4AJbY40IhV0u/qZlIPBGiCeQmhj+GsgOrSfhMAOgDFYJIllpOX1wSSKP1pts6y8gZT4z4qdgu7xTK6mcpAVJ2LIUAFgUNOYcF66DDCp0GtaOZeyOZ6nmauFgGbx9FjgGo1caatB4QYgNPnu3SRz598tOrm4O/9cKp7W/76oeO/d37bpyaWlwcwVaatGmlB5s7WS8rdJEmKkkUKHBpyJFhewC5JToUiEKUSi4NBbb/Q17GkmjL3lOAsA8MuvAeUudwpYjZhxhbsd1Vaive8T1d1n4Js/GNQ0MPxecirisiFyoZwYBQgS4KXcnqgAweaEIqNOjt7aIP2EOtqTE+0oB7b5tbnphq/8wVy2NPvOHBK3+ISD+JqDBJ2lgUvUMnAoqiSwpdBMvOTVcvvXdtO3v23PqxH3/i3rnblmbb2Ez7rSwvis0u9IsCNCkilUAKrOkiOK87go9kBQiXcHA4vs82gcOqAQhd2JxwV4jjUsPwoE/8mP0VUR9G7SEiQh8ka8410hHM8p1D9zxruvBURwBcCkRm4xdvh+eD9k8AMnOJHENVxnEV4ghDjkFZEpX6qnhLpdXqvIgXNg8MAP9zLY4tztaW/1EmBGV/PMNUkgMGSnbX8PZyod7XWPZg9fJJMYtfujuhpgtAUq5KoceihyraCldRpcHg375UYVX2Fb6oPlz1q0hxrZXFmoAoo0bSxrPnunBu7flnVs/tvEMPehtQXP5d1187MzM50gAAbKcNVFvbWb/Iqcg1aJ8mE4CdCOwnqJa5sdEdsh+CBwliJ0G5j5c2s1yg1ivgSJAuEn4V3tYXSAy/FSqP0DYgETNuy3yCSpTShJDlVKyuDbZ7vbw5O9lqL8x21N03z44tTLT+J5Umrdc8cOXb5qc7z6ys9cEa0YdODmjyESyIarCxXfznXi9fTRX9i0fumr15djzFpblWp7GRp+ubRTcviqIAKBIFCpMh26NJPhb/SgOnZoy/pv3pu+x5CEN1HbpVcbG/wh+Jhky+XXCoppoAIAUqxY3XdGiIAIAUEBTBcyTp8fE5ZsHlqian1ZFYPXgfE4Cw0ZlEN+YWgm1ibylCuBshWPoxLLFa1U+EsKLcQx1d7Cucoj9pAZGajiAhweLsJD56z3HznsjOB1cpQ+pNJjpGmmCl+EvLXXaGoNi3Z9Kls70kGI7nnn3tk1uHiL9Uhh2vc8ECM1hRBaDGsw4KeQjV7DEGEW1CqCIIVuZJoUowiEW0Ux1lBnQQviBh7AzDE5wsdEqqVA59G5k4xfAngdyTTQSELg8ADdGEazpqlBU9SpIGFkUOf/7Uuc3/hvpXnz3V/cgbHrn8p15719Kdy/Md1RpJmmfP7SSrq/2dbp8GqFClqUrQbdD3hiyYtyFFES8cucL86HOoEEjnpjOVQMwD4O1VoWvEZ/D3SovjccHs4VwmL+ZdPiI/XicXiB3C1R9Pfk45l13XriKB/VzE8zlcf0wX4fIlQwGCJckIKg/F2Lekle71IVtbzyHBfntqGtXxpZHkjU9c9rXTU43LfvMDre/5g48+9wfPn90uEBNMkxSy/PBtCTARLE18/vQm/NEn9R/2+oO/trbRfdcbHlx64vKlUdXqNJpQdPX6tu4VhS4AABAxUQiuKKDjWCfGCYTeLVQLKa/96j4UpMLIcLdM5P1kSL41VXVkDhPPKnIRkPzMEdEFiuW1978mS3UEwKEnsrnwbJQyRpi4BwCckc/XBe1Ef/u9r+1/j6tF8B4NaTIUMd17BAbkFgne7NXPn16xWwBqOuokov8jkqYcwG6u+irEnzkwngGlBJSsoAXdV/F8fKzKm1DTQaEASQqOCZVeKOQ+8WrIH3sLqWpTQnLM7lxSqXoynlp10g+2zM01HXEqCuMJVirBz/2PtdOf+cLK73z9a647kxT6Vx+7Z/Hu2dm2mp9uJQni6Op6lvQGkOmCtEJClYAKwkwixi2rCMPnylBRWnHdi6fz6wcBys6TiErDZVWNYvnBrT2QYRs6+9O1KqljPLPJ7iHw5US5MGOSgEpUorQmvd3V/cGgX2xu5635+XbzqhMjyczYsbtbKf4sAnznRz5z5oNffOZcFzFFxDYSHb4tAUQDStM2PndqA549ufLHb3j4ym9PUvUrb3jw2ENLMx1cnmu1Gw2VnNvIunle5AVoIIWKwX8WuMHjtUa2BFWDpJH21ZARcSfiN18ZXedxKtHWt7JDEzsUeE8j2KHvxZU1HUWqAYBDTtZE0NrawLw/1eYSN1OfAIg0cTF0ALDIMnAj1xfKjgGAtxWY/ffsqRIX27Y+d4CoO20b+EylodLMmaaZoqTA4AVccFBmUUV7T9KkgdOmKcTGZYvzCEMFb02XLDlESGsAEmVwiT0f4RTgrZLIedqkbiVzpIcrcBVnuezOKFqQYENX79ov/JK3uZQnEQFpIiLQRKjdB6vpIlLZ9PD+O3T2fVg/KuQVjn1iOeiVuRCdindIhV4/r8hzotVKC561v4BfWeaCFccY8qe9A3FSFfSfL5DbNdUEAFoXZAxCxMWZ0U/nWfYt59a6P/LoPUtfdc3lEyOLC6Oq1co6Z1d6amtr0NVAhAiIieIi5ST5yhlRJD3ogk0JQDvYykZOub0A1tyqSLUZ6BPejoMQigtNLjeDnRj380iGeYtuQ4PLrkOyt7hWh1tbxLLgxobSgDQxOJrfk8j2hOJ7k2S/wBAXoAAg4BVPAYAGxCyHfHO7oCTto0qKxsRIAg/fvXjLSKf93sX5iZ+7/5YTv06UryEmiNhEosGhEwacOwsRcXqy83nE9G/1evRzX/3w8huuXh5NGu1GI6curW/0u3mRF0RAKlEJW/nyicZRJBxj4SoFCI88gRGpkl88lRM7or1BDARwdQLPjWEebEIEjYTKLgFoI9QISXE/aTqGeb516J5dTReeagDgkBOB2SSsUaieDBjHXk8jhYJD+4YFKyVUeDxQYodcdl5UtQEvEJ7WWDMIAJkk7QBKYUMpcUFNR44C1uf5AMDRowiuggSShwSIV+kS08SKYdX5MrNWdBCqEJU9GgADQFuu3v3ONb3yJJ4F1xqzz8nDR1I+eqFV9RSHSajYONnvdeGZ+I6R8QHgR0v2P+fOKBn/NdUUElFOiE08vboD//UPv/zpx+5Y+u6t7cHJxx848VevvWZmamSsiXNArVRp7PayLCuoKAoCUAgKbAJLa6hyNWBv+wd/LK/G/By6FfYxYnHdhaXdcyvtQkJZcrhdfA7EXBWAQ/zJydakN/04S9T2LbdeMPigQSlQSikgQtKkaW1t0O3udLPp6WZ7dm5MPXLv8pUT450fHm01Fh+75/JfICqeT5IGIrbwMFYIICooVQ1cW+/Db/3RF7/wxH1XfUuq6F991UPHX7O8MKYW59rNNAW1vqF7/YHOioIKpdCUCQT/9e4mZauOBbK2osWu3GMnRXnDNkME6LBcsptlfF8EBFQnfK+pRCkO0VdrOjxE6OA+CI2KAPEN4OYALOC/ZJXXAES3CGbJDPGiJeYgJ5Ii+wYDmFpim7F2TDxcL8VKsgujv1YPVwCoQCXKf6Kajg4RApw+t0Fved0NZGrfAljVh1iBJPIV0tFWcAdC4r3Q5HRQjOYCSJeQaYooi29I9dVra07BkxPFsrYCU6EZtQEehHIXJhSqxfTFJQJCUBoRCBHNgyPeXmL9PixiA6lmEnGhTAqNwXkvopy/z/wtPfJhaibznuiD9724QXiDH0F4DJFf2z1kto405x63xggBADTSuqpKTWUiGrhIACJ66sFbF3/q5Hr+2Yfuzd92182z159YaKmxMdU6d7bbOHtusN3LIQcNCAmpVKECBK6hThpM/QmXMR98BgAgtI5+X60dbCvH2cyhLiRR6hhVXhEIjvFubbnr2n9Q8QLDe3tfbOU3FN8wgNZ8eTlkTBrC25NYR+RV/pORLzEg9DwipCHzFXWgy9mqA0gaIMspz7s6R5VjoznojI8ncOu1E9Pt9MRb52caN/3F113zU8fmOh9/9vR2gZgiUX7olKxcZ5Rgg3n2+de96vK3buwUP/I1j172DTdfNdFsjWCaKN05u5ZRr0cDrVE3G9BAJESzYttcDX5/v5PzAMyxACBZkQQ/CknK5VccEsbtvbyWbUN0yIE95iznC0D5dAGAMHefvfb+12SpjgC4FMh4bIwIIRQooTV5kEONrUixZgZhWNU86tP3UTL+odIuqbLTI1UXpD9JLszljvlwBA5QuSVarJvsDyIqZZKeFDUAcFTJ60HCwWLB8ACVwpD7aA/AKTTu5PmyQScudRoiRpdY5c4ZYEBc0AJNbI+V0cOKvdX0ShIhKnLBnqyilUFQocX57CQySks0cRTjoKw47rF9s9yN5NWy/LNpoticcHon39LnzBCJVcKR1VRTQEQ5oWogosJGop45uZa/9+Rq9vmNnewnH71n/v4T861keqqtSKuR9e2i3xvoXGuiAjRxIU0EAIXSkykKow1bxvcR0RjrIPxOuiCG0rB5XXHSg21uug/tEuMDomeSJ3xNwwB8E1hfJH7EQfLfG4Pf5c/BUsxg5UohQqISopR2ejR44WRXb28XrdnZTnrLtZPj05PpmyZH04V2I/2+P/zUyQ8+c3I9R1RIpA+dolVQRs3E8CyRfvLuW058a5JAq9O87OuXlkeSmalWoiEZWVnNYTDQWUHa1FJEArMeo4FYYh3DKcyR4hzjQPzcPY7gWhn4pgwcxfoJRtytAFCzzc+XmXyARS2/a4op3QW2rOnAUyjQkcDl/ENWPD0wHl5pPZfOWxWtSOwv8gikVHfJLdhiP35pIQukkLtWnIuXNNfW4uMl29/EYHEybTTjlvoDICAkSrUS5QIMazpitDg7gY/cfQyd9eUqARCXVHZEJMpRk9khjZwZPVDFxASh6CBBtSI6ZL2laNXmOcWJPNlTbJNbZnag5/Ud1PRykM3HYLQze8hkfzZ6OpEND7DtrTpoZZTzWxJChAtwu0hmope3BE6hlJ4l4hvEQ5WJBKTF4XVSx7s+KZszt0ByvB9rzYM1DSfSGaVpE7OigC8/t5Hnhf6jje3+t5xe2fnex+5eePOdV09MHl8eTca2ipFTZ3v9je1Brz/QA6VQNdMkRSX8ESKlL8cfiu1b4OcWC0vB0L4PTxi/lMpKiAlDoPXYI0L+oghtlInfSUTcB/3wVoZQ+/EYIQYjcuesUoPuyxDtymABf10lTS+6JQXNw/SlFoRRqIgSIl3oXk8PgDJKlOpMTbWSEwuj6eP3LT0wOZr86uxU46dvv27+PwAk64iIadKALD9ceQEGRUZmOwMiEW08ft+Jf9zt5mdf+/Cxb7r1qqnxxbk0QeiPnFsfdPsDyrKCKEVMlEIEUlYq++/efItUiQl78LfiDAEFegF5HneFgAB8PhgrtM2KE0O49k5mLyECyboSNQhQk6f0UM3WmqrJlL2j6JiwLKLlD/3KRj7e2Z8vdS/QSojW1RDkLMfYRYtwaU1mjVdmY+Mx7kpVeDmCAkSFqJRSFbBHTZc6MQ6lEBQiKOYtsMa/2R1nFkn2itgl1a7dEeoE4dsor9MQm2iIVEWxDnt1lZj92fj346qw3Gq6SMQKP2kEXQJkQrTVC0vytZmAjf/h3Xv/EeuA5A+XmldyRMAukVgXx3xpQj6N4OMT/E85+qDmw5qGU24NQFRNfP70ZvHMC6t/escNJ7517Vzvc/D48e+7/caZmYnxBmiiFiSAG5uDXp7rPNekE+uAVgCc0jgwfEMP+xA+rDqMEKJm4jDL2lI3u6oO8qRL/Qox8DfsKmHahc2RpBgQy0R5MKEhSRX6UvU65ocdjUaKCiPCEEApAqJBBvmZlcH2Tle35mebraXZjnrivqXrZyabP91qtCZ6g/SfP/mVF3JERKUUan24ogGKIqM0aXEkwFM3Xb3wXb1BsaoI3nrjlRPjc9NpkigaObuqd3qDIss16BRRKeNGs6sBy34oG//R84yqXDoZK6GjsqmOTkURvQGvPNwfg2W+XKV7vlgDADXFlO5taNV0sImzhEO40AH7PoXQqMhCakqOs+gJUXHnHpJ3C97FaHu0gsk+rewxii0Fl4q7gQnJxkCP5gYsvsghpGASAJI176Txp2q+PtrENhe6rSHA4XvIgBPyBlPwWqa123i9rtAEDSCG4QEmr1WadEzxeg2MkgEw7G+5Fkw6T34dK5OHSqe6JAkBABEV2qfK5VeF9Q+ikIQljxiF2BHayiqC2HETX2pDrqTpQgCVIaLy3iEOO8SQj7Omo/9ndrvWnFfT+RPpAaEyeQEUNrtA+S+vbw+eff16/0cfuWP++qXZDrTGGs0zZ7rJ6lq32+sW/QIVmkgA5nZy0X6mUzGbvFxFZA+nO8+TxV/s51SM4Np3omMPPaDPBiNMMy/i/TF/E6FQu+od8osBEXEjIb+K71DcMcwH73W6oHKSuJCidcd9j266l/U6Bp3dGWPhotagBxlleivTShEiUHNqogl33jg7h2nzh8dHWycev+f4e4joKURExASJikMlNvKib7EmRADV+3//UP1sf5CvvfmJy7/33ptmp4/NdxQSjJxZ6+/s9IsBaa3TBJPEBAyCebAU2tp+y61nWCmfS98QLyEuQxFITnG8bZ+UwwS4HavsxFvUnEoTgAs11cRU5wC4FIhzAJigftZGHU5elZ2W7IpQUTXHvJErL4LwFLG4sUtRFI8qlVcJZ/qyPhE5uSWgUeCx2WVcZNh2l7HMY5TDxUAQoPH+xkt/TUeOBOrEsyPK4ItylQQA3hFAvJC706x6oZwXboX2yzO47hh9k1hBgME7Pc4O0JYcDjFZagQd13RRCc02SyBEW67RPHq0yUd8VT1vIqAQwaEgi9B3ITNZbocYQaDQgWdAv20kwB7kvSIxSENes+xlcU7mw5JJIlUzYU37J9K5NapS/PSTJzcA4N/9xa+68Us6y9/7+L1Lt07OdmBuppkoKEbOUR/6fRgUhS4IIElcsIw3doEls/MQhGmPvQQWxpYX7LaLGFAN5TZfKEEA8xmgNIeA552084LOhPUtLhdamLsbj3HYvMRd+5FgdDzIsv6D4O3/ICjNfxQgIjIJchFUggqBUtJEa+uDnf6gyPuZ7kxPNvCeW2enFyab3z46Csv337b8j4noeaUUqqSBusgOnfJlPjfix//k5KmrL5/++UaCo2OtxnffcNXUyMxkS2mAEVrtQ29QDIpCa7SkENAX7AlUijKJhI7xYX800AG4hXulmJNLCTGDHt01GiiJYauaakrrIj+XDllnOK9YRjCwPbHLY44XmqC587RjtLjJKxitDBHtQJDFCiiK8xH4EJQw4czUfIQHFxhhDCHEi3tNR44C48qb0/IvAFhN0FfJ8B7SkLn4SFU2dSDpR/GcL+u9G82QPVIyk0Z5wXZAmFyna5vrABENTSqCgYee+QA84mRahefdUbFviiLeQIhZrOLm0Y1FFQLeK8rXVuEB4R0dIltnB6rpgpApFWhcAPOzYx9VlL11dX3n7fffufToNcfHOktzbdVqqNGVc4NkczvrZjnmkGJqCvrYPgC8wuCZ2EvZIUDXUAHqDOCojZ0McY33XbqQn9R+Xnt+mOx2Yw31JIpmZ4wjBCDikDFEyxQf5BzJwX1tQ48+oOhPeHwQAVQCqgDSWa7zrR3q2bwFnbm5BK+9fKz5xscu+4Z2K538+tdc/Y6l2ZGPvnB2m+y++kMnRRgEAIDeb3/w6V8ijYOvffyKf3jnjTPTywujClGNrJzrQbeX9zNASFJME87xQl4EByoqCB1DZrT0KmsQfBEK5QoNnRPJxLqEi97iG0dxADXVJKhOAnhJkJ3i5D3/Vuo7+1/LltKSF1uf94Moh+Z5FdoeaZrRquWMKRy2kPltCgTW+K+0l9AuTpySh4Iea6F3VIl50oTR+5rJHIPiVSEUs8XBTJatJE4gYSUX4b2HXhOWV6XAEHQ6F3JSy5hP3QwGAF++p6aLT0Skbdi/eTqcMFLKO/coKyWq46g4LDfGNksvnFIeVnkOQFbJl4FMDxElW3bNomBBM86cCWDLHA7NwF5TTfskY1SlePbcNvzGb2984KHbl758ZqX33a998Nhfv+mamanx8SYSQVtTQb0B5RzZhwjKrewYziNWJMw5EufLDOtC6DmRHobzwTs8/BVgtxe4KR3YWdEw+Bgnc7F3CVtTqPe48VYoRGLMbljoXzitKPocccJBN7URMEysUNbr3Ego2N4EvBlIKVBpA1NNSNu9YqBXetTPdHt2qplce+Vkc36i/ab56c4VaSP9e//9Uyc/snJu59BKDgYBPvYnp5+/+sTsTxeARaOV/MAtV0+NzU62FGoaObtKtNMvBgWBBkA0+acAwD8dCNAke8rZ8O5efDJmcH/YQV32egrrCwfXEpryxn7OYC3Da6qkegvAYScT7p5IW5z49x5WijFkHFC4SytPAdIerIIUHLfRY7ub36WTYhHnhSr4CLxYV/VqbsZlEBW4XYS7jaCmS5BOrqzTN7zhZmusGUZiU98tmZZHAYTNA2LvP7dzvVYH2fngFN5b4MwqV6/a9+Q0OHvE7+0EBES7cFfPmqETtKZXhBAAUAOBRmscC61ZKPphVXFD5yeD4qt8b954kQYLy3FvR6CAgWOKBDdVHfT4K7jpU91bTTXtl4hySmxegEaSPAME79ru6ufXN4u33nzt9PG56abqdNTI2npWnFvNdgZ9PQCFqFJIVQrKhFkDgc33QyQ3N4b6B6Nazh6TWFngYQiUJtfGNhExBiGEFxh2cnYwvgblWe8ry3jQQfZalhbD1wEJUru2wcol7sp6YAmYLEsq0ZX9poyc40NJgkoBQJZT0e3RoCgGuiiws5im6eLsCDx27/Kt0Ej/5cLc2Ds/8elT/wkAVhCbSHS4qgMAMAiQIADkv/3Br/wKgIbBo1f8ozuvn51Zmh1RoGD0zGoPu309yHLKkwSSVKFCpGA3a1B1OLyDfGbuVDlNRagSyCCxGMZynBWFXvjZcOgeQ00vI6VVGVBrOizkp7UpM+UFCafGczh6aXkxSiKKvvg8Be9Y6fTXhksYuJZyseTI/KpQusDAl304NdreRy5YLEjJv7dtiOta86KvAAUAUNORIscXpDURmRy9Ak8KauJ4LygFSFPZWPeOltCw8od9coGgrwCGotIyHM1A5OQ+bi7UCNYBIQQXukGCXazIZf4KPC0RRwVhtQBOOAYlxnYBYwmrQSgvd0Wf/Jai4yIzTLmfQBZHGWVqEKCml06FzinBFmZFAR/87Mmnb75y8WdX1rIn1zezH3ngrvnbFmbbakappMiovU4F9HPKCgKNYKscm3nohTkA2DeihKBUd6pMXBIJkiLxWip3FM9He6La2LZdSP2Fr4+FgTlXAjBEt3IOy/WmtNeo4ppg7Dx9+WKupWyaSAXPrZX2UrTBQCbJMiIq0xQbKSRFgXqQQX5uPdvJc2rPTjaaM9MteN1DJ248vjjxs8vT43e9+u6rfoJocDJJUiRIQNtke4eFkqQDRdGDT33+1MrVx6ffTQPaair8J7dcNzM5NdlSmmDk3NoAt3t5X2vShQKVAoBCz0KVIBVEoBSUGocvJHAFgrfEpXzCRW3ZLcFG2mMRtaypproKwKVCNu+ns4ydildeVyzFgmCfgoG9prx+lKDjWGCFd4gR77AJL0KlVY3srWOxWB4eEABSXQOgJk9WWbzQ3e4KMOEuE6GKZCb5mg4gkXgllGcX/0+ldlLtBhgus17MGKrIpUOJLYZd+6oeFQ9Y6qS7ta+ppv1SQZxxvYkIySAv9H/d7mYrq1uDt99/+9wj118+PnL58ZHGuY08Pb3S727v5P2sT1miMElTNJEArsiKsKKClPjkjdkSRUAcgNwgb07Fbtth06UiQtG7QYK7DemgiuI1Y8/J7NtESlbpK4hAj9LH8VYmhki0cyIxdokqAWUqBBT56lq+NcjyNiU4MjXdgTtvmB5vYfI3R5pq6msevubHF6ZGvnjy3A4gNpDo8CQHzPMty6sKAWjwOx9++t8mCbYHmr7vrptmZ47Pj6qGUp1Tqz3YGeRZUVChFCqlQKH4MktLBAo+3S9hzBkiCSxIrpNrlVN/ktr4rymmtF7PDzkZpK+w+7tM8hIrt+32ebKYr/BQivWshE5HHiSHOJoegqUolicIbhF20bFRuRmLRpqmrkyOWDDjwckbuUC0YNl3oyTrpHNl3+QCVtPRIARYnJ3ER+4+5g5YLuAM+4aDTBg3YbSDG8BNkdinYt9KL49PIig9J1BKCSf9O87l4usBG+a1EIBUugA9kFAv3heXfOyxe0RWxoTqVsl5g0QYpliJqKTe+xTdYX9SPQcvN2Mno0QbylzDCqJo7JADx3I+ZAzdZx9qTtVU04shogEhtvHJZ85kAPCBx+++4slTZ3f+0dc8fuLv33791Nj0TBO11h0kgu2u7uuCCkJAUtbkUXJvM9uriKCJ0Ck/LPkBAERodjR1gDUNex0GZymyq9gJQgEA4NWWOGFyqAv56R3O7zCRstjCgBjNPAY6opZyOMGnirBoIq/3RdUR7J4Hv34RJ5LizwzkLyNIUkqVJl3kVGx388Hzp7Zhp5u3Z2c66oarx8Y6zRN/qdNOp9uNxts/9NkXPnNqdRtQJUj64JcJnJucw7PrZy1faEJU+KkvnFm55rLpf64R1Eir8YO3XDM1NjPZVIUuOisbhN1+MdCEpMkWFMLyCuGiWBxJeS+04ZJ+LfhFljQCBgHKfVrj3yZ/0FBTTZLSelG/FGj4MyyfYdsGQXqKnDGyR39YerH7ffcyv2OsO7zKDQ7Be0gxaMKvxarL9WxrqslRpIwNO+2NMCozb5ypNzoZ9BZ5YoZd4Zbpcv2/XUZb0ytP1mgm0D6LozjOZ6W+562LEA6KQaM9qMSbQ8ZH/Eeklog/QbnXXbu0KwUBADVDdLamml46EfUIcQQBciAanHzVbcvv7g6KldWt7G133DCztDjTxtFOY2RlZdBY3ch6g6zIQAEmKSQJgkKXjIMdFWzyMiAgb8bvK7SOyLgPz2GsIO1CL0XviNYQ+zfwiex5bdiiJDsqgIywPRpkw5Y09ReT3znA2CECoIm1VJQAFVrrzS3dzQa6IE0jU1Ot5PLlTuvx+5ZeN9pJZibG1Y99+HMvfOQLX1lfR0yQ6GCDAGz8MxkQwFQH+J0PP/PeZpqODvLL33b79VOTy/NtlSTUOX1OQ28AWZZTkSBgkoAKUFsAIaDF98+8uss3EleJCK4NG4ZP2GzmqvO91VSi9PAV6aipitiJyELE5AhFsKnFbOIQYfDbBbKcxypcbsqGtG3PALHMWVaR9Y9sxuo4EoD797/B74WNCqd7y97gzyQ7Y8NJIfD+NvN5GV+vGfxIkdNQ2GAj4HIYiCQCttGnxpAsEoH1XNIvmBHM+2JuyH2fJBlZzicRXcOjY/Y2NZeJY/o4CXvNvAeO2NuG7iEB2NgA5jDyz5vtjZDNIp9fJBpLMpm5ieGiisgAMwbfyIh6Emejz4DBCWL4yQhYQ8jZVUwcSiMYTE01XSAi2iHEDtrw8OevPD77zmdO9T76P702/+dP3LNw4/hUCxRggxDw3BrorCgKKlDbGce9sDQFABSZ+R1wB3yEm5s/poNSDXf2xoqILBL9IDdFDBLBRp9M3hFKKpDTofjycPGpKq0cXm/Pi+CcOJ6tFDsgoy5J3lPqYiJnFIp7E3h55T8UEQAoBQoQkBB1XkBxbrW/0+3lzdmpdvOypXZrcmzxVXNT6hcnxtVPksZ/9+TTGzuHJRJAUpI0oCgy+OTnT61cd8X8TwwK2k4b+IO3XDM+Nj2RYpbp1upGQTv9YqDBymGyafvc9xbFUyHZbzwEmeL1IoCHpErBT4uMchwsB2gCZYaWpKzpSFMaejNqOox0Pt7uwIVJ8viFpb1GRLu8G3rcR08PvcI5UuvcFkeaEI1C4t7DefJk1ZIZ81QE4vs7xY0qG9p1m0cWm3PVvdV0kQlRASrcNcVo5KhBCMMzo0p9F2pgdngY3mDosCTg6867ImLczrfFbH+zqKaazp+IugQAYLOuF91+8f4E9Nt2uvk77r5j/q4r50caS4sjaas1GF9d7/e3d7JellGmEkiUAuWKvDrjyQOyzkASrMsSuVoyl0a3zzMSTYOXIMSx8t3uOpr4JPv7ULvcnkHOYcg4g+IefFHKbBtCpRQVqPv9YjAY5BkSwdwMtOamm3jvrXNXNhrqRxqN5tjvf+yFf/2JP31hBTFBVA3QRe9Q2CF5PrB8qhAABr/1oeSXkxRHs+Ky77j7xsmJ40uNJEl7nZMrPT3IdA4FFAoJE18g0PDdng+1zDyVYV0MSoW87eo92mLItdCuqZLSas9sTYeFCECHIe8lXw8wdOsFN5Su4FyhHgmOkPMQOPcv5D40kt4pqUQSIEb3E334mrX2nEDZATzK6SQdr+YagEjbzbk0JMqgpiNF3p5WaErzeic8iQbogHeRVJrPIvqt95Y3Rdw2ASP74p7AwagefKpesE0f3pPiByxnHndc41gHhdA5xjB4LAhAaL3lrNxJY58cD1GsWDsbnOOWUfCgVLDFvdxYAJx8tnxts1ugP+EVTZkXUHigCFxUDNcvF4AUyioZmGX5gMti1VTTy0JEBSGmeHplC37nw8/87jOnep9/7lzvn77hVct/8borJ0ZmZpoKFLVzrXWvlw+IgDSBRiBUCKh8TzZAh5Ogg51U4bxwrlh2Krh5YvUXEW0joyYj9QfcHALRT8nKq0YEpLwwIIY4L/QmN0aQuQ8osCh9RZEIVEY/k90I5DCcR9kIN/4MRncDkOsSlxnlIgx2lTX9IgIqUI0UUyKkrZ28r6lLWa5bYyMNvPfmxRPj450fm5poX3/Pzcd+AECtk87gsFGCTSioD3/8+ZNr11yx+OMACibGmt9749UTzenppupmeWdjM+sN+jrTBKQUKJH7yop3n906UiWEfiz0ZpEDy4t5fv6mJfFyBLYDhNr9X9NQqpMAXhLkViHWAu3bmNCHfJXcjKHhfgFHVXEUq9aefZPDKkAMXeAVtgRcnfHkiJLV6TQBaN64SGK99VDThadQ5dvPXAqY19qBxLhAHZ51oIgUmh9wBnYA18SvSPzepdc9zpLdhrI3NwkLZ5d7WVA2RF3FOYOA+YKCtnRgY8/b11TTBSCinJKkgSdXtuD0av5cQfnbB/1s84md5W+8/srJ6anpJjbbanRjvd/a3Mz6vV7eJyBIEpWAQoWB/hMZ2w4bqwrnGjoicF79QHEZrsVQ3LZiLLvSbk2l9yS4oCwkvNF+HisSMpBQ9Z2IHsiCoS4xroEOEAEgQaVJQZbrfG1zsDPIdJFNUHtuZiS59drpiUaC30yF7rVT+Gd//uWVFwzinsJhqBAwOzGLue7ZtVohQFL89oea7x4fa1xW4PFvuunK0eZlS530lMLO6ZW+HmQ6o4KKNIEk4SzdxOAws9YQdwE6LHcIv6IHAaLzFDoT8hgUqqmmOgngJUCMKjr73xIAvwbv3vQ4tsAX3U648v5m4XQC8Og0Oc+obR8JKZEqNkDOzXs7GHuxjlhQjgFt58FizvuyUfipWJoSQUGki4Izn9YC7ygREcLplQ16yxtuNGl7PVJuNzfbgpmWf5wuRYYv0RtRhvXcNIiNOWR3Db+zbOl5Vb4yfdm2Yg4hAkcokKnha6NlkHPOi/vVdBHJPhsgQNDWa+//AZjn6p4tSG9O4FP0lZmdlxHs9RByjDtg2rOeJ4GG0NCwxdGcIYBeMHt0yYKkINx2DjRz/RkEgBB52oh+aqrp5aaiyAixiVr34QMff/rpO66f/6EzZ7sff80DJ7737jtmr5ubbWG7iSkSgc500c90pgELQACTHJA9n979qclhwaCCmC5DCF7mBhVaeNa5niKlCMQ6IoiC5iJsKDauo5foVSM3V80brw/J+eynu1WIHKAn1o8gCsnf05mIjDiLts74JLuWSZUQATxGyNf6NdL8ICilFGit+/1isLLW0xpwZGqykdx4xfjY6Osu+18WJ5Pr/+Pvqbf/vx9+9tOIiEqlqHV+oIXMysaKG1+imlDoHD7+2WfWbr3h2LflOss6b7zib1972XgyO9lOdrq6tb6dUa51gaQwAUzYRe/TAyGBjQtgPkJ+kCz/5TcSJAAAYAGOrMcTmAwulm29Ll4DADWFlJaA0JoOITnbl2TEWKkNeKFdlrBYefQljqpiMBZwCEblz8Qt4/4AwEUAiPXYVXgjQNAEua4TqB1pYt6TfOb0lIoZ4iyhFykP4/v5o9y7fB2MShh5wYCqlv6aLiqhBiIdK/BY4hmqePWi71kCnyQnlanERyV3pDRfPNTlgAuK2wlooKaaXjEiGlCattDutz7X7+v/Y7ubn1nv9n/wrlvm7rxiaaS5vDiajrSb4+fODXpb3bxf5FRQApAoUJwXGMByrzY5i530jZwX+xvU3k3i/vdDJWxhz/sN1Y7ExPbnqvSt3SlsGWqHYgsbIYQqJ2+DMG6ZRKFKUGGW63ynV/Szc10aZFl7ea7dvO7K8VanffyNOsHk6x678gdPLI5/5tlT2/lhqBDAlBccCYAIgDv/zyi8Y6KTLrzx0RNvumZ5PD2xPNpqnOmqM6u9rSLXRW5iBjAZohkDyKeFrlTkcPJPpvzEfDluQCwAFNSlAGuSlIpNQzUdOrITn1Bz9k+755S8L9KrjXbrEbv+hbcSnBLojgTWtr+dC6GL8HOZBZ07lJlNxQ5ZELizQ9jR3is0lTxq7RB2Rkl5nXP7cs1qH5Z1v/CgRk0HnFwaM/bY8iFr/aPF2tmnSe44BjPC/QnRdvYbkeBSqV05znOWlXPPlEwwZlkisqEHopwVMIBfJ7Y4GIQACAoQld1naY7akCtAQBexYfnOGRhOvtmeXGSU6Bu8DA2UeRIxJciit0rhAycYnb1vPXjhFgIRd0DgI1C4UgZ3T1aJZyYFhEbalLBrTTW97JTnfUrSFuoigy89t77T7ee/+czJrc996emtt77+kePfctdNs5OzCy1U2G3DSg92evkg11prQIAEFeceIutVNb5W88LNNtuA1woJd3H0oqdo7rnTQZrPCueHAAxF6wA45ugcEfYN4B0e/oAw7GwDJyOIghGWZEwJCgiNdwGFyw/nzgQRT25w5l1YtYDjUY3emSilEAGLQhcbW1lfKcC5mVZjeWk8+ZrXXPFVi7MjV/7n33v2H/72h57/zRfOboGtCHFolLc0UZAXGj70yeefvve2y/5mL8Nf+CtfdeU3XbE8qiCnRr+bt7Z6eb8oqCCFChWYdYS/LfLFJtEf8/kX4sfEL5HAlx6i8KlyKSEv2l/276Gmw0VpzRSXDhFBWMXPR6hGYjxSHqV2+mLuW3H18LwjIShhjsilc/f7cA/uQBB/a08qSOvEp0ebJAwkDnoTqxIbOv81MlSnxF5RcbT6Ct+CAi1T7tszDD47OYK7z4yaXhnCSvdJmWVir4xALs9bLlVEADinzr4u94gp/5YKpBDelXPGnxmcx6BrqumCUZH3CQBAqQY+fWor/8rJ9afuvWH5Hf282Bxk9G23XD8zNzPVwnYr6Zxb7TfObQ66/UGe5VoXSQppqhy6JZIEhhEAfnaEhnqJpBjGqoP+VKyvUFmDKVNZPRqitcWG/O59x63PlyqXy320ZPxSKZUkCJAVWvezYnBmTRe9gjrHFkZaxxfHcfy+xo1E6bswSdKPfvqFP/iTL53dQGwgYANI7wy99fTYLK5urVz0xTHLTcSCiQRornfa6fdMTbYvf/2Dy49cMd1SJxZHRk6vdtNzG9l2UVCByiYDsGm5nN5eEtBQ+UjDwxVPx0Y6yl0CNdUUU70F4FCT9Eqh1wj9XlSPTzv5YNHpqGAsG0Qe0A1UVwDGczkTKXImabReJihhjBwaG0CT/o4m4yxCdNLllnWfh1FtRuf98PizGfjTJKAhQCTlU+nW7H20iGBhbhIfuWdZAaCrkWwwcsNcFG6uB+l5Lznc5TZHEOi85CsyxwmYV1G09Cu72PVtjprKFSR5FF1LN660DtI6COQ8LRrMHkvmKe98sUJQ+v98BAl5AWbzUpTzpsQiS1gA0ikoDJeYglRSVkYigM8n4RGwEDgFN5ggBSBzMgI1gzHVVNMrTFpnhGi2BBDptZuunvv/vXBq58NveuKyd73m3qVb5mY6oBJMM6J2sa51PysyRDRlBdgHSiiS3Andw24fRCvLZSRZ4EvnP9LR4twr4doxTPOQFQhYSxPqGbgkceD3dBLfMxgAuModvjKJ8PXIvxECIIZQPbaqA25/KTp5hMBflYA3eOzEaqWHLxAJlAKlNemtraJ3Rg2UzqEx0WnAI/cu3DQ9nf6vl801f+mJ25d+jSh7CjHFJGlhUfQrBc9BMP4DwgSAMvjDjz31wmOvuu6vdQfFL//Fx4591WVzLaVBN3sDne/0YaDJKKhKyWSrli2dTPYksWPegUZWVNvnblmVTISjySFk8goE7oNaH67JUx0BcAkQIiTeInHSwUdrGbHApkm1w8pdGxzYF1WBlOV9seVrHBgBMq/27v0GJyRy6nqo+qnp6BFWvmQwqoLXHOwkL9uLe2RRDQ7FLPFsBKrFp6SCOSRFwT5GUtPLT6T2bgMQSi3h2pFa3Hn41MK+BM+92KW7Mj8KVTZBAFC1klDTASEiYwiiShBIb37+S2d/66+96YZc6/zd992+dOvi1IhamOs0Wk01vrbe73X7xSDLKFcJqFRUCDCdQcTZsTQ+P3oxM7qSYqOcNSQEtvghAo1x+L0rLMmKwy8PUbCokvX5pIlKtCYqcipWV/tbve28MZhtjczONtX9t87Oj7XUd460k4WvetWJX1yYbn3mzFrv0GwJIJvA0I73mdc8fN23TbbV//76+xcemJ9qquX5TmdlPUvXtopuUVCBKSQC80GqwoGr7uPOB6Y9OpgIwYUYCEugppoCSqlmjENMFJgNZt8x52w2YoXsRiLjuXdhAZbEK04Dbfv1Bgmfj65gaeUd9XYLgrd2eKEiZ6nze+/flAtXeEfwUgu5bgB5FNytLKLkATl0VNf1044unT67Tm95w02aAHyov4XKXeJz52GxF1E4K1wpKQouBw8VMIQFzpmLNpOvU3wML9oIfyrl82Hgy2zjI9+hHbitWJCd2+hSour66xeXkBlDsX88eKDW6xLiTsZ/bt7wawE1SR4KXvhbuj8lQ8VXHHCNhCff+y8hfCUFrkdhLV5rGdYDx8QVKQEAsnxAiDUf1nTxiXRhi7wgnlgY/cDJtd5fffpU9+2vf+DE119/xeTI4kJHNRrYOXO2B1vb2U5OSJgiKp6nhu3JJUW28Ttmmvt5yVNarhXscHWNyM/RIIeAX1zEb/8q3sLjKojEMsR2LmrTuPXFq1/o1yruWzhKSqBCDASEMkEEkwYG5hAw22tuLiLK9GEGL2oKsqqmEAAVKa1J9waUnVuHPqFuTU2k6sZrJ8dbI+nfmJxuXzU28tyPfOSzpz7+3NmdAjFFooNdIcCTApvM8Etf88h1fzMf6F/86keXX70820JQ2Oz2uoNeH7QuUJMihQpYBKNzJhCClMvASAFwTgCu+iJ4lpw1YG0CuU4ckq+upleM6jKAlwBZ3c+uHs6CgH3DvM4+L6PLu12z62na3UMVJ8GJ7yq7L8kvdrQicHYTf7UFAMD5eWv+PopEZm3U0gY7X9qPRycGUCtvhRYFQ18ArvoefqH3RmLV7KjplafzYaRhUi1uM+zY7tecT4+VxPw4lEioljXVdDCJSFOSNPDZ0zv5s2cGn9/eyf9xPtDb/cHxb7zm8onxsbEmKlCdVqOXbHWLQZbrvAACVIAKCZUxu4SCoaFkCVfMgWGa1X7WixdHAnkQSUH5UKAeDVX7qsGIlzTDd7ErpRsnOGrgRlQIiAklWoHSGvTmTt7r9gaDnW5zZGGx1bjmisl2q9F4dVOlzWYj+ZEPfvrUh75ycj1DTDBRLciL4XkBDgIR9SlNm2hBgCf/wuM3fsfkZOvfP37Pwi3jo02Yn9Ejq2tZb7Nb9AoinSbYQPRPVm7ZrSIs8Wm8Ogjjv/b/1zSEUqw54xBTmDCstJfeYn9+kZC1xcgdQd9dcH2wSiDKktIQSyqRfsC3Ecg4H3K+UnmRGHE8DrPmUdCP68AqssR7cskLPYShK2FNlzJROCOAbDUAWyfXHGfHhHClkGPzwHsa1uYFMX8sIXkuRjGbiHU19jj5rZIiq7tx1IhdgARuQ3n4ueqklgeAUIOtuMKJm5ALrthH5iKUsGJlZfHmNHUro5xws+9JciCLuaCL4ChXQvH3B6drxx49096xMwEiclkYx3i8eRTABc4gQuNFf2011fQyUVFkhNhEoBw+9Knnnr/nlqUfOnWu+6nH7jv+XXfdOHfN0mxHddqqdXalq86t9Xf6OWUIoFBRAtaPwKnW3YxybnTvqOBNimTnp2ji9RuXjR/dmiNdEGKhAL+I8KYxn+ndm/gE8g+/DuSBqBzilKJwfRL3FDqWH7YdTRiu7y/3Iwl6onBY8osQS6iTUBAsagQODFeACkgVBRVZTvn6Zt5TCeLMlEpPzI80Xv3AsUcnxprvmRht/uiNV8z8JgDtFLoPh4FyGzFlc1Z87n/+uju/S1Py7sfumb9lZq6jQGGne6qbZ4UuQCtCRb4QjHzK/MydHk4++sx+7+GOXxSVan1OgJpqiim92AOo6aWTnfqypHPJWsBAtEcIgG0Qaom73e+lm9by+r1EEy+0zikq/nqg1BZSKY2sNpyOPDmtLjpUeaTadzHkosguR/FbKmF8YG9erKH6Q0JW1FxY6bK/3irzTAxpuWvfohuKToS+xZpqOrhENKBEdYxfGeD06kb/11c386e3doofvf+2uTuOz7YaCzOtRiOFsfWtvL/dLzKttQbQkCillDI4F9nagIGP3Ske3iQjaXeHmC/Iy16Mn71S+lOVxuUHJs9WOvSQ+4CKxenFkvhiSmfCT0+R6ubARguAKwXYQEyLAorBgAZnT2dZtgMjC/Pt9vJ8J3n47sVb2q3kZ5KGamuE//jkl89tIyaooAEF9Q70gklUkFINRNXCE4tTv5uo5HvGx9JfeeD2mRPjky2czvTI1lZ/0O8XmdZEtlyi7AGkLPZPvHzc/xjPQwg/UfKyf9iaDh2leyVrq+kgEwIQatKUkbb7rsy2OEA0AUUeS0axnxOdlHYrWRhIb91Z/giji3wo3lcUZ8BlmFiiyj5hmpDZco10G+gsNiEy8fKA/aJirDpyu/TQ9YMIChH2mbCrpkuKHBv4rPuWtdw/dC4SlExlGQrZLWQ6ctEnopG8legKEEwUaeAeQb8yWyjfcTVPJrtxkq8g5PrrdfHeg0UIgKAsF4H/iy53PivbrpIJ+L9xhRXhZrRv2TMYchkrdU4kQ+iXdJ4e59Zn6YhszYhS4hEQJhUAHooLACDPm0TQSJsYX19TTQeBCt2lFBtYQA5PPbvZ0/r531pdy77ywqnt737s7oWvv+O6yanlpZFkdH0w8sLZXnerq/tFAQUSkVKakyijnwKmX+lfB3CzERFszgAQ9nmQE8T8skqWP+T6FKa6KJfE7XhZ8mae18OMV9f343ul4K3Q9dyVYYSc23YeyIZg37kYnzQnuR3LJjdmIzJY/LgwOvPlUhTKRFY22ZEqhagRdYF6Z4f6q6sDhQjNmckm3nfH/NXtkeRd4+PJVffesvAvAeAFDX1oJCOYHfDtAKZ6RROfPbkBH/708787M6F+qpHCD9150+zi/PxI2kxInT69k2cF5MomqgyiFYUeEyjU4tmGawY5BZ1cGQAsXrlPXNNhoToC4LCTcf5rYP+3Mf7FUlYmZ3e4LsTxIdeU1rahFEHMQxq/KIlddRECm/t+fwOCYvCgVliPGqF8pfwhHN4KQi6p8rfIc1XXS7XNVR50epWErqpHsfuxmg4MOQAALOjjwdQX01k1hVwWc06Zk6mKMaMDcWzJbgI99CeFe79qOuiE2EIABUTdI/XAcpslHrGJX3lhu/jycyufe9Wtl33X1nbv+UIf/wc3Xjs1MzXeBADsrGwkycZ21i9yXRSFNniriiZyYO36eWTdKiE2G4K84Eq07fkEyrM5HAX5ewd9SQ9w1fz0oENsG1bcdtihyoOV66NHIr0zSKiAVlxaDU1sUrChAARIiIiNFFNSCRVEtLqebw/yQs/oZmt8oon33ja3ONJJ/nGqVLM/oHd/9gtn1hCbiGoUSW8faF4nGhBiC5/88gvZXTcs/+tmM5kYG2l9/+3XT41PT7VVr5e1N7d1P9dIoAkSE5WCplxgDCBh6TEO03bNdgAJZx3or6mmV5jqMoCHmuyGTQJNRJqRQy6Nx/uevTPRbxQIRQqU1hBvu0RQOAt5J3Esahwgk+Admm4tsHfECN0WaKe0nKKbQly7zZXFQfS5TtDtotZUb3o6oiQ9JX6xZDOGbEYJnzUX+TIDEzALsX/e8XMMbLnrxHG3r4ZINAH5Rnj7EWyQi43YcX7kAG2rN/8fDLKuLSLNHGJEEm+/IiJQBOTjliI9OHgl3ztljkKe8iLZcpVgBSPFRT0VQrcDisCwmE0qhWbfKFdjsbeQ8tsCZIH5QAQI2mEd4sw+vquaLhbNzYwjUZ8Qm4jYRKLBkVsH2diypdjW7rxx8d0nV3Y++ZoHj//wq+9eum15dgRbI2mzcWZHrW4Mur1BkQEiNhqYOpM6tKtdhQCwh91y4MNu3DkzzeSBCIRjHYd93ySbIYQRA2I9i6ZenBlEGoXSO2+/FH+SQAQhSRwDgd33iAw8oFj73Dfs7s3jl+NwrhiyAUauSJMDR8yHBwKjvtoRIyAqAsACtUatC6Cdru7DygC0ptb0dBtvvXZ2opGo7+q004XH7l3+eUD4PFAP0qSDeXGwAS8zLxtIlG08dMcVv7o42b55sp38pasua7fmF0aaanWgVlYHO0WuiyTFFBQKNmT92Wq5HHZCKJ6FiHgEbmXaA5qcFzUAUJOktBS6XdMhor0nNPuoELk4IEuOSK3bQy7sn0uo/Ha/Fw8Zw3AFGoYOvBZzR50IyAbk786ADi1zWpjU/cpduiYV58Xu0TjVf+V9XUNXybKmg0wE4AAAsNY/AwGSZ/zDN+4bEpr4fmgoB3Kf4k3oZiutCEO5SqBTEfhbRlsRATCrjf+DTTdcOd+58/rZpdfcd0Vx7YmJU1945mwfsYmJUpAXB3uv9IUmk4W9gwqbiKjP/fGfnfq/3vKG658GTb/66F1Lt81Ot9XsdDtViRo5tz7o9bMiL3IqNAJyGHY4DQN4zBvsgSZVMaeGjxD8LaTpLmmYXzfsp9x+P2fDdzT0s1aPaLeRlKQXb58LB4NEsfLmpZdSSiEqJI20uZnv9AdFlucwOjPTUXfcMDs20k7+VqIg3djW3/vHnz+1gpgiqjaSPuB8rhpggbmzf+Hha98x2sTJNF1642UnxhozM5j2B7q1vZ33dQEFaEK0lSpEGogqJTh4hcBfuVukAIKfmmoylMZlrGo6XGTdlMpgp+zl8bCuW4ooNE2cR14WhGXpAQCgJYLtVdpydnL5xqPh3sGEAeQQKq/iD4W35+PyHN9O5F03qU44sAE8oC3R85qOEEklhjS4LBHSgbKbxDPpdl3uYzeLeLqYNoHSZnhUYPUYlmj39pQ/H4zXOl44CzsiVsyFWkxfbCIEZbdU2iAr74M3wop8/gjviTfeGplChT19IP9yJ3zMx7B4z2A8omqgAMnIXclEnnEFnIrgcgA4Fx0heZ0AweyiUVDL0oNLKmmgLjK6Yml06XX3H//+5cWR27/0/PpHXvuqy9+TJskX8qIPjbSJWX60ogHyvEvNpI2ZzgARcXFu9BOD/uDvPH9253tefe+xN91w+cTo4vxokqbpyOpar7e5PegWRJSkKlU2GxsCTyYzdTww4CsNcTSi16nimRnqUvymhCPHBjhXh0E/f/0yIisjuQbgxukUqnBMfLnPaeCvkbNeqoVOolnJICsGuEZiTfRB6/5uBPICcrKGtVFeA3mpRCQ0PwAaEbMcirX1vKfUoLMw38RrLhtvfvUjJ/5qgpi84YHL3kmU/ymiQkwaSEV2YPmcih1C7CBiE49NN59USv9Qu4PTzWby0OJ8R83PdVoq6au1tcG2zilvpJCiAoVWsQ+/c8sfLsm/4UciIs1BAvZBySfSSEcwyw923oSaXhlKa0ToMJNz+2gga7JjFAoK5hdHeqJVWq2ogEDqi/2sLl1LpdJZfh9HiQljyy8lVW0qIOqgjE3pAi/47Acj0KBBk4uSU4gqUWZHX83dR41I/K1CvKv9ILF3Qvhw7SFhiIFQgoJefOJBbuNHRX4Jj/Z0kovpi8bLRmXwuWq6qORBAJ/EEWJuEdJVOmFKWr+XyO5tcK7iEvDC0fsQ7RUBq5SFrRPsJPR99MyIsrH94f25JWOmpgNDpE1+r+nxxuIt10y95v67F645tz1/78R055qdLvyND3366RWl0iO5JWBgIx8Upnh6pUv/7Q++/Im7b116W7ebr2SvOvE/X3PZ1MRIu4lqCtpKEW73iizXVOQFFYkClYgZAhBCdPGWHXe8tGffT36/nsgrJIUzzSXjrCCGH4adK41JLi8x7mjECvnFSbZ1WmTFnVD0Fa2tYW7D4cRfJiG5JLwmgA9RITYSTDUhdHvF4PTZrs6KvDMz1UhuvHJyZCRNvqnTaEw+ds/l30akn1cqRVRNJH1w+ZyoS4gtPLm2Ax/5k1OfGR1JfrTZSH7qoXuX7p6f7SgCaPQHRau7TX2tQSsiQgWKWaHqmXstxYLSrDeQ1UgIC5bptfFfE1MNABxyIgIirQvSpIHIIdQic4iQFjIxPnnJjGDBWEnDLHp+y+gjVbdjl5JDIKt29kdDdG6qYUwZmVbEZpU9pu1OXIWNJFFKKYRC1/x9lAiBYGF2Ah+5dzlRiAoADTpm/QsKEG2GSCLSjpXChMUxr8p9dnZdDRQpV17D5d9wWpU1ElkZivNCuenC523npAk0UaEJCh5BTQeACDR70xRIbdmeZukV5kZBgDDhfmACRJGwzkSIBCYSgQunle3AsaFvHCjm5ri5xoC87MsDIvK8iRjIaSLQxgMHhJjt+d3UdFGp2xtk3UHWbXVSuP7YWJI3W1/dhMa//gtPXPc9WuefMzXJUyTKj9yiqCknVC1Esxny1AO3L/3U6vrg84/csfytt107e+3yYrsxMpq2V9f7jbOrvZ1evxiQQg0KkjQxtZWMimG81wgAYAu2USDzwUkFN4+cp9Yc9fOLwWTZ3uUJsD4bAeq5ik32V2TQS3HhsQcK5YnLL+DRZ6bSNrQAiw5BypJzxeUSkW0gGD6P35YkQeuockEVAF5vRdGeSZOm/oCy1TUNSLqzMNNOLl8ea77+4eNvanQa42957fXfOz898qnT57bB7rU/sHxu8gGkeHK1Cx/6zKk/IsTvThvqFx65e+m2qakGFrON9jkg3NosunlBRaMB6NYP6W1z6wGfQivIERWYUlhG2HMZwFqPqMlTXQbwUJNxLemCBrqgAsl7i4wiKn1EKH4oFt+uPwj2ZUUG925gkTsVLGMQBkP7FqWehnAhRueCcTAmzUizNoCAUpimKaZ5YZDW4YOu6ZIjW+tSISZo9hECQQEa2GNijfDAO8NueQ9nccS2bxYqTlIBqmQwCl23HBleTWTzAJqBABGA2WmuSV5f00UlJNA24ygZEEDIV5fsyko3ko/bGN2Vybx3kalebjNYG7fdhQNF4T9u6T2K8h7CjYn8KTxW4UGxmg4uGWB/daO3+czJjc88d2r7huumOo3rr55RYxq/qt1Qo29+7Y3fsbQw+ekXTp2jBJuYIMJA9w+sgfRyEOk+KTWCiAkSFU9ffXz6V86e7X1ucyv/8QfvWXhgebHTmJlqJ6Sps745UL1BnmkNujB5AczkMBmGg1KxZmoSOTmw+8pQcS5wgPhJyvn49v5kJf2LDzuNia1u8Fog648AUJ1rViAKsntn53vXi3+P9kXAWVKa+E6Ql0UOYY8yjtqvFUCbvVVJAokmpP6gyFdWaSfPdXt6stm4+rLx5vh467Wj7eYvaw3f8p9+78lPH4aIF6KcEBv49OntweBTL3xwpN34wXYjfdf9d8xcOz2RYqKhlQ/6+U6v6Bd2eyCDzuwAC3nN/iCyPgEKTTJXof1cjI9a0wGlugzgJUAEoEkIAKG6mR8XFgDC48O6qoRoLTmcQCqRw9TWGFHmW1kxFSHT3FogvkGnJO4arochbBBh7EIMIiq0iH3FuGu69MkY+ah4EQyyX0ReWBQciAY+AOl9QJBzoEIRqggDDQ4E1TDEMetG9tmkrYnoklig/QyooKYDQCxblXvNOSbD7MvgRK2vFF7uCaAszfhobAd4ja90YWAdBJxc1TYchMhkZv6SgMUQxGQphXnVdJCIn2A/o62t7eKFjbVBt78xaIyOISxNNdXDdy88ODrZ/LeXnRh/zz23XfZvChqsGdFy9KIBtDbhz4gKAXCgC/jD7W7x7ee2e9//qjsX3njL1ZMTly2PpBNjafrCmZ3e5nbeHWSUJYpUM8XUZWtFDPOs2bXEu1bIRfZI0yvUWwyRaBdaweHkJRYsHnrw7cjfAaURTtYNhKxFUXBdfE9558C0rEIAQPsrbGgbRyn56xF4r3/8qfy3YFdZrN4k4UEKwAQAcg26Pyiy1U0NhICdTiNdnuvgE/cu3o2g3/uX33D92xZmOh8+tXIYIgEyQkzwudM7xR9+6vk/QMR/3GnDex66a+74zEQTe13d0UDQzSijgopmgilaLtMAUqkGADb/K75rDDmwppoAagDgEiDiqGMKgvhdObMK84WkiIDAW+WVyEhmRlJ7KHIcrBwVSxmVRZBrzmvWEOPLX+AXHau2mvQ07Ea1q3vl56jpEqcyv1gFxtlkBgfjkyGHRqqZ2/7o0wFWqXAAgYmEIfSFtvtY8eEQSGd5oYcdEAEVQqKMxSkgrpouHnHwP5e18r+tauVtdZTPu/TkZZ8g1V7ZKg6rHQZ/Vo3E8Vy4VyV0J2JkDlA4C9AyJFLQUU0HjngtVgCQgB5Q3lvvQ741gJ1eTnPTzcbrHly66bJjY/90YrR5xavuvPxniPTZRpoeSRAAAIBIE2ILnz2zXXz55J//8UN3Xva2s2vdtxbFiW+7/fqp6fGJBmR5q4VKwdZ20dfabLQEFU07l7gVHHhLQQMAGT1W7cZwkIE75lEAlNa36NbP3Nh3E5KXBcE1wfonhZVw5IgOpVrIH3toDBx3EYOPDhClqua2nQEzCMRX4BsSImCaYKIJKM91sb456CJgZ3qynS7NtdQbHly+t5niLxUa/s7/9btPflypBBU2UdOAZsdncWVz5cDxOlFBiE380nMbm4McfnNmovHuidHGD99y9dTkzHQzIQWdM2sDyno00AgaE1KCZ8gmpESxVIi+3TPStfFfU0w1AHDoidyPSN9szyDL6wpjOERuY6HsUIXwaHTf6tHw39iY8r+9aEfghW+YieONLx/bQMGCFI8QwSZMqelokgepOLGwPcBQkeU3oY1VKTNx7uJQefOtwhtzhyj6jlvGPXGiNfKTxCB6RAR6dnKkZucDQibBstGrfPURawVwIKtPBGD+YwwbeXlXuRVriJjF4DrwTj/brgpeqOjGtJMBUqyUI3Byw+HZLGs6eCSyxWswfFnkmga9gta2s8FIUTTm50eSW6+aGAd94h/MTTav/cY33vjuq49PfOrJpzd2EBExSUHnB9dT+nIQUZ8waTEIcureW5bes7bV//LzZ5f/0QO3zt1wfLajRiY67XNne43V9X6v28v7ukBKE0xUQq5IwPD+AQKvawQ+Y+U8J5BRkdVwc3BdpFIJjU8uM3bbAvGNOUdJua9gt5ovYFIeh4xIkB8h2n0UfkT3nRjZF399oYQL7yrB8QQAiJDyjIpz69lOVmC7kWJzfroFj923dDup9Nf/6tfe8u2Ls6O/f/LsJhx0oItoQIiIX35+ffC+jz7771WiWkmSfP+dN8+ML7fTpCiocy4f6FyTLgqiNIEEFVglP2QktJFpFP5TEgCqqSaAGgA4/MRSlTRwSFZstpBYdURdanNWKpGyz5JkjqV8xTAg0hWHQtNhaYDAIyqaUnRNyedVtS/WueIw6q2mo0MIQGANNcEjBMZ8U9Js834JDy+Bu2ZoaszIY1J2bBiDKnC4Rj0ZfzKa3aPSQ8P7Hk01H72yvkNJktaMfJHJ1K2yJRvY7wdO0bJgEwrFP5ZPXoZJ0DMEn9CnYYlAWC4fKF09wZVS9FZIP6PLkxSOIQnD329DjoGrmg4ase9PE4EG0pQgYqqQtKZuv8jWNwc7/V4xtrAw0rzt2onx5dnWm6+Y79w4M978JwDP/ec//8rKNiIipilSfnCNpJeDqDB5EFC1kHT/1MLc5K89fXL7Ezvd/Jdff//y/bPzozg/3U4QsH2WetTt60FBoEETKkWgwpLL7reZOFbCIwbLg0+zFMxzspVmsDTfJEi9qw9G4sfWyHb6HhcHNDImVPu8PuZljdv+42WA/RShaU4BouFAAQoADicnge9O/nJefIMch1LqILk7M0KhELGhINFEepBTvr6V9QAJ5qcazbmZEXj9w8dvSZvJr/b7+V/9D7+z8TGlFCpsoaaDm/eCiAgR8eOfP/P8zVcv/PzkZPv66enON19+rJPMTzZSnevO6lbeGxSQAyEmBApLvEcAoIE4zysfJXO8BgBqkpQSxfFFNR0uQgK7HWg/5KON7f/IoC/hrkPsfgyWD3mkmp2qVEc/EHJvQrS3tCyZ3xJ1ji0sa/zXyS2PKqH4EcoFoss15BQal3DZW2aEZksJO23dryiUuhoeCEfB5AtVsMaD8qTou7KjOgfAQSPHYsg/WC33ZIprrygbLjgf8WS5jUOJ3aWhtKy6Ro4ZgRNCe9iBJ4AFECzCwdd78x8BmjUAcMDJhKUUgGSkhkLURLS1XWyBHlCaJpOzc+302HxHte+cv3F8JPmZqYnGNQ/fsfRviOgps24ebE/py0Wk+4SYIICG//L+9U+/+TVXf+fm1uAHHrxr6bU3HZ8YWZ7vJK22Gj2zOkg3tgbdLNd5I8VUKZGdXeK45r1YhOx9AEDGNIrTpaqCw/wnHkhgo7niQoKK6coZbqh0jtWvWG2S+qDbwDCkb6kdBiN1y14oJocxWeXa6bvxHxcVIJFSZjtAvr6RdUlrSJtpc2qsDQ/dPntNv3flr37jV9/wtuW50Q8+f2anOPg5AYjMDtZ05zf/+9M/3mwm42967Nibbzg2liapahZ6h1Y28zwvqCBASBGUcvoFsa+PfDIhgPBvLcNr8lRHABxqiowdlMgtgMsCYLXQcsCVD7ZyMJAIJ4zbhneuNvdL2UeCsQpd2L7x1QJQFAzgpYavCYEA18qD2f6s2TydKsXJ0w6srK/p5SKnd6DwdRpjjXjfM9msAL6Mjo+RMQfI2nh+OrkboH8ncQEPGQSDkRUH/Eyk6HLOk8Qolr15DWQdLELg5JKICtCXbrBZwQRQhC4dEz9rv282lGyRjBqi+ZNPj+raVRsGFLBo1A1yXwxJsMRHGxxjQAAEjp6xY63LAB5UEnaWWcvtc1MAChGTRCWFRr26nnV7mW5MTzVb42MpPnDn/Im5mdb3T000r3nV7ctvTxL1QlFoQJUi6SMIAlBBiA1ETHBiLP3Is6d2/u6Zs9235Q9f9q03XzszPTneQo3Y0lRQd4cGQERag1ZIpuYaRPPRrRx8wP4SOpLTioQSJgsn2dRGvkOHJRNf53I680oVLlh+MTR/jPLlg84i8EDcF8DqlIDiAi9YMHwLDAKUVUDioRqdT+x0c2MSd2WZKkrZC762VwgQNFGgFAHmmvTGTt6jk9u0M541ZyZb+PpXLd3RaeJ7i4L++v/5209+GFUDlWqhPsAVMEx+isb/x95/x9mSZHeB+DmReV15/+qZ9n7azXTP9PR0j9WMRiNpcfotIDz8ViD4SQvoBwJhJIyQRmIFCC0S7Aex7G+BH7DsCiQhxCI3RmY0ThrXo+kx7c3zVfWq6prMjLN/RJyIE5F5y7w279ar+HbXq3szIyPj1j154pzvOXECP/Tx55565IHT39Fp4dT81930gZWlDq7Mt9tFBXq7Xw2rEiqVAShFCsl6/4BEoMDleCAbyd5XaLXmsCi2JvbzJ7x+yJODdNSBXIrag2lm4NTUsSmf4TUHQCP5K44Fzjm3F7Stjz2N671hPHtthEPhPGPmGpMkNv6ihGOJ0CFCEvsVuVd+5cih5EfyAGPRcDJ+npI2nmwwgVOLeLlS3nUN6Y84bungN+MO5PvDDFZevxfIwr1n9ySp0ckHBwAQFGLLEJ3mqELEPFctzFANCxoNN4pRUWhdVu3u6nJH3XPbwlTeyr613c5nF2bb3/+pL5z/7IXN/sSvmX6tQFSQylq4tT2CTz9x7pwi/eODQXH+0nb5F+69c/nGpcWO6rSgt7k5aG9sjHYHI12YNekqU6Zwq3hc46BLSP6FkCGPYETivDgi1AzGTZvA9lgYS2FWMqApgxth45t979OM/e2+egs7Mh6gi1n5lrxDo66AypKqza1itxxS1c2zqeX5Njz24Nod/QH9xB/8wD3feWpt5mMvnr1Cky7fZncARCI6+83vuO275qemlt/5yIm3nFrsIrby3gsv79LWTtnXGrVGsFz0ONsl/JjJ+U9g5NiwT3vCUQE/8OgS0cY51y46LlV08M17B11cITID7FGMJwrmFqOGgv0ORhRHpdxlvigb52l7+zVkuDmFzu7JDa58tftJhuvxhRAEckFMQ4ORDY5KG8dU0AVeXUgcPnX+nJEtnlxdGjb/O0bMnORbQsqLJMrhWd/RPkHkE7SNkUc+XJJwzWG0TSBf4IoBgnuL5IJWFBTRQpt9IozvMGzISwSsrNTqT7BqDb10CIUwKjgo5Vh2Qj4ex1ULhfr0Cpekdk+iOIlwmeaoKqWwpRQqtx4b7I4iOWQKAasSqu3tcreoqqqs9NTyQje78+b57sps91tW5ns3ZFn2p37uI197QimF2GohFZObLv1aQVcFIbYQoIRPPHHuxdtumP/nZzeLL713u/x7b3vj6oMnV9rZMnYyXequ3i6hqKiqCDQCKBJFjdxzSL7Wh4zEior3NkTCe+nxSLwGsMFd8ca8DUI7JJ7Q2AWsLTvjezbRlWDtKvN+nDlF3C4GG3Yu0h+yDxQHdIKPhb49ovhlxmFz3K2KDa3QTBn+paqwGgxodO7iKCtK3Z6fa+F7Hz35pk43/5eE8D/8Hz9/+VcRW5irFpZ6kuU7A0sCfOn3vvsN35a3sn/9/sfXHpiba8PObtEtK61HJVSVRg0IaLJeEW3Bf29oBKu8J/jjJrzuyJOjdP0A5QvjdZBNRG1I6Q9R53c9Jxz3HRixzc33O9zYKhhDNF/tTSyTnPpMZh5p7a9OOL5woQOqy0LARgW+2OH6r9Nn4g7GTtqzb7awmOqSbFbCRIFA178Wy/LwVmB1e4stf4hoTdGk3qWHaHkAkXDevLx0XLt9+qo/NclemFSg3TZUIaACgMoRiEY+MUelgKAc6Wp3F/paD0gXMHXyxFR+6uQ0vu9tp98yUvAvf/833vWXbjk996mvPb85sA7IsVNEvE7c1gXYLfQLv7g70le2+6O/9db7Vh+77cz01KmTM63p7SK/uDEc7WyXg6KiKiNUSoFSCtzDEzvlTDlbmye0XcKmTBMENpApBtiUam+7dM7fOIgnP44WU9QsfBHdiM+JBaE84fkp7RCQfbHNarIoRCBK6NFIMynAzK7Oggr11nY1GJW6yrNsamWhC29/cO3O0aj68W/9xnu+Y31l6tfM7gAKifREyjdRSQoVIio8sTj/+ZXl1t9dXlI//tA9SyeWFtsKEabOXxrt9gd6CAoVKlRsmyMAKLDTklmLVl3bT5MwiUgEwBGHdW00aTD7fKJd+WwTgqwCMG2lTyFYARndcQy1a1ePMY0bh/e1OLKFwoIk6ee4i1xQtL73jRiVJB3iuc07S4gmkktEmnQiAI4r3MY33mLi8K2NsBi5dFkr1nHzIYW6812zgSPry8k7G0aiObkwCt/CC74g6l2sFTmsDCAskyTH1xZGWrTbXQJNWW2TUoKIBIgKHd3qRMjs0yQDgyZ8hUH0TupgitlapzfRuwuSrpIyKPRjUECL5wDrSohHw24uYMoZIAu6rK3C22cmTCT4e1ZIOSpsKTT1KMyyJgINQBqAMpMJoFqAba1RVwWUGxujXdTQW1nutE4sd/Cb3nPjI6dXpv7D/znT/vPDD9P/9cL5K6RUhlpXx/L757oAL5y9Un74E9WvXbw8/B/OXRj9pa9/7NSffOCOubmlpS4CQBsqop1+NdQaNCCAIlDE6T9cmMml9tjn2OgQW+pFVNtnWyxYn888jn3PO44688pe4yrtsRJgrWApBH/Yhdf99eSnL+QW6K72NqL4+0izjXjutRNuHDUSCpDvLX75sboxot3i3qkttxNK+CUxnWpswEwBAqAqNej+kIrzl4qh1tBemmvh+x458UCnBf9iVJV/4qf+2+bHEBVmqo2VHk2kfGvShIh4fuMK/MZnXviluWn8gQzhex96w9LqwkJH9Ye6MypGJRFRpbW2pWjIZoeg2auSi2LX7ZqE441UBPBIgw1G0EQI40w0SxLs+ezXHXxqfNfYRUxbHxpslDZTxvsTydIbs95UMliPMaS0SuEcGzwQEvTqiw3u+2SkifmogABAmx3X/AE2UF30Lb4ieE/jzlwdDh1mO1zvgfAmOZ10KMtCuQKUqABIAzEnamoCKNKoqgLKoqDi8saIRpXunlTYWV3qwuMPrq4XRfUj7Tyf/vXPvPSzv/XEyxdNJDwDosl0lF5LmPXYLTx/cQd++cKVZx998Ka/u707enHzyvp3Pnj34pm1xS5OdfLuuQv9bGOr6BelLjWCVgpUpkAF2ffOGJN4LZ7hAxpjLhAUG3H7jQfFv2NwVR9JMAXmbTglBze0AaaGoBIqQkWIFQFtbhf9siirXNHUymIbHn/T6p3bg/J//n1ff+efW1+Z/vTLF3YIMUOiySS5eGeAL3zlwsbD95z4P+Znu7evLPb+zC2nZ7tLC51WpWlqc7vojwpdZplSCMwuO3KHACjtJpRQQyoCeKRhd58m1ERiP3F3mJBsdTO7b7XfAjqo8BxlVgE5GtZJh1tLir49hzrdtiPgJjeKlLafXmTFGW9QmttaJ81RwKICLvKtwDPHhlxH9BSnayr554TjBOuLEVVOxsmnwjn557Cnv8wgWGeJ3sxxwVZ+EVJiJPsQ/Zjq8OE10qHydXvYgwS7RlIBAioM0hgSrjWs/U4uTOYIAOIF/14YIufZLcPnI/wehR0uENRz4SgXq0eKW1CgG+V9gj6leIMfECfB2H0A3R7SrFwRoZ0IgMkGmh1wWogcPUUAVPzFcrIKaZuTkrUgRyLSFejtnWr44su7sDAo24tzbXzsoRM3Li/2fmxtdeqRxx+66e8QVWcRM8QsR6omt3jaawVDAnR4m8SLt5xZ/ofPvbj10d/z3pt+4r1vPfng8kIblsuyVZWV3toBKiqqQINGBMysEtfk6rwYWCfNxWZ5fgieUbCqxDz4bgaJHF7+V3RubyG/KrJ1SDxbadr49vzOOo7R9eD0DrcUrcUUSiIqbz9QA8cgt8dF14OwFN1nDDWZ28nA9SWz93zPiIQKASutq50hjM5eGmQV6M7ifAfe/9iZN093W/9GEf2R/+sXv/xJRJzoTACymQBEdPYb3nbbP15dnLozz/Kvu/Fkr7283GkPS10Ni1GBAKBQgUYEDT4RjcSrhARGygC4TrAvH3uQ577hcsfHUvP5uPurd1NYOYlyghieGXOVmQe8kweAGPHuCccHWPekJEjMhfKgzcsntxiAosvGd+juG47CnT3IsxH2L7IVAGBprpdk+ZrDUDP8zmTzcmqv/7JqcsJsZ/3EIe8trpOXkjTsDt7n+JgjRi9RfryEiQYCIihUpBC0OGoTvcmuPSewO4UhoAIFQFAWutzYrMrBoBpVFcysrHTxgTsXZlWu/kS311r+Pe+984O3npr74nNnr4wmed30awmioeXYFAJQ+dTzF3/9D37j3d85HJV//9EHV95800q3dePJqc7FrbJ1aWs02O2Xo6LSpSbMsgyVj6tQ9Pwd/vmKycS4p4P3vdfXeJDMBLmlbagpDqeR9hsbRlGl8cNh7l4hISICEaiyourydtEvNGmV5731lR686+H1O3d2in/yu95167evLvU+d/5SnxBbyPUfJg1Z1gbENp5anXpqupf9tbmZ1r9YWzr90OJcBwaDqjMaleWopLIodUmIoAGIZNAjOf8JEXKkJBVHGYikEEmBq/UBLrBpEgDQbwVKQltHVp2v9Or3kSXxWywZsxcIVhfdvOZauj4cWW3/RdFbxHQj2iCa2/jVjS5wotBmBhAYRt3XOzYDJATQMXOdcCxAhHDu4hZ9y/vv1mDlX0RYzE5nhFYQ62wAWQE1vh0bzSJ668MS5l+3d7N/Rgjl4yV3OYbaK9PeEA9MQtgyRsaYx1rN5IRrAiMnSK7Wii2yYjQP2USPYN0rX8eFAUie81EvoTw9mwlCSpyxT6zf7WEvv1JGZCww2hPAdRiahMiK2kggp2lxiQqj30eH+3slvG6wvJRSyDoDkFf+g7YLgu0szeUpyK0KACBNSmmlCWlUgb64WQzKijoL87m669bZqfmF9n9/44npez803/1bH/7Ui//lS89uDlBlSMe2LoAmxMwUZ1ue+vXnX77yrWfP3/B9v/tdZ/7o3TfPd1bbHaUy6p0nDTt9PagINGgEZagDS6s5NkA83/atTFKTc0/Nna7Ty9I+89VHxK0ifg9rWQdhlRBi3cRVTNAdDNrLEaEoeUsArpZBfSJrmhGFEkW3st/pJwSNVt+aMy7j1FqAKPe/MMarQkDKQFUa9O6AiouXizzLsLU414avf+zkI3lO/xKQ/vTPfuipTyHmmGfTWFY7EyfbZTkkxDaevbgNv/HZ6jNry52/f/PJmZ948K7FpYXZtipGVe/i5qh/ZaRH/EdHVGA3CQSWlzyfxrKcvM+X8PojT1JwHQBBuWSfYD1X0MZ79Psg4l0PcMXeLsrefdSvdS6T+LVnHzZPlVV/pakqNVUHGVvC9QbvPMm4qJMQbPanRb0lPKjUH2JE5PuWwLghcdVu3tgXmQ1IuMYw0uTdams4e74mytvgy/hbj83kw6Ae16uH1/aSEe8khKb7fteZdtagbh9oqAnXDIiQKYW5ctFSAgBtPbC688iEqAINKgOl0KyZ3tktB4N+MRoMVW9tfap90/qUmm217p3Osx9utbPZLFf/4QtfPbeDmCNiBloPj50ZSVRRnrfx7MUdOntx9zmE6u8r0NlweOr333rjwvTKYhfb3dbUhUvDfHNr1C9GusiUUnmOuWJfGq1ji76Yn6geuqeWqE0Jh/wGMHi1d6zen2m6iWcSm7IRmod1wME2DatJlMNLCFni7Z/SpPdDBgBQaaoubw37o7LUJ9e6nfWVLr77zetv3N4pf+h9b735zxCVTyG2ELGDnPExSSAakVIZvnxxGz7+uZc/tLYw/c+67fx/fOCuxdlTa1lellc6Ozv9XdKoWaiUiwwaJOc/gZHTGIM44YjALO5TpHg5KpO/zPoLlwcJyVfHC8JJfjfaiFN21dH9ea/YWa/4zWo8k2xZX57YZEBMuEQu88DtVmTXppGItsZ9BKM3eQNkY6WaCEqtR2WhS6W6e88WCdclVpfn8PE3n1TAURYb0uB1zuaB0Kh5QSYHDiz8TsS8XhJ81DWaOmXtDM49dDwcgB1CFOIR2QFC9uXSa1vNGHNb1CuK8SZcC1gKQAfEkiADOHkDOGxHJlJFxNF/JhEsXFTGxavs4ToB6tojQqDBRShfRghjN8Kl6bolCSb2izasx9HgIF+F1+6a6HHr6v9yCa8tzHemECFHbJnNHGxRYEF8IiAQuq1GCdAsSucSAYgACgg1EGpNentbD+nsLiwt6PbibBfe+sbV26amsh+a6mWrD9+z/r8CZJeISsizDpbV5DlLrzXKckSIbQQo4Fd/6+UnH7hj6XvOX+x/5gNvv+mvvOm+tZNz8z0AzNpVofXWcFSAdpVCwDG7qIx+sPOHyWjkWhxg5wW0FpZ9WtHPKcFGAcErimw6fsEzm53POFqPfI056+hB4tZcW8dcZIlP7jyKGskxhHOhhC9vw9Ykhu3cnMpztJxs+aMiqyo7l7sNA1z2KX8mhaCISBelLq/saMovgVKq01pZ7OI3PHb66zLM/tf3PXLznwDA5wAKyPMOluXkybXWFSEq/PTvnD/7xjtP/vDMbOfM2urMH7vxxBQuzI5aW1ujbqFBg7bfP/EyrmRDJIRINQCOPKx6Yw/GGZoR9qST9z61rwaUTG3kpLtJYL8+AlqhzkTsyVP7tbhAQFBpKitN2jlkCccIgeujvXsF7Pz77SYCo8X+2iPI0Yzmk96Z27+H8ApLpBlDTyEiXtjYIZXlSZCvKbyTblxnCtQRAjjONRChmjzVreF9daNkPqWYOJW5d4yu6SjtG0vzLRP9NOmwBIBCyJTKM1S+8GgA78iZd/zLaUhAJMgVKCKgoqDi0sXBaLhbdas1mJqf7+KD9yydyDP4K522Wmq3sh/98jMXz13cGsIkV1F/LcG7IphdEvS5YqT/t6KArd0R/Y377l69eXG+o9bXZrq99jDf3h4N+6NyVBBQlmGWKVSZ2TkUTaV38PabyeSkJpuHHd260984wvBtzRiT+qjZUovvE98NI50m5WtvfTR+3M6MlU2Ew+/mSUDPaYixUHCNgUJAUKBIA5Slri5vjnbLUndPrfY6N56cUe979OQ7NraG379xZfD//fLzly9tbY9AYQv1BNYE4KKAClpXfvnjL/7ADacW39h6c+uBudkerq/p2csbgwFURFRR8HwnJEjkuL/5kTCxYOcfFZeSNo4DspYEuY6ZQ0cBaYzW2XAML/pokrVqQ0UeGMH+KEejULYSTQztHcS6yDHUfBH64wJiJRiw0kd/iatSZZZ280U+fJVwnMCFrlCLtYNC2Iz1YIlxcPJBkexxYIRFqGaz2PYuBEMA/rHjJZhonHl5MW/NY/5xVeQsMUHIMWUvt6sL0ylNaxLA6SKEZOqP2NRdtwcAEhGvgLXhV3uhM16BXFTNaTQrHi6YH9vswQ4sXt4CkbSlLdg+ljUpzGn7ALgMGGEwC2fR02coxo8AgEWiASYV9htD5Kwhc9R5lQhulyAAICFhLkEQvfCYXDoEUqCoUtVgoEfnLwywrKA7P99SD9y9tLIwm/+FEwvtu37+o/gDP/frz38KETHLMqyq40cCAABg3gIqh/CV57c2i1997t+evTz8yrtf3v1rjz508t233DjfPbGe562LoPSFUg8KKqoKKyQihZRxeoYC9vvNEy3su8Dzjtflu7wduddzYIfxc4tOhUlH2s2DVNdcTs9EXjbXawJAn+Hm/xoAfiQxJepVIYBNfWB9xeoVg37EtifgTEaeJW1aixuz0L7W5OQbuT9nZrNidEnV9nY5uNgeZZ12np9e62Xf9I5TfxBRq//04ez7Pvrp808TFNDK21iUE7g7gMpA6wL+669++clv/aY3/oUsz/7pu96ydvfi4pSqCmpnSiGiMlloIKqCJiRYpLDSkQcSP9x7VmuuEcGvgPqJmVkiEglhY278CiRNOGBje8HoTbTuKSFBA5AmIAUy0D8+TsE42HMijRVxIHhOGuRRdI7xcQLtXbLJsz+OFyIykRpekv3fs0tj+mmK60WdjkNwKdYuGdeDl3JrKnPO8d43SDgSYAIAWoioxlUNoeCV/O6xbg8gYp5hphSqstTlle3R7qioqrLqTK0sdbN7bp3vzXTV78pa2Pvmd9z0N0+vTX/2hXM75XHdIUAXA+MOqwy/+sKVwdaV0UevbA03dwblX3l7Bb/nthtnp1eWuqqd4czGVjG8slMOK611WVKVKZVh5mk5ZqdtFlhDUprYws8dgeA9jDs+brpzpGTT3UIqsDlN7tVF/fPIgVPYQnxoLu3b+ARY/awUqkyBqiqoyoqqy5ujPhH01pc7+Z23zHZUduYP9Au4srlN3/2ZL724M65u0LUGb8eJ2MLTJ+Y/PD/f/sG11e6P3Xfr7MLsQidvdTNQ7Qy0Bq1TTayEBqQlAEcdNgTFNX0N28/lzmWAPfzHB4H4WvMeA4Xq6FbA4K2sXG0NYxd58mYmXyhJWF91HX30dJzZ6u5tRyeymWwRd/H5LCNsuq/GLjxLuM6BcOHiFv2+999l9yMWO+CSK35tHxcn7xgIqenGRVV8dIWbmucmcJU47AqxxJHrzC7+NBFdY+SZiCwBIBf/IyfD/KzlfOeEawlixakc2em3lQBC+0N+FxUfhQMXbQv+ddWxQ9fMmdpOl4a6zEkei66oCeCOWyEicRydKrWLjrkImeuVAIh8vQJ2RExqVfHK/n4Jrx2k/HC030ZVycaH0f7wHu1eSInlAmUffrcezDLMiIDKUpebG8MBEnRXFjvZmfWZ/BveffP715anb/7ZDz/zl//LR5/5+fOX+oQqR9LlsZx4SVeE2MLzWwP4+BPnPntlUP21C5vFk+959NSfffMbltdXVqaw0xp1Se/Cdl8PS9KaNFQZqszlDqEGQ9KBp3LIBnBdRgf4R9QZSpKVlPMFf59ibrEJkl4/kBAjQRei1z8q0F8YNReGYmR6eVdd6DMCEf3nexnHnYKxyM9ixsWJdrylJfHfQ2hKiO1QNheJgJShu1QGmSKkotDlxtao327hdLfbU7fcsND+xrfjH68qGDz2wMkfBVDPTTaxVcGL5zfhE5998adPrfbelquTf+SeW2fnptZ6gCUAaSKqqEo2REKMRABcByCikogirRmh5g9HK7coagdR+yCSCeGWr2NSDwIHqTl4diDUCOemu8kPY+yclPJ0LBEKaiSFoZ3TZK24495Y8dnTB5hBAyNMdCvTtyVEc3TmXcJkIqqgBRAYuYHJ6fnWuA8QDdwrGnOudhgjOT0gzyndfHk0fDqkwCYcHVg+yi7ToEYdKF/H3/O479w4iVmGSils60pX/X41GBX9cjCqemvLvfYNJ2fU8kznbpWrf1yUNPjop178yEvnTSYA5i3QxeQVUXutQVSQyjp4fquAc7/1/LMP3n7iH+3sDl8oRvp733j34g0rMzmeWut2L22r/NLWqD8cUVkVusgyyLIMlXFwtdtbJA7aY7BkR363DWPxdOJezbwDX5Od5tmoJmOveNI6tFUIEMs6+VBWkJEqCA6mv3g6znPMy5LK0bAaXbw8REScWlnqqntvX5gGTX96tz86e+7y8Me+8tylPmKORJNHbKksB12V8OkvPL/1nkdu+cFeB+fXllp/cPnW2QwIAVuYeZFJ1kWCR57W9R1lsHIn5VShLQIAzI6awBSiiE4afWj3SnWss+8PXEtPvqLTq2TfRuEtJqqjtdRevsRv8h2HG1NxVIsDFfHEIl03TgXQLuXWRqqM8y/XwyUcHyDAyvIcvv2hdeKkGCvndqd2jl8gx8MEDcDvyIm0TTpBjovaxwpcHkBUByMYCDuH7Li5qI1zEnkzeQBEJCLtDXhXubfcc2lPwusI7zyhkAHwuwMSKOAFqXXDPXjlnXdveof8go/ScgOSv1yPMtlJymPchgDAzQeSuQBrO/PNCclsLsNF4wEAqJX06aSC52L08z9Gx1xTK2Nkoq0shcSKSSRFGVh5RwREhUppVVVQbV0p+wADIAXthek2PPbmU7fNTHX+zdJC7/v+y0ee/ldfe25jQOXxTRrR1ZAw6yFiC4mKrbtuWvq3Zy/0v/Di207/va9/6/q7bjo1lbV7Kq8Iehc3R7vDgR4CIGQKFGdrcA0bNz9xNpuM7it+gQE/uF88x/v7cr2Ir7Pk50nfT0hC2HZubvP2YG0M9a0K7HF7D7fGH8Ob+A6CY67mAdevIu7cC67c916QsW4EGpC3cCWlQBEhDYe6uHh50FeIvZNrU+rOW+dmvu6tp75z48rg6XtuXvi/AfTmJJIAVTkihS20hTif/5b33vUPbj8z9ZZTN8/eMbM6BdlMq6s6eS85/wkxUgbAdQDPE/t3YGw8DW5dQHhN/eAhlIObDeJpYa8L9np/sC5qu6kx2AAPYlkTpaMTXm8Y2dey1jliYBofUHJd6z2ENgjRWmMNg0KAsh15aa2HdxImHHUv23tQY6+oO/+N2I/qkaQpMw5RoCt40XQrT3A1C14yEo8eHHGkkXfE8ZPi2Guw8csmCLQeeflFhSrPMqU1UVFSeenycHs4LLuj5W5v5cQsvvOh9RNZrn6w0Hr0Kx/Dn/rS1y5tISrMVQuKY7hNIFV9AgBQWRtJV7tfeubSb3zzY7f8j0Dl//zut5x8x6kT063VpW6e59nMxY2RGg2roix1iYqUUta1t9sCuvqy/NgD7K8uwH/BsV/NGgC98Iyd4pqPhnNa6F+/2l/1XgpNyKstohu3knypI7zIZ/YphUohYlXpane3HJyHPmQ5TM3NtPG+uxZP7w7PfH9/VA4ubxc/e/5ynyZxxwtNBSnVRsQc7zgz98UP/UbnB8/cMPPjD73t5NT0fKszNdM6oQBAp8TYBIE8eUpHGWQDhXZdqpz7LfxE7j0NspR+pMIBQGT2y+il6CkKmboXtbX/gWnaEAvDWkeCljY3Ro5TuQVvGPbhfrS7nwl4kPKschLvYwUiUwPg6+8yJXCZOeI1/65yMkulceiId0gnIlOUmUIrAuMHgtxxGcH1/QaDMmeDBwJtoAet9IKPxjQ8XwnXGghgKqlrsrsAIJfv9pt621C7ZV2dmmPd6OOtUjW5kgLuXu6E+cUyFwgVhfpS9I1OdDlSJsle5GCi6wUNW4wosgAIwG8fbQ4WSRYnG4ioFJJSRlDt1hS8PbqvXSJ9f7RkFtkGjrz0dgABJ9eBpzgVAlYadH9XDy6pQrXyQXdxvg0P37u4rFq3/qOl2fyOh+848T91INsc6hJaeQeLCdxT/fWArkaEaJyzlbn2F3dHxbedvTD8ix94/Myfuuf2xdmTJ9pKtbLpixcH/e3t0S5q0O22alnH3z+6JJUH+BUC5I0vovpTGnAGEZ+NQVTF71rilg7ENUIY0uEPA/S+bzFHRs0a39cIBL5HZM36w/6jO2vWFwgwWs1O/cipTLXaUOYPhkioNCgE0MNhVZy/NBgSUGdxoYsPP7B2+8Xt6q9e2Cqe/uTnz37u3MVdyrM2ltVk7Qyg9YgQc3zyuUv9N9yy9J9O3zT3DSdunvvWXAHOdrOllkIYJv8/QSBlABxpWMVqzTd/jABMjn9gwtWvlq7KIXRZGNJqHBM2HBv/Pjzlz4rZT84JDeCJi8/LdO+E4wjrRTdG2M3BQJYodKfkiYPer/lJqjtpaIXcJ3cmOT0aiBx1NsB9Zom3n+UFB8ZBI/IxYRC2rF2xp74eO5K0iOqIQQGgUmi2drYEwDitNh5M9AdbBnsn0uqtVo55RkhVSeX2dtkvR9vlzk6rd/L0dPbW+1YWeln252GktjKV/S8f/9KLG4g5p8MfS5EiGlGeTeGFrSF86FMvP315o/heXdGwIvj2O25bmJubayMi9pRCLIZFqTVoItKgQCH6+sc+dZ98wAcAfAmoMK9zD43ivffgmz4s6maWVDcHmd0c67jXPfY4Rw3NyP4TF1B1TR3x5ekJlYFqK9UqNegrV4pd0qTb7Xxqcb6Db3lg9eHNneLv7A6q7zp74ZmnENVEsqFEJZmx4eavfvrsj9x559I72i3VLvvlxqAa0KSOO+HaIE9T/NGGLUOtSfOcjXYfX+BCJyinBEOMRhs/g2CGI087Xs8l7mx/ofwF8b3CCq7+jFxDxskJ7O4b/pmcsyT3yY4HjkiozCRpg70ERKQpZbYcaxCBJgIt1sI6SsgFCIAzXsS+wQAcMmA/HVhO7SvbH4A8FVwPJiKh7XsUMVZncPmF4ojknqKA/PIV5xNJcO1hv2EijTaiBAC+tqP5ilEJe5iXgHhZA2+UCv3n1va7O8X0aSAV/oZuXPIcuOgYkNTfgfIcC9mzVb1oqnNT6xVsHJvwmsLNhblCzFHZyiIUlh71WR8Upi0Bf8lgl5wLmfJBYbDBVOCKQUoBgtKqLKna7esBIUK7M5peXGjhPbcuzMAH8G/OznfueNfDN30fUfmiyZQ5viRAWe0SYgsBSnjiqUtXWh+Bf3Bpe/iV973tzPfc/4aVm5cXuzjVVb2tS/1y8/KwP6x0QajQ/O8mAQQQxTnM9iPCRvK19s3zT+RKPYhpxG0u4DSK+NrRC0fAZQr9ITKKRGKCDSm5vsm3pJpl2KDvJDEuznH/zuYEFlTBP/DncJ/e/JmCRX8A5BRi+IfgqxDN37rUqAe7enjpQj9fWe60bzk91X73W09+w6XN4jvuvmX9rwPkxSTUA1iaXcZLVy6GY1AtAF3Al76y+flf/pXn/+5MLz/54gs7nwMAUKp1TcaZMJnIg5KiCUcSxuFtpvqJfX6IY5FXGaQ6FCJK9qC3aiQjmhlit647XPk4qfu1JLxuEBIgrGAKrF9j1lifzDwigYcfPjEHuKMN1Di59TnYLrIm70I4vlfhWSZMAKzVuQ+QbenGjBJnvx/6zqbvw8ljcPEYxLQAjjkOqQjgBIMJAMhRWfffzZmSnpQuGAklJb9u2865Td6bC7WRIekzRQoygFJjNRhR8eLL/e2d7VF3/WSvdf/dizOdXv7HMMPW+x695ftOLE4/e3FzCIhtJJqs9OnXC0QF5XkHi6qAT3/p/LlzG4N/eWW3OLszrH7goftX71ldaKvlxXaeE/W2dspst9RlpUlrBSoDgOAbYPKZwuMAhzC3PBNgf+31tUgZaepduOJup9QDDKGxGxxz8gDXHwC1uoTkP1WmULVzleuK9Obl0Q7oCs7cMNO+44ap7jsePvFHXz7b/83hqPyPT7+4UV3regA15x8AqBpSpnr45FPnhg/fefLftfNMndsYbgEAVMewFkfCeOS4hwmacFTgJ3enotFveu5W9jempjZFmxr2uXLNSbRjF0WYprV1+uG44i5dkSFJyFpvnnz5WHKNRWfuUzuW144GUaGzgpJ8H1fIYmnGYNUmc9KkApDfKsgkAiJLXs15wwae1BnK9rztBwA45ttUzR09H7cnZLbC+Y1tyrI8CfI1BgFwZklAt9rjHmYvayTSbuV13TwH8GQA1dWUPCSie/JqFzuzDJZNNAGOxoVaHgNF67W8oKwQQBYcEGIb3TdhEmEL/mOwf7xzpAgBtfR85BRP48hOZksFL+p4AZc/pQAzxEwT0WBYDYEqanUwW1zuqltumGl/4D03fOvCfOfG5dnO93zic2c/9dTZ7epYZwKUQ2rnbSyqAp59eav80Cee/8WtneLcyxd2/+oj969+3d03z82eODmT964M85cuDPrb/XKoNZWESilltgkEsCSjm3rImXmsJWTUx+mn2JwDeZxEhNzMVUEdJuE1y+0Fa1mi1pNG8HrG6Je4YTgml8XpiVKjsSSXj5425zVKxmQkocTcnMvzeoOjbzphdUe8X5BdWJEryEoCKAootndouHl51FpYauFDd8+eqMoz/6isisFT//HCzyIiYtZCqiZLlittClB+6smXtq71WBImF3lykK5XhBHMQDuZ/LExPrlUl1ej03DPt/E9Q+uCnSSOo4Uj8GZzSE+E1gsCIiQC4BhjdWkWH3/opHnjDB8CU7rNb2ApY7pRGBQ9wSWjHeK5GEeliWKBnhizBIS8JnYgw/uDtX50w75uCdcEbOoiEKHmL94pKVdzTdqh8gtv4FydbIY8Z7wnt5c+L09h/f/x0ThXFdvV99sbdWFDM1+kIoATDK/EEEkxoePXNwM4lw3tSycXzP+IuTfmBvxtRKY4F1hDIESzDM82HlW6One+f2WnX3VPrE91br9prj071XnXTN76sU6e/VX8zIu/9tUXLxfHORNgVI5s7CLDp17a3v3K85u/8a6HbvjzFy8PvnNUnfm2+25fXJyZ68BKBV2lhnhltxhWmjSBNsaNtW/k/CKjN+4blDLQ9Jc+wPTi1VWzPdmYTSpIgFp/+5mX3vcPmPKDbFneNI+aE47XtH93x6Zade3JVUtqQYaYEWRQVFiduzDa1brqrZ2cUo+/aen0lZ3hD3/ju27/ChF90Xwbk7czQELCfsgTrX/EYWZhLWlUBAXWcDOkLtppwAQ5fRYy1hVf6F5DQ9KrVPIcJWLjor5KtGZKYHSHYCYRBnBgecTRCae9SRERL+72VY8JkDSAr6+ecKxgzF8CCPdMDiUbbLFsruIO7FgFTUPmDMiGSNBvzGTOOE6NZdFZHoDxU2Tvxds9E2ck2BXXbDjZ87A6P41JjicFCGB3l3BbrgM65QMur4Skx85Wp+mhRgQJF4x3LwlIImvmR2xVbBAf3D1HVyybfQcMHxN0ahYtZUZ4fDd1PyJAw3wrZHF0LrrRMy5FRIZDWZ1FfhJG2/2YXQK84FpN6WhVZQ6DUqiqiqrhiEbVVqFb+UgtQ9ZaX+zh44+cfHOvq35ipgvf+8BNS7+UAW0i5phnCoryeBIBRBUhttCuJ3/2kXvX/8HGbvHMxY3Rdz16/8ptays97PWy7otnd2FruxhUJZUaAbMMM1P7iGR0n8TS+MimC5105w9LsjGY8+z6f9ehJMLBKQ/jpkcEgNy1REx9WNNflhh3fdrRutku2t3Z6kgkimoYRIy6AJu+cjaGoDXvHoWO3NJAxoJGhCxDVWnU/aEeXd7UODVdTc3NteCxB9fu3unrf/mN77rl24noM4iIedbBMqXYJxwh5KlY2tEHp6Wad0YhmkCAoPr5VO3bDp1rbDxeR0QTQN38pMCoJNkK97is8dae3AjGQBz0MBtzEVu0RNrH4pJ4H0/IRSo+skUoSmCatEbJnEFdZoJAQQQEmYdICH55gb2mcd22POSNN+cDRq0TJgTGUDRVufdexOETZOVeJCj+5XZOhMD/rmlSKa+iFyepKKJwToLCXvwY4uP2KeHO2GuEeAFNksdJBwK0FGLWqLFktUp7Xl5Yk0uWC86kw2YNaEhWIOKWSmEGkAEQaEK6dHG4PehXnbW1qanV5Y56/M1r9/RU9cOdDH6QEH7qc09f2kBERNVF0oNjOVkTFYTZNBdIPHvrmaWfvHR5+KQu9Y+946HVuxfm2rC21O2qTKmtK+WgKKjQGjTvPGJ0QfPzHtI4sS5qUBdjCfO6fefd9AiOXBh31+b2kgx1FBN4jUeRiEqxrVX7J2cJ27duv0CU712RS/dHMjyuZotBAWYAqqSs2hng6MWXR2o4pM76cg8/8PZTbx0Oix955L6Tf5SIziK2MM+nsSx3jqUcJxw9pCKARxroXAxLAoi9m0KOUyaP+qtlYJGCmcItCyRzLWGk0+Lq/y6yIPsXDDP6zpFITB9S/5MwVECs6wp69IMj/85dxVRuMO0lHBf4LfZCF0baN35LpagcIPlK/YHjLspoOKOHH4gaZ0YccCEvrvYOsaGD8pdnDXwwGYAA6fzmTqoBMAFABFQK8kyBUnbeJNIApIm1LGdBodCF5DKlmoxocLuggI/RirO11k7gWI/WLHySpd+YJQXLjZqDXArDX8etw0RfAm1/4hslTA6YxCFQRKAAEFEBgOLdAIl5HZMXYMP+gD6qz/N4owNITq/Kc+jcKQ0Iyr2nzCRVVRp0Wehye6fo55f7GWS6Mz+dwcP3rdzaaeHf7k5lC2+9b/U/EtFTiIgqa6OesL3VXy9QtWMd0gwBYFRp/aGyrL59Z2f4Q29/84lHblyfynpT7fZL2VBdvjzcGRVVSZp0C7GtFCIa4w81gDDK+CU5nRDd1UbvnUaxR8FF9VmPxDZlEIGPv7EmFYGsfMLxyZvIElV2+xQrp05gx9yAHNkguwxaWUn1yjVOx/J2Ay8UJCvVaJe4VBr01na5C0AwN9vqnlrpwbsfWn/nhXODv/rYAyd/lKh4FjHN0wlHB/m1HkDCKwECgNX5YPSrTP3zbdhspPDa2lTrGd3A5wnON0UQsKaT43iCG22T518fSKTBo7ESm6lRfJVDc6iU2ZBLNfedcF3DMv+ICMo+Ht74CLxuEa6X55xFUpcdlycQrc0P6lWiaLqHz2S9PQS/hkYQePwcyrElXGsgglIKMpNmbeTAONm26AMiAsUUJ4Ma9aJz4MDqx1p6QWQw18+4XvaTEmIfkO+K9bsFPVLFBAftKcwJ1xxWfrQRRBWQ6eByoUVrI7gBNyVdfvNeKKPganNemUoDiC5majoxG5hipsAsxNvaHg5GRVFVi53e/GwLH7p/5YbeVPbXu718/ZH7TvwoEb2oVIaoOkj6+KZRE1WEqoUvnL1S/tuf3/jINz5287eNyvLH3/e2M+9cX51Ry4udXAFMb2wW/WFRFVVFFQBkitMBgnlOaCG3aJLJItEswsGfcl/o1o4++h3dIyoCyISpu5qNQ8FqIougNDERxdTcLCpejvlmod3qx81MhjeZjQo3b7XVekqhAtBQlLrc3qXB2Qv91oqm7KaTM+3/7l03/ZlRSdt33rj0QYU0QFRIlDaiSph85GMyuxKOGJpqTTc0EiwngFOPrANRNkXRblx/e9/PBKN8GbU4icA3lNZHE08tTsf98z04GQ5d3DfJ9TGFdOOFL0+g0aayoH0OSMh8A7EF5jnwe2OLKAMSutQTcVl4NYle7P3EvajpCn4UjCgrl6KYxPkaw2sfz+yI4+iibeR2MYFAYixIymTYNZNLTcSnE+iI2xWueYy9JcaOkYhqi3ODUVtWGai9Z3cJ1xwo/jPvY7k4LF0E0lio9eB6iu0Am2KlEAARM9SaykpXu7t6cMmw9N3FuRa+4Y6l5Xa79Wene93VDzx68we1rp5EVKiwjfqYFgcEACBdkN3ICInoiW96x81/8fIV+svvfev6t9xzy9zUDaem8m53NHP+4rC/2x8NioqqPMc8y5Ri68e7/p7wdmRAUOwf3bMfabTmsblXJs2tmdAM+9lP0ii48xjyACKtxLZsNO+64qhhiR5xr5gACO9FVB8u94lImClQWpO+tDHa1YS9M6dm87vvWJp+/PLoT371ua3/NhiMfvPFC7tlK2tjcUyzWRKODlIRwCMNAgRSctoXZqpT0NLxQKH5BNEKvEjAx3l88Zd6hFT8ihSwWGBt060Fw+pcHgwZXdG7tUqtncsmqGQt0KWt+VQt8VnchxvDRidc/zDOc87V/VwOLIlaVj78GdJOcdRfyBSBl/fQ5sWG18SWg1/84p4VEk3YJgP70KFLqDFGB+DqwkyzNZPwOsPqI5K1s3xFAKHdDFxaqlSWkvaJuB020kXzupmKTghJXm8HFG3W3gACcFXEidW0X8KFoRsZThYJEw1EAIW5FyTiw65qvDkARinKfH8/gQfv/bwaO/nupsEvXobImeUIBEoB5oAZEdJOvxqOqkE1KnVvab6d3Xv70uzCTO+PzE9319//6K3/HyL9lMIcEXtI1D+2UkekSWGGChVq0p954I4zf6bfH55vqTN/9o5bFnvz823UmroAGvr9akgaqQLQCsFWuSH7qAM0Odasf+IaYDX7sGEJpze47JtY3zRGbLz7HtAGsRzJV0hYJ+ij+7qJU8yr8hI5zuBcTLw7WxP9X8f3QbamVJ5hRgQ0GOrRpc0CpmbK2cXFDtx128Lpdz9y+m9d2Rn+5WfPPfUZxBzzvIdleXxlOGHykZYAXE+wZqjxf2J12MDHBg6zPB+/ku3Ce4X9xp2Oj0zJpYeBjj5AUEI2MzFdcpaH2buWMskWJxwfsANlHSFl7F5e28x5foJYAoCAIvMvjIS7fZAbHDwI7QjTzkt0/UkYFyOJXrPxHhSzTJgEEABookqTjZ1LT0u2IwDSSOiYVH+9i9AiRHoXYS8l6FticBBB+m1Ua++6D/rwMiqcfZFHBeJ8wpGAAgBl3T9TFIi3N/dsDsuBdQ7rs/2Yb1umUDeoo3hOdhEF22WGCjUiFqUu+4NqdGljBADQW1/qZbecmW1hhu8rgX78A2+/7S8uzXe+fHGzD7Yo3rFVfpoqyvO2JW/ag+lu9SOjoth+79uKP3vf7SurK8sd1e3i1MVLw3xrq+yPCl1mOWR5BlnNXXap//yl13dsOggOows80W3n21qmiGgpp0crP1yrZ/xdMVCfgTk7ZsBxm0aCFcgRWKIfwwcYcwKBgIbDanTpcn+kFLVXltrqsTefeOe5jf6fu/fWtb8EQLtVlTZOSZhs5KkE4FEGAgBqQ8ja/3y1J6FeMdoOzV/v/HhWoI7klQZiA39MslU0JNc3+cgUCFsXQpPZJwlI1rpJOcvomYuQ8S4ABKYglyUBmqvjJlznQJERImBIAXJUgJVdu3sf+Xdumz+wif9S5tx1jmEILA2UMove0yNuLsJksp38zYPXAKBJkyY6v5GKAF57EAeCtNZu5T+HhoTtaoNv2teY5EUk3vBmAkB4SARNNILNpo7khutXQfAW/DpWsgIsCS5WqnJfAgDgmqlW8OqkVRK7owJEyFFBBmjVB9TnXTt3k5U5cnuiCPUDwYHQs6rpVd8nuKpBinjqt9LoC7BlGSokoOFIF+cvDamqqLe62M3PnJzKP/D2U+/vduBfKNDf/l9+9akn8ixDpbqoj+nuAAAAZTmiLOug1iX8xudeevGW00vff2mz/NLw3fqDD9+3fMPsTAsAO23SQFs7xaAiokqDzgxtYOsoU5jICeA1UhB9aQCG552NSH6qgrBJ7S2rPus3uwKpMlvUbCiJ1NBN2J9QkmGJC19o1VGyksl0BCjKt9EoxxAOsk4BAAAS5LnKKw16e2u4C1TSDWdmOzffONt+5MG13/vFr2z8u/MX+x8+v7ULx7mwZcLkI2UAXA8ItgHcB1y9ylxXywsY30lThGA/49Cr/sCYjJTyfvfC6ALZowhhSS1d7XODhOsYe0U+ay0JwlRY0UeTmx4gWi8opXwvyfPnx0TdghhswuSAEAg0AH9F/G3H3zjxSX5LkX5yogfBCXEeIFCZe6uy+OQ+srNHn6FIxwNI+nSSgUAt6wg5KpJgn28uXhQ91vuiSCft5zDykEJfK1OoFAEUpS6HIz26uDGksqLe+kq3dWZ9KnvPW089RqD+l//+fXd+182nZr/41Rf6u3t+6GOAyu4tbzIBoPzF38SfKstyd3sw/IGH7lu968TytDp5Mut0Nob5pc1BfzCoRhoV5goVIqHY68HBftlI9UWc+4xGGo3j2waONIaX7dm3/aD7NuX2tRQArKnivce4N9wmmMT5paZDlWGGCFgUVbF9hfpXtkbtlRWFb7htbu39j53+wa3t4bf97Ee++gQiYp63sSwTCZAwecgTw3+UYRejat6ryTgOLsYT07OyWr+2OQFyDbSIUqKI3Acv3HzRLDdicSy4vackONokI1vuXERKs20SzQeuxjaCiepaO9Uwvwhk9q1q4qgTrnN4PggATQq9TXe1oU63z5mr5OZ8HhQHnXQKeUYAUdNC3tEFRISpxZWK5ZaCkhBzgxUPqzyOwGkIq/PTSUlPBDiOhW4ZPf/jm/jCqsILI7nbFqumQMOi95bc9n4QRuT9mn8RjfM9WllyqSvmDG/nhc3aUBa9Ign+tCRLfSV9OslAgkK5ZXDgiUTeCtCGRa1DSACAyEkmnKYtCQGnrvx37rQdShLeE0Xky6qwhHuqy92LqJVhpkipoqDy4uXhFV3B9Ppar3Pm5Kz6XV/XffvibOdflVr/0a8895VPKZWj1uWxF7xcdaDUQ3j6hc3Bf94d/vTGzvDi1k75g48/fOqtZ9Zn8qWlTlbpqqsrTWUJZalBZwqUArAzkyf2kIiCRQCicmTjHzrmB4Ri8nxAaDs6TsltKUjCZxe2qPfdvTgF965preCXMFt9t8T9hprU11ch955AtAs+F4ISpjFv9koApMy2CworUFVF1eXLo2GO1FldaON7Hjnx1q1+8fffeM+pPwyQXdG6goSESYS61gNIeKUgZfTUgdoCxEr/wK6FjAbt0ac47pOtGwzIPadzcy/fmgBcXw33jqJrRKDl3ROOH5wTREJGaquxZfvwjCe+yBkgNUlCt7ux879q10dumu1ujFASBFfbbYj3+pwJrz/GaUIACCQBkYQxi/4nOLZHR5E4HGxgvv/65WLkDX1K4tVpT0dU7PmpE64p2KtBQETliSopcTHZzixpqGEsnVWTWnkbBsVveB9iITGyF9uEABAUKswyVAoRy4LKzc3RzoULg5GuAFbPzMIDb1i54/SpmTcBABBpUNnUsRe+ohoQEVFREbx0YYd+9dMv/frPfvjpv/5Lv/H8L3756c0BEcGJlV6+vtqdnuqqjiZNRQVVqUFriuYoDDYujZLc91I4B/saxllsQRuE5jhSrCYPBBEFgkANXk0vfowxISZaIBKo3FRq3NkpBxcvDgZVQXDjqWn1tgfX3v34G9e/5Y4bFtpaV6RU59jLb8LkIceG9NeEowND8pNCJBXM1MiLQCPXhh0QV/VZOOQUNnV9iV/upGR1gwFxC+noIwCSW/NKrkgteZ3a1Am7/84BY5KaZyzijxDNNbJDHXeecD3DOkFEWJELdFmDGAkRyRbItHFYRPcY8E4B3iQOXSIbOfH3EQ8Ym7jai73Nx7FnLRFBdhtCb5zbZZpinGQ3awcEZSiAcWGZhNcXGG3NaI/aSBPyN07mW/VRJeRSE4GF6SJVIquEt6Z0qlnytbJyKr+gSDSEqATq3BnGyH5a4Nd7wssKoPlFGgCJUBPhKJEAkwp2SFy5f0dcsrYxsoSWggRf7Z0joFwKwNkDJAKvwptC24+Y3t39pBTJ6/gw+lgwt8oVKsxUDhXp7SvFcGtz1F6Z7kDWUqrby1YXFqcQgIB0mscZRBUh5vjyxX710U++9NHtK9Vzm5vFX3vPIyf/wD23zc8vLbQVad0tNVXDAsqKQIMGyBQp3iPAQLA/7muP6D5fFRdCRQHiew1+gUuVDzKVZB0qEv1CQ8a/7xBtDYqm6Q8pas8kFIBLSgmDT+A+LwU6V/Qpmot7mt18XGVARM6RUohIClRZUHFll+jyVtFttVt486mZ6fc9evqv7/aLizesL/4ckaYs62FVpV0BEiYHqQbAdYHIMHQuSczEe0fm8AgVaf34uHEF6vWq7rhn97VoKlkjnRmQZLAeZziSqdF5ofrxMB62b+8o2gnHSzj/goCw/TvbgoLLxD2TzB4NBKbx/pmrh2JxvNO1x86U9e7HkqmmQXMx2KZrLEl1kHXfCdcY3rlRwqkLXfKomt84+IvJ9wyNXz2OfRNegqIRCS1p5QsxV5kuCcpSl/3doip2Rlm/X5RVWfW9k5cIAAmiklC18OLmEH7hN5956p1vuvF7B4PyYn9Q/Kl7b587sbrcVd2p1uz5y6PR5maxU1ZQEQFlGWSgyAlI+LXuIR+SyAnajtcJe0mbIz8bP9x+HRxAjvfpY99bBO3qRRSBwK3SIwWIClSpQV/aKAZKDbrz8x18+P7l21++3P+LX/jaxq8+f3Z7Q+u0K0DCZCFPU/pRh9zCibz/IFjZUNszr8tLlB0/G/yOVSNJZtVQs/a4nAiCGL28Grg6K/I9kJlif61sLsdCPo7qx+aCpSYmS1z7wGQaKLTrpxMBcMzgxVdxfQgrIHbDSHRbDqGzSNEy/F6wXIE3fo6cTIbyzi99OqMpI8BRYbMzB6fjumudsMr4BudjegcMAQEUR0wSriXs902gwe8BYL9oofec044ApGy01aQ8kfj6bSN7lbyLIJNckIplTUbhvPbEJoYAjQT5Ehbh8hNEEQLj/ogLa7vcYDRby4NC1O2ank6YEARElN361EuI2bCSj6AzAPga+YKLwpHLSwqEEC3BHrBdXHbQaTiKJTYkWomzY8iPHDNQmVJZpgChrKAaFFU50BuXN3bJSGGSuxikC0LsIWIHiYZnH7pz/YcvXe5/fqd/5u8++tDarQsLbdBA7arQ1e4ODbTWWiOgUpQBADPRwg70BRwAXLGcMCxuDkBAUAbkDDrd46+SpI/VlG5iBlcjwGnRIOPT6zvfPTrZqS0zYKLCTvLc0/68Z8B7+Y8X7MJr7V7+RfaFMksBtAa92y+Hly4TTk+3uidWunjvnQsP33PrwmMf/+xzP4eYdvJJmCykDIDrAqwovU23/4TJzstBddJBOdOD9DHu/asENOuyAiYk4RjBOWvkCa5YEMRb5E2RqCHSMQ7Y+NK8JdFNdFLyXNbf9yRaxN4lTById1whjgF5t1iKjadVZUG/g3+v41vGwhkb5/KMp7r2FOlI5v3nsQXlzLvWAYadcI3B2qOW6eGEb6xm2h/xbhbhOddjuPxP3tUHCXiZi6lhbAgplSEqpRABQFdal0XVD3tIiEHUt4ReF1sIm/1B+VOjSg9GGj745vtXbj+x2MJOlvUuXSpaFzZGO0VVVaokyhVkXMeUt8wjpsUDW4+aVMue+oSz7pj2Gffd7T/VHtCGvQocRJqQi1IHt2nS5ghZRgoRsSqqcmdXDza3hu2VTqZuXp+ee+dDa9/zu95x61NE5ROIiG75VULCNUYiAI40OAoPmsjUdXXOv3FmkKyC57XNNhYFEFqnjrKliO11itwxrrZ5owqTbpa9wEU0WXECxDmtGL2Sa9TYrnCXEIj9s03NImZp3epqROUGmXTt8YIJeQESoRF8dFu2oTCCgyWAKKMQJLgAElEO4EvtAWva+B7tcR+XcLEvn3HpThG6u9mqBAicz8LF46y5rJPxOyEgACKyBICIQvngOhlJM9wAMwS6piytdLhFIiG56tz14DLhuDlnC42+xrid7YPIbpFiRyJYCbRRYaeizRlk6SXiihjmgyIAFGVBiCoJ44QCAYDX2fN3aPQJb1ohiEby+s5cFvQCPpLLcLXbvUFQv7t5ELzysgUHjHtpbBAT/0emp0C0s4VPUCGgUkFpuoS9QTQgxA5+8dkL/ZtOLP7H85vFU5tbox/7hsdOPra21sMMMR+WVXdrWw/KEkpNBFkGuQyyYzDlRRMfcwFu3uJzBGEyEZe6teQ2+LX/yEVNxP4DVn/KO4pberKoabEdxq0x7EdYr4CxnNfm9cgm5R1e7F/Xa2o/WM5Q4B0ylSLUCFhq0ptbo1Geqc7yTBvf8+YTbxsORz/ylvtOfBsAvoRKIWkdP0AJCa870i4A1wWao4ysbvfSNLV4o/TyD9I+BsEefdgTcQ7hmE6p9mI/yPWPew4k4bqH/N69gAWvxm1l2SA0zSI6/knwkmeNhCgKi7V622LMXnS18A4TJgRyOy1/rN7KpYvGProD1t/KQzXljUGj/QSDgvFFunBsOkLcfxK/IwOjUZTzxBrRfPjwM6XXa77b8b3EsiTlGtGs3zPZAESECJgphQpTgOqAWJ5ZRKIhoWrhs+c26ad+6Uuf/tlffuY7fuHXX/z1p17YqaamM7jx9FTnxHJ3ppOrnCrQRUllpcEyRNzTGLup9rVqAGyuy8Dqbn/9tB/CJZyyKOpY87JhMONsyxrnNbazmGqwql3sEMTESZZhhplSO7vl4OKFfp+KEm49M5M9+sYT73r43vX3nFyZA9KalGondivhmiNPLOtRBjOrqAKC38Lu/UtkozY2RwBtdCrQ+8Q0cNi1e8kpezWm1EbfCRuMUuHBO/cHMYjwA0g/LOybJKXL4TQ0x30X2o0JpU8V7GadcGzA27K7H/K8kynN50JV5H8Bl9oncgJuHhH/zs//wrwRJq35l+NkQuwofGuKU7oSlSYJE+2mTLwDgK1bkMR3YsC6CFWwcVaw7ErUNEF+T/7aIBIWxqkAKJQdsiqM7yqit8EtbeOYR+I7yBItfmw8fmvAkqBO+YVtY2qrmCyV4O+QMEHg+Q9yV/vGyE8gK97pdtIBLAehI+/5eV/tAsLNSGJHzMb1AUHslBIW73GbYtrbc5yYr3N6DwAg2gF1n0Usxx4259HWBVCIqHB1offZze3RH76wPfqHv+99N/6+W07PKEWQlcOqt7lNg1FJBWlEUJiZy3mnJi4WSsKbR54DEYLtTSFQMkbnBFNkzGnWTvioPIlfKKQUrcPtj3Mmggv4eFH2d0LfZ21JDMsvk7Ss+MRWQPzEyKxYk1IbdAA+LwABFSISqGJYjq6UVbW5nXd7c2115tT81GNvOv0Xz10cfunU6uyniSrKszaW1SgJdsI1Q2JYjzxQ262p1H60qzM7jSJ1hYHC7va5m+hr7E32A0W97HHN+M8UGtGmMc8Sfu1q0q7HDVYu0Bg2foWId5TY5AVynho4Ms27bIFwRTZN7XYBIvEO3gacVmAfQ/A8IBswcacJ1xTIWXNNX3yIIL2amtRYE+MakpZYe1fXwONGIbfA4qJuwhvbA046EUGBSftXOwe4MOEagiCWnnGtMHp1Nai7dY5sPUinMUGKvg+zC6UOJ+8UqNoTF7Yue9eXNOVZjuc3duGjv/XScxXq7+60cfrrHz35vlvXZ/MzJ3vtzkaWX7w82u2PqCgKKDMEzBQqUM5lhoaZCQAgXDdEdS326n1Tskh0cKswMiQHeUCeMuqocWJnpx6E6pTtmSoJtkoxKTiIiFhp0pevFEN1adDtTXXxTfeuPHB+o/89z7y09e0vXdi5VKVdARKuMVRaIn2UgTb6D4r3nba8pYvpGFeIALgiOoCJcrJRajW2z8qPTQinBi1fgBCmTpsLne/NM4CLwEbv9yg6aIOgPpIvrpXHxF7Fbst0NnK5wrCifeeAhOsURmR4J0hjRGi7dtsGN9FWyubYJofMwIdAwUVQeQ2ir6oNNlzlLRPnr3N5YJf+bU4i823ch+iRHz03LPYYFeWAgOc3tpM0Twjsd2y+YRTaEZk6cpahdfx5Kb1TtVagCOyeFE5HclopKzXkUvwgIrqc1WTlxO/eIgbkgl8s0+D0KgAASLVpQeAjXchjIyLOpkFE1cpbSQgnGm6LBwCna9BFZG3GEbe0IkVef5GfY6V6k06dT64SRLv1w3zB9HDu90klrAe9PUFEpG1ZDddWE1BVEZF2OeaE2Wv/57uOUFYlASgoqgI+9PHnnvrX/+nJb/8PP//UP3vy2c1hdyqD1bWuWlpo93od1YaKtC6pogo1ab8XCKd/8J4NmtMqrf1IfI5roLi5kmukRj9SMYrMPLbbvMCg1Yesh5zQeaPWnvPTNtuhzup1czVnjHLdCfKiaT+nEWCfgYL8uZwuNiYmZx8QaLT6Ev2+PQZmXFmucpVn+e6ARhcvjYZVVcHNN0y1H7p/+b133bL4AFGqAZBw7ZEyAK4HmAwAT+sLB+bQFls9wBTgarVWwCfH9OuYTvcee1OogY0SG7cChOoqxppwlGEMTIWgFJu9vBbGbWZZv4bBJH9N9sbJ6l6VsaNLmy7f6yJrXKc6LRMHNmZ9BMqROBB9x8ZAHV9twrtW8ZVOGOtVqDFutj/i7kXWamNzImISNVxcluzWSQUFv8fP/tTwJR7OTgiFyalGGQA4BIwzZJ0py3aR1kSkvdefMgAOhJW5ReRsAKLK8kEZAtBzutIfbLVwhgD/0G03L3ROn5jO2u3R1Nlzfer3q2FZ6hIJVdbCXAGHjLy2C204JhM5/OLxWn1TckVo/R6xSEcqa8ygAtkd15DEcc+xuvdihYBT1plCpZTCoqBy60rRn50dtU/M5uqWU1Pzj9y7/B2P33/mCSI6i6gwkQEJ1wp5Wlt11CHL3XEOgKVhnSlAzHra5ad2tSlKBejbmvdMkzpFD/F6VmkGuL5QKEcfgArGG9i8e7hHvh/yNgcKm9Ut+WdHj3leuQVgku/jBI50KsQc0cg7M/vBHusAdmt0DjuRO8dOlzQ0atSB9Yocr2Dl0NlMgogzp81hT81xzEEU1fD1CHhIGolgdWEGkxxfawSRdhsFI6taTUjfZJ2Y0JkIf/I352SMD5ClDDDaOcLfkfVc6KX7QD7YCJpT7CC1sq/bbqNl3lpFp+eFfvfK2sVs/SmnuJMjNnkQLn8UkQyzjkD8yzUfvI4Sp0GIXnCYo8N+mb8TT1ayEOsqL+fcF7qufDd2/bnImCGAIfeRpO5gkEsBGHnWgbLqw8efOPfim+5Z+RtXrlRP/7/ef9tfeeNdK1PLKxlWRTV1AQaw068GpJEyUsBZlxrsHOcSMhGlHLkaDk57UOipQ0iTGvMTwvPBNrj1BmLXJ9d3vIoU5Fuy5Lk3GL0mk4ILXus6s5bfOh3N58grQmfskjslFT0hS7hCAoJKU3VlpyhmNoedpakM3/HG1fdf2Rx89xvvXPsggLqkMEdNZZrgE153pAyA6wgBM3mIa/Y/gLXTh56Q4wuw4TVFv8ec9kebPi0CAWqZHJtwvGBsF7/JmhSTq59l95d896RQvV18NTWcC6CtsUKgk/M/gXBi5bSMLW8a60qUFm7UxbjUkavUWUgHExVselOPoLn5JInfkQCKn72+tL3PHFT2wvk3oPEPYyRwhrVcd9VwcZrFrx5FuUsAAAoVEtBL1Qj/cbfTWgFU/+/bb52bWl3pqqwN0y+fH2B/oEdVSSUpUFmGmf/Dk+ch3Rfs5SVQfGN1CrePzo9rHl2LsFe4ckzw6BUheh4ikxNlswC8/IBIKUAEzPr9anT+whDXlzvtu2+end3aOfFHv/j01n/67SfP/arCLIl3wjVBnlTrUQaB4Ne9ASCq34sSu67iqWFhef/SkBFlhM6T2NCXK7Xyv67KKjcX/cg1rsDRCBlNEAysO+HZVSARMSXwaw15AARuVZpd0sjp3poINAWTTcLxAUdfbTyWY2Jk9j9HItImdOtjFF4oGxmvxi02zKUIgOB233YyTIGcN5g97pFDzlxBQuSdAIycu0pYyQe71nCRUu3WnZpokHO7rTpy6aTCPeKtzy1CarL+3UoPSlidJPQnRjJJrNsjQ1h4Y4EkxfKM9hgnN4j/wKyixfGka8K1BcsFurI49p21B0SElexKZqTIaQu6EiKH0XshPy6gateK19L0Kbo2PG7MEU6kAlNwwq3lJgCijh9UmsdfKTRpQkT87FfPb7zprrW/vdkvnv89773pr735rqX5laUelhqmLlwa4u5O1dcVVIjKrKW0jrC03sgqHPRmGYDdZapZCljn8Q4CrmIVeJ0Ebq70Mk1uRjYqisBsGWn1mds5oD4/+7ujvZ/QkcQ2c2iTuifF15kyvzhnyn/YGlnl9y3gj0WQK8wIgMqSqq3tcjA31WqdXOvirTfOr95/5/Iff+Odp35LU7WTZS2sqiIp14TXFSkD4EijiWGlhuN7XwFwmOl1fJSAGt40Evp7D7F27kAEcdB1XMIo4TiBwh16A/jpPpLjuCZaFJyty2D45Bz+OdoPToqTUTBJIM/9UMNhseGp4ypfv7HJ24WSeNiBsB6tUwoJk4eYr2yyA17NeTAmma7meozeMmn7ykaWsDeIzFIlALq0Myr/aSvTXUX6u+6/Y2l+ZbGDmVK9s2RrAlRUKQKlMlQKLJnIwZmw14PeHRq/YDe57jWLNhCWNP58THteHZii8HGCg3SHwlrgQq66pGo0omJrpypmdqr29FRLPXj38jc8/eKVb7rl9MLPaF2OENtIlLYFTHj9kKf5/ToAkeZyqE5JI5q61Hb9li/nwpVSwUd9hLFA0eIqDIoHiFCXqxhtm9fWaQnjkbzmRNG0kS4WjK25jzzH97RMromCoU/5RssOQzWu3FvC9Q1CV+nXxTGlERAvUyX+34u5l14UcQ+XVeNXWceEFz9O0swJI/jSyCV/dwKfycIxFUQgU8cSkyRPCpCIQBORZo7ICJldE01IbhG2iE/5ovsYaTMSr0MEa0+DCJPr2rzk8hPgd5dwZ4V+Zb3u1b2LE7v1vSyTbusBsDa5LaJ5dX+zhNcTrk46NtEAUjN5mZJOTq02RO06+9KGZZ20RTtSBKREQzTWd0826wTRZvKB34veX5dqVb16yLIWVNUIvvLsxpX//OFn/tn2TvFC8fW3fPDhe1dWVhfaqEvdu4Aj3N4tB1qTbiulAKz2A7d/tDMAnYy5ryjIA/W1SFhviWr6trkIFCH4TCeuOoVuhynOtAPbVbym30+WLhJPAAjkUgR87Qu+HP3lkry1bdkOFvInaloEOpf7CD+M/dsY6e7vlsONzWG2MN/OHrxr8YaNrcH3fOXZjU8+/eLW0wAlJCS8nkgZANcF7Mwpi0nV2EphGFqEU3wTOysmctffHhT9XgzpXtv/BSOUt/ATwdg7I6LZXkgmdLmb7jGghOsTe4eQaB+BqF2N4iJytkwtVIUN19bkeq9RBa/RGRkpJDa5qH9D1jAUurRBBY/9SkXcSB4MlSD3TaF2M9664IpiVVhjGJqUaiiprosgSJDk8WiCot+HvW4PjBUJaRAIzcsslBXagK7Y5xlJeOUoy6Gx5FDh57586dz2TvFvOm01pxD++oN3rC4vL3RUnme9ly/1sT8oRpU2ZeoVun0ahMcv5SOe8ZpnRHmVZRSam49DcH9GOA5EDMQp7qCR3gqGP0Z/M4cfBMrEB4gMbCb3EQFzBVkxqsrLG3rQ62bTJ1e6+ODdS/fed/vSe3/p48/+ZCvPMGUBJLyeyMcVKEo4CkAgwooIzbpUS2U6vpwX/TODCqw7SSheacIiBOF5/wu4ZC9aqsFZm+5yFHrQxxOkcWyDSSFI2pd8D7BRAQg0MN8P7Ru0F1N8Lrgi6dLjBGb3AVGRfRY8xe8LYthnQAixeZqsl4/sxnl2n9wvGedyEQnnnvGzFzmHsja3CwiDW8dtDCuNYhE5X6fiKvAJ1wLso5jtsM0hTj0iTj8C1nNCH5KfYwlkAMutX42JHnGpaUaBnHJfXNW/HpzH0EhGJ79+dxeeD5y+tb26Mip2hTaAsPoTITXRQPeVk1u0zAecwiHeqIKAc+kQxJzNXbEEMiEpTorJtsFNco1c1onQuty3WcrN4wBwNXxsbxSx+aUtZJfw6oFsTYCnXrwy+K+/9ty/6Q/pUjFSH3zLfavrq4td1Ajd85cBr2wX/UoDtXOVI3obkawcuekpKpQTqbmIgmKDVSaC2m+f523XjgJSVOpQ55OTkxvwRqTszfdnHglWgPX52uQ52PbiE9UE0ClO9vSh9hy5UkFoNvQtK12VAxjs7Jbd5SXITq70Og/dvfInP/DoLb+0stB95uWLQ2rlHSwsSZOQ8FoiZQAcaQRqU5up1ms+aV5a1z242jGfoq+xoOj3Ps3G9Uji7FjjIZ459hxbdL2ZTbL9Pk7C9QopMxEdDzBWlOLYheuN/ITetBV1bBcHjwnxKpXmvn0ncTQhzf1HBhwR2k9BSvGj5pZ+s8iA9YzeRqxo2Kmgihrahdc03Kx+TfgUJaV6ZCDZywM0rX+zB9NBNV5gbB9YV7LssTkGC8dowCR3rxVMdDrDL3xl49zWDv2bdpb3siz7O2+8a2l1cbaNiNStNOn+bjksibQiUJljvwFCojOeZMfJkLQC974K42tCAanV6vGzP9WEcx+NeACR9yxp+NRELEH0QXiHYEBC0qCriqoru+Xo0uaw124puP/OpQefP7f73Rev9P/OyxcH58oqLQVIeH2grvUAEl45iEAzo2mDnTLwyNnxPoglVFPUE8THXT4B6z4byfRrVEVrZkS5SisJfU0Udo+yTF9I99v10IECDfW8iEbZyJszwBUCIii5JjHh+MAHlEA754nArY0luaa+idJ3jhGSbGy6YSoNvPgR19Rw8QPgKtvmfugrCDuZxkCmvWmsAFC5BQaI5s34KFvC64eoLj7IavkApoi5IXskLYsAiCxLAIHq4noVvlqFC7/biBKCXDrF+6azTDHxgKz0+b29vde9EL5xC19tw4BojecENB8OAMDsCv6q/lUTXj0gUlshKLFyOWpBIEQYnLfit0Nx4uEu9zuoABL5jBGQbexLQggSStHpQdvU/MdPBnldiIiKq/n4miiAQ3+ThNcKRBUREDz70mb5337j2X/77/7vr/2Fj33m/LODfgXLcx1YX+r0ZqazbqW1LoqqIE3S/AMUc6U/HtM4JjJjFWKDbSb3rvCzrRdBoR+FIenmXVs3R9wtkppAc3vVKobpOQURxfcKXTwDFO60JcdhZNf++GfNLJ8gVIoUKMD+sCoubQyLqtJw640zM2+5f/V333xq9pYMFQBoyPNeEvqE1xxpG8AjDXZ2SJOzHEWycUPmcJxWH/clcv7D0xi/s4rROva1XdJED5LFrfe+Rwwh3FY7bCLtjKgJICiTcJVwPOHzX4MIAhJSvUwQv4npLABTm4rdpCbRi46IbAH7jyQbakSZe+Z8BEyaLo7iSpgAcLiy4SgFPpP9YqNqkuAbUCgIwjANIf1y4/xzeInlI6Ck5Iiah9+EaI7whDE56fX/Jud/kuF4IO+PSD8m1G+CjwKAZjI0+N2M5mjtmFZiO8LwdtaFMiSAeKZ8+zyfwbLcTgL4GoF3B/idpy9vbm5X/z4HyrNMf/ChNyyfXpxtIQB1q5J0f1ANdUUVECjMQLG+s5OkUVAY6orxX5oPl9fbRAEj0UpsYOmEOarXL4JH/sB4FQgNwku1g0hEGLBlcS9MqHnnP5R4gkyBIsCsrKjavDIaTPeyfP3ENN5648z6HTfNf8OJpanfPHt5G6qqGjPahIRXD2kXgCMOAgBNVFZElQbwFgAi+j2Bra4isCEq6yAR2DWh5Bx4tmQtlxBW6wVrN6Dvj3/5GgOyulRo+MpV1WbC4P3TrTbnmysfMrUq143B633HCBOfIUIgbW/H1biTdB87KASlEJRSkPmiwo7ZRy/DPjnf2Rq+hmbAHfjXlmSLnbjomYgNCgzuxkfEYGRKdpLZiQUB6MbIj9duFAfUpdFonRtwUSvXkBxj6epVuz2o5QAovCwGxq66F0zJRfgcXjlY8pLofgjQzBetohwRYpYIqYkDBwLArTkOvRqOpipwzjeKaL7wdaIVzK4rH8yM5nXbon6Vf+EkjOUJ0CahGJ6MKKL6yehhJF8WPanE1x5cE+D5c5v0Sx9/7qdHVbFbVvofvvXB1RtXFntIpKYuXh6qne2iX5S6bCG2lLLfqiuzL+dSm/3mS6bYFhDw34Gc8B4DwcD8FBnYswCitgkxAWbfN0uqr21F4fVBa342uM6Ks3sFz2FH4WprsLFMrh4BKGfdIlcPVoiYI2ZFSWV/qIfb/bKrtW4tL3Sye29f+N1vvGvpP3z6S9XvnL2UCgEmvPZINQCONIxy1URaE2inWCPw9jq1cE9tWq1Tm27NKYXHxa4qTcMKXjaSq8FbmXJVH4Yjlhtu5S5iD8xkqeqAIE44NuCMPYWUKy4G7OWJ0M3eHLsAd9IdD97Xj5KxH1zxrJrDFVxOjc9As5fvewpMjIQJQBQNCv7z5I0PW0olKGRLCAtG/7qlVjhGBvk63gYVRHkrpyvD6KrzA/eSoiDYJd5gNOD4cyVMLMbOlntMo1KHkdU8cl5u5DYPJRo1LQlC38mNUO0pyus3SXgtwZkATz63cWWrP/rpPFdTeSv74YfesHJyab6DGaru2Ypop18MtCYNCDzNRrCznpxfSZ4LjpN0k8WZqD+jGusbkjYLYaDWmPIM6Vmhm/mauKiAkFnWuS7kJO8dzQ9mxb87R3zQkgAKQRUE5e6gKja2Rq1uO4M33LJw1+MPnfjOi1vDv3Pu8sVziC0kKpLwJ7xmUKnA9BEGgiAA/OQpbDkSEc2I7mdm0zOgARcq9DcrvWB9oO/F9o3uIr8zNfhsMLmonw+BPxT34Tw5FNfbi8z4bOzUzj1ybSIiKARKSwCOKcQ+GCCFyMibry/Bdc6D+hP2R6P5ceILDaH5Ru9c9ld3/o0oG1bC+lfuP1enwA9E+4cuqelJAQFqQAWuNj4RoduGxURZTUPz3bllqxRoTHfeSQuv7WfwLgNgnX5BiMq1sIF6FT8NxCsXGAB3obkR17FATxaz1DuioYguSpgYeOfI1aFgWbMHpQ5zrr2QNbcmGsGu0XYuE/B37iWXvMBJmQu0nb+3NwT8WMWCcXTLFpzetnLnjI1Uz+f1BJGmSiO8cG67+pVPvPCz/+cvPP1dn/z8hRdGIw0ri11cW+n1ZqZaXdKky4JKIiC7egO5HomzLMkbblKSwjz6BjqcwpfSekRpJ4I7yB56IIu1a92Vbv4NdKcpWxFIem3+R1dvxY4vritEPBOICj4k9o8hI88ZgipGVG5ujoqqJLj5zMz0W+5f+b03nZy5NQMAgBJaqRZAwmuIlAFwHcAWHDErAOTBBmZUcvDOc4ZAQcqz7rgzGmDvuVi6+BifaWSAZZShPsZ666YrnQkcKOameyUcB8j1y2zE2jPmn9pj4J4PYb/6CzyYMG18BCICLmxjl6iY4z7l1YtuzbIg4gUtCZMDBLM1IwhClazRFxu2YGXNNmSV65qEEhLLlBPFSJNT7UX4tqZ3628pTOFigatraCIETdjEGiRMGBARlEKFsXME7OfE9L09J312R0iFDpA5EhKl4p/abO/vMYY0jbgwM35f6cIK3MjfLcnd6wmikhBb+OVnNze3dug/tHOYbufqg2+8e2ltfraNmqintab+UI9Ig9ZoltuFNfOav7NYUtwCKb64pgjr/Xg7ly9lefVkVeT4AwEHB0BMv3404XaBQk6BuVMrsu75IsFlhDaG4bzMbSQHQpZhUAiYZ5jpiqqt7WI41cvz9bUe3nbT3Inbb5x7//J852NnNwooUy2AhNcQiQA44rCKqSARtwl4S0d02hVNZOdgZF+mya6ruzC+GgBF55omfr6/d6rCaupgPCk2IMSerGEvsmawqKbOH9x+JmedkutOE2GVNrk4rpDSZtaE+GrB4FfruRoZwhcS5dwCaaxZLeELk+mCHMUPrYd4I+SoX98VehLLV5jXyfSdICjIQXHoiKvie7lqumTciUCDjpcNGsu5OqXnnbXafZzoeRNYrAkT0wAJS1XZSQOJNKImqoiSFE46LH/I5BSa71js3ICILicwcKqsbhQOfSMILAPK2VROPDFUd3tTUVJ1csH0cKciBNKh/1iWu0kAX2cQFYSo8IVzW/TLH3/+pzSBHhbl97/l/tUzK4ttBNJTFy6PsN/Xw2KkR1kLWrndgBmBOKPEOdtOz/nQObnifZyLbMWrRh6MIeTFaGvtQ706rgMe2xgFHNm5gUUMzAjINubjx+OPM60RAfMMsqKkcnegh9u7VUcTtFYWu+ruWxe+6d7bF//36svl0xc2R+M+cELCK0Zef9ISjgy4SBT/oP8BADMxo1NV4Cd/cNc5BSgm7dDtj5xzoesCEyJwiCjUm8K2kIeVPe4d+EgUo+rZbmqRadHW/5f2AhFqv5lLo02ecN3Ch5aMeaHZRhUAsNSZC666pSRCYMLpf4wc8ePhHiZec2MfvtCOZfPAjkCwcAhIGrRz90yKrAIAuLCxQ1mWJ0G+1jDMjEIk5RQPARDXXQ+MQQAgDA2/Whq0bdbkGYm3PiHbClmsi11fYQnWhvE70SdZJQt5SYEGG+Eyq1RBWeVKKRlloiFmbC4AjOb7JGIC1G2MY4iB2Elv8ItiPsCbDqy0hOAGAtdEeEYemXf+gTT5CpjgjJhkmU4ATGHAHD//1YsbN6zP/2sCXbVa8D899IaVE4uLHQRUvbPnR3p3txhABZUCzJTikneu0K0REWvosb06zjbz58a0aiIja0Gk8Fq3I4vrlpzOlP3HXceJUhS0kRaCOMRkgW0sCgZ7DoT3hUXCqqRyt18WW9tFq9NRcPcti/c89qb1P7OxPfzRy1cunEPMkahMT0PCq46UAXBdAMGviRKRzoYpNEhhlv61IxNCdTs28FlDmFcd/ib/NthBdsxdaoaDtEIiZpUvCD6+XaCbkMBAgCDK5INicZjKPhrENSYaO5OOlpjz5e1Elw0HG2BJMJK2DLo0ljT/X1vUojy1r4QNW6f9xvhWY/tuFBoPKYosfVTT2E1jDnrZZyzSxbO9kFiOnQjVCYTURYaNItKcGhdZAeR3HrGQvhEEIYIGoLzEOzQ8DMmBxcV7xyWRENglUVwtnhfTpCl8ImCWAyACQPUrn3jhv2QKOlmufuiRB08sr69OYVnCVFVW1agoi1Ij5S3MMyULTPAv7/8GR3xGHvPy5vSBtnGi6B0LqNTXVjNLaY2XG8RSj+ISazDUN4FtHEJwb/84RWytHYtCQIWAo5EuNjZG5fJiO7/lzOzsow+u/eEvPn35Zz75xMtnazZKQsKrhEQAHHmEVqFz/1l1hZOymPojd702S8dOeUOIQByXFU+DlFcK1Z887rdiCUcU3Nk49Gb9FTPIzHeA3aLK/oACMBoVcuAKL8lxOlYoyyHdeGoRwIa7gn3PRJE9EgeB3wesWOzdxRGGwGx20YHAC4xT/30kQBoeZAdEbDKbyDICgimttLo4kwyAaw73XeqgYpo9KNdXe7dHfMkArj2TrXU913xnl53VyJOOK8kSXoNWcXKpWIw8fMuQoaiSbVdpubEXjYNImChYtUNS/YCr/ifmQ1Jk90ip6Sk5xQZui2cImEXw9BMBILmEQz8Y0ang8aX6JaeZrbCZKR8RUKW0kwmB2R0A8YmvXrp466n5fzU91Vmfn+/9jTfcuthdWuqoqiynL13SO8NRNdIqUwoxM9Ih80TQOfvG5uQF/O4mzixsIObFbzFHyzlVtIs3YwlKEAaFovz4zJ59Y+xcO776HybmOcgW0RQPAdk5wU8DroVSoFoZ5lSR3toqBr1OPn1itYd33Tp/+tYbZ9+7vDj9MQAApdqoddoaMOHVRSIArgcQaNCko+rNjYQ7xW8Obc8JJiHuz6KpS+kuHTq3b08/3p605IDlC1TiTBOAI5ccWfCsk+PI2GknNi2iooDj4Egzl1vo72kbNJQuauwJxzyqCRMFSQyxznml9GJENjkF2UBCGdcoZFYP1/uB4EtdgXs+0jLBowUS2X/G2Yqq6DMhIDYq885UU62fMMgQZp0I5irQnQF1ELxv2nmKai8AIO3kM1HgLQIBYPSLH3vhn3emOqcA1J+6/7b57un16Zwqmjp3aVAVmiqqNOQKlLIVd0iQnk08OAAA1ZfO2+O1zfmuEl60a7dBdLLt6QP0jNShpuj996zgT6MQEXPIqpKqnX452N4pOydOQGtlqZPdemb2vTednP2nFy/vXETMkkWb8Kojf5WerIRrAfamNWnSVJn0YUP120xicsEqb6+iVbVWGVtHngNGzuhz5VnE9E0ut8DsF8XmBTvekSEbsasxZcDUvz/gWtuxEPv2MmIQgIsI+U8s/jzIHz7hOMFFr4g0aWIhcSIiDVpXB5APW37AR7akQSBkmLc6QvFsEAc47LaZbA6zj89GEGLAG1DwJHqvC+zOHucvb6caANcc/OfXAKQ1KyUjWsZwRfsT77/COnOsH13zuVD8EtsEBjnVviZA7I45iAAb8eC8ZvYaH8XouBigzRWzW8BqIoBW3o5M9oTJgPO7W8HyeVdXjRBBA4BiJ8vsR0I20SjogkHBeyK//3ntvNy5RI5J1ChyDwF4cUdrh5i23iJxFFviRScOGbahohI+8fmXzt5/z+nv7uSqN9dTf+zGk9PZwlKn1a/01JWdclBVpJUipVA5tpxL/vmMz4YgkpwExbwsTUBGk95zrndttvSqiyTLaRmJcYyU0JuA5O9OIOZ3PhbM5yCuY1takCBW7m2qDRISlBVVO4Oq2N4tW1kL4ZYzc/c8dPfqO++4cfG/ZRnsqryFuizSQ5HwqiExrNcLIrWAPC0Lq5MdI4yvO4BK8c3kJL3/xSJeVgeKn+iag8IbC+iMBiLScg/hhOODVt7hVFKTPioMUzYpnLgJwRxnB9QhLqo9c95YAIoeD1fUP+qnRknAgZ/JhGsEziZpcrybRWNsR7WWNOY4gLFAwTMMxpj2/lcsvI29OOtzzD1E5DgcT8LkAwv5dTF1SaLEr5SURn3X5Dg13ys6t9dMb4kAy8fLFtb/CViIpP4mF6UeUJ61AFHh5790Yfe/fvSZv/UzH3rmZ7703FYxPdOC0ydnugtznSmFgBWRrqKJsFFK7AGvysRZDJ3+/RASWLXpNmQRAvHlpyU87J31+OCYmzccd6vF4p1ipP1hz42Kqty6MqSq0HDLydnlt96/9p23nJ47XZYVUVWO+9gJCVeFPNGsRxhmtkdAytFSq7J8DpIkMMlT74Dg9wOMGVMOMAm61J0XjC1yFqHQe+RjUl7rEbhFiTXtWE+VktZnUFYAQGTGkhiP+GHb2ESsbLg3ifexgmGBgDSVACa4GWxHZJ8B9AWyTDF+8+iIoENspnL3/rkAEZENxZvsY8mbDJCLkTk7xIcLanEQ9i9ZstcWZ/bPKUx47WGJJWcqIguO+3KJUMbZ3XUGNaKTgsMkZVMeN28wyLACcOayuTcFp0x/5A4g62YftXISjayrCYWtKuYNw6pCUY4opaJOLojQ1qcAntwNAcBVckCR1YnCEohL9XFnrJVkmNOnRocassHZAim/4QMQkhH8GNk8FKuDNYEmwOTxTCCKsk8K20hUwoc/8eyzb3ng5HeWQPr3f/1t33JqdQZX5nW7HJXV7qgsKk0akTBj7dVQZLKuUKz+Y3aTuXJgvWukjydUM8NyQcGoqr/9xy8uIH9DrHOhGMm22wUAIIj4u8nc/xJFWin4zTLtT6O/1NrwiIBZjrkmTVvbRdHOVXt9uZe/8Z7lR37ryQuPAcCTAAAq66KuBskaSHhVkGoAXAdABFAKMreRGYCfdRur+gamZXCsoXFwBTv15F8eGL5vk2HaWFeQwpbN58V7WVTGhhhIY9n8GROOA+piZZ1xNiQoPhlWjNjbw0H5MpryG9aoNHUayzA1SWljrCThmiEiG2O8iuvkx/AF/ggKZz/mbxsHtn8MrfaphPokTZoIkjN2pODX/RMo0ACkINRzFE7JBlIQ9pTocQptrytiystfT+FbSLpvsqFpRK28Y3cMVS/Nz7a/b2Vu6sy7Hzn9lvWFtkLo9V662Met7WJXIagsg8w5xOAd7cAh55MQHWqcH/fGgUS48aS8MrZD5WTdYKOOUdxjda9ZFUEmPoaQZ5QREO3sFMOpdpYtLXaz0yenZs6cnHvXjadW/38AOZBOdTETXj3kaa+Vow1TLBdaqCDj+L9bT+fXqUK4ztg7QRhrSo6CRguc3Mq8QO/5UAL5Qx5Ct5OLKJCrFRCkVqFZqYjCQ/NZA5FmxfCIjFiJYu+QjIjjB8O2oybzHNisaeL12aIOAHGIAVyRIpKrCkUUAkQkzIcGzFsnYhxTRZZPdE+dXGMN4CKuZjEu8rjDTNhYKx+wpGDCawXkUKWygf/gO/JRII5YeUs2yFwyjewp/3XL83ENwJr7zqLYZBkHJLCI0QZ9ojNj3X4AJqvK7sDGANDaVtIgsjUAEiYPXjch2cVwCHaeJaN6SJFZ8K/dFw8Afp2gqBcRrBMMgpnYWJ8SUGT+gVBfrq3tu2E3C1bJjh4ImQAXoMrzGSzL7aQEJwhFOSTEHElX8FtfuPDFqXb7TwPBP/+Gx9YfWZrr4M6gag8GVFSVrrQG7XZrAoBwvjRySj5VL5hfzVkUmz/JCpcsW6ZXZ56645z5ZCuqSIOXhJkbGbLurd8hRQSZxH6VYtr2w+KYvw8LsAUtbsHPARIhIQIqo29hONKj3UHVKiudTU3lcHpt5r6b1xdOPPvi+ZcRO0kHJ7xqSDUArgM45zeObI5Fk2Ns1Sw0M5bxFXzPQ41RvLqqmbx5yNYHsyM0LIDaK46WcL0jlGJy0TDykzd4Lj+Wq71lc9wTcsihOSt7XF8IgKgAXRWlhGsKin4E4rWdrxAHl7CDaNGmgdXvEK7N9jnZRACVhip5XkcBUj5jL75xBm9+d9AvG2XfB2vuiwHL4xgkbpvMbxmYQkjO/2SCqKRMteHS5hB+5le+/Llf+PVn/sYnP3/uqY2tAc3PtdTKcneq083bpSZdatA0TiYjMQreYvBr/zHVu2tutOfVfEeMzvGpqw+cSrvDciAICGaiJyKtSQ9GutwdVJAhwE0npm9+4x2LH7j7hvU8z672rgkJdeQpQnqU4ZhHsMXwbVTR5RVxWQCIwvHeBReUfuDUewo0UsZMfobRqng3ATc8Mo3k8oT6jtlMDci4qWjT4KC5Kwj9LgCoAVADovZRuiTexw4ISGicZ0cMEZI9bMXNZaQAoY0L8K7FRuLQRRtMn3ze3iPawtjLKUXHhbxj+NsOBTmw5qJ3AOCjzUquMk+4hmCSFcmvhSbkH7JKUHz/tWhp+B2GmlfWxPavwsiqjHZ5/RuMJ3DqhF61NJjPPuAQnKsYzyUGQSQBAIEGV07llZJfCa8pEElxDoefoZ1UoM+8q/NVvr4Eyx6Gx/mYV4CeACC//jq8xoVX3VprBHAlfKys2c16bG0CJEcAeB8LIW/NYVlspdl8AlFWQ0JsI2KGt5+Z+dh8T/2tDOH73/zAiZuXlztZSbrTH5UFaVObCUQ9E6PK0MzCvJAfhXpyGgmCIgJ8cRxKcnLr7FPWnWMmYUlAyN4JAEBy7+RjB1YwfTKBvQcnLwj9LcfkjxmDPRBxMI+UIgAFiGVFeme3onlUeMv69OKj9y/9uefOXv7U7zz38ueUUqi1Ts9CwitGygA40mimTJFJ9KbmY9VGHDXdK14gz1+NUbhf+33Ou+ApcUEjoUtj/jcZrMcOxndWiEa/EQBo78kjL/v3Dh3zZwcpiBo/GQePgLnmwYu9Vjiit2ASrjGEXglik/tfdbV3Gz8GvnN090OpOn8HDA/Xbk0NrxImEyEtGc/YRvOFx/yrPb745gNjVV9dECUHZmMCollIR9hTCIBuwXNy/icbRCNCUPDl5zZ3PvKpcz/z4U+e+4mnX9i5ggCwON/O5mdbvUyprCip1BVV9irzowXv3mDTXo2F2TRLN56ooenZaWj1CkxYpjacrhUfEK3lQhroypVy1O9rWlnoZPfcMX/vTTdMv3N5cRqJCDLVTYZtwitGTg0TfsJRAjOdMjrJCtWcd4EpSXoG6gMBYkEg36+8j9RaKH/Hbgz7LWKS94eZMbV6UPpALnQPYq12vSuOziIQKL8wF1ibHtItS7hOgAC2LgbmnhNiR5pTm21w3wouyxIAkiMKeI72IQQEIF9N2IXvwbYTJ5qmZlkK2K4rJBcKIxDhBXDyS6R95CFJ87WFiPYD2qrTNvppa0zYtCs04R1wVqLXy1anCl1njscRIq/wQlKT20RRfg7MCnlkWSNuL2SIxKTAWxa4J4RcJpmRUrQq2a3HTnI4qUCAlkhw4qXHbj0HcpASWY35758Fx9UkMafJxzVJCq65zu0khGEMlMP7rOdsNELuj062uUveQ0AEBVwc2BZrsQRAkrmjAE2FqQlA5dY733Tj/76+MvNQt5P/3ptOTXfXFtptKLTe2CxHGgAUqYznPhQGqdE+dr2/FxcvnzxLWiGHKKMAwl/uha0uBUBkkqZis9a3JyuzTu4dJRDZwu6d36mAAO3mP6yTyZvCfA3Z3VYACd2GVjxKBMwyyIiIdnbKYaeVZYsLnXx9fWr65MmZt8/MtH/y0sbuSFOqyZrwyqESjXSU4Qw6YSLWSMWw+di5NHSc46YNGQAU3n2/kVpOomkR4GEhb2n9LRQWT0ICAIjJn1NEFAbTLYrYEwvRfkCuLMi38Fyb8Pn2HVPzU8ZDkUE6rZMBPGFAnzlnbUQRwQpxMB057rq9B3F1ui6SO/Q9NfaGAMp4ZgcaVcK1BBa1b5Izm4iYoBIukvg+G6V3PJx/33iy3hkBgAYALciqoI3Ui25NHyQC4Ighz9qA2MYnn90496GPv/BDn/zsuY/3d0a0NNeG5YVWp9PBNgBCVVGlTUVoR66H1CYIEaVDyGezrvVH9tObjjXbt5W/m2AZDoAmu1ySwkqhAgIajaqiP6jKkgh60y04sdK78/Ta9AlDmKVnIuGVI20DeMRhi5cXRKSJQ//CQQl1EvnfglUNFKbzhzg6ZU1YsUbQzN3eAzcT+hiF5C9zEQOO1HPtX/TxCNaE5KMTfkwyR4FdLhs/IG+QGEbZq/lECBwnFOWQbjy1gkSgXW1rTvpHt9008GYAMjIl+AJwlau5enDTzcg3N4LNb53AenEWxk1gOLs+0HbBIVcEQFKEpKKHNeGagTMzQPvaKWLFJ5rQaBAABVE5AkONRORX/7vK7cCBJJAkJ/iQErgoraNshXEcbPpHohMXTbPa2qQwsJI3tzYD8nMHAqBJr8qS9B0FUIvpSFMbx1UFAl9tHwDA1gcy4kO2ggVxbgDAOG1j9ZTkF8BpPieLNszJHaF7HgKu1b7mKC4AO/7844ebdN+RQVHuklIdPH95Bz72+eqzC3P5D916aurOuanV9dnZFi4MO1ObW2V/MKwKBCCVY25UGwXcuY2QA4DQbWLdCHqhE3F64fxbmXK6UgSMAgl396BQVdrtsyVP5bQusj1sda99fGzpDbdzgMvOcno4NK55IxnOtrGmgLFSKkKtQReFLkdFBXkH4aYT0zc9eOvi43fftLihdbWVZ20sq1FiAhKuGikD4LrD6/ONejNgv+gWIzRED9R2r9PuB01kgYC0v4dSiFhU/aQcjyFMUTTtZdT516E4BO7YuMBAfDwOsEFsILxyJJ08yRACIP1sZ4A2td0v6vQqqanA9j2AXnZMA0QPh3+pEEEZ5qz16gwy4TVFELq0ngqxe6HtjzjvX40X0AZREtNvQ/tY7sIOZNwh7hrddkZp6j6q0HpIBADnLu/CJ5849/Ff+tgLP/6Fr1zeBERYW53K52ZbPQQErYEqrXRFvIiKo+8NOLA47Kdr9zvvWh2ozH8wLBx3Yv8R1JrbRqYYYEm60HBqqTf34B2Lf+yWUzO3AABo0vFVCQmHQk4HTFtJmHTYtCXkyvhot9cl9BmrnCEgPRibOB+xrWENAL9W0LH4xAZvYAW797I3p9aZtXXRLJk8DS4KZmhaWUvVx7XIsqziLBEAafNReOcDhXgg/Z1wnaGVd/D02rRSSLlJNEER/+JcWLtsT0ZIWfRcsFZEBvgCEYVlyLWHIr7mjkm4kJi7IbndMTgIQO44mUWxB3IgE1578DeEmmsBgMuoRkDkCJBVSFYfcza0FUWnzQAgDghF94LaV+41movyik5kTpbtoZHQwtC/8vtO+FgxR7F4brAjLMqCzDKahEmEn/+sQ48IhArI7n5iZNTKo00BMCuWndIDLzRkvniXKUK+ibwnmEvkyj5yW/74uRvAELOsZN0GPXaXIjduW3TC6tu0BOCIQuuKEBG/8LXLF990+/I/b3ezpdmF3nfedtN8a2Guyq9sF+3+EEaVRq0QUClUoTUYE0NSSwZnwmOe/BIzK/h6UyL+7+xJALn7lTQDXAunMnmXCtMZ39MKsdTA4n2t1ouwGcDnDriRCwKtqKja2S7Kbg6t1flO655bFx7+7S/P3r+62PsskYZW3sOiTIGuhKtD2gXgOoCftr2zsL9GeDWdigMxqmKMrwGUqM+WCIBjDUTKFJJSYhcAX9isIRLlG9X7ajyCDW1scbhXOHYeDBvrr+kzk3CVQCcG7E/X3fg4NwTl1a/pN7p3BkB0d9usaT03AQBpqtWHTZhgiPK/VkC5Sk5N5lC+2EsgKew1uJYvj3nKBuVaozKt429JBOThhkREwlGFWauu8DNfvXTulz/x0j/7+OcvfebcpRF1uhksLXSmeh3V1hXpqoQK69JxlWDF/Cp0FfU6/m5jn6zGY25oKDJoovEiAqoMMgKCfr8s+ruFnuooOL0+tbS+OvVQp51nAARllYoBJlw9VKzYE44SXFVzm6np53+7go6E88OF0NngswQ8BXv9OjXsquqboxz1chl6XB6aBLPvuFMXwRRsKd8hMowRhc629dVkxXQRRxAL/d1nQiS0P44lxqCqesJxQlEOSfEzoUzxMrvLhKtBKZ4IwexbeWZLVGSrsA0ta0tI55z3V7dLwG1VeB+R4MiWqEBgzhHK6/kJ8P8xk5W4rAmAidWYbCj/jQMAV8kH4+RY5UUEpoi5tmnNwG39a7f/NVNTopag0F6syP1hsb5UZnhb+UYKJVSM391HiJmUUa6TYfQ9EWgi0KQ1ERStvIVhnwmTARdRLKT+cYnVLH6ItlaumTO9khM6h69zfjjZ/5zyAscYCVkz+gr8XAwEkTbzlwq3ydYAQqmTAQAOUo814ShAAQHAE1/b/PIv/uaLf/s3P3fha9uDChYX22phNu9mqBFJA9h6KEYXWfsxkB1Javp509mBTvdFcu/q6Uh7VepSn5PFBD5remmeAt9V6mqnx3m+t3LtMvjEj2no74VsTZhPAkG/BKhI5RlmCgGHo7Lo94syywCWFtr56mL3zumpdsfcvXrtvrqE6x4pA+BIw6nHTEzNAcYEd3wPB2ZK92Y1x11y6Gl8XOBqrwtEtBQBwNitRJ1sKlkRxxKoG1j5mhs9NqQVHWZbuOF47eLGx4mNmvG3abjaGURJR08MwgKjxIUiQUOj5q39gG0/Tg4OrfyuHnsKI7rRVERUVVTq12tcCVcByRaxD82yKss8uKxjAIi//sNNlVIaEEQk8wBabtxdHb+fRO26AVFJiBmcvbhNv/nZs7/8kU+99E9eOLu7225nsDDfzqenVDfPKKNKayJNKtKTMOYdwDhteXABOoyYNdGpB+2J6YqQcmjo1PVmCLg8A5UpUGVFVX+ky6IiaLczWJjtnlye6820suyQnyIhIYRKjP7RhiUNC65MjWIxHSGh32cVPBtgKH0ROBA/LgAfxUiZObVRJw5LkQsVcE8AAHINv+zT5Qe4NX9+TKGxzFEtIjSGNkkmF+wP7+1qGovCrFojwLDaTdrxGKGV92ygCxQgKSNWkhoSkQQRUiVRL9vJHzqxci9sTQ3wGxOHDns9Rsslil0lgcaZPzAOyLfjvbBFnkLCNYRVOcpIEe8IIAA2fi8iTjZM7756VnVGDER4FuMb+RdoCSRvQHpZ5V1UUEaX9v4EwY9PTuD+3PSBAAikOQOgTmQkTArsN2iy9JAA/Vonn5hkVRj6Qiiihyj+HvRtq1kAhFLnZ2pXud8WxeDMJhZ9qW4jWfcF/0UaoVW+RKnK2fUArUtCVPilr53r//YT53/qC1/e+NzFjRG1OxksLnS6vW7W1pX5z+gfRJMZZeTG7LwLgKER6SL94OxS9wwE6hekPWtFFJ1QOgMUfGdEHNWXUXnu34/DnmdT2urz0JIFdw8EPy4EHgM3EuAnAU2eQFVRNSypGpYASilYXuit3bQ+e9vywhRkCiHLW8mJS7gqpOjSdQfkXw1KoU45Ho5xb2449vKGE423kwdxn7Y1uK252HsSpuyeo0u4bkEqjJw3z48obN5xK0acw0YNx2vvqCbK2HzBXmN3v6NFCgnXHCJnHjxBxA5V2DQmiCzG2Hzc/+EI+cPIRez879+a72CdtLQLwFGA5crjYxLC/QmOsuch/ayDQOpIJutN2tNeVzQOvUanJlwfQMwAUeHTz18+++u/9fI/+u0vXn5uMNSwsthRC7OtjlKgKk1a6lM5v3qSkn83Si/snWdHwW9DzgveK2jqaNrQmefPI+zNcbLuiDKKrvX3HiPk7gEkjk5UGnV/SFRWAMvz3fk7bpr/5htOzCyVlaZxtktCwn7Ik5o9ynBr4FuIZAueuWij03KGeUdxFYDPDOCK+ihOit9CS5qDrlqPc7oJmNXkXQLsMUvNcvzAl8siV0fAFQwGsJkF4efzY7Cf1zT0xxwh66q9AxBoJKBWNoXhtkcJ1zO4Gi6a71/bBa8i0moFR2S/sGSaSKvLKLGPj73WvjRgowDF9aEFwXkG3MJkuth7IoodBiTb5YXfrDBXYBcwKlcmO2ECYOtLgPh+QQGANt+b3Ozc/bbSEZGcfgkBC2NIWvJxInERgFjMIvsNl2j7e6Fs4uWUeN93VtxAsj+TGSAlVPWLsky7AEwk3KTd4nCpWwsNAM5BQRtf9fLBCtHLpI2Wshz7XU6E8MiaFuLuAJ4Jc+WGCNy879IB3P3QmQBcR0Psh0JAafK+XqB1QYg5Pv3i5vCeW1b/82yvvXbj2tQPP3DHQm9xrpNd3hq1d4d6VGnQYCtOBH61m5iFvKFnu7jmDkW6lS+Od7GC8MmA6BfylM46laTyZI8bMbjc2w7g5Fs+IMFlYhTxmExb8bEVKA1Ag2GlO60sW5nvTt1zy8IHvvTM5Z8DgF9PeTIJV4v8Wg8g4ZXC+fmetw8oRz+teo1qK08divwhr9eaZ3+QpwCauw+sR+7wkCYlSuXIXQX2iaMoGgaYcByAYB1ncaC5ZUSA1foZd6qRKQMpb/7MYYUcgYm2w1+b8HrAGJ2sU+W6JIs91E5dUsZBytY4ZRsrUaccKZZ5QwST9PfG3rF+n4DRSDhKEF9qSFzJk4f7XjF+3TTvH2LqDZ+eNG9fjzD1ABQCqN2Fmc7//4HbFv7A+lL38dnpHOfmO119pcBBvxoCaMhzzKU8eGmI5JRNUcFsBtIURccD+3Uc0HdZ06wUP00HQJPq3ucCvzsAocpAARL2B1XZyys1P93Obr1h9vYbT04/eubEwscAiFr5FBZlWvKacDgoHGsYJ0w+4ufdTJx2bRShK/tvfoiIkLShAwLCs7biP7Q5hSYMli1FkhMwoOHLmiI1QVZyObQuisVBKfHDV1BwLYCteUAY5zza4umjqk9Juo8h7C4AgLzLNQFp0CZAZWkhBCCXIgBhmr+MPDjB54W0EAp6KJDebUcEucZAUHPgnjcXGeAAHe9mYe5rg3mJ358osL7yiz9NTZOIBBB6zZViixemOrCMQaDS/VtrkSIEO7ZI3W5uSX4pC/rYle9FVHc3Ms1bxdjfbjG2GTYBkAYiDZoIC3/PhMkCy4fTGV5HRfVNMHKI6pN1JL/hLQTxJSOZrPsae/YSKmTfd0+R3MutVJM/c70BMQeACn7jc89f/NAnXv57H/vsha9c3i1pYaGdzc3mHSAiqkxM21eeALe23xz3dqs1dMHX5vHHASP5DQrxEsjOnFxz0R8EUalf6l+3rUD9w9nBupkAAVwP4t6urpWwLeIMP76XUogqwwyAYDAsi+GgrKa6GZw+0ZtdX+k93GlhC4Cg0mk7wITDIxUBPOpwngW66Zt1GsrZlFM8hbMdfve0x49zzX1XTttFEuQ1NkCtfdgMICQBQrpir4/cvNZa7mnl905L8n1c0Mo7bCEov3+PkHkSuauRmckunZRrH9qqO2vCLIC6jIXv/dZrXN0qtK2D8TQSspExk3ANYQ1Ez/8EGjX4/nzlqcjAG6fhQj0Z1nCP24m+vJx7Xsndgp0zEtoR/B6GsiRcw1pYXwQTylbeTcp0ooGVJZIcRenZyeirRa4YDL6VfcGE+vgvOzorxLbxOin/EQFGQuZEueKG+yVcD9B6RAA5tLI2/uYXzn3kVz758j96/tzOzlQvg8XZVtZtY0shIhGQ1my1SpmJ8+Kkwy7vFM/jTRhTYaeRhLVwnn20MVBjRxGCgtlRlwCCdPMbZSpEzNDsyToaVeVgVJWoAGZncpyfa5/pdbKemY/SdoAJh0cqAnjkgSAmfgfDXkpX36yrkjqKVwk6a6FBX9b1p9G0gQMk9letufDSTojJAfSeulTmYoCRLybIV+vLkQ23umnBLwJLHtOxg5VIQs0WQfifl0ZRNB0AAJQRrUaD2LH60niVDwYxE4buMTTX8m4YKOwGcH1YqXVHah8FAcxShoRJgKc9UUsHm3g5FbpFzgBgnWwnU4G2bSAvxR2cAFnNDVbE+DYAJhOAK1ODK7yONkLlaVurl13ZN002DwbCddee12Lxjp4FSvWCJhbEv0y2kFN10ezN0UtkloB8G1ZO0RTMPAEKJiignxyTD36Cj7p0bcPRANhIqI/uog0EUDR/Jw14PYGooFJreOKpc/3PfOncf332+Y1nilEB070MZmfb3VY3a2lNWmutWS05GlMuuyfwNp/diVXWkXAOfiCj4OZz+RRoBN93ILOedJCdYGM2AdYTr4JdiMJTwmSw94LwLrYAoLJ1O8qCin6hq5II2l0F8zOt1YWZ9lyOaTvAhKuDSmJzlIFsFmoS1e7Y9yE70XulaIkB6ZQLy6+JQK0rxMgyPCCimBV4PyjSgtHtSVyBcQeimlEwMmKj/HBjTDjqqAkRebKJzeIwniBlv8nMHF+FX07V/D7cGssfrfct38tMWldR3lykpNgnTAIQAFE5uggl5RNqLUkSOKNUskoOzTIWG5jNqswfxdjjinpx1jCPgS1oJ6QW4A3kxs+VMKFw3ym4mR+jCTZSRmO/1THRypqXMlZzNl3aFONv0JDuGZFtEq4vKEBEfPalrZc/9zsXf/prT2/tFoWGhYV2a3om7xIAVJqXAkAwzQqN5wxdv/2kRcDg8/t4TYA75WNTngMNJdM1iFvWe5Qq1vO5wWa/EMh3wyPkVplp3lwTSRPQsKKqX1agAWB+trNwZm325MJ0FxBTLDfh8FARoZtwxMA6SZPf+teeEZukElifxFmmQXRKOuJOacVcf6S0apZD8/m6E8/2pmBpkVwUwG2bIsgHn8AqoxZ7/T3M3untrIvRIBOOA/zM7XbrISnOQipcVr5bhiLX+gv3P1qmEt6LEFCDC0MINLtOFJ0F9vyJNJrdr5PYTjSkNkOIE0K9o2PW3fu6Dk74WI5cnQgKLU4E8IrQ3zWgr2wNgnBhi9f50epvsHrfdh2uTqjZoMjjJiZaW0U5SlI5kQjnw4iyIU98Sn0jfBSUEjKGtGQ+wHHsfh0zyshnIKNiHEzYOx7C2gHsthESEdfKAL9EJeG6BNGIABC+8vxG/9c+ff4nP/KJcz//8oV+OT2lYG4myxUSajJVq6zGsoYuAJCQMT+nGzEKVGY8+8ZloZ3iQ6EoQ2IreJC8Y0/uwbImtFOTtoGTXjHXs97ny9xYyT4InAlj7WKeQxARFSoChLKCajCqSGuC5fne3B03Ln7ghvXZWa1LyrJ2emYSDoVEGx15EJqsTtKstxDlL+HLsF6xkNGlIEgke4/eg+hEspl+DVZkI0ZEZ3CQogZjYgS1wbBFQWw/E0mFudfoE65n2O9aUY4ZtUE5757nXzH3S7cNgbwfFpTOFH4W+BoBEWSIILjWdKb5eXGGg5VWt2TbdhwZIZaXU8kUngx4xyiUAYyjrA3XAAAvy2J1KZx2lqqGUJA8KqOyLCNimYs74VKopV5Gf7288Rg4G1hF/l3CBILVGLqMoXDmo/AgiWuc3orJJtG1+IkltFGEhJ6LDtdsCbMlMLv95oZUW2Od5vDrEVmWA2KOv/ip55768KfO/eCTz1x5vqo0zHQznOpkrTxTmSYgLeZUX1dXLqbyDeK6KVz41L5B3w7EQRZtTxQEUi5Kq9hbEhAvigHfliIJd93UaIcG3R/eUtjlzDAj2toIo5EmXRIszXa7t9+48L6bT8/dsrIwjVqnesEJh0MiAI40QqYQAIAL4LlcTn8CmozLqCvXrpYBGOlGSXZGPryPHsV3jUgGZ5jGwxyjIpmsjS9wxoMcowIcVcNkORwjFOVAcvfmUVAIqMALD5NjzqvxshaIcZM7Z5IDouR+f9ItxK4Z1+znuzLrovi6yLVBCKp0IIJCTDp6YiBUrWeKxqgYHENmGv2IoV7DSK95mkEKNMZqMWofVLtwZ2J59JfUlry6GKyr2MakgQJMWwZPLoQcmR1w3DzsyHr30rk7DftREITL6sRcLQ+LvgEoknES/5reWf2GzQI2ouETIQBQW/aZcH2htBlFiBl+8enNL375ma1PXd4odDvLYGG20+118rbWpMtKVwAICgHQFaUAoECoxjnfGB6roW5PAqDnUCH8EaoYa88KNkvquNU0sdnc+JwAOEIX0VDIZaF1VRLMTLWy0+uzt62vTd/XbWcIacOghEMi1QC4DhCbkl7juKpQYsIPeQEmKOubA4SmgfFNImXaRDBIq0K+dUWrwpRUAHRp11FBKkHusildN5WDPwJ7dwrztAvAMYaZMLUlAcCSAKIOoCCNnO/EBbLIi7lb5s0dod0NMI4UNDj/whgwdouMifmTYrmLWVmuPAmAXNIthV8nE3HuvXCwSPz2+jmKVqHU2uI75gsaLEeUt7J9ecMTAcmakSw8IJZcOcoJ3NHAvrU3D2JoLhqLpR9cwmSB9QX7/8p/507ykGRqPsPxUSDCCcF+p47EBOJUJhDLQ8DKlE9tcvdkPiEkGng8Lt3K1g6Wy03A10IR1yRch8AcAAgubPUHT3x1499/8atXXtzeJZif7aq5mXYbAKCqqGJbls3bgNyS3YEzfeULZ+jWngCORIlp3Gey+mVS3n7mLkPF6a5DtpXliMCPQajcYDBW9BUA1zRwJ23IgBQSKtRYlZUeFRW0WgqWFlvzi/Ptu/JWlgEQoOokYyHhwEjRpaMM6yRrgpEm0NQ0UzodaOPtNnkpiE/F/gyM5+Z5iyBwRAOEF8T7sUR2bYBGTShPW1O00UD1Y9cAZtG/V/zKi3YS8eMHyqIFfRbC8XZWs6Wj7FzvyCkhb2zFBtwWBaf8HWRUWNyekHNi6n0YA0RscWGvUUrlKlMtRGXX2yZcW9hy02hLq3knn3gbVic35L9ft166QaGO+1YRZESoXpGF28TX7+sqWR4AmPQlEtSU/TwEBDb3VjpwrbyVhHCCgQi5AoWuuj4BT9iO9zeSagqLSaES3JB5D6FZYF8c4PuXTcY7adF9iIAA0Wx5Ijyt0UE/e8LRBOkBISK8fGGLPvXEhV/+jd8+/29fOD/Y7XRbMDvTyVu5ygGMgGgnRijsUIYkOwFYa7ldUPh4RKrG7e2owDv2bkmKK7Ia7GpJbFrHj4akvDDQr/UWMXdGQQMyvC7zelAUVTUalrqlNCzMqs78bH5Tlilj6KbNrxIOgVRl+kgDbeEwKLWGyhUUYesO7PuIreRtoZCdD+fMo2vnWH1/K9ddsA2gIFgFcQquoE98LTBvQDKUas9bbReZHz6KJgqj2DNk+VENQCSWHngSIon3cQMBVICg3HPAG0J4saYw+T4o5yPb1sCOmcgRNMed4SqfN/lwGCff1PPhTa/kfwoAlDXcjQwrhZlSKleqeX15wusJNvysvKD9zki5aGVgxFkpE46WIAj8tw/uoNS1RobQbYkGVpSFULLyJa8hg1thKN++PbLzT0REGqzuBARChQTK9KY1gdbMd0RMccIkQgFHEN2XaqTNiRsBgAYEbVket4sQSG8jdlK4D2wSV6f3Ano0mLE1CDXsbADv6XMFFAQAFaQ7pTn8OEDripRS+MkvvnTx418495NffX7r2VFZQa+bQa+b21oARJXmmRF9oKnJEAWIlXHDXUPDVbrrRr9DtETQkb3gA1OCPqD6UBiB7NfVvGmD8WlPnvGCA8wwAwQcjXQ5HFQVQgWz05jNzWTrnXZLpWBXwmGRJOY6Q6SymklSp6UiRGxpkzILXo+1B/c2FIVebZzZg/vDeBVuGwfZVsgsBBG1s+lkORxHGLY+86tdnDM0XmKFPNp/BHvlTQP3O5LfmACTB73p0PxsWt7AunIu9gCAhKgg2+cJSHid4TKe2QCUURuQchJ/Z4f7HgVlG9AF+6K2VYU7ASC3L0SnMh1nagxR99gYLjg5YEcCCJQr0oC27Khz7ilQNkiHFMJa4z0mY9EmyjGAseLva/+LZmFhowMPN+Fogsik+H/1hY2Xn3lh47e3Nvs6A4KZqbzV7WRt0qCrCjTP4N6fbnolEDvj8fla02BxajD7h+GnA32qpiHsgyZd77JjEABgVEDZH+pCE0Cnq2B+pnVittfqKsgg1QFIOAzypFqPMAisswO5i5MTeWbSLWACEN4xhCnOvq8a949xA8vWA4L3pTD6xeEqfoeO5gx4B+ct+WNE0ek4q9ZmHnjilQwzCrxQmtlYm5SbHKdjCbuYXqGdMm1AltipBjCS4owJ+6i4id+KuO0NpNHhbxLKppuySTx2NhtFiUci8Pp5l262eAlddoKZ9EkhkgIkhairV+0PlHCVQODEfE4AIbmcyjreofNCXEoicnG8/MU1HljLsux6gzCkFHz+ttDa0vkP9m3zL5FDSqxmkbsgIEEQ+ziu+YRFWRJilkyGSQURIGgri5YEsDkoSACo0OaF+K+Y52f0TBYA+UpBNsfOmgMYyJpzu1jk0I/Ddt8oK16G7b39AgXQ9pGyKVrJmzkmyLIWVNUINrYH21995vIvfO3phff07lAnZnpZVhR5azjQo7LSVYaIlIHSYdUqAHCxe6eLESIyE8BlULm6Fy7vL3LtSarsmMliCj9I6xJXSxvYmd2+5ot7zLzt7PY0QKHvCYOeFZgaREVF5bCAalQBdDsZzM91ltYWuycrGl1O+jnhMEgZANcBiKAkMuyo9SXGur4U/IhWIphFTRcEB/bDPjoouu0epwUbO7avxgHhOOsj4fpHwxe/lyxQ9PpqltvLaG38MIXPXGQAR5QZP8AIAEohZgpzxKsZUcKrC0sQKeUKjJLYbq+Gxm/scLGgcZrWydEYOcdIa/KcMH488frZ+P6JRD0SQACyO0yIlUiNX54j1QU7P2bnk6sdS12gonvXj6O3X3i/lD2vSLheUJYDUiqDl8/v6M9+eeNXPv6Fi//5xYvDfreXw+xMO88yVEBAsV0Xai5xhidVrr/ijtM4ZQix1dlkQ8d3qs/psO+ZOkTMn0KyAQmZvnNMcaVJFyWVRQmAoGB+uj17crV3z41ri5hnCFnWTvZCwoGQCIAjDARe0CzWNgMA8fTJ1Dz7IwJsIfBWVhwsCmr4kdeX4ZZWYuV0jVKQSVTcSUjT8noot6OLuKk3AMAN3PXG4wXwxV0I/L25wrUpgK0G1W6zcZ5wXaKVd2MC30SzbHphEyfkIgC8MV+N7fcVKFDKelTs0l2HNgPBnmcDJLraxi6M1W0LDbFTSaTN85hn2G7lakoppVJtn2sNs+5fKcyzTOUKAYA0EGmzrN7xPdZQExux+v0eI5lhxebXFASV2Jzek8odwMkN/3BFdgwWlIZZCi6Sy4kw3LcLBfOPiTuJWgKISIlMPQIgr0vc96nsl+uKUbByQ/TOf1AvR8zDHOhEocvs8UBG2ZZwMgONP66gmhsw2H1VeYcC0zlpJ7OZa5hw3aOqCsqyHD/y2y8+9Wufv/xPvvbS7osECqamMmx3MM8zyFg6RWk+AOAiq96WdDZl5IM7cbQ2r9SDJF4YOSen2zlNxdxU1JkKWFg7A3B9LaffwT9QJIoIWn3MtbhsJqCrT8QjRo7/u1QyMiRAoYkqgrnpVveGE1PvPLnaWyrKknQyFhIOiEQAXA8gqIBAM2+J43YkPQAhGUSXQqp17/f79Nk0iH0vt8aqJxvEvRt7TEgIUZexuqTUdlsLQvL1y8LIa9OD0CyNOPYMGDOdiTUy034ry/JWnnUzNGnnWZ62+LnWyJTKs0xlCgEQNPg1l80K8dXQS0GvkX9Vu59QhoG6jh2yBq1pzExolu5EAUwkVD4luXXQYKoAyB1H3G4SY7IB5PU1qbgKAb5amfcynWTtuEJrBYgt/NKzm196/uz2k8NBCe0MoNfBVp5jroGg0j4uFRCj+yCUqlDSa12MUbKvSJ/HsYUG+OUw8n7+qZDny7LSValhupPlJ1d6960v986szE+lhyfhwFDNta4TjgLIWXWUcYTSKgnzmyl/jriD+xGFgZl5hECR+u1PoMEkBMGEGsbTqVOZYiUGQ1EX0iCtr7CKqlq7NC4eiIlMGX5ALniwL5FrAkCQt5BwfaMoB+7LRgQlCDHwMXiwMifjByKgKpJJRMAUXGTABRWY7Qe/0xaAr9rOEQaUz6WZvUlIuIks+z2wTQDAPJe5UlkrU71MoYo2HUh43YGACCpT2M4VZkp5zWUCQ4iBHLjLfMSHfMqSAcsXZ4KI47HaEiag2x0grvVHHE0lu9WraOOLrmNEANR/jAzbT2OqT2XeKk325SQh+v5Ls3sjgvZbl2GQaQfo/ud8AXttUD7ICydYWRTzPkRmgRVrlHO/bCGctCBh273g0pMkNhSQrGySueODDAAquLy5O3zhpa2Pnju3PShHJUz3VN7tqBYRUKmpsptYIAfMjchQIHbB/M82MM/BPJ+KSZ5E5J9rCHiL01up3pKo57sCCNvZjqIWwPLGsugZnHfvxmjnDLIZWMrkCaJSZkPAUaF1WZQw1c6y9aXeDWtLvZu7nRwPzIgkHHukDIDrBWi3dMSg1H/cxmcR+WOB9hobIBoTZh8XiWo6T9GRfSP3waJEwdYane2dPWADhA0MTHJ9jIEAmZOBmHmKKaGmsFfTwyOfkcYO/LuxUr3HwyKNcUM22F0MtS6qSmuAKhEA1xiIAJmCVqZAKZDk0J7XvGLvJfDBrra3fQY6VhcjAGLSp5OKqtyNvrZwEZOMIEZtqEn5jQl8iiubUDcprgY8rVOjUk44DiDqE6CCF89v6Wde2Pr4l5/ZfGpje6S73Rynp/KWQkDSmsympRARmvv0HbwLpbxRZvcSQbwK2RxjmJP43dQrCf5AIYBSxm8rS12NRpraucLlhe7y8kLnznY7awEQZFn3Fc87Cdc/FAUJJwlHC95fQEfwW1cimMoxjHICE/Ui8ih4ymArc7ejgI2AMskfRBTCuFcQGQDP9DPP79ZHA9cgCPOewuwDXuPqP7OMzCIAKgJQxDErvizJ9XFDblPkkeXRRvHZe7LPhVhvCrzkzq/V57WxNirlJnquw0MAQDbOCrxGUJitVs7dsyfXE/IU71Ju/AUm0GqEu6xMGcBWjq1uGxdaLeyY8aai2NcSiKYoY6ZQGT2ERNouEnX6zQd3fLTUblEi1vhLh97tJmD1s99n2jSsZxB4IquWUYpkg70syyKQG7h8fi/rWn0KGx0j85lBmYyHvJWn4lKTCbYDKAfUCGgWAVg5JPd9C2bfVQSIo5ghke6ike4aXp/sagdxtBJ9zQACmxXI0snZUQBmzXNoS/gaRjaca98AUPv1/TsmTAKUMqUfvvzslc//1pOXf/rFi8OdvN2Cmel2lmeoeIcntvPY9iUQxS/B2oei1hVhYOUCgLCJSWSyItfuAeeR++cBRLTJPgPgnx0gJ+2+D/98OjsipgHcs2VtEa4JgNbQdrUIAEChsfKLUutRQZTnChYXOjMLC+272i3sABBonWyFhP2h0ox+fcGzia8Cex4IRzM/OZ4k9WcwVncHjmTJRrGh60+H+QQEgKTChgnHDcwdeSYrPBcgWIPCy0fGC2n96Bje3h1nT29MUzBb/CgELEqt+4NSgwJYWekunD458/aF2W7PJGulSf1aQyG0DFFj+Zjg+6x/wYdZn7qvpnolQVHJY+3RD49BE5EmIlSAmKFKdOokw86zCG1UNjIazIpeCtnf8VR9PRLK7wIx2VNApTC9ckER1d0SjiGqckh51sZnz+6c+8xXNv/9CxeG51ApmOq1IG+pDJFLQYOlVgWhf6g7oQ0C1IX7wCbqXhcdpJPIOI7HH5ELNgphQhxVCVVRglaZgpnpVmtmurWe59h6ZRNFwnGCSoJyhMGV820kM1g7byJGyOuQTTsfEnUr5Hl9vVRWnq4Pf/ugPLh9r/1g7LEwWmXX8JMLY8l7mMvAxSjsemlfHdWuR40UKUd4WfmT6Mx6cjo0aRKOExCwQsSMCQBC+3yQLJDJESyw8S0bq3W/eeJFL/5uIavYUkCy9VaWXdV1P1+LOgEiGwcAXDzWru0bFlWxtTMcatCwvjbVu/eulXe94baVR9aXZgBAgVKtJNDXBLwNICgu78/bANYKr5ILaNq34PKTajUCwOpSYBlDH9vnTCgXWeKRWNlya1cjWTMC7a5Bq3oDjjSI/NrXNqRGhKS16RURIMswVwpbfPeESQW5ZDqe31nHkA29o5UR4Bk09D5M0gB6WyGULXCy5aTeRi2NbjX/xXIbV1klti9cnxIs5wgAOAL3OuE4odIEF7cG8DvPXPni82d3f2c41JBnCtrtLFd5llkdZaL+QDajhIvoeCXFzj1nxzKcrWxTA/i3n+fJtQscamc6WGl3+hecnPscL763tTUiG8E/rMKutva6+wGu48LPG9oJCLHSREWhK0OO5Djdy5fyzGYLJj2dcACkDIAjj/gblAorOucrQR2sW5Qv2IJsvltjBzTmPs1dHaLviHyweYguxdFmZ+9/h4TrExiGyqPU+ZpUcjVMEOl8sZtWk6Zm2Q6Jp6jNXhkAClWWQVZVWvcHxWgwLHS3hXDnTXOr737r6b/5jjefenR9eRqINCDmSW2/jsjs9pIICBliK8sw46J9bCZ61DIAxmlBATyYShwnP2NvUG+MRFSbApjXEiay1sZGVQogV6CUgva4PhOuNaybrwl0RUH2b/xtcSAx3CkI+ReOu278QQCebAPxvAoxcdYJFy88fBcJ1w0UFFUJT3z1xeH5S7u/s3VlVGnS0OmorNXKcgQErUGDrhfr28MibUTTFfXZey9pxOaObCf7yfGBzou+ERGVIqU16aIirQGg1VLQ62TT7VzlfjAJCXsjp+QoHXEgIGBlHG5wUSE/m1vjgLMA+BD59XvsM5vzPhoF4AuKckQhMBFI9B/bEsS3YQZUKGnybQLVbWnQ2Bgma0L7CCz3Qe5z2qAsr7vSHH5Lwn38QISaCCviRX8gWHrwMkEcnRJunFs7ax8nJ8eujZ/Vyfbrrw0jXWDPxCpW9mQiAf5ZVKhRV6R3rgyHHYXdlfmues+jJ97S68K/KHT1x//jLzz5yUQAvL7gdZyICHmeTeW5ylAhaI4cIaBZpmkVE7KAeI+q6QsLfXDkddOmv6aBYPQCo3Os/905L3fI2WL2BbtXrpSFl2jbjUmdUYiQZZhnMq0gYcJgVrxpTaOqpELb2c9Q4jbPw8kk2wF2Mb6rO8oKD0KZtfV3XM0dYi+dxPSPQjQEJeakKjIOCESVdAAEV7NA3IwIk6gdX6gcQBcAAPDyhe1PPP/ylctzM9lKr4Nqupu1tkZU6gq0KRHlq+6wquZkUxZJZw07PWh/uwdARPyd3GEgp74X8uYv8CNk7mYfjbr+le/QVQmw/Zjnx92KgkfJ2reiBoDV4pUlACpN0Oko6HWzmaluqys/T0LCXkjVfa8DIEBWZyvtj7TZolS8ANJ4dO+jvg47qr1iX436SZoePsLm7h7EJ3wHCsEsUvVrwcQnSYrwOIIItBGTfeTQXwGOCYsWbh9UgkIzN35majGyEEZ8McswUwrUoF+NLl8eDkbDEk6vdvAdD6/d883vuenHPvCuO+4hKgkxQ1SpKNvrAUfyKFR5pqZbmVKojH4ywdbYE4+18X6OszQrgzvvc11w+R4nMXxrfu+pnJ0sK4RMoVIK0tqTCUS7PY8AGpTKcDTSO1UJJWpPSDqZcjUBgUuNAf+42TZa0sfngkPhaXespt0axPYgVgQ/UykudbyRZzmYLQEBnnt553NfeubK5y9sDIt2S8FUL8tRodIaNJAvrG+mfF6UUkdd9iy7P6YwX/PVJP6NzskHQDwQtW5jtT5O1GPTW/SHAKA16aKkqtLmYKetOtO9bDbL1B6dJiR45HsbAgkTjbiak6EK7fpiBE2aF6IGLCcA+8p1VeltAAwO+Ago9xQzqvF5r/mYDA1uhXI7NnkGG/4VrhUHKlzgwjO46LUjAlLtMyccDxCvjWbu30bXbZSW0O5A4Ul66aJ5SxnABbEcieAWdjtOyjlvhuVnsUcZ9yInt/aUuJvryj6+CAoVag16MILi8taozFqQr8634esfO/2oUtn/9r7Hb/1DqNRTZCMkCa8xRN2UVo5T7VxlGSKQBrAqtqZkuGK0WWAKJqqPgeiIkigEoRblcygVahBs9aQWeVVne5A7X8jdU7gfG44iEXVC7wgaD1ETkQYCVAh5prJcKRiVBSEiZnkXq3KQFOsEoNLGXUZEyDOcbpl6DViVJoaOjgC1wmgnUbIS4CSEvCwKg0EEASKbAb0oBZl86PuQXaG7HhwF4e5Lrr468KbutvZ5WnZyTNHKM6iqDFp5jrfdsPjUZ57c+Fe33jD3hpOr3bWpHiqVFagBzHomtIv/WTbJJQB4vtMKLYukI3Wdg83zcUTeNjBabNt6G9heK3S1Y9sC7tUaJS77CkWHbKxIn5/8Qh0Kl5yRuZ6qCqqqNEe7bdWZm22vzUy1YPNKsg0S9kfKADjSMCqBACreyskgjkA1Xdfc18FvvX9k9fDTdr2/gARtZGmdMgTnjtktX8b1mXC9QysCrT1d7g3MGoIdAMAVBQqb1C9q7uqVwdi+CEqZjdcqQLq0Vfaff6k/2L5SwJm1KXzvI+tv+eZ33PAjb3nD6hoRWYcsZQK89kBQClWrraZbbcxQAVRakw5iUKZdjL3WpUa3iC5vuu6wOrdBacbdBqeNPq2ISIMGpQhaOeZ5rrru8rQZxcRAVwXkWQanVmay0ydm7lqYb89nGUBZaioLrYGAlKith84T9z/m36awJPmXERzJZM81SmX4YIwHhjX/eVTJ7T++2N29RLoaUFkB/M5T5/u/89Tmr7x8sf8CgYJON4csVxmByRbRgqYaK3CNtmO4WXbcmBovss7+fsJJsWXhHpeGM2MQUBiuA2fpEiFpIqoqItAaep28s7LQO7k01+1mKrl2Cfsjj43dhKMDtIynJiRt1j37Pc7BVQQ2rKJhRu0ZrzH9ET4gwkPR3bhf63EzGclet+1TGA0EROjVWBjBEvSoM09CFtYHDDAOr7pR2UmANKt/BEDUiuxGAJg4rmODshyy8CkADabqNR8iV4zdVUGL2H2ym/oi8BLpBgcMMZBAn/li5Y+8w+ejaCzPHHUIW3jR91E0VICkAUYlFdUu6QsbRZ61R/nJpRZ+0+On/julK/32N538bgB4WleJ7X9tYb5bpTJod9RCqwsZKIKqItIatLJShlxQBaSeQrb6iIUHgTNQ4rwqoY1t7JSzRXhvavPO6GgRN/JghwyjA/KjAHjx95tiuFIHRECG3NCUI2EnV3mnlc/whQ0JDwnXACprIwDB6ZXZ7G33r7/l4Tes/fHV1e40KQ39UVEORlVBBJApVGh2AECnc8LlzOATAUiICNrII/lwP0Agb4I59QdEZXM/6ZOTG3cNGwVuDHaXAt76PJUBTACETOV4241LL56/1H+6qOhNvW4LWi2VqQyUyb8ySszoYTRTMPhof6Af7WTLWSs+ZCR5Wr8Di5F9K6QIrC/JeuCBYYvCvjbtKbQW7KPnrW22B/yGQhK80wa4/tzeV27mICKqqopAI850W60Ti9MPri1M/dzXnt/oZ3kbq3KUlHXCWOTXegAJrxwaSFdEpX/SxTNvfHoMiz1i2KYR+0TQx1CtwVUHXF6y32jGj0S6aQgAChAVAIJCpHzcVQnHBcy5EwSmp9mrakx4SxBoDWfHYV8p8zsFHUAgyVb6BSBAVWnQlzeLfllWnZOrnfYdN8y01NvP/O6t7dGzlzeLv/2Fr13YQmwhUZEm+9cE1m1XSrc6ON1qm3T+ylRcJ0s8ojEVrUcttzwVfYwDBWeF0VdrKPsNz7O0x3eOR9HgwDmKChCQNOmqgoo0UaYQ2m2VtTr5bO2qhGsGxC5mWMHyQg/efO/aG7/h7Tf8/QffsHLv1HSudvsl9YdVWVVUoUKl0MfYaQ/RCvEqEOeRAq0VA5TthF4UVP7olQ8i4UgDFWgawdbOYLR5Zfhcf6Bpfgqx28KslUFeEelKk1YKlPL5/PX0kUjuD2YVOk9fXmrkUwS3msddt34lx1/rsPH23IkvAIggZxLTQVVp0kTQbef58mzvlsXZ7jQAJKI2YV/kSUSOLjiGREREmrQpIE3Rf6ELBI5D5E5kDEqyBDx78++IVIjG4pQkxW04AgbMswJHBMCqVxd24vGx0quFszAchiU30L1GQDMT5AptBZlkrB4btPIeFmWfrDAoABD7WTfNxp595xQZ/6BEs3NkQIinCeIGCMzeAxNwXu7djhh2GicQu1tQ0AdYcUYEKioqr1ypdKcFqtvO8htPTbe+6e03fFtVwvDhe078KIA+h5hjwAMmvEowf9Isw7zVwql2C0EhgdYmA4DQf6MsP8z3kAkmIcnUKGJ9KbWuiLs2RFgJyNc94TNxO/Ti5u7WELUFeV6oXX4QiIBIg9baCGDeybNOJ1/0V6c1ANcSWdZBgBLWFjr45ntW7n//Y6d/4PFHTrxtbbmT7ewMaWOrHI5KqFAphYonTT/nAoCNVvqJHCONJtdCO/fHiWno29RtB3udiKiKhmbWJ9uAjRObnuUk+DDsa8J1C9JDQkR8+fwWfdcfe+jJjc1iuDLb6XZbSnXbKu8PdaG1S5AKyqY4mScpTtKddyrZu8ryeZAZAXyNkf8gsM/nvLOOwUmnt+PKBMH14pmL6mnxc0r2mTGrb7nAh4JKA2kN0GopNTvTWpuZbi2fWJ59itJarYR9kDIArgcQZbXZkuovg+gQb7ezJ2I3XxiqDZEElO9ZBzra8yAx/sPBmApmT2OjV42CVqhUpg4c6ki43uAIAEE+mRPm157r714teYmofvSPx97Rh5BsyxQiIKiyJChKqi5tFn2i3d7Kci+/9/bFWQT1HbuD8uyljeGPP/XSRoGokEgnoX9VYQypLIOslatOK1PW2SfSpMnsRcW7P3mSUopeyJnu8/VEySn1OL/rs3YeUfBI4yAmBJu2IDtEAFNhutKkNWKWtZRqd/KlG06vqOhjJbzOwGwKQZdAVNEHHr3hgfc/dvp7H39o7V3ra92sGFWwsVkU2zt6iKAgy1ARaGB/GwD2Fz0hVbEb0tx+PCwBQD7raYxjTw3HEhIcTDbKxtbw6fMX+hunlrrr7ZbCXidrDUZUVhVVSiEyRSrcb48x0faxWSkBBRZBmMDjdLN5G2poNgD225RI8Gxy3uDHicftZodKE1UaIMsQe71sbrqXLeUZIuxp5yQkAOSpAsDRBSs6GwlXLvTDmoLLmSGvOgUImXxwmiZWZLxGyqmuSNs5telyk0J+FeQ7NJFYH+n09w9yDqyGJMu6ou8muKmIcJEr+Q4aiDQgaVBIKhVBOY7g6JYVBnLiB4hhwR9yAmSv9CUtHH8v/KRmZwvAzeZuRYEvq+7au8ICtqd4q3ZvnIeRMteTNaJRgRoVVXl5i/p5K5s+uTqt7rplbvYbHz/9V4aD0cX7bl3+WQDcTMsBXm2YP2WeKdXKs7bKMoAKoNJEpDWhQhNsdXutm2+VI51oiVejis3qE/7uQ5OVgiitq97uIKXSe/q1Obwhw6tOGzA3a9epinxWQgINGkoi0ACglMJuK5vvtbMWAqZFpdcIed5D0AUQVfTIG06c+j1fd/O3veOtp77pxlPTndGghEsbo3J3txpWFVW5ogwV+/PCFyCOUgKw8kEAkNO43MHH+zBhuBIj/RlENkk29IFPuQuAu8anYBldybUCiAAJK9F5wrGFseUuXO4///zZ7a/ecmpqZXmhnXe7eQY7GitNVQ6YubIWUoe6tS+8pI+cPSDeCXvW/HbvkTypS0Z3E1O9vHDK2atjiNtx7908L58AfjzY9W/Qtnw/u52RIQA05BnCTC+fmZnK11qZygCg3OcPm3DMkTIArgtghTbl2UFUGjWKD23E3J2P+xh3ImqzTwAoCnzyUEJ4l4rNiLrbFHRZ85UAQNYVMlqTNCCZYjAqU6kGwLEFKUCyzwOv4WuQQYRaEswrkZYwlhCU4wzbUSj99es9VeFsZUTMM8gqjdVwRMXFjVFfKdVbnGurN929dBIq/YOjEnYvb5U/dW5jBxC7SJS2ant1QACgoNvOO6281cVMQVVpqCqtNWmtQGUIZis2YNtQWm/2XxcJRRQyAHA4qdujrVWrQunHp2v8VdwdPyuWQSNNBJlCmOrkizO9VifPslGpq0OMN+HVQlWNgKiih+5eO/G+t5751ne8+eQfuunMbE9XBOfO9oebV4pdAoAsw8zVomiMumOkqzz8XF0XlcPCkQS1NS3R3ffdLSDN4ccZaIM55y71X372xSsfv3Tb/AMry53ZdidTJvIPYIUIffgo6iN4d/hpMX6EXGAs6E+GCvZ+yva7Fzcjaz6EBC45W56AQFdaVyVBjgpne/nUTK+13sozBYCQ5T2syn6yAxIaoZJuPeKwvg1q0EAIRMpwkWiL6bqGCFxD1G38Q+gCTi7WJPcNBgCQlURkCNW+Z9fKrbUGqQ5tRKtR/ciW0XjsOeKAGL9nTgNJXI8AhCbeq80nU0rlWZblAACI/w977x1vyXGdB36nqvvGl+O8eZOBQSYyQSKRYCZFilRarS1ZzgpeWbIcZEte27Rl/SStbGttOe3a3vX6J1u2JQeJkpjFTJAURTCBBAmASDOY+PJ7N3V31dk/KnR13/vezJBIg+kPuPPu7a6q7nu76tTJp4qDulLg1UgCUhAkCYig0G++aTvFFNv8GcEE9SkDvP+A6+4WinvBj+ktXMWbMV2ZIXxujhEi/7D51v9n+udHBREECSFAlAx0urre729uDbjdjnHL9XMH3nT3/r//+jsXX39wodUAFIiq8oDPDQjMKbcbUatRixoggUwDmdZaa9YuDCm0OgXl1cEAa8qfv5kNNMIV1NJBcmSYRs4t7y8Qkld3zfC6HNDM8GU6eoJtyrIXqTcxAZrACogE0Vgrmpscr00mWVJlZ38RQCSJAFx7ZHrigbuWfvC7XnPgb11/bHKWFWN9faA6O6qfZaxMWyZjHWSwZmadKxXN47ZmTA4Jmd9sYfdU5BUiAhpl6R/BMRhu2hf36FxACpWZVLiEFV8CPb5t6+dyxZ1WALQacBzV6dxasvrU6c5Hz2/2NzQx6nUBKVmYSW42ckMLRzGcRUu/O+ZyUZCnygG9DfnbgC6G+/PI6/jkVHn2TeN14Mizo8MA7JrwjqzBDfq7smvMrVZzdeHvQ2tTkSYSAmPNuDHWrC3FMgJAqIIBK+yFaM9MlhUuCxhHVGSh4M7kGLtcLekftP+0G3Ug5An7MNyuoABgr0Ao3NOI5rtcKb/nXdqzV0IEGteQC3XBDkwABISUsfQeABUFvOJAECQo8t5/9qB7z4U3rg/5PdmZEVx/KjXzAxXfFGaxHad0bMjcutdHf6O5RYAgiUjGHCnFqtPN+mBARrI53orola+YvSFJ019JVfZzW92zH1nf6leeAM8JzBOYbNdmGzXZAMgqAMA68LKys6bUl/NkzkNzZwR1Gppxu96On68ju3F5ghuq7iaV8R4NKHcxAaWZ+ppYK0ASYawdzU5PxPv2zY8/S1WJ9hcURJIkAYeXJxr33bn/TW+698DfvOX6mYVYCpw+00s3N9NupqHjmCISJGCEf2YOyN8IahPMh1FXtf/m9Kx4ZhR8W6a8tm84tdwXQkiAw3+Ly8R5cVXT7UqH0sCTp1azN9991cMrm4OzivlgI5aIJISwUvQoFXuocSpQuNLeXOSNgznIoR3fhQMU+VV/qaGVMYLgh2ddwtiRMlgenjA0MgEhr681tFJgQUTNehQ369GslELszeNXqPCc1Hqp8GLBVgCAZh1raGjS5okSwQvEzthTIo5lHX2u5bSv3NJpaB6jYCQI9aAU+hlQEEXtNZaWMXaa0ZAfDm7LZfIvcAGjvjcDHIhXjpFxegIpRRRFsu6/YIUrA3kcvw78XOwcpbwUlp/9yKtIoKQiCJOxc+k1dN1gfYTrZ5cuudLLWbycVc3cb165wDooaHZ6NtPcVLsUzOBuXw9W1weDTi/FwmxTvPq2hdvecPfyz91109zNc1N1AAoyalSr4DuAFAIHF2Zoeqy21IxlDQpQGaCZmAOC5Q3r9qkTcVHwL80EtlZW8vlRbD+EtJFzp6wh+hzMoXCi5XEjKMwzM4RhHZ2BatQXtgowrVirjCEATLSiqenJ+FC7KZtZVlWaeKFgvHgYizNjeO0rD7z5Xa8/+o9vv37uQCOW2N7OeLuT9QeZTkmApCRJ1iRvlE5mDlKBCSAQmIg05XlRglngSBICpVLhWHlz5vyPnajCEtucyIb0LbhQ7upiVfh2HThTLkMVrlHhigUzI45qdGald2Zta3A6U4woIsRSCCkgzBzRZr/P8+MVBfuADoeU1s/VIW1qGIznFkCZGSjr10aqIYo34f84Hy/LK1jCXPrmnofPE2TY/oIEiEhr5iwzCzyOIeo1GpcSsWdMKlTYBSLghStchjAqRAZDaxYMmwuV7J5bsDU50hQwqIGHtGMac+FlV0E80OgXGYVdNKBD3MTowfMjjjC7IcttSwyI/7I2W7cgGUtRX5ydrASfKwpeAWBdU8lzkkUBv9CywACHwlFx2FCpNjytRm367sruNTTjA6/xEQMW/Wk5d+jWYCYBimMRg0BbO0l/Zb0/6CUa83Mt+epbF+978z3Lf/fWa+euZ06ZtYKgZrUWvg1EUYMyNeCp8VpjZqJ2VbMmalAaWpm0piAjTuU50qwzKjjXdwagYEbshlz3OrpNme3087rgxh2eLdNccpPcR4Xl7tz57SrNnGYaxMB4Kxqbmahd3W5EDQAQsl7Np+cZRvjXWJhs495bl+78rvsP/co9ty4emWzXsbKa6HMrg26SsRIRRSKCJFFUPLpnC/IpSuG31JECTC7ElClaWRlacLoL+hcpaokqBhEHQ9csn6qKmFcoQCNTKda3+v2t7cHJNFUsiBBHQsiIopz/4yGql2NEZv/S/C3MfB6moDkHvcf09EosLkzjfDWEigDHg4/gh61CLPfCKRrynFFDMXSqtNbQkJJFHHNTCBaVAqDChSCqCIDLG4Z2EAgkyPOClgE1GkbvFGBOjaIJYfzTCIHIvbPGLhNe4GWr4r4+xFc4ZjO8mmszbE1wJf3KNgZv/SwoGowPhAagGWBtiGZEJGMpaqYSQDW/rxQUvVqKGzoAcLBzu1g+2PN2LpdNtu6sW2dUWB+jOA0rRBnXQXd9s+ic8SD0tCmwEnZ9efbAutMYO4F35/HrTQoiIUBKs97u6sHKepINBoxD+8cbD9y1/21veNWBn33trQf3a50yI0McVUqAS4XWRqk4PVGbmJ2sX9esiUgphSxT0IXQZcct2uDlIG7Tz0g30TwRLjGSZcNSTnJHUrGiMqFIeEMvK0cyrYdV7gvjpnFR2WTumECKmZNMMwEYb0aNuYn68bFmNAFUfOXzDUExASmYM37tXUuv/oG3HP5399w2f+1US6Kzk2F9I+13uqrPDBYC5FOhsZP381wS3rVuFLNn524o9BROF5RRw4qBQJmUK+zd/PaegJYmYniKh/S1wH2YseRz8VtWeDnAzJATZ9e40x2cSPqZJmbUIiHiSAgSEDqQrz1ddFOwKHpDEHwlAPt/aeqPIIp+Lhcb5/yp58CDew7m/S7yuOevw5xcDOsN44Ym+PXLbKpdARBExMxQyuxGUhKiSNSEQH3Ut6pQIUQ0clOocNmACBBEkERCsI8qcpwA+72ZrZOpCS0aCmUuivwYohuuAwX6yFG9RxqgCuDg37C7p44cCmYjvzMce2NaMYiZiV1m7QgQsaCatDxPHNUpzQYVJbwC4dLvhYJWLv34JBn+dE4OQ8H8wtcZWj8XcWfl3hxen5zTIfkSg54hsPnkiRhSQCASUJr06kbSURk39y02a8cOTrZe+0p8X7+vV++9efnXmNNTRHFF6y8RzBpzUy2679alfXPT9eONulEApJnSztIf1EJ1c4tyDal7lCNQJrU+tpRHNSseLfB2PHraBed9GNaosUoHnbJLgzlNla5HQo434/rcZP2qsWbcNG0rcvp8gSgiU9aW+Q13H77mz77r+K+//p6lmyfHa1hb7WFlNe33BlkCBkuzvwszFQl5PVKDUU/JxUAz4FKfFCcZj9jZ93zcxc5cmmsj2AT72WvIwi/vDAYVrargQSTBbKra9XrZ+V43SXWqZBwRxbGMsoQzS5BtCOruE9a4PVmuk51dwIvhQ8K9e+eia5x6frfRy+AR74ptCeU7Hv0N7FGreHZ0mhnQmjWzKdkqhahViVorXAyqMoCXM8KNlUiYBADCm3nYV+C1zcj+6yxWTuZ2mvvC2EW2c1jAyS8+wiPan99t7x8+F7bPTVOjrjg8Avx3YQAkSEohpBCFSMQKVxCGeE3zIuEsoC5SUIMJ2jHBZRX+JVzPzl8KKlk4a1gBwedcq1Y8FarnODxH4VG7mgmRhMgUOE053dpR/WY9kbMzdXn9VVMTiukvdjK1cf3V878uJLaJYmJOqzVx0WDUYkFzU/UjC7ONw62GiFSmkaVaE1tqi+KsKSk3PS9W9mr2xMnVkw7670U3i7Q4FLYCGuqF+WC08nQqXM1EzwImhEwQEWvmNNVa17UYa0bR7GR9X7tlPAAqsvr8QIqYAAVm5rfce+SGH3zLsX/+mjuXbp+ZamB7J8PKetLf6mQ9MCAjRCRsHict2BEw/5iHEkGGinrrm0L+jT2BXfrkYv3wfryLtcCdcyb9wlw1n70wVgq7ovKtV7iioXWfiSQBQLenzm/vpL0kUQ0pQHFEcpAg0xoaBAGZ7+NFOpqL1cylmU6OBlpw2K+IXDEPv15ykwKGFsju/GthzAKsKs2xEuy9Za0jWV42wKxlbS8spSDjAXAxV61wpSOqJsjlDQ5euR+eYUtt+h/zYlOnmkSxXzhOCE8+LFUziYRCRtWwGpy/zTkPCkZgx5S6XtbyOvQtdlc1UJmGOlN/6by3PUgSQpIhgkSorP9XCELGk1i6FeC2de8NQ35KhyGsJtmla+slJQr+BBLUrvsr+9lYnsneTmwXSb4mdmOlc8EN7Gpv5ak92JUkIoYUTFoKmWXIVteSLphbi4tj8oZrZyY3eslPnN/qfXOQqt9/5tmdPlGdmKs1cbGo1WQ8O1m/am6yPl2PBWWZ5izTmmBcMIWRo8CB0tS5MVHZpAQgp1hDCQJcd/+XR50PMBzVOvqxuoiDXNFl79PHpgTCFxFJgoAGJ4lSSsuo0ZBicrw23WxG06ZVVV71uYaUTdJshP/7bju4/0feefyfveM1h163MNek1fUEK2uDZLurE8XMsSQprPDPTAwWRoJxiXsB2BwobGlSSdtoUCh3UlQfFJpyqOUvzGkO5qkRUgoKL8rbD1dnK41pmIiRs7xCBdiIkE5Pr25sp5u9QTYlpKBaRIJAYMWapdtYQwEdQ7STOVgOxEOk1y2Y4t7sdWzDUzfsXJroQ+62XPzoVBV5O3IyP1mibZ0UjO3CaS58eAKDtU2AJYSAlCKSgmT5G1WoUEblAfAyAGsGa844DMwPX5yTnF1LlXhJ3h7N5f3y1Xa5iWGrwcgxLMMxeuQiA1G4P98m1NEGfKwloASABCR8Dfiq0MWVg9HzCnBK9CCib2QeH7Jz0y2X0GLlRgmVYIEAxmCXv2LUEvPT3stauVN2HlRTnuvu30DzH6rF/HcxUQHSpAFDf6CTjc1U1JtJa3yyQbdeP7vcT5JfSVPV3elm7z2/0oGgGmlOKu5gD0jZIIARRzKabNcOT7XjViwIvX7GqVLKWC2tQwnICFywQgwV2cfic7bwDKE9PjR9R2uZihM3oN8B4XSzy2khmMvTPfgUeKCamWZmqtas00wrzUC9HqHdrrXqtag26p4qfGeQskFaD8DM/JpXHjz6fW869itvePWB1y0vtKnTU1hZHSQb20lPZ1o5gYHZ6TERCs7slJtWqzlSBWWbBm8L82F0KXV7zvXMI6PL0lXQlINZX7xEEMSXCzM+l4agkaqAChV2eun22lay0u2rg5PjUtYiKYgUaTb5oCSAnKIZeJtR6TgY8EI1yFcQcHuxj6jJt1kaJsu7aBlQPu+wq/UAQzw4/FoJVP/5GD7LEGu7fggkSBKJqoJGhQuiUgBcznD5fBlpIUOorR+WKwMsh+d1AV5nmWfZL23O4Xs3SqilDPWiXiUZdg69BRwLwv5+7bkyI1sijP60D4IOrkGGuWDNzJodyRZEEMQkBEfkUyBWuBJA4RsiEQphDLC2L2HV5p6HLgjVu23Opblacudmx+76JVJMQFi6ObtkdlOmFa8XJvAs3KdTaNgvQYJJgCQY6Kc6PXu+10szbs7P1em+WxaP9frql1bX0yff+7HHv04UUSRqlOlKCbAbXALAOBJyvBXvG2vGMRFhkGmdKa2tvsg/2WF9kkvqZDRJomBSDQWoomKgWIJieOCQ9hbUUQF5pMJ8828LR63OwNi/nBojd1MhzeAs00ppsIwE1RtxXItla5dvW+HbRBQ1SOsEUgjcdsO+2R/57uP/6J0PHPqew0ttubmVYGU9yba3077OlJKurJ+2rhvCOdA7n2YqaYiKQolTHsD/dbTMvpwyy+7Zu4scwPBVSvu2V4yVvjDnzEBe7tTmKLI6exZUtgRUqAAA2OmlW2vbyemdvrppakLIKAJBCNJQLvs14Gmr4zmZA/I4gr4WFfv5tA01BiVfvVDBEHa+kD5gCJb+O56ZSl3thhAo0ow6w3ifAdB+DRsvXyHJJ8Cu6HSF3VGFALwMYP2ahXNvtkdRjlAlOB9Qt9HD7/XF+NS9ilQZOJdoxzCW2QSUjg4JUOEx55PNRWXDyLahwBbwG9p+BRKAJKKIEEmCAFhd4KtUeJkgy/r5Hk8mHwZDGO24269dZv2CU2u+UWrO7fA+o/VeKA5S1igMYeRooTviqMFLI1LpoF3STMQkCGABUgq601F94gTtumxNjdVwz82LN3W6/H+/7YGrfpw5+zoRUSxjSlWVE2A0DDWKI4qbTTnTaApBgpBlrJU21iAa1mP6TBJcoFl5g+L4u4PcCGS5WrYXC/RVbNuFh0eObpO/lq/g+OUhgU6YYTUzs2YWBMQRiVokmq6NkE3SqlfNne8QShnL/z03Lx16632Hf+ZNr9r/9qNLbZlkCufWutnGVtpLM50JYhOaYZXaVtgpqeTzFLoFoYTy2RIeNgMUH+FwSrLwXD5KLiAVzxUt94bXYCB0UnB/XKU0Zk2aNbTJZWgVUpUCoEIAF9be6aeDjZ30ZGegUyZqCGnXAzOPcjkNZ3N5VueeUrvRaIw4XhrFu/aNOh4c3sutpswqF5gQypUCdtGx32DIVjQCBAmQEJBCSCmqChoVLozKA+Byh3H5iUkIIQT5aiHEAiYsyCQFdD6gue2SC+ygKyPkyViJeDm1KZeYA84HsO1yYYaDRhS+KdHaku7Vy1wcUDx3ZXcoF30YGmDNphQgAYgFRTUpGlJwTJUC4IoDkVBEIgYJ0hDQTNC2NJbPAkCGX8jZZXKOM+z320I4gB07/IBA+suXS0EFR8Xmtg0z5SsMQxGIBWd/u2KDOR+y3ORFQlMzmMEgAUFMzBrc76vkzLm+mB5E9f0zLfG2ew/cq5X653ffuv/PEYkTmVam1r1XnlwYs+NTtLq9cQUIfoYTa9Zku9UUU7WGIBBBKdKs85APX1mlUGit8MycutSc2k3RM3R5R6kpnIVl+5B55naqOpE+rB7tjpO/E3PNfH4FA1meEkQEDa2ZWWvjYRVLEu1mvLhvZtzoPXSVB+A7BZHJInHz8X3tH37bsb/zjtcc+JFj+8canU6Ctc2B2twe9NKUMylgc9oCbpeH4/5DeuTjmd3TJ3/cvOHgj+saUJRCzpPwRu1fLtKfUQqtfL7aa5XkIHd5ZsAK/sxE0CaPBgPOkCkq/rSCh0ts1+ur7uZO9mR3oAaKME7SOvFrZmIKlABB/p9QxKdQOevald+Fe7en28FqC72vivt3WXE1RPe9QsCuNQ7XqCHBLjeHVwDkN8HGZ4uhyW75IBvxShCCICVFUlA0vD4rVCii8o++7EEAkTJVAIIF74KeAxTtRGWN5QtLLPbQhQ69ivc6rOFlMDRr1qxBACJBIpbUlAKiSlZ15UEKkpGgWAohjNnArQliaNKFdWEdaP3Hi7Y7+Y156Fj5yIieNDyvw+5c/Fg4zkOX8cIdcn6FBIQQEIqZN7fT7spG0k8SxvJci15359L93/O6w//grpvmDzJrVmoAGdUJACYn5mlyYn7Pn+DKEP4BgBELifFG3Gg2ozERC2gQVGbIjQBDlOZP7moSCmXmiZvnEzzzC/6KZVrNxQnhDzuBn4ao+kVeqDilXEJMBisNrZThR2t1KaYmGtfMTLUabPNOV/j2YTxwBG49PrPw9vsO/OU337P8Q9cem2qACOdWe+nq+qCbJjojYhLSrOdc+N9tiTJ8HH1xE/WnR0+HoiATTC2bgHzXjuEXQqASzWek71oyMvirEmyClrzZiAwtFa5cLE7P+FLO/UGW7nTSk72B7msYxYDNjre7vx4hp9Sj1oWFn+/PIQrTv3SDVP5QIsQF5Rzy9cLlL0Bkwl8FIAlCVPmvKlwEokpDdDljhBhhN0+bHIxd9pO81qnTW9pN3koMQ7OgEDEVXrJoQShnMs9tVZYZsMyDc2ENx/T215ILtNes+qEK9oTCvZgYaG0st9pYQaUQIorFmBACaZawjOqkqkoAL3tEUZ2ybMCCWEiBGrl4WSs0kdvdrY2AKfcxYRu97yJPidlau/I1Fv4tueRhaLNmY+UvNnTjmS08ZzSKayf81w9dvhQQCJsIl4u9P1siQBAyBd0dqPTcSj+eVTo6stiOv+d1h38YrNUrrp79WwDWtEoBAJtb56t1EmCyWcP8ZGt6rF2fJBJIlUaasdKadSQhKc+zZp9HUASS4FU9RkETSDYM2Aps5AR74pBABuVVrWIT9lpeFvNDmbNhUjVyltpceURFOl9UQvgl4j8AmqGVhk618bBq1COxMNs+vrwwvgDgaZEPVuESQUISIHD1wcnxt9938Cfe/tqDP3P8yEQ7yRjnNwZ6fTvtpymnUgppcnu4eUbW0YeZyRf1KSB8hkNEo0wvyMUsub04n58jBaQR74yXIcBko/iYjXeM1UrmqVPN2NpOeEFMnt4GajRi9vS3cO8VrlicXV9jAIijiJbmxgbbnfRMf6AGYK8AwJDnE2DnuZs/lHvCeBT3d9hPTCExdGNZ/1cOr5DvwUOmAy7S2Pxq5ctz8URZYWevwsHi5ZyDt0oLkyfABj0SkaBq3VS4ECoXq5cBiKGJob3AD+QaT4tvn6svcxKWXRjBIOxNbvKs53Dki0pSS4HrCAivP73bFQIGHICMKIpiMSYlVXFQVxS8IC1tyj/W2vox+2WhDeuZ79/mrS2zl8/rEfOvcGjUitqFay51Lur0h25/1Bl7rKwJGL5CeJoECTCxYOZMs1rb7HczlTUOL7Vrxw+Ox2+5Z/lPbmwl35JS/L9f+9bGOSJJzKpSAAAQMqJYCsxNNmv75tqvmGjX2yBCqhipYqUZbLxFaFSxCACOh+Rd6NZec8W1KNecGN1+BL94cTBaMMMk8wjKy2YJqUxplSnUJLAwVd9/cKF1w9H9cyeIwHHUoPQSwkcqAESSIgkcPzQ1+aZXH/iBt95/8KdvvnZ6SgjC6ZWeWttMeoNUp4KIhCRBhIJp05UFIwAIM0s+D08hl5cCQYnK54L7GgWf7dIFKCL/Qybin5lNqhY7EUlAEHFlwqxQADOhn2i108vW+4Osw5oh4kJi/otTGw3N1LAWz6hqWRdeXHtfNyCwnBsLhpT9KC12v0+U+ZE8k7G9d5c/s6Bsfl6IQoWXDUTOGle4/OB0nhAEFo4zQB6Par3r4EyWRFbrnhdFN+MgsHg6o1bobOhIiSnVm6slc72rtVq5l2loPnk6lLOzrjXIlmcLS7Q54mjvnTgIvmIgz1oMWJ9tIoavix5JknEk2iKi2N1nhZc/3P6qMoUsVdtZplSoEzPhIBog7bZP4znilQAMlyvDatXNdLOp/X1IHpBnr8otrAAYRNpMxqHo3PwO89zaFLz8EENrKTxOwWfDKbubIr9OCMExAFJAEJiSTGXbO2n//FpP9wcZrj080fq+Nx75+e9+4MjPHDs41QDIWiYrsGYkWcrLi+3Zw0tjr5scqzWYGUmqtGKtDY2zVhYmb/e3s4BddgbyWc5yOuY8tAtEzSYSKOaDCOmhfTnJnPIJ4Txdyo6hjlT6jBOWtzRz2pfLtm3z3vk8MvegldLJIIPUGgsT0fThxcZ9c5O1iUwNWFWRAJcEISQBjKPL4+NvuffgD7/z9Yd/8cZrZ2ZkLLC6OeDV9X63388SKSCkNIUj/J4a0Cvr9Jx7mQR0wG+cbq4FsgD7aZT7Q5MXGXJ6RoDvS+ymasgUBNcMpqVjP/x9WFYD5OynLsFELqhoNppa1qwJAEmCkCRIwpecjKJmRZcqQDPh3NoW7/TSzd5AbTO7yk92jnlTeb4W8uJRJvsOB2Q3pJdAON9zf63ifwiYa+R7bcADWALrRy4vz5yUm3vx/jFOe+H3ieKOEGreyC5K9gVeHY9i+Hwj12lUzG+FvVB5AFz2oAJRKZ/a42NwdC8isZtSf68xdxvKU2KUkwle3Gi73WfAHDMgBZGUVJdC7N2twssK7jEnqU5TpbskSdTqEkqBwMxaaa29PEbFTqJg0GJySTJ3mzvWY8CvHz91R62MS5+Az82UNaM4V9uMmdNMZ6vrg67KdGN5sRXdfM3ceKrET2zspN8SpP7bY89sbBIJqmK8gf1z4+JNdx249sD+sZvH27VYK0aWKZMW39Ecm5et8MTIyGdGKPpO5RZn3cpjq7+TGRYqB/w/HJ7J2wkCSQIpzXrQz3TUiMT0eNxaXmjeOTMZLwDYqMwHFw8iQVIQDu+faLz2juU3vPXegz93+w2zi826xMr6gM+vD3q9gUoECJEU0ln+R/7EhvKQ9z55IZ/D0LW8QSCgibt3tloNMADNYG2MBAwwYknUrEdoN+NaXnIShZotFa5cuKnX62eDQaI7mglCCJ+7J9BfXfLIw7Sx8CYf3fMOeYzghS44HGTLe7yn0pp23HLZnFA64o16REQsK8a3woUQVbVWLmNYjbxZ8CTsX2+5CTL9Gj2jJ1Uuzi8nZi7OvkAEAS+0+33dJ7NCQYtaqEMctvdt2ca82pzVFOoDSlPQXZOK9+btpuy+BfkBmJm1ZiZmioQQ9TiakJIiM1xFCK8EZFnCsYzp4MJYb2snO9lLdYKYUG8I1Goi6vdAWrNWKsiF7taEs4gGNbGD5WKTBsAZX7m85fsqGmHGfhsE63T0Ph7cL7JcIeZO5DM9j0dwmonyLA6nNcEtvXwd56fNiosECaWhe301YEW6Uc/Gp2cadNPx6anvzw79ci1SY7/zEfVvnzi50xWiRlonV+TCkcJYG1vNqL60r/3q5X2tg+2GpCzRSBOtnI3FhTGxs3YyM7m8Eu6BuEQT5EL+Lb0zlh43LXzkiTng6Jy3oLozOe1FzooabwR397s/smITtv8b4cvuD0EOAJPgUEiSWoN7A61qMdPEWC1eWmhdNT1Z3wfg0YrJvDiQEAQwDu6bqL3hrgNvfftrDv8ft10/d6DViLGxOeBzq4Ner68GUpKQJIQo0CK7DwKOVJGbZzltMHNqqJqPu75vaEPx/H5tzwOFflQ65umK8wJwnQs5gbyuyozjxnZ0z2krchrLzMQa4EhC1moU12IzvtZgpZC4u6OR2Q4qXHFgQIo63XLNTHeQ6h7bzPfCcb+hA5yZ6H4/NrOvuBe7uV1YN+znq3MqhSXg8Gsx4AHCTFhAcR8244TXcqpcDtYeF86b+8+9/4hyjpl98a7cxZBATM6dl4RXBHxbepAKVxQqD4DLHARASIqFpNhbDIZ8llzLsNdoxu2S2bmLojFl29V3zjYOCUOALUslEUdC1GtyPI6EfG6uVuFygWLCE6fX07fcc/zh0+f7J5MBL0y1Y8zN1lpaZbrXV4N0wFpEJKWE8Ps6gFB4Dj4OvwcQ9tprfgVswPO0HYfiYPmM0UZ4d0VBggmUauheqtOza4NuytRcmKuJ26+bnUsG2V9fW0+/qbPTHzlxtpcQNYn5yqvzrtm4TtbiSMxP12+an663Y0nodjKdpkoFuSINAlYw+BDyh3v/hgUJK/dEGVLGYvgpX8rD2bMtaTu0MFuGYZ6JBIRicDfRWVMhGmvGNDvdnG23a7OmfVVl5UIgiikSwNL8WHTvLYv3vfneg//wjpvmrx5v17C+NcD51X6/00l7IKJ6nEc0++glQjEsmYLpBuSagXC7B5AnOvn2MbL/iIOBjpLKbcJ7MvdoglLMns0ainWjETWnp+r1ZruG7Z7CybP9c2ubydOmj0CW7VxxdKjCaGjW6CcqTVPVYTBImBAAJ/J+O/tsnrrVG5Xsv7vwzRdp+XfdCqo8DldrODaw+4rlkR+pdJChkZsvKgVAhb1RqVUvcxARpKA4EiSdWd3Gm7LNpmtDhMpZUu0WHNQeBXsFQmF8Ispj9G27PJKvJILYMUOhqlCcihyLy54Qkotpsu18HKLNBlww15Krvu1iucgk22JmpTXAjHpNRmOteK5Ri+rmDire4UoBW5L22NPbT371kfX/8sQTW51BX2Fquk4zM/VWrSZqrKCgYCq5C5sv31hC8/3fp1S3Vtjc2FVgwMPia27jLR9hp5x3onjJzJantHBls/Lr5bGICBanvafS1dw6L9QyMvk1yDMFRKCYIo5Y7AySwcpat7uxmXKjVsNt184feNf9h//RG+5ceuv++RYBGpG4EmNvjVDbbMTxzFTj8NR4HBEzut00SxKdGX8rG9PMdg6wjXV2dAnumXvRiJ3FxnkkuWnhslA4MBMzu0wrwXPNZ5A5Y4inF9gL1d8op91EFBiTLX1ml7mFvInWFsgIPVaIBJFi6F6isyRjXavHmJxqtMbH6vvdbyVE4wqcIxcHIeoEaCzPj0UP3LHvjW+//+CvvvIV89dPT9Vpq5Pi/Fq/3+lnCQkiU7bWJiEzxnGjnmTmkP64rN/5UjdySrEKhN0bbXodRzpyISmPYgYoIBm5CdUOEeTncaMHkw25/oGJyOYqMKN6J4NcFWkUGfbGQBAgqkmKxluyPjFeo34GfP2Jre3PfuX8f33q2Z3HI1knoMrlW8GBAGgkmc5SrRN23ktFNtbQZDdv7RyG3wU5rzQR7NtuEflYepT2bQR7MTw76vNjDOfsMcj7uOsCLsLQlcAI3PdNy9A7sJBAIGcD2JNq90FbBQADDP3tq0MqXCmoPAAuaxgiIoiEIOfu7qw3AafoSWLJUuVNPeGIl3wL8Ne9UKPvFDzyrSeaSmlmZmrUhBhvR7PNumwPt67wcgbrPgtRJ60H+oE7jv7H6bH4KLT+U9ceGx+fn21KYmqvIqHBQA2yjDMJEQlJwrK7bB3v7X4dzNvyFKZw/VDQrKjJ5+DMriA8L1PUmS8Kd0REUhCx1CJNVNrpJf1zqyQ1NxtT4zV61c0L1yeZevd6R53sp2cfOr/eA0V14iuqjCYDFKHVrDUmxuqzjbpAlmr0BipLM60gTLxVIJzbSUBDw3iC62Rq5I/aqwZct5zPHBrG9Q3/8nDTXfuEx0aiFAnoGEsCQbPmNOMsybQmKWSrVYsmxutX7V+cNZ62rPYa+YoFUYMAjbnpBu58xfzdb77/4C+8+rbFW2am62Krm2B1bTDY2kl7BEYcUWQFgyAICaVgo90C7PMZFVIjyqnU844iFbS34olhcTYyCNqm/avVRW2sFdXnZho1QOLJE53+J79w+g8++cVT/+KhR05tRLJBzFWViQohGDpwc7007LKnO2oX0l8qN0J+0gnmQxN/90sGRV8xarv4thH8FE7xtmtFjgoVAkRDtVwqXEYoZo12mn2XF4A9hwov6DPy7KLsrI8IeM8hojSaG81jnp0c5JiPUOsYeAIYYuo4AE9bKbwEB1xy8DenxyErZPubiqeCGchSrbXSohGTmGjHk826nNjjx6vwMoXWAyaq08yEPLPdTf/WIEk3tT7wkzccmxqfnWlKgForq33u9/WAiZRLIARrebPWLDs3i4I8B2Y4P3dHbOouE0cu5RU1ZK69MwFTYfFR3ie8Og0tCBQHLXI0RXGBfTZv5+wdSZIAU6+XDFbWGFHcbE7PNMQdNy++Yq2jfjHJ9F//7FfPPLKy0YeMaqSyKycnAOuE3/WGG/ZNjNenZCwxGCgMEpUqrbWUMiLivKQ05RnOzUf288JPAmvcyWkknNa0QNRcuDSQ62bdhQLXcKfMCTrzyHdcmlM+3rScWCKYYnleaVskkAGltMqUZg1GvSHF/Ezz+qXZ1tips6vbguLKzFSClDUCGAszddx58/ztb7jvwLtfdce+2xfn22Knk2Fltd/vdrOEGJDkI3eNjZCKBIBdShCYh8MAqFxjxO7pzlIY7KOWSuwiyAT9c+QJJ6nMEFCRxhTy+Phtn+2aAEDO0upkLDIODpo1iKk9FtdnZxu1OI7x1MlO/+OfP/2BP3zwmXd/+ZvnTkRRTJlKrxiaU+FiYGmhsMn/nfcSLLWzLKdz6fdLwC4IV2YySMRTEIFyfX6Be4YbpsyUhuf9fh266tib8UZ8dx92vVCwyAsk2W4n3ieA7Zey9x+ufl/ZAARAmE6hGrFChV0QPXdqqAovFixt0H79W58lRyRyvXtIDgijzPahdenS7mGvGOeLn2OFeyzfjGemA55ZQAjLzWaKtdaMOJZoNWW7XhfjF33hCi8rMA+YSNLa1spOHOMfSyFiwfSjN1w9ObEw15QA2qtrCSUpp1nGmRQQJEhYppapPJ1HTWG2DK15nzcLBPSLWU9E5Qbl1hdg3gvHi0oytuXcmHI6INgIgLbMmEhSTrc6aU+ukcQM1eZmm9E9ty8+kGT6l/qD7K9+6HNPP0kkSco6KfXy9gSIZUxSCCwvLtA7Hjh843i71iYCUqU51VBaQ8dGYEOZFrlDQ+9LRicuny4pPJ+LHXnEpUfDT9DSTDWKqZzbZWaltE4zBRkRFmaahw8tjR0H8JCoWIgCSDaINIM55bfed+SGt9x76B/cc/vSfYtzLdHtZzi/2k82N5OuIFAs4UL3RtoSaciS51SLoybaiwSvoAgPwQtCAYEkpY2PchSJqNUU8cxUrRbXIjx7rp9+6otnP/bhB5/5O1965Pxja5t9yGpiVRiCnVMu25+1O5Vl9aFeQ0wlSszmcNtRs69AJd2K3S1Lb6kfcS64FxTBz8n6tSMGJQpfdLpQ4SWPqJojlzF84BNrNiVSbbyezQTAZEuektfCe6ujfc+cJ3EyRM1xoWXG1jK7VgvqQ49yw5cPT3YWMKf3L4okJQuVO2qNYS7JcHjeqS5yS1igxiCAhKF4qWKtGKjHAs1G1KjFNIbSFStcQZAxoBQ++5WTq7dft/z3wRqR4B+/5tjU2Mx0UzJka2293x30VcIgJkG+HBWF8z3gtwtFU/Lm/sCQHB8wwWGuYDPni/NyyPumLBPYhVKsPOcywHO+uuyaD0uIhZYNshQit0QQMYN3OqovaICF2Ubt6IGxhualN/f76u+9/o5D72ZWzxBJiqIaZS9jTwDNDKVTvueWI3NH97VfN9WuNbQmJBmzYkelyHt/unwkBpZauepQuV+JPV1k+MjPCksph6ytxX7eak8lSuq7eaqOsvkqdx7hfOh8I/Dtg6xzBGusdS0yxXqQZBCxxOJcY/H44ck33XLN0jcznXakqJG6QqtGhIhkk6AZmlN+891Hj77tNYd/4XV3HXjT4aV2LetnWF3tpZ2dtA+ttZBCOpJj6Yh/oAynhLQEKKgh4f7kYfhkNQXk50runsLBv3l/91R3UxSVM1H6mctc+hzEIRcyqOU0JrhL58CAdiuuzU5F9VpMePZ0N/n0F88/+P5PP/1zn3v49NfOrfdBiJC9zJWNFb5dEAikDf9qE1wgr4XCTDa7WSBtA3B7o3ubT272PGh+uOjBl185n+nhsL7bCE1EwSjAKPDi+Q7vvGXzeybk69jy9DmJCNSA5JO/2AwArhRRxfdWuAAqD4DLGmaRm8LUpcrdI0hAzgoYpv+5rY+3lzYzJHMXHmXXNp7CFoUwYRWeSkMrDRZSUL0uojgSDXd9KZuk1JWX0fxKBmd9FrJNRDEBstOs8a/FEbc08KeuOTozPj/XlEJwe22tT4OBTlWqMyGEEJIEX+oGOirmzlvFaPeRSjL+kMbBHwsb86iOQZ98rbHjLFx5OrgkSPY8C5aChACQZVptbCW9SELMz9WjowfGmg+86sD3p4p69966/IvM6hTRy9ssxyAszY7RA3ceuObQvuZtrYaUScpIUmgfZGXdKUYxiDkHeSk/U25o3+PjJWE0HR09b0btAqGTFREIgkhp1v1+xi1JtDhdH7/60PhbvzLX+m8AvqW5qgYgZJNYZ2BO+bV3Htn/jtce/oUH7lr+riP7xms6VVhd6afrG0mHNetaJCJBhs44lRxQphTO778or4zGpc657xwXpI5e2wTSGpqZORIkms2oNjtVq7ebEmdX+tlnv3j+wQ9+6uTPfv5rZ756dr0LQRJKV8J/hd1g5zqThinY4g/vNmlGidz+LaHgDHshujtEW/N6l26AkQ6xxbK9FwrSH3X1Il/gWwgSjkpozdBaM5irzJkVLoioKpJ++cJmC3YJdTLWThEfRAIyGQcA3yPQ5dMwncrjoZxVyl8M8HQtiC0tmxIcC2PU/XkMIeUWLE8vXdfcJFoYq3DpYtUt/4ZgkiASgEwzZxoQUqBWk1Eci7ZvWjGoVyS06jBRk4AMn/7KqVN33rDwi6niriD549ddNTU2N9MQYN1aXe13en09MPV0Tc1uH24LYMgjxsNbEQqKfk9Xc9/7fF67wgBOJLcLxq9FGxPgFXa5ocIeCc1ygY3W9vOWQZMhnlwObhdLbPgIV1/D5Atx/olKQ23vpAMpmOZmW/K649PjSoof6QySlduvXfhnzHqVqEbMLz9rbyRbxAyMt+PW4f3N+w8t1Q/X6iS6A4VBCm1yljOxS2HuLT/uSeUq1sJ8CeiZI3UctPfWHm+d5cIYOcs6SuHjaHJo2S3RdKBYaoCQey5YY5E3XBFI2Dnks8maKUJKQfe6KmvUZLwwUYuvXh67ft9c8xoA36qsTQDrFMwZ33rNcuu733D4Z153z/L3XX1koqkHCqvr3Wynkw40g6UQQhimnbiYpoGCTDrklqzTObmDYakeLucFcbPFF9qDnV9FBTwX4o5CBX1OrAoqBc5nYO7G7NQXlhIVEp1Q/mKwUloBjHYrasxO1+qtZozVjb7+/MMrX/3Qg8/87Qe/fOah0ysdBgSUruL+K+wNYXMAAPA8r6uMka8TBHGwZmqS96YyHfPKF8EqsLt+niYgNAfkWobcOh/S3hzlSZznzSozBMV7KNf7tFU4/D7uVyIBsAmMSEAwE7RiaMWZ1qwqmlzhQqiqAFzmYACKKdNMzCOUOSIXC1C0wj+HxKFgCtvbCrH3VUeYwKh8uqh/Jadq0GClWGdKMxFTLSJRi+Wk71rpua5YMPdYRi0ikgTgdC0Sv16L5BiI/9Q1RyfbszMNwUB7dW2ALGOVZTojkRcIvCjL2rCCgIbfciD17TqQbVlm0N25sp0i+J7IGf1wOMcP5e3ygnEumRgRQBFFzMSDJEtXV/tKCDE2u1gTx49OjL3u1Us/3u8Nzt501fxvREJsE738snMrnQFgtJq1eP++1t2LC43JSACb25lKBiqTwoT+O3LHHPoiORaRACLaxQi0C0a3uziKGjS+qIaB8sjeslUM7dqayNTZVgqq11PpWFNHMxMxLczUJ6cnakdMyytXwSqiBrFKwKz5luP7Jt5w98E/89q7lv7ssYNjLWKNldVOtrre39EgRJGUbk/WobC/B/iin+4ey/GiJtPwSd7lrBeI3O2Xs5wSCBBQihUzWEghmw0Zz8026uNjEa1vJPqPHl555EOfefbdn/vq2YdOr3SYSEBXwn+FC4JsBkBEBcMRASRIXITf3RDCBbbXErloMvsdw1xFByaEnI/P74SMAsCbDLQmKM1K61DdXKHCaESXwKVUeAni/HqH3/XAdVqxsEueYYoIm0BUB6OsN7JywRxQshhxIXaQhgQbT1KLEYkYyXwQCtZ+Co6XmtlrF9+EuQCs1bLYzpkjYEpVqYyzLFMaUCKOmVr1aH7f7KSln1cug1oBUFmXhawT6xQPfuXMM6+8Yd+700ztvIMP//g1V82Mzc6PCRayvb7a63a7aV9IcBTZ0prePhpO3CLhNJYF9sY3A6vPD9YBALdpF6Z1MW8GvF3NpPlwlgOzdp3Vr5wl3mUCDq9vMv+zW0wUVNowgr/I70uYe6FMERKFbH0r7ZPsNKana+K26yYXtDrwv+/09LmdDv+3p89uQ8g66ZdVnK4CQBgfr7eWFsevnZtpRkiB/k6SpIlKhbCRpVYx5K1JYBBx7rfhZGxv4CmpXMk5ouZPu/gj5jGpQDjTOJgTxoprlBH5ZModrorzM88HQfm/uZoiN2t5G5M3q0EwQYBJa+b+IEt6/ahGUxSNt6Pa1ER8/MC+qQiAsuU3X0bz4eLAKoWExHWH5utvfc2hH37H6w/9vVdcMz0ntMbqWl9vb6f9TLFySUYBqzwK3eMAk8McyIs7+L+hJd/CVaFkM4+8I4CdC+W9FDboh5w8YYlAUfBhPzfZl7YsKyELb20SVDIeBZb1IDBIEDEIGUNDM7fbcWN+tt6YmqzR5s4AX3xk5ak/+OQzf+sTXzj9kRPnugkgoascEhUuAgSBSEhIISIhmKyPG1vFAAlBAt49JdB8cc7fOis8obi2vIBdmPY5zSz4+ZWVajnf6nbXcBDktvvi5yK/ECx3f23nXih8Lxf5wACLwCdHA1AMpYCsUgBUuBAqD4CXAUzCL5MUxR0ZthnmrEPOCJb1+yM2+8L53c5d6OyIdmVzQvEeLxnMYKVYZUprzRpRRDTWihcn2vXo3HonqxwAKmg1YBG1TOFI0Dkp+NfjSI6xkD9y7dUzrfm5liDFTZPtXGdaQ1tXw7xajx1rqEqA26xDfrt40p0v9Rxed1ZtUGzGZa5jGKNWj3P0L10pGDynBk7dJyVJkKReTw3OJZ2MVDY2N98Qt1w3s7Sxrd/d6ekV9QX18ZNnt5hIUCn7yGULIg2tmX/gzdcdnJtpLTQbMXb6CXr9LMmUVjIWpvyfs8dQ8JRLD2s3Sjb6hyoziCOGHOpdENsuiMJTLo3llFFWPZyXoYOf1iQIpDXrJFVpP8myVOuoVhM0M1m7enG6MXnyzMbqlVgOkCgiKSJctTwZvfaVy+98870Hf/7W66bnGjHhzKlutrbe72SatZBCGkU8Q7OpxJkXAys8DZRnSVnJXnDnv1hXk5Fthq8VgodPDvs5sSs45oQfJjBYaRiDhBCi3hDx3HSjMT0RU6eX4qGvr578wGdO/sNPPHTqY088u90nivByDCmq8PxAgBALISJBsbdtmWyAIHLbtVsauNA0H7l4ws2eym0vMN6lsrFlPUJ4hBEaz4r0O08KyBC2NTOgGVqDVKUAqHAhRBcW2Sq8dGGenVKcKM02DCDIP23KAgSbtGXz2KlDMSyoBBKOOcSFz8UYKuQZTUec93mLh65TJkxc6JtbSRxT4RieIqPsax+DjOlBs840s9ZAFEmaHK/vn51qjD/6TLYmjPt3hSscOuuyEDViTvHZh88+c9dN+35BMdJaTH/xmiNTjfnZhtSs2+tbg96grxIAiCTJfFm4ie5qCofO+hRUwhixnZfyWBDlBorc5Ed2XufHQ8NCvm6BwAXADWgHD2y9fkk5/YFdZU6MDbIfudVPBEgBkWrW6YCTzc2sH8dpc2yiRvfcMX8DCfyrVKV/4bfev/4g0bBMcDlCSklaM19/eL75rtcffWBuvNYiEHop657iDAyWlGf/z/8p0rK8/nLwszhaWbYu5UKT72GGpWBOIVDZekOPHcemdCg+aDjhslgp3s01d9CIniFZdkyz+RBYgK2bKQikNOs0VSrLNOo1SQfm28ePH5g4fmB+fF2IK0vNShQRILC8OEmvffWhH/ie1x/61TtumDpQJ8bG2oC3trP+IOPUGCvZmcr9gnPeInl1G3veevoMacuH9lR79CK070HOcE97Cp04VyTZ6UR2LtrZks8mL+wzoH39Qu0mCWkQsowzAtBqR42Z6bgxPRlRvz/Al7++eub3P/r03/7I55/9vadPb3cBqiz/FS4aBEbGfb77xoNxLEVDgKCZoFnDlQSgPK9Jzivmu6cnfwCC6Z/vuI539pH/lF+9qKt3C9Dtw0Udva+JwQHbTbnXTXlrHqX5LewuVtvhlfrGz5cFQJKIBAtoBbBipTXU0GAVKpRQeQC8DKCUzrKMB9p7uXtG07OpId+IsCw4MES4njeiERLdXbb8i+BlhvtQntJIa3CmgEgKTI7VFxamG/sBrL08xJQKzwW0TlhGDSIhiCBOx5L+UatOM6T19111aLKxMNeUQlBrZa3PWaaU0tZi5/ICkWeng3XE4foqSt8XsBaUtftOPCi3K3IuKC3T8gQP2QxPCHJ1Q2Gtu+ggd8S4FMeSJLNAp8eD9NxAL4Lai/MNuu+Oueu2dwa/+rb7rvrzzPyo8agQYM4uW0ZeM2FxukX33Lz/mmsPTbx1ohnVBoMM/VRrlUdd7I7wB3SHSk3KKqG8cGN58L2oYPlcyYn/AnS1YG8qCf/2cNjUCqIMCCvZAVCKdZJoNOoRDi6M7b/x6NT3PfXs5jMnz2+fIlkjVi9/gY4oJhKEA4sTdP+d+9/01vsP/MNX3jx7YKwOnD3TUavrSTdRlInIuClby7jpm4/iZ0KO3X66MGAkvI+9e5XH3XuGFs95vSP24AicMGJMkKQ1sWZoQYIaNRHPT9eak1MRdfspvvLIytn3feLEL334Myd+99ETW9umu3rZz5UKzz3qNWrVIlEnEi7FrfmvsAl76higTKfdXl7Upu1J7i9yxo7cx4NruhW927UCvYMr2lO8CafoJwEpBAkm6IyhMk6qJIAVLgaVAuBlgDTTSZKqjlZaW2YNxlE1NxMUZe5QRVkiQrvynpag7qY5LVsU7FCFWuT231zj6cbMW7CtHBDKOmW9RH6vud2MrcVCaWiVMQQRJlvx1MJ086qr9s98UxAyGcWksirJUAVAZX2WUUxaZXj48ZUTgujns1R33vHA4R+56shkY36mIVTGzfWtQW8wUIkgUBxRRDC14nN7ql1DzEUZGsHqy41s5qT3kiGvAAgZF/JWh11YBMo1D9YSAOeHEAoXrqFfXd5lvRSdyK4iaJAqlBiCQFpCZBlnvQEnG1tp3GyI+uxYjAfu2nc3a/q3b7z76J+VInpK6RRRVKMsu/yEPyGbBAYmxxuNa49OvfnqQ+M3NutC9HopkiRTwuZScbmYvYXIJYcIQgGI/C84lBXaeUv5PAGONgbtAtuwR0gvc2ksL+iQ03Bz7bAwSxjjCmuBCplHN2Bx3phv4stg2M42AQKlCqrbVyqOI7k42xq77ujkG7/8eOv3AZyC1qg1pijpb1x28+BiIWSdAMLi3Bhe96r9b//e1x/8P+96xfSxRsxY3xzwxnba76U6EVJIIVmQ39OKBIDIv8sHzyv/DVsGgZyWsHmUbtWPqkRmPhfNisy5qFOYe86Tye/XPg+FmeCUBz05Lyf7Ffx9MxipQkZMGGvKxsxUrTE7XaNBqvDlb26c+92Pnvw7H/2jk7/3xLNb24CvslKhwsXDUtpmI2rUa7ItCK5qiqmNQSYfBQeTO+ASLbnO99c8YaAd3uWK8guJ/EJkKk7Xks+Mv16+Tsxe7nbncN2F/G3eu+wd4HwQvNcQuwQw7G4NBCGMLYMBZBlzkuqeUnlJsAoVdkOlAHgZIM10kqaqq7RmR9zy0nohdrEoXdQ2XBQddtMTFC7JpTM86mTI7F4sP1DmrGG5IQJrcJoyahFhohW1F6brN0yOxR9PT6kNEldejGqF3aGylKOoSVvdAT7z1fMnAP7lel1MgvhdR5cn6nMzjQiE5ur6gHWmlNasiZiYAnZ41Jxm6/RH5Qajp1+oOqPw716G4HLnESuxUE6IwnahVs4yS0HNbuSnQBJCMqRm4p2drP+sUrxvrt44tNgWb7pn6b7NncGvbGwP/rc/fvjUKpEkIRuk1eVVHYBt9v+JsXrr8P6x1+5fbE1HkrDRSVSWKhULyGELzLAtKT/qRy5ex/31jJ+nqV483/M+XetdT+bso/nIwYjlDWE35rAojMKOQ1YylUIIxaQ7PZU26lpMTtTEoYPjxxbmW4emJpsEKGRpttfXuKxBFJMRXjP+/rfeePd33X/gl++7de6q8ZbAmZWOXl1LuoMUmYiElBKSCIDyUoD9rxjUM+Iq9m9BDTR86BLw3CzIXMmYT1giBlhrk3dcEFGjJuO5mXpzajKi/iDDVx9dX/3Ap5/9tfc9eOo/feuZzb42+tLLikZUeGmACNg/O0733bZ/ttmQY0Kwr4ppFWG8ewUd93k32scorpTvjF30IxXIbn7tb1c8z1P+EUBEJEgICcEAUqU5ybivdFX3usKFEQ2ptSpcRjDkI0tUkibZllYmAwABNj4P0NAs8sjV3LLowgDI240AjCCXI+OaKLA02OPlWVS8HIrmg9JVQiEmcKouW8O8H1QQM2vvBoIgiARpTTpNmGMimmxHzcWZxs3T4/UJABvFzIMVKgBZ1mMp66R0gk9+6fSTD9yx9A/STPfffv/h//Xqw9P1ffPtCKDW5ka/1x+ohAgUxYjIpfYvGGtDodsZi3O9flnlNVyyr6QKGzIBFj/z0Kot8RrBOiLnRpi7IRQvHVyZC0cIQkBAs84Uq50O9dZiJZpNVVuebYi33Lf8PdCcveaOA3+HIJ9iPcDlBwVAYLJday/NN4/PTtcirRndrkqTVCtTWIpIOMIJmPwNAAGikMW5YFXNDxfl7yCRQMkIZNu7bPAu53T4dODnRdE522pxCooAwLnAhgogHdwqWc0sl24knAOmygFAgoQ0+TC401NJq5HFM5M1uW+hNT4/33plvR79JgBmnez+U1/GEFFMQAZm5u9/8zWv+v43X/V/3XvL/A3jDYGdnQRb2+mgP9AJSJAX/gOYx8VB3T/rP1Twxgg+u0N+ztkjXgAISIR75oHW0D13HnGN/H7cQEV1lqFv/mRhTlPQDQRoBrJMZ4JItJuyPjvVaMzONmiQpvjyo6sr7/nIiV/46B+d/M1vndjoa2a8XJKGVnhhEUU1EgS0mnFtcqJxoN2KJgiAUhpsJpZxz9OaySeMyr3jzB5s/hIXZnFBWM9nPcOn9LetzJopcaaOlnuP1OGF79dpqJQN+VHOGQn2/DL7sf292/sTbNlghimJKA0jn2Zap6nuaR8PHJT5qVChhMoD4DKGc+9LklQlg3RNKaUJBAHrj4c8T6ghUEZyD2jNKHKVnxhxsHzY87SOFo5ievb+Fi7b0B5WirIgNDQGEQBBEKwZg1TrekxyrB3XF+Ya10xO1OYBPHPBW6lwRUKpAUvZIJvR/uuvuXXp7zdq8biMoncc3j8RL8w0I8HcPL/WV5lSSisowSxIhLsr2bAbKun4/Qd4l+0wXKbEWBew17QvdCX/79AaIjdQOFhxQHKaQCCgF/Y72YR0klhAAIrBWx01wJkuFmbqtWsOjdearz/0g2nGvc0t9Ve+/NjpzuVUGSCKYiICtM74T77lugOzU7XZek1gayfj3oDTVLESgoQNcYZPDmV/xvIvz4FSyBl4R1qCggMXopEl9tN/GukivosFqyDYc/FcoRuNGtTepyCKAJkpVkmi0l5PpcyQY2OxWJhtXbcw25xeW+uuZUpd4BtdfpCiRsxG+H/T3Ydu+OG3H/8/X3/nws3TYzWsrPb02tZg0E84k0IIV5sb7Kx05v9C+a9Ati5jVwWhOej/ONGcMJyiYqjYyG4o6o/cjSKY4EZBxDnXEFQxhWJmkyOFqBlH0fx0ozk1Xad+qvDwo+vr7//UiX/2+598+v994sR6V2tUwn+FbxvMjEwpvvnqhfrUWHy41YiaBCBTDNasiWEDbXZTbgeffDbNEdL6LqBRHzxBHZ7Ww9kzyoq98tGc9haU8O4afijDM5M2i5IIJITZl1KldZqpntYjN4cKFQqILq6IUIWXIpQy8ezdQZp2eoPTSaoyCKMNNClB2STpZZ++zMMoQEN7JZCLAY4JyXWnxayB8LRqKAOqPReYOcyhgH55q4SVYnziFXsxKlsrAkLJ5I0oBSYIYAhiYtacJEqlDSla7VjOzzb2j4/X5goDVahQglJ9FjI2sd7MT77xroM/l6bovf3+Qz9w1aHx2uJ8M8qY2xubg146UIkWmuNY+lAAU5fXu3LbcljO3mD0BLt5zYxgHUbeY1ijeBQzQoXPIVvB0E4o3UW+K2QFYGcxDDQXYBbEAiBOMp2tb2ktQHSgEcXHlsait91/4Id0yr27blr8ZYBP29/xJb/gtNbQWvNNRxeb3/OGw2+amaqPkQAGqeZBqlPAVIEwP6m1HgFwFNLQoaIVqbCnemsOlSxF8GIbFayvjNAvwJJp2zWktTSsbXWd/L/sK6kM14V3KDHLfk46aTAXJgkABEgrIM1UNhhkaZKoRj0SOLTYvub6w5M3rq/1Hjy72lNx1KA0u7xCQXZDLYpJW+H/ba85essPvf34v37tXftfNTtRx85OivWtdLDTVX1BRJJIuAem2cQkw7sLBQvYJa0B9iAMI7UDyJ8xw+enLNGE0OAYXiKvMEGuf94n1A0W6IQNLGQ/m8BM0AxOM84AoFWPa3NTjdbcTItS1nj48fXN3/nI07/8kc+d+E+PP73eZdYQon4Rv3aFCqPhtpNWXYxNtuSBVo3qBIa2mxsJEi44j+FWnKOxgFWa5iuFPIGDm/BhVZ6gu72BYPl5mb/I94ZwHgH+sKfz9rI+J0zxWj5eyO8d8EpnAiAM527rHdg9iYi0ZiRppgZJtqk0q0CbV6HCSFQeAJc5pKzRgZnmYLs7ODtIs5QJRgEgIUiFy98aK4eYiqLL71BNoRKT4kjaSP1iyMcWRymdGNHQZTQq3CMV/ua8azEA2yUwE6QJTDxIVZYqjlqtmKanGxPjY/Gy6adAskWsui8LxrTCcwutUpai5jwBHr3/lgM/W49kU4rldxxYbsfzs42YAKyt9lWmWGnNWgjDdgBwTLivEcCeAaDSTC5z2WXsJqQV+11oayevGgsVcOV1bT865duQSTDQDRIg7bdKM6i1bdWjM31amq1H1x+dbDbeQD/aT5Otlc3kF584sd67HJQAzIzl+XHxmtsP3HbD1dPvnBirx/1Eoz8wOR+EKXGQ/3ZBkj87QGE8Ky/tpsG5ONBIyX6PAfKHWbx0ECQSDFm4R8cLc+EsXPKqwm25v8aPjLJM6U435XZL0qG51sId18786dNnOydOnt1+0sTKX/6QskZaG+H/1bceWPxz33ftr3/Xaw/fPT3ZwMZKl8+v9QfdvkrYMuFEIDbluXT+45LRWdu1QKEmb8RUCYtAmg6lNoGLQOmpFrSKxR13+Doc/kPBGMUW7juYBubLsWawsgXYG/WoNjfTaM1MNUSiNL72xNr2+z/1zL/5/Y899a++8eRKh4iIRANK9V7StKDCSxtuK2nUZH2sJZcasZBghlI25Y4w8fCmXF5oRbLzm4Od2FmRSjtyiJIePbgRmO3dNKKCctXl+ggbB3eS+wHltxbeQL77ekVBQXVLQTfzMnRHCIJSjN4gS3uDbN3kAKDRX6xCBYuomiGXNzRrdHoZ73Syc0ligi+lEJBEpGwkQEg0ALhMv4bnH/YNKP11ViiCi70fiVEZywqBpcOqgJz0OpaneCbUPewmRrDX6sJkLWfwIFFZkmodx0JMjMf18XZ00F+58kCssAeUTti4hRMx86m3vurIX0810re+Zvl7jx0ci6P5VqwV2htbg26WaSUkcSREJASR1nCLi+HdZMPYvZKl74KKgN0wul8Y60iwFojAyuC6cmDq8/Rh6BZyQdApMRxPIggkBCjLdLa2mXYjQe3lfU15/NBY/W33HfjfOolavfm6hf8A0NpLWQlA0iR0m5msT9x8zcyfvv7o9LWtZk10+xn3U63g/Dt8Wn0uMXdAkZrl9M7IVYGipvgAzDsvUY9SwQbC4a7TJKTVVBjTjxj89IU7DRU/7hYKcd/lHuF1jM+pYuidbpbFkuLF6WbzFVdPv/6rj2/8ZwBPApd/DqooqpHWKaSUeO2dB47+L2++6lded9fyvXOzLXR2MqxuJMl2J+1rgIVL7+eDZmC3V5C3OuaCgBfgw+uVH/NIJXsB+dou+qUMjzm676gr2DF9dnQ39934BM3MaaYzENCsR7W5qXprab4pGIwvfXN1+3c/8tQ/+cPPnfy3jz693iUiimQNaVYJ/xW+U5gp1GxEzYl2faFRkxFrhko1M/tM+U44J3i7v1diF/8NyOPw/ncBg5U5XCLQVFzTuy3g8tD2TTH4zhAOlF20TZpvq2M0DaNIiEhK0gz0+nrQ6alTJgyLISrxrsIeiII6MRUuRzBjZafD77zv2OZgoHvQgBQEKQQRqSGPX2cPKkjXvsGwZd8xF+Y0oeAjhZCA5gLCKN9mCgf0JsXwRNCeineL4i368V0IgT9HRJrBaaqzNFHaJIyJ5OR47dix5ek6QMmlC1sVrjRkWcET4Mn7bzvyU7W6GI/j/W8+sNiW8/ONGgmm9Y1+J9OstWYW5BRVVnfPArCBwAVbKiNnpoPN3xwocSO7UeY9KTYNfSyw98HSCu9peMmW1iCTKWrEDBKmJKLW4CTT2cpm0iWB1vx0JG+9dnpKRPT3AWBtI/2nZ85vMlFEzNlLb+FpDUBgfro5ffzwxH2H9rXbUgjsdLIsSVlJSZKYGTmvZT5SQBNRoijkFDH5SUetqCR15/29tQdmZLYJG1FwHB9WII0S9oIOBez284cagOL8cLoPDs6b4YlEJKUmQqeXpfWIxPRkTR45MLH/4NLY3fvmJz5ivm+LmC9Pb6soqpNSKZiZb752ceqdDxz7xe953eHvP7DUlqsbPaytDtLtTtrXmrWMSJKA8GUTqcRUDSn83GG7GY7cpHdZ5H4jdkome5B2ecIl0pIPeyH1gld6+VbMYM1graEBRqMma3NT9dbcVENqrfDYiY3BBx58+j/+zkee+Gdf/9bqhrFM1pBmg8tyDlR4aaLZjJvj442Fej2WSjHSzNm7jbKZdW4tLya/dDSWi+uA84YclLtE2B+hipeDDaCo+LWdEB7Iw2SL1+SS/w5zuQwgvPHAfCBPjzWc8p5ISqIoEkgGmne6amenm51JUpUCDFUp3irsgSpF5MsAEdWo08t2BqkasGZIAUhBkoQgzh2S4TLwEwwv6mR1CulZaBgAck1pYLYw8B0RMhHkX1ykZCiyHJfCog7dlLsn+55gyg8JQQIM1korlSrFilGPJWYnm4cWZttjzJrLCtUKFUZB6YSJIhARffKLT517z8ee/Bvv++Sz7z9xtqsmJ2IsLzXjmalaO44pzpRWWcYaDFuN0q4WLq0YRmiQzVFecxa2smVwAKWFExxgDtayHdQuEJ90DPn54aFypVo5KGiUcUQQQwpNJDT1UpWe2xh0z2+kul6TuOX41Ph33bP/Z99x7/7vv/rgxCSgYD3pX3JgVjw/3dy3NN9cmhiLkKUKO50syTKtJBEJm/wfQB6l5BQmwQ/D/uVobDl3P+9K/8LWTiQ0PKnpZpRKXOhrXsX/yqMWJ9Uuk2z4F0GgyR3ZwpQDJAkA3b4adPoqk7HA3Gyrvrxv/J7Z6VZLyAjA5VkOMI5qpFQCEgKvumXp0Pe+8djfe8Pdy997aGlM6kxhbb2XbW33+5lWmgSTEBDCPxAiE5tLzERFw6LzErDh/yMDPbzwT/kjYLMBe6/lwhqlwszxT80SAx567qESKhdcgvlW+pDfjgY4y3TGmnWrIerzM/X20kJLRhHh4cfXd/77h578V+//1NP/9JEn1jeJiISMoVQl/Fd4rmCmUrMVTU1M1Gfq9UhoDc5SrcHMYdJV5jxJqudzgYBS7qrC9UeG1KtuQx5Bagv7qm3mx9iFpy6jSMuLdxOue8eLa/s1pQBFEsi0xlY329juZufTjBUq226FCyC6OKagwksXBAWNbqIGg1T1mTUkEaKIhEiFYACaoQXYc+A2JWA5mhXYhSQ6ZsX3L/QI39iYU88/sqfI3pIEQIQMBzgsUli4+pBC1R/MhRJDcG3SZXsx1sxKaZ2mGlIIzM80Dx7eP3HtgYWpzwoBjqIGZS+TBFUVnj9onTBR7KsDPPDKoz/WaMj/2qgv3bsw26DZ2XrMBKxtpl2lWGsCCXIpv7TRz7PVthWE//LUK23Ubv0Y7r/Uh/KBqLx62Z93iYTg10UgvAJAyTeIQ4mW87FsCAO7knRGIAWbb8uIIooyDd1NdHp+I+nGMbVnxyXded30Ps70r4H45ze21X86t97BS8kTQIgGCUhctTwbf98bD79qcjxqadbo9jPd66kBEVMcicj/UNbBGwh+OqD0DAIhzAtygaBX8vDIQ8HJf86fAuX/5vkGEZxCkZO0Y4al24qNR34sgLk02ghKT6bwIRERK3CacdpNdJoqrjcaEZYXx6656uD08a89euZLl2segExlkFLg+JGZ8Xc8cORvv/OBI3/mqgMTjZ1ugs2tvu7uJAOtlKkOQT4HH1wIhdsBOdzcjGLQ7nsmc1++xO3zLz2ykT9eQQ/uhIVwtZfUTiNJRajUKy1HV4LSaSJsPxfdRIC1/MfNmam60GA89sx27w8+ceLf/tYHnvyFr31rdYNIEFGjsj5WeF7QbEYz42PxeK0uqdfLOM20ZmgIYQLvcurHCA1dXicektJ8zRUXzp6LMGhWelfswyNPF4is0xAQAg8xuzeEPHRJGee2eQZDChJCEpJM642d5OzmTnr29MoWC1m7LOlvhRcOYk+GoMJlAsYg1YM00wlrhhCAkBBCOOuVC+jLNZjkzIV7D1uyCDiQtzYOWQtcV+uuVB6MqeQSXWhiGSgvLA2rKEYpCtw9cfBea+g0VRBgzE/WZ44ute+fn65PZGrAWr/8ylRVeH7AnLIgCSKij33+yVO/+9EnfuY9Hzv5oSdOdrJWs4Z9c614ajxuxpKkynSWKa0YMFouChmOom4/tBDnK4KCA1xce4HyIFyWTrMQ8AXh3SMXK0vL2begoWPFEfKLE3L6oZmY2ZQcFTbvcm+gkrOrg97qZspj7TruvGnhwFvvO/x333DXgfsPL403jCeAfEnsOMwKihO+8eqpG64/Nvm9E2OyNkgzdPsqyzLOWENbRQmBmJic22VpnOBYQc4f8YMOPR9rygmPl1U6hRC9IZeQ8h3sLd+H9+C8DsoKh91Q1nkY10FtM8FD9wcKghjLC83FVxyf+l9vu2F5gjllKaKXxPO+WJicFZrvuHHh4Pe/8aqff9v9h37kuiMTDSEYqxu9bG1j0E0TnRGbeU/Wl86Exzg9QJjR1ircy8b7gJ8vvAl+rd3W8/BZLrUYpje+r5NJQvW/m4MjnhSDoDR0lupMa62bDVmfn661lmYbMiLG1x5b2/4fH3n6/3r/p0/8468/sbHpfj+th4X/2fGpy2ouVHjpQIqGnzuNupxut6N6rSagFHOaaaXNlC4RyGHlbPmzV5r55VAstprvq6X2bnMPZfzcTXaov2vFQ2vVvtslTU5h/XqdhL0Du+8LQSApMMi03twePLu5PdgAALoQf1/hikdUTZHLHYadSxWnSaZ7SjFqERBJImFLNjFsOaIRAffD1qnS8DYcleD9D8GOBBm6NdJu4ZOGuU85r+Hz8DnCW3Q5Dkiwt16U3JA5p7quZ66jcAmqCL2B0kJCzE3U2lctt1+/NNd4P4AN5ss/QVWFFw5Kp0zkcwJ84b7bD/9pleH/eeu9+99ycLEVzU/XawJE61tJVzGztuvDWeWG9/ZdLAZF/oQ5Nw0X15hfTAFTUmLo86HdIgmFvfKFAZf8zTND9v7hLBT5pb0d3CY3IwGgJiG1Zt3pqv5ZEKJYtcbH6njlK/YdT1PxL0nQT+901cdWN7ogiok5fdG2HqI6AYxbrpmf/f43Hv0zN149dWuzKcVOL+V+ojJ42sYMwRSQMTgWk4NDQMjo+d+Zc260/NiKLCaVvDGCU75FeAs5Rj9N9ySL/G8pSICLb3xiyF2u5I6ENmcCg0iQ1qQ7XaWimOW+2Xr71msn3/WtZ8bfB+AT+qWZ/3EkyFYRu/Hahakf/q7jf+8drznyw8cPjzXSLMP6ZsJb2+kgSTjzv4EL0BVkEv35MOJQ+g923VwxZArzerc6v9HBE4yCxsWJCflaHpX0r9glnHlhOzeJg/3SmvYJCHZ5Oz4Taw1mzbpZF7XZqVpzZqomNTMee3Kj+wcfP/lvfuvDJ979tcfPdogkkRwu9Tc7PkWr2xu8ur1x+UyGCi8paM6NNq1GPNtqRnEkCZnSnGasmIlFmHyjYE1HvjVykXIXqWIu/LtlQL4tB/v4aDrtjVacj2220qIC3pP7Em0sld71hTfc6vVcsv1g6C9ISkEkBXoDna5tDr65vtXfAQCVvXh7bIXLA2LEPl/hsoIAwFBaySTVvSQzBYgkgQTgqvYUzYZGI1ASqoOPoeZwt7CkwvndGNTigSGLxkiLQ/nTsNY2P0xed+poLwkIkiQVM+/0smwwUDw1FsXH9rdu2DfXPLLLt6hQYU8wJyyk8TH81ENPn/29jz/1197/6ZMfePZsN5uaaGL/vrF4YrLeiiIptYJWinVBgreL0MXtXQzZDeY1OSlw2Cp4AaOa68UI8gMUexfHpcKB3HpZYEHgFhtAEADFAiISJDWDOz3VP7ua9Dd2MkxPNehVty3e+Jb7Dv3q/bcv37a8MC4BgMSL6Z5oYtPnZ5qzN1w99dajB8YmJBG2t7M0TbRJ/uf4LvZ/y2JZEQFttXxbQZS6pC8bjuMGuEDzvFtAxoe67j5QgdJeQAngGVkikpIkM/N2Jx3sdDI90Y7o2qMTx44dGHvj0vwEARoiemm7osa26oeUArddN7/wrgeO/Oxb7zv0QzdeNdWQAlhZ6amV1X43SVQGJrblxt0ycDozuxoA9wuV15ZR1Nn1tPuOemkoKI/s1Qm7zoLyE2UQtKkp7nNOuG7MYJWxgiZtSv012/sX27Jek3jkia2d3/nIiX/5/k+f+Jdf/9Zq11j+FesRoXWV4F/hOwcDEDi0NB1NtGqHmzUpACDLoDMFRUYRTSLf8VBSiSFfBxc/Ha1Kr9C37MNazMNhr+WUvHtsGhezL3h6y/7F7P4BQxBIRkQkBLqJyla3Bo+vbfa70Us0506FlxZEYSZXuAxhOFWlFXr9bL3X01orRkREkiCYmbVm7aiGk0TYuPAyvAhtEHooWo984y5Y8Grk0vGAlJEzfbGNeeRcMwqXyIjyLIQIKJuNK3B9fQRyftlS1IIZUxPgqsAIARISQjPrna4a9PpatVsxLS+1FxZnWze4fkKMVQSywiVBZRkDNRAJ+sCnn3z0tz/4+F/72BfOfPbcRopGq47Z2WY8OVFrxIIEK9Zu6pLnrAMlAFwQQKBhs3PYOJ0H2Yac1OBeXph3/fJEn2HCuFBlYP4N15b97JIHOutHYHUwAgtB2KQh7NobbYS7He99QEQURxQJMG13kv651V5/u5tgaqpGr751323vfODYr7/65uU7jPWfIWX9BV+DkWyYb8IZH1gcv+rQ0viBqfE60gS8s6MGWaazSEAIAWFpF7sEbAK5u7dDHkkVPM/8h3E/Za50dSYgyv+GlK64HefhG2YctjOnzHLap+kYRMD7nFM4BvJrEcIZaEeisJ23FfsXw4RBaDsOEZEUECCNTi9NtneyJJISS3PN+pH9Y/fum23OAADrl3YyQFMyi3D1oZnGd7/26M/+wBuO/sz1Ryabaapw7nyPV9cH3V5PDYiJhYTM536edsyuA7M8w30s2N/ydpyH+4baG+QPMFS0+CcQVgJ38wfI13mwp3K5ORXPk72wBkFDQLMw/IBXAuTzvF6T8cxkozkz1RBEAk+c3Ene+6ln/7/f+vDTv/TgV88+CWiQqD1fj6dCBQAAs+KFmdbY9ETjUC0SpDUjU9BKkyYQhM0AYFNwmrVXorFFkF0nLoGuWTSeUwaKAXBk2zuu1q4rvwe4N8GaLq9j774fvIrJBXPNr+unmaA1acOzA8zMmjUTGV43koY6d5NssLo9OHlqbYtVJdZVuAhUVQAuczhOQimtun211u2pNFOAtCEABfE+sDrsSR5GnqTRDUKiRcUWjNFD7Wb+uLBGtNyCh98RkxRG8TFIVNpPtY5qElNTjXhmqnnd4aU5wwJxlQegwqWDecDMmomIPv7Hzz76+x9/+mfe96mTn3n2XI9npxvYv68dT45HjVhAKqV1plgxrHsi/D/ExoXem/gLL8sQXIyFoHR3KK44KhglRg/Gpb/FoVy68gsbLY2iIJJCRJKkUlrt7CS98+c6/e3NAS9MN+Q9dyy96vX3HPrFt9x7zVVLM02IFyFGUWkFZs23Xbu/fe2Rqe9dmG60BQj9vtb9vh5oxYqsAgBAbvC5EAoc3aiTsMPtdiY8OKTpDHpf6FaKI15M66F7uEAnpxw2VnMIIk1pprPeQKVJqtGqR7hqefyGW6+ZvuvgYrvGWnP8EvUCcDHrN18zN/Nd9x7682+9+8BfuOHoZEuAcXalo8+vdrv9gUoAwCT9g1PPEQWxGUZZhovZxPY+X16vFxrL64cCMYPLM2702i4MYbV9JAQxCFkGpTR0vS7i2em4tbTQiKJI4OHH17u/85Gnf+P9D578Rw8/uZ7H/FfZ/is8jxB2pe2bbS/NTNT3RwLIlEamWGsnrAeC87C/1oVo5/BicwrUUV42VGgcjl3ifMs6uz2/ZYl2h6EEubYR2un5AUgJGdms2v2+6m92BpviMsu7UuHFQ+SDxSpcliAiMBMyxdlORz2z3cn62Sw3oohIRkKwSdSkQZBOEwp4/T65eFTv5uu4AcrbAcipq/vjDjumw82ioFap50R20UKQTyBAwb95W6bS8XLGbauE9XlSvcKXSTOQZaxMghhCrRnT7Ezzqn2zjcnT5+Rm+hK3SlV4icMmBpydbDy0uaP+hBD02+947YG7pqZqmJ2sxVop3tjJekpBsSBRsKTapBbGjc96EJsTZmi3xsqZ+u1qySm2zdVv4/cLlb1CP+Dc1ODjZcpiomdfXBxiaVvwcc++tFi+jp2l2N8pEcWRiJTWemtjsJMNdFZflmPL+5rRfXcuvqbbHfwiq+Rvf/CzTz0pRY2UTl4Q4UHYRFLXHJ5pv/GuA++87drpt463YtHpKXT7OlOatZAk8i9rv3DwAxTiuf0XLj0r+xtzyAT6AQHm0ArEvouHY2RDrrbw0Ljwx3l0WPruJgts5pZgzEBhWqLv+ekiRR7KEWMuYQ3Khv5qe/ksY93tZjqWsTi6f2zuNbcv/dzaZn99ZqLxuUy99PKuODf+647Otb//Dcf+8tvvP/RXrj82OZWlGda2U72y3usOBlkqJaQQJEjAuVkwABIuN03wrAvLxsX4D+2BtpN7Br4KgNtLqfi8SsJMaa9lgE0cjrtm8ByZwrlCRXaP80w9TsBwl2UmjmOKJidkY2oqkoI0Hntmp/+ejz317377Q0/8wlcePb9q9AXxpf7sFSpcEkRUI61TvvbQfP2Nrz54+9xkfY6IkaQZMq1NURq4PFd+HfmUnOFact5qIVkNNzBPUh2nHFrkvVtNmV6Wt6+Aphc1Bfbs6N3X3BkhTKwFdywPs2WtWLOGFoJEHAkpCFAJo9dLdzrdZMcYtyqxrsKFUXkAXOZQqssAQSnWnW52ZqebdTINjmJJkQsECjkP64MvLkAhLsb44BUGZWvChXtdEi7FipW7WBlBJVNaJ6mGFITFmebBqw9N3Do/3UAkGVH0wrsgV3h5gHXGkZRY3ezjDz/35DO/99En/vIHPnXii6fOdXl6qo79S2O16fG4GUWIlGatNGswcxgnvHf+/VG4uFU53NzpGS4NtquP4tmV3ykcMq7PMiIhhBBJinRnJ+tubQ8yQQrXHG7VXvfKxXfefv38Dx5Znok1M0i0X5B1yJwBYCzMNGfvuHHmx649Mr5fEmFjK1H9gU5JEFkxL8fFxmsXwqi8+BUc2aXbqLMBo3lxfUL6fsFL5u1ozwN7gJ2QCBeQIAQJZvDWdpJ0OhnPTTej22+cv/P6q+deV6/XAWiQbL5k6C0RkSDgmoOT42985YHvedu9h37q1mtnpmuxwNm1XnZ2tdvp9bMBgRFHJGNJIjD3F/RrDkPrY+jb7vL1R/30Tsd2keu2KDAMHyvfl9MxCIAkgYSRO5BmrJRiVY8pmpuOW/vnG1Esga8/sd59z8ef/o33feqZf/LVx1bWiIgiKaHUC6O8q3DlwiVtXpxtzB7ZN/a6uYn6JBhIEsVaaw3Y6c3DwvXINTdyRY2mqlxYnByYm8oDDh/19+ReQ1e40D14XW54FX+hSJCoRSQkM9J+hkE320oSpfb4khUqFBCBXwQ/zArPMQhpptXmzuDk5s5gI1N6f7MhEEdC2HgoptB+bugMEwhcMAkUrfPmjTFfsDOv+9zWzirhdKXOuhXcljNy5OapAmPsImpzNtmZ04L7BBDqQ/MruXsL7jU8Zlm0LGPV66bcbkV0YL41d8s1M3/mmdNbTzy7svlM5SpV4TtBmmVsM4fT/HTzj7d3kj+Raf0b77j/wF1Tk3XMTmU1pcFbXTVQmjUBYE3k2QHiPNFv8NdbBEuz0y9VK5n704FFEOHbPN2wFeTzjGWuQkGYqU57K2E+vssKnhslvLWC7Hlv6QiuZayLRCTiKCKCSJXW6SDBxGQNy/ON5r751isbjTgCkOEFq8qhIWUNB/aNHbnu6MTN++YacqejsbGdDpKMlYxEJAQEgX2G9zyvdDFzo4/Bd1If+Q8o+CWF1ltyjgXsfzNC/iQpeGevmNNcb1JCTsldnpSQVIcW36JLSH5vvkH+bYr1CoKyE1xsTXDZY00fZ7SWQggwuNPNkliQmJqs1Q4tj7eOHZ5+69xM+9fPrHS7eImUXxXClKI8sjTReOvdB7/vHa859AuvuGpyNooI5zcHvLqd9AaJSiSRMAkhTQYM9ygKqp6hBGEWhWcRrlsabh0sZAZ8Vv6CaTBEaSJysCkWQpCDfZe8PZR90sL8zgTAgNYmZKkeUzw1IZtzk7GMCPjmM9v93/v4yX/33z781Lu//M2zG67MYZplFe9Y4fmHtgqAmcb+o/vbd85N1JqsNAYDrbUGk4v99zQyr1lFwRqA915ze6kjZVxwtwcCUdyvXZujyi1GlwwgUNEV9H5h0zKp9Z4+pe/JuW+d81Sw2g27doOQI5NvR9YjIVkzup2B3tkZrKSJHpgLy0v4gStcqag8AF4OIODMyo7e2EpOrW0lpweZ0jISiKTwtMi1s4Ttght3TgAv6vLfHrzkMFqDuucFRzYPUlsZax5pxbrbzVSWaCzONJo3Xj392iMHxq4FUOUBqPAdg1mzEBHOr/fwgc889ejvffSpv/KBB09++ZkzXT3ermP/Qqs+PRE34whSaTY5AZhNGbBLnfej7yD412LUkLus40sNcbcfhq5Q/Ca55CIECSGFkBEJLRidborTK73e+fX+1weJygAgegF2ISnqxKz56NJ4dO3hqXfsX2hN1moS3UGmO71soDTrSJIUIuffLka68d87DEDlAiu4J4rXCMcotyoLi0N3MHR4VLGJ/H4R0N+LQa4u8oUl7OQhIkgb5jJIVLLTy5IkVWg1JQ4vjR2/7uj0LQszLUTyxZcXSdRIa8U3XTU//ua7D7/zLfcfevct108fqMXAylpXr6z1ev2BTgiESJKUZEr8sQa78rUwQSIYqbYqP47dnmMZ5cNh091+tlC/M2q4vSaxjRgSAKAZKlNKaa1rMcWzM/X28mIrqtckvvHkVu/3P37yN97/6RP/5CuPrtqYf5OGbJeRK1R4jmGm2vRE7eDSfGN5vB3LLGXu97ViDRZEQgAU+KmV+pYUcSWl5oWvzcEwI3r5JJ9FOB2g1R0MNSgMWVIShG/9luLCj9hkgo1iKWuxlFozdnaSZGcnOZVlOjW9KtGuwoURVUUALn84I9XKxuDc2dX+1zu97D4h61JGREzkjH9gy8yQ03wizDJdsgxxyEGSU6EirCvuzAiem2C4814zmqtHQ7uJH870sX99ZhNydrGSAcQreANtrdPkhtyuzZkiSQpo4l5PJc2aEtNTDXHs0PjywaWx+xdnxz8MAELWSFdujBW+AyiVMpEpJbYw0/yjzZ3BD2131D//rnsOPrA01xCzUxwzM29up5xlnAEkZcC9O6tdbsAvCvVhMnmzxtzCM4xH7vrosvzDj51X4LAje8+eosXCGR1DbWFgxPCeQoGPUH4/XghhgnPYZDIGF61ZRkK02lJGjQgnznTVJ790/qOff3jl3z95YiWVIqZU9Z7X9RfJJoE0jh+Ybt57y/57br929l1TY3XZTzS6fZWlSmeRICmIiImhNeu8gGMu8BZ/H/8zWKrINkY0kP59oFVR7Vp6zDZ/QGCR2kXyK1ZOyUcqWqbMtex88k8mT2vgLGCuf27hyi9J3mScOxvYueq62PQV4RwhAmkGJ6nKdjopR5Ggw4vNuXtvmf9rG5udv/2hz2w+KkREWr84luNI1ghEuO26/RPvfO1VP/2me5Z/+sZrJ+abNWBjo8crK/1uL+E0IhKSiIT7SRis7ex2ijs7942fi7uA3w+DBeu/qZECCoL6kCDi4o7zuQfOH01hPlDejgBAc/B87dNmO1HCUAK7lZuKHtbKqFkrrXUcUzw5ETXmZxoyrkV4/Ont9Hc/fvL/+a8ffOLvfvXRcxsmbKLK9l/hhYMMysVOjNcPzMw0xht1iZ1uovt9lbCGloKEoaGjhH/Y+e7Kc5gF68pgF/tRTg6D7m69AME58qUyeLi380bw9Dlc1vndeYWE3aVtnr9yHhFPDTgHiCiKZRTXIhpkmlc3BzurG/2vJ6lRqhNVCoAKF0Y1S14GcBU/z633t8+s9r643U37ACClIBIkPOtpa4de2OYX5hQuEdZSx72MDHkbRonMBmMxLjzKLlau8l04Fy+rSYiIBMDo9VXa7SslJGF2ul5bnG3ePDFWaxAIrF96yakqXH5gTjmSEc6t9fiDDz7z9d//+JN/88OfPfXgs2e7arIVYXm+WZuZqDWjSERKQ2eKFLNNJ+5H2cOkZ64SSgPFBUUhg+FMtBd156OpwW5Lzh/nUNh15UZyUYWZoZljAdGuU216LKZaJHDidHf9U188+6tfeXTlKSFiUjp93oVBpVNozdg/PzZ9980Lf/WGY9NHBUmsb6a6P9CpKd+miQOb7oUoTtiu8M7UeKDhVhczWojSwx09S4buYq9Dhb4FInwxNHi4dTgdrTxKJEgoBm/tpOnOToL5qTi+66aZN9x09dSb9s2PC2YFohcn94rSGqwGfPWRmZve8trDf/WB+w7Nzy9NoNPXOLvW627uDDpKaVWTJGMpJIHATKw1dF5AF3suGfNDXNxv6fFtNre6muLjLN5PcdKI/D0DUAxOFCulWceRiGanas3lxWZcqxG+8eRW8vufOPnf3/fpE7/88GMrm0SCpGxA6Srbf4UXDtompV2cn6D2WHy43Y5iihj9VOlBojJmZkEF73gAIY3k4cVRVsReFPagw8Sl7Jo01GPPrXTUzYUj5YmtnE6dmZmjSFBUkzRImVc2B2urm4MnB2mmAEBUkl2Fi4AgKuulKlxuyLKUhYjoiZPns9Mr3Ye3dtIdMBBJASmEIOfGaPMBeE2is/FRKPA74mVNHS7dkePwOVAjBFYj55nkLA6uTpJvE5QKLFS9Litg/XkEBwEXb+rbh9UGABvzrwHS3ttKmMLdGCQ66fRVmipGsyGxNNe8+vC+9kFduTFWeA6RZikDEYiIPvPlsw/9p/c+/qc+9JmTHz2/2tPthsTcdD2eGKs1pBBCabOPu83dFhAHYLJ1GGujseg7X2tvALaGPbMUnGGP7VIhvz6sFb5YpdNbcPPjdkQrUIQ1zV0mDdfYK9jycdnRBUcLzPfQmjXAaLdkY2qiVo8FYX1lgMef2PjSN55Y+9LKRneU1+RzjihqEKDAnPGRA+OveMW103cvL7TiNGFsbGZJmnAmbYZ3SyKZQtjvWyifUHg24SnnIm9pny8m7ayulouDpXHut0Zg5SmoXgvh9uZNmOV9lOupux6oUPu9SN89IfZwNDmcMAXOIChN6DxOTF1q+zKDkBCmxOVOTw22OlnWakS45vD41HXHpr5nbro1ZgZ7sSqwGK54aqp2dG6hNoGpGCCJJCHONGk2if7IReDCleu0C8bn0bFznKzHh7UFmufoH6ENRguUcq7OePCY84dHyJ8nuzXGNh9A8HJd3P5nNnLkdc6DueQno52vJVV8ZkOSRCTk+FitMTfViBqxxFMnt9Pf+ciT//4//sGjf+nTXzx5yowVI8uMp87sxGzFM1Z4gcAAJKanWo3pqcY1jaYUGox+lqlEZRlDQ5CvSwKnCrB7GHL3LbaWeLeX2vXh1iSR399ynjK/g/yA3W/9+mYfyudztxLgPW/Bdj8PA/7chsFuv7Wctj1eYGz9PkFuHM2sjQKARBQL9BKlzqz2nzi71n+qP1AKIGRZt+JtK1wQ4pJUzxVesmBmSNmglY3eszuddJM1EAuBSJCRgw1j6CX2opBdBo14Fx7JX6E1aLiHY2Q5Z2bDIXybC5lAhscsDmM1EE5ZYbURZLk0xawHqc56fQViYGmuuXTDsan7rjs8046lQFxVA6jwHMF4AjSwstHHhz735NO//4mnfu7Dnz31mRNnu3p8LMbyYqs2M1FvxZKk8QSA1oxA6thrPeRCWKGJE+h9q5zV9+cv7VsgkESCy5XXYSBShrIJg5ViJQTE1FStMTPTEJtdjYe+tn7i8185/y/OnN/eVlpByuhSb+ySoVQKZubrji40rzky9a7lfa2pep3Q6Wdqp5P2lGJl3P+LBGrYOrOXLSdoRWGbUL0ysnVwfrdn7jnKEaeH2+9+d+FzxAj6W1RB7D2K5V2pMAoDQCRISiIxSFS6082SNNOYaMe4+uDkK266evbWhZkxSMmI5AufgFVYs9jZ1e1vfP5rZ7/22DfOcX9rgPFWTDNTzVarVW+QkJQqzjJly4s74YJs3YBcwGeySTyHn/KINXpRuND8Ku25/lff41I0/FFrRqZYK9ZaRohmp2qt5YVWrWHc/pP3ffLE//yDTzz1S1/8xtlNIkGRrIMDy//q1mrFNFZ4QUCCwJzy8sLY0uxU40AcETKlkWRaKc0axORycuwyQkCOuXxm6N3I/iPOc6nJsP8B77H8Q0XwbpfgoT3eFuok9zmKIEQk0E21Orvef/Tc+uDMymaPK5tuhYvF88+BVXiBIKB1ho2tZKPTzTZ0BkREqEmIxJZoYjaJ8XJOd5gg+khRcoy9ZQzZM46FEOScpobk1HPT1gyWM8REgeHDxSOGggzlY3nGymoYfLxWMUgKsBYoylNyO4UwkQCRgNCada+X6VoUif1zrYnbb5j780+d2fnyN55e+0JVDaDCc4k06+U5AaabD3V66s/3NP71dz9w6HX75lq0mOlYK93Y6Kh+plghImkCixkE7XL8AACKcikXYw69iYJt1IsTENz6ciMAeaIB+HNshwyWHMhbeXOB0GSbd9cyCzjvRnbdWYZHG4swCRJxXUbjE3VB9QiPfGt96/c/ffoXP/6Fs+9d2+yDQN6i+HxByhqBGFcdnG7ed9vya24+PvOWqfFYDFKF7kBlSaazSJAQPrjeCNphFb6AfbS/SemEz/YfPAtrWRrmw9wzAoJhPfKk8SH941DOs9QtV7x45SvBWaRss5ya571zQd9ndym1yBOyUD5+0CJIK+COBYSfIAmktdZZpnW/r5LtTtasxYKuOjA+//pXLr270+3/tc98Of3K6kaCOGpR+gJaqpTqMwB85ZFzX+900h88dabzd7/7/oM/eM3B8VokW1Jraq7rBP1BNlCCuSYoAgkCCfjADqcXc4/Xu8qZ38M/GdOMnV0PgH8bxATbqWOfd6lSQ77/lX8i82TC6jdcrOZkZgMF8wPk55dSrJSCiiJEE2OiMT8TR+2WwJMnd7Lf+9gz/+W/fejJv/mZr50+a3bRGGnWrwT+Ci84ZFQnrVI+fnghfuPdB+/dP9tcjghIUw2loNm7KhVWHgzbCfcOwQmgQO+4LLl75JtsoPZ2EUBWGA9pcngJtxRDDwJy/YI+NrohYGfJXRI+l4vlkcmMR8Ky5oIg4liQlISdfpqcXu3/8bn1/loka1TF/1e4WESXqKKu8JKFAJBhkGS639dbWUqo1Qm1GJGMEClNWjNpCUhLMveoNB2iZN8oEcxy2iqfL7B4FAHrWBqS8O3OwcIw1g/TOjyyYdw0iECRJAkwur00q9UQT0/Wo+uvmr752KNrr16cGXuIWUHEDdJpxehUeG7AnLIUMZ1b7+FjD515rNGO/1qzUft3D7xy3x3Ls3WSslkXK32xtpX2tGKdgSBMSgArFQwzJ7xb8o5c/i7aZAvC2iV/g9JfN1BokrCclrWAKAZUZkprNJuyNjkRN6JY4vx6wl94ZO3BT33p7H954sRmZjQI6nlfa1qnEELi8NLEvvtu3fc3rjs6dRAMrG0lupeozNt23W9V1i0WMNJMMxoFpWhJ6zI05l7nC2OWJPDh5jx8aOjs7lcqKgJ2Gyek4X5E9gdYCBAEhCCiTEOvbyUDKVCfmayJu2+dv+fseufHH31m8+dWN5LtTKW73u3zhTiqU6bS/tPPdh7rdpP/vS64Gb/m0LuuPjAVLS+ORVL2WqdXOirNVEYaSgoWQrANJhNgdlHJ2icEHEawM7mEuKMwdPRC8+tSFrLbl9kvU62gGIBSUJFkOTtVay3MNuJGXeCJZ7eyD37m1Id+7xPP/P3Pfv38ORPz36xciSu8aNA2QvPgQmvpuoMT71icbExozegPNLMmFhDkwm48D1hITPpcTN3y/pcfpRFnitzwHlTUKRNHnQuvGfDSLrZVEEhKIWpSQBDQ7Wf9c+u9R584tZYSRSRllaizwsVB7OE7U+GyggDAyDKtd7rqfKentQZQbwgZx0Iy8hyi8P/m0cE+jolzuuS0nWEZY19oj1H0qHLxTNYtwIRHeqHcjmcrmLi+5bItXHzlZ71pDK6WudGosruui3S0dymsmYUgCBRJSAKj008H271UNeoxDu4bHzu0OH7feKteAwBWL1ZcaoWXK0yCuwipSvHZr5z5yn94z2M/+L5Pnfz4uc0B2pMRFmfjeLItGxIElbFSIECQyAX/PNN+QU70FncXYwjY3Mbw8fnI14mzNnh9G+VvwvVtxib/Yg7jvGG9DEwsZZ6N2KxDTQTFZGKKCTQzETemJmtiayfBF7+2+tQXvnTmn3754ae3gBR4ASwUMooJAJTK+NojU6++7caZu5cX2/EgBdY3s0GSuth/Fjl5cb+3i/dmF8jPecx+MfY/zIfiXuanNc/IGIithsQftzS3RENdjKc/T2Ff74fu2znblJ8a9pk5mkthAoghbQHlJqngFNn5kyd74XzeIR/PzQfA6qlcZhibF19IKSGIdnrZYH2rn0jJOHKg3bjxmpm3HF2e2mfKyL3wCVjTbMCmRrbCZ7506pn//N4nfvJ//uEzv3nidEc32zEW5+tyYrzWjGpxrFhwpk3ILbEGaR0sQ/dbB3H1wb5m9k4ThBbkV7CRvAjDiQ3cPAom1nC6XjenrO4tmAvkpwsTu/3XxzQzs4bONHSqWcsI0URbNPbN1OOJsRqePddT7/n4M//jP773sZ/82EMnnwQUgKgS/iu8uDD1ZHBgoX38+MGJO2cnG/U0YXR6WcYMlkRCMAGa2OfPcYmlXH4Vy8S6/BtD+fr82nXaX/vyuVOC0tJuTx3ifd0e6lrm/LQT6N1teSdVcLAlcEB3w+uTfWuIrTbFN5mEoFgKGUsJUkCnk2yvrHfPxVFERgao1m2Fi0P0bZqHKrzEYJJOEZTSvLmTPr2+lfUnxqNWrS5FXOOoO1AJM7P0mf8uDrtTEh59nnb7cJE0abTCddeDgbGtYO50+gUCIAmkwOinWSZ7ItUa0US7Rvvn29cvL4xNP35y9YwQsloIFZ5zMKcsRJ3Or/Xw0T869VSjJn6y1ZT/8fWv2nfr0kydiKgmaYC1raSbKVYAQRKBXGkPL/Rf4ELecMAB83ER9xd0L78bukRgYQmbMxG0ZlYKSgimdkvU52YaMq5LfPOpje1Pff70v374m+c+BwBEAvoFyPyvlQIz86tvOjD7p9959Q8f2tdsxzGw3VXZdtf4gkcRRWTzmiIPMPK/QMkW4+3no2+e807+UC7s55/D5heyFJVApTelihAXM9reHgLBLe0yWmE6lneSQMkkIiGlhk6zLNvu6MFOL61PTNZxbHl8/503zP+ZW67Z939EUmy7uvJ73PJzDuaUpYxdnNi5WhT9/HS7se9tgt64tNgQ+xea9XgjlWtrSSfNsoygIQWEIHar0tnVCzOiEK5jf4fg9GiUJ1nxTksDDXem4MEXH0Weeceo6gQzACkhZiZrrX3TUdysSzxzqqM//NnTH3/Px57+Bw9+6exTRIKErENVbv8VXkQI2SKnIFyYbl63vNBabDdj2ur2dLevUmZmG7sV5ia1QrsL5LIHgJKWO0R5mudC+/Dx7xB2qdJulyhfyymLrcJf22y8QpCII5IChCzV6Hayze1O0s2UQlXYrcKlQIz2Ka1wuUFro/UbpJk6u9r78rPneyudgeZaHFEtlgIA2GQBsNmtQ7M8ihZGBJ/L1ghv7PDWQGP1CiyHoRa1mEUcjkDDKTvz5uUbyBv4JuSIp33jrJSO2ckPAwRoa710lhGVsRoMdNofaNSkwJH940duu372nTdcPTelteKw5myFCs8VtB4wIKD0AJ/76ulH/r/fffRPvPeTpz69uqkwPt3Evvl6baItGhJMKtWp0uCi9BC8/DoqCZZ50GOQLy6wX7iuZQsIFzrAWQ8DIwgRM0h7sybnGT6sAz0bDwYBprGWbM5M1xqtVoStToavPrb2xU998fS/f+ibZzaIiLR+/l3/hYiJSODWaxenXn/X8o/dcf3sfeNNgW4vxU4vSxPFCsQkBKgQ/+9/TPvOfEXylXLcI0CuLjAksiT4lS0+/reHK6ZihDJtU8gzwbiXU+5lAXbOB8VBhp5lYEFyyp/ce2OYhqKY7T8f3tH54ozLfwmY3u6eiAN6DDgaC/sNBDGEgAATsoyyre006/dSHFxoNN50174ffeCOfT+wb7YpASCSL7zyVSmnhGJ8+osnTv2nP3j0R3/7Q9/6raee3comxiPsm61HE23ZiKSQSpPONDTDJv4jZ+8DF70wckWAl0zC9Wpf+c9NhWeeo6TAo+LL7bkFi6Fvl3sF2M2WNTMraI5ijibb1FiarccT43WcOtdX7/nYM7/3m+997C998Rsrj5g5Jivhv8KLDtYKAHDV/tlofrZx29xso1WrCfT6WvWdAoDYpv8zxJD8C+RpoOdB7bhu7cCuGk/oyMvawVZaYE05WOFhUutQKegqhiAYe8jTy+0BtkHZJcjRkuJ/hp/VIESxiOKYJJjR6yre3k7P9frpoHg3FSpcGKKi9C8vnF7Z4tOrnUdOnNt+fKeXqjiKUI8th6VdwZNLIRIjBPNdQYXme/Xac8SLN2Du1t8VLAsItRlQKahON9WDJMP+heb4XTcv/MQNx6avAwDNVRhAhecOk1MLfhYzZ0yihvPrPXz4M88+9j8//PSPf+SPzn7t7Pk+2q0YSwvNxsxk3IoiRFpplSnWrOGdCQEUBQGEB4ufcwbiwhi91EYJIzbg2ZdbMme1JqgMSmdQjUhEC3PN5txsgzY7Kf744ZVnH/zSmV978MvPrJgc6rJwleernBizhtYZ33Bs7ub771z6iasOjU8Okgzn17tZf5ClgphMvgV2SgwKvmnxnop6lj1+0rJ2M7whhPJ70bd7JDH2HOeFiWhRtzp07kJj7H56LyJcLnGHwjQxAzIEGLEUUpCg7e2sv7o2yJqxwC3XTM/fe+viTx8/NHWQmdkEq73wMFZECSJBn/ziqRP//UNP/K0PfPrkB55+dkc1aoT9C4363HS9HUcy0oq0UtBsw0FE0Y/YjBf8XiOXqm8H9xN9xxthnmEwH9sdYA3NijRrcCSFnJ2qtfYvNButhsSpM1394c+e+vj//MMn//YnvnDqsc3tFFLG4BfAO6dChQvBeK5oXpxpjc/PNq5ttgVpYgwGKstSnRIAISGcwttqqr0Ino/isBtBtBq1AsJVNHxsN1zSci7vD4WP4RbBvonWrJnBcUSyXhdSa43tbqa2O9mZVLFJqFIlAKxwCRCVxujlA7Jljk6f3zn19Jmtz252BgMZCdRrkiSRcAxoTgadBjKoR22ZSfiYVjt2buoP4lxDw0YuahsLh7EUaW+lDzWmYZRUwS6F0GrprVT2mk5R6y/ixrP3ELo9CjgGn32xJimEYGbe7iZJp5/y7FRd3HLtzI03HJ1518GFSQGwyRxeocJzgM2Nc4WtXasBmw06wx999fQj/+F3H/1f3vuxk586t5by1FQb+xbb8cRE3JQCIkt1pjLO4GXuoAKZf9m146wcFMbthyHclFsGHWNhT1JhDQPOPchUQCcQCwakcfN3vBIxXJkNpaC0hhZSiLGxWmNutkVRHOHhx9bXf/fDT/7spx569qOmrYDSWeH3eD7KiQkREyBx1f594tqjs99z7dVTByamYmz3Ur2xNehlWZZFxIZSMgLrdfjyPwK8+cj+OL6Mu6VpeahmbnEnl6fEOQ74hAlhEIDv6OkckUbBWwPFV0i3PXtI4fOHp815P0Pf3YQINQ+moaOx7mu6HyGg676CRJBXwo5h5ht8CG1ueTYvKSCEgBgkOt3aVv1+whgfr+H40anjt14//47rj81OaGaWcfyi0F2lMhYkAGg8+KVTz/zW+5/4qfd85Jn//uy5jp6ejrG0rxFPtqNGRIJUSplSpL3nAwCfIYKDNWZP5s/RPgm/Hq387/NEINRY58+Eked0cL+7z6FjjmsQ5zkh4PMygJlZg7UmHZGk8UZc2zfTiqamWji9OtC/+4ln3veb73v8px76xsojJq2hRJYllfBf4UWHEDWSgnFwYYauOjR169Ji80hcYyRZikGiM51BEYiEIAHBgn0KgLKEne9zgFUU7Cqlu/0wrzbllXQOjlYjVzQQheuYLdtsV2ugKw9XsaOvRU+t8Br2jpjA2iX0AGvNWjNzHJFo1oXQzFjfzvrr2+m30lRnQC4DVKhwMajqn72MIEggimq0NNfaOXF2+8HNzuBHhUS7XhMUCxIZDF8Q8hOGk7jwLKCcBy0dDwhuoEgNGR0nnpfGu0idapE27np3viX728hdHQxVjSRLBtDrZ+lWh+T0ZC0+sNiqXX1w4rX758YmTpzb3BBULYkKzx9YZ0wU0/n1Lj7w6ae/Ac1/sR7L33z93ftvn5+rY988x4J7rfX1ZEdr1kpBS0HCxQPqkrWXC5/8QQSngzXAF7GWRsEKNd6X0SgKtYbOFKtIkpwYj5vT0404ZcK3nt7J/vCzp3/jw5858TuPP7vVJyK8EK7/MpLErLEwMYHbr5+7/abjU2+bnIxEP1PY7GRpr58NJEkRR1ICgC+0MIICkvveBU3jaJpVpGXm0yj6Zj3xfS6FojQ9yqn0Ahiy+rpDPHKI4XbfATh3ZQ9H9fPSao6FMFqCTEH1B5yub2WZkCKanak377pl4cfOrHUfXpwd+5jOFETUIv0iJLBSOuM4qhGRIEHiKTD97MRYtL/ZOHjf3GwD++brdcECaxvpjsp0RgIkBAQgQEY1bYs+5pHHYOdemSsE7OHg+5Wet5sXQ/OgqPUu7HZGK2CyOVudAbR1F9asIynk9HjcnJ2q15r1GKfPD/jDf3Tmc7/94af+5ie+cPoRxYCUcSX8V3jJgDlDqjXfd/Oh2Zuunv6TS3PNWWaNbl+xUqxgq1kLAlSJquVGJPuX3RrZg+Lt4RK726IY1SHfaEfsyQj2FAqoQLglF3Zqq1ngfCi26XhrEck4EtRPNZ/fSNZXNtNvDlKdAgRdhe9UuAREL/YNVHjukGUDFhTTiTMb2RvuPvL19a3BOsDztVggiiBJOF0lfNp8GkXJrI+AEdupQNnYStWeaoWekOTMjk7baSWFAjFkb+Rwn505Ja9r7gpzOc2tvWLog0vhH6fLcAySvSYHGwKBJAnSzJwkOt3pKjFIVNxuRjiyPHb8hqtn7z6yf+ZDmrOsKglY4fkEc8pEgjKd4nMPn3mUhf6RQZb9m++6/+C9i/MNCEaslG5t72T9TGnFIEQRBJuYb3Z2BQ5WEeWLyK9YJ226ZHRkz/tz5m7sPXmrpZcemRgaOY/iezKBNVgr1gxGoxXVFxab9WYzwmMntpMPfurZ3/ngg6d+6Ylnd/oAQ+sXJsmbVhoA4RXXTB15232L/+i26yaOx1Jjazvhfl+nYIKQEFKQS9YeCN0GZAWqogw2gkjaOFIn8fHIZk5bYx6Z17nmxRmGLVKjBHen0MzJWn4ivM+cKBesSKNvjgt/QkVEsRWNOO4yQRaVI07Pm+8xeSIuIiIN5p1OksSSxeR4Xdx54+z1Z9d6f/Xhxza+cG6tt80qGf7yLxDSLGESddKc4BMPnXzmbfce+XGl8M/f8prl1x1ebJMkWe+nWm13uZdmyKQkGQkSfjnlhkb7jCjf54q/cXnplSQDdyLUEwwrArzwb+cwafuUSVCmobQWLCXJdlvU9y00auNjNZw429Xv/eSzH/kff/jETz70jZXHFDNAUSX8V3iJwUzHYwfHbr3p6sk3LEw1GulAo9tRymTBJwFhnFJD2hakqzLUlvLkJ169WrZkUemNXVTkMgv6NTai0xDtDPYCZq+cy92FzD/OAy+X+M19DoXzuEQB1m3AnY4iIWQksLaVqRNnu986vdL7xqnz25qoSmRd4dJQ+Yu8zMAAiCJaWRusbm4PzqeZQiyBWkxSSkjt+BSyXrwoEqcCj+E+UvAqX6/MwFoUuwzZwoqWtYDNLLY2IxTG2e2Cvn1poEB6MUm/QFpDDxKdbu0kOklS7J9vTt31ivmfuvbo7GEA4EztMn6FCt8Z5iZmDFvAmgGBlc0u/uATT3z9v3/o8Z/86GdPffHM2T63GjEW55v1qcm4JSWkZmalXVFNUB6OY6d3OM+BXBgrLIdciN+1SgAHL/9Wm3s1Pt5MTNAMzhQrJqDVihrT0/XG2FiMzZ0BHvzimQff89Gn/+qnv/jMWQ1CJBvP8S84GkQxSSmwND9Gr7pl7k/fd+fcvQf3NWS3k2J9PRmoDCqSUkopJHJ3/xFfvnysdB0Mk0IuvOPSGfYdwqR5Bbk6zxlYfgQX991H3NOF213qVVyf0QOH0y1QS/irCElCSsj+IEs3Nwd91ozlxZa89brZ+26+ZuZVzIqF0BCy/qIxsawHLEQNRILe9+mnvv7b73/yL378c6c/f36tj9aYwOJCrTk5EbUFiFQGVaiQaEYoKGXCcIDRCJ4ajVDH54oeX8DXXsVNGfiygmyUPVoTa00cSZJTE7Xm4lyj0WpFOLvew0f/6NTnf/sD3/qxj37u2cc2t1NQFfNf4SUGIhOCubwwRYeW268/drC9PN6MqNtRuttVCYhIRCR9SGjAvwarxKlMA4Lrr4DRlPLCFLRMtv2bcL+k8OCo/STUFCLUCw+NNzSGSaQjarVICCGxuZP2nzm1/eCps52nzPlijp0KFS6E6OJSRVW4fCAApNjupL3NzeREr5Nyc0xSI5ayG0k5UFqxhgZB+GIAlngWiJGNO6KQwsIoK0PC68lwaGVyWgPHDI2kt/ZiDLh6r74ON0YQ2kB0cXGOeX4Cp9Ut5hlgd1PBHuEurTXrTifNmjHVFqfr0StvnL3vW89uvwvArwEaImqSznrV4qjwnGJlay3f3lkxkSQiormpxlcE6M91k+xfvOWeA/fuX2hSLEWsVbex2cn6qWIlCSKSJEJTYZ7yD8CQu01x9eSf2Vv8h3RmgTwCDZAm5z/A1usSrDUrZm40RG1urt6amarTzk6KL3999eSDD53+1U98/slTRBEJUUP6Arl0ExiL0y26/YaFG267af5PLC+3Y0iBzW2Vbm+rHoEokkKK3EiNnEF0piOEP1H+OyDQr5RzvzmGj+E9kIpNQutt2cRT+OMJVYH/C28CXBhmt9RVziG9PHp4N2GmazcYBzfP+eHhrxJ+Hwq/V+mLIPfAEkSCwZylOuso6J2uajTbsbj6wNjUG+5aevc777/q2dmJ2jfObwxeVJqr1ICJTIlAZn7yB95w/CdjKf/NA6/ed9vCfINqsWjotKt2uqqvFCsGhBQQPo2kV+MUfUvyPbPot+N+8zAUxdccJ9/Gx6KEj0AYRZ9ZqppYKWilSQsw2g2q7V9s1CYmYpw62+MPfOrZB//HB5/4sQ9/7qkniYggJHRl+a/wkoMGUYS56eb48r72nfNztXokgY4J4UpAZOrfwa4y53VkeU1hbfZu9QRLDXl+lSC3laO5BXpvViEHx/NzBoWdtUBiOeeFHfvptwAuhkwRh93yUdnpBfy9GVc7MKKIZL0RkYwibHbS7jOnNz9x6uzWTixjEqJy6K5waag8AF5mIBIACEmaqfWN/mNr68kgSzQaNSnqNRkTiEwu0T3cci1j4YlY0bDhmwzBEb5SwrIRg+cWj5HKAc6l+oLytqTRHXmBIKFgqb9JhAWWkqQgiG5PJdvbadaoSVx1aGz8hqsmvu/2G5YnpCCwqioCVHj+wUaGwOrGAO/5xBNf/q0PPf6XP/b5U184s9LjZj3C/Ey9PjVRa0lBQjNrrZlNlUANF5kPZwJ0Kepsxjd2/IZPNgcwtGNtijdCpZcZkokJ0iY1YgYrBa0ZOq6JeGIybkxP1UgpjYe/ub7ykQef/SdfeeTcQ3FkEvHV4/oL8hsSEWnO+OpDUwde98r9//t1x6aPaQisbmbY3tGDLEVGIAhh47QDehakczKDWUvqBa6Ytw9G2bWdzxxYeuXNytn1Rg4V5ooaukz4t9x45LiBkHmhr+t9wfKGPumk+zr5P/4XLVyNAFdyUTF4YztNVjcSHm9GdN+tc3e95d6lX7r64ORhIQToRc7DwpwyIQZRRJ/8wpkv/I8PPv1jn/rCuUfWNhOMtyMszNVaUxNRWwoIrbXWmnUoaIQPeOhRO31daKV0zwvhIIFGwOm+RxUEMek6oRicKShBRFNjUXNhJq63WhLnNhJ89I/PfOW3P/Dkn/+9Tz7xdSJBJCKwykZOpQoVXkwQAVqnfNXyxLHlhdbxRkMiURrdQZYmmcrIlRcFgjVTouQFQ5Yd15/fjTMtHitSdCqMMNyDRo6R7ynsNQlhwt18IDf+8LbAdt81ZQ9BcUSyFkcACFs7g83T57efPLW2yZnWUJXBqsIlIhougVHhcobWPSaSlKQZn1vtffnM2d7qwmRrf70eicZAy61uxlppBSFsCRVPwgJLeZkZyds5nUCeaM85EQRWtEArGprf/XC+YkBOFQs8UXD9EfYlezBvO3oCW02sy8SNXPsqBQlm5kGSpVtdFvNKRxPjNRw7OHHt9Ucn7ji/svXJM2t9FUcNSqukKhWeZxhPAGN1nJlqfKUmxU/0kvTX3nz38n3LC21Rq8UxKzS2Okk/zXQmBUQUkSSCyRIMwLkPs5v0DBZ5BfvA8lDgPIAhT4DACmGSLRl6QEyp4izNkMU1UZuciBuzU/WINOOpE1u9T/zxs7/5sc8/+5+ffHbzXKYYzC+MJVeKXFi88eqp+++5Y/7th/a1a/2uxtpakiQDTomcn4Ux/ngCtotgTPavgfs9wqO8y2lDrQq/edi09DBymS+nUSPvyD8SKhxgT2dDVjWgrMSF2yy2L9Paov9BMbcLcmWw/y7BDTrlsJ9KnB8L7pcASElSMXSnnyZYZ7RqrcahpXZ8501zD3zlsbU7T57tnTi10lVR1KDsRaS9mhMmiuncZhcPfvnMF+Ka+IlM0z9/7Z37XrG40KJmM2ucPN3FVnfQU9btWFqXuvyRFLXmNvEEu8xeZtdzbL7rZM75j+4NBU8q34qJNetMgzOllSBQuynq+/c1G5MTNZxa7fMHP3vqC//zQ0/86Hs/9a1HveVfVW7/FV56kCIirTO+6/r9U+94zeEfOrw4tiiFQDdJkWastPFcJZ9rhMFkk5wEpNQTarMEXS6OcCFSwKu6Y/m+Fy62Av3k8EB+JqDGhb7+kt57h2jIbStU9JXopqMG2hZwiYQQtVjKiIAkVdjc7q+c3+huuio7FSpcKsSLqmqv8DyBcG5th0+e7TzyrZPbX93opFlUl6g3pCSYeqKGqQiNELklIkhGQqFbPhDQvcA4ERosHGUONAC7INeKDldv3R2F8K7g+uwUC66Miz+BMr9LUhAJAZFp1t2BSjY6KQ9Sjf1zzclX3TT3U9cfnT6WZilnKt3jTipUeO7AnDIQY21zgPd87Ikv/NYHH//pj33+9OdPn+9zvSYxN1OvT47HTSFIaM1aaxhXADaWVQEqLEMb5h5UwkDpbMkK4RYJ5+uXCCBpit9Z7wNNAqLdrtXnphpxTQo8dWK7//E/evb9n/jCs//3579+9ux2V0HSC+eKqFmBmfnum/btv+36mb94/NDYeKMmsLWZZDtbSY80cxyJyFuNRtlwnB6Sg9/FE5cQjsULLUnIG4/sc2FZq9xtiK765zK642i7025q0eIZ3uXE8D3sgoCxLoxVILz54FKQiCRJlSm1s5P0t7YTrZiwvDg2/qqbF//y7dfN3TI9XodSGUg0X1T2xCTrlDi91sFvvu+RT/z2+5/+C5/84vlvrO9kaLdrmJ2q1yfbtab0a9Jk9siXUOn7j/C6M2UaNUAaQ6y/K9WJoj3SQWuwUsxaaRUJiIlx0ZybjRrtsQhr2xk+/sfnvvpf3/v4n/rdP3zsS0SCQLKy/Fd4yUKzwuxkk64/OnHH7dfNfM++mWYzGWh0ekoxEwsRFrl3SoA87R+sN0yBYBUk+OIOWbI6BXAKS/IGroJ+3LzYZunnMoNZKogdrOrSxmJLpboSrqHWwR3TYNba7PRxJKN6LYqYGTs7CW9s9U/t9LId06lSAFS4dFRBIy9DCKvWeerUzslvPLP13huvn7173/72ZKMhhRQQgI2BIirUuQoVnAA8jSxyjDlxzHsVuiAkhoUBS0wm+7pYYe9AMVBIl+3PeqY317hS3qj8LbwlhtlLRFaHTIJIa+it7TSNhajNTdbiu14x//qTZzvvOrAw+U8AzUQxGeGsQoXnF8wJE0VERDQ1UftKI45/stfHL73x7v2vP7CvFdVqogYGtrfTXpJwIgVkHFEkgnXKXOR5oNnbH8yxcM0VFmO+XAmw2T+IwcgYKst0JiIRTYzVGgtzjfp4S+LUuR316YfOfOy9nzjxd77y6NojRJIEImT6hbHcmmJQhDtvmN//3a858jOvvHH+rnYzRqebYbuTJoNEJbWIYpv4Dy4kImTovKxaJCr5Wy7TOkubQjIzkhS6qwR0qZDNPaervkjqLgL+3j9CeIldedldD194+CJFD8X98IxzVYXXKxV/FIZjqG2cLjNnitXmdjqIalFjbKwhXn3LvldvbWd/48TZ3l9a2Ty3CR5c4O6ef2id/P/svXeAJMd1H/xeVXdP2gk7m8PlhAs43AG4OwCHwyGDBINIipZEBYuSlRNpfZIlWdmSSZuWLVvZliwrWLIli6IYBTAABEHkeMjx8u1t3gk7qbur3vdHd3VX98xeAEDcAegfediZDlXVPV2/fqne86NzOI4O5B+zLPgx4crfO7B7ZOdIKY1pi6Wn5hpQa7ptV5JgSIwBADJdIlfvM1WVLPTYnclYEyL+K3mvbSGkEBIlY8gKWTM1NpZJF/sMmF7swN0Pzx76x68c+dF//sarL3oeQg4kE+U/wcUJlfzPMjmunczfuHldYU2+z8SlWofqDdeWAMS4Z+fGgGaC0KJA0CSKCqght4ZxN36PEDmue0QrjFQTYjHaSMh4GiljrI4WhMzZe+7rOQMAkQhJkkSGLJXiZiZtcFcALNY6nYWK/WLHlrZ3YJIAMMH5g0Vj/RK8HSCEQ4wZ+OyR+drLJ6p3z1TaCwQAqRQHw0CODJkEBCIktbRQOSwCwVA3eaJKnhL+U9u90Hp1ouaFjHsYI94s8NfZ+p5/8tuH7oWwFP8SXymw4tOrLKveSfpwCIgAETjnnDHGmg2nU6227bSBsHltsbhzy+B3rBrND3lJVeQ53/cECV4viFwCSEGl5sLnvn74sb+749UfvuvhqW9OLTRlJs1heCBjFfOpDEfGpPTUe32OoObVICLwPZKkTeeInxfVcpzgLH9SoafQuYKkK6UkBpjrM1IjQ6lUvo/B3GKLHnpy9qmvPHDqV+584PhzCxUbEEwQ9OYkFkOWQUSAkYEsHrhi/IPvPrDqRzdMFrLNhoDZhY7TsqWDjBjjxBjzLl8qX40S+fR18rqeHu3J+68WWRQs6afws5dgioJs7H7JRgiyrAadUECQIX0FHKX1GX4LPETqp1E87PuaogUfNAGVtHWrGF5DmOgKtcPVB5+XVZ9qREH//vsgbLmHIIvhCwDDwQf3THrh8hyBNVtuZ26x03ZdgPWr8tbVu4dvv2Lb0E1Ewidt84LLJ54BGGF2sQ53PXDi3r/74ivfd88jpx9bqHUolzWgXLRS+ayR5gy5FwkgpZ9UVzcokfRqeHp5+1G/c9q90X+zYADePfSeKy8kWEiQQoLknPFizkoP9WfSfbkUVJZd+MZj08/+ny+9/H2f/vLzD3mlwQyfVwAG8v0X/H4mSNANAQwRBkrZvomx3FWDQ2kLGEBt2bEbLbcDCMi5X+eOAt5DQIaELKAygJCbI7NL0V3oXwJVCQaVwVulvNanHoTcG+FZVAS/cgKXIPVOMN3jpXqCHrRBhWNTV6YSdKdSBk+lODY7gqbm2vMzC/bjtg0uAAf5JhndE7y9kMSNvE1BhMA5x5PTyycXl1pTUkgwDAamyTkyxoiApB9CHKlVDKEBVedC/bsutEZOBYhKqhrjqkitXuv8ewncET7FKPsqOTQ8O2xTk1EDq2+UdDEQsjhDxpBhx5Z2veF2bFdCMZ+CLWtLW3ZvGbxx3VjeIhLEDCsRmhK8aSBqE6IJiIh3PXL0+D/ddfjjX773+F3TMw1ZzpswPpy2igUjyxkyx5GO45DwMr+jlxQcUcvuhqDiGP28m54MFZ3coJJ+6qt3XEHSdsAhYJDLmunhspkeKDJoLrfg/senn/7MXSd+8pFn5w4hcpTEQNKbKISQgHIhBZduHNi479LhH966ob+QTpuwWHXcas1pkSRpcMaRoVctOkZLPa2H2v3oNkNqAlr81AjJdLcbV6a72lrxTAxPVgWpA+UeIsQZVJELlnL1jkeIHq9dTmBU6LorkTbOBIwllOi65RC+XRgyxjljrivd5WWnVat3BAOCjavyhZuuGv/VD92yZc9wOYMALiC7sEkBATzDHAHCXGUZPvv1l57+p68d/fGvPHjqkemllhwsp3ByLJMuZFkKgcCVIIUk6duZtR/H1wEIKXwX6jEVXT9rsB38ZoiQXEnSFSSQMdaXs1Ljo9l0uWTB6bkm3XnvyUOfvvPwDz/w5OlnvLQXHPQINkpEvgQXGQwjhSYHGB3I8q3r+7euGc9vyWYMcFyCRlvYjiNdBD+JKCH5y2tIny3hHKHg7RdjvMj30BAcbyOchVHJMrbsC+PysGoQYwbZEMowEbSPFNC6MuiCOkZbLuRn/YWUxbllIdSajjg61Xjh1GzrmemFKgEmczrBa8OFf7Mm+BaBgZQuVKqdxtJS+2ir4ey3Cim0LM4NkxtCkJCCJGPIEAlRmUy7ZGIleAJECbRb1g9IlyCW8Kpb4I0KhKHvydsZpW8lVuqxzCqFUug5U8q/33+XR0rz2vndMUQARkwCQNsBp9YQ0koJNjaY6bvmspGPzVeaR0bKuYeSigAJ3mxI2SbEFCIyJJKHbtu36mM5k//ZLVdPXFUup3BwwEojAlaqbkMKEpIhMo4MGCAEKY/CAG7CsMpnKN7E5hyBCqFESURCgiRCyqVNa7DfyhRyDKrVFjz61NzxL9xz7Gf/7ssvPGBwEz0P45tXvg3RQiKb9u8aW3fdFaM/vXV9/2bTZFBrOlBddju2LR1/aQSSzwXxiKQu7dj3EkXDM0FpbPGDQwukMjYGUp++bKmbg7qMCcro4rcZYVtN1493r+8IQ0ZR207dx/c6J+hR71k/PPqcaPlhInsCL5s6JjIG9FsiUKK0V5GBEFGiK4So1jrtlEnZYt7Cq3YPXtpw3P9WW25/9O7FUy9LkmAYKXTdN+8ZGyz043xtKdKflC4hM5GhgZLcR997/aZ/BZz+8rarxy7vL1owUDQtIYnqLdkWkiQjQEbAgmfKr6qhifkI2JUGkOLmIv1XIAAgCZIzZLk+M13uT6UyWQ5z1SZ8/aFTj/z9l478wBe+efg5r5KCBTI2LxfrC4mnMMFFBSFccEnQDXtXr9q3c/hnJkf7hoQgaDRdclwSAADMZ1g/4k1NITV5AiumbtP2DoFgSzDDAAIiC5gPNd7VjwtA2qa4z1+1pXFhsKs7e4eeISA2WgAIQ/pCYyESQ4YpiyFDgMVqu/Xq8dqXT043jgMAIEvC/xO8NiSmo7cpVL6UVttxFyvt55YqbVu4AjJpzjMWN5AApCBBFM1MFOrocZKKHRH3QPn/0T1K8RZ7Qus9YjlVJtpAoQ+bC0IkI3Wxop4Uve/Q0+VpOF4cJQTFrRhjjIBBbdmxK9U2FXIcr9gxsPuK7UM/VC6m8wAE6EefJUjwZoGoQ4gMEBHvfOjEc5+56+jPfum+qfum5ttyoGzBxHgmVSoaOW4Ad4UUQkgJ4HlB1AQNvBaa5BSd06HQguhZxQQhOa50JRClMyw1NJjKjg1l0XYIHnhy7uj/+/LRn7vvydP3IzIU8s3L+A8AgCyFAA6MDeRx99bhgwf3jH/3qrFcptFyYWnJdh2bXD95EwJCkLwwno9Nv/roxI4eGHwiBOpxlRj5j9YS9jKRxvuMW1tjVopwSBT9qgur/gLYyLV51x8NSz0TD2u+LI1zV7wA/TTFsdr/oiPt7psAQPrbOGOcI2K77Xbml9qtlu3C2HCaXX3Z4JUHdo39yI51A1kiSeJNTsgaV/6DsUuHkHv398FDp5/97NeO/cRXHph+/PRcW5ZLGZwY60sX8lYWGTLXBeG6KMCL/AeMml16/dJqHyhrXPjdS95LkiRnwAo5Iz05kkkPFA2cmluWd9x//KF/+uqRj3nKP0MA/qbOywQJXgsYtxBAwkB/DrduKB/cc+nwbcP9aavRcKC+7DgAAJwxFtSziS3DCokqrvrHEDFKdqUKjLiWonwVj1uN7ouOQssJGGkn9i/CrRovUigOB8uByEuFZXDkKZMhAsDCUmvh8Mnq3YdenmoZPI3SbSbzPMFrAjujcpbgLQshWwSAcHppmU7PN588dnp5ptFwKJviLJcxLIaIQpC/WBG0kGBf/NDC9gFCGTRcKuX/z1vUGHYcrLn37aG+UOsdG3qHdFoNK3IFOyHCpTozamMIqDyU0iN2g6iUpY6WgKpOuqcWgMEY4wxZqyU6S9V2B0HC6vGstXNL+dZNq0vrKExykCDBmwopXQIwAZHjp+8+/ODf3nn0++9+bObR2SUb0lkOg4OpVDHvLQeQ3iNNAGo9OgVzh5TtK5hzMUWPQoVXkpf4IpPmqYF+I1sqcGx3XDj0YmXhM3ef+rnP3nPyH47PLLc97/WbnFiMHCAi2r6uf+1Vlw7/+LYNxXI2zaFS6bi1mt1CAjIMNAAJJHjmTfI0TlJGv15T2U9i53/p9tl0CW9x3TayKxYzQKD9FuqkWDvxr6Rv0YXcXgYCL5Y02gVGDo1RaOTYkDN71aL2PWSx7XHjamRsUQtwIMzqjm3FxogIBmcGEdByW3Qqdcft2AJGy2nz2l2j333jvsnv2bF+sOD1dXEELArXIUAOC5UWfPrLLz70t184+t13PzT3yHzdhVzegsH+lJXPGWnGGZOChNSMzQAQvBu7/IX+qzLMswOgzpR+6LPBgRdyPD1YMlN9WQ6VWhvueeT0I//nS4d/9B/vOvyglzPBSpT/BG8JkPSiK4fKuey2jf3fuWVdYSCX5lCrd5xG07ERETlnXBkAcAVbozJD9lDrtc9hJFjQgJ9bQ29JcZUegRVwqupWW9Iazl+f/QOujZr5Qvuu347qA1VBgdCYCoAgJUhJQJwjT1tomCaC6wpYWGqdPjVTP2FwC32bf4IErwlJFYC3M/wogBPTzRdePr782Jrx/MjkWDaVy3C+yJFJAJIExAD89aMUrVzky2hn7CL4RBEijdtJz9iAZvXUtr8mYY96fFNcrEwSwX98cI6MSSDbkc5yA6jZEqnBAQs3rymMXbNr7Kf3bp/4OSJZQeRIJBLBKsGbCiKbGEuh//wd/uAtm39SCPqvN+0bvXrVcI6lTG4BtKDWsNtCCCklAkcvyDqaXMhX/gMhxtuvMiW7gqTwigtCxuLW6EA6O1hOYcsW8MgzszOfu+v4r9zz6NQd89UmADB4s+cCIqLJGFy7c2z1B29e+++u3N6/qy/DYLnhQLXutFsdsg3DK6OgEvQFazXPi08w9qlXETbtgNd7F87n/NixvaISzqVBZU44330hsGc3IeNSzzYQvLBDtZeht2hFEkohSNbrTttgkOkvpPn2zaXRpi1+Ya7SfGl2sX2P99xdHCDpBtUBiMSLH7xp609wjn96YM/w7onBNFoWpk9Pt7BStRvClS5w5Jxh6MkET7c/k98SEVESkhQgBBBxkNiXMayxoXQqkzVgdrFN9z0++/QX7jnx8Tu/efwQIiKwFJBIEoIleGvAYABDpRzuWFfeunlNcddAyQK75UCz5TgdWzrM4BzRYwwPZ2ItOAeh88zMFvZC+gZSOXLOhCCZds+ezmVKaiUJvAS+BICQssDKpNEwmITlpktLtfbUQrVdE9IBgCT8P8Frh0H0usWXBBcpkDEwDRPXjhemnztS/X/bN/Vfs2q8bySTNtAwmQFtQOmpACr/qXK7U2Ao1dwTmjodpnvSlPdwlSf6xk9Cbx1TzCcWMdSG3rDAO4kqHoAgdhQEB+ud+yqNvt5XDSocvlY8JtYcQ0JiXjuuAFFbFm46bZtDpZRx3RVjH1qq2y9vWTvwBwDUZMxEKZOygAneXEjZIcQ0+mUpH71h77rvQqL/e/u1k9cMltI40J+2AAFqDbsjBAldLtCdr4y6xRhvRQyq9OUymzJS5aKZGShYSILg2ZeXKv/w5Vf/9efuPv53U3M1qdbgv2kXDwDMTwS3dqyQvu3AxP93+/UT37FmLG3V622YXxJ2u0M2+Uzjy08UpEQEQFRrPgM5UX3XvNYxRT/iyFYefpXcXfP6e4i68qMrRGO8FrSpXPABi0aMkzF7amxZlWo3rq5r1xn5oWM/l6aGot8ZRTvR9+qDjjYXhG8p4TcuAocSebBYFxFRBZgBISEB58iRkOyOcBYXiAzGc4NDGXbp1v61J2dGf2FuvnXszoePHmHIUV4kRlgixzcCWEhkP/7ug5u/15Hif92+f3xfuWTBQMm0XNcVrZawpSQpAYDzsF4XBf/xgdGnz4tKQRJExDmwXMqw+vOmlckYsFh34BuPzz79j18+9iP3Pj77cJDtP1H+E7xF4BnPJN2yZ/Xa/TuH//Xa0ewASQnNlguOQ0JKkgyII2rrryjq+MfQkq02gS6rqmw4QU6qHhaCgCoJtNx7gQGAlEc+jJKNq/jxhU8hE4ajobDtIEEvaa1ogikCkAQSUkrGGEunmJnNMEMIAYuVlj231Hmu0XYvfI3UBG95JDkA3saQrk2uIHj5+ELrhWPVb55eaE0RAGTTHDIWGpwjD9a2av+CcKdIJnHQuJOinAug7VTQzQVq/5nNsxG7QHAcdX0Pj+s+o+c33/6AKhQgNlQCCQgSOAfOGGK94bbnlzou4wiXbCz1X7Vr5Ic3ruqf9AKsk5CrBBcGRG1izMsJcPfDR05+7u6jH7vzmyfvPzXbkP0FC8ZH+6z+YjpjGgaXXiZyUnM5DPlW5cQYEDKQjIEDKB0BggAhnWLWyKCVmxjJcAkEjz23sPSZrx77zbseOvnF0/N18oS2N1f598KaCdZPFNPXXT5+4/VXjn33pjV5izGE+SXbrtadJgF489fnCAaBChUo/68FIQPFSPKcBw+9aCp6CKo6DWc7L95vnMu6xxc0cZYxdDXxGnBGp5vWvxKnUTNxMAbMYMiIgFod2anWbbvZcmCwZLJrdo8cvOmqyV/as21sgECC7kW/0PCMAN7yhH++56XnP3/XkZ/85/tOPnR8pin7iylcNdGXLRetHGfApAQpBAiisN6CtyiNkQQESX4OTvQMWK4g4QgSiICFPjMzMd6XKZezOLPkynsenjv0ubuO//S9T5x+eGaxAYwZkWz/CRJczPA4XcL4UJ7tvKR8+9W7Bm8fKqXMWs2GSs12XBdc9Cc6oibzaSmrlBkU1F/PQnte/EWxL4ECHo4U4lE7KxpTAxlTbz1mUiY/OUzP0K2QvyUQuVIKSSRTacNIZQxsdSScmm0vziy0nujYnhH0TV+Cl+BtBeM1v+0TvEWAwBnHtZP9s6fnGs83W2J3rmhC1mK8YaDREehKP7GQskEGtYqjzUBoHYCYZTVUx/Wagmr5LSBE8gRQlzdJWUKj33uIu9EPhJGv6hvpu8nfQl6htNDmSkEZGBWgwBkwRMCOLZ2lGkFfn8gXSyZsXF2Y3L156Lsu2zD6O0SiwZmBQibEm+DNhxAd3+uIOFBMP95qOj+CQH/2rv1rrioP5HCwhAZQK12td9quEFKiP5l9zSJInunlVUYJBC5IQiTIWGCWCjxTLlkIjODZVyrLn/7a0V//zF3H/+TwyYrjVSR4c72vnKcQQMBQKQv7Lxu75t0HVv2HzWuKA8IFWKi6VG9SxxYgTI7c5zDwhDZiyufiecNZxI0eSpErXE6XHEmxT4GlNLYbNQFSkygBYh4gCF38MbsoxcKUSK0tjQ9FTxqoV1sJhqH7ynpzrFYnIugM1eAi3q5oO+FQ9OsPry+8bNLUfH39rAq+8Op5IwAA82p9EwC0OsKZX2jzkYGMuWl1IeNcNf5dx2br9x6brv/vuaUGMMZRyosjEsCLzkkhookDJevxatP5SNuhP/vAwdU3Dg6kAQSYrgvpRkvYrkAhCYn5ZWz83Aso/eXEfiAaquV5nAPPprnZX0yZfYU0VKoOfPOJhaf/8Y5jP/jNQ1NPzC41AQBBiGTNf4K3EgQAAIyN5IZ2XNL/PZs35Etpk8Gp0x2nVnfbgoCYv2SGeeIjRZRmv7JIhMdiHBQlUc8f73GpTrghf+mG0iAnjCqhqw4KokqpK1IVY/QevAVU7gBfGlZNUHxhmqrE5YmrICRJbkgjlTG4aZlwerHpvHR0+fHjpxvPzlcalCSmTvB6kUQAvM3BOQdJEqrLbXt2sfXUYqVtu66EjMVYJsVNzoCHijpGhcqVcAZv0rk5ms6Vt+KtnUPrXbs9Sbjb7x9CAoD0s60yBkwSUasj7ErddlptB0bK6dQ1u4c/uu/S4ZvHBvpQkkiqAiS4YCByyOAcFqptuPPB48997utHf/HOB049fGqmIQt9JoyPZM1S0coYBuNSoBQuCZRAnsrvOSwZIkqJJAQKIiTLQnN4MJWbHMlyRIRDLy4tf/7uE3985wMn//rIqSXXL0f4pisZUjpQyHLYuq609rorR/7t3ssGtxX6Uji/6NL8otu2BboMGXIGjCEgAovO9Uj6tbPjQkzqFZ3uK+0IPOpnjkh4DfEKniR9XvkSXtsj4b1lwmgqNU5kyLjBuOOSu1RxGpVKR1icYMu6vvwtV43/yg17xq8eHcwhkQQv2/3FAaIOMW7AQqUJd91/9MgXvn70Z796/+mHT860Zb4vBZPjufRAycoaHLiQJF0BQhJSWBnA+1ElIbkChZAgDQN5uWhlJ8dz2f5SGqfm2vTVh6af+fzXj3383sdPPzG92ABkmHj+E7ylwA0TiSStHskbuzYPXrN5XWl7vpgC2wWoLot2q0MdQK+sLYKmcwNomn6PR15jg3ON14q6rzCy/ZwR2E5BX7bVuzc9qvYMx5HvmTIYskzaQOQMTi+0a8+8vPTXR07VTgAAsKT8X4LXCYMuonC6BG88XLdNiAznF5fpe9+z9eHDJ+unynlzrWVxzGUNq+3YbkeSJH+lrGdslWEoVaS2NEBgVSWAcP1nLMwJtFN0t1WXCz+MhNK9c+HOqGssvh41XDrrt6F4lVR3ShVA8NYGa5VaUaVsAbUGGhgBARIiAwYEcrnp2OYSsqH+DL98e/+apXrzV148vvDU9GLjKECyFCDBhYPjuoRevjscKqXvrTbpI7aQf/Xu/av2jwxmsL+YMoSgVK3mSFdIARj4wP2kfxJAoEQJMp1Cs5Bn6VLRRGQIL75cbX7my8c/8dmvH//DZw7P1S6U8s+YgUSS9m4bWn1g9/C/3L29vG9oMMXabQmLVafdbEmbISDjyAJvDoaUQzFLZoSlqHsbgE5RasV6z+rOWqNKfwt7jXj2oyQYG0k0MiB8FfvcG8tPEO9SD1NAjFZjicUMaNcb8/yryICu8ALtUnQajvN5V5CBdreCRAQYGQ+GvwyG1xNm3WaITABKxyW3uux0MkutTH/Bwv27hja7kv7MFvL7PvPVVx5DRDS4ga64OKKxhNsKonP6i+mnRBs+0uyIP33vwckbRodTOEDS6DgiXWtC23HIRf9do6kdKCUICUimycxClqeG+1NmrpiC+YU2fPX+qfv/4c7D/+qJ56dfmqn6nn/3zV2OkyDB64UUAkbLWXbd7rGrD14++vOrRvJ52wGoNoTs2GRLADI4MgyT5PtAiEWYQkBASAH/EEIkWABA49aAjxUXqXa1WagJpdESgB5vki8nKoJEQgrpiyBccqaRXPRDIJVGX0qosTOiwRhLm9xMWwyEkHByZvn4c68u3vvS8cXWxRQBleCtiyQC4B0A9PMOHT+9/OpzR6r3TS912tw0IJczuWEgDyVQANBqiAfnA8Q2oVaHNYpz9zqdt2/q3EDxL+fYBwJI34LLDeCGgUanI+ylSqfZ6bgwNGDh5dv7dx7YPfI9l6wpFYmILiYPVIJ3HohcMjiHuUobvvLAkSNf+PqRj3/5/hP3n5xelsWcCRPDObNcTGcNzrgQIFwXBElGQhI5wpVSuDJlgDlasnITg2mDiODJF5bqn737xB/fcd+JP3/2yGLdy6j/5iv/XmI1gg2rirl9l43cfN2esR9eNdqXa9sSFqu2aLRc2xVScAaMMe89ppIAAsTZ6xymaRD6eQHwWlkkbi9doenzav58T9AoduXT/IOif7rOCMVmAo6AjCFrtkVner7dqtQcGipn4MDlo1vffe2aT12/Z83qgWIGhBSAzLxoeJjIIc4sWKq24Y4HXj38hbuP/vSdD5x+8Oh0S2ZzJkyOZa3Bkpm1OHCSRFKQQPKM0yRBkkRpcjTKBSszOdpnFfJpODHTlF++/9TDn7/ryE/9870vvTizUAcvi2Li+U/w1oLK51IsZjKXbx/63iu3De7OZ0xcXLSpWndsQkLOkXvh/5oNFeL8tkIEwDkzwUoHv44pFTQZbbtbCj2TXEogiQiBQdpgZtbihsUAOm0HZhebh0/NNec8g3yiuiV4/TDOUOAowdsEjCFwbuDEYN/Jp15a+qtLNvRfu2YyvzadNsBQ3jMKpDMKPVLKyU8Q/h8w8MRj6CFbKfdKaOvsYYFVhle16nQFd1zogIq57TRLrXIlkapppmy3yjEYcQbqXi/lCVP5ZAkQETkC2i6JdlvYlXrHTWeZMTGcsW65euKnWy13dtva8v8FgDpjBsokH0CCCwQvEoB7kQD9mcfrTfcHpZB/+p4Dqw8MD+ZwoJQ2bFeml+p203VBAHCQIEgCUcpCs9jH04MlizFG8NQrS/W///LR3/riPSf/4LnDsy2vBvOFqhQrgUjQh27ZtO26vRM/t3PrwEQ6ZcLcYkdU605HkpSMEXoLG8BL1KQyy6OWKpqi5ejUMsvQBa2iiaIsEzAWqeohPs/FOQkDUoQgZiAwJIR99HKiK1kxHoMX0pLn1cJYhv6w8kos2irWSK/c1AFiXiqKR1+p7T6Hal577xqCC1d248gZ/j0Lr9q3K3vMjCGze/fO42otsIEYAnIEFALEclO25qsOS+dEeqCUgpv3jh2UjvyTf+T4k197ZOqolC4YRhpd9+LIgO8KlROAIZF87qb9m7+3aYs/ft9147esGsngMKHhdkSm1pBtV5BgLLjDYBpoFLI8NVSyjFyfBVOzLbrjGyfv+vQdr/6rp16ePaESkiXevwRvFQwVB9FxXKg0KwQggIjo1gPr1lyyqf/GVWPZtCSCSqXTabTcDjJChsjCUrUUGGYVeQBAD/09JCePV5UhmLQD0Tec+Yf6nntE0KKw1M54ZJfHeQgAKitAmNIlFvivi6mRCCrUBqhFlqkaXCiBvOQfhIiYyRhmNsMN1xGwsNiyZxfaT758ct5BNBDAPLebnyDBGZCYkd4BcF2bpAQ4PlORLx6rPjo11zzqSgmmyYEzFrqxpVd8NIz7xBjJhptJ/6LBNyX0sAece2xA7+O6t3mBUj0Oiwz23HpRQiyQJ/IjEjDmbaouO+3Z+ZZARNi5pTx8cO/4z21eU9qUVAVIcDGASJDBDZhbasFXHzz20hfvOfoLX3ng5MNHp+oik+EwNtJn9ZeyOW5w7rrClULITIpZoyPZvonxrAkM4JlXKvUv3HPiT+745ok/ff7IfNtTXohc9831MnKeQi/qwKXb9q/ffMs1qz5x+fahLYV8ChpNQUsVu9lqux3OkBkcOXZRwApWxHNE18X2FDRxBSbTFN5ep76mEalRnf/PcKYxnG870VF4rZ5pOW70eIh8wtg+XUT3DiBERszgwJmfPb/WcDunZ5vOctOGNeM5fsvV47fcdNXkr+3cNJgnkiSE7SeMvDhA1CHGTEDk+LX7Xjr8ha8f+/gd952+98hUU2azJkxO5KyB/lSWIaFju7bruI6BhIP9Vm5yPJfq6zPh8NSy/NK9J+/9/N1Hf+rex06dmF9qgsFZaKFPkOAtACKCSrNCquzfzktGSvsuHf7BDasKk5bJoNVyqdmw267jupwB44wYnmc2//PnR4xZSF8bx67YttZ0Nyn16CtwYhG5QgoAgkyGm+mMwRptCSdPt+dm5tuHvIM5GDwxACR4/TDodYsHCd4aYIDIcGyoWJmaqT9Wr3UOZMuMmwYy02AGAYGUyj/GIGLX1B3+oWuJAoumFqiF4eJSQGV+1SVIhR4e+TgCn5Va9xUEDvhCOFLQDvkfVWplAm1sKs0/avmttEoEoRcK/PVf3j4vqzhipyOcxSWibNroGyynccvG0tpdWwe+c9emoaNEcuFi8j4leGfCcZ1g/fFwf+ahatP9l9WW+19v37/m1smxIh8eZCYRZWu1ZoszYOViKjM4nEULEZ58YaH5D185+snPf/3oHz5zeL6GiMiZdUGuQ0oHABAu2zoy8AMf2PKpW/dP3Dg5lGXLDRuqddu1HeECASEiMuYtmvQikDxi0LzIEEpVCCpnR5j1Xj8uRIzyAkdQ4PHWw5JQRRn5kUeB4k/BunbVh1Kc0XeEI+nedXVYzAsF0fg8IkWn2HWcdpTmSde8/oEtN2YuiSRh6b5ur4twkCrqQHn3veuQsWFgJDqhV61u5aWLbCX1YgnaQs6RAxJKIUW12m6aTObSFjcmx7LGDXvHvn256Uzt2zH2e4h8VkoHDCODrtu6KLhYBJEAFhLZzx+8cv13tVrijz908+r3rx7P4SBJo9Fup+vLsokEkEub1lA5ZeSKKTg13aAv3nP8n//uS6/+4AtH5uYc4QAAgOMmnv8Eby3M1xaIMy/0f8NEKfXBm9Z+3617Rz86MZhNtdoClhuOK6WUvuMFA/HSE8g0xtN4NOKoD1fqK9lQcW5YJKWHwu23TxDyXVcWv1jEQSgjQmxMECEu0PoO6VPJmPo7yHtX+LlXkYikECRMk4xMzjDMNIeTp1v284frDx6dajypOnbcasIDCV43LlR8Z4I3GZwZIKQLU7NL9KP/YscjM/PN5VLOLKYtzjJpbjXbri0kSe6XXgnD/HtUX4kAY2FWukkp5juKSXc9D4t8OJNxikJhvodDJBTHVyBrCAk4ELRJe5MAIGfIkAE4HbDbLdFeqjqpVMaw+kuWedXOwe+aW2g+tXa0//8K4QpfyEtIOcEFA5FDhmHh7FILvvrQ8Zfefe2aXzI5N2/ax65fPZY3jPGslS6AaXHA/qwFHZvg2aOV5hfvPf6XX7rv+P949shCXXn+L8T4VbLBzWsGMjdfNfn9B68Yu2XNaB+z2y7MzbfsetPpIJA3L5UK6mn/Z2oVVvbsnGs0kmontrVnuIDPNxoldsUknItzi3p9iWnp0PvqzufH68WLvY6hiDECte3n1RHq/4lcVawhFW7LGDHGkAkhhW0Le7FCiAbkyqU037Qmn79t/8SP2R13od5w/vtzR+YbiBxNI4PORWIEIPLK8yFyNFhq2jDwY+kUy990zfj1q4dTbGK8Lz1XaRsoCYZKGSObM+Do6Qbd/eCphz//9SM/e/+TU3MALnDG4WJJdpggwfnCq2wv6f0HN1xy3RWjH9u5sX/A4Aym59vuctO1GQOGwbJ/3zp6TtVIzoXBwlF0kedKTb6umRaVOcMtsU70F4H+viAixoFlsgYyk8Pphc7S0y9X/ubE6fosgLekN0GCNwIG0ut71BO8NeCKJnlrhwBOTjdeePFo7bnBUnpPf59p5Mmw2o7r2C5JhhAswCIIZeswY74qUQJ+KKLu+4KItyvwyAVHQWh5VYSHAPGFtXH/l8r26gmOCEF2ad0jRlozylKrWiKtYS1bNwa9kBoYBi2q9WEA4IWhIjWborO41OaDJYtfsW1gVactfvnY6dbjx2cbzxO5r/GXSZDgjYPr2kF1gIFi+qlWG7/f7dAfve/61e9btb7AjMECcgBwFjvw6KG52c/edexX737kxN8//eJsxfOqX5jQQoYGAhBsXF3OfPuN637q225c+283TBSyraaAxaWOqDfcjutK1zPKeZKiroT7S/9DX0toHQSAsGaz5hLyv0e5pKuMk85/qva0Oj9QYsOQf4//MCShgBC9bcq2onNa6DiP81V0MGE+Fe84pp8CqqH49fW+nrBotXZ9wYj0TsOrC/1WfgQDQuCh894H4TkIWvtq3HE7huJy7YeMGhr8ESEBQ0DOGbcd6SwsdpokITsymOPbN5bK7Zb42Y7t1nZtGvg8Asy6woaLDxxcacPXHnz12DW7V393Zbn9Ox+6Ze1HNq3JcyOfMYAk9FkcTp1u0OfvPn7HP375yI8demHmBIALAAa4Ikn4l+CtCcYNlFLQ/l2rRt573Zqf3Lq+tDqXNWCp6kC17rRsVwrOkROG2VKYzzxEoW9f51r1STl5AiZF349D0SCAMH+Jyu0Sip4RY65yfSEGRkiIthe21kWVvmBLUQ6msPOYuIuBscEfMyEAcA48ZTEjk2LQERJOTC8ffvaVhXtePjHfYcxEKRMuSPDGIIkAeAdBVQM4Mb187MkXF/9m9XjfxsH+0lCfYbLFus1FW3Y4AOc9XDJd3hrq3nf2Aaxw8DkbceM21S727tlVLA4hdmRgKvBqMgdWAbWAgcDgyAkZOo50lyp2M2vxvuFyGi/fNrj5hhPLvzA13/zY4y9MV7y1y8n6zAQXFl51gBQuVDvwzSemT2cN+DfZFBZvza25fnBdEVotG556Yb76hbuO/Mbn7j7258emlsSF9fynkDGA0XIfXrtr9PrbD0z+/OVbBkpCApyaaTn15U7bdaTDGDLO0cv4D3Bmx3+AMx1EK3NScEhU5utqeiVnzBn2ndO4I8d0K+Xdx/Q+tWsIsfADXZg+F0R58zyhO9/iwQya3AzhWghUwjcyZCZjzHGl22qJ9oLskGkYff3FFLv0ktKEIyZ/1RGyVWvS35+cqbmIBhJdPB5zFR3mVY5hswDyF/I5azibXXvrxOoCIACcnqrDVx+ceuRzXzv8c/c+cvqEIBc4T0GyvCzBWxWIFgJIWD9ZTn3ghvUfvuqyoW/rL6bM2rIDi1XbbnWEjQwYZwwQAUn6pIwQI8qVCLX3dpU2dWWCPtOg4Q2JADjXfrxLJZI+76UtbuXS3LQYg1rdgdmFxstTc/WalwA0Wfuf4I2DcW5hNgneDpCyQ5wZKKRbOXD56s9s29T/Hds2FYf6siZYFjcQJeoeppj/yfujrKJEQQZVgFBmU4QWxgH4ltnAEaap4XGP0Ioj11sMvwcrRmMZrOMRBKGnzosW0AMCwmvy/WsYrCrzvhMBIqDkyKUr3Y4NTqUunGyWrKFyht169fiHO45o7Nk2+psAbPZC1UxPkECHl4ncRCE78MjzMy87hB+FNP+7fS3nyun5Rv3TX3r157/yzeN/f2yqJjwP+YVZ8894CgEEjA5k8cY9o7e958Dkp7ZvLA6ZJkJl0ab6st22beEwjoxx4J5nBpRnyI/SUdFB2kzHkK+8v36H6ghfNPSzqnu1AnQqiTl5gjXtKhO/TlbKi0PaGboXPGaCVEmfw3TU6iiN5zQBGOOXoGReitliA1sFaV1q16HC/bThEEbPDfsPF3Z5XekRA4GVNDwtltMlSHit21hI3XN1WNRUEVy9nmAAdP8eAmOMIQJ2bLTnl+wWIGYGyhbbfenQ6qaLv1Zvsdn7Hj/59cNT1YvOCADgGeGJXLj/iZNTB/es+wHLNP7+9pvW7Dc5wte+OXXo/3z+8Hc/9uzMYUEOAJiJ8p/gLQ4JDC3YsKo0fvWuwR+/dGN+2DIAZubbznJDdgKvPaEfIxQ4ZECrBOALm4QR/tESBQbedAwXfgZ8QnoWgWCHXzY2xq4aIQbBpoqBUIV1RUYHmnAbtBRGoXZRcZADIHwHSZBE4EqQnCPPZrjZlzaZ2yGYm221Z2YbDx6dXnIREYHx1/g7JEjQjSQC4B0GCZ7QOz5UPH1ydvnJti0O9BfTmE6Z3DKEQQQg/TIkqg4rAIT5/nwgaAGxvsqsk+AZrUp6W69JvIm3fkafV++z1eiDF4j3QXomAuh1sYwjExJlvSHaU3MtGB1IWVvWF7NSwr9cqrrPzyy6f3B8ep4uRsEzwTsPRA4xnsL5Wge+8tCRYx+6cfOPLcw1//WpueUH7/jG8b959WSlDYAXLKs4YgoRJBC59MHrN+68/cDq3776sqFtmbQBs4stWqw4HccVLmPADA4cWHRmRt07Gqmcq0lbZeR7Xdfg/T23RnoZVrt2n3X8im5fEzDK07FWz9DwOQ7uTKf2Gka8e1jpnnqiNGfI0GSmK0gsN0RLUptMC/v6+lKwe9vQxlYb/6Mk+nlXynum5mriYuNiFb6LzECS7tT7btjy45zTn5oGT3/+q8d//M77X30VkSNjKRAiUf4TvHWhnCGXbhzJXbNz6Ed2bCxsKuQNWFiyqVJ1mq6LwuDIgSFTeZo9dC3EgpX4B/3sr3FHZhebhVbXsw88sB50M9AZz+7KW3AWTtVeVwQAriRpmMzoy5pW2uI4t9SWz79aefHY1PLD6kgSF0dukwRvDxivM9YlwVsMJF1CRDw1W6Gf+O4dh5Zq7c7IQCadS3PeTPNUqyU6wiXBODBkyPwy23oLnldH8zKR5rQBjWeV/wZA9/p4B1EQ+wRdS181G2zke9QFFlpnI4v/QRuLOo2i5wbVXAkI/DJ+mheN/HVi0dwGCMgYMgAEx5VupW630xbwfDbHN68t5m69evLn6013esvq/i8ByCYyjpTUak5wgSH9SABEjqPlvkMnTzc+Vm/anWNTjTYAwIWKVvFKtjkwUMjA+6/dsO29B9f8h6svG71seCDL6g0XFpacTqslOqhykkDg9QetwgggqJiimMc+Lrxpa/9DAyBoCUQ1tvJKgXrxBNj79nR53YP/+CHrvhAZ8Jx/rO4BV2OO9qEZJf1Gw/3amCm84oDttHaDutbquhDVgKK2TY2nledf8Z6XC0W7QMSQc+NurR7Xqb8fvOuhyHc9L4zXNUbvmT9WLcwMEAAYQ8YISUgpOx1yFhbsNkmWGuq32P4rBi9jTP5nIPGvH3iC7j98umZfjFzsvYdTODqUfWa53fkIR4bPv1o94oVMG4nyn+AtDfRzumxeUyx86Pp1P/Sua0Z/dGI4YzU7EmrLwrFtcBAJORIjYCBJZzMKUqRoqV7B40YKq1SHfv+YTAhRYVJX5jGyWysnEI5dN9OGfiIMIrxCvlXkSVGiJ1WUKpoeu0uQ1XhQEpAkIm4wnuszGTCAV0/VFx54eva/P3+0+oJpWMgS73+CNxhJBMA7GKdnG6+8eqx+fLg/uymb4pjPGWanIxzbJgcREZkvg+mxTis6iBSjriy3nIuP6Xz8S1rC/kj759pjaNEN/hukFYyPCwiIAQJjwEgSuY50lqp2O2XwbH8hhbu2l1d1pPsfGx178cXjS1/jjCMyC0kmlQESXFgQOWTyNM4utWF2yakiErjiwj6XUrpAJOmmPWtW37p/9ScOXDF2w1A5y5dbAuYrtrPcEC0gL/8GopeQIwix15T/qFcm+k0zF/SmlVg4wWvCOZwfLVF1Pg1jlMJe6xgjza7EiWd7HM6l83O/ma/l4dNfPpwjR2QoJcla1Wm6LknOIDtctthVuwYvFUJ8Coh+3iW6b2qu4SKaSHRxJc9SFQIA4AgAAOOZpJJMgrc8EFPIUEA+a8IVl5RvuPXq0Z+9bEupXwLC6fmOU22IDiEDjhJ9qStMLR0u/wnJL0ioChCQdqRGtUbkkRJ7Z2GiiJf/HMm1F5mfaVt8e1djakkbEgOElIk8lzGgaQs4PL18+LGXFj//3OHZBjITKUn+l+ANBrvQA0jw5oNzDobB8ZVjjaceemrpz185sVwhJOjLG9wwOZekr4oHL0SYKKBWlR8v5lj3jameyTX0bvn/lHbtr8dSK6hiS0cDYyopdZy0WtF+JxGLqv9P++idE/xT54b/PGVCqlCGCPcz9OEfHFiApX8bgIAxQgOROTa580udVq1pQ2nAhN27Btddf9XEb77n2g2bh0pZAJLAjdQbIbYnSPC64Ig2ARogSfO8XiB4YdmC9l82OXLDVat+8cDesdtWrcqn2q6EmcW2XW847SBbMwBQsJI8iPDxso+gxhXgc4mu3xJSkKZEERB6ZgOPSkhvFSCY9YrMKCSw4Cg/T33Mk66aJ/9cj/O8TNKBJzsibGq/QYQk1W7UeFBdj/fB2x2wsdqpcawWaaD+BTuDS4XQuRaORc/ZEnKvGh9o/0J+RAhvV0SzV2MOosXUOehfnzKuYkTeV/fD/wmDxj1h2bMFIQAw/7cQEmSrJTuLSx27Ue/AcL/F9l8xfPnt16/5rwcun7h21UjR8Pq1LkouRkwjYhr9YLQECd6yMHgaAVzoz1uwd+vgzusuH/vhrRv6xzMZE5YbgipVu9XuiA4yYMAQJaGkGAACKo7IcEHWf1L8rVVR0Ti22x0UsmQge5L2V5NJu6iZQkoL6BT9YCZFSx6hhoUI1Nsp7CIa3YoEiBTYNYQESUSUMsDMWcwwOYdWB+jUXPuZw1PL04g8KqQmSPAGIYkAeAfCdV1C5Pj0y7OV6/es/+tNawu3X7Ku77pC1oJ0yjGWucsIyVMW4icrQ6sSErWyesH2Hog7sKK+unCb1sVZKU+t1tcNCdT13x4d6Ps16zLqLB4/mwIRGzgDZjDOhEtiueG0mUHcyGKqWDBh32VDe+o19xOtjvz49CNHTiKaCXMnuCggROOCexAQORIJ2rtjYuC2a1d//OC+sY+snsilXSFgbrHlLFbaDURAw2AcJZAkkJ54pVkt9Lke8QxFP6OmJocMdOZb4OupscD/85zC8W4IKMxUqO8KvFbdHqTgEGWE6KJQvXnoMi+s1FeshW43lT74WJdne3rOStxxhj/DcaTbfHpcurcOAtSzQgBQqdoN23bd0VHKDpdNdvWuwUuFpE8Bsl8UAu6emq8TonXRedmJknD/BG8PCOmCwRhsnCiuunHv+I/u2zlyMJdL4WLNgcWK0+l0pA0AwAzOEBC9iP6g+GegJvfIxARqn7L4Yi/GVC2cZUYpWjnX6ifBeSt5/nuJjZqRNiJ6Bl8QpATpChKcActluJVJcdZqC5iabTdPTjfvOXFy3kVkSSRpgm8JjMSy9E4FA8YMHCn3nT56fOCuZn1k/1Af57m0YdRMx3RJSpIkEREYIgt8ZdQlSWLgcgIIvEbqCAw53V9PqkJ5KfBEemq35qHyzwnk4m5dPDjOE3ZJd1qFfQdCsLJk+OZYdRGBnBsXcrWMNMFa2li/CAiMmHTJbTTc9vxsiw0Ngrl2PGcd2Dv27oWae3jn5slfJ3JaF6PQmSDBmw3l+d95yUTutmtW/dDN14z/yLb1+RIjAQtLHbFct9tSkvTC/iEMv2HIACnInhyY71ATFTUd3/Pgo36kDwqXfPqem8CwEBBHON8BtIohOrFof/X17YGuqnrTSwoE9Bmuo9eqlHinxgyUyrzpGyoxFFqDTqNXSCpbNXjcGlBqt5jbS8VH7XoUVKd+kC4oJ5nXuPLIRRoOfgVNyu4Catcbz3EQib4A/XoJlMVW/bqIiEhAEgiEK91WS3YWF9oGCTKHShbbf/nQ5YzBfyIhP37/k/KBo9PLF+VygAQJ3urgPIUcEVYN9fHLtw7v23/F2L/YuLbQRwSwUOk4jZZrIyBwBowzYAiAJEEqxzn5glwgDqqETWqDgiavUYyH/W/aR58hFcfonviQYsLM/LF3RkzKhSBaKdKXOsczXKL/biHNXEAg1aH+y8m7IiGFdAUJy+RmX95KGSkDp+baztPPLzx2+FjlvnO47QkSvGYkSwDeoWDMACIBp+crdGp6+f7p2Xat0ybIpjnL5ngKENAR5EotQzip4EstJLYbBDopKmBsP/XY040z9XOmXpXpAaMtBJ2eyaulj137jMoL6RG3BCJkgKbJTOGCWFqwlxdmOg4IgnWrctlrrxz5vgN7xr7nkvUjGS/cy0gsbQnesUA00OAMdmway1y/d/KjN10z+fFtG4vllEmwuNh05+ebddcRrmUww+CeR9eP8+7O70zRrx56MQD0OLC3XyneSrSF89QV4wmodCmyF86d5qLdxDroLZaef6vRgfXafpbNkUwxK19Y/A7ronTYVuzm6GsNVNQuI8YZMcNAgwBgqWovn55pNhuNDg0PmOzqXYOXvevayU9dfdnovsnhHDKki3Y5QIIEb0UgmiilDcP9adi7Y/iKA1dO/OKmdaUBK8WhtuzIas1uuy65ps/vDAAZEDAkL8kr+gKWMoZqgld3ZxCE1p8vy4XsoZw88X9nOjM4yg8/CkRM/ZAVT/cXOBAQEhGSl/gPCEBCykJeyJsMGINXTtROP/jkzH89drIyYxgGMkzUtATfGrALVQIqwYWFEK3AA3ZyZvnYi0drz84stYVpMcj3maZpMC4lSiD0TbUeURGS+hcSX1CbGyJCb9eDhaitP9YOwOA/USo+m7FB7QrkQc+iFRWJ1TovCJK2KsFZz0MQnNOzOwwPAp/IfQ8e48gQEYXLxPKyaFcWbWkAwa6txdHbD078xt7Lhm/0Sj9JQJbkA0jwzgOigRwR1owWjGsvH/3Quw6M//LurcXRrMmgWrGpVnc6tksuAAD36MY/kfy1lGrW6v+6Vd+QDrAr34jfIBAwIM3u3VvhR3/9vnYN6l/AI74AqVVDiR0ZHh9KqxG+CYwcil8AASJcxVQOAS9tCak6CCHBIlHQh8evusdcXVKMlP32/Xvc4xoiNxMCf9YK2r4vrgevBFWkwfuf4k4MO/bbjsvPgdgfvgBA5XwJj9RywgABgkTVpsfEDIVA2WxTZ7HacRpNG0bKFtt/xdCV775u9X++6rLRPWODOQSQ4K2tTZAgweuHCwwAtq4vbbr1wOSnrr58ZFcpn8L6sgvVumN3bLIlSGAs5HcCAGCAxBAJ0V+OH13v5KdTgYjqHXzTjYEahwbQZU31DzR+0ZpFnWsUZwOopUY61KtFX9sf8lW4P3hvST9ziceFQX4ACUjIEA0DeS6NZl+Gg+MIeOVY9bFHnp378ovHFxtCEAh58ZQxTfD2QpID4J0MxoGBhKm55vTjL8z/r8mx7MYrSuXRQp/BanVuNJsy0Hp90ZK0igABSUeBgdwIPpUroVzth57ndW/tpYdHofmLesiwEZI/kxFhxc26yBtcld+mrzYgADcYZ4houyjmFjoNATI3MpplV24vTcwtjv3Gu67d+BKRfNkrx5aEnyZ45wCRIWcM1o4XrGuvGLv55mvGf233JYWxQhphYaEt5+btRscFwU1uMPRcHb5NmlCL0PcQquoRmUzNb4wfGdVttbMVTelHxv7Gr0M1ElgBPbkRg+Kj/jA0u6iuaKuuQutGdx9dn7SWiUJh01fq0c86qK5cj0xFfw19YHDtkf0/sA34m1dS79VhGN+gSNc3JfvbwwwKsfKsXZen7BTxNr0/4ZqP2J0JTRG6JO+5EZERM0xmSACqLLst25VibBgzw4Npvm/30OUdR36KIfzSg09PP3JsquKonBQ9Lj1BggTnAESGREQ7Nw4MHNw3/tP794xcMzGeZY1qG+bm2+1mS9iIiIwRUxJhUGsZAjWZdCkxRDcxRdKhKK9TTyMsQMihYXMQ3RLb4R9PiuLj5ymLbo/7oI6IxzGo2lK+/g/oLYOVRMQYsrRlmLkMN5AIKpWWfeRU9StPvDTV8CIiEhUtwbcORs8nOcE7AiQcYtzE544u1K7ZOfHFTWv7PrB9Y/695VIGMxY3OHMYAICfnFjJXIQISJHQEQzXwPrk6wnDgXcoCgxlvUhtb914oHeJURKPkzlFXgZRS4DedcDLqIwGek9xw0RUcg+t0P7odQ+VVzqAuy6IpiMdXnfauaydzWcN2L9rcLdjiz97z3Ubf4zIed4rr2ggJVbdBG9zKA/r+GCW77989Mb33rjqd/deOrCxL82hWu3QYsVpN9uygwZwzr01MlIGxf7C+QrgKZNdmfkBQnVQ/+73H9E0/e3d2fGC5gFCZTRY+x5eTff1RVTu7mZDNvPH519Z3GAZyLDB0FBRS7yhWB+o8VLIs4H4i9HR9LqMYIQU7azrvLihJOBaXdj2rs6T7cP3gJZegVQHoQKvs7p/0QRKUvYvC4N3Ro+y3YFM7ttkvKgsAnIFiEZTthcWbS4kmoOllHHtlcPX5LL8jwt95r/bvn7oDgRsegqMpGKmhNVWJeHlBAnOER7HE2zfMFT49pvW/+xtB1Z9dM1Y1nAdF5Zqtqg33I4QIDhDxpAQiQjQX5HvzW3yOYIANconoCjjePwQypX++RQaYXWuWYHuNDLy+Clw8cR5JUgTFeOnSKsef+nGZt3AGxQvoYAtwY9zACmlFJKkaXIzlzHNlGVibdmFY1PLMyenl5/g3FuiJJPSfwm+hTB627ISvGPAODDGsD+fnn3xyNI/zS6M3NSfT2czKcYzaWbZLgnhJ2phQUmtiDBKqMcFaPwaZa5ePKYL4yF7djvJzo0D4/QckYh725a7m16pK5IQCsdhhlqvlJi3LIJxxggZNDvknJ5ptwZKZnrVYIa/a//4ASnpD27cu/YHiOg4IkPkFtIFrsWeIMG3Cogmco4wMZDnV+8a3Xvbtas+efXuoU39fSYszLfl3Fyn0bKlAxwZ48AZAySp9EKiSNr/rqRL2scVOCJMXhcbl6Z6RnFmIog7joKSp5Ex6EfqSfOUdIld4wlIiPxB91L1A1k1dh/QTzSlHYvaPwoIrjf36Q53NQqMbe6KfOjVUOxLt2+NSLdFqHtAKxwPep+hNSHY2W2SCLcQADC//qPJEIQEWak4y622sIaHMrmx4bRRyI1ems+Y/yljmUUi+Lvnjsw1EBkakOp9jQkSJOgCIkPOEQaKfXDT3skPf/DG9R/btqU/JxwHpuebolK1W1JIwZGhF/qvDHp+VKiqJw3g19UD0Lz5vQlnRbLwQEH5kHjc0dlELfSJKiKUrjiMXubYyFcCUPWyKRiXWoMAQCSJpJQWN1ixL2Ug43D4RG35secXv3RytjHlDT7x/if41sI4a72MBG9rSKdNiIhLtTYcnaofOnyqcXJ0ILcpbXHM58xUpe60O7Z0DIYMeZiNJAyPUqqw2uGzN2rWUz18VYOWqHsFREU9XGF7l0TYE2GkQdh5r5NiikTsdH+jZl8ObwOCt4ZZChD1hmghIOQyZmZ0IIU3Xj16EIH+1+0HNvwEkXxRNwIUCkNYq80lEzHB2wJe6UuCyeE+47orJ25893WrP3XVZUM7ShkT6jUbFitOe7ktOgwBDQMNhr4NLWzBU5Ylkpamv1spVceqyaeht4e552gjZ4RnRtmm2xygnNnKM+X5viNDwegZoeh7LiPpQQfKC67a8jk2qI0NenC8b/zwKwVgNM4eQqOD2qzqB/j5XFZQzlXFFfC8bxFbcKxEFoR3kUKvv2+M1a8j+ETqGsO9imsx/KjaJn/EiOidi+iVFVNjYuhlkXAFiU5b2pWKbTAGqUI+jVfsHFqXThufyKZwYN+2kb8hklOIiJxZKJKSWwkSnBGIDAEI1o/n8zfum3j/B25c9YntG0o5DghzS7ZcXOo0XUe6jCFjAWWjTj8Rm6pHPKHsGPCFd+wZBtJLGvNXD53Btdkd8Qm6JbH7O1H4fkLdnqnzamwg6uWAYQapwLoqgZhEylrcLPVZuNyR8MzR+gv3PDH/n4+frk+RJDA4P8OFJ0jw+mHQGWdXgncGGBAQnJprHz30cuWO8eG+sU2r+vKlvGm22q7TassOeXHunuirvFVAIaUTRF01gSDcQ9EmTRjEXkdEhVW9mlbkuBjBo0+x+hOtn0GBdIgYp/9uw3KX9O67yOKahnpbISnrCDJgrgvuckt2pmbbbEhaqTWjOf7eg6tuAOB/dMPe9R8lkicQGSKmkKiTTMIEbwt4pf5cWj/Zn7p69+i1t9+w5ncPXDm6tZw1YHGhJecW2s2mTQ7jyAwOnDNiAAggA+XSV0LD9E+6kBd61kO2iWYZUdE5ugKr66VdIQHgNxf5rhYiIIabQ8U87vWJ8kjAZ+HlaIfFyxnGbZGqVKEqk+qv9Y9cRrgkKUgiGJVVtauPsWuUhrVxh2OKVkUNS+4BRn4jj+FVaVdUNyvCuIAAwFD3fYUdByNTUrHqXPE8xq6CogG7ymDhvWwCgwx68QYSAAgYA2aZaAIhLC+7rVbHdTo25MoDGXbFjoGRrAW/lLagfMUlQ79PRFMeJ2eQqJVwcoJ3LMp9JVxcrvScA4gcGQIISfTDH7rkto/cvu5392wfHAQgOD3dkLNL7WanI22DITMYMiAAqSJ5UM1PAMUPqEL/PaMihdbIbq4N+JzUvAfVlNrjMSKphff+7rjQuAKFa80FB57BjhA5J7pRLVcITZ4BzQkgRgzSJlr5tGmYBkJlwRbPHq584Y5vvvKywTkSMHDcdsJBCb6lMM5oJkvwjoDBTXCFgFNzzcWHnl74kzXjhX3rJnL7CnkTKrWOWa3HpEa1YDSSYSvGoP6xsa8aej13FPsbOzLuxOrVcg97Q6yxQBTVxfauylWhxN97yLHqGcGLzH9pMQ5cSJLVZbeFDNGyDGukP4M37R29jiT9+bsPbPgpLxIAEdFCosTrlOCtC8OwUAgXiCRtXTeUu/maVe+9ef/Eb+zbObSlnDOguWzDUsVuN1pumxhj3EDO0A+4VIu3w3h2T5Dz9d8wLb7usgbo5SvH+CHBjviH3oJlYJiMz0bl+A60UQwNmSu0Fp7rGyji1lE1Vl1I1awCyrOt0v/7ujFypsXtRT503w81mvhVd3nANG6NULpWd0CTiQlAv9Gh0h/7dWKbdEMM+IYQpbzrx/S4+cEPo06ksCxtIGZTYD4BQLWeAZknjpNwpbBd6S4utZExzA72p9i2TaV+g8ufMAzMHtw9+odE8qWEkxO803Em5R9AwuRI3vre2zZd+x23r/33V2wbGsxmTZieadPsYrvRbLsdREDmF5CSgV4PACEReuZCjdMpkolE79T/G1gn41ZbCJxPvSuVdLUIK3FlcGjESKneRhE5mLTj44Qf6Y986wYSgJAkhQOuaTCjL2eksxnOmi0XTkzVF4+crH4NeRpBSkgSkyZ4M2Do1dwSvDPhuG1ClsaFJRueeqnywqWbKp/dv2vwioGSZWRTnKdMNImApFQcTb6Nlrp52idl5RhSps/oUxazwq74CCoWxrDNyInRr70eZd0MHBHA42MJXirR8ejyePcVhBegypV5cioh8yoSgiSkWsNt0+k2DRRNa9VIxnjfwfGbuAH/4+ar132UiI4w5GgwE90k4UuCtyAMI4NSCCCStGPjcOH6vRPve/f1qz+xZ+fA6kKGw+JCk5aWOq1mm2zGGWcMGTIv7Mhb9684I5ToEH2OQeUJ9lVWlT4aMNjunayJfqR5bTAqFHb7c+Kar+KK0OAQ/ldvtJuTNLtA0HSo4+sCoTJARsdCcUIMk5qiMi4SAMlA31WdURDiH/F0oUZn8SoAsWSI5Ie4Ivgh9fF7FFxvRBqPid1dVoRgkS9SGMZBsaMDg2xsWZYe8h85I8iuBSrnoJ8iUt0vddXov7A8Y4FhgMEIqd1yOzPTTeHaIjc4YBnbNvUXMin+w7m0UT6wa/yXieg4YwYiZpGomXByggQAgN5afhCC6Htv33Ltd96y+o+u3jWyyTQNmFnowOxiu9XsuDYioMEZRwSUBORFMoUL/lV1l4ioGE0U4hmDu+S5Hsq/ZhjUZb1upTzOLX7ncR7UxMCAYjAm/YUmRq3dkNci+U4wul8Kkq4AkcmwdKloWdwEOHp6uf3E8/N3nzpdPQ7SjbSZIMG3EkmWiQQAAECyTYgmnpyepe9897Z7p+dbtcnhdDmb5qwvY6QaLeq4ggRDQsaQefyNgQTWVeoJoNtqGmz2/6OEeZ/EAyG2y18V/RbxUEHMgQQh95P2hsEVzu3qpmv7meQ/DL1RkbEjMEaISBwECddBt1K1XSkkpdMsPTKQxhv3jV0rJP7Zt924+WeHy9mnZhYbQfj0GTpMkOCiAuNpJOkAkaArd4wPvOvA6h+84arxn7ls6+BkPmtAvd6BhcV2q9F028gYGgYz1DyXAX3o/uXATQShNq34pdfUQAgWo2NMGgv4p5ub4tOcIudrhgWtue4zQTsu2k9UJY5ZFAMSIv/CMLhitU/6mitDYJwhcg4MCD0PkiSSHuUQorfS3WvO14LDlQtdWfNDg0TXDYlq276AHkQK6HIyQY/bGiXRiIGUokYUpZ/rdwtICcvhkgdCdVbcgOv3gRAYAdSqB+zxmxMAASPkCIwRI1uCbHdkZ7HSYcgoOzyQ5htW92c4N/9FKmMNfNsNG351fCh76NRsSyScnCABBKlYVo0VrY+855KrP3zz2t+/5vLhzcW8BfPVDs0sdNqNhtsGIuIcOUdkHjWHpaM1/4s/QZWchiHt+HsIwoSk4SDgDOJYdEe8EukKIuXKTUVCQmMkGhtU3JzpbfX+J4OXi9egIM+Plkoxo1i0sGkLeObVyov3PjbzyROn66cRADg3z2GQCRK8fhjnNiMSvDPAADGD1+4eOvzcK0uPjpZTNwz3p8xiPmU5riM6TbdFHDhj2mJ85W3DqASuvEg91X8MTg636X/jjjCIHdbVpMbuWodKvwCIGgGiuQRQP0HrML5XqSeBB03XV4DAqxLgmbG9iADGJCAAF0AgJMpG27VPzTZZuWRZ40NZ9t7rVt2QS5t/zgD/1WfuevFJxixEZiElSagSvAXAMIuAAogEXXXZ5Mit+9f8zC37x39sx6Zi2TI5zM23ZaXSbnc60gZE8AyH4aOtyYWa8qYW0WCo1PmTLchqH05k72u8Wl+Pmve6tRBBU2j19fhB5IDOIxQ9PdZsRNFF/RwKqC5gEn1WBxq5MgLoSnYocHIOaJlomCZjQAiuK6XtCNd1Qep6bhBxpd1VrQoryXD8/u6o2NpFoRGai1xFeOXqWAyTD/ZmTPQHp8w6McttkEdFP1O/ybHfM5YsDMArSxvpPVymhsAAidSSAIamiSY3wHAc6cwv2A3hQGawnDHXr+lP9RdT7xouZ1ZnUtaP/d87nv8m5xwRDWTIQcgkV0uCdx4QDUREkFLS933bthu/47a1f3T1zqG1hawJizUbZuZbrfqy20JCMjlyZMiUPq/kpDCAyUOYrd/7R4oiYlM4wiYI0OX5D6hExf90Gx+9a4jyeGh0jgub0e+kJWwJqhcq7T4ikGqcpURDQmBE4AX0+yFWHJnFgGUyzOAGg/n5lnvo5aXPPPLs/KETM3VCtNBxE55J8OYgyQGQIABRhxDTeGK6Pnff4zOfGupPr77uipFLiqU0a7SlWW06rUgCVADf09bL/a+gq+HRw6LhuF0upTO0qMYb/d67qd6mX1Vu+o1D8KIJM1URAjICDsSBAbpSiqWabLiCZMrk6ZGBFB7cM7KbEP7n975vxy+umyh8/eipqovIMVkDluBihpfpX0K5kIKDe1avvv26NT9/cM/Ed2/fWCpnUgjVaocqi+1Wo+V62f79kFD/7F4tan97mA6p1xfVXHfQun+Y71TqigftPlr3HFN0R68zQrU90KiDvFTq6O4+KZQbvaz9SIF/nAKPkZAkEQFTBvJMipmWxblpMcYQ0XWlbLYA2yTBESik33Bwb4NIe8W6FBgke1/4eaKnNbabyXXEMqyA+o1D44N+z7sNCYERJrY1tAWhZlXovsCIZQABGPNWVEhJstOhzmLFlRLs3Ahn5nA5hdfuHt4mGf8fP/Ydu37rsk0Ddz3+wuyMlxcg4eUE7yyobP9rxgvpj7xn674P3bT6P1+9Y3BtuZCCxYoDs4uddqMpOiRBGhwNzhjXLbK95n03ohZVXbM+d6kwOIHAj4mKpKha6frOsj9+3Bnb0BgoYDh/KZkgkFICWSY381mW6ssavNl04djJ5fmXjlS/eGp+2a9i0lUoNkGCbxmMbtEowTsbCEenlpxNqwa/uWqs7//u2Fz+5XWltJnNGaZVQ1MSSJL6ei219F2FwnvbNNEsQFSG13xQXUmg1NFxpV2TuHVHYPBFybgEyhfWqzVVwzvyOorHygbNxeZHXC/RygqGpmJlnPDfZl5CAEYAIFwSzabbOT3bxH5bWEPlFN6yf+zyfB//72mL/fw3HqEvvXR8oYXMQAQGMokGSHCRgaGJCBIkCbpl/5ptt1yz+pdv2DPxbRtWFXIGYzA/15bVarvt2sI1GTLGgAEikqoH6s+VkEJUCLunqxOASpXf49lXk0vL+u/TTSwlAPp1ppXtESMOpB6aJAYfsYenqMd5ob8dFMNE92tftLD20Hnk9RQufSIQEqQUJDIpZhVzRsowkC23hbu4bLc5A5ZJGYZpMsYYs1o2uW1bulKC5AyZl1TREz81PR3DP9RFZ+Hafv82xdbExoYfOrnC9oNvwXIw7XQEzfumj4siY9R+mLD6geowWBIQa1dlFlNriiPjDNICor+8QxPPfW8h48gQ0BCCxFKl07BtJ1Uu8nR/MYU3XTW+ddVQ7o+HS6k/3Ld19PeIaMarEJAYARK8M4CM+7xM9NEPXnLrh25e87t7tw+uy6U4zC90YHbJbteXRRuBgWWCiQwZBcuPCLR1kd7/ffLzOQF1slAkhcpWSSHDB0YA3RrQpbmjbnfQIraUpydw0MQaCM6IXbzOm+H4dFNmmAElPCmkSQoGTQAowcsHlUmb5mC/ZZkGwpGTy80nnpn/4vGp2hGSAgCSsn8J3lwkSwASREDUIkREk5n2y8erX55Z6PzMmvF8uS/DsS/DUs022a4kgUjIOfK4cyfile9y7PjC6Qo2p5WoeaXjwu/RM6NW497P90pP/bmOIUDPsoCeCUK9DJn/ouAIDBgjIUhUanbTcaQwOGTLhRTs2zmwDhF+J9dnjl+5feKvSboVT+A0kShJDpjg4oCXBZpgYqSPv//Gjdvff8P6T+6/fOz6DRN9GQSASrUtF5darU7btTkSGpxxYAgSAZAQdWFMfdIfbpUWJCJ9xZTOeCK/oI3uSbuiV/gsV9l1TlzejDCNvuRA1/nVsRFNV891DUoaRiIgSQRSSAEEkM8YqZGhrFlr2vT8S4vHnn5p8YuMgbllTem6SzeVLxkqZ6x6Q/D2fMsRggRjjAV5EiJDDxXjXvbM14qeS2Sx913TlzR4m3178Tky/YpGZG8nqh4iphqVxDGwVIeBIEReDgUA8Kq1AIFtC9t2wOk43GXM6BscTOHuS8pFBvBT2TQfeu+BdX+4ZrTvhePTyzYiIuMmCDcxziZ4e0JZ1Davzhe//32bD37glrX/6eqdg+uKWQsWFh2aqzit5ZboCEnSZMgZR046+ZBOdBgYYNXOQEqCLpoPxxA5Kn7ECtyheTRJjUM/9Swez+CwLgNDj251Y7JvnVQc6/1Vl48AkoAhYS7DzXLBgmq9A0+9uPjEvY9Of2pqrl4FQOAsScmW4M2FkYScJOgGgiMdODW7fOz5VyuPTw7lbhjqZ7xcsCxJjqw2hMMQkHPgGET4B7J2hKWj9tLQExSYdONuHV2I7mJjrQvs8eJQJWVQX+EatQB74iJ2vVQi0QXRzmK3JmqCDl8UnlBLhETgB/eiV7tL854R9xLpgiuZbLZkZ3q6BZ22ky6W0+yaK4bXlkrp3yrkUmuu3bXmPxLJOUQTGUuhTNafJrjA8DxCBIP9Obj28vFrbr9uzX++6rLRXaPljCGFgPmllltr2LbjCsGQ/ETPKlieBXlBgtJyga4WhKt734PcyZoyB6DNRX3eUxjqiRTx3CNGTvKVRMVT/rcI12BotAxkt5hKG1lTqkTeoGPsCnf3DiPfvYV+vkLvRC+uPBiOFCQQAVMmM/J9ppHKmDA33eh844mZP/j83Uf/HIH4DXsmbxkoZ/5ocjI/zDjnlWrHcF3X9bNtKe9ZkHYP/JgAbY08+rdHv3AtJ0JvoTxQ1/37o1eC1VrpKWcHiV5DS0DEvhOxGmuRVBT+CNG+yP/1UK0eIK0J7TcMeteNNH73fvUJQgLGiBkmmEIy2bbRmV1wWq7TSJeLFtu+qVQoFlMfHR/J7Ry4P/3L9x06ff/hU7W2lC4wZmESoZXg7QaGnud/cjBt3HrV+Ec+cOPaX921bXAskzZhseLS3JLdarSln+0fOQCh1M2gKucdRUW3lVw/0UNCntYZJKrFh4dj/GtMdlxJzqPo5kBm1HlSLdLSOTFulKBI2z7PByRGIL33AxgMuGECy6a8BUgz8+3Oo8/P//lDz8y+PFtdJsQUuqKdcEmCNxWJySlBFxg3QAoXpuaWl775+PSnBvvTkwevHLqk3J9mbQesakO0/JWl/hkab3WtxfQ4HbWFnq/XCXWm87vXm565jTMZeM8J1P01nr6WglcDAWOAgMgJAYUgUVt2Wo7rCuSsr9ifwe0bS0UE/KFCxhz5wA1bfmftWP65o6frbpKNOsGFgsFTKKQNDDhsXV8q7r1s5OCt+yd/e+/24a0jAxne6QhYrLTdpVqn5bjC5QiMc2C6AhqKdbTCDKXQ7bQCVnr4fVX3nOb9a8KKjQe2zy7aCWwPUdlVy5eCSuFFIABHCuG60s2lWarcn8pmcibOLnbo0IuV5x55Zv6zh09UmwAA+ezC1/bsHH7u0kvKw4WsBcWilZYSZMeWDhGRaQTlt0JBXGnFr7Pmr7rPPe9Pz1v0xv4i59Oa95OFVuIo35O674QAwBgwzpAxQukKEPWG27I7juM4bm5wIGusGc+Zljl6ZTZt/Ldyv/WHDzw589mXj1VOLy53IFkSkODtBC/VBYft6weL1+8e+tD7blz9y/suHRrLpE2YXbRpbtFpNVpeljqDI2fol/qLenEg5DeNMjD+QRcie0lkvabVWSgsTlJ6gpFzEA3xXDpQxsbAexpZcKCNk0AIkkKSSKWYVegzUqkUx6WaDS8drx9/4Vjlm3O1ZrL2P8EFgxE3oiVIIFybkJl45FS1tWZ84O6hwfSfbtlQ+OTWdQWrLyuMtGlbrkuuv8bWrxglAQC6ajkDQGARjVSNJu2QuIc/8BMpz4/ephYAHLPeIqpa4eGRiAj64mBPFia9uUBODw3ISklBiLoIw7dLEL6mW5oxiG2gMBlg1NkFQF5CACDmXSOTjgSaX3Ra7Q6liqU0376+UBwtpb5r1Ujm0oGC+ct3PnTqn0/NVIkxjlImwmaCNxdCugDAYOOqfuu9B1f9+Luvm/j/tm4oDaQ4h1q9RUsV1262HFtKkhy9CBcKlE5tvgfe5nDS+J7ciOgUckP0UQ/mnJpkFD1C5eNA0OdlNFInOB71FvU9StuPeYr8rKH6GlLP2BcMVmU2APRMfppjSDcCIPkXgH4sABERSD/xX67PSpf607zlSHjkmfnDdz8w9WtHT9RPqmFMzTWqT7+0+DeXrCvs3LFpoNxfSnGSkJlf6AghpCADODJEkr4zKwyXAp2DQnFT40XQj4l+jXvMtECL4Av6URUhn4ZdB+79SD7YmJsu9pvFDQua+SLYE4YCBFv8iJBoG+GlezuZf9FMU1i8ZJXEJYB0BImFqt3suJQqFS1roGTxa68c2T45kv3k5HDfNV++78Rv3fnQ8Ze82uhJhFaCtz4Y4wjAYf3qcvq916/72Q8enPzYlo35goUA84s2zS/YrWZbdBgjxhAR0ZPQmIoyCqQm1Gdq72h6lbgU1XwP9fQwcisqY0U5OW6V9UOBFBfHIjX9TgP+wR56D+rH+9RJAW2B/8Lxdqgh6hTlZ2ChICMrIQghhRAk0n2m0Z9PmRIQXjxeqz76/PynT8wuz3qnsh6/RoIE33okEQAJeoKk43vtuXj2lYU7jp6sf2zNaG51JsWh0Gem6g0JjkMuIqHB/ewlUS0auiO+GOjSXoy+z8OLh2f4dl4N9ThcE0p1IfVMiGThlqCbQfQO9DWyiAiMEwPOGBFQoyk6rbbrCAHZocGMuXYsZ2QttjNtsf+SzrDy/U8aX37ihbkZ9WZLLMYJvtVATCGAgKFyBjasKo4dvHz8+997cPLndm8tlS2Twex8m+aX7NZyU7aBiCyTmeh7Vj3lWJ+b8cd1RX/y2Ua14pYzT/vXQAoKZxxq73aVWKfZJDTCC0ViV5CUgiRnjGcy3Bwopc1M2oDj09XOA4em/+Khp6a/fmq2Kg1uoCSEmYU6Xbt7/GsDResvi32pH9+xsZy2GDM6TTddbcim7ZLLDTAQAZABksRz57GuKzjT7xNew4rVWLq2nu8YeqoO54TIGT2awcA2HCoViIQGAhIiEwJE25FOp9J22o6bGR7IZPoLKdyxqb/YlzE/nMuag99z25ZP7thYfvbpl+cXvKoYDIgSQ0CCtxZUpn8ioj3bJ0rXX73qx997cPXP7N7WXwAGMD/TkHOLdqvZEh1ihBYDxphXeY+INCe7FuQfZDrVJx3otBJTwTW+6aIe7GLZM9Bxb+HwNVHPSu8MjMhfgaVb64oIvPp/EiRnwAo5wyoXUzBbseGplyqP3H9o/k/ml1pVAASDJ2pYggsDg+g1vF0TvENgAIALp6brU4een//iqqHM96+d6Mv2F1OWK1zZ6tg2Q0LOiQf6r5aGOSyVRaGrKHxXQMj0vgdfswDr30PPIQTHA4T2BX/VPRBiYJoNPIQU+J7ClgLLbZhJ3Bubb3UOXXvqojRXlxqLpnYgIGouP/D7joxWGbmVZkTB7QAERMmASQCqL7sdkG0olyyzVDDx2iuGN48Npn5/cjDzt1dtH/9NBHOWwAHGDJQyWRKQ4FsDRAsBAIYHcrDv0uEd7zow/jsHdo9et3a8Lw0SYHbepvklp9VqS5shoJfbgpAIiYKM/xREAiAECeohXBTgb1CEELhVYuJdZF06Bt6ZyCmklDj/lIjgp+XhUH3Hsvt35RMJzieIvCHjrvAIg4SZDBSHqekeEWp9dxIRgXClIAGyL2+lBgbSmUzGhPmFNj31/MLTTzw/+/lnjsw19OU/iCks9sFRIem/Tgzndk8MZa8fKFhQLpkpW0hRa8u2sMm2TGYyBghMFWnxNXXFmfFs2D4xYpQgA6wUIaATNfn3oDv6Qt0A8rlS97KBFunlt7NCV/Ehq2zhEBFiwmgwUmOIaA5xDcE/TvE9EiAScAaMAEECUdsWzvxiGxybUqW8ydeu6ksX+lfftmV1Ydfdj53+i2sum/h9ImcK0UJkFnLGwXVbCTcnuOjBtUz/N1+5ZvV3v3vjf7zxmokPrF/VlxauhMWaTQtVp92ypYPcWyrjTSkMVGCdItGv8uJ9VvvVunotK0tP5V8Ru2pK44+wLU0CDDk77ABDOUs/TkUnqSVBMcNAmG/E/4MMAsODf4FhZBIqmlQOL/8e+iGgRCQFSClJGhx5JsWtvixnQARTs83G488v/tnXHjxyDADAYAY6bmI0THBhkJieEqwIIocYGriw1Kw9eGj2D8aHcpeODmWuHShlod1pW4uVzrIgSZJAMkTWXWu6hwVVEzD1bN6aiHhGv1OPxpRKftYje/miesmz/g6MbTlHYI9PMUiIlCZHBOAcGQFCx5aOY3fcju2m+vtT6cH+FO7aXC6mTf79wDgrFDOfeuX40qnDJxc7iIb/4kkMAQneGHhefweIJO3YOFTatXVoz8E9479y457h/WvGsty2AabnW+5S1W61O8JGhswymMFApbZTQdgAZ56TITeQn0n03Abo/6XuTSv5a7pOOMvIehwebo4q8ZGe44qrbtfwyhJSmA+PJJEgCZJk2uDGYCmdHhzM4nLThkefnT9814Mnf/ulY0uv+KXngv45Z1BdbsMDh04f/653bfzt4f70xLWXj2waLKeRkGU7p5tuqyM6giFDREMvTHV26HcwFLN73ZbIPY+n8+5qs1f758qsr43a6CxPQ8/WPUuJFxnAEE2GXAIDV5BYbrhtuy2dTsfNDA2mrLHBDA7lzNFszvyJXMYa+uBNm/9oy+ri8y8cm2sh8qR6S4KLGp7sIICIaMNE2fzg9Zsved+N6379lqvH37tpbT5luxKm5ppupWK3OrZwEBENjpxxz05HukIM4GvJGOOA4DUQs7nFpgXGjg1rTPutnMc0Onfh8eyI2H5XajjmGPJt0a6QQkiQ+RzP9JetjGEyODG9LJ58du6RZ19Z+Lp3/yUQyYQjElwwGL3WwiRIoMAZh6mFpgSA537sO3b90e7tg1cMD/Rl+jKcpS2wOg45UgIhA29hmO9tI01ExKAkE0DgcfF2efsD66xKqhXlxNA+HHr2IwhU9dDSG9muFmf526jr3O4MXhh2CmEss5blOu5R1Dr0tHtti6YRBB62yPUp55O3DpWIqNkRjly0SbqULvUZbNPqfPbb82v+1ca1pevufmj631+6YeIfiNwOIiJnHEWSGyDB6wTjpi8USrp299i691+/6l8e2DP+Q9vWl8YHCxar1xxYqjtupea0bUe43AsFZQAAElTGZH8OIniuXuxWJUm5xLtq0AN43vrYdn0+B65+jQc0j3A8aij4rz/Pg6kYcyd3J7HSvoVJ/mPqqyovH64V9Yt/RJV/xXvejUACACFIgASZNplV7DPSxYLJXAnwwrF6/Y77p37zqw+fuuPY6XoHkaOUoSLpui3yFEzEsaHsPQbnP55Om3958MqxiXIphbWak5YuCZJAUpD0iwP6oVFE4ZXE3ezedQRVCUDVEQjtoKTum8+P6Bt8lAwRzdutPkSNJBEmR8WV+m/TTWPhc6CNVefxeGbvwKCEWlQBRo5VERAUhpv5S1cofFzA81lyb1kACillfdluS5Jk28IqZEzcur6/UCplvn/zutJ19z868/t7t078NWdmVcgOMG6gFIlxNsHFBc45AkgwGIed64dzt1615vYbr574td3by1tHyxZfbnRgsea4S1W7ZdvCQZDA0KvkAsS0AK0IZwYzMsrLiiNDLtZrhUAs8kYzwQWykgoq8KZpVKaK0b1WeTAQ/kA/hLRhqDkeOS54B/l9A4Skp0ZN0j8MVeynL7aqs4AkeMbeXJ+ZKpbSrN6w6aGn5p+568GTv/7qscVZAAmQlP1LcIGRPIEJzghHdMhbI8bhwBXj97x4pPbq6uH8DstCKBbNTHVZot0RDgAA58hVAaoAmj4eUDAARNWCFUS/3jJ515EqKOxMFQAiw3gdwBW/6GPRdp9Dp+qtgX6ZQEBAR5CoN9xWpy2cRpOnx4bSqXXjfUZ/PrM1m7Y+Ucxb6265et3frBnLT52aadh+voYkGiDBeQO5hSBd4IAwMZKz3nNgzY73Xr/mp67ZNfr+7RuL5YzFoF6zaXa+01puiw4REGPIDI4cEUH5MAiQ4sa7lSee5qHVDGSxD93QDXMrdNH77OjWri7jg1TXFEziFcbkLw860zTXTKEgibzloZKkAYjFgpUZHkibwAheOLzU+uoDp/723iemP+vVm+docKv7SkgQ5waenmuKbzw2fc/4cN9/Gy5nf2PzmkJ2cCCdAkRcqttNxyXXNMHgDM8xwEJX0s+NLc/kF1u5ff86ztq6POdxdP9EvX+zlX5JP2FhuJDLtxAheMtbEIEJCbLjSrdT7bjNpmM3Cqn0wEDWXDOaN/r7rE39OfNXikVz88Bg6o9fPbZ48qXjlRoi93k5KReY4MKC8QySbAMAwEg5B5vXlFZdfenohw9cPv4Tl186uL6/aGKj0YbTc832ckO0pSTJENDwook8dT6w28Ye554TK8rvgWG0V8UU7Uv8FeIZBeIG27CHN0Ku6wnqHroaQ/z9oSygkoj8+8ZMixmlfMrsy1pwYrrpPPrc/F888uzsY4vVJiBjIEXCCQkuLAyirumWIEEEyDmQcOH46drcw0/N/c/Rgdwvb99cGBwop0wCCQu2dH25FtRqL/JrUSNQuAAXNRdYqDQEnn3PW6P7hPzTgrWrKrF+aEv2tvpHkxLktPP98ei+KV1FjzF7xCQRRDJgtA9AzcAM3RZv9ZnijZLmgELtxUXgrQgOkgkicAYMJEhHkFtvuG3GOlh0ycxlTLxyR//q8RHr327flPvgfY9lfvfuh6Y/8+LxShNAAOcmCpGEniY4D0gHABisHSkYN1419q4brh7/9cu2De0YLmdMjhIWFtqyuuzajY60BQExRETGvCoWvsQWJEVCQhU9o0fRROaYNvcBglkNXZHkMSd1ENwTibXXFMquiazajbQaQddS+EDx18/qpeQrXvCZgcIGVH6CqGjqTWwkJJJScgSWTnGzWEyb6ZwJR07WnTvvOf6/v3jXsV98+sVpT3HkFjgrrCUXwiVExKm5prjn0dN/VSqkNwGb/N6Nq4uZAcasli1cp+m0CFjwGwERMP96wnseKvseB0dF27BqYcQiEs1xEvs9Ibh3eku6E02l/9YNwhCLstAWkkRyQpD2IEBUA1BKSBCN7LfnDzJqblbvB3+7qvIQvGNUC+T/pt6PzTgyKUF2BLmVZbftyjYVctLMZBju2FIaHhlN/+ilm4vvvu+x2T/as3Xiz4hEDf3VGJybSW6ABBcMJG0AABgs5uDA5RNX3rB3/Dev3D5w7aqRbF8uBVhZalG1ZtutlrCJiDgDxrycHeh7uwEgXkFEK+wRcfQAhHM0nHEqJQwBAJKXMSDO+0Eep5AePKEOvU4omJOhRKZHLgEoWVK79oCaUE13387nT/8gGk0bOoYb0KfGgC3VbSDyg7+8klhSSCGJKG0ZZjFvpfsyBrQaLhw7WZ9+7nDlyy+drDS8sn+JoybBhUcSAZDgrJCuQ5wZePTUknP9Fav/cWwkt2/1ZPY71o5nGbnSXK7Zhu2QI6Rf/g5ARWEG9B1fHxs1GEeFUnVOt0awMhT992TVuLlW27Ti4SuYliNNxazePbrp3dHK7QYiMGOAaIAhJElbSDFfkcv1hmuWS6lM/4BlbF2fz4yUrd3lfOrfZ9KZ/v4nZv725FytdmK65ngZqQ0gSoTNBL2BLItALgAQDBazsGo4X9y/a+R9t+6f+PUrdgyuHyhnsdFyYW6h7SwutRuOAME4Y4aBnHsZkuKGs9CW1mUwO18fTUyAjO86S3O9DHpnP73n7NUISNk39Lkfa4kif3R9FxgASAkkHemSJJnLmZlSfyqTyRmwUHPgsWcXnv76Qyc/eej52aqX9O/sS3qIiJBZ+NDTUzM371v7yaGB9Jbhwdx15XwK+ktWWhBJ2yHXdcllDBhHYMHvstI97H0bel7nmXCmn4jOhdC7WlFkqyn+8UPPYcyR3y8yIm9bYMD2lR1V30xpGQZHTgRcSJBtWzrtdtteXnatYtHIlPstY8Pqgjk+kN5Q6sv8YjaTHn3vgY3/85K1/adnFpr1pboLiBYyNEDIZsLNCd4UeHldJBAJ2rp+oHDFJcOX33L15G/vu2x47+RoynRdAUuVllhYdJsdRzrIkZkcOFPJ7XyPB/rzI7pk6zzGAdoLIrZd/4TxnV3VpJR4qFsPu5p9g6GzVowkSZKSXoWUEgGg0GemhwczJgHAC69W6w89Ofu/j56uTSEyZJiU/UtwccBA7DG7EiSIQUiXDM6w1Jc+MTqa++97dw7ctnYs21/MGJDPcKtGRC4ReWHsfmHT2KLQwDOGkdSp3v5gna2+TVlnlaXZ2xgIc9qCMFUPWj+/hxMO4pv00nxqL2n7wiH18DqR8gyir/SEr6SINTto0D8GlcVZda7GG4qmBADEvLoGCIAkSNqOdCo1GwXJdKloGYVsCvddOrp6ZLj4H3ZsHvzOBw6d/m/bNwzdSeTUvBeNiTJJRJUgBsZMBJIAwGGk2AdX7RrcceNVY7911a6hG9dP5PMZ04DGsgOL1Y5bXXbbjkABCMgYMIN5eeWBCCShn/eYACh8kQTKVLi8U01kAPC3657aYNquJBj63wOHku+t1SpzKC6IyIFBPWavbW8tqZ8MX8lugWcomLjR78FYomJqZI2od4LXXkRMJPArznur74kIhJQMEQt5M9Xfn2LNjoDHn104/vWHpz7x3KuLxzrSBgCz6zdbEcQAkeNIOXd07aG+31sz2rdp97bBsWLRYhIwO7/QabTbbgdN1Mw2Yfpq3cEWaVajpqjYG94nJa6H9KaMJFq7oPG67z/D4FjdvBKeobbpz4XHjPFkkSH/d41PW4pG2uWpXpEo8nwFeScUi4fRCd7bys/8jRTEhKD/FVwhRW3ZbUuClCPAzKUN2LGlf6i/nP6Z3dv6P3TohYXP3ffk9J/cef/RlxARJblgcAvdJAQ4wbcQpmGhKyQAABC5dOtV69d933u2/MJVO4c+sGlNcSifY8zu2FCtO2K5LjqOiy6gl4comhsMA/ktSIgPAL5o4s9JCilEy7MRznIANes12ch/LUTltngkESi2ichKqI7whuUPo9so0UMm1BsIhwbx75HJ6b9qwgX/6iIoyBwi/ReaZaDRX7DMfMGEIycb4msPT336zm+e+C/PvjJfQUzyNSW4eJBEACQ4Z0hCWKi14NnD888//tzsN1YNZd83PpBi/aW0JbADlZrdJCLiXohwGHSpCYS6nq6kqEgJFp0a3yjTlL7K5RztXSsd1svxpP72POUcqV7ZBDzB2y+ihoTIiBmeBMqIiFodYTc7wq4vi1S5lMoMlTPs0i3Z7Phwbv/QQHpVsc9ae+PeVZ9dNZI7cny67qCfvOdcPIoJ3t4wjDQK4QICwHA5A+ODheyODYN7D+4b/Y0brhrav2Yix10bYG6uLZeqdrvRFrYkkobBDYaEjBEyT+cPC6/pdjsA8Hf3MLWdA2KOlRX3r7g56gbq4U86Z0fRikPRhVUtQineczxdoOuCkC4JzpH1Zc10qWAZnAEcOVGr3/Pw1B88/NTsV07M1yRDC+V5rBcnahNDE6cXarRn28g3h4qZ3+/LmP9m17aB0nCZM7stUq4jXJJEAkly9PN5obfCfkVCO8sI4vew1+ErNREq+SvtjXva4j33aHmFzij24cwVC+Jn+mNRScn8BgAQGCAwjhz8pK3tjnBabWFX665ZKpiZgQHL2LSmL7V2LLthzWj+R8ulzOZvv2Xzb25ZW35xsdKuL9U6fv11luRtSfCGgvMsStkGz45FtHXNUObDN12y/T0H1/7bm/aNvnvjqlwaEGBhqUmVaqvTaMmOJEbcMDhHDBKGhMu6orY18DeuNINXmlj66QwAZMz50vO8wIK7Yj/fojTmgUFSeWUQe81S344qXCkEgUxZ3Cr2WelsxoJGy4XnDy+duvfxqf906MX5RS/0vyuFdYIEFwwGnu1NnyCBDykFISI+/fzczPtvWP9bxb7U6E1Xj+8dLKXRlmTV63bLFVISMd/FFOoBKpQSwNtOusU4YqVV2zHmEdQ8fDFLcxdi7p6IMI4QOnewh9UaNOoH8E3LoZU6asMO34xdyWf9V4fufdIWtQYeRGVZ9zvxrlt5ngiI+e8eYJ7WJYFAChStjrSXqjYSQapQEDyf5XDljqHVo4OZ39i1pf+7Hnry9B9evnX4i4DmLJADiAyTkjPvXBjcQuGv9Z8YKsCBK0YO7Ns1+rPbNw1cvX5V3+Bwf4q1mhJqVZeWqk672ZId6Sf74wyYyllBfkZkfx56Wf+UazQAap7jcN4GeyNzSXlfNT9yrKku7wxo25QnWoXhUJD3PfAYIcXO0bTc6Fp4iOyJdKeobAVjIgZnEISMg4AIKCWQ7YJLgom+opkvD1oZ00I4Nb3sPPLUzNcfPHT67558Zabmhf6fvzIoySG/7NzMlVvH/sdgKb1tbCj3kVWjWV4umZYjXFlruG3HJYGcAefAVFEW1O5PeKt7FA+MVGwggCD6QuMv0DzkcVdbeNNCZRwDb7onRQfr8VVffuuE5EVjKZKmkNf1DOPKSxcZOAQPCER2RyM11DVg5GLVOPXGQpVAf2q95A5AtiOcap1AgEwX+rhRyFi4fjKX7ctPvGvj6txlh15YvPOxZxb+++PPzT/56umKCyASbk7whoFzC6X0lnYREd22d82677h1/Q9deenQd23ZUFw9PpgxXCmhtuzSUk10mi3ouAIF48AJJaAvm3h5lwgJGKiJoan8qM/rgPp9boilEYlwqhJzvLZ62BXC4KTwPYEEmsEZvGgzbwi98w50R5PG3znxNH7UNVb/e/BeUUPzbosSZ1WkhJQkQaLsy1hWf3/GcgTAy4cr9YeemP7fLx1dPNaRjtZ6ggQXB5IIgATnBYObgMhwbDD7RLmU+fdrVhX+YqicKef7LMxljNRyizpCgkQg8BQHBMIg8tZD4OTxteOziD7U9Q1X/Nq7gfC1pben+5nOJn3Fu4iaC8i3AaCyCPcwWvfQYpQRIHi1qOvRUlGpbNQIqGpTc47MFSSWW0672XY6i9WWWSqlMuVylu/Y3J9dO5q9fHww+4liKbspn5/542OnKjOVWtv2MlIDABpAspMInO8A6PWGR8pZLBf60lftGrn51v2rfnvvrsEdY8MZRpKguuTQ4mK702qJjiOEQGBgGGh44aASMDBy6VqWh5g+d/bJpJqJH6fZAPxjes/s+HkrHOfb+Lq6PTfERcGeh0RMmOEZFKyXFUJKV4CQhGSlrFR/OZsplTjOLzbooSdnHr/30VO/89KxpRNeorjzCP2PD4UZ4HuYFt5/cMPvDPdnNtywd3Tf0GCKIUunhWxRrU5NIUGqFViBzRGiynTk8uHcKLb3oFQD0Xt5Zr4Ne6KAV3V0mSbObyzxZnochMEAu5c3hKYhj7OJvAUKpoGcCLkgkh1bOK0Fx6lW0Sj22elyMW1NDmf4xEBqct1Y/vsmBvM7BsvZ33/qpczdp+bqS0dOVVsMTU/ZYgaQaCTcnOC8gJhBABc4EgwU01AqpLIfvHHzpvdev+7Xrtk1fPOGtfm8lUJYbjgwv2jbjYboOC65Hs+DgdyXyPTIphWmvacTawr5a2AHxSlvyIPeJVO9HkQb0F9p3lxXkp93kySB9C0RaJrMLBdTqf5CCk7MNMWDT8x+9aEnZ/9yfqnVBEDg/LXze4IE3woYcU9HggRnguPahMhxer5Jz7y08PDzLy48tHE0d9tgMcWKpXRKAFKt4bSYIOLoL5BXFtNw3RToRBsKVFFvXPAmUh4cioqHeuZWT28m/6WCEWM06SvaSPN40RleQcECtej7BXWtIi7gol6GPDQRoD+QQKtRA9baILWSjZRVJNqvVxDLT63ghWMzApJCkmx1yIaqjZIwXSpaPJcxYdclgyOlwezHd2zuf9+h5+f/32PPzP2/J15cfH5+qQlANrxWb2OCtw68EGMCEzlsW1Mu3Hb15P5d24b+5WXbh2/euKY0UC5aKBwB9ZpDS0t2p9F020IIgQwYU+mS/XknA4Od7+VV8l/oVVc5okHNYFUuqushI7VTWcrUOf5sURM7qNUenhhq3GE1Eb32oPLkxrxK3V8iqnv4J7DJxS8wOF0NTR+bpv6TDMYHACBcEkKSTKcsq1i0ssWihY7jwLOvLJ368gMnf/PBp2cemqs0AYCDfB1GOSlahIwhIuLYYO5pEPBDaQv+9rbrJi4bKFnQbIpUpy0dV3jj8UvboeLAqByvGQPUZfk/VZSZlO8+5gEEdWyUz7uMMUG0QGjxAdCeGL8zlTfF/60hOCiSKCAYTvAW0ccfWKnCsXitBSlcMDBGqygvr0+KNIg+nWuUHzzJvuEWGRIjScJ1yK0tO20pgVwhrULGwPHBjHXtFUNXrluX/8ODU0PHnn1l6Uvvunrd/5LkvIRoIsgmIDORZJK7JcG5wTPyCgBgsGq4z7h8x/BlV+wY+rFdlwzduml1fmywmDIYA6jUbKpWXWe5IduuI11AROTIkAMyDG28KrWLR+gYTghNhvImeFAdAyJmQi0HAPi7AqNosB+DuaqOC2o8oZqn/sRT6yHVOwa1Gp2x6iyBZEnBsDye6LI4RAUwDL6FvOHFh/mc4K8C8lb5k5LhpJQkgZAsk5v5nJEq5g0EEnD0ZG3h/kNzv3Po5cWXaw0bOOPguonTJcHFBSN5IhOcLxBNILLh9Ex94dFDM78/Vkqvvuby0W3lYppJwHSjIx3przulgND99wCo0oAQSbJ3JoRU/dpsxlqusDAhmdq3QnTA2TyAoUwYvMwwahWPegXPfKWBIYOU0UK1qXKrUfC2BQAk4JwY58gkMZACRKstOq1O067W21Y5n04PlNJ824ZSesN4dvuGyfzascG+3f2l3O88/criE4tLjdb0/LL0IgLQezmJ5OX0dgFiGgEEEEkaH+pjGyaLk1duG37XdVeM/OvLd5Q3Dw33MVcwqFQ7VKu07WbD6biOdIEhGgYYQZpiUtUpg5bVU6kmdJDdo3vV+1mwsoZ+dlKI79fsafF9vV1Z1H1gF7WsZBhcaWMsPR0RSC/wQqYMZgwMWH0D5RQXQsCzLy4u3v3Q1O898NTMN47PNG0v7Pb1G+NISmLI8PR8gz439+pzP/i+bb80NJT9y8u3DQyVChZzXcou1Tqtdkc4CAicMebJ0BoH9vopAh3gvEbTQ9ju/hbZ0+t3x/DOUoxRe/62UQoOm1lx+L5u46/zVxm9eg4DIAj/9Td6yj9BkKiQISI3kBvAuZQgHVe6C1XbqS87Rj5tWKWimSqXLD46kSvu3ty/c+u6gU3D5fz2j9y+/b/s3DLw5OxCffn0XMNFNBDQBGZaIDrVhJsTdMGr9uPz/GCOrRrOje7cMrjnwJUTv3TVrpErVo/nDECCSrUDS/O2XV92244LLgIiZ8gYB45ehD9SYIXTBSRFCL0Il8LPkaO6J3H0vRBfdEzaERQSTnAidXOSZpOIddA10XXzxMqIGjQj25VNMzA2qmv3pDUpQDAEVshb6cEBy5Ig4YXD1fb9T0z//VOvLB6arbQBEUEmpZkTXIRIlgAkOG9I2SY0TDw133AvWVX6hmUZvz46nPvTPTuH+8tFi9XqdqqxTCSJPPsoB+6tFlb+I/Q1cWXhhajHSePgiHEZ9ZdF+A6iuFAYlqnB4CWmTg0jmTFyrnrZQHAuqBeAsjZrO4JSOLoUGpWfSbOg94hRjl8jhpnVokKxCjbTVqIiACIi8y6CgAEjApJSyk5b2hXZBhKUyrspI5vmsH6ymOvLpG7fvK7/yhePVB599pX5/7Nn++jXicQMIqKQAhA5cm4kVuq3MBhLIZHK+uzQ/p0T4x++af2tu3cM/ciW9f3b14715fvzBrodgkq9Q5Wa02k1RMd1yUUiMLwE0L4yz3yvr65mYXd2fN8bo2WN9+16odMlFK90QStmVgB9KlH0qHiCjWB/uHJfzyTvyZHaPNXmWuBZUnQTyJ7eBaDOSVqfoUxM4fHBgdqaBT/2XwiSUpI0DTSKeTMzNpzmmRSDJ19YbH7u7uP/4SsPnPyrV05UG4gMpXzj1n9LkoQ+NkyU78r2ZX5REP/knu39w6NDKUMIJ23b5AoiQn8trVfnm5RpVrte0mo7xgpnBwf10LjDk/zDYqo6Rg8P9gS/SfSAIBYlQqLKXR8+ZRGHo2c8BYj3ra4GQQtmQE2l0VWLUH2IXqpHwACBLuC/U9CvGMCUtYAhoiSSZLvkNtouAAIKCVYOkPVZFqydzGfMDHvXpo35vYePDz797EuLf3P1jrEvE7lTiByl7QAyC0kmFQMSeODc9Nf5e4/e3m0j499+49obd13S/wMb1pV2rpkolEf604xcCdXlDi1WbafREB3HAZeIiDNCFqyfR6XKRgx2cXklEL8QgqmnR0n6p0H0q87rGPAy6QdrCj4pjxBFzQReQEK4ij/u8/fmns793lH69kCwilcc0PlcVRMIxouBoOeJchicSgQk/WzNpgVGud+0ikUTXj1Rd79476m/+cK9xz/57KszDUSOMsn6n+AiRWIASPCaQK5DngMJmtya/tolG0pfmRjNfXhkKMMG+lMpkAD1ut2UQNLgyBio7LIxDT+C2JsktlVj9zOcH7xudHkztOT27OHs6Hk8hf/H+EX1MJoHV9fDGqDcSz37Ck5UAi0Gby4EAM4AGaIBgCAFyU7L7cy2RGdhqcPzfVamUDLNyZGsuWYiP7FjQ3F8y5r8FcPl7F+9a//av9k4WTqytNxqzy+1CZGj53niSY6AtxDU+k/ySz5uXDOUevd1m9a+58Danzpw+fB3XrK5NNRXSIHrSFis2FSp2J3llui40ovsNwxmMADwM/wDAQMgJF+5V/YybTYFkl5gPdNmHXTP8bM9SvF5H1faVjp+5U1dEynSRY/z48euMOSuEcatDgQgCch1yeUMWbGQyowMZCzTZHDydE3e89CpL/zzN4//0bOHl5qI/FuS/I2ICJHjq6fq9j9/89Rf9vWlVo0MpH5p8+q+VH8pZXYcmWm0RMcVJAEROQAPLjkwfCpTCQWUc16IGzih+5bGn5qznqGZlbotpb2x8tCj76LY66HnUBAAZDwMzQuR8StfBM8/qpeCwRlnHDl4CgPUmm57uem2jYpj9GWtVKFgmZOjGXPNRGZk16biyNbVpZ3Dpb6dt1+7/k82rS6eqtTazdmlJnneXg5E7YSX36FAtNDz+AsaKGUwn7OsG69aveb2A6t/4MYrR39w26bCcK5ggesS1OptWlpyOvWG03YECM44MzlyzwvjLSgE8hJv+nquij70F0xqHIykVsoAgOIJhLhjo9f88SWWyDsEVzhehdsHyn+YHRni0w4Ddoq20kPsOiu0DEyhOcIfeOSatVLQQpKUBGSlWaqYN9K5nAHNjoBDL1ZevuP+qX/38DNzp5PkngkudhiIvV+PCRKcDVJ63qZnX52vfOiGjZ8aHcptObBv7LJSfxodF6zastN0XRIGoBlQv+z2zytoS8N8KD9MLw4N825HM8GqTNLqU+DL8d8a3aUIg9ddRDnoPS+6LONBJIH36lALQsO1Y3CG8FMI3lDKsA6+TqHs8UhhJ+SXFPAUNP/kICO2B4aAEgGFkELYJGvLABIEkZRWvs/CUp+Fl24uT/QXrZ++bEvxg68cq3zzhaOVr1y5bfg+IjHlVQES4GcVT15eFzGQWwhSgrf+04Jt64dyl10yuOejH9z83VvW9R/cMllYPTmUTmfTHDotB6p1R1Zrjt1sirbrhX0gY8AYA8Yw9NCAsi0FBf804a9rmQtqfzGYDyGixyvHihKwvG0EESGvW++L/A3mdDy9f2SvGiD12qoJdvHtUSOj7r2WgIG+5wunKgoHPPcRkSQkSUjkrQs1hgYyVrE/Dcdm6nTHvSfu+vw9x3716VdmGoiInKXgWwUiQYgMD5+qyAefnP7TDeP567Ip8+DIYIoPDbG0nG9BreY0BREhQ6ZoV7eQep+Zb+FU6fa1n1fdBgUMn4YwWkuRK0ba9u68Rn7ah+COx354TTHQ+gxVeU+XoSCW369SAcE65tgyLdKup4vodF5Wow3GgYjq+rzqLGH4CQGoMBkEL8eAcrWSJJICyBEk3JYQQtjkSklCcrOQ41hKG7BjQ/9wIZ/+0e1bSu85erzy8IuvLn1uzyUj3yByZjwDLfMNAQk3v1PgKf4SACQYzIJLNw6V3r1/8urNG0rv27i2eOCSVcX164az2VzWgFZbQq3hylrdsRtN0bEdcr2HEJAxYOBnYw6rukS8/YiBpVc97Pr8iE08/5CzLQ9aOTnsWQy8GrUGJjrUj4hr6NhD3tJO0A4PXmR+WGoge/nrC8iL3PRUfiQkSZIQkDOPcYQfaVUoWOmBgZTpSIAXjtSWH3pq7s9ePFY5KckFBH7G+5IgwYVGEgGQ4HWBMRMYGrh6pO9QuZz5raGR3J/svWx4MJ8zWS5jpBtN0SIJJFGlJCM/YhIBiaESBAnjZH4mRN4C2gm6QIkQecH0/hj0G3S9QmnBLiVkBVNz99mkjaf3OeqDfhhq8m6Y6CYUpoPXLoG+HI8QEQ0TDW4Al0QkpJCVmttcbtgdK2UYuaxpFfpMY+u6Yn7b+vzWua39m599tXLz5PDC/37X/tWf3jBefGlpudNeqLbI4GkUEoFzBNdtJgLnRQJ97WepkMZMKgtrxgrlfTuHv+PA5SM/fdm2gc0jgzluMoDmsg1TMw233nTsdkc6BCpjMZqe4KNFnfjSH+rauebl71afwye3y0PUdc7KiCf91xNAeWM8k6C4kgeIYhO9q9PuDaht7mHGIPDEcH1zUCUUAIiIXAECkWE2a6VLRSuTzpqwULPhvsdnn/7M145/7GsPn3gJkSNnKXDFt9ibixyAHHjl2OL01x449SuZtPl71+0duqK/aGGpKFOuI4VtS1dIKdE3BgW0EgjUGPwwwX9io1YmyDBKRNsDUUOst4GCx63H4RD/7SIGYAoGF2vXf6UoL6Y6DaPHkNZqvEtQh2udoX9lkSSuwZgoaF89PeHNUxaGIMsgIPPSrhEnRhLJlVJUau3G8jLwRZMZ+axp5fMpY/O6Qnbzur7N1W3ljS+8vHRwdGjuL27et/7P1k4WZ+rLbXt+qUkGN1BIDogGSJlUDXg7Qvf4AwBMjJRx3Xh+aN+lA9954PKhn9pxSWnDwECGW5yB3XBharYtqnWn3XLIBQJChmiluBUo9aglKI0tbQpmeRfXajr4ClvjRQN68zFEpmqPvRCyLKoRqe3h3ArYID6TtVnpWwO7ENmuNH7tqzKKQCBWRaUtSVIQQwAAxpClU8wslywzkzHg8ImGfc/DM//06DNzn5marUpEjjJJspzgIodx/sl9EiQIIYRNiBaemmuKx56b/9ol60tfXT2Y+fD4QNoYKqcyjNtYa7pt4YI0TTSQAYL0KBaJAdOkyt4vmdiHHo9rXC2JVuSONxjqM97LgiLnBoHOkRWhmh4UH53+oom/QIniXWp/Y+FzCACxdWyAfm1sVUNxxZKJqMYermDznFTIgMCVJByXXEe6wvXWJqegzzTyOY6jAzmeTplrh/qzH9u5pfzBo8frD7xyovbFA7smH3FFewrRRCFcQDQQ0QQpW8EIiqVhrFZmEwJ5k+AJhA4AABjcgh0bhgq3XTO5Z8Oa/hs3rSresGFN4ZINo9lSf9HLBVBbdqFWtZ1a3W63bdchAuKcccYYQwRvpbJ6NpEgcM3rDypG55Ky00Vnq64VaqKhv1nP0e9paaglV9cVvJgBLy4o6hIZhPNIjcRzY3tXooxjcfsbxSdjvAuteoc+ar9BUvXeA2XXS3MKhF7SPyFIWBZaA4OZbH85xSpNBx5+cu7wnd84+W8ee27ueW91vvmtV/4BgKRDzDBxdqFBDz59+qF0hv9GLst+94pL+zcW8wYysLLzi05rueG2vQICwFQOPHUX9F822B4QrVLBw6Dh4L6rswP9O+pp9BZNxZ6g4IGIcmtPO446QVlgIvu7DUbhkx79oxgeVTrLoNyB2q0UBYo9e9HYl4jS0VU5QhuH947wrCV+GLHjkitdKYQU0iUnVSAw+7IchksplrqkPFnoT3986yXlbzsxXX/m+Kn6V265au09Y4P5YydnG0TUBEQDOWfgukmegLc6DGahIBXVhUAk6bJNw6WtG8s7PvqBze/esCp/cMva/Pb1Y5lisWiiAITlZRfqVcep1912uyMdQSAZR24gsNCjHxqlohGTHvRiGjqCnC8xfozONL+H+NSKtIE+pQfqtKbKq1ZohQa0z9prBrVOY2lDNKNx+KIh7XSmDN8UkEw3aYRcgUhAkpBclwRjDHNZM10u8HQ+zaBes+GpFxaf/8aj0598/vDiUc4MVEabBAkuZmChWDCqlap7oQeS4K0LxBwCOEBk03fevHnPt12/+vcP7hndM9ifZos1m45Pt+q2Ix0zxS2GBCAlIQEwQGSIgX1XxsS3lZTu7rVj+t6VLdD6CrTQvOv3GaPr0ACgzo1at0MZOCbd6cJr3AAQ9OmLzVpjQa5/bSxBZGkQ5u8fGHuBB0qLn1jRywOnie7+IAQRqbI1Jkcjl+FmPmdYuZzBTJMBEUBlyRGvHKvNPvTM/D898tzc/3jm1crzLx2b6wSXyNMIxAEZB9Pk0GktJS+6byEYSyORAMYkCOF7gob6ce14YWDfzsHvvHr30E9eumVg09hgxjAsBGrZUK05stIQdqMtbCFIEhAhAnIE5tWb9/VWCNOYB1GWviYXX15D2rMZGgD05HehQOYZ1rymvEfSf0795xD1YyBuAAhnf7hYKJyzalfku7+NeRkMMJh552QA0McWfkCMdkZ6XVFAAGJegCgSEknvJhMQQ4b5fCozPpmzgCM8/OTc7D984dWf+NoDJz53dLrmSoI3JOP/+QCRI2MMNq0qZm/YO/n+2w9OfOKqnQNrc2kGc4uunF2wG64k6VWx854VVcHV/7lCI0t4R7S7E+NU1a+6+ep3jvCa+hT+DSuyxA0A6jeKMryezXVFA0CM37uVlKhnMfazh+8gUt7OcHzxftUzErbdrVN4zz1FV0MTAknvmUUiMhBY2gKjkDOtXN7gZtoAgQjNhkNHTzSqjz23dO9DT8//t6dennvk1GytPr/U8IeV5Al4K4LxNJJ0AUCCwRk4rscPa0bLbN14fnTPpYPfddVlIz+0bWNpw/BA2kqnEITtQnXZlpVl1261pC1dFAAIjBFDFZAVsap5wBU+hMlPYzNJs7jpCrSaxV4nLHiuI02rM+MGAGVk7CoTquSVGEfrX7VDUPuuJaH1ugqWtHmkFFSi8oL7/TI3AEGVG9TfdEBESETMn+Se0VcKEEKATJmGOT6Syg+UOOu0XXjsuYVT/3TXiV/4/DdO/N2J2ZoAQki8/wneCjB6Gr4SJDgPEDWIYRo5S+G6sexT2bT16+Ojub8aGcoMlwsWLlUdqyJdISVI3/PoETAhSaXX+m1FBKqVLMMUP6r3C0PpNGGApo5e8afdomSoSMfGEjcY+Mq50qG0HfpQSWWK7tGEtkFpaBReRNCUPi6tv+AwVE4s8lW9IHCA+Zl7XCFFx6WOK6RwXJCOgFQhZ/C+jAmj/QbPmMZosWB97+b1hetfPVV/7Ke/Z9c9J043Hn3leP1lEu0GookkJNiCA7I0kkwEzjcS3EijFBIAXFDP3nApC9ddMbFu4+rCzh/68OYDa8by+zatLmxdM57rHypnGOcMmrYDy8tCVmqiXW+6bUdIgQwY58g4Q8aYNpW6aF+p9epz9170TwyewIjwpQQuADUnSfPOeH/pzPkwIr2pP3qKJr+dFc5SudopMmEwcgSscAMCEtLsZuC3pqRppfz7KT+DwHiSSK4jHcNgRn+/lS0PWCaAhJcP15vffGTqr+9/8vQdx07XXAlvvvLvXYKXD+CFo/ON7esHv5hNw+Bg3vh3Ozb1lwaKaSYEyy7V7Xar7XQYQ2YwPytAaJdRei/GmYuC/8afGQp/v66oiphxRW2OP5QruSV7KdZnE2N60XrwId6B2hatMxE5LlJdQlsjoSVGC19TsTdPcKoywAFIBkhEJFwphJSu64IrJFAH0MoTM7I5A4aKaewzjVJ/IXXbulX5y/adKj99+GTlqx+6acODLx6tvEDkVFQFCAAGjHEQIokKuFiBzEQgAeq5YsyE1SN9xruvWbNp3WR+949+55aDEyN9l22czG9aPZIrDhQtxjlCqyOgWheyUnfbjZbouC4JBgwMDtxf6x/oxr5S7AtJqM3UONPHJlBgKQuNbcHUCXapt0L30hrQ+ojPk+hcjWnyELYZtqLLX/GJrLek8VAPMU3VnkaIZfv3ro98ORERQEWReSkFCElKkEQAFkdezBnp4f40S1kALxyuLd95//Tv3PvE9Ben5hqC6I0p6ZogwZsB4+xvzgQJzg5JbUJM4bHpho1Pz921YV3x0+PDuR+aHMqa/YVUioDBcsuxpSDJOHI/YTZIIglEqm6S11jMW6PtWQFRAXTFVwRFVZzwvdO9EIYiwmdXISttYIF2EzVR+/uCTUEEaY8XpP8Ru15aSqWJKyv+mPWXdKx73cpAWlivwRjjJplERBIQmh1ht2zhVKs2z1jcyKUMM5PhbMOqvvzGtfmt+1ojl0wvtD/4wuHqi489N/8X11259h8mR/MzJ04vBsuhOecoJQKgAYkx4LXD8+BJYAjBus+BYhbHBrPFrevLm/btHP6Z3VvLt6yf7Bss5i1uGQwch2Cp0qbllnCbbddxHBLCBcEYYymOHFEr+USaLqILXbrhyRfI4ok340qN8hB3r/8M21RTOnx8o+s3u/MF6qIpQcQnA73NZrpq6Qmp2hb/cqLTcoXHM2IziCyE9+kFA6OG7yL38gFILzSUM86yGW4NlC0zlUF49Wi1/fX7pv7h3kdO/eEzr842LnRGaPKTVhmc1/seZ58dzFubLW58/+b1/fnB/jSXElKOLVwZDNKThHWvtperUakVygAZGlXCNI4EWqhIF5/HDUhqW3doctSAFB6svxjOnAU83mJ4P8Jr6LU/OkiM2ZyV91MHdj/PkYeKgscpYiz27ykCAEdAw0QTgIEkoJYLbrNiu4tVB9MWMwpZbuWzBp8cTVvjY5nV+y4tr56abd707CuV5x96auZPDu6auGOy3HfyxEI94GZEAwEQGHIQCTdfFFA5XEzOwHa96TY8UMTVY4XCrk3l6/duL//Ezi2lvasm+orZnIkmIrgtAdVKRzZarttoC6fjgiuAiDHGUpa3+sl7+iTIIEpQfx4x+NrLXLcyLYbzw1OIwzic0BzYQ2DT2wizGweTHgNLgJIEA5bpPTZVg1DjFNIvkWJkEvuIQTSROjwIV1Avj7i1ApTlxPP+kzQZY/0FMzfUb1rcADgx3ZT3PjH3la8+Mv3nh16erSGaaHCr5z1IkOBiBBYKRaNarSRLABK8IUA0kMilG/asm/zwzWv/6JZrJt61aqTPbDRtODndaLRabodzZAwZI4+HEVWWO80zopO7EraidcQhYp32vkaMusGOQBGB8PTQABxVSeIIHD3qJaYEYOkLwH4smcqvQyAj2kegSJBvew7kRIopY9plgW+DVu8oib0PBBVKLSMXqb/gkSJWD9TXxgkCcgUJIUAiARkcecZiVi7Lrb4+0+jLmWiaBtgOwVylI47PLFdePVl76dTM8pOz88uPzsw1jx051Xjm0edmZpTy6sG7KYwDCDfJVn0mIEv5XiARbBsv53DteH5y9UR+7ehQ7tJV4303rBnLX7ppVX71+HA2XchxICIv43PdlfVl215ui47jSkHAiCGiycHgjIJHCSDQXSAUBrVg7Fj4NcbnFqg21Ez0HmNJEHMWSe35Y74BQHvQAwUKADGcH9SrDzVPIoIhxeZxeD36WIPlMIHUq8atC5sagtB/rY/YenjyS18RIgAjcCWRawvHQGTFPiszUE6l8kWOMwsN+ZX7Tn39H+889v+z999xuhzHYSha1T0zX9q8e86eiHMQSYAIJBhBUhSDSFGyZFv3yvZPjvfZcnjyT5KDrOv47Cs/p+tnWbZ8dS1bz+HJsmwFSiJFigEkCIAEiZwzcHLcPZt3vzTTXe+PTtUz33cCCJIIUz8SZ7+ZDtU93ZW6qvonH312+dnljSG8VmJCnSHie9+x/+of+tChv/fDHzn0Z645MJV1exrOLncHm73hoFCkBEqUiZAIGog0+OkUztLJ6Ju9VsxfFGBpYCA13uHWahFMIQBGnkqu/6yBmPRxQ1HJpYQbhEIFrgi4dxoCZwklXM5DZ/hw687naLH9Y4STNSSwbh3ZRdsmIUV8CgE9tXRlPOYIqAhIEVFRUKG11hJRNDOZTrSTxtRkknY6CXaaGeQ5wdJKXx85vXnhyMnN546f2fzambXuY6fObR85cmrr5eePrq0Hoi8AQNQ3CHwbYXZmEdfWz0fzm4gElV9Pjq4S3XR4dubqA1OHDuyZuGHX/MTb9+2Zes/VezpvuWZfe3HPQiNrtxPINUC/W8D2xrDY2smHvYHKh4UuFCBJCTJJUBpPP0MAiSgQZ/BdEojYnSZIFKaqlRNAl+litCVNXQEQFHIwRkCjo8cKPLnrBj1/QADQLrGobTTwInL1XV8sU3/UH8PFWhJC+IC3EFgcXD23Xcm17nKEkrONAzdnExBpbW5z0QoUKdKT7aR1+KrOxPR0BifPd+kLXzt9929+6ehf/sLXj7yAKBBlCrqor0+u4fUDODU1lWxs1DkAanh1QMoWaq2AaEg/+IHrrv/Tf+SG3/zEBw7cNpEhnDm7na9vDvq5IkWIgAKFTddcccgFCEpI2TrtFYqyvAjlVsaZtVk5ppw4XsnbcvzUG58ts6oIfSwVf0AuZlauHd9HyWBBJYNFZKNgFpGKv4L3KbUGAPa6zJKdUOq6drHL6DIOWuuIlIiNNEnbzSRptxKZNSTKFCHXGnr9glZWur0jJ7aOP/bcxu88+vzarz1/dPOFF06ci+hIkkhUCgFAgMAElK5vEgAAQGwigAZEAikQcpa866bD81O3XDt30zveuvBnb37L/PcfOjC5b2Gh2WxmEhIkGA4VdLuF7vbzot+nolCklCYn+oGx8gAIBIFIJt+YXT9B/AxCl1+vvm6kzcevIdou5jmFZOsI5L1NzDhLwiQEhd8rRhBwi/Qp9jveCAzKq4m7mnuNtfRuNEmJFcyoSW8IIb+bEFEDQKG1UoVSnWbS2L/Y6UxOpLi01tNff/TMY5/5yrG//5UHzn5+dWMAWmRAxWvn9FVggpoK+r73XHXDn/jkNf/XR9+z/8N759rJTl/RhY3+cG172CMtSCZCCntvODriyIVxwkAPgX+eyBJjrI7EdeoS4YbSoioBlj2cogXC81e4NYeVJqvJXN13DWsLWZXyeve31NAouu0RjZ9pq9II9HkUrBIS9+HotseMmMGBjLaokRQZM7MUJFoNkU62s2yylSVZJgAEwVABbO0M1dmV7vYzL689/vAzF37lsedWv3z8zPa5M0sbJY8tk80BhQD9HUhI+WYDkbSQVA4AGqRAKFQwAB7cNZkc3ju57x03zn/09pt2/YW3Xjtzy55dncnOREOkAgG0guGwgJ2eUjs9nQ8HKtdKk41XJwRCjUZ59cq/kTUoJAL2C9f8W6H3CN5NkBkAvIl0ZNIMz0QoXE0UBBV3e2xQ6DlVd0AQGfZC46PouWkRvVXAdO/LVfkYuiSebn8zWuV2Pzn0IBgAuHnEyWxKg1YFFoIAGimmczNZ++CBiaSrCD7/9TMv/JdPPf8jn737pWcQJQJKIF2H29Tw+gKcnp5K1uskgDW8iuCyle+Zm4If+cS1f+5P/MB1/+rW62bmBGlYXe8Vy2v97iCnPElFkggQPNFM3I4Xvs1vJpURp9rOs5a74/v6oyR+9I983BgG3uaborIBAKsGAHDNOwGTM85YcXHObpEBAHlf7iVZPYNsEJrDv2zSYLgyrT64/IvSjOpQP7oGyNXToLXWhclOrQEEZolIOg2RTkyk2cREKtutFJIEoRgqWN0Y0Mnz3c0jZ3aOnTiz/dD55d4Da5v946vr/XNLa73lcyvd5WNnN/L4BEoCgLRC0ZvDICBFA7XP7OyEogSIhnTLtbun9u9uHdg93zi0MNu8Zt+uzvuuPjD5zmv2TV+1f3GiMzWRgUwRBkMF3W4Om9vDYnsnH/YHalgUVCAiCglSSuPpz9UXtMIPPx0JBgA+9WGPBAOAfaWdIGUeYvhh0+0FnQ4BKrGi8fryYpkXG7kK6PcBWy2mXtjPI71MrcCGbM+RGz9XHIG8kBo8A6y454KQWPJP5z5hdDmzKQUikgYaKl0QAraaIts122wtzrbE9nYBdz9y9tlP3XnkJ+97/Mx9x87s9F+Ld7a7pGPz0w14/22Lt/7h7z3085+848CH9+3uiI3uAE4tdfvbXeprDSQFCSlIIKM9nArxgYUYXOIPvVLODtVt5dHTUg728PTNa8kxBpEBgP03KAj+M8fZwYGtLXv2SZUMLawv5gEQ9hAyBoVsbI53mD5HGwDcf80i1RZRkyrGTZv5mzRQrkDlihQprRMBopnJrNNKs4l2mnbaiWi3UpASoDss4OyFXn707PaFI6d2nj6z3H18ebX76IWV7sunz22fOXl259TZlT4ROLHP0GUhBajXkKHq9QZCtJC8N5extyRSwoHFiezA7s7i3vnm4bmpxuLu+fYt+xfb777u0PTbD++bXFicayatRgIFAfR6CrZ7OW3tDPPtnWIwGOqhUqSkACEFCilBSmH8cPxeICDHY9Eq2Iaohc0WDlNiCuyMsNxmYCo4L6jYAIChCa9cI/FdVzUAxF5X3AAQgzubD0kBmfzk97Hp2KMqAPnlrN4AYBF1FgTHYNxtHsEhxxujvW1QE4IGIFWQKnLKm6nIFnc1J+fmGlKBgEdfWF/9jT84+jc/9aWX/+vSyiYY5f+1ReNrqOFyAGemp5O19ToEoIZXFxARiYjec/P++R/40NV/5w9971V/+aZrpibyvIBT57b6m9tFTwgQAgGl4xoVxlAxADCLMDBGwZUUzjhMG0EBAPY8dGE5J7ePG4bpKpKrFAt4vLFKRnMukLL+ghOyY9aM+VrvWuvGByE0opSpuiTElpMghtICXJw2j9UNSGF45K0PRNrOrbYJzgVpkAJFmgjZyNKk2ZBJqyFkoyFQpAA5aej3FG1t5sMLq/3N0+d6x4+c3r7v+eMbn37u2PpjJ85trZ5d2fIzliZN2x0Z/dJ4g4AqevwrvW4hkQ3jBQPG81IIhLwUCnHDocX02oPTV990eOrjb7t26kevOdi5ac+u1szUVJY2mwkmKEAXAP2+pm6/UL1BUQxyXShFZPNmOFkJrbKA7pvGZinzXcMbprwDgrcwRZIdBAMR31t+43EXaYrXUwmirVaKJygfMpUtAuGg2ImW5FHmDWGkWYYrBjEMw+PqQyDKBoCQ0i9MAUNJ+4EiaE2UF1S0WqKxe6HZmZ3KcNgjePSplZOf+sqxv/nprx3/7fMrW1So1667NWIbEXPQOqc//L3X3va//dB1/+3D79p788RkAiubQ1rZyIfb23mfFCkpQaJAQdabBPmcsWtQwhp0ENObarbvMbi52pEFgKvilzIAuDqc8IbvGpeDCKdw+0X4HdLMsrAtwNLa4jsv7qsCpTXo1pjfqzZTOVnDgQ9LITKswCpBdpgoADCVUjQbMm23ZNJoCSFTARoFDAuA/lDp1fVe/9Tp7dNPvbD2hSdfWP1vzx5Zf+qJl8/vlFGTMrFICVD1tYIXBWlvaCEgEMJcQ+oy+AMALMy28aq9U3O3Xj//ntuunfvTN1w1+d69C63ds7PNVrsjk0ZTAhBBMVDQ62nd7aq8P9RFrkmb23o9Kzen/fZf+wCdW4o3FhnhAfhec1A9OihtvvIei/8J+wTC88hjkbVR2YtuP5RSiJb3S+VawMjQYIo5I6/f8dEdJaxNJzcRGh7pjQLxsIPfnKmMaAwAhUalFGhBRNNTsnNg/0RTZAKeeH5j8/fuPPnPv/C1k//mmZdXe4Uy3q5QQw2vQ6gNADV82wBFiqRz+uh7r7nqR7//2v/4hz504Pt2zzXE6kafLqwNBjvdfKCVVolAmYjoWnIAYLQ6KAVEACDGGQAEWDEdGZexFmUn0ZcZQcUA4PhrEPmpzAXjUZpmSgyynH8gDAWDQQOdAYCYAQCDmuKzarHYNGQGAN9HGK8XPTEwSzt1fj7CO6tcmQy46AwP5vZgc/irFWld6EJr0kQAEgWmiUxaLZl1OknWmZBJqyUgSwSABuj3FaxtDtXy2rB7+kL33PHz28+dW9p+YHm1//TG1vDsxlZxfnVrsLm6Ptw8cnolN7kDOPkxcaoIAjS9PuLphGwgaQ3mJEKzNxKICrrx6oXOwmy2e266sTg1kc3OzrQO75pr33ZgceLth3a3Dx9cbM8tzDTSdisFEgCDQkO/W8BOt1DdnWLY6+XDvKBCA5AQQggBwhnPAGLxBwCtg4xRabUPo3RqjF38bv94AwCWDAC2Ra6kY1hrQe9jGwj9cvXwnTEAAKt4MQNAjJv9HT1xAjYRH7IRqJUmrRQpQoBGQ2S75xrt/YstoXIF33xsdelTXzr+v3/loVO/++SRtQ1DrF4bcf/jALGBAEPYMzcBn3jfvk/+0Y9e/a++5117b5ydasDa9gDOnNvp7uwUfSIgIVHKREifU8Q75YL/sF6d9YYARnO+BQOAUxyE3VvBfwRCH/6be+IadzDSAEBhLfpi8QMeVsMNAAhOMyff6uUbALh5yRB5U1ab0TEkNWNl9ppLQECbmZyoUFqpggogBCmFbDRk2m7LRqeTJO12KpqNBJJEQJEXsLE5pFPnulvHzmwdO3p2+7Gltf7j6+vDlzd3hucurPeWltZ6a8srvY21jSEUmtNkCeaU883rHSCTDmpFYHhVOOEHABAoYG6qAbvnW9O751q7F2YaeyY7yeLsTPPgvsWJ915/cPrdh/dM7tk722pOthNMMgkFaegNC9jZyfX2dl50d9SgPygGhQYNAlBKlIkUJr7fucBzrRsAiAQBok3yatdh2QDgyf0oA0DYo8F2d/kGAPYf+9K2F+VTgbD3vAHAUwreWsUAEN6SR815TfLS/L9YGjdvZbQBIJjj7FYEpUDnBRRSCDE9mbQW5tPmxGQGp873is989dTv/dYfHP1L33jixCpihrXyX8PrGXBmaipZq3MA1PBtAEyaiFqB1jn96R9628f+l48d/nfvvW3XW6YmM9zYzunccre70837iUCRSpTCWrkdVBiBjzf2zmRB0IeSEk4QKe6RG6lXmJmJ3bOBWDspC6O+xZLwGrhyGYm4kuOZaMcR1SZrIHBszInRXGDmFgVnAGCnV24Y6DQxd7RpGyMrKASjOrqJDOHbRuBw6XXAm8mNe4CzWgAiokhANFL0XgFZJoSUAkSCoAmgrzUMdgq9vj7snb/QXzl3oXfixPmdB4+f2brryKmth0+c3Vo+cno1FzJBP3LmskduTm3yNSc7C4TvqMeAkA1Eew7Mld54HVhF0SYCesvVi42r908duuHQ5IevPTDxyYOL7bcu7mrunZ1pdjqdJGk2JCYCAUlAMSTo9bXuDVTRH6qiyLXS2gT3I2l7ioFAYK1cQCZ+MQrxRxuibVeCACRRUrrKApBfMyF0NFLa3XL2S666Zs08BAGyajCLO63qfRTwYOqQ/4dtqbhuWVCs/sXVsvAmKG3euBA8XpH/5hSmKEAVWqtGUzQW5hudxblMNCXA8y+v93/9C8f/5X///LF/8tKplQGiRCkyKNRr06NlfmoeVzZX7GdPEVHBwnQTPva+g9/zZ37orf/1A29fPNxsAiytdPXq2rDf7RZ9QoAkEYnAcPTs5zbKQGHoAmFQOaone1xJB+BkB2x7ANzQU2onNjf4etFZYBQGFiBOJ1tWXsAvjXKISDm2GkGA0ygC/hAt+dIwoWRrsg0KtsDDTnYNarRROATkZjXS0zRol8eFUCAIgUKASIXGRIJIU5E0MymbmRRZKhElgiIN/VxRf0h6a1MNltf6a0dPbz/74smNP3jh6MYXT5zefvnxF8/0AAASmWLAze2X8H/1Bs0fIGTDW+oxMiYZIw0AgFLGu+fm63ZPHdrbufqGw9MfvOHQzA9dvW/ibbvmGrOTk0mz3U5ku5l6j658qKk/1NQfFqo/UMUwV4UqSFm7WmD9CChdZhXh1X9Ae0Lgyay59BFH5ktyrgFk1x4Bk2vMmMjJIm5vedGIS1+x+aBMv8M+pahEJdWHK1Xam0HGKu1VxlyN1MHkIPuL0wJrIQh/RjiM4xX+gePsoDVorUBNdNLWnsVmuzMh4PyFvr73wfP3/95Xjv/Ep77y4mOIAkGkQOr1cUhRQw2joDYA1PBtBXPKRPDWw5OTH7p978d/9BOH/80H37lnf5pKOH6uq5ZX+t1hrvIEAROBMmHyus8W7RQEbgCgwKy8AcAUjpX2mCdF4l/IX8sqW5cxXt63xdgGssTWHGK31REGAPs4dtILgq3LNG4MGi4+1I6SJ/tjnZUNANGpJ8WDobKQ6bqn4EhNXtgEEMLdK20KagLS2tweYBLQgRYImCaYNBsibTVl1momSaudiHYzgbQpIQVzXd3WTg4b28Piwnq/d36lt3x6eeels8s7jy+vdB/d3h6s9wbFznZfX9ju6fWdntre6Ra9bi8vTi+tkRRt1JRDiKPnIOz/3SqoqopOGPIKIPlrG0pl+YIhCKf6pl0BEhTltHtuEtvNJGm1ZKvTSlqTnXR6spW1Oq10utXO5icn0gPzM8237d81cfNVi51r9843Z+anssbUZIKNhgRCgmGuoD9QsNPTtLOT59s7xcDH9gOAkCDTxOTJkMLESWhtvYDJ7AaHpTkYMW6h/ksKL05GIpxbymaNBaOKO92/tAGAzb83AMSzdzFgDtX2t9vf9jtZJMhfKhGE1lif87seoDrCqBSU+qwUddmhI98iU0ApUFqh1gSUZZguLDQ6+xdbEgngmRdXu5/96olf+ezXT/zCfU9eOGbE+O/edX+vBFAIBCLYt3tS/uAHr/4jf+QjV//LO26bv3qqI2BtvU9nl3rdnb4emKythEKCQGvxiQwAGMwCXpEAR+sw0Ce/AC9lAIjVjpgWm5rIiDXv0+sKFzUAsIJ81VPUzkgDQIQPbwGrbYRHowwAI2gV26AawXtpGaVM+64Fa12DSdXowrbI3uiIlja3GmnabidZp53IdltiI5OQSglaCdjuFbC83i9OLe+snzzbPXZ2qfvU+dXu4+ub/aMb2721ze3hhbXN4fra1nBtY3PYv7C+Q+Z6Qe7thB4jQAQh5OsipAtl21iqPY0vIKYfCRDldHDPPM5MZu3piWR6opPMTLTTqcnJxt6ZqcbVu2Ybt+ydb77l4GLrmgO7J+YW51rpRCsDIQlypWCYK+j2FHV7Wvd6Ou8NVF7kqigKrRAIhEAhBQqRoERh+T05AQdJA/CLkkPYDQFRxQDAeCDyPeM2RLzXyso4uNFf0gBA/i/w+65kAODtMXCo+MMezlv4JnFuCUxmCtsF/TRFO8x7vI0wADAvN0/2TSVAANCadKFICQGi3UwaC/PN1sJcEzd3hnDPg+ee/Z0vHfuJ+x4/842jZ7eHAgGUfm17eNVQw6WgNgDU8G0H5yp13cGZzo998vD//mM/cO3fuv7wbHN7SLC82i/WNga9fKCGiRAyQRT+MLJsWS4l+SsTe6+9MMuxYRIxT+GGgkgQJPAxY5ElwaNAwcLsTgXs80q8GrciMPbIxxTwdskBwY/HlDBM1qX3sS0wAwZnxoyZs/ni11xxbEIiwniIJgLVTAYConDqvzmK9nXJCJrkRoEAKBB8eSmFTFMh0kzKRiplmglMEoFSmnEoIsgLBf1+oXrdYdHdHvbXt4dbK5tqeWkjP7Wynr+wvNp/fGW1/9L5ld6xC+v91adfPj0AAEiSBpIybpgmFFICgLDKhWYTo8OkgohGGdaUeeckLASTSpkgMQYnte1b2LdrGmcmms3ZqWZnbqaxe246PTg707huYbZxy5651o27Z1v756YbsxOdtNVsyzRrCNHKUpHJBCQB6EKB0hqGOel+rvRgoIq80LpQpLXWJruX1hq1WchCohThC1jjkP1oQYLxEh2633YpW3cAjNaiX7Klq/iA+3VzxdotSr7nKL6ZwilGxFYZMiNXJT7Gnd4Qb5rJlNYAUNr21oIVZZuPoj9L7fPvHO9FrOyV8plwSEBKUBRUKIUqy0Q2N5u1F3c1knaWwAtHNwe/9aWjv/Q/Pn/kHzx9ZHnHXbEHr0NARBRCwO65SfjY+676vj/zQ9f85w+8fW5/QwKcXe6plc2iv9OHAZCGJAEp0d7xGLUxZuhEYIpzOsfcdUsnf6NPzJETT4j3cEmJJv+fytILNDZWfLhRIYa4Ab6uYoMUjlrmUdvcJwLArTkK9N3uJ29sjtY9BA3Jbmd3MwMhGZM4y3RuXhjLDKA9JxaAUiBmCSaNVMp2I5HNRiKSTJgrW7WGfkHQH5IeDAu9vTMcrq73Ns8t904cP9t9+MS57t2nzu48enZ559zSan/r9PIaSZvvxIzDTQCC85BAHyahwVkaTW4aCUO1823dK2nSQk2WZ5O9ks7Tg5Ii6DgemLwthT3dv+HQ7sbirvbcwcXJtx7Y03nf/l2tdy/ONa5ZmG/umZ1uTnY6adZsCJklhJnQIIWwHl0I/YHS3X5eDPJCDQtdaI2Gb5oQLQDS1q/NTRkiCPOtSYflr4EfStj0QABgjPaOvFt67mWH0ornWTAxPA8hj6z4qK8yZm9zVb980j8enOzBNoyj9yyhB7L/RVvf44omr7Edv9kidhd5Ty4Kg+MGAD8tQEQm2ZJSWimldbuFjV0Lrc7MTCYGA4LHn10796k7j/3MZ+898T/PLG+oXMFrPryrhhouB2oDQA3fEUBj2obvefuuG3/oQ4f/xh/63sN/6oZr5pq5UnDu3HaxstbvDnPMBSLKxHhGByXAsim0Ug+JWDQkJr4jRK5jMMIAYP/g/0BFgblCA0BFex9nAHBVbZ1LGwCAuSCOMwDY0iyeHwDAuX+790E05H0RK2FUO6sgkvE6d0Kuta7bxIROxHOiB5nrwkmbmFSlCYiEiU9MEpFkjSRttWTaaiSy1ZCi0ZCQZQISgSC1hqJQ0BsUsN0n2uqpfGNHDdY3Bhtrm4OVCxvDU2ubg6Nrm/0XdnqDpX6/WC+KolBKAWkCArmjAUApnetCQ6F0USjKi0IVSmlQBLkmHBjdjBIgAhQgE4RUJphImYAUskgSbCUSEyklCJkKKWUjTUUryXCi1cDpdkPOTXUah6YnGgenJ7M90x05P9lJpqYnks7cVLM1M9FIOq0E0hQBEwBFAIVCGPQJ+t2Cujt50RvkRX+g8sFQD4uCFAGRcNmdE5ICQQgjhJoDfRCgWV4I+x29ScivLqYQuKWM1gBgY/0jwYgrxuQtB+UTdgav0ABgK/EmwlorK/jjDAABCbfgfAUKlS5uACCGp1eyqoqhm11EAKWJCqWUJqA0kcmuuWZn3562TCXAcy9vDD5z16n/36fvPvaPvvHEubMA2rvBv17BnOoq2L9nRv7w9x76sf/lo4f+xXtvntvbbiZwYWNIp5Z63X4v7wsgY5mSQlTNLrHiahajPaf3BoCSUWasAcCB/cavAQMARPjDxQ0A5T5HGgA0e+YGbmk9awjJKjdxynWruGp/latAk0wH7b3vRERaEykya1lp0qBBJ4giS2XabMq01ZZZu5XIZkNgkklIEglJIoAUQbdXwNrGUC2tDbpLq/0L51d6J5fWei+ubgye39zJT+30BxeGw2IwGKid/kBvdftFv9tTm70B9Xp9lR87s6wBABKRoaIcLg4I0Twwhd1A8MQaDeO3n8kpo2h2soGtTGKrmTRaTdluNWQny0SzkclWliTQyJKk1Ug67XY2O9HJFqenGjcszDZv2DPfvmZxrrW4MN2YnJlIs6mJFJuNBIREKLSCYV7AcFDAoK+o39dFr0d5b6Dy4bDIC6UVIIGUUkoppD/xRwBEjUBAmhw1s2MmZ4j3MgMXXaxdJY71R0eXR83EJQwA/h9jq/HCgl+xFcaAlV9XagCIeNIIAwCj63j5BgBjHUfnycWXizOgW1zd40KD1ooUEVEjwXTXfNbZv68tc03w0JNrq79358l/9OX7T/7qYy+ubQCoWvmv4Q0DOD05Jdc3N9R3G5Ea3viAiDjVSeC6g3O7/9QfuuEX/tgnrv3j+/e2RHezC2eWu8O1Ld0bFlTIBGUqUXqmYg44jOLpkvoBugSwEARBinRyz96couLwYH+Ni19jvvyh7fCPrxfkxpJQG8YMoYjjwaZmHC4AVQ7KGR1wtcYxxqDQe1cHppQ5d+agjJUFLNYn+iaY7x8zcnjFzCCDaM7U7aVVwZChtCatSQOS9iEcRpkVQohEokik+TdNhUylEFmCmEjAJAGUEiGRAggRcqVhqDQMC6BhQTTMlSpypfNCqTxXqhjqXFk/PE1AqlB5PtTDwVD3hwPdGwxVd5AX27mmXGkqtKKcNBUAAImAJEugkyWikWVpJ20k7SyTrWYqsjQRjTRNEpkmSdqQqcxEkiZocE5QpFJgKgVIQSjImEykMCdeShPkhaJCExUaaFigznPQRa5VMdSFUSiVO5sja2IxobsSJFoTDCIACpP2S1lFymQHJ0SX2dhnKnc6g1WSQniAd2hnK8OtDreWopAXJpzFa6zklj1SeYsUMaexhIWM4/qoKGvIS1Wk2bIaCH6dsa6ZAuWNFZEOGUvKIQwbfXuF0lpprdJUpNOTWXPvYjudnEjh6Ilt9ZufP/pf/vvnjvz04y+c3TEeGim8ERJCIUpEAbB/1xR+4o6rfvjP/PB1//GO2xZ2oSA4fX5bra8NeoNBMSRAwERKgcH7GJDQnTibuecqr2DJGiOpHAL9rmBj/qnkDAjP0P3H6U2VtVKtG63S0WSexUJbR30WOhXlWuFtjcHXMySrjXBy7wwkMQ78N9OHbJtuJE7/8Q2RPV33UVu2LmmfH4FsVpGQHRRBJCATKaWUgEIAJomQjUYiG6nENBHOkACKAHJNNFSKhrnWea7UcKhUf1AMd3bUzvpmvrKyMTyzsjZ4YX1r+NLa5vDY6nr/2PJq/8zqZnd7fac/PLu8QQAAMkkxeFDzj8A+JjfyeGOJ+4I8W1D8XiCCFBKG9haDxYUJnOqk7al2OjE7meyZmWhMz083F2ensoMzU9kNk51kz0QnXWg3k+nJTmO63c7a7U7aaraStJEJmSYCG4nEVCBIRAAFoDVBkRMNh4Xu50oNFelCgdYKtVaaSJNWZMCGbXB/OrN0BKIQRrgxvNfGd4HzVvBf2i83ZAq8CyHhIY38GlO7fKM/4huE+Noj/ph5FsSvQ1PIdm6cUjDcDsArB+8yx0OC6MFx4sud03XOZ0bwhtI43S6t5A3wglugU4UiXRRUZCmm81NZa3GhmbY6El44uZn/5udP/PKvf/b4zzx79NwAMcXX6q0uNdTwSgCnJqfkRm0AqOE7BNZBHD7+voOHf+z7r/0vH71j3wcPLTbFTq+Ak+f7w5WNwbYGgkSCTBGFIdoiGABAW8GKJU9ycclYZiAlF2SHA/vr1TMAlNv2A/bPL9cA4MXj0lHYZRsAbHiufU4giGHBWXU87DjPgRs38qLkryGyWLh4AQGAiMJ8HwBw6apsnB4pRVopUOasylQT9m7jNBVplgrZaGDSaoiknSWYZiYhhEgQzIm8cJcTABGA1hp0TqA1WaOQeaZygmFOlA81DYekc6V0obXWWpO5x8CMTUgUqSCRCMQkkSLJEpEkCFkqUAoEiQIwESASCZDYOSMNRGT61gSq0FAMFAxzRXlBNMy16g2U6g+KvCio0ASkCIkICQjJZGsGFEILIcBlV7D6OJq7nJ3QaI9Mo1hqt37cKYfwJp6grLAFGSnSzJ8aY/39VTQA8DXmlKXSq1F9XKEBoAKRAcAItZEBQBvESbjUlqZPIm3mxcw1OJ1JaXDLRaeJSBZmm53FhZZME4Qjp7fzL3799Oc+deeRv373w+eOARSv+5P/MgghkUjDob1z8o9+7Jq//L9+3+Gfu/3G6bksAVhdH9D55V5vq6f7hAKk2aI+GSUAE+OdAmuSUTjbLbISEJ7BSAOAo22cHl7MAFAla+MMAKZCmcxH9BDA7CmgQLO1yxXhdy6jyzZBZ6VRNx+jDQBxtHXVAECsPa//WQMAoV3sPhzfZQYINN7hjyKE12mFSmkipUgpTdrkdiFNpEkIFEkik2YjSVtNmTUbQjYbUjQygam9VcDGgACSoYODIcF2V9HWTl5sbuf97W7e29jON9a2hxdWNgbH17f7Jzd2Bse7g+HqMFfdPNfbw1znuqAdTZZWEBYEaFxpSEsgnRgCRXYUOnV0DUHk9orV1KTBF7mQ1BECUiEgk1KClJhlqcyaDTk72U4PTLSTPdPtdM9UO12Y7jTmpzrp1EQ7bbdbMms3k6SRCdlsZJg2EkgzAUIao0JRaChyDflQw3CoaNBXut/Xeb9b5P1hMcyVLjQIAJQgUQjpbmlJTESA8J/MXLTjkjaauBuzIMgZaswiK61Zsp/bxfvHKzlabSVSxA0A0SbznlwetWj9jwwNiNq8iAHArztemR0SuFoXMQBwznAxAwCWtpo3lfjaxpgSPCbcWw2KgLRGXRDoRICcn0nb+3e30jQV8NKpzeHnv376M79314m/e/eDyy8aOl+f/NfwxoKE+BFlDTV8mwFRApGCL37j6NFPvOeqv6hB//If/vDhDy/MtWF+GrPhUDe3+/lAF1ppCSCFEP6s0yq39pQOCZGcaODlLqbb8pjEABQxTMdLCSxjKys4JYkysjmA5zv+r6AguXIUl0D+R8DJ4UkA7uDU62lUsjqMil+04zX6MXPzRlfP9cmUfCZegLX4R9fsmELkdCpAYjMZ82Pro04YnwIHyUcKFEZERgLt9E4AFCQUkR4WCgoFatDHYksoFBJRSBBSghBCgJRCpBJROi0a0N6LjCAEAUrXtYBEahQNiVmKCJgk5tRLAyKZUBQUVk7W1vcSiYSZvEIT5IUGrRQpO5ka0FguNJHJzE9gHR1ImQubyQrQVCjSSqEyJz8AEkMWRuETNjn13qVSg3jivYhHTHBjMbaRJuQ+AAA/prFqC19jpU/nBDwXABB/scpn9huFC5D2hXdNLu0sdMVCj2TnNGAQhhMQDCesFF4HnPyeIj92r9B5xZPvEptDmoDIhK7bH6Eh4VJpEZHSSmsNlKUimZ5oNuenW7IpEzhycjP/9JeP/5ffuvPYzz7wzOl1RImIKbzRQGtFiAJPnt9Qv3fX0V/Oc7Uj4eqff88tc7Ozcy3sD6k5pFz3BzTUmjQJEk4dDt4mBGbPgTUFAhmjLdlIEwoOIlal88K5J3fMbQXCC27k8mt/rP+9XVvsZNBU4goOU8KxvBOsSuMRYaf/0Ukm69iT2aAYmZaQlee9lEqUlDG27y2v4nqITfrp1jx34PKKM7rPoW1oHRp6QiisXdXxHXe1HCJgXihNPT3sD1EkO4BSopCJEImUmEgUibGRQioQhUBopYjt2STdPZukRK3JQtPuoabrBkq/d1honRdKF4rMAbkiXRRaa6WV0qRJk9beWEpgnhT2EN2aAUzMPAAgCBRCCJRCCiETTIQUwuRMQUQBIAUIFCaDirQeZ0mCIhUm0EVAsMAKryAC5DnRIC9AaRNYobUCpbQuCtLGiK0t7qSV0gUJxETIlABJMAOLcHQeTHBQtDjQmY8ofGMA4w4WIrwqhA8ti48JdlDBvdhAkY7u13gI2wJGJ9lS4WvNSyChQOjSThZ/b/dAHI1TWu+OQlSFJ7D02eDpZRUW7MgNX6z1WH1xA3Rn/54BQbCWAYJJsgNagy4UKplIOTUhm/OzWZplEo6f21F/cO/pT/3PLxz7m88fWz0LoECIBGqo4Y0G9aqu4TsKWheUyAzRCNsv/MhHrvtrzU77v37oXXtv3TuVoRC6ff6CFuubakcVqDAxgopPhEaCaRVMEYDyn8HWOx5iRRogKCmvFC7WYyTgXqSgE09fER78NJcb3kdiM7rzyk+svqbyEyPBE4HAeBLt6RMiCgEybok8yyYiyhXRUEOhtdLEvq3TlhMBQkiQQphYV4mIQqIQAhAEoBBG/nKJf0yYsok8RtRWKCMCQaDRJL1ShfXY1Ebw1Jq01hqKwp6M2ezvysYIhkh8m+zNqvHCxHR6zV4mIvHnzYTkrDO2jj39K08qS2Bo9Wmf+fgiXyBIRJEaFX9HjItW6l7e44uu74ut2VdqZn6F1cqNeInVUg6f38IaGBAQUWsgXZiM/6lEOT/dbO/Z1UkSKeCF41uDL3zt5G9/9u7j/+jBZ89vICJKmUFRvDGvgTIZ5AUeO72qvvh1+vWJptiFSH/3prfMzSzubou0kXfOL/fFTjfv54qUIDAKkECnJVMwDoVzy8pR41j69J0CusgvbybzbwjJ77LRbV3BcnCrcsSWHoXFyDdO8SoXLSlZzklOeyuZoctSOouYKeycpl04WFFopXMqDF0kbXQ8AQKNzTWVkKSJkGkmZJYK2cikyDIhUimg2RDQTiSKxJFIBIGCESPjTRWc14xXH7r4KHbHoWH3BGDSHQKiMMtKIggJ1gBs6pNVNAkRQANoItCuPUWgC4JhTpDnmvKCSClNqjAGiVxpnRek8sJmZNXGTcjpncaDy9gMhEBMhJAoHAmxqRpKpNl/Cie2WMU5lLOsxBN/4dV5o8MKr9O70uUVER0KjNxTQWnn8AqW3PjylxIpLntrOMtFbCwb2eZFEQK/nhGAbM4iEy6oQSuNOpFCzk9nncXdzbTTQDh6Zqv4wjdOf+lzXzv1jx986sJZovwN5+FVQw0OEqwXdw3fYSjUkFw83K7ZzhM9yv5kruG//vD7F981M5OAytPGYKDz/pBypUFLQUJ4a7pV77gLKPn/WHACgynBDpoiZuSt4OjUTK5esfb5X96Nv2yPjs9bg3nCneI7pk9euw/u1bYCOpe8II4BcCN2kJ35KUBZ+Ivi3sqxCqxwNG3l9ywLunsx0iphOTWZrxJOtMFLmnasXGxhsXlgMiM704EWIAQCkksQZDMd2yRYYJ35EYFAgUBQqFwCIAAF/sRcGBFRoDtW0U4/NrURUBOR0kSgXdyC+Rg8VpZcbK1zc/Yuy36iwLnyI1Jw98Sg8iOPo7CrDGMJ0M+Xmx2X1ZlLc0HPJ6isUAqrJqy9sL6jzxV91/jDl8NSQthKvB9KJ6ZG67Px874JroRgPBb+vnwVFR9ZNEPjPAci60Y4oQWHk5kH9GI8uqbsJ0Kj7Jjr/kBlIpGTnaS5MNtK2q0EXjq1Vfze3cf/22994aWfeei5s+sujOmNqvw7MEYAxGNnNoa/85Uj/26rOzzzo+qaf33Hbbt2zc9mmA+KplKF6vZpUGhSKRJIIGltK+iy0hP7Tmj9oIMPDABfgz4JY1jE9g2wD8/2if+LfP1o0ZTijb2/C/EWRilGbu1aomFXo1tP6PwaLFpRYkqMm3PeVZHvP/rVx62KYawAIZmtfx4KeFNDGXVXhc1VzNdcsdKT0gEr8n0NCAIJtUTJZhkAEJQGrYagh0qr7lCj6ClhFGNEKY1NVkhAKYRIUIAQAoW9tVWipYuGbIDNX+CppSORNkCefQ/73hlMgUALANIISqFx6rKb3fIM77lFitw1tlopsmEPZO5+N2E/xpvLeh74KC1hkrMC+kd+Cfv1aL8kJ3vkBgcm9YJL1Mc5PDu5N09djpcSiXbjQb42+LpwfbGFgaxd4jzHexkAe8npf2m9IMeZrR30n4AJKjFeFdGD7RuAWBoIhJtRf4rouJ9XZOEh3CnO7EfjC+P2rWnTDFJr9Mr/VCdp7plL04kJCUtLXfrifWe+9OufO/rjT7+8fJYoB6zPSGt4A0OCly5TQw2vOhBpSpIUl9e68PmvPvPMj/7AzT8928Zffe/b566Zm2mgRjGxvDLsbe2oHmlNaWJZrkB02lqQHS9PDh+31i9Wm6utl1Mz4qclAZYYzjzRc1nRcbxvNF5XuGMrWtSVQZV5j+jAKd1BEqi0wOISKo0hOHEKQAgvAUCQdK2Gb2IQ0LF946JpZspIcT4LAtMKEbzvIxGABg1ozuadG7L1GrUCHXk3fRTo0ZGAEpxOA+bSQa+m8u8cCU6X+FZjX4c5jBQfdxI2qnilwdEf/eLruVr78lcbVzOuFEpYlf4sj6SszJgfF1nkaIVsLlAzWVkrezhYkEoFyvmZrLN7oZk2Wgm8fHpbffG+01/67NeO/dzDz5uTfyEzUG9w5d8BEREKgS+eXOsPC/qNRlPOScR/eMsNs/O75zORpDhx/sJAbPeKfqFBE2qUEo1up22Ilr0BxjQY2i4rBKEAf3NxAjayjYtV8c3HxqZyK9WnXomAkR4ACPHR7yURGYHX2J8X+zX6WWUc5a3plUJvlDCclG18gQBojuwBCAVZ7TNWzoG0jZhSBWmnQDtd0BhyDPWXiMK7yQsTUmD3oTfWmreW9nHLnlOakaV20zaOhzRoJDAGPCSl0dz34qMHNBAQBbtp8Pyx+RGMRyKY8Ro+hIgCEhQm1MywEbZmWDx5yOVgMQ1ziH4O/JTbJHj8g/E16Txm2LjjjxnMUSPBer+NhYihXD6dv+QqxvEk2Lc9trMyVyr7sYURoy9xaTC3FjkjllkGJn0PUipRzk5n7T0LjXSiLeHY2R197wNnH/zcPSd/5htPnD+rdX3yX8MbHxLEy9pLNdTwqkNR5NYTQOKeXdPfSKT48b7Wv/R979711vmFJmoNrWE+UMOhzpUmjRJMrnXHQF1qYwBD6CMLNGO7zhIOyEI8CSJG45l7WbhzHgTBluyEUlePn7FQMO97nm6EhBDfyS3oBACCgNWHSi6DSuK1CMfQn38WKeR2rE7msMdTlU3PEihi+Am8ca7Uxm6rXvSxJ2MBu3BYzuaejddPHfdUYN/LCWp+bpggYL8gEgAJV8ofeRD4uEh3joXaYWJFP3KHlDZ3trW9IHoUYkE6TtflcAgnflgq6T4mT2KG/vuGb2TruSmJTmP4rLsVg2GYwPuGaOY95qVvZwRYi+cYYbGcPC10Fwtipo0QI03MSBFOIZnWwLAka+lyrrFuXuKVyBvC6J8wRIr/DQeL4Dw6XJNoBWwX9Axg3P6JgBKJcqItmgtzMp2YEHD8/I7+zFdP/+5vf/HIT3zt0ZNL7uT/zaL8OyBtPAFOnN0qfv/uk7+ytaVP/OgnrvrFD7594eCu2QaqAlpASN2+GmqttXORdnvA0h1CtlLCRwnnvd5LiJ/suSJc7fH/BI2CfDlP2m03ga56AxrZ557O8MGyLlkfbtX71W/XrAlvAuPFMmIvGSIS3Oo5rTSDwlLSP6h451Scv71eWGI09h9OTv2U8t8EPv+CI0N+L7qv4feY522IoRr/fIjo7rJHqQmMz7zmBT2eNveDywPD58mE+oVREphELQguFarnCRgMAIZ2aCBBqAk0KdTazBE5bk5AINDFDrqj+zAyNJ/AMYCIxKOr4hIE+WlmKXn9kkIEj3ugtp5X2R3gnWOc5cAzSPMlyH+oANH69nsl+uxeFjG3yKDdSnG5mIayPrzHl+sjJPyJ7c5c3qCoibAvMKw5vpRL5NvJVeS9alx/rJL78kS+huN9Ie9B8ORhnpmOlZv5IndggJQmKCc7srk4l6WTUxmcXurS7999+gu//YUjP/70S0tntc4BebRiDTW8QaH2b6nhuwom63CC55Y34X/8/hN3/dkfufVnplril99zy8L+ubkmgpATq2uDwdZO3qNCFzJBiQKEVelMG7ativhV0ReoVCpW7ww+8atyjRL24wbla3FdJRYLgPPSKt407qcXyC7SwCuBSKW7sqrO65WJb+UC1T6iWTeMXpsjJhwl/jBlEr17oJFWnPIfZlxDECGMAG7eCTBrJygm3rji9AHgKqn7b1nQAf4mGt3ImcPqDGB1Oi4DYpG52tvYncBK0CVKxODKuSTjo/cDU/ReEZRarW7Li5W2D+MdMmJmCABMwLN94jOga9RZlmTzM0l7YSZJmk2Eo2e21J33n7v79+8+9je/8fi5ZUSBb+YTISIiITN86cRGf2dbf7qRwkSK+C/eftP8/sXZhmhmcmJpZdDf6g77OqdCS/CnvcZga5MDEtp7LL2Bhme3hOqXq35N55TP30YnhGM3IpgNwJS8kfvyojBmcSJ4Ixhexj4c1UTUVlS7RA1HjC8yKo7FctTOqZYcwwmIv+VKmrA0FQWiT/EWiCOLKgqWDqbieaVak3dDsNtV+x7RJUklJGJu984XH8FEfZG0yWH5SBDQnuMDt4RYld4+DqEqQE43D8Mmx+Wssu/tNuQ5srcOBTPBKDDczbnyx8CVazZLblHT6K9akinC+o6K8W+PbkQXX6LsfZnzjCt+sfflcqNxY7YJtkurOT7LyFP0N7IvYk7+kbQClUiUc9Npe/dCI5loJ3B6qUt33n/uwU/fdewn737ozFmAHIRIQKn6ur8a3viQ1Ku8hu82aF1YT4AED+2b/kKG8JN5gT//Pe/afXjXYgtRQnNQqKLfV0OlSSfortYhe/OvEyMsC/eWcgdOLAm5qVwMdnAmsHWcQBCYrXVjtedT/IQTmNYIvqLt20lkQVR1co07NQrYQWRlj/KXRyOhiMn6UwAnD1EsefBTfN8W81Bw7RBL4B7OMMoCblXw4xXCLQLstBsB7FVrDCEMc+F6sWdL4I+1Y8ZelXucpGUeutEZ0RuB3DVwti+MWrSlKZw4ONRjuZoLSMF7wX2ZIH5SECYh6KFBeCuJ8m5+iCsvobV4ziNsAKMp5+JpXDZeOXzyAvbEHSacxBsaL7UfhE/+faM5iMbrxhqkNh4aEbtzMnXJdx2rMSE3QBCMKSoHfg+49RwH0Lp20EcQEwCYLF+gk1SkUxNJc3GhmXRaCMdOb6lPf/X07/7Ol0/81N0PHz+DKBGwPhHSakiIKZ5d3YYvfOPkp7a3izP9fvEfP/TuxWvnZzIgRQ2ttN7u5r2igAJTSIUEDLkePPFFuwrB3WPnlRxTEoA9C0szUD9kzw0NIb9lwZER+5xtFxfUDcBonisHEC8pU43vzZCp3ONDWFrPzIfM01JkzyneDHYvlsFPB/F9j4HW+0AoYOueDz1wJSR+Xu37Rz7eyL09xsNtOevlYD8h0wx9a4bWoT/EBmIFwXqHRZNrnouIXIbjaxiBkwARRYwHtRvCjSmhg+DMhQ4jNsHAFHE3UlsSjRnZfSIzbZ6mBOcLxx+iSQv+I2FNgD39t3PmF3Uss4Q1HOgkjOiDItrH/rFTThULAzrMrdxjV0nE1+IHrqzj0YyLsT1Vot/RZgM/pzDyi1q+WVn/jte46mxSIPDQkSZn9856WpJGKBRop/xPtGVjYa6ZTEylsHyhD5//2pmv/+YXjv75h58+dwQgBwBZK/81vGmg9gCo4TUBzhPgxJkNded98HsoMcky8W9vv3luz/R0AkTNztraMNnaKQZKmWzEIrodoHo6V9JlmFJ4ZYBXWslmxOO1uFDGNH1bHOKCTNCt1ioN8wqHU9GlRzZ0hfxvhKBRhercR66tsd9uhEc8G+O7Zmqol6PQywmsLRfECUzI8tnunJTPWoh6ihYTAHMlreIVlAqHQrm1K4PR8Vph5i42U3HJK8EiKN7j8Ypn/1uDsmGgOvWxnMlUjICN3UcBZ7QBxwBakS6INAFC1pSN+ZlGa36mmSQpwpHT28Wd3zj7lU9/5fjf+Noj588iCpvtv18LhQBAlJMQDXz51EZ/c6P4aiuDv5Wm8Au33bhwcLKTocBWa3lNis1ePlBaa1WYZG9OhyG2UDHW1Mf1GP2Kl8IIQyVwpS6u5xSZyrNXBFRelpeEyy5fmYqYajh7aQkdwhJ5qCrbzPiAI0tVwdSj8mbEyuRZZ2yKooBKfZT7NmvAEVCbmCVmekBM2cWSsmg5emzwN4leo0EglC07VPk9mjpWnntrjD1ldjQJPccPfUdzFialvAlCkTF7ILphtfy94jolPf3iJL7kDRMjjSUmWl2/YQmwN7zQmKV1qfVf3aFY6pxYiZjzue+CiKgV6EKRUgpUIqScnUrau+ezrNNO4PRSn+558NwTn/7KsZ/4/NdfetEk/KlP/mt4c0FykXQiNdTwHQXjCZDgifOb9OVvnvz0cFhsb24e+Jcffs/i23bvamIjFU11rkfdrh4UipSUIJOQNK56juKYs/MeBMswiAIfiQLdmG3ahYf7TEQxX6jw4xgLo3dGwqaLSnO6JhdmYom1bA/wgg6VWaMTKCB6zuP5gUrYl387bF2CJyvCeAUrZHPy4zD/KwmlcfO+XIh39Aj5uHuM5h5DosCgtUfPfc5knzW+zPydSoDutihy7pYATjBwWFKQKyLFkiK5wzddJZO2jdhIwZV07rnghEX+3cIo4zaw1FIYn/sdvklJWjbjLA8KAJzTdZS5nPfL1ypB6VSSZ64O8+R/lxeslxbjCxO8jY55k8SCpVs8FM1ZkEBD3o1YTiXgp3/k4/yZl4ejAURQaFKFRt1oyGxmOmvt3d1KskTAi8c3hp/+6sn//vt3H/979z5y8kzI9l8r/xy0HhBigstbW/ClB099fqM3+PM/vDH85997+97bd893hEhkE9dArG/1u8WQcpRSSgnSJPG09y+EXCTBRcd91+jqEarorGXdIixVp7RUd5U7Uy6RWl853llhVcbbPlRGMmMgS1N8X2y9ElvnZcXKYeb6Nfofhhesy2jfu3fl026kkAMHoGIEIUdYK+MKCm0oyAg2e8y3oqkTt+Jy7pV11FEcdKzU6daB/eHQLn8XYMU4G3dH8tU0cjHOpSw6nrZwDhvnWSH+6cI7Yt/Fuzzw7P6sl+jzol3vCN57qeLnTr4PFswfViyyvv1EQASB3seygpvZyLbAKyIrR768f+fnnLwPmWXvFO9H1nfIL1DpJMKVC1U2kj/U8J6cfgqisTOHD1SadK5JS0ScaIvG4nwzm55J4ezyDn3u3tN3/86dx//Kw8+ce8EkKRW18l/Dmw5qD4AaXlNAVJDAFI+eWh/2tvLPF8NiJ0vEf7rjnYvXzk1mQBpaK2uFXN/Me1prrR0nc9qdVfaA/ROzeyi9G4GD57xMNr2SQYw8Ey51egUNXlRwuox24iJYapBGlnr1IFYko8deYHGCQRDxuSxTncnyjIwtH/ISXJb0OR4uZ3ZGyF9ju/z2zPYITYn9QaNfml/owhyqmMXi+xVM3piiV7yfxsJFN3E43bKytipIaZNoApqtpLEw1+wszKRCIMALxzeGX/j6qd/91J3HfuaBp5ZWw8n/myvh3+WCodMSj5zZ6r98euPLf+Lj1/8kgPjF979j7zsW5lpyz65mlqQkNjaGveGQ8iKHXCSUSOkoDlurl6BBZQpyqa1cVTdHlb/Ybh1Vo9xeUGbG7ZhQq1TicrbSuFU37vkroGmXB2yeOC3lVpny54uMCWOavMhvR4a4osu7ZxqjS8EbdzQCXZY+7hJQXhdjvjATMTiZHUXny9LHpT6/N3r4efX++uPR51ZYxlMvSmhHMdiyEeKiJBZLv/k3unS3l1zi3JI0pvCox5qASAMpAkoSIWcn0vbifCOb7Eg4u9ynux5YevR3v3zsr37u3pefRxQoMAGlhzWdr+FNB/U1gDW85kCTuR3g3EYX7n3k3H0FyT+7NYBf+vh799y2Z74JWTrMtFa0uU39vNCFQMAkgSTiPlZQsHZurw2E6ESKr+Pxxmdfwxm0oxLeol5SrmLeTMDSXPnq4XTZGAhM9zzjtW2b8W7TabCyRy2603xbNeRJtjgwhY6HSsZck1npSwp5zM1jgcILKfZZRUinMFs+pJM3QAxx17+NqdUlOcfn+mWSER8GP+0JwoOPzzeHAtpGr9sTitBrSb31Ryq8D4yEEQwTHsmjARdej2FGJfnKTwVGXfhzyNKcEZ90fpoetRnEq9hTwK0VEw/s1ytfkqz56losOVtbFwu/ltk8uI0DfH+F6fBz4U/lS0eGfgR+XKV2IjzNj8ibJmxz/0QT0bBQBRBRq5005+azzp5dDZGBhmdeWu196q6T//4L9538hfufPLNiTv6TWvm/BGhShCgREXHfQueh7YH+cxtd9a8+8t59H7t6fyfd18QkSbCzdGGw3e/pfgIIAjFFvlyIgJ9c2++KfvdFG4xK39ytPKaBjjG+VpJfWm9zZKfN8T9uH7tFVFZbwilkuJ8Ag+IW0d6o6REJzRxPic0FGBfyFT3vKiu0PDtgVJnPGsTPSl4HznvI7UkCcDlVEaOxIXAXLj7+MO54bkPeAJ//3fZZovfIyrt4dQRACOn9XA+iNBwe9uPoGh9zxDN5a6XpCMgEcuu8oMKpOcZTTIGWh7YQWBLMaD7CXJWIpGuSyRhovNpj3BjfLae08OOJGDT3nosHGMsmvJ2oITMecgl0wfIBZHOObC4xaoP/xNLvGCe7NvwGC/XdCi97nSEBWX8BKBQpDUhSCjnVThv7FlvZ1LSEpeUefO5r577+2186/uMPPnX+BTOholb+a3jTQm0AqOE1CSYnQANPLnXVic8/c9+PfPzGH08F/OePvGv3zfPTGezZ1WwkSS7W1ofdQimlNGgEQiHKmYYMOFXP52hmgl5JNHSyk5e2yor3eBgdk8rfV/+6vHbBITOyNSYnjxx7SfDD8lv2b6X+uOdVHEbDmIpBAsTKtyCrrKN3ooVQYoQQa5+VPMPjDxn8dMGKsyVkbE8lfaA8gouNN/66l/gQNLbUtw5jEMbKS/aufII0bh1cycL1khrGeHhhuYQjlf69FC7jfjNBUROQUlprBVoIEq1mku1aaHVmZ5pImuC5o2v9P7j3+H/71J3H/skTL66Yk3/RgELVbv+XA0SKUGR49kJXnb7n5We+/wPX/DSB/jcffs++jx7Y18lmZltCIU5sruUy70OuC1IgCE3m+HI8UrzGuPH1lcgpZg2M3mWjQx9HlR1BEEa2OAIcqR23XCkqOposj8KhREdGN15q40pWc2CUMbMgcD7jDl0qVwMAoLLmR6X3l+p+RCjEqCEjAo5r0+rcjhYwxnzJ3i/xvFrf1yDkUWzA1WIPxBbzRSaEYhrILPs4okB4Hun7F4GRLILGFOAFR1kZyu1cBoySqcq/q1mdRoOrpzVorbXWBJSkmMxOZ+3dM82k007g3IUu3PXg+Sd++86jf+lz9774PKJAwBSoVv5reBND8m0SQWuo4VsGE2uaIWKCiwudh4u8+LGtrcEvfuID+z501d4JkWVJqrVubW4p4wlAKBCFdHzSMUPHuXzmeZeVlrw5AEJRZw4I4kzM85z92ks1aB+TaRswZOLh7gMhptDJVdXs7yWG6h9TGEalVQgnx/7GgarSVRY2HQP2p04V6QriPyIrfciyFCnXVqkjEyDr63GPUITY88EJSj47O/pmWX4+KP8RfdsgjQakvMSknU3BlYznm/xs8GEyY4EXRi1idmyVaXJjB4TSUUYQdhDCrRNhACxpdIyfv6LQzZ+t45xLwtJm35ALaT4GOTzz0+tP+OxU+2Vt8HfoVQ1aGHDi35vNBUfBj50LvnzyIn2FPL4IEAnK7iMirw9xfbITgnZTECForakYqlwg4cRU1llYaDZ3z3dQDwmeeHZ18zNfPf5vvnT/sf/2+AvLK4iIEpNa+b9CID0kxAQREeenWy/mRfHT61v5z3zoXQf/2A3XTs4s7m6Lieaws7qc97c2h91CkSYAAAFCimDj8944bjsEB66YIFQoZrzf2E4ETwd9N2xPQNh75QSxVF5jngxGjMU3TW5TR2s6xtLfd+56ZHSRVyS3uezL2DiHbPQQ4UJsPMgoLEbzVcLB71ZiBMUj4YbBjLSeuFpW6LRNAhGOoTnCjAaU+VuJtpanzfFJPx2BmYTonsBn+L+exrK4ppiPO5rMv03MSx1uPqY/olWhRZ/TxxKfiJea+UHXUkSMXUu+q5jhed5qG/M3yLg6GCSI8q0AEU32ayhgHdY/RXR55K0QyPLz2H75J6ryz9L3Lsktpa8dapWs77wELxmG4uQHAQQASpHWBDpJMZ2aTFr7djeSTjuFk2d39OfuPf2V3/vq8Z9+8Knzz7mT/1r5r+HNDvU1gDW8poFoSEKmuLSyBZ/56sZTn7jj6j+fpOLXPva+fe/bM9/C3buaWZaiXFsfdoe5KlRBChEQJQoxqr2y8uyfx+CfY1BgeCujWo5rXmJcXgIZ0xyMUaQi5Mrdx9IXP0kJbqqvIsQyc0mVHgdcUIn9Dfm1R+UUiqYAOVk5FGSibFzaSjPkAwii3mORJXy7eHVUMI6w9Vp9ZXxcohrRCBNSR67BcR8qmly8jKXGFBo3u1SqxxfZxfos74NKnVFaOY4s4vWMS6x/K3uWAwkuCm5ONVmBUINOU5FOtEVzYXezOTmVQW9QwEsvbG79wT0nf+m3v3z8nz13YqWPKDARCeR1IqhXBCYnQANXNwbwlftPvPCemw/87PYOnB4Ue//q226c3DU5lYAAbEok3OoNh3mhC6VRA4BwS6GS184pApW7yi4TpxGVyk1c/G2EzCWLBLp7ibJj24g3Y4m8xiUvZ0oua75GFCpv5RK9QABvjKz6z4X61esNyyogV6MvhhIa/RfLppLxwG0GEX5edy51EuveFbI9nkyypxcjyc6jgmvOPO5qRLuV+an+cflw2eJJicCP4FuvvNPLQyKW0dh+GMUICEBr0pqMJaORyWxmKm3NzaRJmiCcOrdFX77/3P2/+YVjf+Huh8+dLNQAQEggVdR0voY3PSQXSStSQw2vCdDK5AQwib3p6Pd/8PCPb+4U//yTHzz4A9cemExazUwK3GmvrvW7vX4x1AiQCpmCQH6IboAzeuK/7Y9RQYD+v86aT97E7hT5wPvjkwRTJrwi95JC2bKox3El4Ip8VSwJdnoqCYXkT9xDW1ypHcHgoxaD8SCCiqsAAAAimRTQpTJszGHwpvVS9u1y0yOFPIw+hjn1YIGkri2kEWPz2YMx/GRGGNdwPHr+XciPgQux1Wz5YWH5b+3L+VsI3CwYQbWEL5Zw4+2HgpEhZbRw5pqw8x43N1pLKXdduZWrAqEkedy56MZMM5X4U2YC4dI6w4OiKXZCc0DQ9OmO2Cgo/5p0ketcJpjMzDQ7u3c108mJFNY2BvDYM2tn77z3zD/76kOn//tzx1b7GggSmUFex/x/S6BpQAIbiCiQSK+/48b9/3q7v3N2fWfPz77zbXPX7JnvYKspGhcuULKyOtgZFLrQhFoiCilRBiIaa6AsXYV94oCv+xLxsGuqvI6B14Xq+i5731RCoF0tTzfIs4WyfhZlLPedIFRvrOV7MWIcMb1xtKN8FF1mJ/ZPvxdxFNm2FMil0WP5WPy43Phdvg8gMN5BAogjN4Y4eI8Hctf18ecjSFbEi8NndDfruC82itbxtWFQLeXUd1kl/DyU6BoGQzH592zOR/DDioGjlPfHz5F2yezL/HHExHEmXhFeHCYEkWJc/ghussnVHU353Q8/ryMKee8WXiK4CUDMp0pyTnloUBp3Sc7x4oPblRh+u0+DgAACfOoPTUBFoQsCgGYzacxNp609u1qyIRFePLk5/IOvn/rM579+6h/fef/xE4gpAgig2shbQw0AAJBcTLSroYbXChBpkiJxwuUzH7j94F8RQvzKJz9w8BP7F9tybrohBVJnZZ1Eb6hyrUgDgUnyCkGYMO5sUFLkIq5u/ylzPQPsUL0sOQIAep7oHsbqIZQtA6wu/6PKknk75euCiJVyopVhqOP53OXv+lg5pUgwsgI0VXuKnHS9zsbwRghcnMonQ5dC+nKwd4p3+DlC1WU9ju67/EWcmzmfAz8QprWWmo17ZfJTLPKH+eASYPV6pNFQWbIjXEmpVJYLwCUs2Te6OFRn7mJ1Rn0QdOgG7QbZNDC0yPjBWrGcItQ1EGgNmrQRFJsN2eh0ksb8fCvNmiksrQ7g0SeWjnzunpN///NfP/ubJ5c2lQYNiWxAXl/196qAJmNEQUyRKN+87tDM/1jf6p7f6eX/8I7bF2/bP98SC3MNiYCdje1i0B2ooVagAU3+FowWXKykh8VQ+jf4O7PaFY03glE37o0uGDdz0ZVdMdRerIdRLfENjGG7lxTNSgASy+xa9oSq9lLmKjwoICi85X3HKVXF22qEQh9CJco9lxXkS9AYRwZLtMhfc4gjUGUjGTUDnB5WuiuJA3zcyJhJlGrQzZkr7xuh8j8Mo0rwYUVNj6QAAmM1HzdVJeJfTUpcKs7WP0X1GJIjSPq4ywb4szATbqTl9Rv/5ctj+INsvXLyWV+EALRGTZoIJcpmQ6Tz043WzEQqgAQcPbWdf+m+M5/99c8d+av3P3X2vAlRaoDWOzWdr6EGC/U1gDW8bkDpglAmzhPgzEffd9Vf29oe/uzH3rPvj9909eTknsW2yJqyc2Gl39/cKrpFQVpkmElpfAF8FoBIBx+n/DmOOEKEQlsvEpZcO1wEidmhqUJjBALWZfwTuDIYK/njDAZcUAlx9q5fZMOqHJY7nH0MYNxHJRMxx9EPl+NrX7HBRlmzgctLJdHICyklHFxtK32aqqFFb6QoqdfVMIH4r6hPcphEmMbF2DAJIDqId++jdAB8DsoLEdwchTUTDoyQCabkZ8RlYw7fzLbD40b57PGx+WxVTk6O+2TKlf0nVk6CTSIsKpOdnEvkccSx/yJOs+eT6Iu4GH72DQLiBgDdJQ8kkBAEoSagXJFSBSrUQBMt0dw1n7WnpzOhQcCRY1v9h59ceujuB079028+ee7rR89uKwACsuHoNby6QPYmF0DcKgr6/GZXn76wNvz733P7no/fcvV0+8CBppzYGLbPLvXE9k7RLwpdCEkiTUQSxSQTANnFh4joblg33w7AUQP0qcidV01J/yO+Ryg8H0V0KTzA2GAbEUGy7x0ZCLSUNeZoPoT1PNJOcBHa5MdMnO9AbCeMTnxZI6X8HOT3Vdi3gQOyHDKOnjKi5ZSyeIxurpkR12uGtgbzpsCIKMa0p5Il3+FSYic+R4nHlXPF0eCnacRzT5No1DfgAWSB9pp/WZ8s30rIYYJ+rs0/GNXnnoFlnCJACF5OjtaWb28YM+Kw1sh1ieHmGLYnqFyb8z2orCOOXFleCazKLTCOK/tynHf6tq2Hibmiye93gpBBgwhIEZJSWqFAMT2ZthZmGo25iQYMegU89fzaxpcfPPMbX/zGiX9mlH9EFBloVSv/NdTAIbnEoVINNbymgFRBQmbOE+CFW2/Y/TP9ncEZUgd+8sbr52YmpzIgEE2iHvR6akAEpBRpNABldZKMW5m/PCpybQSA8lEpWSHMH4QTllmlbzs8LnNYLBWP61Z17DKXj9sLwl2c9Il43YsBV0z57LjmRhaOn1UjJyLBufKMJWgKIyj95A3QiPf+6qIyXiO17goyIzqi0l+8zAhFIbTPUmaVBFEXc8+Fc1fAzm9JB4+v+7sYXOp9ZBeIC4dZqIp08fvR33scEnwGY5UhPK/GDZeVFvuP33PCeAeQDhuTzbgmooKItEYSQopOS2TzM1lrZjYTuSI4cnxj5+5vnvudL99/6p899OzSsyubfQAQQFTHgX47gUgTYoanzvWGx06/+NAdb7/qx7c2i38AGv/CW6+b6UxPNUApaCZyKLZ28n6hSGlFGhBQsmxzQXkCRk/dD1ssojeVlVVda2NKlE/Xw3Yvl3PPMXrLK8Xmr3H98z02htZcBpTJEoCbhrKxMJQrj3B8w04NCzW4acJWd5vaM7foqrmoECt6kT6DEXqE8snI4yjnpfLVou4VZ+detQQAHsGGHjmqxp1HOntsmYgNBQDlzxobV8fk5BmhjHMLRyVEz5coySm8w4tROXJzUWHgI3kHP9OofhXOVcqd8huSSnzWRYh4+UOAvbKXALQfuzb/0W4dJ6lM260knZttNCY7KfT6Gp57aWP1D75+6v/6nXuO/4vHXzi7gyhQiAyUqsO7aqihDEmZd9VQw2sdtBqSTDKr0ouNRkK/stPPz390M/+Z225cODQ/18JGK2murvSTtdV+dzDUQylRykQkQqBhjBqCAgaO6Tvln0oCTYAo2y6BV7btz6q1m2jkiQ8CuxfYZlIui4HIT1/LNgOm+4bMeE6w4JpUKRu25erkhSunoBKBPasxhwTEURhvB2BCJrDxV5TOUbo2P+rDuDivHgsTVbGpIrowwSc+ZeFOiU47dp2UxOFxwlNZgvRl7HIp30I51rWev6wKS7GKYeeUSfAjLDMBeyaXlpwDoq5csWh2/VqNMYxl+dLp1ajP7IT4UVgSezViq1GllptbuzRNDUIk1ESUF6SUApUgipmppL24t9mcnkpgdbOAR55eO/e1B8/+p/sePP3LT7x04eTKVh8AEIjqONDvBBANbV6AFInyC++9Zd8/XVkfPv2RO/b97fffvHD1rrkmtDtZtrzSl+vrw36vl/eBFGECiRTCpHIlQMXOu0tRAuSUTu9ZAuWdVb7tQ/g1ZvaHVdXZWuQ3uUTj4Y2bguEFX9ehcMDJF+Pqd5XwVZSxyPgxQm3EUe0F36/yBo92JaNd8cYcDdyeWSLLbOvzuQ7tlflb2d3efw/3MaJ5HNVCeIqlN+NuLyGoFHTom3B35ypn58J6S0WG2tHMagTPs8bhkNyyNK+OH5ee2+HbF1QhwmF2KbJ7hQnkGJVmh5jpHeOqo1AsDS7qLJzRV5AotcXWA1Ise/AUMWT3KWkSIMyBRkibA1qDVooUEFGzIRuzs4327ExDNhoJXFjp6yefXT129wOnf/6eR878j6deXulaT9GaztdQwxioQwBqeF2CKoYkRQs1DeDBZ5ZPXL1v9j+sbebHtnvqn7/n9sW3Lcw3cXaukahcNbe2AXNzuqQQUGKJ8TlH71hItDBKDzTyQdBaInmQSRbERTn0ilhFqeLIANNJyy/CqQTFKjmWyjs1PjzlDN8n1QHgh2VV6QQ5D69IY2N+jwDP57GMSNxrSPPEf3KFGczXqpbzIhlGb1gHzjeC9T9iFLEgOWJsfN7KAhSGfsqJy3jjVk6ryNHV2N7QabjNCv3/o+vCoPSJXPw/su9IwIxOpT6r6yHCP8zdCIsxgjdO8HlzDpxlW4rDqdx3WP/sActjINCketRkhEhFpDUBaY26IWUy3U6bu+bSZmdSwnpvCPc/vXL697985u987cGzv/H0S2cGJh1IUiv/32FweQEEpqgpPw8A/+GPf/LGp9Rg+CsfvH3PjTMzLZibyaQAaK2BhkFPD0hprYlAIEmjnpUv2AwGTyBziSU5wobkU4KyVK0wSlWs6CjolNyKOufpL/vBN2+J/trWOb3DytvLgrAD4uYxelxVJAHAhU9guAWkRBXJzmDZ0G3/Wx2Te1rS3CvlWHl2r+O4MhFpK899iS9GSrH96dnxuMmt0Lf4O6L7s+I5wDkPb7gSox9qeA3eabrxuMnXH4ezN0i5nH/VNVNJkDJ6NUVhFTYOssSMLw/YMEsmpLBWIiQ509H2eYW52N1hJkgTEIAOXB4RCQlIA5EmIg1aChSNTKTTE2lzfjqVMkU4u9RV9z+29PiX7jv19+95+OyXjpy+UCAmtfJfQw2XgOSKiEANNbyGQOmeYSAoEACLux+iO3uD4q+ubA3+wbtv3f3+6w5MtA/sa2ebW3m6vNrvd7vFIM8pRwEiEShQYLDrk49QtLxrzBV14JRNL1F4nhg95wHh0VEHloQd9sz3Vc29bqQ4JlBweW+07BeET68oOvWsJMCZSQztxl2PhEoSoXHCyAjcxqEbCsT4VU67PZrIFGMA8lc5hIJ8qglgxMyOlsorM+SEmhFxosSFOT5INxRfHl1pJuYG7GLkR30j+w+Nwo1BReEOiFQUG9YmABueX2rIMGftWuNWyeEl+lRhzkPFKAbYvvSRK/7UL/72BEDBlQGBCKlQpHKlC4Egmo002z3dbO9aaMks1fDy6S319SfOP/6Vb5z9R/c/uvLFIyc2h4gSpUigUPXdz98t0C4vABDsXZj4JlD+V1bWen/vvbcufvDw/sn2nt0N0W5jZ3VFpJsbg508p1yQJilQyAQMvQY0+1wDWEJtFkjpKg0Xe+2vqceYhpfDccqkj+uiQWFjPXANmu1cvhXLaq5XHSl+Nz6zW6mmp3UjeiGDSjmcqFTYlw+eX3GxsFej6RwJIyhU6W08iohfXazpS+xQNw0+lB3izzmyLeftR4G9lFnoSBSqnzXCIdJzGU+3awZxVGVfgmPAnPttnzHfYq0CcLeCwA+Rt+ZwRPC0s/zBKHRSDszy+wbYvnFjYzw3hng2/egqk+wnFb0RmwAQRJgJ6+ulCUkVqqBCqVQIOdlJm7t3NVtTkyn0CgXPHlnfuf/xpa/e89DZf/LQU0uPHDuzqeqT/xpquDyoPQBqeN2DiTVN8Pi5reHmTn7vuZXeX1q+0Ptr33fH3j/7tutnZmZmUtSkm0IA9nbUMFe6UIgogHzaaQKIk8dZrs6vwDHMjHGxkGyf3bjHJC+meNkalte5PmyrVvr0CW+YpOgYu+0nIMN6CsJIlJopMG4CJnXGzDxSOJmAMO6kuJy/qYwLF1JKj6xUgUyopjDVFXAn3FwAia8/Cs1zxJ2TY8nX1b3GuNaYjFzAJ8g1xx+g84WNW/PjCRi5BxjGSk5tKKsGrjHuRcDXD/9a5fzIJdSjxFxBBgwtxuKdS6pXEYxL8xZO+nnf3PEYmFBMUcnI+ED+/2wm4wVu822QT7qmgbQmKgi10qhRSNFqiGxhptFemG1I0RBw/Ny2+uK9pz//W3ce/RuPP3fhxfWNHqFIkUjVAuFrAAytTvHcSpd+4wsv3fM9t+09eeFC7yc/8r59/9tbrp+ZbXcSQGxlAAjb23m/UEqRNtkdkC1dctYilrTUWGFNABBpCpFRgHE4FZBPbheupLPNeQWotEtYiFBEUtzC51s43hqVx9wjvGz2M48pKl9VoEoaNLNecONxiV9BKFHBD4OyGNTNGGL25kgajCjNrYDEcCjTeZ5V39FZl6CUYVWdtzEcw7wa8Y6qU1kmvSX1N3of5cUtNc+nN07+GHHWUV2OwtP8Y/tE22aZ77s23KkDN15xr0ODtmNgDi8I28I3OsI44Jm0R6REpcM6wcgdzjNg+wvZVDAeGPCJ15RJ5wkakDQRagWaiChJRDLVSpoLM1lzeroBfaXg6SPrm1/82qn/710PnPnFZ15aO7a+2QcAglQ0xs1wDTXUwCCh8ebnGmp43QBRQYgSL2x04a4Hd47eccu+f7q+1X9paW3PT7/r5oVr9u5q4uR01lxb6qUr63m3l+ui0KSShBIpnLqIhITVxD+jAK14VdbCiL+GmLGW/asD8qwyXURSGFO/zLw5wwcXMV3Ci9Xlgh0hjZYHSihEShyXBr2kFIQMr8aPNBYEddkJDrFqCtX54AKDx9uLQ1GhanKjslAZ/zt27qn6OLIZjPxW3DfAPiOG0xgBOsLFfggM1Svgvh85wdNrSqW+g+RVwdejVRWVR2DIcHeeIwBcomcCNfMe8ONF3g4GI0BYIH4nWB8dJAKttS5yVRQadZIl6dRMo7M438zmJjLo9wp49LmVrbsfOP07X/7GiX9x9/0nXzDZnyWSrpX/1xKYGwIyd5vL0Q/cvPgLa9uDo+9d2fv/fNv189cd2jeVThxKs42NQbqy0hv0dvJ+MdQ5SBQiESaEyxkSQw4PtKEA5ifw+104sA1lidhYWgdhrbK8/xEt4CbJ2MPd7gtOXD1Odnfy18TKjdMY/f7lDIrtZ+YWHkbP87NAxc7J56sKyG4BcMMq91dF2X2Tyo0xI2kLRHQu1rGrV+XF6DmLJY4rAZbuuQQR1WnziMfEvMyFgnlg1Jgxflbhc+UalwcRrqU2+TxFIobfDoH+xhwRS5g4Jd49ZWsGDR0Pa2QMA/JNjUqZiNzCa1ofyVrQ8w8CBKVJq4IUAECrKbPZ6ay1e76ZdDIJ59b69MhzKyfveuj0v/vaw2f/5/2Pnz2BmGCd2LWGGq4MkislSjXU8FoFImUFywSJivNX7Z35v0+c33lwZ1D8++97397bZmeaMDfTkEpDi7bz/mCoCtBEGrTRm1AAgLDyAtNggIsicTZl+yDK5+ceW6yqiEZXrnERp6Q4My4fse3KJe6hqzL7rT4cp9yP0nBZ9bLMZt8FITuuODIW0wnc5UR5ZWBJrXgTQbt0h/te2jHvhNMwnQZJvlLFCOFw8MIqG1c00KBMeyQQIiMRcjUAzS/uQuka4gJjELXME2I4RMoAn2P3iGJcggJhW0c/JSGtBfemcFoIO/GvTrL7qr6B8NQqYGTcFCiux4bARhsEyiq/cVPlbunggACAWptBkwaBhFmK6eSkbC3MN7KpqQz6AwVPvLi2/jt3Hf+nn7nn+L979uXzPRMELoF0LRC+FoFoSIhtR6tPXHNg5leOnO7f+5H35j/3kTvw+689NJHNzjUQNDXWBWJ3Jx+Yax7N1V/uSkAism5cnkyTV3+tG7HpbwQSWF32UZw5gN+Ubo+b3cD3d8gg4ym4NYoFm0FpXWN5u4xboowooWtnBF/xalMgSmWbnEvqCvbeQn8y7MfJeQ+O7KaC1hisAydzxccQV37CT2WaMZpW+O5LdH0swmXdnPnXc7pepv+c15TaiXAgKkkGjC+OmydPMCMeyXgmM2hEermtUzECUMkIEA09/hLhKWMaBPY2o3Ba77wKoi/JxubXefll1Bu/ktMZFdi3IrY27ANNQIqASJsrXpuZTGens/b8fEtmnQSWLnThnofPP/nprxz/yW8+ce7+I6fXBogpAjSAqL7mr4YargTqEIAa3lBANCSZtNAwBa36w+J+RP1Tm5uDv/euWxc/+JY9E+09i+2kM5lPrG0M8u2tYX8wpCEJQClBJoKEPe1Bm8fHsTyMMiWVfeQreIRXOKbYxWQs/vxSV3UG1WycU3nZZfsiQNE/rx5g5Y/LBDuRowQwKMlnfs6vtI9XAGPk8Mq8RZp9pUqluXENUblM5UuP6h2hmjAARkh2F2u3gh0vNi6PX0msi8wHI/CM163XdQBQaU1KaaUV6QQlTk422jNzjebkVIaAAk6e3lHPvLh67K4HTv+rrzxw6tefO3KhX8eAvj6AqGv1iBQBoH/k1POPfeKOa356eaP7V++4ffefvO36ub27Zps4NZ02Vlf76fr6oL/dLQbDQg+lFFIKEBIJhVfNA6B1EYhXll2JTquyRGOkBauMa1ntYtsKnbJUIVWXWIJ8UxsWU+rrcuDyyr5Ssh4pt4CVfe7L8XGPoQljG78EVOq/muR9zMSU1eZvBTxlHjsh3PgSzB/2h7UXV6noKGQr36WCywge4XR3ZpMoq/OjuUFp3/mok2Aes2cjJZO+78BEOyAAEZEiolyZG12yVKZTU2l7YbbRmJ1qwLAAeObFtf43Hz13z133n/4nX3/4/L1nVrYBUaKUDSiKHZqa3IWbW8s13a+hhssEnJ6ckuubG+q7jUgNNbzagNhAgAJmpzO4eu/U7k+8/+Bf/MEPHvxrb7thdr7ZEtDdHsLqymC4sZX3cjJuAIkAKQS4OAB3WmJy7qD7H5QMAAjsaNn847HwJ7Lul7eij8o0HTHe8mmEV3ZtH/zUhtCYzW3j7lmYC44Rl0VKIgOTO+LJjHEp3Z7n3/jRc70TIR6ElzJG9+FFJi46MN2Rx/O6hE482ZefWS51OQsBl9pHjLsixboRlcfrvidr3s2AQZvNN7tSjFgdP6fRpCJTBtwclNVn+wX9gDGUh/jax7KGXs3IH/+uruvSODFkE/ddYtRrJGQSOOXAnS+xC7d9gVhNEzZTFwFAobTSSmsphGg3G9n8Qqs1PZ9iQRqOHNvp3/fA0pe/fP+p/9cDT59/7OT5dY2ImMoUhkWd7O/1BIgtFFiA0jkdPjCXvvfWxTt+5MOH/+2H3rl468JiA4f9AjZWB3ptbdjf7quBBgBEwkSAEODjf+xhuVmFGojIRHWB90IxR5sm2t0ZAMIPqBJd9zSYCZw+Ru5vYDY1p9GApQEUGqs4y/DAl4oBgDvxA/CavEfg74i17WhLzJbYSXdp44+xMpdj46s6bPB68ME+/Jq3Ct5QoftUQrqspMZpd6D0bXj6Oua6Xz7K9/NQoqWlRP3l+Yo55DiVuDwr8W/vIui04TLT9R6BnOayRDHmeL48iwF/NgE+p7FdnZ4uE0W1Iw8Rsr3x840oi+SoOOHQTxxohn4chAQ6emf/7/okIAQN7mpARaC1Sf6PE52sOb/QaM5MpkAFwDMvrm999t6T//6z9574Vy+fXl9a3xyAptrlv4YavhWoPQBqeMMC0YCEyHBtow9rG4Mlrej/7g/UyvJ6/6duum762r3zrfTA3olsarJI1zbywcbOsD/MVS4ECHO6FG6TsqwrFlWsnuvvqvUvqopWUGZDoZIYBGXmXmG6Y+SMck75i7U5SgF2osLFoCoAjEGLKaxBLol7CMpyXD+IuyN6jobCapQNDRfB/eLRvlcIF2kGx/5wz8gpIuPLXBZcomIkLY9BuCKz4uVPEYV/nS0iYDRqrkuaPmsAXd8AoAnB5H3WGhCg1ZLN+dlWa3amJbJMwtm1Hj318uq5hx678Jv3P7z8bx56evnoha0dMHfN1yf/r0cg6lEiG47iFt1efi8o9RNrW71/+Pab5+84vKczOTfXFlOTrfbG1rC5tjkYdHv5MC90gQAgJUgpUIAAs8zIBa+Ew0cWeHMFi9zAyD1N48pcou1XvN9d26MbqEbQhLJh210Z0QlNltVPlmSWd1Cqe5HXl4HCaIWbXxPqIj8u93tWuwzGg5HtlL41LzH+S1T5fFz2IgNnBWNsLlKHK+4A40ZyMUzZP1UZBMuTcKk2MeAQapLnE4zWo9KgCmVOLtIU0+lO2pycytKJToYkBJxa7qkXX147/bUHzv7SVx44/asPPruyBKAARR3eVUMN3yrg9NRUsr6xUXy3Eamhhm8XIDYRIAciRYf2ziXvvHH+5u991+Lf/+Dti99/w+GZiTSRsLmR0/Jaf7DZHfaV1koKlIlAgU6htXGmnsG6C5QBSJtE5TY3FeOlXDkFYlfuMKWWvbfYQlnY8oHa/rDFnCH4s1Qs13TXE/BWohlhSrM7fSifysQ48JByMzBn5eetxoYPsu2zC45KeMYjL1/RFw5xSqc5Tmgj99ZIHG7uQ3xrVeCt6Icly00pbZ7/N7pPeRREMbQOS4q+jfso5HWQkrWo1EM5BrbsMTL+bIqLdXEfYe1R/CFKBgAXz0olFwEs4RodtGHUewmrks6PEE6Z2GXkQAiaSKucCiKiZkM2Zmez9p7dbZm0Ezh/foe+9M0zD3z+3pM/+/hzK489f2Rl03j6CCDq1QLh6xxS2cRC5wBAsDDThMMHpne//x17fvTD79z70++8Zfd1i3NtpELBykpPr28Nhzu9fFAoUkKgEBKEcFe9gbkuUgdlBEVEUd3d5OY/1T0X042YBnEPo7hWieJXm0IIJ8B2A1QOq335Syxn7pbkGqVwJmvosc1egA6jsgGgRB8o/IxmIuIH8bkvcibgC1V9gsrjqsbdl7lCTOf9U5ZlECvG5pjOcLJmHpQJcpnvluikK2eL8lSz44NHXOfOY8F+Dxtnz/NKRLVso4ghgQT5sWOFaSL7w4/E5ccp3aBQXlJlhxc/16WPwvF1xfyXxzBboW20Hm8YMiTbE34ke8+SSesKGhAKTbrQpFKJcqotmwtzWWNypgm5Ajhyqjv4xiPn7/3qA6f+jwefPPfwy6fWe4gSERPQelDT+hpq+Bah9gCo4Q0PRH0rw2QIAOr42dXHPv7eQ39rea33zHtu2f0nb7pu7tD+uXbSmZhsrm0PG+sbg0G3mw+HucoBAKSUUgojXNoWuW4VpIbLQgZGSQzjHpaLlDXCy61ZqjMqI38sEZTbvNgA47KxKoojSlwuXH6teFLLU1wWeS9W91uFccovh/KNjBeFiqD2rWHlm3TC22W3y1ySx+gQQRjkA7MdRcoMX3VGDNYEpDRorUkLQGw3ZWNiQjSmpxpps5XBzoDgxWOrOw8+du6rd33z1P/7d+888k0j/wsUsgGqqJX/NwLkytDqRKR4Yb0PF9aLpa1t9Z82NgZHzizv/OQt18+/97p9U7MzEw0xPZk2N7qDxsZWPtzuqkGR6wIQUSKgECDQukS7ZKvVBUIA9u7xiwNb01WN0pe67K06DpUrJkOxYnZ59a+skzKivJtLtVSluzS6wFgY3UPFhf5bghFNcY4+AuWxnfuXfIYofhwp3CM4E5b9BF8ZfKeJYdl8Uu7fKf6kgZQGpbTWAAAyEclkJ23NTWWNuclUJAnA2Qt9/dyxzaUHn1r5zDcfXfqFz979wjNG8a+vc62hhlcTag+AGt5UgNhGAA1Efbr24Ezr5qvnbvj4Bw784+9//4FPXn1oOi2IYG11QKtr/cHW9rCfa1IShQkJECjQBK6Fk1GAcGLKmb8VOiuJcgHCaQu48rGaHAsA7NQ9jCKyyvurm5H8aYORL0Lb5mjBVo0MAOYhlnDzKPsTAwRw8d9gXGzL2fipUh/ZiQLwK7uigTIM/WlTjLkbXrkCN1aYOfEnMxSeO2Xb40oMV++OXzZjlAwhpT/Kp++RZwE7ASuf9biTtajLOFP36PySXCANKazZOKu4hybiOF23XoiVHXend2jHxf6jc68mQMLg1eJjVtncxF8x3Chgx4nCtkzm2icNWgBiM5FydippzcwlSbOVwtqmhkeeWT/52a+d+Lm7Hzr96+eXNror6zkAaJAigULVp0FvRJDYRm1p9b5dU2LffGPP22+Yf/fH3nPw795x2+LtB/a1khwUbGwNYWU17+/s6IFSoBAJpUSJCKiRbMwxsesogNFnawDwcesG4pNQZyjgm47t7IguMcpRyiA/KucLAFROZcsKMz8FvqhhlvdPTumKhgdlahHYSFDdgpIbYsi5tZCTH05tONX2+XOBzSXEAy17hpUxZH17buVpDqctGGh+ZRIvFRFUcUOwgyPOQ8ao6yV+T36NuWfoa6KTGVybRIHeWyLqLyossbnKxEQ/MUK/mgwzhjFOZ9W1V3qPI8qOeh94oZvHmAsoDVopUJqIEkGi00lbszNZY266ialAOHFup/jKQ+fuu/OBM//w8edXHnz2paUd48EpfNLQGmqo4dWB2gOghjcVxJmni/7LJ9cf/+QdV/3t/rDYeN9ti3/oqv1TM9PtFNt7O83NnayxuT0c7uwUgyJXhVKoBAJKidILIiVuaGUwYOoseCZdLncJG3/1tGFEeSaYub+ibD5XCNU+Wc9jhMgqft8an76yOFUnZLl+r2Tsr3SWLoHGJfsYWzgGKv0dNXWZbYzA40q/TtkOQWyJhXsEx5R29xGWFj8RGmFQk9ZEJJCw1RDZ7ESjMTXRSJpNCZv9Ibx0drP77Isbz9zz0Pn/885vnv6dY6dXFQBAfRL0xgdlabUQbSQa0NkLW2fPL3U/s7NTrK1sDH7qHTfNfXj/3s7s3FQm2nuy5k5PNba38ny7mw8GuS40EYEw3gAy5Edjpr0xmgwnJx7Km7H6K1Cf0Utz7ILFuAxWXoyreQk6eVnkjfeII56V++KNVzna+N+v5natDixgM46DXQG8KqgGjKqU11osXlVPhmrvI+FiY7sSllIqG4khhCaMgWGhFCltbEIkhBATraQxPZk0pqdSkSYCtrcH8PLJrfX7nlj+/FcfOvvPP/3Vlx93p/5SplAUtfJfQw2vNuDU1FSyUXsA1PAmBGMEIJidTGDf7onpd924670fun3v337vbbvfd+iqyWaSCNjcHMCFlf5ge6cY5IUuABASidLcRM1Con0sPVgZhCpxdvw3j60LTYS4SXNCzPIoW62LHT6xht1Jgjs1KUWiM9Y55jAmOjCJT47KQmiIa4xFaPvLTgBFA7b1SwaEcOLNkSB/0h+8LOITIy/qUdynG5AfPZZNI2we/E0COhpFWaauCFKVeFey/SA7JuLHHmyGSkf7ZdzKGax5dmsv1/qPY6+686ds7j8OhVj4pOhLuXLVua6sRYYS2na8iI3slkyOv5cOzQkrmuZCfj40aBcaVa5JCyRsZSKdm0iaiwvtJG2nsLKew/1PrRy755Fz/+GRJ8//2kvH186cXe4qpRWgzEAX/VogfBOBFA3UVAACwO7ZBu7fPTn79hsW3ve+W/f81B237fqeaw9NtEQG0N0cwoW1Yb65o/r9ocoBCYQAIRBRIAhveDXEFV3+EL8H7dIld1sAEiKL2XG0jyvNVdXYH8fGJ6OlfcLzCjiyQQDsxNxVDOX8s9BZ+INrYRiPq2rUsAP1Y7H/9248lh74Np03G+cvMSKBz9g2OVPhbZZRr+RliSw11aFC8OoCxiMDOQyeZ2V/+tHO6eFbjLvdlwhLNYgNkc8V+Dl1VDySERzizgCAMT0OfJIhgJU/3GBYmdK4qtf0uLXkFjpG7/zaZPPAeVmJ21fXlpl7f+mGGyYBaSLSmjQBgpQoO80km5ttNKZnMpQSYWl5Rz/8xPLzX/zG6f/jnseWvnDuws7GykZu8chrOl9DDd8mqA0ANbypIUlaqNQQTFgA0Y98zzW3vf9de/7G7bfs+uQ1B6cWFqYyQZpgu69oYyvPd3aKQT5QuSKT60YKIYy7KVPGrSugc/lzgiRPqGZ46jilC91tVUxIMsoXcgOAlziCEmdEj1jxLsuFEL21z1mTowwA3F3TCKmjFEwEl/TvcgwAo++kG2UAiHG8lAEgGBguxwBQFpxKKEIJvkUDAG++nHBsrAHA9enClblwPsoAwD54SN7I8eZfLXzXuE9eNNTVbsgeVSpNElpZPygNaP+rTfynVpo0EZEQIBotmU1OJI2ZiUx2EoRCERy70Bs89sLaM/c8tPQv7nvs/KefeeFsD1GgEAKUqjM/v5lBygZqbZSDvXOT8M4bd9/wwXfs+uvvvHnuDx862Nm1azJLMEmgPwTY2smL7Z3hsNdTQ6VIIQAkAqX05luznvmuFAARqTL59QhczsCyblalSgjoCgPT+eDyDAC+U/c7UsKijthzrDbyigwAvL9LGQCqinRsAGDjKJWl8vgv0wAQeuLXAYY5BHL67SgDgKNz1dZG4xD/vDwDAGtj1Pcalfwloq+vngEALV0uJ3EF7a77Q6gYACK6zjpxYXIsXwb5PsnTewQAYWPblAJdEGmlSAFoSFNM252kMTPVaMxMpCgTCWs7BZw8t7391HMXHvn6Q2d+/q4Hz3z+2PntIQBCIhuQ13ldaqjh2wq1AaCGNz2ItIlUmC2we7oJB/Z05m66fu72D7x998986PbF773mqukGZhI2N4ewttrPN9aH3f5QDwkBhRAiTUTiEgQSaCJwtwIIMBfcaEIERBE0/oh3W02VvMJEAAKQCL2HNQKAdmo2BSEkyAr2lvWqyhrkQrJtlw4FwLVBTtlk8Ym+cFlZDS2QL+dEs5JQyQbMsygD2OzArsGS0OZCCf392j5wngl9fJwjjByRjYEF2/pzCq/AuzkqGzzKw8fSz3i8VVkt9OmvbEYmn4/upDQw1rUfflkgDQWDDO8uho6O38d0We3TdBN/fzf9IwVrBABNhEwGd1HEBAI0AeSFKJQmLUBBpwmN2flGe2a2KTqtDLbWh/D486tLX/jmqV+67/Fzv37s9Pbx46fXB4gpCilB1af+NQCAkBmSLgBAAlFOt16/a+bGw1O3vvfWXX/5/W/f84M3XDc30+k0YDhQsLba16urw+5OXw+UIpVKSFKJEhOrq5AGDQQEAhAQJCCANverEBKgsETbb3O3cTWYOG633wxt8nTGnUxbmkLOkOA2sTecxZ7gMXUlo7AJTzb9Rgu7Ls454KluSe9zZCO6WYUVNvfJo6/rDKOjrrMN7UfENfCKsnHYGXb9U05jqWo48GUoekas7zBD9jmGmQBgOW08r+BtM3D8lTsP8NfsU8S0PR67L0sASETxDQWujRG8lxjXGHPrQ9WLAaLvwO92iFaQ4amRqACa8XUna6Drw42Dt6fNnBASkPDzFa4eNv8XAlAgoCAE0qDzIRZDTUoprZKEkqlJ2Z6fazTn5puYSQGnzw/ovscuPPP1R87/28efP//5oyfXzp5e2ik0AAiRglLDmtbXUMO3GeocADW86UHnNvN00sSljQEsbfRWT5zbvnNltbu0vTP8mXffMvzkwYOTc9PtTOzZ1U4nO9nU5nZebO/kg8FADYtc5QgIKFCgRC6uGUB0/qYAwAUVcA/iJ0aQoOj0CCpVRqj65Rt7xwg97FGkbF8hUNSjecLPmrE60giri3XJddwR2F8SL1+P2QtKZZw4H8Oo8mMQGI//uHkvj/wyR1a2wfg2rhixEfVGrazwXY14x6ViJ1BjKIexKgIIIOxhkdYIWoFS2hyLokQx0ZKtyU6WzUyIpNGU0B0QnF7ayl94eePEPQ+e/tdfvO/Erz19ZHUDACBJMqzdQGvgoJlyYMK49MYTLy7f8+F37Du5vlUcW9oY/ti1h6b3L862s/nppphoNSfWd1RrZ2c4zPtFUSildEHKKOXGTibYjQF+LaNzRuJUjm/GiroelFqG78jFO2brRuTnClb9ldLI0TUvQlMqQKx4XCdWe6vzxXu7EkBuNyk1En+JKwdv3xn14rKbHTeiEY2w6WAq+RV1wXsrm46ZXTeIAlgqOIoV+KyuJoTR3TdcGRlLqumC7rQGXSgipUABAWWZzFqtNJvoyHR6UspUImxsDeH0+W7voafXHrzngXM/941Hl+86dm6dtM5BCAGk6twuNdTwnQKcnppO1jfWaw+AGmoAgES2UGkTEjA/1YCr9k7uvvGa+Rvfc8uun3r3zbs/ctMNszMTEyn0uwWsXOiqtfVhr9svBkoLLYQQKFFISRLRHKtwdVh47kxWbELLoI2wiWg9AIJ460+NnUKMAOzUfJTgxR9QaMNnmh99zsJPYszBwWixJMpY7U88nMLOTmDM6YKN/bZP2ckClz3KwkskWJoBxwUq0g4/VgnyQ/lxpR+0AxmFCAuV9PMDQdipZtofneObm2S4JBYJyVbowtK90ZF7P4RvGB3LUZiq8h3XaAU6d5oZhD7nIhtwJd4eE+r9CZtwY2DfGLjCZDxUXE0hCIGAlBJU5JgXClQiSU5MJK252aw1N5diQwKcX+nTw8+uH3vwyQv/85FnL/zqi8cuHH/h+NqOOT6TQFS7/NdwcUBsoAnhyult187NX3tg8vrbrp///vfftu/PvfNtuw/v2jWBfU2wtdmHjbV+vrk16A8KKrQJQ0EpQCQChaVYQNoQZbPWhVvpyOkFggZE4+rvTWbktqwlilE2eI4vMM3M1A3/5bqZ28PhFg/Xj6nA9iOVCbtt04UTVWyO1T6jguM0Ske7OP4VIwCn11g6LS5fxcBV99h0wMm7p1YUvQn9ekIU+ByHigpbsc2in3Nj3Ah+di6wvdQjZxNmTVgkY6MRReMITBMANKfBZF2mGL+g0jjd2Fn+gAqUWASUsHCfIgo/i9aE8eQgcMb84KFChHZWyKfasUcbLqkrDQvKNRE1M5HNTGWthblG2p5IAUnDmdPbxSPPXnj+q4+e+4WHnl79zKmzW8tnlwekqbDt17S+hhq+k1B7ANRQA4NCmbizNElxZTOHlc2VpUeeWz7/kdsPHL+w1vvx1e3Bn77+mpn9i9OZnJ/J5EQ7mdjcKVrbXT3s9XWeK1KFAoVEIBAQJQnn468p5FpDz9FDJCRyseRS8go4UYJCjPiogpdxhMF17CsBrsqOu+JqFGI08ml4EQQm2wPFQswVQaznhq5iXZkhMqLwuDZg3MxWpObo+biv8YrGdynglo/yv+49QEViNgYshpAGEwJK6IVtN3737Z0brSKiQmlyFoE0TdKJyaQ90UmymclENjOE/kDBkfNbg0efXX38a49c+PlvPLr06SdfMrH+UiY46tCphhpGAZG5BhJFhkDF6tMvr37zlsOzz62sDp5Z3y7+9i037bp5fqGVTbQENButdHIqSbe3i2Knmw/7Q1VopVVegAYBCJKEUfUJXQAWlumDtkR3xEYOIVDgQ5iq72EsTRnRYPmPkQWcbvnKNs0IRKn01hkO4zIsfiG04VXLkAPHPPf4Wb43mvSMBQSbg2TUi9LvKgWumDoqdXDk68uc0TH8IfxVQlLDKwNGk0eYQRhNtt2U8SrxvZFX+iEA6fjeFm8Qs/Yv441BoJXWxsiPhEKIVks2m80knZnM0umORJQIS6t9OnVue+upp5fv+/rDZ/8/X3nk3N2nl7oKgECIFEjXin8NNXw3AKenp5P19doDoIYaymByAygwp0uKbrlufv7QgekDt9+460996O27/vQt18/sWVjo4FABbG0WsLLWH25u5/280AUQkBQohASJgkWKm0g6f0xBwTSPghyDDazd1OHZpyEoyixGAH3QJhMZmfAYzq8hTnzn6/sDBqPilZTFKHY0bpwXY03afAC8q5ECc9X4UD6UN8nu7IXeyKSWkkwXzo+CCBTmqHw0Uh4Yk8ijLqypppRV358YeRzYINi8+wBighGncGN+UzDuBNwCfmEZjP4Gvhv+B5ZLBiW+ggQCCDSBy6SRiGz6QsGG75QjABQWYSIERaQLRaootEIgaKQinZzMWvML7cbkVANSIWD5fJceeWbp6N0Pn/7FB59Z/tyJszsnj5xa7xl3buEVuhpquFIw3gA5ZELAgT3t5qF98/O3vXXhj7zzloW/8I4b5952+MBE1mwI6HcVrK/1aW1jONjpFv1hDjkgIqaYJIIEIll6bD1z0K55Q8jN7QCCa8RO2TVpBUNoTJxmM9rJhBAt9HIit9KOrmp+jCawV5wRlMmTZzclD6CqAmvpJ8saj65LSyDJWZ/H0TPXJzE6iWGYmjgu0cBc3/69zy5jmRR6q0zceRgfmwwEKCNVoedRrhOy3lbO044lCGA8tJKktTL+MoOybJ887bXLAN19FJX5sLwP2GSaiCznmVZinq6qkxmo9ILfUGELgmvGeCAIJDD2V03GhU/YeSUAACFMKiMiIKV1UShFWmspUbZaSWNqptmcmW6JzkQDikEBLxzd7N376LmvPPTM0i+/eHT18RNnNs+eWu4WBoEUiOpY/xpq+G5B7QFQQw1jwOUGAACQIkVNavWZI5urR45vvbS+uvPM6uaev/7W6+ffMj/bbkw0Ulicb2WTnTTd7g2LXlcN81wXqtAFWSEJJZrQAH4u4cMBLIyzykNZWXNCIRn/xBGHDOMuGnaKMvEyQTC7zPOYS0PU/+jjlZIAPOblZR+Njyh2peLFKC19TBsXn6iySaR8TgOV3yF/wqvzCSpLwoqZ6DoDqBpTYgyJwGVKN3KwM2m4Gw0IiBQQkAZz1RMRCURsN5NmpyXSyU6StZuJkCnA6nqfllcHg2efXXvqq/ef+rkvP3Dyi0fObQwBEIRM61j/Gr5lcMYjKVI8cmanf+TM4PSLJ7Z+6eTZzfuXLmz/rVtvnPvIoX0Tc3MTTTnRSbDZkM3tbpFtd/WwN1B5rkhrRYqISACgkCCEAGEts0ikTS4L12HF03sE3WC3lLyy/V2mG+wnz/FWtQJcZlcjmEf5rc1sO5oYjumsZGO4lN3zkliSZ4+XJL1VjKiCz0Ub4Az5spCL7C5XBMHUUO5rpGU45AxkGJa/oHtWIe/jPjXLSmtlFBLk8mL4kBjSSuuCjEVEImDaSNJWQ6SdlkynWonMGgkMtYZT53foxKnN1W88fP5TX7zv1D/6ykPHziBKwztQgK5P/Wuo4bsOOD01lazXtwDUUMMlATFBAAUSU7jmQHvymoPTV7/16tn333LDrj/5rpt2vfOaA1OtdktAtzeA9c2BXl8f9ne6xSBXVKAQIpEoUYLwpylgLPL+pBwBNAivhMbKcxXMqRQBEFobAwEioHYCDAaLv7f/ezHViAgaAISRbW28vi3ptcRYlAo5AMpCKT9ZGHMiwhMIUCjqVWMeb28lGBdxH3BisnYpJr50xuHx8TfXo8GbrCSJUZsBVXvIZGvFfcQifOiJ/8Vj6M0TDe4aJX6iFM/1CANAKR63jIvDE0tTH2cVD2vLCMbhLbIuKsInApgTSgRNSATazpcwX8kMgICQjMs/KaVJp4JEu5U0Z2cardmZhmi3UuhtF/Diic3th55d+eYTL6782vNHN+96+fj66aPnNhWAAoAEauW/hlcbjDeAWfx75ppw1f7WwQOLncNvu27uh9510+L/evO1s4f272lLIQl6XQVr60O1sV0Mer1iOMzNXYNCgpSpSCQKo8aT9re6SIEuc4vpUDs9nO/b4DbgdmawGcS0KlBU669VzvnhrcNlwyFA5YS3PBe+Rll7LNO10KajL2BxrtJf1y8zPgB4FT2cdPNbENiQfHt8nJZCWfJSHoHpkuNcSkM7MtmLqeMO0mMduMQAuD1nhPJMrpmyIm4WBxGbqLIHB0PSDtcxP5sngch7SzgeQsDngV8L7NYBn1CLjbXM8o8Wpt59O+Ze4VwSEdH7+QN65w4iIycUWqtCKaWV1gIFNhtpY2qm0VqYzZLJiRSyQsPSSo+eOLZx/tEXVr/62PMX/tPzL6098dAz584jOikjAa1rD68aangtQG0AqKGGKwQhMiTSIISAPbNteMdb5q//3vfs+3vvvmX3Dxw+MDE/0ZQilQD5UMFWT6luV+WDoc6LQitFRNok+0OJQkgkFDYgkBCNAQCAKa5wUQOA/4OcMQFAW4HLGQCCyIhMsbZSAjrjvxHPvFJqkagaADDu+xIGAP8TS8ILNwC4wweeBI9CZSy5JlyOAcBjHc0jMgOAnZfSVU1XbgCwYhUziERKvJtDYsIqwkgDQAX4IEbgctkGADceZvHw4mPFABDG6VJAATjZFqyQSESaSNu71REFComykWLSaYt0eiJJm60UFAjY2NF09MjW0jcfPfubdz14+l8+/tLKyeWNvrmOGkUtDNbwbYdEtpFIgaYcBCBcd3C6/cHb93/0/bfv+dmbr5u5bc/uZmemkwjUAMOcYKer1E5X5b2ByodFUWiM0gCCAI1CoJACEAQagysBBQOABXSaWFjicQq8ixsAQkI7RtEqBgBrNrxcA0A1O15UomIAgKqaTaOw9loww9slIPT8iDytcjkFWK3LMgCEcqMwY3qtx9WWdIkUgSf7YyU9+UM79eFOxMC3KArZqxoIrKkHsYTZpQ0AhicwA4BtmAAiGl01ANj2xxgAfDiBwy3kE3bNoLkCw6ZqdPGB9so/bTz9NZG5lVgILRoJSpPdP0tb7QylROgOFKyd3+49+/LaC19/4vy/u+/Jpc898OTZM4gCERG0rrP711DDaw3qWwBqqOEVgDldUmBilof0vlv2XHXNVbPX3nzt/J+49dr577v1htnD+xZbUicCeltDWNsYqI3NQb/bLwaFIgVImEghpQAh0RwNm/t3kYV22kxBFX23LHmwkwD7l7+TGML/AbgwYWuK8MILnb4CAdP0bU+xUMPVRffASBgYnpITUEzbLiQ9OnTxSFsZjAmmJgbRFwpDL11x7FVbF//oDSB8btCJzOCyF0fiLrq8C8x4we0wpezaZeNMmHeOWxyt77FlBg/0lcHLcLEiUcIDSvjFFVi9IGySOVpCcFH91hDBT/fcvJub0IN1hohs+gUEpUAVSiuttE4QsdlMGlOdrDk3naYT0wlkSHBubUhPH9leevTZ9S8/9syF//ji0ZXHHnj29LpxAyVwd7hDDTV8h8B5cCFIOLxvRh4+MLHv8J6pW268duqPv+um+e9/yzXTu3fNNREBoNdVsLo+VBub/f7OQA0LBQoEogBEKUBICVK6dIFuw2qI1jNZ+h1vS2T03O7NshsSlSiapcWBInJl3KbFq+iaVSXcPnCTEd57Mh9TqcgA6h9beurGbcfjcwMAecNmpEyD/1+kgMeci/0iAqa7Bq07QgdZZYqmwafZLTE8YoaSqClurLBNc5pMTsn26e8tbfVEGENuHYpnskz7468LQeNn398XQDDzGT1yHVjuFqzlwaCtgVCEVA/OE8zMvTCfyU0pWlMvEhII0xohaA2UKyoKRQoBoZFiNjWZtOZm0mxypgFNgbC+kcOLx7Y2Hn1u9b4nX1j+1WOnN545emb76LPHVjeN9UEAUa3811DDaxFqA0ANNXwLkCQd1LoAhAKUVnTrdXs677t5z/d96F17/86tb52/dWGx1ZpIEJTW0O/l1O0rNegXxWCo8kKR1pqCfCNAoLAGeYRYW/cKXhAnykZ/X5QLg84IwISp0IAzNpSuHELW+KgrrFzb4Z+xBgDXKT924AYJ3waTjMgdAYG77ciJa+5qIoymYpwBwI0DWSexEO1CIoIA5QVEP47gjjvaABBPrL/gkc+PE7CinjAkaopwhGCEGKnxlz5NRfBnFZDAXznprrWyBgB/IgTBAGDsJXYlWAOABiBz4s8CUxBACCGyFJNWU6aTrSRpZRITKWCHClhb6Q6fennzxa89svxvv/bohV9/5JkTW1I27PQJKIpeLRDW8F2BNGmj0k4xJ1B6QO+8Ye/U97xnz5+64x27f+KGq6ev2zXbbEy3UtSKYDAoaLtXqO5AFcOhLvKclNakAXw+NHPICRVbIBAZ5bx8VBxI7XgDgH0RtxcoR/ysal30nVUMACWGEBsAGJKMUka/xhkA/Hh84jqPmDMABG8rR9vjPsqMa5QBIFLyRxkAfBO2r5IXQdUAEAwOploJK0/Hg9IdwtLKBoAwR3wO4+9V5ZkBJ1fIauy2K2LjjA0AdhY9D2MGALJ2BZ/A0Gn/CAgiGGmAwGV5MY5dSJpscBciYiJkmkjZSIWcaIpkopPJrCFhgASbK1314pG10998dPm/3v3Q2f9812OnjwohbEyBBKVq764aangtA85MTSdrtQGghhq+JTAZzBUkmMChfZPZ9VfNHLjm4Oz7b7x+9sduu276PdddNTm3MNNAEAiDbg5bW0O9sT0cbndNvKki0ChASIlSChQouApttX+m9ZoEzFZucfJB8Fr0MYWRsGTllqryzcSS4BLA/suV0SCsuhMSp+RGWqg/XoCoHR6iiVzAZTiQH6u3ekTNOvsAV5CpVIgcqmzOfOw6AJALtYgRBpYkz1bT/ua70ChUDCNBALM9MYTQ6d7WrhAOeEwb4WqrWOEvJQUf1Vto30rxkWCH5OcGSdiyiECa3PEPgclMQM5IwT6QJgClQStNWilQQEBCkGg0ZTY1kTXnZhppZyqDTACsrQ/hpeObG4+9tPrwMy+s/vqR0xuPvnRi68Xnjq5smpNXUWd8ruE1A0K0kGgATvG56Zr5masPTh06sDh50w2HZv7wu26c/9gNV08tLMw1EQCgP1CwsTmg9Y3BYLtbDPKccgIEIVAkEqUUIIRLFQhmN2pySfKZQZLBODd0cq7yjBRHiiNLvB9CwTlFYH9QRFnAE+7IUOCUbXd67zH29MQ6iPuQqiiUgCwt822Qs2q6WqanqAp5t/zRV85QMFI40wcxQwb7J1KwS4Zrzy0do/RMIVbSy58iMkYwhkCM7mOZQLsBeqcMHc2huz3V8jf0hhRyQWJo40wCnwptB+SCYcL5sgXk3XcgNr6Ii5Lhu3GCYAKlTR6XoqBCa9JCgGg2ZWNqstGanW6mnYkEWgKgN9Bw8nx/+PhL6y888ezyb7147MJdR09uvPTQ8xfOhHiDDOqbXGqo4bUPtQGghhpeRRCYIaICISTkxZA+cNuhhQ+8Y9f/44637/7xt1w9c3hmtpm1EwlCExSFgu1+oXe6ed4b6jwv7K26GjQgIAoQAgGFTRvozmndFUToZC0AL0jF8ssIAwCUTjb86QEXkPwL5pXOlHNwgheMMQBgEEgRgFsBYsW4bIpgQieXCUcJZyMMAMSb8n2HisjHVZbGRxgA0AlSTsC+mAGgkqeAz3xsdSkbACLhnLdVCb8IpS5qAHD+nkjsBAlDcimqXmul7UmQOe43Yf5EQNrI+iillGkqZCPDZKIt0nYrFY1GAj0i2NzoqxePb5z7xqPL//3uB8//wt0PHT+TJgma5FECtKpd/Wt4bYK53UWDFAiFMpnJ3/nW/VMffs+eP/eBd+7+yeuvnjk0P93IOs0EUGnoD3LY6hbFzkAX+VAXRUGKJVYB9HqcodUCABCd4S+cHcc7v2oAAGAK86UMAKzyJQ0ApXCiyzUABLNGqX1wQw80m1k4ozZCLhf0dNXwsVEGgPAz4HIZBgCv+jofLzeuClMIyPP5GGsAsJhE/Cum66HJYLiIhkNuBt0qiQ0Alh5joOeszZEGgMC1XCHPU7D8ho2X3FjMnYLGAZAsrUdMpZCNJqaTnSSb6DREM0tgQAq6m3194lx349Fn1u6564HzP/fNJ5cfPb18gRIpUWsAAlkbeWuo4XUEdQhADTW8yoCYIUABhskquu2GXfPXXjV1/YE9k7detX/6Y289NPu+m66a2nfVnlYiWwjdQQEbW0PY2szzna2i3+urQaFJowCRmFhTIYVxNHVWdiOqIWoyeXucICVsEHpg/zYDM6AX8gDAXFftEXbCSchGjKwuAAKSyQJPGJ+cm3oUteXK+9+uTpTSgMYbACAWviqJBzVXhbnM5vB3ryjg4w5dggWAtYFhxtjJkRkvMwAAV9pjoX3UHYqRoM8NANrZEsoRtl5cjfoKBgE7fG9cERFuDq8gTpI/7fHIWLcRMywB7sRJE4AGDQWBVgUoVVCBRJAkKNst0ZyYbDRmphpJuy0gQYCN7QJOnNnefvzI+tMvHFn9/aNnNh9+6fjm4w8/vWSve9JQZ/ev4fUCJqdLAQAaMpHC9VdPTV9/eOrWA4tTN1yzb/Ljb7t29v1vPTS5d3G+JWUqoKcU9LaHsLk1zLe7Rd7vq0HuvWRQyAQTKYQwFlwQTssD8k5bnnSUDZcsK6qlZeF3qDfagBnnaEHWR6xUOxrp4tkD5bEqNVfm2Q4OIVKW0njS4qyLYFyHcLyB09sghMVLO5qL0cT4E3ZmF/Bk3VFydI4Sju+FMXBOpa2RxnloOQi8hSvdJSNBZFXh5Yh9K4uga5/Y+L0BwKeDdSn3GN7oPxJGhltbhhlDmBnA+uq79kfwypBQyM6ZtUI4zy67HqUA0UxlMjmRNaans7Q1kUBTIvR6BCfP7gyePLr60nMvrXzx2OnNu4+d7j7x3JGNY+fWulDf4lJDDa9fwKmp6WSjNgDUUMOrDjJpImkFAsmfLt18w57Ou9+2+NEPvWPxZ99108w7d+9rtxoNAaAJir6GXlfr7Z4qukOVF4XSpLW2XuiA7oDAymcChZUY/MVR9iA+6LjRib2Va4iYUOJlS38vAHBByYuVLpygnLm54qoYBMSo46DfV73n/QuGFHteESSp/D707RLbeQHNvyqnRI7x9oJySU4Of3BcRuXajp+My8bt+rCSXknULAmMXohz8+PqO4EO47lFgMgBAMLcuebNO+tiTG6+iLQGbW6TRABCQkTMpJCdlsgmOknabklMGwkMCw3r6wP10smtpfsfX/rNux86+wtPvnDh2Pm1HQIAECJFogSI6jj/Gr79MDcxh6vbq6/aWstkhkorEBIhLwzNfvu1i1N33Lb7499z+56fvfmG2Zt372q1mp0EU9KQDxV0+wVt94qi16d8MKRCKVIAAMLkBxAoAIVTSynQZJ8rz3VeNgAQfxaUPw1QoowQF4x+OsMmxHqtNwBEtUqKoy0YCNZoA4BXTuO+y+bNgBLF4x9TPhgAGDXlxs4Si+Gm07IpxHm6xVcIXqYBgM2HwUSHokw59wYANIPzbQeEg4IPrL77l1tbEDCEWaDnZ94AwPIp8PWDPgbCTgGi5xdEmrS1kSARgRRCSiHSTCStTCQTjUS224nImgn0SUN3c0jHT++sP/zU8le++vDZf/bwM0tPHT+7OQAAkEKiJgFSplAU3ZrW11DD6xCS7zYCNdTwRgVV9C3DTzAon2l3pzv8/PnlzZcfeXbyfVcfmvrB6w9Ov/Oa/ZN7D+xqNWb2NEUOmO30imxra6i7W4Nhr1fkeU65Jk2AgAIBpRACpRbufl0w0gE7P2EChpGArIUAwik5jCwNvlo46PDH9e4u5zjU0jbIDAtGNnR5+EMf6P/LhBrkb8GfnlRPsxyOvE7VGMEVam4KASIyifeCqcP1gcjLArhTsXANXijH5ysWaq14Vho1x6Msg/sQiiD4RfNlUeE/o7f8NMj+icilQrc6oulE796vFOlCaQUEJAWIRkNknbZsTHSSpDPREO1WBgIQtrf6cOTYRvepIxvPP3d0884jpza/8OLx9afuf/LMebRQnwTV8J0GBID5yTlc2Xp1jABDNbQ0O/U0W4Dc6g7yz52+0H320NMT7zu8r/Oxaw/PvPetB6YOHtjdzvbuamCOkHZ7Rbq1VeiNzWLY7RXDvFCFLnQhBIgEEaVEKXwYFxsAD5dyzxiwfHqMeHM9z5csUfHYguCMD4ZblOiXbyJ+wiMAgsrJkOXvmRHSktt4XNHpNHICBiGhTXgWhkoefzd3nIfRiLmg8JJBmJ3yYqlERpRNLD6RLXnlP7apcEUcI7runzvHCvZ9eU4clsGPocfMIj6RK2FcMSBO6H2+ABBAuVAuRVopUi7Ha5pi2mnJxvRUI5uaykSrlUCqAba2czhyfLP/1LH1l146tnHv0dMbdx05sfn4s0fWXzy/1vVGdCEyoPoK1xpqeF1D7QFQQw3fAUhlx2af1iCkgsKeLr3tmt2d298y/+733bLrp267ae5DV101NTcx3UCJCGqood/Nqd8rVH+gimGudKG10spEadsTGTSSBaJXPH38n9X6NBihAgFBuKv5mNDmVWIDkaeAfe1UPJ+gKAgc4N0MicWQEpGPdKzkFSgbAIi/NjgwjZVKopTvEiJUwph8I7EBwLlIEoDNo8D0YgweEK7X0QYA1hnHyQmnzAAQhNHYaIB87owsZwNhY6GumgQQR7xgI7ZTDwAmqD+KTUa3DExGf5tnwgUUpxJFM5XpVCfNJjpCZA0BOklgWCBsrA/18RPryw8/ufT7X3146f98/MX1F08urRCAO/HHOvazhu8KzE/MISDAq2UAKIPEBDUQJDKBvDAKz41Xz0294y273v7+W/f8tXfcuPChq/Z3ZjuzmcgSADUk6O4UtNMrVG9QFMOhLrQiIgXK0V0yh7uISIgChTOCcroFtiwAhJwAlma6aAJTlKdzYwYApyGXb3Mp02LXjh8xf+IMFSMMl5zmAATPM66cO33ed+kMAEyhR4an16ptO45HeF5l64t4eE4xr+LI5hDCyTmOeF+pV5mX+J0l9yMMAG4CnKHZxdo5vsDyK7Dh8ony1/qxfAXomJavqQPz8uwXgUi4jAJEQKC1QcBEogDIBKVMUbYaMu2006TTTjBtJDDQBNvrA330+MaFB59c/sy9j5z7xSdeWnv62Nm1AsCd+BMITEDpmtbXUMMbAXB6aipZ39ioDQA11PAdgiRpoFI5GEYu4eCuCXzLocnrrrlq8raDByY/dmjf9Luv2jd59aHFiem56Uw0MwFKE/QHCrZ3cr2znRf9bj7oD9QwJ9AaBEgppJAgpCDjcupCBQjI5naziq8A6xmIAqxCCNyt1Iguwp5MGaHVCmwINkURkYljZxKel8SC8h7O2oEJYqaEE/ycqARkRSUvVDlBCrwQys0aphkmNHpgJyZeybc9c5dMLCWL8skMbd3S6ZUuZZUOL036PBeH6oVcLkhjqEe2r3ASxE+KYrlKaGtuQZcX3Nl63LWBZIeFPhu4u3vZCIyaSGsgTVoTkiLQSoEmTVoiiizDtN0RjU47SSc6qey0M2hnCeS5hrMrPf3y2Z31l05sPnvy9OZ9p85s3P3SsY0n73n8zAmT1R8AIK1d/Wt4Q8Ku6Vlc3ljza1skbSSlAGAIAAj7Fzr4lsOzh649OH37gT1THzhwcPL91xzs3HBod2t6fioTzaaAXGsYDAi6O4o2N4vB5k4+GAz1UGvQAgETAUIIFEKCFIgohCUMKEy4ODPOAjiaaJK+eFqIwSkJLS1ycUAhb2wl4skfIBMGOs0JKXKDATdOQMno6ui1NUyAi09jdLlM11xPLm+AMQBrh7fXiLXLHWMVfR46QAKBq8MWlYox2RkR0CviwlNcN0lcCY+TDIa7YsKYEUIyw/BfAMcJAt8C0hT6EqZrwOimFWc3sfn4XOuO+VhTiVHoQzoaMjYkBERp+Dxp0KQRCoVKKVIFmRh/BMBGgkmnJZpTE0k2MZ0lzXYKTSFhONCwtNZXx5e2N146tfX8ydOb3zx1euPuF45tPHrvY2dOBK9FAUSqpvM11PAGA5yZmkrWagNADTV8x8EkCySQAqCwmdIP7Z1OrzswfeC2ty784Ltv2f0X33rNzPV7d7farVYCiRCQDzQM+4p6OwO13cvzXq6LoUZlVFACYe+dQkQUSCBAe49BE0EoQCCa+FQwwpk24hFpo24CAoB0V1EB+RMnI3EII67ZvMH+vJtlrhbAkhXadPLhVMQN3p1egRcWXWZof6t2yQBggCqCIrJG4wSCXFBz74G9D8aJIPCG12Y8wexguvTnNnYQBEFsRF9PuyFZY0tkFnByPjoh3HbJbihg3gpESKgBiJwXBgIIMlf2ERFo52XhGhPWSqM0aaW1Cf00oqwQUghEbKSYdNoim5iQSbMlME0lKCFB9wnOLPWHjz6/9vQ3n1j6pYefOvc7x89srJ5Z3iBTP0MiAUT9WiCs4U0HxhBQgBTa53U5sHser75qes/tN8790XfdNPvnb7p26sZ9e1qdVjuFREjQOcD2tqKNrTzfGai8KEiR1ho12YRw5OiBUeeFO9cnG2sfDKZABJqEVQW1076RG1IdmXGROS5JrCOZRulElxuWGWqtAg+erLk8I44Ch/9x+2akiZdDtwJdK9NWbxx1NJQC/SQA5l0GTksOH4JbJDiF9wYAxjuY8cASyWCQ5fkFfAVn8XBUP7Tn+kDfK/pSPgGhPYJ3eRJcCtrg+eYVeDC81E0RUeAWCOSZkrnxBw0Ttxe1OHZs7UIaCDWS1oI0gdbCmIayRMhOA7OJlkg6E4lM2wlQIkF1FZw92+0//uLqs998cunfP/jM8u8dO7W5dHZp3dL5BIkQpEygKGojbw01vBEBZyan5NrmhvpuI1JDDW9WSGSGSuf+NxHRLdcuzLzl6pm3XrV/+n379058cN+uzlsO75m4at9Ce2JhOhNZipArBb1BATt9rbt9pbo9lQ+HOi8Kk4QKUYNALaQ1B9j/+1Nk25kTYMgniAOrnPp4eQ3BtV2gO7AgIkI0nv5O2RVWsOEn21YNjp9xxZln7vO+sIKJYdYHwR+LCXDGC3CHKd590h0/AZDwZzauBTvDrIy3Ptgz/Eiw5PKnE6D9CMAkyzMSXznZno7PpbiDRAif9Si5P6xwbUMDYgOAEfpcxgcB1vxARNqmGCMyLp/G9ZM0KdKkSQskTBNMWs0063Qa2UQ7la22xEaGoAoNa5sDOn1+Z/vYUu/0ufPd50+e3/nGiye2vvTcy+tPvXxiPS/0wK3UOsa/hhoAIE0aWChzawAAApGmm67dNXXDocmbDu+feueBPRMf3Le7c+NVeyauOri7Mz0z2RBpIiEHgmGuYdAvqNfNi16/yHuDIi8KUjpYQEEIFAmSuf0FjFHPqYtam/T5ZOkoWW8u99P+aQ0K4GmMe2H+FYT+jJkbAIQ1AIygrQCBTLEfKOzF9+603fXh86gY4Le4OFul4TWMBnvsmQHA09xAejiZRvbfcuSDFu43lUrbEbtEuoxeBxMBM/a64gCAwt+NY2siMBNLqKuJ0PMGr8tb6wD4S2C0Y2bEygEBCMIQ2oDGSUJZ0g6WAwMAaSLQqFMhZJbKNMuEbLRl1m5nst3OsJUgqFzB+vaATqz0t09c6J07d3bruTNntr/+0smNLz97ZP3ZF09sdgs1tH1LICpqOl9DDW9wwOnJKbleGwBqqOG7DjJpolYKjHRnGPCuuUmcnW5nh/dO7r/9LXN/7B1vnfuxG6+becvirmaz3U4AgUArDf2+gu6AdLeni+GQiiJXSmtFJrk7AIK0eQKcysrc791Btj8ZCUqoceskd8LsjpPACUzGYdHdP4+ESIiovegE4M6EMEhM4I8yfAl3YhK0Y/QGAHAerJEngj8A90YD9J267NRMTPQCbSxkeQMAK+sMINGMsOyG/qc7aTNj9E3HHgtuHq1u78/TWBE3l/4X+laD6Ksp5IVG67Fg7nLWRugk0HZGBAkruYMUILIEZbuBaaeVynanIRrNBAogGA4VLC13h8+/vHHsoacu/Oqjz6/8xksnN06ubvX6y6smq7/xUkEgqhM+1VDDKEBMkdNsAIDrrlpMDi1O7rn1hpkffs/b5v/8jdfO3LRnsdNudRIQEoEKDYOBgl6/0N1ergYDyocFqUIDkb1FQAKhcEfCAo0yiATauBeRsxcAWPoTYrICDcKQptU8cfQMvQGAq9fOZuAT+FXGaqt71ZYAUUNIHOOMpeQP0l2CVX+eTlx1tnjy3srXoPDcMd54WjYGsJacAcCwpHgA/M68qF4YrzMARDXJnsJHLIRjr72R2VyVa2izHaO1EBCZ1LgE3j2DT7JJbmBcIUiT8QzRltkhaIWKTEQXEbocAIZPJiiwmcm03UzSVlPItImi0UgBpIAi17B8oZc/f2Tj2DefXv21R55f+R8vn1w5tbHR6y6tdi2dlwiAIEQCStXeXTXU8GaA2gBQQw2vQRBJhqQKcCcQRJre8ZbFmbccnr716oNTH9q7u/OexV2t6/bMNXbvm29ML0w3kvZEAwglDHKCQbeAXi/Xvb4q+v3CeAZo0kSCtJU7hCAhBQmBhMLlDbAqrdOjtTn2NgIcApj48pDICG18KTcAAOp4MOQNAAZcjKd2bZjOXCZ9roEjQAhtdUKqORNDlwrRCWTCHSR5fJEdP2nbXumUxf5L4wwANooziHoUDqUImOgaYkMjw4MTil1vNjaXnDAJ4czIGxccjj6BoutXIxCQVkhaoVIatcnmbyRuKbRIE0iaLZG1WmnWaiay0ZDYbEhoJGYKtroKzq72B0fPbZ8/c377yOmzW988dnL7zudeXn/swefOrYS4T4D6xL+GGi4fhMyQdKAIREO65ZrFzo3XTN90zcHJj+5ZbL93Yb51zd5drf375lpTC7OtrNNMQSDCUGnoDzX0Bkp3u0XR7xdFPlB5UeiCNBEJQ/aEQBthBSCMS1cUC+/UWHJGVmcAsFd7xip96YTe0iR3ID1yjLYFQ/OFdWUnT8mctdYnsgNju/D02CFqS4PlL+aBpYLOWOuOyEsGAGOT1r5OZADgbQM3AMR9Q2Q8sX4cjP1487g3NGjGORweJQNAMImAufiRwmD8JKPPzQs+NMy0yXmT8eLS///27qxJjiS5D7i7R2RmZVV3Vx/oxjUYYI7FLldckkvKlqKMovQirfFNZjI9Sp9KH0F64qtMZjRRMpGiSeRql4d2OcvZmVkMBkejgb67jjwiwvUQGVnZmCGHos1wZrv/P1gbgO46sgqGqAgPD/fgQwjBc6BAqqFb9XPgLFM7KkxeliYrR5kdjayURUYiTK71dDKrw8FxNX/6cvHi5cniyYuXs7989OTiv/7Vh+f/+4c/fX66GufToh+F/QCuGxQBBPgaY8mZNP731G52eXdvKuuTorhzc3zrWw82fvu7Dzf//S+/u/mPH7w5na5PCxYrpI2Sa4jqZdDFovaLqnVV41vnJXiKbeCYA8eU/VQ3IBWPGyyMB5vwMW9R+szStE8S7xJ3oZnCqkjdcFLWn0slJonfC/2E8/Lu+qd249MEt1vPDxfnw/2a1283fMjhhO/yU13egxo+b9pNSjtj8QerFoRMxGnfh1RXxa9ocN5z8AbQ6jFT5IOZUgHBVRHAlF6rxKp9IajQHb4g8p5D8OxVu/xfVhJRyTOy5Yjz8STLJuNMRiNLxgopMzW1o5OzOnz0ydmrH753/Ps/+Mmr//Dh47MPjk4Xs6p2/uh0qXEXiCgWfcLCH+Dvw8gaB22JyPdZAXd216Uss+LmjXL3229t/OavPtz+d7/yjRv/5P6djZ2t6UiyXIhFqWk9VVWg+dz5aunbqm6dc8H7kCKYzMRxMRp7wEpXHpRjKnmXHNQdl1od9VdWJulGHO1/rXb8X3sRry+cO5KCBjHom1LZibpHXa28+/Sswdj5+lN0Y28fAOjv+pkBgMsBgq44wiDzID7E5SDs5bwGujQWX7r9py5uGABYBX6HFxp/NAi/DF9Quvju3yEGpleZcNyP9zFivfrE5P6qgtcQgoYQKKR/PWvEZJbMqKBsUppsPLamKC2JNaTMNJt7enVUVT/7+OzjP/vp4e/9+U9f/afHL873zy6Wy6p27vBkOM4bQvcWgOsLAQCAXxBGMg59zX4mVa/fuL9Tfuv+xsNvvLn+T9+4s/Yvdm+Mv3Fje3zr5rSc7k3Ho+kklyIj8uqodp7qWrVug9ZN8HXrfeM0uNY759WH0CcpxiKB0pUuZu4W9cwil/Lq+2lTV+9YY2PCYQu94S581xqwCwCsTjemCEG/Lu6fod8lotVDXd6/TxMnJR7sFGn3PdLBVfJwfnr5uT4/ALB6gH6za3jVl1JSmQKn10ZEYRAAGM6FuzmiUKzTHVKmQKCggTQECiFQCHFyGfeV4rafZFZMnokZFSYbFWJGhZGiEMqtkA9EVe3pYtmGw/OmOjheHh+8nH98cDx///Gz2X9776PTP/mfP3r2KE4EU7YGzn0CfNFYbDz/M6hCf//2Wv7N+9N3Ht7f+t7dW2u/fevG+Ns726Pbt2+Uuzemebk+ziXLhIwIOR+obgPVtQtV7UPdOFfVbdu64L1THwLHxWFsIyBsYoTWpLSrmG7ed43rd+njL+Wu7Fw/lvaDW6ppf7mo32Bk7Qez1aJb+4Ezrn1XifWsXXy4f2OIuDupFF7LGOsr9/8NAQBatUiI3+u6HsS/docfPhUA6B98cIGDz4jPLP7y6QBA/3rSZQ3OGHAqmpMeLx224xhPSecHUsaX16A+rMpBBg0hvu1MwsJW2GSWbTfO29HI2tHISpEZyrraBovG0fGsdgfH1cWL48XB/qvlRy+Pqh8/ejb77z/96PRPf/Te03NmGXxyCsZ5ACAiIp5uTO3p2SkCAAC/IFhKpnhMtI/g392byqgw2fZGsfngzsab/+jtnX/7nXe3f/cb99ffvr03Go/HTNKt95wP1DSeqkZ12aiv6uCryjfOheC9ekobO/HUaTchURElFSbRVKKe0iSNU5Hmrr/1ap51qaqeakzdTHUD0lnJFADg1WQtzl0Hu+Y0nMalLSJa5Q8oDW6fFurD3Z3ucfv9msFjr+bFfcDhcrpqmgTy6ouH3//0DtrqtD5RX705vYjBQ/fPN9ybUlL1HNRToDRxFmISZmvZFhmbspBsPBJTjIyMCiGTGWIx1NZKhye1f/L84vjnT2fv/+yT89//60cn/+XjZ+c/P50t6mXl6xeH8xBb+cUJoTGGnFtgUgjwJWEeMVE80mXEkPON3tnd5FFh7da0mLyxN77/y+9s/+tfejD93XfeXPvmrd3x+tZWaYrckgpRaAJVjaNl1epy2bhF5doqdhRwIYj2ZV6FhVU1dYORboBOa/EU2NSU0LUKusZSgoNddiUlSQNWGpj48tjIOhhnB8Nz/HBI2WHaDbhKgy3wfihcBQrS3bux83Kk97XA6/AOPEhYuPyZ0Y/Dw88Spj5bKxU71O641WA87p90GCJela0Z1EpQ6lvvxIFcU4IEp4teVfknlu6z03e7+yFm5KVkAWViyo3YcS7ZuDT5uDSmGBnJRoaMMUQk1FaeTmdteLw/O3nv58c/+vHPjv7j+x+f/OnTV/MX86qtl5U2r44vNHUaigFenO0HgBUEAAB+gRlTcgiB4uQyUOrZ+5vfvrv58P7Gr711b+1f3todfXdrs7izNR3f2JuWm1vrdrQ2MWaUZ2SsJVWmxgVqGkdN40PjfGhd0KYNvmmDa1t13sWa8txtt3CXGGAkzjnTslYGKaHhU1fbBQDS0rcLAIR+h2e41/56AKCfLq6+LgUAmGIzQyIlSVtQ3SS028fiQQCgS08NlDZ7tH/I1wMAg+pa1Fc/GKYmXNr1otX3OAUA4tQvaL+fpEFVQ9AQ9NKDE1N8TzMWKawxRS42L8TY3IjJjeSWyBoiQ0qtC7RonF7MW3d80SwOz5uz45Nm/9XR4oOn+/M//GR//n8ePZ9/+BfvP5/HBb8n7AIBfLWsLdl7pfj/MWVzOf31b97afOeNjXcf3B3/9s3d8W/s7qw93N4s93Y2R9s760U5XcvsKBc2hshp/P9fN16bNoS6Cb6tg2sb713rXPDBh26ly/3YzPHIl8SmAZyGRY4/63oJEJFSCKT9yLmKGpByPGrAgyG7z6Lqewx2o+QwAJB0C+Ju6I7CKr5A6e7Dn/9tAYB+IX/5xp8KAHQfMt1KvQ9a9IX70ntFfUBC03vElx4xZVB0NV80JTbEaEs8+aAUutosqqyBSIPX1Dk3iKgYYo41eERMJsZaI1lhbJ6JyTORUSY8zpgME/mgNK+8nsxbd3jWzg/PquOTk3r/+Kx+8uRg/scfPD754589Ov3Z4+dnVRNWmSbEljSgeCsAfDYUAQS4AlZZAXGRp+r05vaEx6UdjQoppuujjTf2Nm8+fHPr+w/fXP/+g7vjh3d2x5vbm6N8PMljZWoNpD5Q0zqqWk9V40NdeV9X2tZ1cK2PXeVTCqPEpNO49SEkpBS7AMQr6pbpr4cB4neZYzM/Jel3gPr7pYL63THP1+tYX54R0qV7pj2UvjpBn9w6rLjU7frQoEkTDyeEg10o+uy/U7eplQpTyeDu/T14cGWxE0AMf4R4vFM1aFBW6covGCFjmDk3YkaZMZPSZuXYmqwwZHJDYoVIA/nG03ze6svjqvrkxfzFR5+c/9n7T87+84dPz3/w4mhxsJy31bJy9ZODc0dExFww9deBXSCArwNrxuyDpxi8JVL1urs54XFp8iK3dn1SjPa2Jzvv3N34zW89mP6bh/c3f/3urcnuzvZoVE4sZVkcD5wLtFw6qhYuLBdtW9fONelYVwpNMscigqSUAgCxJEBMTO8qu8Rc/dUW9io4Gi+QVocA0uKfiES6cGg/KNKlcbrT776vBm7qoq0pBaobrFP7u9fG4FXktc8wWH0spD8MH3sQfNDBB8Hqavqowuq4Wrzu/uaDjgU6uPaUtcbD5+YUJ1nt6IdBoVYNGpSUjJBYYSks2SIXWxTW5oU1RZlJURjKMiIRJXWe5nNHhydN8/j54uD9x+c//Omj89/76NnZDw6O5kfLqm2Xta+f7J+63FpufQrwGtRwAYDPhQAAwBW0Kh642rmInQTuTt66u/aNN29Pvnf7xuh7O1vlO9ON4ubGerE5nWRrWxNTTEbGFoURaw0ZExevrVdqW6+tC+pdUNeG4F3wbSB1IQQfNHgfe8+H0PcwYk3VkblrQkhELCzMRIZZhvvrnAo69Tvn3SSQh4mYgwyA4WQv3a1rttRPVHn1FqwyPFXTZLaf0qXGeSkAoNzFIfrlfBel0H6Vr0oaVkcQlILGnf14oD/0z5mqbzOTMIsRFmOUM0Mms2KK3JosF8mtcGaErTAZiVkMbQh0UXk9X3p3NnfVbFbNz86qo9PTav/F8fK9py8Wf/zo2flf/vzZxZMPnxwvh9WdiSyJEfIOi36ArztjMw5eKVWUT2P2u3e3i3fe2Ljzzr3p9+7eWvvnuzvlN7c2i9s7W6PdnWm+tjHO8jI3nBvpqnoouRDI+aDOB21b1aYN3sV6L957Cs4H77sdaiJKg2O/OJZuHBGJI2N3vj1mbXEam4n6UX2wa/56AED7R11ldw326FcBgP6diIHbv1MAoMd06fNg8FCXBr9+YT+4Oa/6sKRPjksJBf0A31WaUUpDfZ9ukD5R4quJo7BhFiMi1oqxViTPxFjLkucsuWEuMmYr8fPVBaLWkS4ap+eLpjmZLRfHp8ujw5P62eFR8/4n+8s//OjJxZ98+OT88ScHF+p93V2gEJGQiJD32O0HgL87HAEAuMJij+oU34up37tbEx6PrC0LUxZFJpNxXuxtlrfu7o1/5Z07k3917+bkO3d2x3dv7JQbW5ujvBxnZDMm0kAaiFwbyDWBmtbpstXQuhAaF4JzwTeNOufUh66XdbclRF1tgG6aGc+r9umVKbufUwggbdZQShVd7WBTV1WZVqmXq17XXZCgO+Da79h0k7g0aUy/Lk0a02/9vLS/Qzef7SapfdpnDDQE5tggKu7w9EKgPgDAwrFGlxHJrJjCih3lZEYZm9HIyqgw8Qx/DBCQ90pNG+j0ogkvjpfzR8/mjz7eX/zF4+fzP3hxOP/p4dH8ycWsqhdN2y4qVz89uHCZtey80mpCaMh7nOsH+EUTj3WlbC4iK0Ktb/Xezakdj2xRFmY0Xcsnd2+uPXjn3sb337678Tv3bq29c3d3vL21OcrHE8s2Y2IOpEGpbT1Vtae61tDUwTdN8FXjnXPe+0CBlNX3qe3UnVOPGQMsmk5OKRFR14ZwdQSAiFYZVXFMHRbvizUD+jV0GuZTtkC6R/fKL6fvDzf44zCuw5sNfsaUWvK9lhQ2kIIRgwDA4GYpG+xTweVBfQJVjsHd7pSAajpAED8auxfIwszWkikMmzwTUxTGFoU1o8JwlgtZSyRddZ2mVbqYOT05bauXR9Xpsxezjz56dv5HH+1f/I8nB7MPj87r87oOi8UyVE8OjtWaossaSe9cRkGXGOcB4P8bAgAA14gY2/WqHqZoxp2mt29vZfdvT964tzd++87u5Du7N8rvbm+N317fyG6srWeb62M7no6L0aTITJEbsUbZiJARIpZYMbl1RE3TZQj4oD50Xz5mCHhH3qUK96QUd8pDv8mSpoBp955pkDmwmqQScX9QoK/8PMjujI8jqyOc2m/qdCme/RSULxXI6meZoeu3oBzikdZuyigkTEomzRD7ylssVojFsBjDIiJshNkalsySGCNsraXMMhtmElYKPsSK/c7rxdK504ummi3dcrZoZ7OlOzs+rZ7uv1r+6PHz2R893p+///RF9eLj5y9DDOqkIZuJKFUMR0sngKtITNaN26tkTVXVX//mrc0Ht9fu37s9+Y27Nyf/7Mb2+N2Nab63Psk21sZ2vDG2RVlYO8pEssxwJrGsX1Al7z35oOq9ahtUnVd1LgQfVNVz8EE1hDiOu0BeByvw1OWPB0tnSpXwUrqXalztp+yq9LVaW9PqJ13gN0UaeJV+Hz8L+goDKRWAVov0/g6v5wxcfhM1jfy0+oyI0eK0sKfVrj7r6hF4VUqBqTuuFcd5IyTWsmTGSJZZYzNhK8y5JU61WpSUWk9UuaDLOvjZsm1ny7aezdrZxbw5Ozmr949P6o9evlr+8NmL2U9+/nz+158cLM5enlc0DN7HAD52+QHgi8HTjU17enaCAADANWJsycEHiummcZJhWMgFp3durMt4ZIpRYYpRkRWjMium02Lr5k758MHNjd+5e3P9127tlve3p3ZzZz0fbZaZHa9ZzjJDLETBdYtbH8jHVFRyrWrTUmibECoXfOs0uBB8cPEsvMbNqhB0kFvZT7nijo2scjapq7DcJRSkVT4R6WDa2N+C+vt19+7X+V1Kp6bU/z5aEFP5Q9DuKKyyxkzLuJtvRUU4LfhFMiMyysTkuZgsFzZW2AiTNUxWiNgIMRsiJWpbT4ul05Ozpj08a2ZPXy2efrI/+4uPn5//wf7R4q8Pz6rDqvZ1XfnFonL1bNHU+68ugpGC48mCQGnhb8VSO9jp317bZlWlk/kJJooAVwzbnMmno12WVFvd21rnSSn5uLTlqMjNuLSTrY1ia3dr9PYbe2u/dXdv8t03bk0e3twZ7dzYKsr1cRY7hwgRcez96lXJe6W2DdS2pG1D2jgNTRtC67xvnHofSIOP8YFY1C61jNW43ueU5s8kXTAgNZFN47R0+fJE1NdP6euw6KqVawr5Eg0OYQ3eh0uDW7dyT4etiCjWXOlSDvpMgi5vLMQbxJFU4959ythKHz3a35lZRESIyAiJGDbWkhSZmCIXm1mVLGMucst5UZCxNu7uk1Lwnpra0dlFEw5P6+WTl8sXT19WHzw5WP7J/qvFD18ezj84n1Wzed34unZ1Vbl6vnTVwclCh3Vbujg1acBRLgD44iAAAABERGRs0Z1BJYqLzFTAj0nV6629Tb63tza9e3Ptwa298ju7W/mv7m7k725P8r219WKnKLPxuDTjcW7ycWGyUW5MkYtkhtkwM3V9n1Pb5sCUSiXHKvkhqA9ELrZH6opRBfIaVD2FWE45Ng2IVxf6Gs4Ui/+phpiqSfF4a58kEF9HV/sqHklIGztdDUNi6WarIkTCFGd9MYWfhQ2JEIswGyNxd4eJReKDG4q7PSxMnohaH6hqvFa181UT3KJRV1VaV7WrZov64mLenBye1I8OTpr/+/Rg8YMn+xfvP35x8erx85M29m2O73uaADLHc57OffYO0N7WHpMqhRDo8PwIE0WAKy6zJQciioNl6gLTHaJSr7d3pnxnd7J+9+bkzXu31757e7f8rb3t4pubG/nN9Uk2LQsZjUspxoXJJqXNRrmVzAobFuK040wxPytQrEbvXdDWe/VNCN5rSIt5r6qtD8GFoN6TD2GVJk9EgyP/3Vkp6g9xxVwupS4UuwoOcFdLIHSr91Us97VQgKb1uqb2BkwqaQ0fe82sssi4O+OQ8sOYJX4+GSN9UFeYyQizMUasEbaG2QiREWVhpcxIzHojJed8N95TmNXBzZauWSxdtVg0i8WivTg5q/YPjqv3Hr+Y/9HTl9VPnrxYfvKTD54thUes1F76dyMiYrEUcJ4fAL5kOAIAAJcYux5bC/ZdBVY7zqqN7u2s8bi0+aiQsszNeGSNzfLcZaN8tLme39zdKt69tV1+d2+r/KXdzfyNzUm2uTHO1salzddKm5dja4pC2GZMxkhaefe1ozQQBa8Ugif1nlzw5IJScKzBk2pQ8t00UimVWI7V/4OSBh/DAaE/LkBdEEAGaahxmW1iBj8bQ5wOvlojnFlia4nEEIkIyaBHdjqrz8ykQcm3gVzdUl23uqyDP1+69vi8mr08Xh4cHFePDo6bvzo8dT85Pmsen8+bV7NFddG0LVV16xeVns+Wvnr+8lRFclYdpvYbMkbIoYgfAHyOVc/3NFzE8Xp3a43Xxlk+KbOiHJmyyE0xKe3a2jjb2NnI7+5tlb98Z3fyG3vb5Vs3NovdjXE2Xp/kxXhkbVlmko+ETCbErKSxhQl55ykNVaqxWGnd+NC4oK3T4Jx65zXEoG5sIBsChRBC1wFFYwBAV20Ku3DBqoBrytVPtfzTTXVV/a87GtBHGeJin+NJ/O4+IiTCGrsgcCxvKIaNEWFjWaw1kmdissywtczWMBnpvkz8bDKpzUsIFLyn4IiqlmhehXBy1lQHR7OjJ/sX7z95tfjzZ0f1j45Om5+fX9SHVe3qqnF+UfnZbNHWj/dPus4sqS0rEZElIkNsmUKL8/wA8A8DAQAA+DszNmfttncuTza7PXCt9c6tbb61U05vbpc39zaLB1vr2b3pWv7W+ji7M12zd9bWshtladaLwpZ5bvI8t3meG1vkxubWmDyzYpjZcCDhwMKx01S3QU/xDD3FDM3u2S8dMu2KaAeNu1eqFLeBlFd9oZVTMT8iXuU7hKDa5aqyspILQZ0L6hxp3YbQtt43LvjWBe+9+rYJbV37qq6axWLZnF/M3dHZrH16eLp87+B4+ejgqP7gxXHz9PDUXTw9eKXM4+78/upsp3DcTcJCHwC+SMYUMZh7KWleKQYHWr21vc57W+Pxnd3J3s3t8sHu9ujbm+vZO5vr2YP1cbaztpbtlKWdFIUti1zyopBslIsdGTGFNZJlVvJMWEysaxL7z3Ofla8UjxdoIAqBNAQlp540aFeKhjU1I4xXprGNXrrM7jhWfwwgVRDU/pQAx4yHLsGfiISJu7NaxDG+HLO3Ugg4dLUGlLW7LUlM56JA3VEI57VuvNaN88vatU3rfNMG1zauaZvQ1E2oFku9uFiG08PT+qP9g4v/9fjZ6Y8/eTl/un/UvNw/OtdYqyVJnReJWGKIo3Vo1QcAXx0EAADg70XMiLWfXA4LMzGpNrqztcbjXEyRS1HkNsszKYpMijwTYzMpc2upyG1WlmY6KbOdjXF+Z2OteGt9vbhXFnZjXMh0lMt4Uti18ciMy9zko8LkZWGyIjPGWhYj3BXbI7KmK7zEXaGroKvKVV12QaC4Y6WBybu4uG9dCLXX0DTeVXVoG69u6dUtG1/Pls35bNYcn120T88X7f5s0T6fL9uD+aJ5uazcRd34ZduGtnHeta1rm1bruvH1snbtomqXTw5mLRFRXPjHhNr0PrEIBVTqB4AvWewskMafVEU+BQLiua97e5tSjkxR5FyMchnnmRR5ZrLcWspza8ejbLo1zd7cnRbf2pkW39paL+5srBe7G+v51uZaPplO7GhS5nZUZpzlhrKMSSzFFXl3HaoaD26l0wNxO57IpMJ9YdV1heNivTusH6+XA6U2rLFKLBOp0Cp9LB7vigvtwVcqIRuUQhOorgI1tSffBnWetHEh1E7DrHLN+aJZnpw1R0cni6evTpYfvDpZ/vj0ono+W7SzZe1PXavL1gdqnS6bVhfL2tXzRVOfz+rq5elSV0e4iFJgnMVQ8HOM9QDwtYEAAAB8YTI7ZtLQ1fXvMgViumd3izC4tekqUsfq9W/d3rbra3mxsV6sjUu7Nh7Z9fHIbK2X+Y3JyNyYjMzeeCQ3x6XdKXK7nlsurYi1VnJrKMss5Zmh3BqxTEKqqj6dQWUmjUWt42ZUIO/a0LSNX9RtWFatzpvGXSwrf1y14WzehONZ5Q8u5u2L84v64PSiOTqfN8vZ0i3ny9a9ODzTzGTsQno9w7ldX2AgloymOAt1Dot9APh6yGzBq6aq1I3VRKtA5TCoK5RLRlvTjPY2i/Ubm6PNrWmxO90obk038gc7G/nD7Y38relktDee5NPRyE7yQoos40ysmHienowwkwiLYSZjSIw1IlkmbGPtFSaNu/ZdVlRc83OK2g4CACkHTYhVuiBAIO+DBlXygbQNPjj16kPQ4Cioqnqnoa19u5y7ebVsFk0dlk0bqmUdzha1v7hYti9PZs2HRyf1+6+OF49eHi0PXp0sZo/2z+pMDLtV64JO/DsTUeyb2Pe0pfZvqNcCAPB1wJsbU3uCAAAAfImMlIMK9sOMgfTneOZddZUWefPGBlvLprBiMis2N5xZy0WWibHCVoSNCJOwkAhlRoQMkxWhjCgWklKSZbcgV9LAIXhLHDJVpeCp9T4476l1gWrvPcWzq8E1XtvGad203teN969O4u6NSMbav46h4WEEIWMMUvoB4BeKtWMOXkn7LIHLxWBTgUEiots765znYotYC6YsR7YY5dZkWUbWcGYslSJsjeHMGpE8k9JaM84yMy4yu17mZqsY2d0sz9ZMxhNrKDdMYo2UxkgmwtbEKqzCrEKxwmu8GNWgca0furCBatDQOj+vW1osm3Ayb9rjeVW/rGt30tZh5oM2rde6bV3V1q5tW0fe6dJ7bVuvvnVaN867unHtovLLReXcq5N5t6M/HMqFVuO9kDCTD1jsA8AvFgQAAOArZ22RCkER0eW0/e54Z//7ynCHiihOzIaBBRl8Ea0ms/61+66q7fd4UJf5Uq/qtLuPHR4AuD6MGfHlgG3K7grxj5zWyWksHY7FTNbIpXPvD+7sSlEYk+cmM4ZsZigzzGSNWGvYiIgxzMIi8VRXDAAokcQMgL4WDVFg9hSU2jbUVavLRROai6pt5staD4/OlYgol5IddzEEHX4GpGtmEondBnT4/e7lCBO1rsGYDwBXgn1tRg0A8A/ub2pvl1hbcmoeNagQRZ8ubvVZf09dDF6vVZB+T1/dzg4ziRB57OADABARkfefPR5mNtYX+HRhWKZVsVMl50Ms4tePtUaF2flQtV/0tWY2Z+djsDc+Z7oMGdyK6fXxX5ipxVEtALgG7Fd9AQAAn8c5tEcCAPi6aT9nbM5sGTvHDI/OD7KujMl5FaSN39NPBWp1kF0Qg7Scvv960EH7bgDEbPsCgI3H7j0AQGIxIgIAAADAF+3zAgQAAPAPTz7/JgAAAAAAX397mzu8t7XLn39LAIDrCRkAAAAAAHAlvDw9wtQWAOBvgQwAAAAAAAAAgGtAVkVWAAAAAAAAAOCqEiz/AQAAAAAAAK4+6Zq3AgAAAAAAAMAVhhoAAAAAAAAAANeAYPsfAAAAAAAA4OpDEUAAAAAAAACAa0CIEQEAAAAAAAAAuOqEsfwHAAAAAAAAuPKEUQQAAAAAAAAA4MoTUkIIAAAAAAAAAOCKQxtAAAAAAAAAgGtAkAAAAAAAAAAAcPUhAwAAAAAAAADgGkAbQAAAAAAAAIBrABkAAAAAAAAAANeAIAEAAAAAAAAA4OpDBgAAAAAAAADANSCkijYAAAAAAAAAAFccMgAAAAAAAAAArgFR1AAAAAAAAAAAuPKQAQAAAAAAAABwDQihDQAAAAAAAADAlYcMAAAAAAAAAIBrAAEAAAAAAAAAgGsAAQAAAAAAAACAawABAAAAAAAAAIBrAAEAAAAAAAAAgGtACE0AAAAAAAAAAK48ZAAAAAAAAAAAXANCqvpVXwQAAAAAAAAAfLmQAQAAAAAAAABwDSAAAAAAAAAAAHANCDGqAAIAAAAAAABcdcgAAAAAAAAAALgGEAAAAAAAAAAAuAYQAAAAAAAAAAC4BhAAAAAAAAAAALgGEAAAAAAAAAAAuAYQAAAAAAAAAAC4BoRJv+prAAAAAAAAAIAvGTIAAAAAAAAAAK4BBAAAAAAAAAAArgFRZZwBAAAAAAAAALjikAEAAAAAAAAAcA0IMfFXfREAAAAAAAAA8OVCBgAAAAAAAADANYAAAAAAAAAAAMA1gAAAAAAAAAAAwDUgaAEAAAAAAAAAcPUhAwAAAAAAAADgGhBm5AAAAAAAAAAAXHXIAAAAAAAAAAC4BkSJv+prAAAAAAAAAIAvmRBOAAAAAAAAAABceYL9fwAAAAAAAICrT0iRAwAAAAAAAABw1QkxigAAAAAAAAAAXHXoAgAAAAAAAABwDSAAAAAAAAAAAHANIAAAAAAAAAAAcA0gAAAAAAAAAABwDSAAAAAAAAAAAHANiKqiDSAAAAAAAADAFYcMAAAAAAAAAIBrAAEAAAAAAAAAgGtAmJm/6osAAAAAAAAAgC+XYPUPAAAAAAAAcPXhCAAAAAAAAADANYAAAAAAAAAAAMA18P8A/dEiXpxWzlwAAAAASUVORK5CYII="""
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "uws_logo.png")
+LOGO_CACHE = os.path.join(CACHE_DIR, "logo")
+_logo_by_width = {}
 
 # --- 🛠️ CORE UTILITIES ---
-def add_watermark(image_path, base64_str):
-    if not base64_str or len(base64_str) < 100 or "PASTE" in base64_str: return
+def get_logo(width):
+    """RGBA logo resized to `width`, decoded at most once per width (memory first, then the disk cache)."""
+    if width in _logo_by_width: return _logo_by_width[width]
+    from PIL import Image
+    with open(LOGO_PATH, "rb") as f: source = f.read()
+    # Keyed on the asset's content, not its mtime: a fresh checkout touches every file
+    cached = os.path.join(LOGO_CACHE, f"uws_logo_{hashlib.sha1(source).hexdigest()[:12]}_{width}.png")
+    if os.path.exists(cached):
+        logo = Image.open(cached).convert("RGBA")
+    else:
+        logo = Image.open(BytesIO(source)).convert("RGBA")
+        height = int(float(logo.size[1]) * (width / float(logo.size[0])))
+        logo = logo.resize((width, height), Image.Resampling.LANCZOS)
+        os.makedirs(LOGO_CACHE, exist_ok=True)
+        # Render workers may read the cache concurrently, so publish it whole
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        logo.save(tmp, format="PNG")
+        os.replace(tmp, cached)
+    _logo_by_width[width] = logo
+    return logo
+
+@traced("watermark")
+def add_watermark(png_bytes):
+    """Composites the logo onto encoded chart bytes in place and returns the re-encoded PNG."""
+    if not os.path.exists(LOGO_PATH): return png_bytes
     try:
-        clean_str = "".join(base64_str.split())
-        rem = len(clean_str) % 4
-        if rem > 0: clean_str += "=" * (4 - rem)
-        logo_data = base64.b64decode(clean_str)
-        logo = Image.open(BytesIO(logo_data)).convert("RGBA")
-        base_img = Image.open(image_path).convert("RGBA")
+        from PIL import Image
+        base_img = Image.open(BytesIO(png_bytes)).convert("RGB")
         bw, bh = base_img.size
-        logo_w = int(bw * 0.06) 
-        w_percent = (logo_w / float(logo.size[0]))
-        logo_h = int((float(logo.size[1]) * float(w_percent)))
-        logo = logo.resize((logo_w, logo_h), Image.Resampling.LANCZOS)
-        position = (bw - logo_w - 30, 30) 
-        transparent = Image.new('RGBA', base_img.size, (0,0,0,0))
-        transparent.paste(base_img, (0,0))
-        transparent.paste(logo, position, mask=logo)
-        transparent.convert("RGB").save(image_path)
-    except: pass
-
-def get_tradingview_intel():
-    """TradingView JSON Feed: Fetches high-impact USD events specifically."""
+        logo = get_logo(int(bw * 0.06))
+        base_img.paste(logo, (bw - logo.size[0] - 30, 30), mask=logo)
+        out = BytesIO()
+        base_img.save(out, format="PNG")
+        return out.getvalue()
+    except: return png_bytes
+
+@traced("webhook")
+def post_to_discord(webhook, embeds, files):
+    """files maps form field -> (filename, PNG bytes); nothing is read from or written to disk."""
+    multipart = {field: (fname, data, 'image/png') for field, (fname, data) in files.items()}
+    return get_session("http").post(webhook, files=multipart, data={"payload_json": json.dumps({"embeds": embeds})}, timeout=30)
+
+# --- 🔌 POOLED HTTP SESSIONS ---
+TV_EVENTS_URL = "https://economic-calendar.tradingview.com/events"
+FINNHUB_NEWS_URL = "https://finnhub.io/api/v1/news"
+# Per-request timeouts; TradingView may make two attempts (curl_cffi, then requests)
+TV_ATTEMPT_TIMEOUT = 8
+FINNHUB_TIMEOUT = 8
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def get_session(kind):
+    """Process-wide keep-alive sessions, so a warm daemon reuses its TLS connections.
+    'browser' is the curl_cffi Chrome impersonator, anything else a plain requests session."""
+    with _sessions_lock:
+        if kind not in _sessions:
+            if kind == "browser":
+                from curl_cffi import requests as anti_bot_requests
+                _sessions[kind] = anti_bot_requests.Session(impersonate="chrome120")
+            else:
+                _sessions[kind] = discord_requests.Session()
+        return _sessions[kind]
+
+@traced("tradingview")
+def fetch_tradingview_events():
+    """Today's high-impact USD events as [(time NY, title)]. Raises on network and parse errors."""
     tz_ny = pytz.timezone('America/New_York')
     tz_utc = pytz.UTC
     now = datetime.now(tz_ny)
@@ -50,140 +141,513 @@ def get_tradingview_intel():
     start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0).strftime('%Y-%m-%dT%H:%M:%SZ')
     end = now_utc.replace(hour=23, minute=59, second=59, microsecond=0).strftime('%Y-%m-%dT%H:%M:%SZ')
     
-    url = f"https://economic-calendar.tradingview.com/events?from={start}&to={end}&countries=US"
+    url = f"{TV_EVENTS_URL}?from={start}&to={end}&countries=US"
     
-    today_reds = []
+    # Try multiple impersonation strategies
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'application/json, text/plain, */*',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Origin': 'https://www.tradingview.com',
+        'Referer': 'https://www.tradingview.com/',
+        'Sec-Fetch-Dest': 'empty',
+        'Sec-Fetch-Mode': 'cors',
+        'Sec-Fetch-Site': 'same-site',
+    }
+    
+    # Try curl_cffi first (most effective)
     try:
-        # Try multiple impersonation strategies
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Origin': 'https://www.tradingview.com',
-            'Referer': 'https://www.tradingview.com/',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-site',
-        }
-        
-        # Try curl_cffi first (most effective)
-        try:
-            resp = anti_bot_requests.get(url, impersonate="chrome120", timeout=15, headers=headers)
-        except:
-            # Fallback to regular requests with headers
-            resp = discord_requests.get(url, headers=headers, timeout=15)
-        
-        resp.raise_for_status()
-        
-        data = resp.json()
-        
-        for event in data.get('result', []):
-            # Importance 1 is High Impact (Red Folder)
-            if event.get('importance') == 1:
-                title = event.get('title')
-                date_raw = event.get('date')
-                
-                if not date_raw or not title:
-                    continue
-                
-                # Parse UTC time - handle potential format variations
+        resp = get_session("browser").get(url, timeout=TV_ATTEMPT_TIMEOUT, headers=headers)
+    except:
+        # Fallback to regular requests with headers
+        resp = get_session("http").get(url, headers=headers, timeout=TV_ATTEMPT_TIMEOUT)
+    
+    resp.raise_for_status()
+    
+    data = resp.json()
+    
+    events = []
+    for event in data.get('result', []):
+        # Importance 1 is High Impact (Red Folder)
+        if event.get('importance') == 1:
+            title = event.get('title')
+            date_raw = event.get('date')
+            
+            if not date_raw or not title:
+                continue
+            
+            # Parse UTC time - handle potential format variations
+            try:
+                dt_utc = datetime.strptime(date_raw, '%Y-%m-%dT%H:%M:%S.000Z').replace(tzinfo=tz_utc)
+            except ValueError:
                 try:
-                    dt_utc = datetime.strptime(date_raw, '%Y-%m-%dT%H:%M:%S.000Z').replace(tzinfo=tz_utc)
+                    # Try without milliseconds
+                    dt_utc = datetime.strptime(date_raw, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz_utc)
                 except ValueError:
-                    try:
-                        # Try without milliseconds
-                        dt_utc = datetime.strptime(date_raw, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz_utc)
-                    except ValueError:
-                        # Skip events with unparseable dates
-                        print(f"Warning: Could not parse date '{date_raw}' for event '{title}'")
-                        continue
-                
-                # Convert to Eastern time
-                dt_ny = dt_utc.astimezone(tz_ny)
-                
-                # Mark as complete (✅) if already passed, upcoming (🚩) if in future
-                status = "✅" if dt_ny < now else "🚩"
-                time_str = dt_ny.strftime('%I:%M %p')
-                today_reds.append(f"{status} **{title}** @ {time_str} EST")
-        
-        if today_reds:
-            return "\n".join(today_reds), 0xe74c3c
+                    # Skip events with unparseable dates
+                    print(f"Warning: Could not parse date '{date_raw}' for event '{title}'")
+                    continue
             
+            # Convert to Eastern time
+            events.append((dt_utc.astimezone(tz_ny), title))
+    return events
+
+def load_tradingview_events():
+    """(events, None) on success, or (None, fallback (text, color)) when the feed failed."""
+    from curl_cffi import requests as anti_bot_requests
+    try:
+        return fetch_tradingview_events(), None
     except anti_bot_requests.exceptions.RequestException as e:
         print(f"TradingView API Request Error: {e}")
-        return f"⚠️ Economic calendar temporarily unavailable (network error).", 0x95a5a6
+        return None, (f"⚠️ Economic calendar temporarily unavailable (network error).", 0x95a5a6)
     except json.JSONDecodeError as e:
         print(f"TradingView API JSON Error: {e}")
-        return f"⚠️ Economic calendar temporarily unavailable (parse error).", 0x95a5a6
+        return None, (f"⚠️ Economic calendar temporarily unavailable (parse error).", 0x95a5a6)
     except Exception as e:
         print(f"TradingView API Unexpected Error: {e}")
         import traceback
         traceback.print_exc()
-        return f"⚠️ Economic calendar temporarily unavailable.", 0x95a5a6
+        return None, (f"⚠️ Economic calendar temporarily unavailable.", 0x95a5a6)
+
+def get_tradingview_intel(events=None):
+    """TradingView JSON Feed: Fetches high-impact USD events specifically.
+    Already-fetched `events` are only re-rendered, so statuses can refresh without another request."""
+    if events is None:
+        events, error = load_tradingview_events()
+        if error: return error
+    now = datetime.now(pytz.timezone('America/New_York'))
+    today_reds = []
+    for dt_ny, title in events:
+        # Mark as complete (✅) if already passed, upcoming (🚩) if in future
+        status = "✅" if dt_ny < now else "🚩"
+        time_str = dt_ny.strftime('%I:%M %p')
+        today_reds.append(f"{status} **{title}** @ {time_str} EST")
     
+    if today_reds:
+        return "\n".join(today_reds), 0xe74c3c
     return "✅ No High Impact USD News Scheduled.", 0x2ecc71
 
+# --- 🗞️ HEADLINE MATCHING ---
+# Briefing instruments and their aliases, in priority order; UWS_HEADLINE_ASSETS=<json file> replaces them
+HEADLINE_ASSETS = {"Gold": ["gold", "xau"], "Nasdaq": ["nasdaq", "tech", "nq"]}
+BRIEFING_LIMIT = int(os.getenv("UWS_BRIEFING_LIMIT", "2"))
+BRIEFING_MAX_AGE = 24 * 3600
+NEWS_STATE = os.path.join(CACHE_DIR, "finnhub_news.json")
+NEWS_SEEN_KEEP = 2000
+_headline_matcher = None
+
+def _trie_pattern(words):
+    """Alternation factored into a prefix trie, so each position is tested against shared prefixes once."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word: node = node.setdefault(ch, {})
+        node[""] = {}
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches: return ""
+        if len(branches) == 1 and "" not in node: return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+    return build(trie)
+
+def compile_headline_matcher(assets):
+    """(regex, alias -> (priority, name)) for one case-insensitive single pass over a headline.
+    Aliases only match as whole words, so "nq" no longer fires inside "inquiry". Blank aliases are dropped,
+    since an empty alternative would match every headline; a config with no aliases left raises ValueError."""
+    if not isinstance(assets, dict): raise ValueError(f"Headline assets must map names to alias lists, got {type(assets).__name__}")
+    owner = {}
+    for rank, (name, aliases) in enumerate(assets.items()):
+        if isinstance(aliases, str) or not all(isinstance(a, str) for a in aliases):
+            raise ValueError(f"Headline aliases for {name!r} must be a list of strings")
+        for alias in aliases:
+            if alias.strip(): owner.setdefault(alias.strip().lower(), (rank, name))
+    if not owner: raise ValueError("Headline assets define no non-empty aliases")
+    return re.compile(rf"(?<!\w){_trie_pattern(owner)}(?!\w)", re.IGNORECASE), owner
+
+def get_headline_matcher():
+    global _headline_matcher
+    if _headline_matcher is None:
+        assets = HEADLINE_ASSETS
+        if os.getenv("UWS_HEADLINE_ASSETS"):
+            with open(os.getenv("UWS_HEADLINE_ASSETS")) as f: assets = json.load(f)
+        _headline_matcher = compile_headline_matcher(assets)
+    return _headline_matcher
+
+def match_headline(headline, matcher=None):
+    """Highest-priority instrument the headline names, or None."""
+    regex, owner = matcher or get_headline_matcher()
+    hits = [owner[m.group(0).lower()] for m in regex.finditer(headline)]
+    return min(hits)[1] if hits else None
+
+def _load_news_state():
+    if not os.path.exists(NEWS_STATE): return {"min_id": 0, "seen": [], "latest": {}}
+    with open(NEWS_STATE) as f: return json.load(f)
+
+def _save_news_state(news):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(NEWS_STATE + ".tmp", "w") as f: json.dump(news, f)
+    os.replace(NEWS_STATE + ".tmp", NEWS_STATE)
+
+@traced("finnhub")
 def get_finnhub_briefing(api_key):
-    """Briefing: Fetches instrument-specific headlines for Gold and Nasdaq."""
+    """Briefing: the newest headline per watched instrument.
+    Only headlines after the last seen Finnhub id are fetched and classified; matches persist between runs."""
     if not api_key: return "Briefing offline."
-    url = f"https://finnhub.io/api/v1/news?category=general&token={api_key}"
     try:
-        resp = discord_requests.get(url, timeout=10)
+        news = _load_news_state()
+        url = f"{FINNHUB_NEWS_URL}?category=general&minId={news['min_id']}&token={api_key}"
+        resp = get_session("http").get(url, timeout=FINNHUB_TIMEOUT)
         data = resp.json()
-        found = []
-        assets = {"Gold": ["gold", "xau"], "Nasdaq": ["nasdaq", "tech", "nq"]}
-        for item in data[:50]:
-            h, l = item['headline'], item['url']
-            for name, keys in assets.items():
-                if any(k in h.lower() for k in keys) and name not in [x.split(":")[0] for x in found]:
-                    found.append(f"• **{name}**: [{h[:65]}...]({l})")
-                    break
-            if len(found) >= 2: break
+        seen = set(news["seen"])
+        for item in data:
+            if item['id'] in seen: continue
+            seen.add(item['id'])
+            name = match_headline(item['headline'])
+            if name and item['datetime'] >= news["latest"].get(name, {}).get('datetime', 0):
+                news["latest"][name] = {k: item[k] for k in ('id', 'headline', 'url', 'datetime')}
+        if data: news["min_id"] = max(news["min_id"], max(item['id'] for item in data))
+        news["seen"] = sorted(seen)[-NEWS_SEEN_KEEP:]
+        _save_news_state(news)
+
+        cutoff = time.time() - BRIEFING_MAX_AGE
+        fresh = sorted(((v['datetime'], name, v) for name, v in news["latest"].items() if v['datetime'] >= cutoff), reverse=True)
+        found = [f"• **{name}**: [{v['headline'][:65]}...]({v['url']})" for _, name, v in fresh[:BRIEFING_LIMIT]]
         return "\n".join(found) if found else "No sector headlines today."
     except: return "Briefing unavailable."
 
-def get_precision_data(ticker):
-    df = yf.download(ticker, period="2d", interval="5m", progress=False)
-    if df.empty: return None, None
+# --- 💾 LOCAL BAR STORE ---
+BAR_STORE = os.path.join(CACHE_DIR, "bars")
+# One structured record per bar; a whole symbol/interval lives in one .npy so a rewrite is a single atomic replace
+BAR_DTYPE = np.dtype([("ts", "<i8"), ("Open", "<f8"), ("High", "<f8"), ("Low", "<f8"), ("Close", "<f8"), ("Volume", "<f8")])
+BAR_COLUMNS = list(BAR_DTYPE.names[1:])
+# Period used to seed an empty (or too stale) store, and how far back yfinance serves each interval
+BAR_SEED_PERIOD = {"1m": "5d", "5m": "1mo"}
+BAR_MAX_GAP = {"1m": pd.Timedelta(days=7), "5m": pd.Timedelta(days=59)}
+
+def _bar_path(symbol, interval):
+    safe = re.sub(r"[^A-Za-z0-9]", "_", symbol)
+    return os.path.join(BAR_STORE, f"{safe}_{interval}.npy")
+
+def _read_bars(symbol, interval):
+    path = _bar_path(symbol, interval)
+    if not os.path.exists(path): return np.empty(0, dtype=BAR_DTYPE)
+    return np.load(path, mmap_mode="r")
+
+def load_bars(symbol, interval, lookback=None):
+    """Stored bars as a US/Eastern OHLCV frame, optionally only the last `lookback` before the newest bar."""
+    bars = _read_bars(symbol, interval)
+    if lookback is not None and len(bars):
+        bars = bars[np.searchsorted(bars["ts"], bars["ts"][-1] - lookback.value):]
+    index = pd.to_datetime(np.array(bars["ts"]), utc=True).tz_convert('US/Eastern')
+    return pd.DataFrame({c: np.array(bars[c]) for c in BAR_COLUMNS}, index=index)
+
+def sync_bars(symbol, interval):
+    """Downloads only the bars after the last stored timestamp and appends them. Returns the changed bar count."""
+    import yfinance as yf
+    old = _read_bars(symbol, interval)
+    last = pd.Timestamp(int(old["ts"][-1]), tz="UTC") if len(old) else None
+    # Ticker.history keeps no shared state, unlike yf.download, so it is safe to call from the fetch pool
+    if last is None or pd.Timestamp.now(tz="UTC") - last > BAR_MAX_GAP[interval]:
+        df = yf.Ticker(symbol).history(period=BAR_SEED_PERIOD[interval], interval=interval)
+    else:
+        # Re-fetch the last stored bar too: it may still have been forming when it was saved
+        df = yf.Ticker(symbol).history(start=last, interval=interval)
+    return store_bars(symbol, interval, df)
+
+def store_bars(symbol, interval, df):
+    """Merges a tz-aware OHLCV frame into the store; its bars replace any stored ones in the same time span.
+    Returns how many bars changed: added, revised (a forming bar that moved) or dropped from that span."""
     if isinstance(df.columns, pd.MultiIndex): df.columns = df.columns.get_level_values(0)
-    df.index = df.index.tz_convert('US/Eastern')
-    
-    session_start = datetime.combine(df.index[-1].date(), dtime(8, 30)).replace(tzinfo=pytz.timezone('US/Eastern'))
-    window = df[df.index >= session_start]
-    if window.empty: window = df.tail(50)
-    
-    sess_o = window.iloc[0]['Open']
-    aH = (window['High'].values.flatten() - sess_o).tolist()
-    aL = (sess_o - window['Low'].values.flatten()).tolist()
-    
-    def p_rank(arr, p):
-        s = sorted(arr)
-        return s[max(0, math.ceil((p/100) * len(s)) - 1)]
-
-    raw_lvls = {"P50 H": sess_o + p_rank(aH, 50), "P50 L": sess_o - p_rank(aL, 50),
-                "P75 H": sess_o + p_rank(aH, 75), "P75 L": sess_o - p_rank(aL, 75),
-                "P90 H": sess_o + p_rank(aH, 90), "P90 L": sess_o - p_rank(aL, 90)}
-
-    sorted_items = sorted(raw_lvls.items(), key=lambda x: x[1])
-    clean_lvls, last_p, clearance = {}, -float('inf'), sess_o * 0.0002 
-    for label, price in sorted_items:
-        if abs(price - last_p) > clearance:
-            clean_lvls[label] = price
-            last_p = price
-    
-    df_1m = yf.download(ticker, period="1d", interval="1m", progress=False)
-    if isinstance(df_1m.columns, pd.MultiIndex): df_1m.columns = df_1m.columns.get_level_values(0)
-    df_1m.index = df_1m.index.tz_convert('US/Eastern')
-    return df_1m.tail(150), clean_lvls
+    df = df.dropna(subset=['Open', 'High', 'Low', 'Close'])
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    if df.empty: return 0
 
-def main():
-    webhook = os.getenv("DISCORD_WEBHOOK_URL")
-    finnhub_key = os.getenv("FINNHUB_KEY")
+    old = _read_bars(symbol, interval)
+    new = np.empty(len(df), dtype=BAR_DTYPE)
+    new["ts"] = df.index.tz_convert("UTC").as_unit("ns").asi8
+    for c in BAR_COLUMNS: new[c] = df[c].to_numpy(dtype=float) if c in df else 0.0
+    lo, hi = np.searchsorted(old["ts"], new["ts"][0]), np.searchsorted(old["ts"], new["ts"][-1], side="right")
+    span = old[lo:hi]
+    at = np.minimum(np.searchsorted(span["ts"], new["ts"]), max(len(span) - 1, 0))
+    same_ts = span["ts"][at] == new["ts"] if len(span) else np.zeros(len(new), dtype=bool)
+    matched, kept = np.count_nonzero(same_ts), np.count_nonzero(same_ts & (span[at] == new)) if len(span) else 0
+    # Added + revised + dropped
+    changed = (len(new) - matched) + (matched - kept) + (len(span) - matched)
+    if not changed: return 0
+    merged = np.concatenate([old[:lo], new, old[hi:]])
+
+    path = _bar_path(symbol, interval)
+    os.makedirs(BAR_STORE, exist_ok=True)
+    np.save(path + ".tmp.npy", merged)
+    os.replace(path + ".tmp.npy", path)
+    return changed
+
+def read_bar_csv(path, tz=None):
+    """OHLCV frame from a Datetime-indexed CSV. Timestamps need a UTC offset unless `tz` names the zone the
+    naive ones were written in; guessing UTC would shift every bar of a local-time export by hours."""
+    df = pd.read_csv(path, index_col=0)
+    stamps = df.index.astype(str).str.strip()
+    aware = stamps.str.contains(r"(?:Z|[+-]\d\d:?\d\d)$")
+    if aware.all():
+        df.index = pd.to_datetime(stamps, utc=True)
+    elif aware.any():
+        raise ValueError(f"{path} mixes timestamps with and without a UTC offset")
+    elif tz is None:
+        raise ValueError(f"{path} has timestamps without a UTC offset; pass --tz with the zone they are in")
+    else:
+        df.index = pd.to_datetime(stamps).tz_localize(tz, ambiguous="infer")
+    return df
+
+def refresh_bars(symbol):
+    """Brings both stored intervals for `symbol` up to date; a failed interval keeps serving its stored bars."""
+    changed = {}
+    with stage("bars", symbol=symbol) as record:
+        for interval in ("5m", "1m"):
+            try:
+                changed[interval] = sync_bars(symbol, interval)
+            except Exception as e:
+                print(f"Bar sync failed for {symbol} {interval}, using stored bars: {e}")
+        record["changed"] = changed
+    return changed
+
+# --- 📐 SESSION LEVELS ---
+LEVEL_PCTS = (50, 75, 90)
+LEVEL_LABELS = [f"P{p} {side}" for p in LEVEL_PCTS for side in ("H", "L")]
+# Sessions pooled into the excursion distribution: the live one plus N-1 closed ones before it
+LEVEL_SESSIONS = int(os.getenv("UWS_LEVEL_SESSIONS", "1"))
+LEVEL_CLEARANCE = 0.0002
+SESSION_ANCHOR = pd.Timedelta(hours=8, minutes=30)
+
+def p_rank(samples, pcts=LEVEL_PCTS):
+    """Nearest-rank percentiles along the last axis of a NaN-padded array; every pct comes from one sort."""
+    s = np.sort(samples, axis=-1)
+    n = np.count_nonzero(~np.isnan(s), axis=-1)[..., None]
+    idx = np.maximum(0, np.ceil(np.asarray(pcts) / 100 * n) - 1).astype(np.intp)
+    return np.take_along_axis(s, idx, axis=-1)
+
+def level_prices(ups, downs, opens, pcts=LEVEL_PCTS):
+    """(tickers, samples) excursions above/below each open -> (tickers, levels) prices in LEVEL_LABELS order."""
+    q = p_rank(np.stack([ups, downs], axis=1), pcts)
+    opens = np.asarray(opens, dtype=float)[:, None]
+    prices = np.empty((len(opens), 2 * len(pcts)))
+    prices[:, 0::2], prices[:, 1::2] = opens + q[:, 0], opens - q[:, 1]
+    return prices
+
+def dedupe_levels(prices, clearance):
+    """Walks each row's levels upward, dropping any within `clearance` of the last kept one.
+    Returns the ascending order and a keep mask over it."""
+    order = np.argsort(prices, axis=1, kind="stable")
+    ordered = np.take_along_axis(prices, order, axis=1)
+    keep = np.empty(ordered.shape, dtype=bool)
+    last = np.full(len(ordered), -np.inf)
+    # Sequential over the six levels, vectorized over every ticker
+    for k in range(ordered.shape[1]):
+        keep[:, k] = np.abs(ordered[:, k] - last) > clearance
+        last = np.where(keep[:, k], ordered[:, k], last)
+    return order, keep
+
+def _pad(rows):
+    out = np.full((len(rows), max(map(len, rows), default=0)), np.nan)
+    for i, r in enumerate(rows): out[i, :len(r)] = r
+    return out
+
+def _remove_sorted(pool, vals):
+    # Equal values share a left edge, so shift each duplicate by its rank within the run
+    idx = np.searchsorted(pool, vals) + np.arange(len(vals)) - np.searchsorted(vals, vals)
+    return np.delete(pool, idx)
+
+def closed_sessions(df, before):
+    """Yields (anchor, ups, downs) for each 8:30-anchored session in `df` that closed by `before`."""
+    df = df[df.index < before]
+    if df.empty: return
+    day = (df.index - SESSION_ANCHOR).normalize()
+    starts = np.flatnonzero(np.r_[True, day[1:] != day[:-1]])
+    ends = np.r_[starts[1:], len(df)]
+    o, h, l = (df[c].to_numpy() for c in ('Open', 'High', 'Low'))
+    for a, b in zip(starts, ends):
+        if day[a] + pd.Timedelta(days=1) + SESSION_ANCHOR <= before:
+            yield day[a], h[a:b] - o[a], o[a] - l[a:b]
+
+class SessionDistribution:
+    """Excursion samples of the last `n` closed sessions, kept sorted per side (row 0 highs, row 1 lows).
+
+    A closing session is merged in with searchsorted inserts and the oldest one removed the same
+    way, so the pool is never re-sorted from scratch."""
+
+    def __init__(self, n):
+        self.n, self.sessions, self.last_anchor = n, deque(), None
+        self.pool = np.empty((2, 0))
+
+    def push(self, anchor, ups, downs):
+        new = np.sort(np.stack([ups, downs]), axis=1)
+        self.pool = np.stack([np.insert(p, np.searchsorted(p, v), v) for p, v in zip(self.pool, new)])
+        self.sessions.append(new)
+        self.last_anchor = anchor
+        if len(self.sessions) > self.n:
+            old = self.sessions.popleft()
+            self.pool = np.stack([_remove_sorted(p, v) for p, v in zip(self.pool, old)])
+
+    def update(self, df, before):
+        """Pushes the sessions in `df` that closed by `before` and are newer than the last one pushed."""
+        for anchor, ups, downs in closed_sessions(df, before):
+            if self.last_anchor is None or anchor > self.last_anchor: self.push(anchor, ups, downs)
+
+@traced("levels")
+def get_precision_batch(tickers, distributions=None):
+    """Levels for every ticker from stored bars in one batched pass. Returns {ticker: (1m frame, levels)},
+    or (None, None) for a ticker with no stored 5m or 1m bars to level or chart.
+
+    Pass the same `distributions` dict across calls to keep multi-session pools warm."""
+    distributions = {} if distributions is None else distributions
+    lookback = pd.Timedelta(days=2 + 2 * (LEVEL_SESSIONS - 1))
+    out = {t: (None, None) for t in tickers}
+    ready, opens, ups, downs = [], [], [], []
+    for ticker in tickers:
+        df = load_bars(ticker, "5m", lookback=lookback)
+        if df.empty: continue
+        # Same anchor as closed_sessions, so no bar falls between the live window and the pool
+        window = df[df.index >= df.index[-1].normalize() + SESSION_ANCHOR]
+        if window.empty: window = df.tail(50)
+
+        sess_o = window['Open'].iloc[0]
+        aH, aL = window['High'].to_numpy() - sess_o, sess_o - window['Low'].to_numpy()
+        if LEVEL_SESSIONS > 1:
+            dist = distributions.setdefault(ticker, SessionDistribution(LEVEL_SESSIONS - 1))
+            dist.update(df, window.index[0])
+            aH, aL = np.concatenate([aH, dist.pool[0]]), np.concatenate([aL, dist.pool[1]])
+        ready.append(ticker); opens.append(sess_o); ups.append(aH); downs.append(aL)
+    if not ready: return out
+
+    opens = np.array(opens)
+    prices = level_prices(_pad(ups), _pad(downs), opens)
+    order, keep = dedupe_levels(prices, opens * LEVEL_CLEARANCE)
+    for i, ticker in enumerate(ready):
+        # 5m can be stored while the 1m seed failed; an empty frame would crash mplfinance mid-post
+        plot_df = load_bars(ticker, "1m", lookback=pd.Timedelta(days=1)).tail(150)
+        if plot_df.empty: continue
+        out[ticker] = (plot_df, {LEVEL_LABELS[j]: float(prices[i, j]) for j in order[i][keep[i]]})
+    return out
+
+def get_precision_data(ticker, sync=True):
+    if sync: refresh_bars(ticker)
+    return get_precision_batch([ticker])[ticker]
+
+# --- ⚡ CONCURRENT FETCH STAGE ---
+# Seconds from stage start before a source is abandoned and its fallback used; each leaves room
+# for its request timeouts to expire first (both TradingView attempts, the Finnhub request)
+SOURCE_DEADLINES = {"tradingview": 2 * TV_ATTEMPT_TIMEOUT + 4, "finnhub": FINNHUB_TIMEOUT + 4, "precision": 25}
+# Upper bound on simultaneous fetches, so a large watchlist doesn't hit yfinance all at once
+FETCH_WORKERS = 8
+
+def gather_sources(jobs):
+    """Runs (key, fn, args, deadline, fallback) jobs in parallel, up to FETCH_WORKERS at a time, in list order;
+    wall time ~ the slowest source. Deadlines count from stage start, so put the latency-critical jobs first."""
+    pool = ThreadPoolExecutor(max_workers=min(len(jobs), FETCH_WORKERS))
+    started = time.monotonic()
+    pending = [(key, pool.submit(fn, *args), deadline, fallback) for key, fn, args, deadline, fallback in jobs]
+    results = {}
+    for key, fut, deadline, fallback in pending:
+        try:
+            results[key] = fut.result(timeout=max(0, started + deadline - time.monotonic()))
+        except Exception as e:
+            print(f"Source '{key}' degraded: {type(e).__name__} {e}")
+            results[key] = fallback
+    # Don't block on stragglers; their results are simply discarded
+    pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+# --- 🖼️ CHART RENDERING ---
+# Below this many charts the pool's worker start-up costs more than it saves
+RENDER_POOL_MIN = 4
+CHART_FIGSIZE = (14.4, 10.35)         # mpf's default figure at figscale=1.8
+CHART_RECT = [0.18, 0.18, 0.72, 0.7]  # mpf's single-panel main axes
+LEVEL_LINE_KW = dict(colors='#C0C0C0', linewidths=1.2, alpha=0.5)
+LEVEL_LABEL_KW = dict(color='#C0C0C0', fontsize=8, fontweight='bold', va='center')
+_chart_template = None
+
+def chart_style():
+    import mplfinance as mpf
+    mc = mpf.make_marketcolors(up='#00ffbb', down='#ff3366', edge='inherit', wick='inherit')
+    return mpf.make_mpf_style(base_mpf_style='nightclouds', marketcolors=mc, facecolor='#050505')
+
+def get_chart_template():
+    """(style, figure, axes) built once per process on the Agg backend and reused for every chart."""
+    global _chart_template
+    if _chart_template is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        import mplfinance as mpf
+        style = chart_style()
+        fig = mpf.figure(style=style, figsize=CHART_FIGSIZE)
+        _chart_template = (style, fig, fig.add_axes(CHART_RECT))
+    return _chart_template
+
+def render_chart(plot_df, lvls, name):
+    """Draws one asset's 1m chart into the reusable figure and returns the watermarked PNG bytes."""
+    # Charting libraries are only loaded once the data stage is done
+    import mplfinance as mpf
+    style, fig, ax = get_chart_template()
+    plot_df = plot_df.dropna(subset=['Open', 'High', 'Low', 'Close']).astype(float)
+    with stage("mpf_plot", asset=name):
+        ax.clear()
+        mpf.plot(plot_df, ax=ax, type='candle', style=style, datetime_format='%I:%M %p',
+                 hlines=dict(hlines=list(lvls.values()), **LEVEL_LINE_KW))
+        fig.suptitle(f"\n1 Minute Chart, {name}, {plot_df.index[0].strftime('%b %d, %Y')}", va='center')
+        for label, price in lvls.items():
+            ax.text(len(plot_df) + 2.5, price, f"{round(price, 2)} - {label}", **LEVEL_LABEL_KW)
+
+        buf = BytesIO()
+        # Fast, barely-compressed PNG: it is decoded again immediately for the watermark
+        fig.savefig(buf, format="png", facecolor=fig.get_facecolor(), bbox_inches='tight', pil_kwargs={"compress_level": 1})
+    return add_watermark(buf.getvalue())
+
+def _render_job(job):
+    return render_chart(*job)
+
+def _init_render_worker():
+    get_chart_template()
+
+def render_charts(jobs):
+    """[(plot_df, lvls, name)] -> PNG bytes in the same order, spread over a process pool for big watchlists."""
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if len(jobs) < RENDER_POOL_MIN or workers < 2: return [render_chart(*job) for job in jobs]
+    import multiprocessing
+    # spawn, not fork: the fetch stage may still have straggler threads running
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_render_worker) as pool:
+        return list(pool.map(_render_job, jobs))
+
+# --- 📮 SNAPSHOT POST ---
+ASSETS = [{"symbol": "GC=F", "name": "GC", "color": 0xf1c40f}, {"symbol": "NQ=F", "name": "NQ", "color": 0x2ecc71}]
+ECO_TIMEOUT = ("⚠️ Economic calendar temporarily unavailable (timeout).", 0x95a5a6)
+
+def keep_events(state, result):
+    """Stores a (events, eco_error) fetch result, except that a failed fetch never replaces good events."""
+    events, eco_error = result
+    if events is not None: state["events"], state["eco_error"] = events, None
+    elif state.get("events") is None: state["events"], state["eco_error"] = None, eco_error
+
+@traced("snapshot")
+def post_snapshot(webhook, finnhub_key, state=None):
+    """Builds and posts one update. A daemon `state` carries the day's events, level pools and rendered
+    charts between calls, so a re-post only refreshes statuses, new bars, new headlines and the charts they touch."""
+    full = state is None or state.get("full", True)
+    state = {} if state is None else state
     current_est = datetime.now(pytz.timezone('US/Eastern')).strftime('%I:%M %p EST')
-    
-    eco_intel, embed_color = get_tradingview_intel()
-    briefing = get_finnhub_briefing(finnhub_key)
+
+    # Headline polling is incremental, so the briefing is refreshed on every post
+    jobs = [("briefing", get_finnhub_briefing, (finnhub_key,), SOURCE_DEADLINES["finnhub"], "Briefing unavailable.")]
+    # Until the day has a good calendar, every post tries TradingView again
+    if full or state.get("eco_error"):
+        jobs += [("eco", load_tradingview_events, (), SOURCE_DEADLINES["tradingview"], (None, ECO_TIMEOUT))]
+    jobs += [(a["symbol"], refresh_bars, (a["symbol"],), SOURCE_DEADLINES["precision"], {}) for a in ASSETS]
+    with stage("fetch_stage", sources=len(jobs)):
+        sources = gather_sources(jobs)
+    if "eco" in sources: keep_events(state, sources["eco"])
+    state["full"] = False
+    eco_intel, embed_color = state["eco_error"] or get_tradingview_intel(state["events"])
+    briefing = sources["briefing"]
     zws = "\u200B" 
 
     embeds = [{
@@ -200,34 +664,219 @@ def main():
         "footer": {"text": f"UWS Intelligence Desk | {current_est}"}
     }]
 
-    assets = [{"symbol": "GC=F", "name": "GC", "color": 0xf1c40f}, {"symbol": "NQ=F", "name": "NQ", "color": 0x2ecc71}]
-    mc = mpf.make_marketcolors(up='#00ffbb', down='#ff3366', edge='inherit', wick='inherit')
-    s = mpf.make_mpf_style(base_mpf_style='nightclouds', marketcolors=mc, facecolor='#050505')
-
+    # Stored bars are served even when the upstream sync was slow or failed
+    precision = get_precision_batch([a["symbol"] for a in ASSETS], state.setdefault("distributions", {}))
+    charts = state.setdefault("charts", {})
+    charted = [a for a in ASSETS if precision[a["symbol"]][0] is not None]
+    # Only assets whose bars changed since the last post (or that were never drawn) are re-rendered
+    stale = [a for a in charted if a["symbol"] not in charts or any(sources[a["symbol"]].values())]
+    with stage("render_stage", charts=len(stale)):
+        pngs = render_charts([(*precision[a["symbol"]], a["name"]) for a in stale])
+    charts.update(zip([a["symbol"] for a in stale], pngs))
     files = {}
-    for i, asset in enumerate(assets):
-        plot_df, lvls = get_precision_data(asset["symbol"])
-        if plot_df is not None:
-            plot_df = plot_df.dropna(subset=['Open', 'High', 'Low', 'Close']).astype(float)
-            fname = f"{asset['name'].lower()}.png"
-            fig, axlist = mpf.plot(plot_df, type='candle', style=s, returnfig=True, figscale=1.8,
-                                   title=f"\n1 Minute Chart, {asset['name']}, {plot_df.index[0].strftime('%b %d, %Y')}",
-                                   datetime_format='%I:%M %p', 
-                                   hlines=dict(hlines=list(lvls.values()), colors='#C0C0C0', linewidths=1.2, alpha=0.5))
-            plt.subplots_adjust(right=0.85)
-            for label, price in lvls.items():
-                axlist[0].text(len(plot_df) + 2.5, price, f"{round(price, 2)} - {label}", 
-                               color='#C0C0C0', fontsize=8, fontweight='bold', va='center')
-            
-            fig.savefig(fname, facecolor=fig.get_facecolor(), bbox_inches='tight')
-            plt.close(fig)
-            add_watermark(fname, LOGO_BASE64)
-            files[f"file{i}"] = (fname, open(fname, 'rb'), 'image/png')
-            embeds.append({"title": f"📈 {asset['name']} | Session Levels", "color": asset["color"], "image": {"url": f"attachment://{fname}"}})
+    for i, asset in enumerate(charted):
+        fname = f"{asset['name'].lower()}.png"
+        files[f"file{i}"] = (fname, charts[asset["symbol"]])
+        embeds.append({"title": f"📈 {asset['name']} | Session Levels", "color": asset["color"], "image": {"url": f"attachment://{fname}"}})
 
     if webhook:
-        discord_requests.post(webhook, files=files, data={"payload_json": json.dumps({"embeds": embeds})})
-        for _, f_ptr in files.items(): f_ptr[1].close()
+        post_to_discord(webhook, embeds, files)
+
+def main():
+    get_headline_matcher()  # A bad UWS_HEADLINE_ASSETS fails here, not later as "Briefing unavailable."
+    post_snapshot(os.getenv("DISCORD_WEBHOOK_URL"), os.getenv("FINNHUB_KEY"))
+
+# --- 🌙 DAEMON MODE ---
+PREMARKET_POST = dtime(8, 0)
+# While the calendar is unavailable, how often the idle daemon retries it (re-posts also retry)
+ECO_RETRY = pd.Timedelta(minutes=15)
+# Give the release time to print and the first reaction bars time to land
+REPOST_DELAY = pd.Timedelta(minutes=2)
+
+def post_schedule(state, day):
+    """Today's post times: the weekday pre-market post, then one re-post after each high-impact event."""
+    tz_ny = pytz.timezone('US/Eastern')
+    times = [tz_ny.localize(datetime.combine(day, PREMARKET_POST))] if day.weekday() < 5 else []
+    return sorted(times + [dt_ny + REPOST_DELAY for dt_ny, _ in state.get("events") or []])
+
+def run_daemon(webhook, finnhub_key):
+    """Stays resident with warm imports, HTTP sessions, bar store and level pools, posting on schedule."""
+    tz_ny = pytz.timezone('US/Eastern')
+    get_headline_matcher()
+    state, last_post = {}, datetime.now(tz_ny)
+    while True:
+        now = datetime.now(tz_ny)
+        if state.get("day") != now.date():
+            # New day: fetch its events up front so the re-post schedule is known before the first post
+            state = {"day": now.date(), "full": True, "distributions": state.get("distributions", {})}
+            keep_events(state, load_tradingview_events())
+            eco_checked = now
+        elif state["eco_error"] and now - eco_checked >= ECO_RETRY:
+            # Otherwise a failed overnight fetch would leave the day with no event re-posts at all
+            keep_events(state, load_tradingview_events())
+            eco_checked = now
+        due = [t for t in post_schedule(state, now.date()) if t > last_post]
+        if due and due[0] <= now:
+            # The pre-market post refreshes everything; event re-posts only what changed
+            state["full"] = state["full"] or due[0].time() == PREMARKET_POST
+            try:
+                post_snapshot(webhook, finnhub_key, state)
+            except Exception as e:
+                print(f"Daemon post failed: {e}")
+            last_post = now
+        else:
+            time.sleep(60 if not due else min(60, max(1, (due[0] - now).total_seconds())))
+
+# --- 🔬 BACKTEST ---
+BACKTEST_UNTIL = dtime(16, 0)
+
+def _at(days, t):
+    """UTC ns timestamps of wall-clock time `t` (US/Eastern) on each of `days`."""
+    local = days + pd.Timedelta(hours=t.hour, minutes=t.minute)
+    return local.tz_localize('US/Eastern').as_unit("ns").asi8
+
+def _gather(values, starts, ends, fill=np.nan):
+    """(rows, max len) matrix of values[starts[i]:ends[i]], padded with `fill`, plus the fancy index used."""
+    width = max(1, int((ends - starts).max(initial=0)))
+    idx = starts[:, None] + np.arange(width)
+    inside = idx < ends[:, None]
+    idx = np.minimum(idx, len(values) - 1)
+    return np.where(inside, values[idx], fill), idx
+
+def backtest_sessions(symbol, sessions=LEVEL_SESSIONS, post_at=PREMARKET_POST, until=BACKTEST_UNTIL):
+    """The levels get_precision_batch would have posted at `post_at` on every stored weekday of `symbol`, all
+    sessions at once in padded arrays. Returns None, or a dict of per-session arrays: days, post (ns), prices
+    (sessions x LEVEL_LABELS), posted (mask of the levels that survived dedupe) and the 1m span [s1, e1) to `until`."""
+    b5, b1 = _read_bars(symbol, "5m"), _read_bars(symbol, "1m")
+    if not len(b5) or not len(b1): return None
+    ts5, ts1 = np.asarray(b5["ts"]), np.asarray(b1["ts"])
+    o5, h5, l5 = (np.asarray(b5[c]) for c in ('Open', 'High', 'Low'))
+    days = pd.to_datetime(ts1, utc=True).tz_convert('US/Eastern').tz_localize(None).normalize().unique()
+    days = days[days.dayofweek < 5]
+    post, close = _at(days, post_at), _at(days, until)
+    # Local midnight + SESSION_ANCHOR, the arithmetic get_precision_batch and closed_sessions use
+    anchor = (days.tz_localize('US/Eastern') + SESSION_ANCHOR).as_unit("ns").asi8
+
+    # Level window as get_precision_batch sees it at post time: bars since the 8:30 anchor, else the last 50
+    end, since_anchor = np.searchsorted(ts5, post), np.searchsorted(ts5, anchor)
+    start = np.where(since_anchor < end, since_anchor, np.maximum(end - 50, 0))
+    s1, e1 = np.searchsorted(ts1, post), np.searchsorted(ts1, close)
+    ok = (end > start) & (e1 > s1)
+    if not ok.any(): return None
+    post, start, end, s1, e1, days = post[ok], start[ok], end[ok], s1[ok], e1[ok], days[ok]
+
+    opens = o5[start]
+    ups = _gather(h5, start, end)[0] - opens[:, None]
+    downs = opens[:, None] - _gather(l5, start, end)[0]
+    if sessions > 1:
+        # Pool the N-1 most recent 8:30-anchored sessions that had closed before each window, as closed_sessions does
+        day5 = (pd.to_datetime(ts5, utc=True).tz_convert('US/Eastern') - SESSION_ANCHOR).normalize()
+        g0 = np.flatnonzero(np.r_[True, day5[1:] != day5[:-1]])
+        g1 = np.r_[g0[1:], len(ts5)]
+        closes_at = (day5[g0] + pd.Timedelta(days=1) + SESSION_ANCHOR).as_unit("ns").asi8
+        g_ups = _gather(h5, g0, g1)[0] - o5[g0][:, None]
+        g_downs = o5[g0][:, None] - _gather(l5, g0, g1)[0]
+        pick = (np.searchsorted(closes_at, ts5[start], side="right") - 1)[:, None] - np.arange(sessions - 1)
+        have = (pick >= 0)[:, :, None]
+        pick = np.maximum(pick, 0)
+        ups = np.concatenate([ups, np.where(have, g_ups[pick], np.nan).reshape(len(opens), -1)], axis=1)
+        downs = np.concatenate([downs, np.where(have, g_downs[pick], np.nan).reshape(len(opens), -1)], axis=1)
+
+    prices = level_prices(ups, downs, opens)
+    order, keep = dedupe_levels(prices, opens * LEVEL_CLEARANCE)
+    posted = np.zeros_like(keep)
+    np.put_along_axis(posted, order, keep, axis=1)
+    return {"days": days, "post": post, "prices": prices, "posted": posted, "s1": s1, "e1": e1}
+
+@traced("backtest")
+def backtest_levels(symbol, sessions=LEVEL_SESSIONS, post_at=PREMARKET_POST, until=BACKTEST_UNTIL):
+    """Recomputes the posted levels for every stored weekday session of `symbol` and measures how 1m price met
+    them between `post_at` and `until`. Every session is handled at once in padded arrays, none in a Python loop.
+    Returns {"symbol", "sessions", "first", "last", "levels": {label: {posted, hit_rate, median_min, mean_min}}}."""
+    levels = backtest_sessions(symbol, sessions, post_at, until)
+    if levels is None: return None
+    days, post, prices, posted, s1, e1 = (levels[k] for k in ("days", "post", "prices", "posted", "s1", "e1"))
+    b1 = _read_bars(symbol, "1m")
+    ts1 = np.asarray(b1["ts"])
+
+    h1, j = _gather(np.asarray(b1["High"]), s1, e1, fill=-np.inf)
+    l1 = _gather(np.asarray(b1["Low"]), s1, e1, fill=np.inf)[0]
+    is_high = np.array([label.endswith("H") for label in LEVEL_LABELS])
+    touched = np.where(is_high[None, :, None], h1[:, None, :] >= prices[:, :, None], l1[:, None, :] <= prices[:, :, None])
+    hit = touched.any(axis=2) & posted
+    first_ts = ts1[np.take_along_axis(j, touched.argmax(axis=2), axis=1)]
+    minutes = np.where(hit, (first_ts - post[:, None]) / 6e10, np.nan)
+
+    levels = {}
+    for k, label in enumerate(LEVEL_LABELS):
+        n = int(posted[:, k].sum())
+        m = minutes[:, k][hit[:, k]]
+        levels[label] = {"posted": n, "hit_rate": round(float(hit[:, k].sum()) / n, 4) if n else None,
+                         "median_min": round(float(np.median(m)), 1) if len(m) else None,
+                         "mean_min": round(float(m.mean()), 1) if len(m) else None}
+    return {"symbol": symbol, "sessions": int(len(days)), "first": str(days[0].date()), "last": str(days[-1].date()),
+            "levels": levels}
+
+def _backtest_job(job):
+    return backtest_levels(*job)
+
+def run_backtest(symbols, sessions=LEVEL_SESSIONS, post_at=PREMARKET_POST, until=BACKTEST_UNTIL):
+    """Backtests each symbol, one process per symbol when there are several cores to spread them over."""
+    jobs = [(symbol, sessions, post_at, until) for symbol in symbols]
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers < 2: return [_backtest_job(job) for job in jobs]
+    import multiprocessing
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(_backtest_job, jobs))
+
+def print_backtest(result, sessions, post_at, until):
+    print(f"\n{result['symbol']}: {result['sessions']} sessions {result['first']} → {result['last']}, "
+          f"levels from {sessions} session(s), {post_at:%H:%M} → {until:%H:%M} ET")
+    print(f"  {'level':<7}{'posted':>8}{'hit %':>8}{'median min':>12}{'mean min':>10}")
+    fmt = lambda v, scale=1: f"{v * scale:.1f}" if v is not None else "-"
+    for label, r in sorted(result["levels"].items(), key=lambda kv: (kv[0][-1], kv[0])):
+        print(f"  {label:<7}{r['posted']:>8}{fmt(r['hit_rate'], 100):>8}{fmt(r['median_min']):>12}{fmt(r['mean_min']):>10}")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    clock = lambda v: datetime.strptime(v, "%H:%M").time()
+    parser = argparse.ArgumentParser(description="UWS Intelligence Desk: daily levels, news and economic intel.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("daemon", help="stay resident: pre-market post plus a re-post after each high-impact event")
+    bt = commands.add_parser("backtest", help="hit rates and time-to-touch of the posted levels over stored history")
+    bt.add_argument("symbols", nargs="*", default=[a["symbol"] for a in ASSETS])
+    bt.add_argument("--sessions", type=int, default=LEVEL_SESSIONS, help="sessions pooled per level set (UWS_LEVEL_SESSIONS)")
+    bt.add_argument("--post", type=clock, default=PREMARKET_POST, help="post time HH:MM ET the levels are computed at")
+    bt.add_argument("--until", type=clock, default=BACKTEST_UNTIL, help="HH:MM ET a level has to be touched by")
+    bt.add_argument("--json", help="also write the results here")
+    imp_help = ("merge a Datetime,Open,High,Low,Close[,Volume] CSV into the bar store; "
+                "every stored bar between its first and last timestamp is replaced, gaps included")
+    imp = commands.add_parser("import-bars", help=imp_help, description=imp_help)
+    imp.add_argument("symbol")
+    imp.add_argument("interval", choices=["1m", "5m"])
+    imp.add_argument("csv")
+    imp.add_argument("--tz", help="zone of timestamps without a UTC offset, e.g. America/New_York (else they are rejected)")
+    args = parser.parse_args()
+    if args.command == "daemon":
+        run_daemon(os.getenv("DISCORD_WEBHOOK_URL"), os.getenv("FINNHUB_KEY"))
+    elif args.command == "backtest":
+        results = run_backtest(args.symbols, args.sessions, args.post, args.until)
+        for symbol, result in zip(args.symbols, results):
+            if result: print_backtest(result, args.sessions, args.post, args.until)
+            else: print(f"\n{symbol}: no stored 1m/5m sessions to backtest")
+        if args.json:
+            with open(args.json, "w") as f: json.dump([r for r in results if r], f, indent=1)
+    elif args.command == "import-bars":
+        try:
+            df = read_bar_csv(args.csv, args.tz).sort_index()
+        except ValueError as e:
+            parser.error(str(e))
+        if df.empty: parser.error(f"{args.csv} has no bars")
+        old = _read_bars(args.symbol, args.interval)["ts"]
+        first, last = df.index[0].as_unit("ns").value, df.index[-1].as_unit("ns").value
+        replaced = np.searchsorted(old, last, side="right") - np.searchsorted(old, first)
+        changed = store_bars(args.symbol, args.interval, df)
+        print(f"{args.symbol} {args.interval}: {len(df)} bars imported over {df.index[0]} .. {df.index[-1]}, "
+              f"the {replaced} stored bars in that span were replaced ({changed} bars differ)")
+    else:
+        main()